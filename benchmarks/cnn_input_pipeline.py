@@ -0,0 +1,263 @@
+"""
+@author: bartulem
+Benchmark of the CNN training input pipeline: host vs. device augmentation.
+
+`NeuralContinuousCNNRunner.run_cnn_training` feeds its mini-batches in one of
+three ways (`hyperparameters.deep_learning.cnn_continuous.input_pipeline`):
+NumPy warping and masking on the host with one transfer per batch (`'host'`,
+the default), the jitted `augment_batch_jax` on the device fed by the
+double-buffered `prefetch_to_device` (`'prefetch'`), or whole epochs under
+`lax.scan` over a device-resident fold (`'scan'`). This module trains the
+shipped CNN architecture on synthetic kinematics with each path and reports
+the training steps per second, after one warm-up epoch so compilation is not
+counted. The `'prefetch'` and `'scan'` paths see the same batches and PRNG
+keys, so their final weights are also compared; under AdamW the first
+normalised steps turn float32 rounding in near-zero gradients into weight
+differences of the order of the learning rate, so expect a small non-zero
+difference rather than bitwise agreement.
+
+Run from the repository root:
+
+    python -m benchmarks.cnn_input_pipeline --n_samples 4096 --n_features 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.resources
+import json
+import time
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+import optax
+
+from usv_playpen.modeling.jax_neural_network_cnn import (
+    HashableDict,
+    apply_kinematic_masking,
+    apply_temporal_warping,
+    cnn_forward,
+    init_cnn_params_and_state,
+    make_device_train_step,
+    make_scan_epoch,
+    prefetch_to_device,
+)
+
+
+def synthetic_cnn_inputs(n_samples: int = 2048, n_features: int = 16, n_frames: int = 600,
+                         random_state: int = 0) -> tuple:
+    """
+    Description
+    -----------
+    Synthetic standardized kinematic windows and 2-D manifold targets shaped
+    like the output of `load_multivariate_data_blocks`, with a weak linear
+    signal from the first feature into the targets.
+
+    Parameters
+    ----------
+    n_samples (int)
+        Number of windows.
+    n_features (int)
+        Kinematic feature channels.
+    n_frames (int)
+        History frames per window.
+    random_state (int)
+        Seed of the generator.
+
+    Returns
+    -------
+    X_seq (np.ndarray)
+        ``(n_samples, n_features, n_frames)`` float32 windows.
+    Y (np.ndarray)
+        ``(n_samples, 2)`` float32 targets in ``[-1, 1]``.
+    """
+
+    rng = np.random.default_rng(random_state)
+    X_seq = rng.standard_normal((n_samples, n_features, n_frames)).astype(np.float32)
+    signal = X_seq[:, 0, :].mean(axis=1, keepdims=True) * np.sqrt(n_frames)
+    Y = np.tanh(0.5 * signal + 0.3 * rng.standard_normal((n_samples, 2))).astype(np.float32)
+    return X_seq, Y
+
+
+def _benchmark_hp(batch_size: int | None, hp_overrides: dict | None) -> HashableDict:
+    """The shipped `cnn_continuous` block on a euclidean manifold, with overrides."""
+
+    settings_traversable = importlib.resources.files('usv_playpen').joinpath(
+        '_parameter_settings', 'modeling_settings.json'
+    )
+    hp = HashableDict(json.loads(settings_traversable.read_text())['hyperparameters']['deep_learning']['cnn_continuous'])
+    hp['manifold_metric'] = 'euclidean'
+    hp['manifold_period'] = 1.0
+    if batch_size is not None:
+        hp['batch_size'] = int(batch_size)
+    hp.update(hp_overrides or {})
+    return hp
+
+
+def _mse_compute_grads(hp: HashableDict):
+    """A jitted `_compute_grads` of the runner's signature with a plain MSE loss."""
+
+    @jax.jit
+    def compute_grads(p, s, xs, yt, rng_key, y_center, y_scale):
+        rng_key, drop_key = jax.random.split(rng_key)
+
+        def loss_fn(weights, current_state):
+            preds, new_state = cnn_forward(weights, current_state, xs, y_center, y_scale, hp,
+                                           rng_key=drop_key, is_training=True)
+            return jnp.mean(jnp.sum((preds - yt) ** 2, axis=-1)), new_state
+
+        (_loss, s_new), grads = jax.value_and_grad(loss_fn, has_aux=True)(p, s)
+        return grads, s_new, rng_key
+
+    return compute_grads
+
+
+def benchmark_input_pipeline(n_samples: int = 2048, n_features: int = 16, n_frames: int = 600,
+                             n_epochs: int = 3, batch_size: int | None = None,
+                             modes: tuple = ('host', 'prefetch', 'scan'), prefetch_depth: int = 2,
+                             hp_overrides: dict | None = None, random_state: int = 0) -> list:
+    """
+    Description
+    -----------
+    Train the CNN for `n_epochs` timed epochs (after one warm-up epoch) with
+    each input-pipeline mode and time them. Every mode starts from the same
+    initial weights and draws its batch indices from its own copy of one seeded
+    generator, so the modes differ only in where and how the batches are
+    augmented.
+
+    Parameters
+    ----------
+    n_samples (int)
+        Synthetic training windows.
+    n_features (int)
+        Kinematic feature channels.
+    n_frames (int)
+        History frames per window.
+    n_epochs (int)
+        Timed epochs per mode.
+    batch_size (int)
+        Mini-batch size; None keeps the shipped setting.
+    modes (tuple)
+        Any of ``'host'``, ``'prefetch'`` and ``'scan'``.
+    prefetch_depth (int)
+        Batches kept on the device ahead of the step (``'prefetch'`` mode).
+    hp_overrides (dict)
+        `cnn_continuous` entries to override (e.g. a smaller `block_channels`).
+    random_state (int)
+        Seed of the data, the initial weights and the batch / augmentation draws.
+
+    Returns
+    -------
+    rows (list)
+        One dict per mode: ``mode``, ``n_steps`` (timed), ``seconds``,
+        ``steps_per_sec`` and ``max_abs_param_diff`` (largest final-weight
+        difference from the ``'prefetch'`` mode; NaN when either was not run).
+    """
+
+    X_seq, Y = synthetic_cnn_inputs(n_samples, n_features, n_frames, random_state)
+    hp = _benchmark_hp(batch_size, hp_overrides)
+    batch_size = int(hp['batch_size'])
+    n_steps = n_samples // batch_size
+    compute_grads = _mse_compute_grads(hp)
+    y_center, y_scale = jnp.zeros(2), jnp.ones(2)
+    X_dev, Y_dev = jnp.asarray(X_seq), jnp.asarray(Y)
+    warp_range = hp['warp_range']
+
+    rows, final_params = [], {}
+    for mode in modes:
+        if mode not in ('host', 'prefetch', 'scan'):
+            raise ValueError(f"Unknown input-pipeline mode {mode!r}.")
+
+        params, state = init_cnn_params_and_state(jax.random.PRNGKey(random_state), n_features, n_frames, hp)
+        optimizer = optax.adamw(learning_rate=hp['learning_rate'], weight_decay=hp['weight_decay'])
+        carry = (params, state, optimizer.init(params), jax.random.PRNGKey(random_state))
+        index_rng = np.random.default_rng(random_state)
+        host_aug_rng = np.random.default_rng(random_state + 1)
+        aug_rng = jax.random.fold_in(jax.random.PRNGKey(random_state), 1)
+
+        train_step = make_device_train_step(compute_grads, optimizer, hp)
+        scan_epoch = make_scan_epoch(train_step) if mode == 'scan' else None
+        step_jit = jax.jit(train_step)
+
+        @jax.jit
+        def apply_update(p, o_state, grads):
+            updates, o_state_new = optimizer.update(grads, o_state, p)
+            return optax.apply_updates(p, updates), o_state_new
+
+        def run_epoch(epoch_carry, epoch):
+            batch_idx = index_rng.permutation(n_samples)[:n_steps * batch_size].reshape(n_steps, batch_size)
+            epoch_key = jax.random.fold_in(aug_rng, epoch)
+            if mode == 'scan':
+                return scan_epoch(epoch_carry, X_dev, Y_dev, jnp.asarray(batch_idx), epoch_key, y_center, y_scale)
+            if mode == 'prefetch':
+                host_batches = ((X_seq[idx], Y[idx], jax.random.fold_in(epoch_key, b))
+                                for b, idx in enumerate(batch_idx))
+                for x_raw, y_batch, aug_key in prefetch_to_device(host_batches, prefetch_depth):
+                    epoch_carry = step_jit(epoch_carry, x_raw, y_batch, aug_key, y_center, y_scale)
+                return epoch_carry
+
+            p, s, o_state, drop_key = epoch_carry
+            for idx in batch_idx:
+                warps = host_aug_rng.uniform(1.0 - warp_range, 1.0 + warp_range, len(idx))
+                X_batch = apply_temporal_warping(X_seq[idx], warps)
+                if hp['use_kinematic_masking']:
+                    X_batch = apply_kinematic_masking(X_batch, mask_prob=hp['masking_prob'],
+                                                      mask_length=hp['masking_length_frames'], rng=host_aug_rng)
+                grads, s, drop_key = compute_grads(p, s, jnp.array(X_batch), jnp.array(Y[idx]), drop_key,
+                                                   y_center, y_scale)
+                p, o_state = apply_update(p, o_state, grads)
+            return p, s, o_state, drop_key
+
+        carry = jax.block_until_ready(run_epoch(carry, 0))
+        start = time.perf_counter()
+        for epoch in range(1, n_epochs + 1):
+            carry = run_epoch(carry, epoch)
+        carry = jax.block_until_ready(carry)
+        seconds = time.perf_counter() - start
+
+        final_params[mode] = carry[0]
+        rows.append({
+            'mode': mode,
+            'n_steps': n_epochs * n_steps,
+            'seconds': seconds,
+            'steps_per_sec': n_epochs * n_steps / seconds,
+        })
+
+    for row in rows:
+        row['max_abs_param_diff'] = float('nan')
+        if 'prefetch' in final_params:
+            row['max_abs_param_diff'] = max(
+                float(jnp.max(jnp.abs(final_params[row['mode']][name] - value)))
+                for name, value in final_params['prefetch'].items()
+            )
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Benchmark the CNN training input pipeline (host vs. device augmentation)."
+    )
+    parser.add_argument('--n_samples', type=int, default=2048,
+                        help="Synthetic training windows.")
+    parser.add_argument('--n_features', type=int, default=16,
+                        help="Kinematic feature channels.")
+    parser.add_argument('--n_frames', type=int, default=600,
+                        help="History frames per window.")
+    parser.add_argument('--n_epochs', type=int, default=3,
+                        help="Timed epochs per mode.")
+    parser.add_argument('--batch_size', type=int, default=None,
+                        help="Mini-batch size (default: the shipped setting).")
+    parser.add_argument('--modes', nargs='+', default=['host', 'prefetch', 'scan'],
+                        help="Input-pipeline modes to time.")
+    parser.add_argument('--prefetch_depth', type=int, default=2,
+                        help="Batches kept on the device ahead of the step.")
+    cli_args = parser.parse_args()
+
+    for row in benchmark_input_pipeline(
+            n_samples=cli_args.n_samples, n_features=cli_args.n_features, n_frames=cli_args.n_frames,
+            n_epochs=cli_args.n_epochs, batch_size=cli_args.batch_size, modes=tuple(cli_args.modes),
+            prefetch_depth=cli_args.prefetch_depth):
+        print(f"{row['mode']:<8} | steps={row['n_steps']} | {row['seconds']:.2f} s | "
+              f"{row['steps_per_sec']:.1f} steps/s | max |dW| vs prefetch={row['max_abs_param_diff']:.2e}",
+              flush=True)
@@ -0,0 +1,119 @@
+"""
+@author: bartulem
+Benchmark of the compiled GLM-HMM forward-backward against the numpy reference.
+
+`GLMHMM` runs every E-step through the numba kernel
+`glm_hmm._batched_forward_backward`. This script times it against the original
+per-sequence numpy recursion (`forward_backward_reference`, kept with the
+test-suite as the correctness oracle) on synthetic sequences -- random
+emissions and a sticky transition matrix (or a random per-timestep transition
+tensor for the input-driven case) -- over a range of state counts, reporting
+the speed-up and the largest disagreement in the sequence marginal
+log-likelihoods.
+
+Run from the repository root:
+
+    python -m benchmarks.glm_hmm_forward_backward --seq_len 100000 --n_states 2 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from tests.modeling._glm_hmm_reference import forward_backward_reference, synthetic_hmm_inputs
+from usv_playpen.modeling.glm_hmm import _batched_forward_backward
+
+
+def benchmark_forward_backward(seq_len: int = 100_000, n_states_range: range = range(2, 9),
+                               n_seqs: int = 1, input_driven: bool = False,
+                               run_reference: bool = True, random_state: int = 0) -> list:
+    """
+    Description
+    -----------
+    Time the compiled batch forward-backward (posteriors included, as in an
+    E-step) against the numpy reference for each state count, after one warm-up
+    call so the numba compilation is not counted.
+
+    Parameters
+    ----------
+    seq_len (int)
+        Timesteps per synthetic sequence.
+    n_states_range (range)
+        State counts ``K`` to benchmark.
+    n_seqs (int)
+        Number of sequences in the batch.
+    input_driven (bool)
+        Use a per-timestep transition tensor.
+    run_reference (bool)
+        Also time the numpy reference (slow at ``seq_len`` ~ 1e5).
+    random_state (int)
+        Seed of the synthetic inputs.
+
+    Returns
+    -------
+    rows (list)
+        One dict per ``K``: ``n_states``, ``n_timesteps``, ``compiled_s``,
+        ``reference_s``, ``speedup`` and ``max_abs_loglik_diff`` (the reference
+        entries are NaN when ``run_reference`` is False).
+    """
+    rows = []
+    for n_states in n_states_range:
+        log_pi, log_A, log_B, offsets = synthetic_hmm_inputs(
+            [seq_len] * n_seqs, n_states, input_driven=input_driven, random_state=random_state)
+        _batched_forward_backward(log_pi, log_A, log_B, offsets[:2], True, input_driven)
+
+        start = time.perf_counter()
+        seq_loglik = _batched_forward_backward(log_pi, log_A, log_B, offsets, True, input_driven)[0]
+        compiled_s = time.perf_counter() - start
+
+        reference_s = max_diff = float('nan')
+        if run_reference:
+            start = time.perf_counter()
+            reference = [
+                forward_backward_reference(
+                    log_pi, log_A[0], log_B[begin:end],
+                    log_A[begin:end] if input_driven else None, return_full_xi=input_driven)[3]
+                for begin, end in zip(offsets[:-1], offsets[1:])
+            ]
+            reference_s = time.perf_counter() - start
+            max_diff = float(np.max(np.abs(seq_loglik - np.asarray(reference))))
+
+        rows.append({
+            'n_states': n_states,
+            'n_timesteps': int(offsets[-1]),
+            'compiled_s': compiled_s,
+            'reference_s': reference_s,
+            'speedup': reference_s / compiled_s,
+            'max_abs_loglik_diff': max_diff,
+        })
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Benchmark the compiled GLM-HMM forward-backward against the numpy reference."
+    )
+    parser.add_argument('--seq_len', type=int, default=100_000,
+                        help="Timesteps per synthetic sequence.")
+    parser.add_argument('--n_states', type=int, nargs=2, default=(2, 8),
+                        help="Inclusive range of state counts K.")
+    parser.add_argument('--n_seqs', type=int, default=1,
+                        help="Number of sequences in the batch.")
+    parser.add_argument('--input_driven', action='store_true',
+                        help="Use a per-timestep transition tensor.")
+    parser.add_argument('--skip_reference', action='store_true',
+                        help="Time only the compiled kernel.")
+    cli_args = parser.parse_args()
+
+    for row in benchmark_forward_backward(
+            seq_len=cli_args.seq_len,
+            n_states_range=range(cli_args.n_states[0], cli_args.n_states[1] + 1),
+            n_seqs=cli_args.n_seqs, input_driven=cli_args.input_driven,
+            run_reference=not cli_args.skip_reference):
+        print(f"K={row['n_states']} | T={row['n_timesteps']} | "
+              f"compiled={row['compiled_s']:.3f} s | reference={row['reference_s']:.3f} s | "
+              f"speed-up={row['speedup']:.1f}x | max |dLL|={row['max_abs_loglik_diff']:.2e}",
+              flush=True)
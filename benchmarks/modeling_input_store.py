@@ -0,0 +1,166 @@
+"""
+@author: bartulem
+Benchmark of per-task modeling-input loading: legacy pickle vs. per-feature store.
+
+Every SLURM array task of `main_univariate_dispatcher` opens the cohort's
+modeling input, lists its features and reads the metadata to map its array
+index to a feature, and then loads that one feature. This script builds a
+synthetic artifact shaped like an extraction output (features x sessions x
+`(n_events, n_frames)` windows), writes it both as a legacy pickle and as an
+HDF5 store (`modeling_input_store`), and runs exactly that per-task access in a
+fresh interpreter per format, reporting the load time and the peak
+resident-memory growth of the task.
+
+Run from the repository root:
+
+    python -m benchmarks.modeling_input_store --n_features 60 --n_sessions 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from usv_playpen.modeling.modeling_input_store import ModelingInputReader, save_modeling_input
+
+
+def synthetic_modeling_input(n_features: int = 60, n_sessions: int = 30, n_events: int = 400,
+                             n_frames: int = 600, random_state: int = 0) -> dict:
+    """
+    Description
+    -----------
+    A synthetic modeling-input artifact in the onset-pipeline layout: one
+    `usv_feature_arr` / `no_usv_feature_arr` pair of `(n_events, n_frames)`
+    float arrays per feature and session, plus an `_input_metadata` block.
+
+    Parameters
+    ----------
+    n_features (int)
+        Number of features.
+    n_sessions (int)
+        Number of sessions per feature.
+    n_events (int)
+        Events per array.
+    n_frames (int)
+        History frames per event.
+    random_state (int)
+        Seed of the generator.
+
+    Returns
+    -------
+    artifact (dict)
+        `{feature: {session: {name: array}}, '_input_metadata': {...}}`.
+    """
+
+    rng = np.random.default_rng(random_state)
+    sessions = [f"2023{idx:010d}" for idx in range(n_sessions)]
+    artifact = {
+        f"self.feature_{feat_idx:03d}": {
+            session: {'usv_feature_arr': rng.standard_normal((n_events, n_frames)),
+                      'no_usv_feature_arr': rng.standard_normal((n_events, n_frames))}
+            for session in sessions
+        }
+        for feat_idx in range(n_features)
+    }
+    artifact['_input_metadata'] = {'session_ids': sessions, 'filter_history_frames': n_frames}
+    return artifact
+
+
+def _peak_rss_bytes() -> int:
+    # On Linux, ru_maxrss survives fork + exec and so starts at the parent's
+    # peak; VmHWM belongs to the task's own address space.
+    status = Path('/proc/self/status')
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) * 1024
+    # ru_maxrss is in bytes on macOS (kilobytes elsewhere).
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _task_load(input_path: str, feature_index: int, result_queue) -> None:
+    baseline_rss = _peak_rss_bytes()
+    start = time.perf_counter()
+    reader = ModelingInputReader(input_path)
+    feature_name = reader.feature_names[feature_index]
+    data = reader.load(features=feature_name)
+    n_bytes = sum(arr.nbytes for session in data[feature_name].values() for arr in session.values())
+    result_queue.put({'load_s': time.perf_counter() - start,
+                      'peak_rss_growth_mb': (_peak_rss_bytes() - baseline_rss) / 2 ** 20,
+                      'feature_mb': n_bytes / 2 ** 20})
+
+
+def benchmark_task_load(artifact: dict, feature_index: int = 0, work_dir: str | None = None) -> list:
+    """
+    Description
+    -----------
+    Writes `artifact` as a legacy pickle and as a per-feature store, then, for
+    each, loads feature `feature_index` in a fresh (spawned) interpreter the
+    way a univariate task does, so the parent's copy of the artifact never
+    counts towards the task's peak memory.
+
+    Parameters
+    ----------
+    artifact (dict)
+        The modeling-input artifact (see `synthetic_modeling_input`).
+    feature_index (int)
+        Index into the sorted feature list of the feature the task loads.
+    work_dir (str | None)
+        Directory for the two files; a temporary directory when None.
+
+    Returns
+    -------
+    rows (list)
+        One dict per format: `format`, `file_mb`, `load_s`,
+        `peak_rss_growth_mb` and `feature_mb` (the size of the loaded feature).
+    """
+
+    rows = []
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp_dir:
+        for input_format, suffix in (('pickle', '.pkl'), ('hdf5', '.h5')):
+            input_path = save_modeling_input(artifact, Path(tmp_dir) / f"modeling_benchmark{suffix}")
+            result_queue = context.Queue()
+            task = context.Process(target=_task_load, args=(str(input_path), feature_index, result_queue))
+            task.start()
+            result = result_queue.get()
+            task.join()
+            rows.append({'format': input_format,
+                         'file_mb': input_path.stat().st_size / 2 ** 20,
+                         'load_s': result['load_s'],
+                         'peak_rss_growth_mb': result['peak_rss_growth_mb'],
+                         'feature_mb': result['feature_mb']})
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-task loading of a pickled vs. per-feature HDF5 modeling input."
+    )
+    parser.add_argument('--n_features', type=int, default=60,
+                        help="Number of synthetic features.")
+    parser.add_argument('--n_sessions', type=int, default=30,
+                        help="Number of synthetic sessions per feature.")
+    parser.add_argument('--n_events', type=int, default=400,
+                        help="Events per session array.")
+    parser.add_argument('--n_frames', type=int, default=600,
+                        help="History frames per event.")
+    parser.add_argument('--work_dir', type=str, default=None,
+                        help="Directory for the benchmark files (e.g., the cluster file system).")
+    cli_args = parser.parse_args()
+
+    for row in benchmark_task_load(
+            synthetic_modeling_input(n_features=cli_args.n_features, n_sessions=cli_args.n_sessions,
+                                     n_events=cli_args.n_events, n_frames=cli_args.n_frames),
+            work_dir=cli_args.work_dir):
+        print(f"{row['format']:>6} | file={row['file_mb']:.0f} MB | load={row['load_s']:.3f} s | "
+              f"peak RSS growth={row['peak_rss_growth_mb']:.0f} MB | feature={row['feature_mb']:.0f} MB",
+              flush=True)
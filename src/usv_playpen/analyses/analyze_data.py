@@ -11,17 +11,31 @@ import traceback
 import warnings
 from collections.abc import Callable
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 import click
 from click.core import ParameterSource
 
 from ..cli_utils import modify_settings_json_for_cli
+from ..import_utils import lazy_exports
 from ..os_utils import configure_path
 from ..send_email import Messenger
-from .compute_behavioral_features import FeatureZoo
-from .compute_inter_usv_interval_distributions import InterUSVIntervalCalculator
-from .compute_neuronal_tuning_curves import NeuronalTuning
-from .generate_audio_files import AudioGenerator
+
+if TYPE_CHECKING:
+    from .compute_behavioral_features import FeatureZoo, save_behavioral_features_batch
+    from .compute_inter_usv_interval_distributions import InterUSVIntervalCalculator
+    from .compute_neuronal_tuning_curves import NeuronalTuning
+    from .generate_audio_files import AudioGenerator
+
+# The analysis classes pull in polars, matplotlib, librosa and torch (via
+# noisereduce), so they are only imported once an analysis needs them.
+__getattr__, _load_workers = lazy_exports(globals(), {
+    'FeatureZoo': '.compute_behavioral_features',
+    'save_behavioral_features_batch': '.compute_behavioral_features',
+    'InterUSVIntervalCalculator': '.compute_inter_usv_interval_distributions',
+    'NeuronalTuning': '.compute_neuronal_tuning_curves',
+    'AudioGenerator': '.generate_audio_files',
+})
 
 
 class Analyst:
@@ -67,6 +81,8 @@ class Analyst:
             session lists
         (2) generates (regular and/or naturalistic) USV playback WAV files
         (3) computes behavioral features and plots their distributions
+            (up front across all directories in a process pool if the
+            "batch_n_jobs" setting is not 1)
         (4) computes per-cluster neuronal tuning curves (behavioral + vocal)
         (5) frequency shifts audio segments
 
@@ -128,11 +144,13 @@ class Analyst:
         try:
             # # # compute inter-vocalization-interval distributions across one or more session lists
             if self.input_parameter_dict['analyses_booleans']['compute_inter_usv_interval_distributions_bool']:
+                _load_workers('InterUSVIntervalCalculator')
                 InterUSVIntervalCalculator(input_parameter_dict=self.input_parameter_dict,
                               message_output=self.message_output).save_inter_usv_interval_distributions_to_file()
 
             # # # create USV playback WAV files
             if self.input_parameter_dict['analyses_booleans']['create_usv_playback_wav_bool'] or self.input_parameter_dict['analyses_booleans']['create_naturalistic_usv_playback_wav_bool']:
+                _load_workers('AudioGenerator')
                 if self.input_parameter_dict['analyses_booleans']['create_usv_playback_wav_bool']:
                     AudioGenerator(exp_id=self.input_parameter_dict['send_email']['experimenter'],
                                    create_playback_settings_dict=self.input_parameter_dict['create_usv_playback_wav'],
@@ -142,25 +160,48 @@ class Analyst:
                                    create_playback_settings_dict=self.input_parameter_dict['create_naturalistic_usv_playback_wav'],
                                    message_output=self.message_output).create_naturalistic_usv_playback_wav()
 
+            # # # compute behavioral features of all directories in a process pool; a directory
+            # whose features failed is reported once and skipped by the per-directory analyses below
+            behavioral_parameters_dict = self.input_parameter_dict['compute_behavioral_features']
+            batch_behavioral_features_bool = (self.input_parameter_dict['analyses_booleans']['compute_behavioral_features_bool']
+                                              and behavioral_parameters_dict['batch_n_jobs'] != 1)
+            batch_failed_directories = set()
+            if batch_behavioral_features_bool:
+                _load_workers('save_behavioral_features_batch')
+                for session_report in save_behavioral_features_batch(root_directories=self.root_directories,
+                                                                     behavioral_parameters_dict=behavioral_parameters_dict,
+                                                                     n_jobs=behavioral_parameters_dict['batch_n_jobs'],
+                                                                     max_memory_gb=behavioral_parameters_dict['batch_max_memory_gb'],
+                                                                     message_output=self.message_output):
+                    if session_report['status'] == 'failed':
+                        batch_failed_directories.add(session_report['root_directory'])
+                        failed_directories.append((session_report['root_directory'],
+                                                   session_report['error'].strip().splitlines()[-1]))
+
             for one_directory in self.root_directories:
+                if str(one_directory) in batch_failed_directories:
+                    continue
                 try:
                     self.message_output(f"Analyzing data in {one_directory} started at: "
                                         f"{datetime.now().hour:02d}:{datetime.now().minute:02d}:{datetime.now().second:02d}.")
 
                     # # # compute behavioral features and plot their distributions
-                    if self.input_parameter_dict['analyses_booleans']['compute_behavioral_features_bool']:
+                    if self.input_parameter_dict['analyses_booleans']['compute_behavioral_features_bool'] and not batch_behavioral_features_bool:
+                        _load_workers('FeatureZoo')
                         FeatureZoo(root_directory=one_directory,
                                    behavioral_parameters_dict=self.input_parameter_dict['compute_behavioral_features'],
                                    message_output=self.message_output).save_behavioral_features_to_file()
 
                     # # # compute neuronal tuning curves (behavioral and vocal in a single pass)
                     if self.input_parameter_dict['analyses_booleans']['compute_neuronal_tuning_bool']:
+                        _load_workers('NeuronalTuning')
                         NeuronalTuning(root_directory=one_directory,
                                        tuning_parameters_dict=self.input_parameter_dict['calculate_neuronal_tuning_curves'],
                                        message_output=self.message_output).calculate_neuronal_tuning_curves()
 
                     # # # frequency shift audio segments
                     if self.input_parameter_dict['analyses_booleans']['frequency_shift_audio_segment_bool']:
+                        _load_workers('AudioGenerator')
                         AudioGenerator(root_directory=one_directory,
                                        freq_shift_settings_dict=self.input_parameter_dict['frequency_shift_audio_segment'],
                                        message_output=self.message_output).frequency_shift_audio_segment()
@@ -231,6 +272,7 @@ def generate_usv_playback_cli(ctx, exp_id, **kwargs) -> None:
     analyses_settings_parameter_dict = modify_settings_json_for_cli(ctx=ctx,
                                                                     provided_params=provided_params,
                                                                     settings_dict='analyses_settings')
+    _load_workers('AudioGenerator')
     AudioGenerator(exp_id=exp_id,
                    create_playback_settings_dict=analyses_settings_parameter_dict['create_usv_playback_wav'],
                    message_output=print).create_usv_playback_wav()
@@ -267,6 +309,7 @@ def generate_naturalistic_usv_playback_cli(ctx, exp_id, **kwargs) -> None:
     analyses_settings_parameter_dict = modify_settings_json_for_cli(ctx=ctx,
                                                                     provided_params=provided_params,
                                                                     settings_dict='analyses_settings')
+    _load_workers('AudioGenerator')
     AudioGenerator(exp_id=exp_id,
                    create_playback_settings_dict=analyses_settings_parameter_dict['create_naturalistic_usv_playback_wav'],
                    message_output=print).create_naturalistic_usv_playback_wav()
@@ -275,6 +318,7 @@ def generate_naturalistic_usv_playback_cli(ctx, exp_id, **kwargs) -> None:
 @click.option('--root-directory', type=click.Path(exists=True, file_okay=False, dir_okay=True), default=None, required=True, help='Session root directory path.')
 @click.option('--temporal-offsets', 'temporal_offsets', multiple=True, type=int, default=None, required=False, help='Spike-behavior offsets to consider (in s).')
 @click.option('--n-shuffles', 'n_shuffles', type=int, default=None, required=False, help='Number of shuffles.')
+@click.option('--shuffle-null-engine', 'shuffle_null_engine', type=click.Choice(['direct', 'fft']), default=None, required=False, help='Behavioral shuffle-null engine: re-bin every shuffled spike (direct) or circularly cross-correlate the spike-count train with per-bin occupancy (fft); both give identical counts.')
 @click.option('--total-bin-num', 'total_bin_num', type=int, default=None, required=False, help='Total number of bins for 1D tuning curves.')
 @click.option('--n-spatial-bins', 'n_spatial_bins', type=int, default=None, required=False, help='Number of spatial bins.')
 @click.option('--spatial-scale-cm', 'spatial_scale_cm', type=int, default=None, required=False, help='Spatial extent of the arena (in cm).')
@@ -286,6 +330,8 @@ def generate_naturalistic_usv_playback_cli(ctx, exp_id, **kwargs) -> None:
 @click.option('--n-usv-min-category', 'n_usv_min_category', type=int, default=None, required=False, help='Minimum per-category USV count to retain that category.')
 @click.option('--include-partner-tuning/--no-include-partner-tuning', 'include_partner_vocalization_tuning_bool', default=None, required=False, help='If set, also compute partner-side vocal tuning when partner threshold is met.')
 @click.option('--behavioral-min-occupancy-seconds', 'behavioral_min_occupancy_seconds', type=float, default=None, required=False, help='Minimum behavioral occupancy per bin (in s) for that bin to be rendered in the 1D feature line plots; persisted into behavioral_metadata of each cluster pkl.')
+@click.option('--n-jobs', 'n_jobs', type=int, default=None, required=False, help='Number of worker processes to spread clusters over (1 = serial, -1 = all cores).')
+@click.option('--cluster-chunk-size', 'cluster_chunk_size', type=int, default=None, required=False, help='Number of clusters dispatched to a worker per task when --n-jobs is not 1.')
 @click.option('--smoothing-sd', 'smoothing_sd', type=float, default=None, required=False, help='Standard deviation (in bins) of the Gaussian smoothing applied to ratemaps and shuffle distributions; 0 disables smoothing.')
 @click.pass_context
 def generate_rm_files_cli(ctx, root_directory, **kwargs) -> None:
@@ -315,24 +361,33 @@ def generate_rm_files_cli(ctx, root_directory, **kwargs) -> None:
     analyses_settings_parameter_dict = modify_settings_json_for_cli(ctx=ctx,
                                                                     parameters_lists=parameters_lists,
                                                                     provided_params=provided_params,
-                                                                    settings_dict='analyses_settings')
+                                                                    settings_dict='analyses_settings',
+                                                                    block='calculate_neuronal_tuning_curves')
+    _load_workers('NeuronalTuning')
     NeuronalTuning(root_directory=root_directory,
                    tuning_parameters_dict=analyses_settings_parameter_dict['calculate_neuronal_tuning_curves'],
                    message_output=print).calculate_neuronal_tuning_curves()
 
 
 @click.command(name='generate-beh-features')
-@click.option('--root-directory', type=click.Path(exists=True, file_okay=False, dir_okay=True), default=None, required=True, help='Session root directory path.')
+@click.option('--root-directory', type=click.Path(exists=True, file_okay=False, dir_okay=True), default=None, required=False, help='Session root directory path.')
+@click.option('--session-list', 'session_list_files', type=click.Path(exists=True, file_okay=True, dir_okay=False), multiple=True, required=False, help='Path to a text file containing session root directories (one per line); the sessions are run as one batch. Repeatable.')
 @click.option('--head-points', 'head_points', nargs=4, type=str, default=None, required=False, help='Skeleton head nodes.')
 @click.option('--tail-points', 'tail_points',  nargs=5, type=str, default=None, required=False, help='Skeleton tail nodes.')
 @click.option('--back-root-points', 'back_root_points', nargs=3, type=str, default=None, required=False, help='Skeleton back nodes.')
 @click.option('--derivative-bins', 'derivative_bins', multiple=True, type=str, default=None, required=False, help='Number of bins for derivative calculation.')
+@click.option('--plot-feature-distributions/--no-plot-feature-distributions', 'plot_feature_distributions', default=None, required=False, help='Whether to compute the feature distributions and render their PDF.')
+@click.option('--batch-n-jobs', 'batch_n_jobs', type=int, default=None, required=False, help='Number of worker processes to spread the sessions over (1 = serial, -1 = all cores).')
+@click.option('--batch-max-memory-gb', 'batch_max_memory_gb', type=float, default=None, required=False, help='Memory budget (in GB) of the sessions processed at once; lowers the worker count to fit (0 = no cap).')
 @click.pass_context
-def generate_beh_features_cli(ctx, root_directory, **kwargs) -> None:
+def generate_beh_features_cli(ctx, root_directory, session_list_files, **kwargs) -> None:
     """
     Description
     -----------
-    A command-line tool to compute 3D behavioral features.
+    A command-line tool to compute 3D behavioral features, for one session
+    root directory or, in batch mode, for every session in one or more
+    session-list files (plus --root-directory, if given). A batch reports
+    each session's time and failure and exits non-zero if any failed.
 
     Parameters
     ----------
@@ -342,6 +397,9 @@ def generate_beh_features_cli(ctx, root_directory, **kwargs) -> None:
     None
     """
 
+    if root_directory is None and not session_list_files:
+        raise click.UsageError("Provide --root-directory and / or --session-list.")
+
     parameters_lists = ['head_points', 'tail_points', 'back_root_points']
 
     provided_params = [key for key in kwargs if ctx.get_parameter_source(key) == ParameterSource.COMMANDLINE]
@@ -350,9 +408,31 @@ def generate_beh_features_cli(ctx, root_directory, **kwargs) -> None:
                                                                     parameters_lists=parameters_lists,
                                                                     provided_params=provided_params,
                                                                     settings_dict='analyses_settings')
-    FeatureZoo(root_directory=root_directory,
-               behavioral_parameters_dict=analyses_settings_parameter_dict['compute_behavioral_features'],
-               message_output=print).save_behavioral_features_to_file()
+    behavioral_parameters_dict = analyses_settings_parameter_dict['compute_behavioral_features']
+
+    if not session_list_files:
+        _load_workers('FeatureZoo')
+        FeatureZoo(root_directory=root_directory,
+                   behavioral_parameters_dict=behavioral_parameters_dict,
+                   message_output=print).save_behavioral_features_to_file()
+        return
+
+    root_directories = [root_directory] if root_directory is not None else []
+    for session_list_file in session_list_files:
+        with open(session_list_file) as session_list:
+            root_directories.extend(configure_path(line.strip()) for line in session_list if line.strip())
+
+    _load_workers('save_behavioral_features_batch')
+    session_reports = save_behavioral_features_batch(root_directories=root_directories,
+                                                     behavioral_parameters_dict=behavioral_parameters_dict,
+                                                     n_jobs=behavioral_parameters_dict['batch_n_jobs'],
+                                                     max_memory_gb=behavioral_parameters_dict['batch_max_memory_gb'],
+                                                     message_output=print)
+    failed_sessions = [session_report['root_directory'] for session_report in session_reports
+                       if session_report['status'] == 'failed']
+    if failed_sessions:
+        raise click.ClickException(f"{len(failed_sessions)} of {len(session_reports)} session(s) failed: "
+                                   f"{', '.join(failed_sessions)}")
 
 @click.command(name='generate-usv-interval-distributions')
 @click.option('--session-list', 'session_lists', type=click.Path(exists=True, file_okay=True, dir_okay=False), multiple=True, required=False, help='Path to a text file containing session root directories (one per line). Repeatable.')
@@ -376,6 +456,8 @@ def generate_beh_features_cli(ctx, root_directory, **kwargs) -> None:
 @click.option('--bootstrap-lrt-n-subsample', 'bootstrap_lrt_n_subsample', type=int, default=None, required=False, help='Subsample size used for both observed and bootstrap fits in the LRT, so the LR statistic is on the same N scale. Defaults to JSON value (15000).')
 @click.option('--bootstrap-lrt-alpha', 'bootstrap_lrt_alpha', type=float, default=None, required=False, help='Significance threshold for the step-up LRT decision rule. Defaults to JSON value (0.05).')
 @click.option('--bootstrap-lrt-bonferroni/--no-bootstrap-lrt-bonferroni', 'bootstrap_lrt_bonferroni', default=None, required=False, help='If set, divide alpha by the number of pairwise tests (per key) before applying the step-up rule.')
+@click.option('--mixture-em-engine', 'mixture_em_engine', type=click.Choice(['serial', 'batched'], case_sensitive=False), default=None, required=False, help='EM engine for the mixture sweep, CV folds and bootstrap LRT refits: "batched" fits all reps / folds / bootstrap replicates of a K as one vectorized array program from the same initialisations as "serial" (one sklearn / TMixture fit at a time).')
+@click.option('--mixture-em-n-jobs', 'mixture_em_n_jobs', type=int, default=None, required=False, help='Worker processes the batched EM engine spreads its problem batches over (useful for very large bootstrap-lrt-B).')
 @click.pass_context
 def generate_usv_interval_distributions_cli(ctx, **kwargs) -> None:
     """
@@ -401,5 +483,6 @@ def generate_usv_interval_distributions_cli(ctx, **kwargs) -> None:
                                                                     parameters_lists=parameters_lists,
                                                                     provided_params=provided_params,
                                                                     settings_dict='analyses_settings')
+    _load_workers('InterUSVIntervalCalculator')
     InterUSVIntervalCalculator(input_parameter_dict=analyses_settings_parameter_dict,
                   message_output=print).save_inter_usv_interval_distributions_to_file()
@@ -0,0 +1,396 @@
+"""
+@author: bartulem
+Columnar storage and lazy loading of the per-session behavioral feature tables.
+
+`FeatureZoo.save_behavioral_features_to_file` used to write its table only as
+`*_behavioral_features.csv` (float64 text), and every consumer -- the modeling
+extractors, the neuronal tuning curves, the USV summary statistics, the
+behavioral videos -- re-parsed the whole CSV even when it needed a handful of
+columns or a short frame window. The table can now also (or instead) be
+written as Parquet next to the CSV:
+
+    *_behavioral_features.parquet   zstd-compressed, float32 wherever the
+                                    cast is safe (see `downcast_float_columns`),
+                                    session metadata in the file footer
+
+Readers go through `scan_behavioral_features`, a `polars.LazyFrame` over the
+Parquet table (or the CSV, for sessions processed before the switch), so
+column projections and frame ranges are pushed into the reader, and
+`load_behavioral_feature_sessions` loads many sessions as one multi-file scan.
+Which formats the writer emits is set by
+`compute_behavioral_features.feature_table_formats`; readers prefer the
+Parquet table whenever a session has one.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+from collections.abc import Iterable
+
+import numpy as np
+import polars as pls
+
+from ..os_utils import atomic_output_path, first_match_or_raise
+
+#: File suffix per `compute_behavioral_features.feature_table_formats` entry.
+FEATURE_TABLE_FORMATS = {'csv': '.csv', 'parquet': '.parquet'}
+
+TABLE_FORMAT = 'usv_playpen.behavioral_features'
+TABLE_FORMAT_VERSION = 1
+
+_FOOTER_FORMAT_KEY = 'usv_playpen.format'
+_FOOTER_VERSION_KEY = 'usv_playpen.format_version'
+_FOOTER_SESSION_KEY = 'usv_playpen.session_metadata'
+
+# largest integer float32 represents exactly
+_FLOAT32_EXACT_INT = 2 ** 24
+
+_SOURCE_FILE_COLUMN = '__behavioral_feature_source__'
+
+
+def downcast_float_columns(df: pls.DataFrame) -> tuple[pls.DataFrame, list[str]]:
+    """
+    Description
+    -----------
+    Casts the float64 columns of a feature table to float32 where that is
+    safe: every finite value must stay finite (no overflow) and every
+    whole-number value (counts, frame indices) must survive exactly, which
+    float32 guarantees only up to 2 ** 24. Columns failing either check stay
+    float64; other dtypes are left alone.
+
+    Parameters
+    ----------
+    df (pls.DataFrame)
+        The feature table.
+
+    Returns
+    -------
+    df (pls.DataFrame)
+        The table with the safe columns cast to float32.
+    downcast_columns (list)
+        Names of the columns that were cast.
+    """
+
+    downcast_columns = []
+    for column_name, dtype in df.schema.items():
+        if dtype != pls.Float64:
+            continue
+        values = df.get_column(column_name).to_numpy()
+        with np.errstate(over='ignore'):
+            narrow = values.astype(np.float32)
+        finite = np.isfinite(values)
+        if not np.array_equal(np.isfinite(narrow), finite):
+            continue
+        whole = finite & (values == np.round(values))
+        if np.any(np.abs(values[whole]) > _FLOAT32_EXACT_INT):
+            continue
+        downcast_columns.append(column_name)
+
+    return df.with_columns(pls.col(downcast_columns).cast(pls.Float32)), downcast_columns
+
+
+def write_behavioral_feature_table(df: pls.DataFrame,
+                                   file_stem: str | pathlib.Path,
+                                   formats: Iterable[str] = ('csv', 'parquet'),
+                                   float32: bool = True,
+                                   session_metadata: dict | None = None,
+                                   csv_sep: str = ',') -> list[pathlib.Path]:
+    """
+    Description
+    -----------
+    Writes a session's feature table in each requested format, as
+    `<file_stem>.csv` and / or `<file_stem>.parquet`. The CSV is the full
+    float64 text table it always was. The Parquet table is written
+    atomically (readers never see a partial file), float32 where safe when
+    `float32` is set, with the format tag and `session_metadata` (JSON) in
+    its footer.
+
+    Parameters
+    ----------
+    df (pls.DataFrame)
+        The (n_frames, n_features) feature table.
+    file_stem (str / pathlib.Path)
+        Output path without the suffix, e.g.
+        `<...>_points3d_translated_rotated_metric_behavioral_features`.
+    formats (Iterable)
+        Any of `'csv'` and `'parquet'`; defaults to both.
+    float32 (bool)
+        Downcast the Parquet table's safe float64 columns; defaults to True.
+    session_metadata (dict)
+        JSON-serializable session description stored in the Parquet footer.
+    csv_sep (str)
+        CSV separator; defaults to ','.
+
+    Returns
+    -------
+    written (list)
+        Paths of the written tables, in `formats` order.
+    """
+
+    formats = list(formats)
+    unknown = sorted(set(formats) - set(FEATURE_TABLE_FORMATS))
+    if unknown or not formats:
+        raise ValueError(f"feature_table_formats must be a non-empty subset of {sorted(FEATURE_TABLE_FORMATS)}, "
+                         f"got {formats!r}.")
+
+    written = []
+    for table_format in formats:
+        out_path = pathlib.Path(f"{file_stem}{FEATURE_TABLE_FORMATS[table_format]}")
+        if table_format == 'csv':
+            df.write_csv(file=out_path, separator=csv_sep, include_header=True)
+        else:
+            table = downcast_float_columns(df)[0] if float32 else df
+            footer = {
+                _FOOTER_FORMAT_KEY: TABLE_FORMAT,
+                _FOOTER_VERSION_KEY: str(TABLE_FORMAT_VERSION),
+                _FOOTER_SESSION_KEY: json.dumps(session_metadata or {}),
+            }
+            with atomic_output_path(out_path) as tmp_path:
+                table.write_parquet(tmp_path, compression='zstd', metadata=footer)
+        written.append(out_path)
+
+    return written
+
+
+def read_behavioral_feature_metadata(table_path: str | pathlib.Path) -> dict:
+    """
+    Description
+    -----------
+    Reads the session metadata from a Parquet feature table's footer without
+    touching the data pages. CSV tables carry no metadata.
+
+    Parameters
+    ----------
+    table_path (str / pathlib.Path)
+        A `*_behavioral_features.parquet` or `.csv` table.
+
+    Returns
+    -------
+    session_metadata (dict)
+        The footer's session metadata; empty for CSV tables and for Parquet
+        files not written by `write_behavioral_feature_table`.
+    """
+
+    table_path = pathlib.Path(table_path)
+    if table_path.suffix != FEATURE_TABLE_FORMATS['parquet']:
+        return {}
+    footer = pls.read_parquet_metadata(table_path)
+    if footer.get(_FOOTER_FORMAT_KEY) != TABLE_FORMAT:
+        return {}
+    return json.loads(footer.get(_FOOTER_SESSION_KEY, '{}'))
+
+
+def find_behavioral_feature_table(root: str | pathlib.Path,
+                                  pattern: str = '*_behavioral_features',
+                                  recursive: bool = True) -> pathlib.Path:
+    """
+    Description
+    -----------
+    Locates a session's feature table under `root`: the alphabetically-first
+    `<pattern>.parquet` if there is one, else the first `<pattern>.csv*`
+    (sessions processed before the columnar format).
+
+    Parameters
+    ----------
+    root (str / pathlib.Path)
+        The directory to search.
+    pattern (str)
+        Glob pattern of the table's path without its suffix; defaults to
+        '*_behavioral_features'.
+    recursive (bool)
+        Search the directory tree; defaults to True.
+
+    Returns
+    -------
+    table_path (pathlib.Path)
+        The feature table.
+
+    Raises
+    ------
+    FileNotFoundError
+        If neither table exists.
+    """
+
+    root = pathlib.Path(root)
+    try:
+        return first_match_or_raise(root=root, pattern=f"{pattern}.parquet", recursive=recursive,
+                                    label="behavioral features Parquet table")
+    except FileNotFoundError:
+        return first_match_or_raise(root=root, pattern=f"{pattern}.csv*", recursive=recursive,
+                                    label="behavioral features table (.parquet or .csv)")
+
+
+def behavioral_feature_columns(table_path: str | pathlib.Path, csv_sep: str = ',') -> list[str]:
+    """
+    Description
+    -----------
+    Column names of a feature table, read from the Parquet schema or the CSV
+    header without loading any rows.
+
+    Parameters
+    ----------
+    table_path (str / pathlib.Path)
+        A `*_behavioral_features.parquet` or `.csv` table.
+    csv_sep (str)
+        CSV separator; defaults to ','.
+
+    Returns
+    -------
+    columns (list)
+        The table's column names, in file order.
+    """
+
+    return scan_behavioral_features(table_path, csv_sep=csv_sep).collect_schema().names()
+
+
+def scan_behavioral_features(table_path: str | pathlib.Path,
+                             columns: list[str] | None = None,
+                             frame_range: tuple[int, int | None] | None = None,
+                             row_index_name: str | None = None,
+                             csv_sep: str = ',') -> pls.LazyFrame:
+    """
+    Description
+    -----------
+    Lazy scan of one feature table. The column projection and the frame range
+    are part of the query plan, so the Parquet reader decodes only the
+    requested column chunks and row groups.
+
+    Parameters
+    ----------
+    table_path (str / pathlib.Path)
+        A `*_behavioral_features.parquet` or `.csv` table.
+    columns (list)
+        Columns to keep, in this order; None keeps all.
+    frame_range (tuple)
+        Half-open `(start, stop)` camera-frame range to keep; `stop=None`
+        reads to the end. None keeps every frame.
+    row_index_name (str)
+        If given, a leading column of this name holds each row's camera frame
+        index (counted from the start of the table, before `frame_range`).
+    csv_sep (str)
+        CSV separator; defaults to ','.
+
+    Returns
+    -------
+    scan (pls.LazyFrame)
+        The lazy table.
+    """
+
+    table_path = pathlib.Path(table_path)
+    if table_path.suffix == FEATURE_TABLE_FORMATS['parquet']:
+        scan = pls.scan_parquet(table_path)
+    else:
+        scan = pls.scan_csv(table_path, separator=csv_sep)
+
+    if row_index_name is not None:
+        scan = scan.with_row_index(row_index_name)
+    if columns is not None:
+        scan = scan.select(([row_index_name] if row_index_name is not None else []) + list(columns))
+    if frame_range is not None:
+        start, stop = max(int(frame_range[0]), 0), frame_range[1]
+        scan = scan.slice(start, None if stop is None else max(int(stop) - start, 0))
+    return scan
+
+
+def load_behavioral_features(table_path: str | pathlib.Path,
+                             columns: list[str] | None = None,
+                             frame_range: tuple[int, int | None] | None = None,
+                             row_index_name: str | None = None,
+                             csv_sep: str = ',') -> pls.DataFrame:
+    """
+    Description
+    -----------
+    Collects `scan_behavioral_features` (see there for the parameters).
+
+    Parameters
+    ----------
+    table_path (str / pathlib.Path)
+        A `*_behavioral_features.parquet` or `.csv` table.
+    columns (list)
+        Columns to keep; None keeps all.
+    frame_range (tuple)
+        Half-open `(start, stop)` camera-frame range; None keeps all.
+    row_index_name (str)
+        Name of an added frame-index column; None adds none.
+    csv_sep (str)
+        CSV separator; defaults to ','.
+
+    Returns
+    -------
+    features (pls.DataFrame)
+        The loaded table.
+    """
+
+    return scan_behavioral_features(table_path, columns=columns, frame_range=frame_range,
+                                    row_index_name=row_index_name, csv_sep=csv_sep).collect()
+
+
+def load_behavioral_feature_sessions(table_paths: dict[str, str | pathlib.Path],
+                                     columns: list[str] | None = None,
+                                     csv_sep: str = ',') -> dict[str, pls.DataFrame]:
+    """
+    Description
+    -----------
+    Loads the feature tables of many sessions. Parquet tables are grouped by
+    schema (read from the footers) and each group is read as one multi-file
+    scan -- normally the whole cohort, since sessions with the same animals
+    share their columns -- and split back into sessions afterwards; CSV
+    tables are read one by one. A column stored as float32 in some sessions
+    and float64 in others is returned as float64 everywhere, so the
+    per-session tables can always be concatenated.
+
+    Parameters
+    ----------
+    table_paths (dict)
+        `{session_id: table_path}`.
+    columns (list)
+        Columns to keep; None keeps all. Columns a session lacks are skipped
+        for that session.
+    csv_sep (str)
+        CSV separator of the legacy tables; defaults to ','.
+
+    Returns
+    -------
+    features (dict)
+        `{session_id: pls.DataFrame}` in the order of `table_paths`.
+    """
+
+    loaded = {}
+    schema_groups = {}
+    for sess_id, table_path in table_paths.items():
+        table_path = pathlib.Path(table_path)
+        if table_path.suffix == FEATURE_TABLE_FORMATS['parquet']:
+            schema = pls.read_parquet_schema(table_path)
+            schema_groups.setdefault(tuple(schema.items()), []).append((sess_id, table_path))
+        else:
+            sess_columns = columns
+            if columns is not None:
+                available = set(behavioral_feature_columns(table_path, csv_sep=csv_sep))
+                sess_columns = [col for col in columns if col in available]
+            loaded[sess_id] = load_behavioral_features(table_path, columns=sess_columns, csv_sep=csv_sep)
+
+    for schema_items, group in schema_groups.items():
+        group_columns = [name for name, _ in schema_items]
+        if columns is not None:
+            group_columns = [col for col in columns if col in dict(schema_items)]
+        source_to_session = {str(path): sess_id for sess_id, path in group}
+        group_df = (
+            pls.scan_parquet([path for _, path in group], include_file_paths=_SOURCE_FILE_COLUMN)
+            .select([_SOURCE_FILE_COLUMN] + group_columns)
+            .collect()
+        )
+        for (source,), sess_df in group_df.partition_by(_SOURCE_FILE_COLUMN, as_dict=True,
+                                                        maintain_order=True).items():
+            loaded[source_to_session[source]] = sess_df.drop(_SOURCE_FILE_COLUMN)
+        for sess_id, _ in group:
+            if sess_id not in loaded:  # zero-row table
+                loaded[sess_id] = group_df.clear().drop(_SOURCE_FILE_COLUMN)
+
+    wide_columns = {name for df in loaded.values() for name, dtype in df.schema.items() if dtype == pls.Float64}
+    for sess_id, df in loaded.items():
+        widen = [name for name, dtype in df.schema.items() if dtype == pls.Float32 and name in wide_columns]
+        if widen:
+            loaded[sess_id] = df.with_columns(pls.col(widen).cast(pls.Float64))
+
+    return {sess_id: loaded[sess_id] for sess_id in table_paths}
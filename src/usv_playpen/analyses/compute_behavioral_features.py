@@ -34,7 +34,10 @@ from __future__ import annotations
 import itertools
 import json
 import pathlib
+import time
+import traceback
 import warnings
+from collections.abc import Callable
 from datetime import datetime
 
 import h5py
@@ -42,6 +45,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import polars as pls
 from astropy.convolution import Gaussian1DKernel, convolve
+from joblib import Parallel, delayed, effective_n_jobs
 from matplotlib import gridspec
 from matplotlib.backends.backend_pdf import PdfPages
 from scipy.optimize import minimize
@@ -53,6 +57,7 @@ from ..visualizations.auxiliary_plot_functions import (
     choose_animal_colors,
     create_colormap,
 )
+from .behavioral_feature_table import write_behavioral_feature_table
 from .decode_experiment_label import extract_information
 
 apply_plot_style()
@@ -1790,17 +1795,21 @@ class FeatureZoo:
         emitted separately but do not drive the gate (see the history
         note in `calculate_sei`).
 
-        The full table is materialized as a `polars.DataFrame`,
-        feature-by-feature feature distributions are computed via
-        `generate_feature_distributions` (using the per-feature ranges
-        from `self.feature_boundaries`), the distribution PDF is
-        rendered by `plot_feature_distributions`, and the assembled
-        table is written next to the input file as
-        `*_behavioral_features.csv`.
+        The full table is materialized as a `polars.DataFrame`. Unless
+        "plot_feature_distributions" is False, feature-by-feature feature
+        distributions are computed via `generate_feature_distributions`
+        (using the per-feature ranges from `self.feature_boundaries`) and
+        the distribution PDF is rendered by `plot_feature_distributions`.
+        The assembled table is written next to the input file as
+        `*_behavioral_features.csv` and / or `*_behavioral_features.parquet`
+        (float32 where safe, session metadata in the footer), per the
+        "feature_table_formats" and "feature_table_float32" settings.
 
         The class instance must be configured with `root_directory`,
         `behavioral_parameters_dict` (with keys "head_points",
-        "tail_points", "back_root_points", "derivative_bins"),
+        "tail_points", "back_root_points", "derivative_bins",
+        "plot_feature_distributions", "feature_table_formats",
+        "feature_table_float32"),
         `message_output` (a callable used for status messages), and
         `app_context_bool` (set automatically by `__init__`).
 
@@ -1809,8 +1818,8 @@ class FeatureZoo:
 
         Returns
         -------
-        behavioral_features_csv (.csv file)
-           Data sheet w/ behavioral features.
+        behavioral_features_csv (.csv / .parquet file)
+           Data sheet(s) w/ behavioral features.
         """
 
         self.message_output(
@@ -2695,61 +2704,265 @@ class FeatureZoo:
                     pls.Series(f"{pair_name_reverse}.anogenital-sei_2nd_der", social_engagement_indices_2nd_der[:, 3])
                 )
 
-        # # # # compute feature distributions
-        feature_distribution_dict = {}
-        space_computed_occ = dict.fromkeys(track_names, False)
-        for column in behavioral_features_df.columns:
-            if "space" not in column:
-                feature_distribution_dict[column] = {}
-                (
-                    feature_distribution_dict[column]["occ_array"],
-                    feature_distribution_dict[column]["bin_centers"],
-                    feature_distribution_dict[column]["bin_edges"],
-                ) = generate_feature_distributions(
-                    feature_arr=behavioral_features_df.select(column).to_numpy(),
-                    min_val=self.feature_boundaries[column.split(".")[1]][0],
-                    max_val=self.feature_boundaries[column.split(".")[1]][1],
-                    num_bins=self.behavioral_parameters_dict["feature_hist_num_bins"],
-                    camera_fr=empirical_camera_sr,
-                    space_bool=False,
-                )
-            elif space_computed_occ[f"{column.split('.')[0]}"] is False:
-                feature_distribution_dict[column] = {}
-                (
-                    feature_distribution_dict[column]["occ_array"],
-                    feature_distribution_dict[column]["bin_centers"],
-                    feature_distribution_dict[column]["bin_edges"],
-                ) = generate_feature_distributions(
-                    feature_arr=np.stack(
-                        arrays=(
-                            behavioral_features_df.select(
-                                f"{column.split('.')[0]}.spaceX"
-                            ).to_numpy(),
-                            behavioral_features_df.select(
-                                f"{column.split('.')[0]}.spaceY"
-                            ).to_numpy(),
+        # # # # compute feature distributions (only the PDF uses them)
+        if self.behavioral_parameters_dict["plot_feature_distributions"]:
+            feature_distribution_dict = {}
+            space_computed_occ = dict.fromkeys(track_names, False)
+            for column in behavioral_features_df.columns:
+                if "space" not in column:
+                    feature_distribution_dict[column] = {}
+                    (
+                        feature_distribution_dict[column]["occ_array"],
+                        feature_distribution_dict[column]["bin_centers"],
+                        feature_distribution_dict[column]["bin_edges"],
+                    ) = generate_feature_distributions(
+                        feature_arr=behavioral_features_df.select(column).to_numpy(),
+                        min_val=self.feature_boundaries[column.split(".")[1]][0],
+                        max_val=self.feature_boundaries[column.split(".")[1]][1],
+                        num_bins=self.behavioral_parameters_dict["feature_hist_num_bins"],
+                        camera_fr=empirical_camera_sr,
+                        space_bool=False,
+                    )
+                elif space_computed_occ[f"{column.split('.')[0]}"] is False:
+                    feature_distribution_dict[column] = {}
+                    (
+                        feature_distribution_dict[column]["occ_array"],
+                        feature_distribution_dict[column]["bin_centers"],
+                        feature_distribution_dict[column]["bin_edges"],
+                    ) = generate_feature_distributions(
+                        feature_arr=np.stack(
+                            arrays=(
+                                behavioral_features_df.select(
+                                    f"{column.split('.')[0]}.spaceX"
+                                ).to_numpy(),
+                                behavioral_features_df.select(
+                                    f"{column.split('.')[0]}.spaceY"
+                                ).to_numpy(),
+                            ),
+                            axis=1,
                         ),
-                        axis=1,
-                    ),
-                    min_val=self.behavioral_parameters_dict["spatial_hist_min_val"],
-                    max_val=self.behavioral_parameters_dict["spatial_hist_max_val"],
-                    num_bins=self.behavioral_parameters_dict["spatial_hist_num_bins"],
-                    camera_fr=empirical_camera_sr,
-                    space_bool=True,
-                )
-                space_computed_occ[f"{column.split('.')[0]}"] = True
-
-        # # # # plot feature distributions
-        self.plot_feature_distributions(
-            feature_dict=feature_distribution_dict,
-            mouse_id_list=track_names,
-            session_exp_code=experimental_code,
-            plot_file_name=f"{tracked_file_loc.with_suffix('')}_behavioral_features_histograms.pdf",
+                        min_val=self.behavioral_parameters_dict["spatial_hist_min_val"],
+                        max_val=self.behavioral_parameters_dict["spatial_hist_max_val"],
+                        num_bins=self.behavioral_parameters_dict["spatial_hist_num_bins"],
+                        camera_fr=empirical_camera_sr,
+                        space_bool=True,
+                    )
+                    space_computed_occ[f"{column.split('.')[0]}"] = True
+
+            # # # # plot feature distributions
+            self.plot_feature_distributions(
+                feature_dict=feature_distribution_dict,
+                mouse_id_list=track_names,
+                session_exp_code=experimental_code,
+                plot_file_name=f"{tracked_file_loc.with_suffix('')}_behavioral_features_histograms.pdf",
+            )
+
+        # # # # save data to .csv / .parquet file(s)
+        write_behavioral_feature_table(
+            df=behavioral_features_df,
+            file_stem=f"{tracked_file_loc.with_suffix('')}_behavioral_features",
+            formats=self.behavioral_parameters_dict["feature_table_formats"],
+            float32=self.behavioral_parameters_dict["feature_table_float32"],
+            session_metadata={
+                "session_id": pathlib.Path(self.root_directory).name,
+                "source_file": tracked_file_loc.name,
+                "experimental_code": experimental_code,
+                "camera_frame_rate": float(empirical_camera_sr),
+                "track_names": list(track_names),
+            },
         )
 
-        # # # # save data to .csv file
-        behavioral_features_df.write_csv(
-            file=f"{tracked_file_loc.with_suffix('')}_behavioral_features.csv",
-            separator=",",
-            include_header=True,
+
+# Working-set float64 values per frame behind `save_behavioral_features_to_file`:
+# the per-mouse intermediates (head / back roots, angles and their derivatives)
+# plus the mouse's table columns, and the same for every pair of mice (social
+# distances, angles, SEIs and their derivatives). The table is copied once more
+# on the float32 / Parquet write, hence the 2x headroom.
+_WORKING_VALUES_PER_MOUSE = 96
+_WORKING_VALUES_PER_PAIR = 96
+_WORKING_SET_HEADROOM = 2.0
+
+
+def estimate_feature_session_memory_gb(root_directory: str | pathlib.Path) -> float:
+    """
+    Description
+    -----------
+    Estimates the peak memory (in GB) of `save_behavioral_features_to_file`
+    for one session from the shape of its translated/rotated 3D tracks,
+    which is read from the `.h5` header without loading the array.
+
+    Parameters
+    ----------
+    root_directory (str / pathlib.Path)
+        Session root directory.
+
+    Returns
+    -------
+    session_memory_gb (float)
+        Estimated peak memory of the session (in GB).
+    """
+
+    tracked_file_loc = first_match_or_raise(
+        root=pathlib.Path(root_directory) / 'video',
+        pattern='[!speaker]*_points3d_translated_rotated_metric.h5',
+        recursive=True,
+        label="translated/rotated mouse points3d .h5",
+    )
+    with h5py.File(tracked_file_loc, mode="r") as tracking_data_3d:
+        n_frames, n_mice, n_nodes, n_dims = tracking_data_3d["tracks"].shape
+
+    n_pairs = n_mice * (n_mice - 1) // 2
+    values_per_frame = (n_mice * n_nodes * n_dims
+                        + n_mice * _WORKING_VALUES_PER_MOUSE
+                        + n_pairs * _WORKING_VALUES_PER_PAIR)
+    return _WORKING_SET_HEADROOM * n_frames * values_per_frame * 8 / 2 ** 30
+
+
+def _save_session_behavioral_features(
+    root_directory: str,
+    behavioral_parameters_dict: dict,
+    message_output: Callable | None = None,
+) -> dict:
+    """
+    Description
+    -----------
+    Runs `save_behavioral_features_to_file` for one session and reports its
+    outcome instead of raising, so one bad session does not stop a batch.
+    Runs in-process for the serial batch and inside pool workers, where a
+    prefixed `print` replaces the (possibly GUI-bound) message_output; the
+    benign RuntimeWarnings `Analyst.analyze_data` silences in the parent are
+    silenced here as well, since workers do not inherit its filter.
+
+    Parameters
+    ----------
+    root_directory (str)
+        Session root directory.
+    behavioral_parameters_dict (dict)
+        The ``compute_behavioral_features`` analyses-settings block.
+    message_output (function)
+        Defines output messages; None prints, prefixed with the session name.
+
+    Returns
+    -------
+    session_report (dict)
+        `root_directory`, `status` ("ok" / "failed"), `seconds` and `error`
+        (the traceback of a failed session, else None).
+    """
+
+    if message_output is None:
+        session_name = pathlib.Path(root_directory).name
+
+        def message_output(message):
+            print(f"[{session_name}] {message}", flush=True)
+
+    start_time = time.perf_counter()
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            FeatureZoo(root_directory=root_directory,
+                       behavioral_parameters_dict=behavioral_parameters_dict,
+                       message_output=message_output).save_behavioral_features_to_file()
+    except Exception:
+        return {'root_directory': root_directory, 'status': 'failed',
+                'seconds': time.perf_counter() - start_time, 'error': traceback.format_exc()}
+    return {'root_directory': root_directory, 'status': 'ok',
+            'seconds': time.perf_counter() - start_time, 'error': None}
+
+
+def save_behavioral_features_batch(
+    root_directories: list,
+    behavioral_parameters_dict: dict,
+    n_jobs: int = 1,
+    max_memory_gb: float | None = None,
+    message_output: Callable | None = None,
+) -> list[dict]:
+    """
+    Description
+    -----------
+    Computes and saves the behavioral features of many sessions.
+
+    Sessions are independent, so with `n_jobs` != 1 they are spread over a
+    loky process pool, one session per task; each worker runs the full
+    `save_behavioral_features_to_file` and returns only a small report, so
+    no feature table crosses the process boundary. The pool is sized to
+    keep the estimated peak memory of its concurrent sessions (the largest
+    session's `estimate_feature_session_memory_gb` times the worker count)
+    within `max_memory_gb`. A failing session is reported and the batch
+    continues; a session whose memory can not be estimated (e.g. missing
+    tracking file) still runs and fails with the usual error. A session
+    listed twice runs once.
+
+    Parameters
+    ----------
+    root_directories (list)
+        Session root directories.
+    behavioral_parameters_dict (dict)
+        The ``compute_behavioral_features`` analyses-settings block.
+    n_jobs (int)
+        Worker processes (1 = serial, in-process; -1 = all cores); defaults to 1.
+    max_memory_gb (float)
+        Memory budget of the concurrent sessions (in GB); None or 0 leaves
+        the worker count at `n_jobs`; defaults to None.
+    message_output (function)
+        Defines output messages; defaults to None (print).
+
+    Returns
+    -------
+    session_reports (list[dict])
+        One report per session, in input order (see
+        `_save_session_behavioral_features`).
+    """
+
+    if message_output is None:
+        message_output = print
+    root_directories = list(dict.fromkeys(str(one_directory) for one_directory in root_directories))
+    if not root_directories:
+        return []
+
+    n_workers = min(effective_n_jobs(n_jobs), len(root_directories))
+    if n_workers > 1 and max_memory_gb:
+        session_memory_gb = []
+        for one_directory in root_directories:
+            try:
+                session_memory_gb.append(estimate_feature_session_memory_gb(one_directory))
+            except (OSError, KeyError, ValueError):
+                continue
+        if session_memory_gb:
+            n_workers = max(1, min(n_workers, int(max_memory_gb // max(max(session_memory_gb), 1e-9))))
+            message_output(f"Largest session needs ~{max(session_memory_gb):.2f} GB; running {n_workers} "
+                           f"worker(s) within the {max_memory_gb} GB budget.")
+
+    message_output(f"Computing behavioral features for {len(root_directories)} session(s) "
+                   f"with {n_workers} worker(s) started at: "
+                   f"{datetime.now().hour:02d}:{datetime.now().minute:02d}:{datetime.now().second:02d}")
+
+    batch_start_time = time.perf_counter()
+    if n_workers == 1:
+        session_reports = (_save_session_behavioral_features(root_directory=one_directory,
+                                                              behavioral_parameters_dict=behavioral_parameters_dict,
+                                                              message_output=message_output)
+                           for one_directory in root_directories)
+    else:
+        session_reports = Parallel(n_jobs=n_workers, backend="loky", return_as="generator_unordered")(
+            delayed(_save_session_behavioral_features)(root_directory=one_directory,
+                                                       behavioral_parameters_dict=behavioral_parameters_dict)
+            for one_directory in root_directories
         )
+
+    reports_by_directory = {}
+    for session_report in session_reports:
+        reports_by_directory[session_report['root_directory']] = session_report
+        if session_report['status'] == 'ok':
+            message_output(f"  done   {session_report['root_directory']} in {session_report['seconds']:.1f} s "
+                           f"({len(reports_by_directory)}/{len(root_directories)})")
+        else:
+            message_output(f"  FAILED {session_report['root_directory']} after {session_report['seconds']:.1f} s "
+                           f"({len(reports_by_directory)}/{len(root_directories)}):\n{session_report['error']}")
+
+    session_reports = [reports_by_directory[one_directory] for one_directory in root_directories]
+    n_failed = sum(session_report['status'] == 'failed' for session_report in session_reports)
+    message_output(f"Behavioral features finished for {len(session_reports) - n_failed} of {len(session_reports)} "
+                   f"session(s) in {time.perf_counter() - batch_start_time:.1f} s "
+                   f"({sum(session_report['seconds'] for session_report in session_reports):.1f} s summed over "
+                   f"sessions); {n_failed} failed.")
+    return session_reports
@@ -40,6 +40,7 @@ from ._usv_io import (
 from .mixture_model_utils import (
     bootstrap_lrt,
     fit_log_gmm,
+    fit_log_mixtures_batched,
     fit_log_t_mixture,
     gmm_boundaries_logspace,
     gmm_cv_neg_loglik,
@@ -305,6 +306,8 @@ def fit_mixture_model_sweep(
     mixture_model_n_init: int = 10,
     mixture_model_reg_covar: float = 1e-4,
     model_class: str = "gauss",
+    engine: str = "serial",
+    n_jobs: int = 1,
 ) -> pls.DataFrame:
     """
     Description
@@ -360,6 +363,14 @@ def fit_mixture_model_sweep(
     model_class (str)
         ``'gauss'`` (sklearn ``GaussianMixture``) or ``'t'``
         (:class:`mixture_model_utils.TMixture`).
+    engine (str)
+        ``'serial'`` fits every (rep, K) model and CV fold one at a
+        time; ``'batched'`` fits all reps of a K (and all folds of a
+        CV column) at once with
+        :func:`mixture_model_utils.fit_log_mixtures_batched`, which
+        starts from the same initialisations. Defaults to ``'serial'``.
+    n_jobs (int)
+        Worker processes of the batched engine; defaults to 1.
 
     Returns
     -------
@@ -405,6 +416,8 @@ def fit_mixture_model_sweep(
                     n_folds=cv_n_folds,
                     n_init=cv_n_init,
                     reg_covar=mixture_model_reg_covar,
+                    engine=engine,
+                    n_jobs=n_jobs,
                 )
             else:  # t-mixture
                 cv_val = t_mixture_cv_neg_loglik(
@@ -414,6 +427,8 @@ def fit_mixture_model_sweep(
                     n_folds=cv_n_folds,
                     n_init=max(1, cv_n_init - 2),  # t-mix EM is heavier; trim per-fold inits
                     reg_covar=mixture_model_reg_covar,
+                    engine=engine,
+                    n_jobs=n_jobs,
                 )
             cv_per_key_n[key][n_components] = cv_val
 
@@ -444,23 +459,41 @@ def fit_mixture_model_sweep(
             continue
         log_iui = np.log(iui).reshape(-1, 1)
 
+        # the batched engine fits all reps of each K in one go; rep r of
+        # K is then read back instead of being refitted below
+        batched_fits: dict[int, list] = {}
+        if engine == "batched":
+            for n_components in n_comps:
+                batched_fits[n_components] = fit_log_mixtures_batched(
+                    [iui] * n_repeats, n_components,
+                    seeds=[random_seed_base + r for r in range(n_repeats)],
+                    model_class=model_class, n_init=mixture_model_n_init,
+                    reg_covar=mixture_model_reg_covar, n_jobs=n_jobs,
+                )
+
         for r in range(n_repeats):
             for n_components in n_comps:
                 seed = random_seed_base + r
                 if model_class == "gauss":
-                    model, model_order = fit_log_gmm(
-                        iui, n_components=n_components, seed=seed,
-                        n_init=mixture_model_n_init, reg_covar=mixture_model_reg_covar,
-                    )
+                    if n_components in batched_fits:
+                        model, model_order = batched_fits[n_components][r]
+                    else:
+                        model, model_order = fit_log_gmm(
+                            iui, n_components=n_components, seed=seed,
+                            n_init=mixture_model_n_init, reg_covar=mixture_model_reg_covar,
+                        )
                     logmeans, logsds, modes_log, densities = report_gmm_stats(model, model_order)
                     weights = model.weights_.flatten()[model_order]
                     nus = np.full(n_components, np.nan, dtype=float)  # not applicable for gauss
                     icl = gmm_icl(model, log_iui)
                 else:  # t-mixture
-                    model, model_order = fit_log_t_mixture(
-                        iui, n_components=n_components, seed=seed,
-                        n_init=mixture_model_n_init, reg_covar=mixture_model_reg_covar,
-                    )
+                    if n_components in batched_fits:
+                        model, model_order = batched_fits[n_components][r]
+                    else:
+                        model, model_order = fit_log_t_mixture(
+                            iui, n_components=n_components, seed=seed,
+                            n_init=mixture_model_n_init, reg_covar=mixture_model_reg_covar,
+                        )
                     logmeans, logsds, nus, weights, mode_dens = report_t_mixture_stats(model, model_order)
                     # For the rep-row schema, "modes" are the per-component
                     # means in 1D log-space; their densities are the
@@ -640,6 +673,8 @@ class InterUSVIntervalCalculator:
         bootstrap_lrt_n_subsample = cfg['bootstrap_lrt_n_subsample']
         bootstrap_lrt_alpha = cfg['bootstrap_lrt_alpha']
         bootstrap_lrt_bonferroni = cfg['bootstrap_lrt_bonferroni']
+        mixture_em_engine = cfg['mixture_em_engine']
+        mixture_em_n_jobs = cfg['mixture_em_n_jobs']
 
         if model_class not in ('gauss', 't'):
             msg = f"compute_inter_usv_interval_distributions: model_class must be 'gauss' or 't', got {model_class!r}."
@@ -779,6 +814,8 @@ class InterUSVIntervalCalculator:
                     mixture_model_n_init=mixture_model_n_init,
                     mixture_model_reg_covar=mixture_model_reg_covar,
                     model_class=model_class,
+                    engine=mixture_em_engine,
+                    n_jobs=mixture_em_n_jobs,
                 )
                 mode_payload["mixture_model_fits"] = df_results
                 message(f"  [{interval_type}] mixture model sweep ({df_results.height} rows) recorded.")
@@ -814,6 +851,8 @@ class InterUSVIntervalCalculator:
                                 n_init_boot=max(1, mixture_model_n_init - 7),
                                 reg_covar=mixture_model_reg_covar,
                                 seed=random_seed_base,
+                                engine=mixture_em_engine,
+                                n_jobs=mixture_em_n_jobs,
                             )
                             pair_results[(K_n, K_a)] = res
                             message(
@@ -899,6 +938,7 @@ class InterUSVIntervalCalculator:
             "bootstrap_lrt_n_subsample": int(bootstrap_lrt_n_subsample),
             "bootstrap_lrt_alpha": float(bootstrap_lrt_alpha),
             "bootstrap_lrt_bonferroni": bool(bootstrap_lrt_bonferroni),
+            "mixture_em_engine": str(mixture_em_engine),
         }
         h5_path = out_dir / f"usv_interval_analysis_{run_ts}.h5"
         write_ivi_h5(h5_path, analysis_attrs=analysis_attrs, per_mode=per_mode)
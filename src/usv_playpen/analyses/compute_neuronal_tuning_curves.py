@@ -37,18 +37,24 @@ from __future__ import annotations
 
 import pathlib
 import pickle
+import tempfile
 from collections import OrderedDict
 from datetime import datetime
 from typing import Any
 
 import h5py
+import joblib
 import numpy as np
 import polars as pls
+from joblib import Parallel, delayed
+from scipy import fft as sp_fft
 from scipy import ndimage, stats
 from tqdm import tqdm
 
+from ..neuropixels.spike_store import StoredUnit, discover_session_units, load_unit_spikes
 from ..os_utils import atomic_output_path, first_match_or_raise
 from ..time_utils import is_gui_context, smart_wait
+from .behavioral_feature_table import find_behavioral_feature_table, load_behavioral_features
 from .compute_behavioral_features import FeatureZoo
 
 
@@ -318,9 +324,11 @@ def shuffle_spikes(
         frames.
     """
 
-    rng = np.random.default_rng(seed)
-    shuffled_amounts = rng.integers(
-        low=shuffle_min_fr, high=shuffle_max_fr, size=n_shuffles, dtype=np.int32
+    shuffled_amounts = _generate_shuffle_frame_offsets(
+        n_shuffles=n_shuffles,
+        shuffle_min_fr=shuffle_min_fr,
+        shuffle_max_fr=shuffle_max_fr,
+        seed=seed,
     )
     shuffled = np.tile(spike_array, reps=(n_shuffles, 1)) + shuffled_amounts[:, np.newaxis]
     # modulo wrap so the shift is correct even when it can exceed
@@ -329,6 +337,146 @@ def shuffle_spikes(
     return np.sort(np.mod(shuffled, total_fr_num), axis=1)
 
 
+def _generate_shuffle_frame_offsets(
+    n_shuffles: int,
+    shuffle_min_fr: int,
+    shuffle_max_fr: int,
+    seed: int | None = None,
+) -> np.ndarray:
+    """
+    Description
+    -----------
+    Draw the `n_shuffles` integer frame offsets used by :func:`shuffle_spikes`.
+    Factored out so the FFT null engine (:func:`circular_shift_null_counts`)
+    consumes exactly the same offsets -- same RNG, same draw order, same
+    dtype -- as the direct engine for a given seed.
+
+    Parameters
+    ----------
+    n_shuffles (int)
+        Number of shuffle offsets to draw.
+    shuffle_min_fr (int)
+        Minimum number of frames to shuffle spikes by.
+    shuffle_max_fr (int)
+        Maximum number of frames (exclusive) to shuffle spikes by.
+    seed (int | None)
+        Optional seed for reproducibility; `None` draws from a fresh
+        default-RNG state.
+
+    Returns
+    -------
+    offsets (np.ndarray, shape (n_shuffles,))
+        int32 array of frame offsets.
+    """
+
+    rng = np.random.default_rng(seed)
+    return rng.integers(
+        low=shuffle_min_fr, high=shuffle_max_fr, size=n_shuffles, dtype=np.int32
+    )
+
+
+def _frame_bin_indices(
+    feature_arr: np.ndarray,
+    bin_edges: np.ndarray,
+) -> np.ndarray:
+    """
+    Description
+    -----------
+    Bin every frame of a 1D feature once, with the same `(left, right]`
+    semantics as :func:`generate_ratemaps` (searchsorted side='left' then
+    ``-1``). Frames whose value falls outside the edges (or is NaN) map to
+    the sentinel -1 and never contribute to any bin.
+
+    Parameters
+    ----------
+    feature_arr (np.ndarray)
+        A (n_frames,) 1D feature array.
+    bin_edges (np.ndarray)
+        A (num_bins + 1,) array of bin edges.
+
+    Returns
+    -------
+    frame_bin_idx (np.ndarray)
+        A (n_frames,) int64 array of per-frame bin indices; -1 for frames
+        outside every bin.
+    """
+
+    num_bins = bin_edges.size - 1
+    frame_bin_idx = np.searchsorted(bin_edges, feature_arr, side="left") - 1
+    frame_bin_idx[(frame_bin_idx < 0) | (frame_bin_idx >= num_bins)] = -1
+    return frame_bin_idx.astype(np.int64, copy=False)
+
+
+def circular_shift_null_counts(
+    frame_bin_idx: np.ndarray,
+    spike_arr: np.ndarray,
+    shuffle_offsets: np.ndarray,
+    num_bins: int,
+    spike_train_fft: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Description
+    -----------
+    FFT null engine: shuffled spike counts for every circular shift in
+    `shuffle_offsets` without materializing the shifted spike trains.
+
+    A shuffle is a pure circular shift of the spike train, so the count in
+    bin b under offset d is the circular cross-correlation of the per-frame
+    spike-count train c with the per-frame occupancy indicator of bin b,
+    evaluated at lag d:
+
+        sh_counts[s, b] = sum_t c[t] * [frame_bin_idx[(t + d_s) mod T] == b]
+
+    All T lags of all bins come out of one real FFT of the spike train plus
+    one batched real FFT over the (num_bins, T) indicator matrix, so the
+    cost is O(num_bins * T log T) and independent of both the spike count
+    and `n_shuffles`. The correlation of two integer sequences is integral,
+    so rounding the inverse transform recovers the exact counts; the result
+    is bit-identical to the `sh_counts` that :func:`generate_ratemaps`
+    builds from ``shuffle_spikes`` with the same offsets.
+
+    Parameters
+    ----------
+    frame_bin_idx (np.ndarray)
+        A (n_frames,) per-frame bin index from :func:`_frame_bin_indices`
+        (-1 = frame outside every bin).
+    spike_arr (np.ndarray)
+        A (n_spikes,) array of (unshuffled) spike event frames in
+        ``[0, n_frames)``.
+    shuffle_offsets (np.ndarray)
+        A (n_shuffles,) integer array of frame offsets, as drawn by
+        :func:`_generate_shuffle_frame_offsets`.
+    num_bins (int)
+        Number of feature bins.
+    spike_train_fft (np.ndarray | None)
+        Optional precomputed ``scipy.fft.rfft`` of the per-frame spike-count
+        train; lets a caller share it across every feature of one cluster.
+
+    Returns
+    -------
+    sh_counts (np.ndarray)
+        A (n_shuffles, num_bins) float array of shuffled spike counts.
+    """
+
+    n_frames = frame_bin_idx.size
+    if spike_train_fft is None:
+        spike_train_fft = sp_fft.rfft(
+            np.bincount(spike_arr, minlength=n_frames).astype(float)
+        )
+    valid_frames = np.flatnonzero(frame_bin_idx >= 0)
+    indicator = np.zeros((num_bins, n_frames), dtype=float)
+    indicator[frame_bin_idx[valid_frames], valid_frames] = 1.0
+    xcorr = sp_fft.irfft(
+        np.conj(spike_train_fft)[np.newaxis, :] * sp_fft.rfft(indicator, axis=-1),
+        n=n_frames,
+        axis=-1,
+    )
+    lags = np.mod(np.asarray(shuffle_offsets, dtype=np.int64), n_frames)
+    # both sequences are non-negative, so abs() only folds the -0.0 that
+    # round-off can leave after rint back into +0.0
+    return np.abs(np.rint(xcorr[:, lags].T))
+
+
 # vocal-path free helpers
 
 
@@ -1243,8 +1391,8 @@ class NeuronalTuning(FeatureZoo):
         Settings dictionary; keys read by behavioral path:
         `temporal_offsets`, `n_shuffles`, `total_bin_num`,
         `n_spatial_bins`, `spatial_scale_cm`, `smoothing_sd`,
-        `shuffle_seed`, `behavioral_min_occupancy_seconds`,
-        `circular_features`. Keys read by vocal path:
+        `shuffle_seed`, `shuffle_null_engine`,
+        `behavioral_min_occupancy_seconds`, `circular_features`. Keys read by vocal path:
         `n_shuffles`, `total_bin_num`, `shuffle_seconds_range`,
         `peth_window_seconds`, `peth_bin_seconds`, `bout_quiet_seconds`,
         `vocal_require_clean_post_anchor`,
@@ -1352,8 +1500,8 @@ class NeuronalTuning(FeatureZoo):
         """
         Description
         -----------
-        Locate `*_behavioral_features.csv` and the tracking H5; load
-        behavioral features into a Polars DataFrame and read the camera
+        Locate `*_behavioral_features.parquet` (or `.csv`) and the tracking
+        H5; load behavioral features into a Polars DataFrame and read the camera
         frame rate + animal IDs from the H5. Returns None if either file
         is missing.
 
@@ -1365,18 +1513,18 @@ class NeuronalTuning(FeatureZoo):
         -------
         bundle (dict | None)
             None if any required input is missing; otherwise dict with
-            keys `behavioral_data` (pls.DataFrame), `animal_ids`
-            (list[str]), `empirical_camera_sr` (float).
+            keys `behavioral_data` (pls.DataFrame), `feature_columns`
+            (list[str]), `behavioral_matrix` (float64 (n_frames,
+            n_features) ndarray, column-major, one column per entry of
+            `feature_columns`), `animal_ids` (list[str]),
+            `empirical_camera_sr` (float). The per-cluster compute reads
+            only the matrix, so the bundle can be memory-mapped and shared
+            with worker processes without the DataFrame.
         """
 
         root = pathlib.Path(self.root_directory)
         try:
-            behavioral_data_file = first_match_or_raise(
-                root=root,
-                pattern="*_behavioral_features.csv*",
-                recursive=True,
-                label="behavioral features CSV",
-            )
+            behavioral_data_file = find_behavioral_feature_table(root=root)
         except (StopIteration, FileNotFoundError):
             return None
         try:
@@ -1389,7 +1537,7 @@ class NeuronalTuning(FeatureZoo):
         except (StopIteration, FileNotFoundError):
             return None
 
-        behavioral_data = pls.read_csv(str(behavioral_data_file))
+        behavioral_data = load_behavioral_features(behavioral_data_file)
         with h5py.File(mouse_data_h5, mode="r") as tracking_data_3d:
             animal_ids = [
                 t.decode("utf-8").strip() for t in tracking_data_3d["track_names"]
@@ -1398,6 +1546,8 @@ class NeuronalTuning(FeatureZoo):
 
         return {
             "behavioral_data": behavioral_data,
+            "feature_columns": list(behavioral_data.columns),
+            "behavioral_matrix": behavioral_data.select(pls.all().cast(pls.Float64)).to_numpy(order="fortran"),
             "animal_ids": animal_ids,
             "empirical_camera_sr": empirical_camera_sr,
         }
@@ -1489,14 +1639,15 @@ class NeuronalTuning(FeatureZoo):
         """
         Description
         -----------
-        Run both compute paths in sequence over the same set of cluster
-        .npy files. Cluster discovery is shared. Behavioral runs first
+        Run both compute paths in sequence over the same set of clusters
+        (spike-store units, or legacy cluster .npy files for sessions
+        split before the store existed). Cluster discovery is shared. Behavioral runs first
         if its inputs are present; vocal runs second if its inputs are
         present. Each per-cluster output is merged into a single pkl per
         cluster.
 
-        Raises FileNotFoundError if no spike .npy files are found under
-        `<root>/ephys/**/cluster_data/` (no-cluster sessions are not a
+        Raises FileNotFoundError if no spike store or spike .npy files are
+        found under `<root>/ephys/` (no-cluster sessions are not a
         valid input). Missing behavioral CSV or vocal CSV are logged and
         the corresponding side is skipped.
 
@@ -1519,13 +1670,10 @@ class NeuronalTuning(FeatureZoo):
         smart_wait(app_context_bool=self.app_context_bool, seconds=1)
 
         root = pathlib.Path(self.root_directory)
-        cluster_files = sorted(
-            (root / "ephys").rglob("cluster_data/*.npy"),
-            key=lambda p: p.name,
-        )
+        cluster_files = discover_session_units(root_directory=root)
         if not cluster_files:
             err_msg = (
-                f"No spike .npy files under {root}/ephys/**/cluster_data/. "
+                f"No spike store or spike .npy files under {root}/ephys/. "
                 "Cannot compute tuning curves without cluster data."
             )
             raise FileNotFoundError(err_msg)
@@ -1534,19 +1682,17 @@ class NeuronalTuning(FeatureZoo):
         beh_inputs = self._load_behavioral_inputs()
         if beh_inputs is None:
             message_output(
-                "  behavioral skipped: missing *_behavioral_features.csv "
+                "  behavioral skipped: missing *_behavioral_features table "
                 "or tracking .h5 in this session."
             )
         else:
             message_output("  computing behavioral tuning curves ...")
-            for cluster_file in tqdm(
-                cluster_files, desc="behavioral tuning per cluster"
-            ):
-                beh_partial = self._compute_one_cluster_behavioral(
-                    cluster_file=cluster_file,
-                    beh_inputs=beh_inputs,
-                )
-                self._save_partial_to_cluster_pkl(cluster_file.stem, beh_partial)
+            self._run_cluster_pass(
+                side="behavioral",
+                cluster_files=cluster_files,
+                inputs=beh_inputs,
+                message_output=message_output,
+            )
 
         # vocal side
         voc_inputs = self._load_vocal_inputs()
@@ -1566,25 +1712,181 @@ class NeuronalTuning(FeatureZoo):
             return
 
         message_output("  computing vocal tuning curves ...")
-        for cluster_file in tqdm(cluster_files, desc="vocal tuning per cluster"):
-            try:
-                voc_partial = self._compute_one_cluster_vocal(
-                    cluster_file=cluster_file,
-                    voc_inputs=voc_inputs,
+        self._run_cluster_pass(
+            side="vocal",
+            cluster_files=cluster_files,
+            inputs=voc_inputs,
+            message_output=message_output,
+            side_precompute=side_precompute,
+        )
+
+    def _run_cluster_pass(
+        self,
+        side: str,
+        cluster_files: list[StoredUnit | pathlib.Path],
+        inputs: dict,
+        message_output: Any,
+        side_precompute: dict | None = None,
+    ) -> None:
+        """
+        Description
+        -----------
+        Run one compute path (behavioral or vocal) over every cluster and
+        merge each result into its cluster pkl.
+
+        With `n_jobs` == 1 the clusters are computed in-process, one after
+        another. Otherwise they are dispatched to a loky process pool in
+        chunks of `cluster_chunk_size`. The session-level inputs (the
+        behavioral feature matrix, or the vocal inputs and side
+        pre-compute) are dumped once to a temporary folder (`/dev/shm`
+        where available) and re-opened memory-mapped; the memmaps pickle
+        by reference, so every worker maps the same pages instead of
+        receiving a copy per task. Workers only compute and return the
+        payloads; this process writes every pkl through
+        `_save_partial_to_cluster_pkl`, in cluster order, so no two
+        writers ever touch the same file. Each cluster seeds its shuffles
+        from `shuffle_seed` alone, so the pool produces exactly what the
+        serial path does.
+
+        Parameters
+        ----------
+        side (str)
+            "behavioral" or "vocal".
+        cluster_files (list[StoredUnit | pathlib.Path])
+            Spike-store units or legacy cluster .npy files, sorted by name.
+        inputs (dict)
+            Output of `_load_behavioral_inputs` / `_load_vocal_inputs`.
+        message_output (Callable)
+            Logger for per-cluster vocal failures.
+        side_precompute (dict | None)
+            Output of `_build_vocal_side_precompute` (vocal side only).
+
+        Returns
+        -------
+        None
+        """
+
+        params = self.tuning_parameters_dict
+        n_jobs = int(params["n_jobs"])
+        desc = f"{side} tuning per cluster"
+
+        if n_jobs == 1:
+            cluster_results = (
+                _compute_cluster_chunk(
+                    tuning=self,
+                    side=side,
+                    cluster_files=[cluster_file],
+                    inputs=inputs,
                     side_precompute=side_precompute,
                 )
-            except Exception as exc:
-                message_output(
-                    f"    vocal: cluster {cluster_file.name} failed: {exc}"
+                for cluster_file in cluster_files
+            )
+            self._merge_cluster_results(
+                cluster_results=cluster_results,
+                side=side,
+                n_clusters=len(cluster_files),
+                chunk_size=1,
+                desc=desc,
+                message_output=message_output,
+            )
+            return
+
+        chunk_size = max(1, int(params["cluster_chunk_size"]))
+        chunks = [cluster_files[i : i + chunk_size] for i in range(0, len(cluster_files), chunk_size)]
+        if side == "behavioral":
+            # the DataFrame is only needed to build the matrix; keep it out
+            # of the shared bundle so nothing un-mappable is pickled per task
+            inputs = {key: value for key, value in inputs.items() if key != "behavioral_data"}
+        shm_root = pathlib.Path("/dev/shm")
+        with tempfile.TemporaryDirectory(
+            prefix="usv_playpen_tuning_",
+            dir=shm_root if shm_root.is_dir() else None,
+            ignore_cleanup_errors=True,
+        ) as shared_dir:
+            shared_inputs = _memmap_shared(inputs, pathlib.Path(shared_dir) / f"{side}_inputs.joblib")
+            shared_precompute = (
+                _memmap_shared(side_precompute, pathlib.Path(shared_dir) / "side_precompute.joblib")
+                if side_precompute is not None
+                else None
+            )
+            # workers rebuild a lightweight NeuronalTuning: `self` may carry a
+            # GUI-bound message_output that cannot cross a process boundary
+            cluster_results = Parallel(n_jobs=n_jobs, backend="loky", return_as="generator")(
+                delayed(_compute_cluster_chunk)(
+                    tuning=None,
+                    side=side,
+                    cluster_files=chunk,
+                    inputs=shared_inputs,
+                    side_precompute=shared_precompute,
+                    root_directory=str(self.root_directory),
+                    tuning_parameters_dict=params,
                 )
-                continue
-            self._save_partial_to_cluster_pkl(cluster_file.stem, voc_partial)
+                for chunk in chunks
+            )
+            self._merge_cluster_results(
+                cluster_results=cluster_results,
+                side=side,
+                n_clusters=len(cluster_files),
+                chunk_size=chunk_size,
+                desc=desc,
+                message_output=message_output,
+            )
+            del shared_inputs, shared_precompute
+
+    def _merge_cluster_results(
+        self,
+        cluster_results: Any,
+        side: str,
+        n_clusters: int,
+        chunk_size: int,
+        desc: str,
+        message_output: Any,
+    ) -> None:
+        """
+        Description
+        -----------
+        Consume per-chunk results from `_compute_cluster_chunk` as they
+        arrive, write each successful payload into its cluster pkl and log
+        each failed vocal cluster.
+
+        Parameters
+        ----------
+        cluster_results (Iterable)
+            Iterable of per-chunk result lists.
+        side (str)
+            "behavioral" or "vocal" (used in failure messages).
+        n_clusters (int)
+            Total number of clusters (progress-bar length).
+        chunk_size (int)
+            Clusters per chunk (progress-bar step).
+        desc (str)
+            Progress-bar description.
+        message_output (Callable)
+            Logger for failures.
+
+        Returns
+        -------
+        None
+        """
+
+        with tqdm(total=n_clusters, desc=desc) as progress_bar:
+            for chunk_result in cluster_results:
+                for cluster_name, cluster_partial, error_message in chunk_result:
+                    if cluster_partial is None:
+                        message_output(
+                            f"    {side}: cluster {cluster_name} failed: {error_message}"
+                        )
+                    else:
+                        self._save_partial_to_cluster_pkl(
+                            pathlib.Path(cluster_name).stem, cluster_partial
+                        )
+                progress_bar.update(min(chunk_size, len(chunk_result)))
 
     # behavioral per-cluster compute
 
     def _compute_one_cluster_behavioral(
         self,
-        cluster_file: pathlib.Path,
+        cluster_file: StoredUnit | pathlib.Path,
         beh_inputs: dict,
     ) -> dict:
         """
@@ -1616,8 +1918,8 @@ class NeuronalTuning(FeatureZoo):
 
         Parameters
         ----------
-        cluster_file (pathlib.Path)
-            Path to cluster .npy (row 1 = spike-frame indices).
+        cluster_file (StoredUnit | pathlib.Path)
+            Spike-store unit or legacy cluster .npy (row 1 = spike-frame indices).
         beh_inputs (dict)
             Output of `_load_behavioral_inputs`.
 
@@ -1628,19 +1930,27 @@ class NeuronalTuning(FeatureZoo):
         """
 
         params = self.tuning_parameters_dict
-        behavioral_data = beh_inputs["behavioral_data"]
+        feature_columns = beh_inputs["feature_columns"]
+        behavioral_matrix = beh_inputs["behavioral_matrix"]
+        n_frames = behavioral_matrix.shape[0]
         animal_ids = beh_inputs["animal_ids"]
         empirical_camera_sr = beh_inputs["empirical_camera_sr"]
         smoothing_sd = float(params["smoothing_sd"])
 
-        cluster_data_frames_original = np.load(file=cluster_file)[1, :]
+        null_engine = params["shuffle_null_engine"]
+        if null_engine not in ("direct", "fft"):
+            raise ValueError(
+                f"shuffle_null_engine must be 'direct' or 'fft', got {null_engine!r}."
+            )
+
+        cluster_data_frames_original = load_unit_spikes(unit=cluster_file)[1, :]
         partial: dict = {}
 
-        # Materialize each behavioral column to numpy once: the polars->numpy
-        # conversion is independent of the temporal offset and of the cluster, but was
-        # re-run inside both loops below (and for every cluster). generate_ratemaps
-        # treats feature_arr as read-only, so the cached arrays are reused directly.
-        behavioral_columns_np = {column: np.asarray(behavioral_data[column]) for column in behavioral_data.columns}
+        # Column views into the session-level feature matrix (materialized once by
+        # `_load_behavioral_inputs`, possibly memory-mapped and shared between
+        # workers). generate_ratemaps treats feature_arr as read-only, so the views
+        # are used directly without copying.
+        behavioral_columns_np = {column: behavioral_matrix[:, column_idx] for column_idx, column in enumerate(feature_columns)}
 
         # Occupancy is offset-invariant -- precompute it once per (1D feature column)
         # and per (animal 2D space) here, and pass it into generate_ratemaps inside
@@ -1656,14 +1966,22 @@ class NeuronalTuning(FeatureZoo):
                 empirical_camera_sr,
                 space_bool=False,
             )
-            for column in behavioral_data.columns
+            for column in feature_columns
             if column.split(".")[-1] not in spatial_suffixes
         }
+        # The FFT null engine needs each 1D feature binned per frame; like the
+        # occupancy this is offset- and shuffle-invariant, so bin it once here.
+        frame_bin_idx_1d = {}
+        if null_engine == "fft":
+            frame_bin_idx_1d = {
+                column: _frame_bin_indices(behavioral_columns_np[column], occupancy_1d[column][0])
+                for column in occupancy_1d
+            }
         occupancy_2d = {}
         for animal_id in animal_ids:
             spaceX_col = f"{animal_id}.spaceX"
             spaceY_col = f"{animal_id}.spaceY"
-            if spaceX_col in behavioral_data.columns and spaceY_col in behavioral_data.columns:
+            if spaceX_col in feature_columns and spaceY_col in feature_columns:
                 occupancy_2d[animal_id] = _compute_occupancy(
                     np.stack((behavioral_columns_np[spaceX_col], behavioral_columns_np[spaceY_col]), axis=1),
                     -params["spatial_scale_cm"],
@@ -1679,22 +1997,39 @@ class NeuronalTuning(FeatureZoo):
             )
             cluster_data_frames = cluster_data_frames[
                 (cluster_data_frames >= 0)
-                & (cluster_data_frames < behavioral_data.shape[0])
+                & (cluster_data_frames < n_frames)
             ]
             file_name_addendum_offset = f"beh_offset={one_offset}s"
             partial[file_name_addendum_offset] = {}
 
-            cluster_data_shuffled = shuffle_spikes(
-                spike_array=cluster_data_frames,
-                total_fr_num=behavioral_data.shape[0],
-                shuffle_min_fr=int(np.floor(float(params["shuffle_seconds_range"][0]) * empirical_camera_sr)),
-                shuffle_max_fr=int(np.floor(float(params["shuffle_seconds_range"][1]) * empirical_camera_sr)),
-                n_shuffles=params["n_shuffles"],
-                seed=params["shuffle_seed"],
-            )
+            shuffle_min_fr = int(np.floor(float(params["shuffle_seconds_range"][0]) * empirical_camera_sr))
+            shuffle_max_fr = int(np.floor(float(params["shuffle_seconds_range"][1]) * empirical_camera_sr))
+            if null_engine == "fft":
+                # same offsets `shuffle_spikes` would draw; the shuffled counts
+                # come from `circular_shift_null_counts`, so no (n_shuffles,
+                # n_spikes) array is built and generate_ratemaps gets an empty one
+                shuffle_frame_offsets = _generate_shuffle_frame_offsets(
+                    n_shuffles=params["n_shuffles"],
+                    shuffle_min_fr=shuffle_min_fr,
+                    shuffle_max_fr=shuffle_max_fr,
+                    seed=params["shuffle_seed"],
+                )
+                spike_train_fft = sp_fft.rfft(
+                    np.bincount(cluster_data_frames, minlength=n_frames).astype(float)
+                )
+                cluster_data_shuffled = np.empty((0, cluster_data_frames.size), dtype=cluster_data_frames.dtype)
+            else:
+                cluster_data_shuffled = shuffle_spikes(
+                    spike_array=cluster_data_frames,
+                    total_fr_num=n_frames,
+                    shuffle_min_fr=shuffle_min_fr,
+                    shuffle_max_fr=shuffle_max_fr,
+                    n_shuffles=params["n_shuffles"],
+                    seed=params["shuffle_seed"],
+                )
 
             # 1D feature ratemaps for every non-spatial column
-            for column in behavioral_data.columns:
+            for column in feature_columns:
                 if column.split(".")[-1] in ("spaceX", "spaceY", "spaceZ"):
                     continue
                 ratemap_counts, sh_counts, bin_centers, bin_edges = generate_ratemaps(
@@ -1708,6 +2043,14 @@ class NeuronalTuning(FeatureZoo):
                     space_bool=False,
                     precomputed_occupancy=occupancy_1d[column],
                 )
+                if null_engine == "fft":
+                    sh_counts = circular_shift_null_counts(
+                        frame_bin_idx=frame_bin_idx_1d[column],
+                        spike_arr=cluster_data_frames,
+                        shuffle_offsets=shuffle_frame_offsets,
+                        num_bins=params["total_bin_num"],
+                        spike_train_fft=spike_train_fft,
+                    )
                 spike_count = ratemap_counts[:, 0]
                 occupancy_s = ratemap_counts[:, 1]
                 ok = occupancy_s > 0
@@ -1758,8 +2101,8 @@ class NeuronalTuning(FeatureZoo):
                 spaceX_col = f"{animal_id}.spaceX"
                 spaceY_col = f"{animal_id}.spaceY"
                 if (
-                    spaceX_col not in behavioral_data.columns
-                    or spaceY_col not in behavioral_data.columns
+                    spaceX_col not in feature_columns
+                    or spaceY_col not in feature_columns
                 ):
                     continue
                 space_key = f"{animal_id}.space"
@@ -1801,6 +2144,7 @@ class NeuronalTuning(FeatureZoo):
             "cluster_id": cluster_file.stem,
             "session_root": str(self.root_directory),
             "n_shuffles": int(params["n_shuffles"]),
+            "shuffle_null_engine": null_engine,
             "temporal_offsets": list(params["temporal_offsets"]),
             "total_bin_num": int(params["total_bin_num"]),
             "n_spatial_bins": int(params["n_spatial_bins"]),
@@ -2669,7 +3013,7 @@ class NeuronalTuning(FeatureZoo):
 
     def _compute_one_cluster_vocal(
         self,
-        cluster_file: pathlib.Path,
+        cluster_file: StoredUnit | pathlib.Path,
         voc_inputs: dict,
         side_precompute: dict,
     ) -> dict:
@@ -2685,8 +3029,8 @@ class NeuronalTuning(FeatureZoo):
 
         Parameters
         ----------
-        cluster_file (pathlib.Path)
-            Path to the cluster's `*.npy` (row 0 = spike times in seconds).
+        cluster_file (StoredUnit | pathlib.Path)
+            Spike-store unit or legacy cluster `*.npy` (row 0 = spike times in seconds).
         voc_inputs (dict)
             Output of `_load_vocal_inputs`.
         side_precompute (dict)
@@ -2720,7 +3064,7 @@ class NeuronalTuning(FeatureZoo):
         rel_bin_hi = side_precompute["_grid"]["rel_bin_hi"]
         rel_bin_centers = side_precompute["_grid"]["rel_bin_centers"]
 
-        cluster_data = np.load(cluster_file)
+        cluster_data = load_unit_spikes(unit=cluster_file)
         spike_times_observed = np.sort(np.asarray(cluster_data[0, :], dtype=float))
 
         shuffle_offsets = _generate_shuffle_offsets(
@@ -3062,3 +3406,103 @@ class NeuronalTuning(FeatureZoo):
         }
         self._attach_vocal_triage_stats(partial, params)
         return partial
+
+
+# process-pool helpers
+
+
+def _memmap_shared(obj: Any, dump_path: pathlib.Path) -> Any:
+    """
+    Description
+    -----------
+    Dump a (possibly nested) container of numpy arrays with joblib and
+    load it back memory-mapped read-only. joblib pickles the resulting
+    `np.memmap` objects by file reference, so handing the returned
+    object to a process pool shares one copy of the data between all
+    workers instead of pickling it into every task.
+
+    Parameters
+    ----------
+    obj (Any)
+        Object to share (dict / list / ndarray / scalars).
+    dump_path (pathlib.Path)
+        File to dump into; must outlive the pool that uses the result.
+
+    Returns
+    -------
+    shared (Any)
+        The same structure with every numeric array memory-mapped.
+    """
+
+    joblib.dump(obj, dump_path)
+    return joblib.load(dump_path, mmap_mode="r")
+
+
+def _compute_cluster_chunk(
+    tuning: NeuronalTuning | None,
+    side: str,
+    cluster_files: list[StoredUnit | pathlib.Path],
+    inputs: dict,
+    side_precompute: dict | None = None,
+    root_directory: str | None = None,
+    tuning_parameters_dict: dict | None = None,
+) -> list[tuple[str, dict | None, str | None]]:
+    """
+    Description
+    -----------
+    Compute one compute path for a chunk of clusters. Runs in-process for
+    the serial path (`tuning` given) and inside pool workers (`tuning` is
+    None; a `NeuronalTuning` is rebuilt from `root_directory` and
+    `tuning_parameters_dict`). Behavioral failures propagate, vocal
+    failures are returned per cluster -- the same policy the serial loop
+    always had.
+
+    Parameters
+    ----------
+    tuning (NeuronalTuning | None)
+        Instance to compute with; None inside a worker.
+    side (str)
+        "behavioral" or "vocal".
+    cluster_files (list[StoredUnit | pathlib.Path])
+        Clusters in this chunk.
+    inputs (dict)
+        Behavioral or vocal session inputs.
+    side_precompute (dict | None)
+        Vocal side pre-compute (vocal side only).
+    root_directory (str | None)
+        Session root, used to rebuild `tuning` in a worker.
+    tuning_parameters_dict (dict | None)
+        Tuning settings, used to rebuild `tuning` in a worker.
+
+    Returns
+    -------
+    results (list[tuple[str, dict | None, str | None]])
+        One `(cluster_file_name, partial_or_None, error_or_None)` per cluster.
+    """
+
+    if tuning is None:
+        tuning = NeuronalTuning(
+            root_directory=root_directory,
+            tuning_parameters_dict=tuning_parameters_dict,
+            message_output=print,
+        )
+    results = []
+    for cluster_file in cluster_files:
+        if side == "behavioral":
+            results.append((
+                cluster_file.name,
+                tuning._compute_one_cluster_behavioral(cluster_file=cluster_file, beh_inputs=inputs),
+                None,
+            ))
+            continue
+        try:
+            voc_partial = tuning._compute_one_cluster_vocal(
+                cluster_file=cluster_file,
+                voc_inputs=inputs,
+                side_precompute=side_precompute,
+            )
+        except Exception as exc:
+            results.append((cluster_file.name, None, str(exc)))
+            continue
+        results.append((cluster_file.name, voc_partial, None))
+    return results
@@ -44,12 +44,14 @@ from __future__ import annotations
 
 import numpy as np
 import polars as pls
+from joblib import Parallel, delayed
 from scipy.optimize import brentq
 from scipy.special import digamma, gammaln
 from scipy.stats import norm, t as t_dist
 from sklearn.cluster import KMeans
 from sklearn.mixture import GaussianMixture
 from sklearn.model_selection import KFold
+from sklearn.utils import check_random_state
 
 import matplotlib.pyplot as plt
 
@@ -904,6 +906,8 @@ def gmm_cv_neg_loglik(
     n_folds: int = 5,
     n_init: int = 5,
     reg_covar: float = 1e-4,
+    engine: str = "serial",
+    n_jobs: int = 1,
 ) -> float:
     """
     Description
@@ -951,6 +955,13 @@ def gmm_cv_neg_loglik(
     reg_covar (float)
         Regularisation added to component covariances; defaults to
         1e-4.
+    engine (str)
+        ``'serial'`` fits the folds one after another with
+        ``GaussianMixture``; ``'batched'`` fits all folds (and their
+        restarts) at once with :func:`fit_log_mixtures_batched`.
+        Defaults to ``'serial'``.
+    n_jobs (int)
+        Worker processes of the batched engine; defaults to 1.
 
     Returns
     -------
@@ -969,6 +980,8 @@ def gmm_cv_neg_loglik(
         return float("inf")
 
     kf = KFold(n_splits=n_folds, shuffle=True, random_state=seed)
+    if engine == "batched":
+        return _cv_neg_loglik_batched(log_x.ravel(), kf, n_components, seed, n_init, reg_covar, "gauss", n_jobs)
 
     total_loglik = 0.0
     for train_idx, test_idx in kf.split(log_x):
@@ -1427,14 +1440,7 @@ def fit_log_t_mixture(
     best_ll = -np.inf
 
     for ii in range(n_init):
-        km = KMeans(n_clusters=n_components, random_state=seed + ii, n_init=10).fit(log_x.reshape(-1, 1))
-        labels = km.labels_
-        mu = km.cluster_centers_.flatten()
-        sigma2 = np.array([max(np.var(log_x[labels == k]), reg_covar) for k in range(n_components)])
-        nu = np.full(n_components, 10.0)
-        w = np.array([np.mean(labels == k) for k in range(n_components)])
-        w = np.where(w < 1e-3, 1e-3, w)
-        w = w / w.sum()
+        w, mu, sigma2, nu = _t_mixture_init(log_x, n_components, seed + ii, reg_covar)
 
         prev_ll = -np.inf
         for it in range(max_iter):
@@ -1529,6 +1535,8 @@ def t_mixture_cv_neg_loglik(
     n_folds: int = 5,
     n_init: int = 3,
     reg_covar: float = 1e-4,
+    engine: str = "serial",
+    n_jobs: int = 1,
 ) -> float:
     """
     Description
@@ -1562,6 +1570,10 @@ def t_mixture_cv_neg_loglik(
         EM noise).
     reg_covar (float)
         Component variance floor, defaults to 1e-4.
+    engine (str)
+        ``'serial'`` or ``'batched'``, as in :func:`gmm_cv_neg_loglik`.
+    n_jobs (int)
+        Worker processes of the batched engine; defaults to 1.
 
     Returns
     -------
@@ -1579,6 +1591,8 @@ def t_mixture_cv_neg_loglik(
         return float("inf")
 
     kf = KFold(n_splits=n_folds, shuffle=True, random_state=seed)
+    if engine == "batched":
+        return _cv_neg_loglik_batched(log_x, kf, n_components, seed, n_init, reg_covar, "t", n_jobs)
 
     total_loglik = 0.0
     for train_idx, test_idx in kf.split(log_x):
@@ -1813,6 +1827,562 @@ def summarize_best_t_mixture(
     }
 
 
+# =====================================================================
+# Batched EM engine for many independent 1D log-space mixture fits.
+#
+# The bootstrap LRT, the IC sweep and the CV column all refit the same
+# 1D mixture family on many datasets (bootstrap replicates, reps,
+# folds), each from several restarts. Every such (dataset, restart)
+# pair is an independent EM problem of the same K, so they are stacked
+# along a leading "problem" axis and iterated together as array
+# operations over (problem, component, sample); datasets of different
+# sizes are zero-padded and masked. Each problem stops updating at the
+# iteration its serial counterpart would have stopped at, so a batched
+# fit follows the same trajectory as ``GaussianMixture`` /
+# :func:`fit_log_t_mixture` from the same initialisation (the KMeans
+# initialisations are reproduced exactly) and differs only by
+# floating-point summation order (and, for the t-family, by the nu
+# root being bisected to machine precision rather than to brentq's
+# ``xtol``). Problem batches are capped in memory and may be spread
+# over a joblib process pool for very large workloads.
+# =====================================================================
+
+
+_NU_BRACKET = (2.001, 200.0)
+
+
+def _gauss_mixture_inits(log_x: np.ndarray, n_components: int, seed: int, n_init: int,
+                         reg_covar: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Description
+    -----------
+    The ``n_init`` starting points ``GaussianMixture(random_state=seed,
+    init_params='kmeans')`` would use on ``log_x``: one single-start
+    KMeans per restart, all drawn from one shared ``RandomState``, and
+    the one-hot responsibilities turned into weights, means and
+    (``reg_covar``-floored) variances exactly as sklearn's
+    ``_initialize`` does.
+
+    Parameters
+    ----------
+    log_x (np.ndarray)
+        A (N,) shape ndarray of log-space samples.
+    n_components (int)
+        Number of components.
+    seed (int)
+        ``random_state`` of the equivalent ``GaussianMixture``.
+    n_init (int)
+        Number of restarts.
+    reg_covar (float)
+        Variance regularisation.
+
+    Returns
+    -------
+    weights (np.ndarray)
+        A (n_init, K) shape ndarray of initial weights.
+    means (np.ndarray)
+        A (n_init, K) shape ndarray of initial means.
+    variances (np.ndarray)
+        A (n_init, K) shape ndarray of initial variances.
+    """
+
+    X = log_x.reshape(-1, 1)
+    random_state = check_random_state(seed)
+    weights, means, variances = [], [], []
+    for _ in range(n_init):
+        labels = KMeans(n_clusters=n_components, n_init=1, random_state=random_state).fit(X).labels_
+        resp = np.zeros((log_x.size, n_components))
+        resp[np.arange(log_x.size), labels] = 1.0
+        nk = resp.sum(axis=0) + 10 * np.finfo(resp.dtype).eps
+        mu = (resp.T @ log_x) / nk
+        weights.append(nk / log_x.size)
+        means.append(mu)
+        variances.append((resp * (log_x[:, None] - mu) ** 2).sum(axis=0) / nk + reg_covar)
+    return np.array(weights), np.array(means), np.array(variances)
+
+
+def _t_mixture_init(log_x: np.ndarray, n_components: int, seed: int,
+                    reg_covar: float) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Description
+    -----------
+    KMeans starting point of one :func:`fit_log_t_mixture` restart:
+    cluster centres as means, floored within-cluster variances as
+    scales, ``nu = 10`` and floored, renormalised cluster fractions as
+    weights.
+
+    Parameters
+    ----------
+    log_x (np.ndarray)
+        A (N,) shape ndarray of log-space samples.
+    n_components (int)
+        Number of components.
+    seed (int)
+        KMeans ``random_state`` of this restart.
+    reg_covar (float)
+        Variance floor.
+
+    Returns
+    -------
+    w, mu, sigma2, nu (np.ndarray)
+        (K,) shape ndarrays of initial weights, means, scales and
+        degrees of freedom.
+    """
+
+    km = KMeans(n_clusters=n_components, random_state=seed, n_init=10).fit(log_x.reshape(-1, 1))
+    labels = km.labels_
+    mu = km.cluster_centers_.flatten()
+    sigma2 = np.array([max(np.var(log_x[labels == k]), reg_covar) for k in range(n_components)])
+    nu = np.full(n_components, 10.0)
+    w = np.array([np.mean(labels == k) for k in range(n_components)])
+    w = np.where(w < 1e-3, 1e-3, w)
+    w = w / w.sum()
+    return w, mu, sigma2, nu
+
+
+def _logsumexp_components(a: np.ndarray) -> np.ndarray:
+    """Log-sum-exp over the component axis (1) of a (P, K, N) array."""
+
+    a_max = a.max(axis=1, keepdims=True)
+    a_max = np.where(np.isfinite(a_max), a_max, 0.0)
+    return np.log(np.sum(np.exp(a - a_max), axis=1)) + a_max[:, 0, :]
+
+
+def _t_logpdf_batched(X: np.ndarray, mu: np.ndarray, sigma2: np.ndarray, nu: np.ndarray) -> np.ndarray:
+    """
+    Description
+    -----------
+    :func:`_t_logpdf_1d` broadcast over problems and components.
+
+    Parameters
+    ----------
+    X (np.ndarray)
+        A (P, N) shape ndarray of samples.
+    mu, sigma2, nu (np.ndarray)
+        (P, K) shape ndarrays of component parameters.
+
+    Returns
+    -------
+    log_pdf (np.ndarray)
+        A (P, K, N) shape ndarray.
+    """
+
+    mu, sigma2, nu = mu[:, :, None], sigma2[:, :, None], nu[:, :, None]
+    delta = (X[:, None, :] - mu) ** 2 / sigma2
+    return (
+        gammaln((nu + 1.0) / 2.0)
+        - gammaln(nu / 2.0)
+        - 0.5 * (np.log(np.pi) + np.log(nu) + np.log(sigma2))
+        - 0.5 * (nu + 1.0) * np.log1p(delta / nu)
+    )
+
+
+def _t_update_nu_batched(z: np.ndarray, u: np.ndarray, nu_old: np.ndarray, n_k: np.ndarray,
+                         n_bisect: int = 64) -> np.ndarray:
+    """
+    Description
+    -----------
+    :func:`_t_update_nu` for every (problem, component) at once. The
+    score equation is strictly decreasing in ``nu``, so its root on the
+    bracket is found by vectorised bisection (to machine precision after
+    64 halvings); entries without a sign change on the bracket get the
+    same ``nu = 50.0`` fallback as the serial update.
+
+    Parameters
+    ----------
+    z (np.ndarray)
+        A (P, K, N) shape ndarray of (masked) responsibilities.
+    u (np.ndarray)
+        A (P, K, N) shape ndarray of latent weights.
+    nu_old (np.ndarray)
+        A (P, K) shape ndarray of current degrees of freedom.
+    n_k (np.ndarray)
+        A (P, K) shape ndarray of effective component sizes.
+    n_bisect (int)
+        Number of bisection steps; defaults to 64.
+
+    Returns
+    -------
+    nu_new (np.ndarray)
+        A (P, K) shape ndarray of updated degrees of freedom.
+    """
+
+    psi_old = digamma((nu_old + 1.0) / 2.0) - np.log((nu_old + 1.0) / 2.0)
+    const = 1.0 + psi_old + np.sum(z * (np.log(u) - u), axis=2) / n_k
+
+    def f(nu):
+        return -digamma(nu / 2.0) + np.log(nu / 2.0) + const
+
+    lo = np.full_like(const, _NU_BRACKET[0])
+    hi = np.full_like(const, _NU_BRACKET[1])
+    f_lo, f_hi = f(lo), f(hi)
+    for _ in range(n_bisect):
+        mid = 0.5 * (lo + hi)
+        above = f(mid) > 0.0
+        lo = np.where(above, mid, lo)
+        hi = np.where(above, hi, mid)
+    nu_new = 0.5 * (lo + hi)
+    nu_new = np.where(f_lo == 0.0, _NU_BRACKET[0], np.where(f_hi == 0.0, _NU_BRACKET[1], nu_new))
+    has_root = (np.sign(f_lo) != np.sign(f_hi)) | (f_lo == 0.0) | (f_hi == 0.0)
+    return np.where(has_root, nu_new, 50.0)
+
+
+def _batched_gauss_em(X: np.ndarray, mask: np.ndarray, w: np.ndarray, mu: np.ndarray, var: np.ndarray,
+                      max_iter: int = 100, tol: float = 1e-3, reg_covar: float = 1e-4) -> dict:
+    """
+    Description
+    -----------
+    ``GaussianMixture`` EM (1D, ``covariance_type='full'``) on a stack
+    of independent problems. Per iteration every still-active problem
+    runs the E-step, the M-step and the convergence check on the change
+    of its mean log-likelihood, in sklearn's order: the returned lower
+    bound is the one evaluated at the parameters *before* the last
+    M-step, as ``GaussianMixture.lower_bound_`` is.
+
+    Parameters
+    ----------
+    X (np.ndarray)
+        A (P, N) shape ndarray of log-space samples (padding arbitrary).
+    mask (np.ndarray)
+        A (P, N) shape boolean ndarray marking the real samples.
+    w, mu, var (np.ndarray)
+        (P, K) shape ndarrays of initial weights, means and variances.
+    max_iter (int)
+        Maximum EM iterations; defaults to 100 (sklearn's default).
+    tol (float)
+        Convergence threshold on the mean log-likelihood; defaults to
+        1e-3 (sklearn's default).
+    reg_covar (float)
+        Variance regularisation.
+
+    Returns
+    -------
+    result (dict)
+        ``weights``, ``means``, ``variances`` (P, K), ``lower_bound``,
+        ``n_iter`` and ``converged`` (P,).
+    """
+
+    w, mu, var = w.copy(), mu.copy(), var.copy()
+    n_problems = X.shape[0]
+    counts = mask.sum(axis=1)
+    lower_bound = np.full(n_problems, -np.inf)
+    n_iter = np.zeros(n_problems, dtype=int)
+    converged = np.zeros(n_problems, dtype=bool)
+    active = np.ones(n_problems, dtype=bool)
+
+    for it in range(1, max_iter + 1):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        Xa, Ma = X[idx], mask[idx]
+        prec_chol = 1.0 / np.sqrt(var[idx])
+        y = Xa[:, None, :] * prec_chol[:, :, None] - (mu[idx] * prec_chol)[:, :, None]
+        weighted = (-0.5 * (np.log(2 * np.pi) + y ** 2) + np.log(prec_chol)[:, :, None]
+                    + np.log(w[idx])[:, :, None])
+        log_norm = _logsumexp_components(weighted)
+        lb_new = np.sum(np.where(Ma, log_norm, 0.0), axis=1) / counts[idx]
+
+        resp = np.exp(weighted - log_norm[:, None, :]) * Ma[:, None, :]
+        nk = resp.sum(axis=2) + 10 * np.finfo(resp.dtype).eps
+        mu_new = np.sum(resp * Xa[:, None, :], axis=2) / nk
+        var[idx] = np.sum(resp * (Xa[:, None, :] - mu_new[:, :, None]) ** 2, axis=2) / nk + reg_covar
+        mu[idx] = mu_new
+        w[idx] = nk / nk.sum(axis=1, keepdims=True)
+
+        change = lb_new - lower_bound[idx]
+        lower_bound[idx] = lb_new
+        n_iter[idx] = it
+        done = np.abs(change) < tol
+        converged[idx[done]] = True
+        active[idx[done]] = False
+
+    return {'weights': w, 'means': mu, 'variances': var,
+            'lower_bound': lower_bound, 'n_iter': n_iter, 'converged': converged}
+
+
+def _batched_t_em(X: np.ndarray, mask: np.ndarray, w: np.ndarray, mu: np.ndarray, sigma2: np.ndarray,
+                  nu: np.ndarray, max_iter: int = 300, tol: float = 1e-5, reg_covar: float = 1e-4) -> dict:
+    """
+    Description
+    -----------
+    The Peel & McLachlan EM of :func:`fit_log_t_mixture` on a stack of
+    independent problems, with the same per-iteration update order,
+    stopping rule (on the change of the total log-likelihood) and final
+    log-likelihood re-evaluation at the returned parameters.
+
+    Parameters
+    ----------
+    X (np.ndarray)
+        A (P, N) shape ndarray of log-space samples (padding arbitrary).
+    mask (np.ndarray)
+        A (P, N) shape boolean ndarray marking the real samples.
+    w, mu, sigma2, nu (np.ndarray)
+        (P, K) shape ndarrays of initial weights, means, scales and
+        degrees of freedom.
+    max_iter (int)
+        Maximum EM iterations; defaults to 300.
+    tol (float)
+        Convergence tolerance on the log-likelihood; defaults to 1e-5.
+    reg_covar (float)
+        Variance floor.
+
+    Returns
+    -------
+    result (dict)
+        ``weights``, ``means``, ``variances``, ``nus`` (P, K) and
+        ``log_likelihood`` (P,) of the returned parameters.
+    """
+
+    w, mu, sigma2, nu = w.copy(), mu.copy(), sigma2.copy(), nu.copy()
+    n_problems = X.shape[0]
+    X = np.where(mask, X, 0.0)
+    counts = mask.sum(axis=1)
+    prev_ll = np.full(n_problems, -np.inf)
+    active = np.ones(n_problems, dtype=bool)
+
+    for _ in range(max_iter):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        Xa, Ma = X[idx], mask[idx][:, None, :]
+        log_w_pdf = np.log(w[idx])[:, :, None] + _t_logpdf_batched(Xa, mu[idx], sigma2[idx], nu[idx])
+        log_norm = _logsumexp_components(log_w_pdf)
+        ll = np.sum(np.where(Ma[:, 0, :], log_norm, 0.0), axis=1)
+        z = np.exp(log_w_pdf - log_norm[:, None, :]) * Ma
+
+        delta = (Xa[:, None, :] - mu[idx][:, :, None]) ** 2 / sigma2[idx][:, :, None]
+        u = (nu[idx][:, :, None] + 1.0) / (nu[idx][:, :, None] + delta)
+
+        n_k = z.sum(axis=2)
+        zu = z * u
+        n_k_safe = np.maximum(n_k, 1e-10)
+        mu_new = np.sum(zu * Xa[:, None, :], axis=2) / np.maximum(zu.sum(axis=2), 1e-10)
+        sigma2_new = np.sum(zu * (Xa[:, None, :] - mu_new[:, :, None]) ** 2, axis=2) / n_k_safe
+        nu[idx] = _t_update_nu_batched(z, u, nu[idx], n_k_safe)
+        mu[idx] = mu_new
+        sigma2[idx] = np.maximum(sigma2_new, reg_covar)
+        w[idx] = n_k / counts[idx][:, None]
+
+        done = np.abs(ll - prev_ll[idx]) < tol
+        prev_ll[idx] = ll
+        active[idx[done]] = False
+
+    log_w_pdf = np.log(w)[:, :, None] + _t_logpdf_batched(X, mu, sigma2, nu)
+    log_likelihood = np.sum(np.where(mask, _logsumexp_components(log_w_pdf), 0.0), axis=1)
+    return {'weights': w, 'means': mu, 'variances': sigma2, 'nus': nu, 'log_likelihood': log_likelihood}
+
+
+def _run_em_batch(model_class: str, X: np.ndarray, mask: np.ndarray, inits: tuple, reg_covar: float) -> dict:
+    """Dispatches one stacked problem batch to the family's batched EM."""
+
+    if model_class == "gauss":
+        return _batched_gauss_em(X, mask, *inits, reg_covar=reg_covar)
+    return _batched_t_em(X, mask, *inits, reg_covar=reg_covar)
+
+
+def _gaussian_mixture_from_params(weights: np.ndarray, means: np.ndarray, variances: np.ndarray,
+                                  seed: int, n_init: int, reg_covar: float, lower_bound: float,
+                                  n_iter: int, converged: bool) -> GaussianMixture:
+    """
+    Description
+    -----------
+    A fitted-state ``GaussianMixture`` carrying batched-EM parameters,
+    so every downstream helper (``score_samples``, ``bic``,
+    :func:`gmm_modes`, ...) treats it like a regular fit.
+
+    Parameters
+    ----------
+    weights, means, variances (np.ndarray)
+        (K,) shape ndarrays of the fitted parameters.
+    seed, n_init (int)
+        Constructor settings of the equivalent serial fit.
+    reg_covar (float)
+        Variance regularisation.
+    lower_bound (float)
+        Lower bound of the selected restart.
+    n_iter (int)
+        EM iterations of the selected restart.
+    converged (bool)
+        Whether the selected restart converged.
+
+    Returns
+    -------
+    gmm (GaussianMixture)
+        The populated model.
+    """
+
+    K = weights.size
+    gmm = GaussianMixture(n_components=K, covariance_type='full', random_state=seed,
+                          n_init=n_init, reg_covar=reg_covar)
+    gmm.weights_ = np.asarray(weights, dtype=float)
+    gmm.means_ = np.asarray(means, dtype=float).reshape(K, 1)
+    gmm.covariances_ = np.asarray(variances, dtype=float).reshape(K, 1, 1)
+    gmm.precisions_cholesky_ = 1.0 / np.sqrt(gmm.covariances_)
+    gmm.precisions_ = 1.0 / gmm.covariances_
+    gmm.converged_ = bool(converged)
+    gmm.n_iter_ = int(n_iter)
+    gmm.lower_bound_ = float(lower_bound)
+    gmm.n_features_in_ = 1
+    return gmm
+
+
+def fit_log_mixtures_batched(
+    datasets: list[np.ndarray],
+    n_components: int,
+    seeds: list[int] | None = None,
+    model_class: str = "t",
+    n_init: int = 5,
+    reg_covar: float = 1e-4,
+    max_batch_mb: float = 512.0,
+    n_jobs: int = 1,
+) -> list[tuple[GaussianMixture | TMixture, np.ndarray]]:
+    """
+    Description
+    -----------
+    Fits the same ``n_components`` log-space mixture to many datasets
+    at once: the batched counterpart of calling :func:`fit_log_gmm` /
+    :func:`fit_log_t_mixture` once per dataset. Every (dataset,
+    restart) pair is initialised exactly as the serial fit would
+    initialise it, all pairs are iterated together by the batched EM,
+    and the best restart per dataset is kept under the serial
+    selection rule (highest lower bound for ``'gauss'``, highest final
+    log-likelihood for ``'t'``; the first restart wins ties).
+
+    Problems are grouped into batches of at most ``max_batch_mb`` of
+    (problem x component x sample) working memory; with ``n_jobs > 1``
+    the KMeans initialisations and the batches run on a joblib
+    ``loky`` pool, which is how very large bootstrap workloads (large
+    ``B``) are spread over cores.
+
+    Parameters
+    ----------
+    datasets (list of np.ndarray)
+        Strictly positive interval arrays (seconds), possibly of
+        different lengths.
+    n_components (int)
+        Number of components fitted to every dataset.
+    seeds (list of int)
+        Per-dataset seed of the equivalent serial fit; defaults to 0
+        for every dataset.
+    model_class (str)
+        ``'gauss'`` or ``'t'``; defaults to ``'t'``.
+    n_init (int)
+        EM restarts per dataset; defaults to 5.
+    reg_covar (float)
+        Variance regularisation / floor; defaults to 1e-4.
+    max_batch_mb (float)
+        Working-memory cap of one problem batch; defaults to 512.
+    n_jobs (int)
+        Worker processes; defaults to 1 (in-process).
+
+    Returns
+    -------
+    fits (list of tuple)
+        One ``(model, order)`` per dataset, as returned by the serial
+        fit functions.
+    """
+
+    if model_class not in ("gauss", "t"):
+        raise ValueError(
+            f"fit_log_mixtures_batched: model_class must be 'gauss' or 't', got {model_class!r}."
+        )
+    log_datasets = [np.log(np.asarray(x, dtype=float)).ravel() for x in datasets]
+    seeds = [0] * len(log_datasets) if seeds is None else [int(s) for s in seeds]
+
+    def _inits(log_x, seed):
+        if model_class == "gauss":
+            return _gauss_mixture_inits(log_x, n_components, seed, n_init, reg_covar)
+        return tuple(np.array(arr) for arr in zip(*[
+            _t_mixture_init(log_x, n_components, seed + ii, reg_covar) for ii in range(n_init)]))
+
+    if n_jobs > 1:
+        per_dataset = Parallel(n_jobs=n_jobs, backend='loky')(
+            delayed(_inits)(log_x, seed) for log_x, seed in zip(log_datasets, seeds))
+    else:
+        per_dataset = [_inits(log_x, seed) for log_x, seed in zip(log_datasets, seeds)]
+
+    # Problem p is restart (p % n_init) of dataset (p // n_init).
+    n_max = max(log_x.size for log_x in log_datasets)
+    n_problems = len(log_datasets) * n_init
+    X = np.zeros((n_problems, n_max))
+    mask = np.zeros((n_problems, n_max), dtype=bool)
+    for d, log_x in enumerate(log_datasets):
+        X[d * n_init:(d + 1) * n_init, :log_x.size] = log_x
+        mask[d * n_init:(d + 1) * n_init, :log_x.size] = True
+    inits = [np.concatenate([params[j] for params in per_dataset]) for j in range(len(per_dataset[0]))]
+
+    # ~8 live (P, K, N) float64 temporaries per EM iteration.
+    bytes_per_problem = 8 * 8 * n_components * n_max
+    batch_size = max(1, int(max_batch_mb * 2 ** 20 // bytes_per_problem))
+    batches = [slice(start, min(start + batch_size, n_problems)) for start in range(0, n_problems, batch_size)]
+    batch_args = [(model_class, X[b], mask[b], tuple(p[b] for p in inits), reg_covar) for b in batches]
+    if n_jobs > 1 and len(batches) > 1:
+        batch_results = Parallel(n_jobs=n_jobs, backend='loky')(delayed(_run_em_batch)(*args) for args in batch_args)
+    else:
+        batch_results = [_run_em_batch(*args) for args in batch_args]
+    result = {key: np.concatenate([res[key] for res in batch_results]) for key in batch_results[0]}
+
+    fits = []
+    score_key = 'lower_bound' if model_class == "gauss" else 'log_likelihood'
+    for d in range(len(log_datasets)):
+        rows = slice(d * n_init, (d + 1) * n_init)
+        best = d * n_init + int(np.argmax(result[score_key][rows]))
+        if model_class == "gauss":
+            model = _gaussian_mixture_from_params(
+                result['weights'][best], result['means'][best], result['variances'][best],
+                seed=seeds[d], n_init=n_init, reg_covar=reg_covar, lower_bound=result['lower_bound'][best],
+                n_iter=result['n_iter'][best], converged=result['converged'][best])
+        else:
+            model = TMixture(weights=result['weights'][best], means=result['means'][best],
+                             covariances=result['variances'][best], nus=result['nus'][best])
+        fits.append((model, np.argsort(model.means_.flatten())))
+    return fits
+
+
+def _cv_neg_loglik_batched(log_x: np.ndarray, kf: KFold, n_components: int, seed: int, n_init: int,
+                           reg_covar: float, model_class: str, n_jobs: int) -> float:
+    """
+    Description
+    -----------
+    Batched body of :func:`gmm_cv_neg_loglik` /
+    :func:`t_mixture_cv_neg_loglik`: the training partitions of all
+    folds are fitted together (as ragged, masked problems) and every
+    held-out sample is scored by its fold's model.
+
+    Parameters
+    ----------
+    log_x (np.ndarray)
+        A (N,) shape ndarray of log-space samples.
+    kf (KFold)
+        The splitter of the serial path.
+    n_components, seed, n_init (int)
+        As in the serial path.
+    reg_covar (float)
+        As in the serial path.
+    model_class (str)
+        ``'gauss'`` or ``'t'``.
+    n_jobs (int)
+        Worker processes of the batched engine.
+
+    Returns
+    -------
+    cv_neg_loglik (float)
+        ``-2 * sum_i loglik(x_i)`` over the held-out samples, or
+        ``np.inf`` when a training partition is smaller than
+        ``n_components``.
+    """
+
+    splits = list(kf.split(log_x))
+    if any(train_idx.size < n_components for train_idx, _ in splits):
+        return float("inf")
+    fits = fit_log_mixtures_batched(
+        [np.exp(log_x[train_idx]) for train_idx, _ in splits], n_components,
+        seeds=[seed] * len(splits), model_class=model_class, n_init=n_init, reg_covar=reg_covar, n_jobs=n_jobs)
+    total_loglik = sum(float(np.sum(model.score_samples(log_x[test_idx].reshape(-1, 1))))
+                       for (model, _), (_, test_idx) in zip(fits, splits))
+    return -2.0 * total_loglik
+
+
 # =====================================================================
 # Parametric bootstrap likelihood-ratio test (LRT) for the number of
 # mixture components.
@@ -1950,6 +2520,8 @@ def bootstrap_lrt(
     reg_covar: float = 1e-4,
     seed: int = 0,
     message_output=None,
+    engine: str = "serial",
+    n_jobs: int = 1,
 ) -> dict:
     """
     Description
@@ -2008,6 +2580,15 @@ def bootstrap_lrt(
     message_output (callable)
         Optional logging callable for progress messages; if None,
         progress is silent.
+    engine (str)
+        ``'serial'`` refits the ``2 * B`` bootstrap models one at a
+        time; ``'batched'`` draws all ``B`` synthetic datasets first
+        (in the same order, so they are identical) and fits the
+        ``K_null`` and ``K_alt`` models of every replicate with
+        :func:`fit_log_mixtures_batched`. Defaults to ``'serial'``.
+    n_jobs (int)
+        Worker processes of the batched engine (spreads very large
+        ``B`` over cores); defaults to 1.
 
     Returns
     -------
@@ -2047,14 +2628,31 @@ def bootstrap_lrt(
 
     # Bootstrap null distribution
     lr_null = np.empty(B)
-    for b in range(B):
-        log_x_b = _sample_from_mixture(m_null_obs, N_sub, rng)
-        x_b = np.exp(log_x_b)
-        m_null_b, _ = fit_fn(x_b, K_null, seed=seed + b, n_init=n_init_boot, reg_covar=reg_covar)
-        m_alt_b, _ = fit_fn(x_b, K_alt, seed=seed + b, n_init=n_init_boot, reg_covar=reg_covar)
-        lr_null[b] = _lr_statistic(m_null_b, m_alt_b, log_x_b)
-        if message_output is not None and (b + 1) % 10 == 0:
-            message_output(f"      bootstrap [{b + 1}/{B}]")
+    if engine == "batched":
+        # rng is consumed only by the sampling, so drawing all replicates
+        # up front reproduces the serial loop's datasets exactly.
+        log_x_boot = [_sample_from_mixture(m_null_obs, N_sub, rng) for _ in range(B)]
+        x_boot = [np.exp(log_x_b) for log_x_b in log_x_boot]
+        seeds = [seed + b for b in range(B)]
+        fits_null = fit_log_mixtures_batched(x_boot, K_null, seeds=seeds, model_class=model_class,
+                                             n_init=n_init_boot, reg_covar=reg_covar, n_jobs=n_jobs)
+        if message_output is not None:
+            message_output(f"      bootstrap K={K_null} fits [{B}/{B}]")
+        fits_alt = fit_log_mixtures_batched(x_boot, K_alt, seeds=seeds, model_class=model_class,
+                                            n_init=n_init_boot, reg_covar=reg_covar, n_jobs=n_jobs)
+        if message_output is not None:
+            message_output(f"      bootstrap K={K_alt} fits [{B}/{B}]")
+        for b in range(B):
+            lr_null[b] = _lr_statistic(fits_null[b][0], fits_alt[b][0], log_x_boot[b])
+    else:
+        for b in range(B):
+            log_x_b = _sample_from_mixture(m_null_obs, N_sub, rng)
+            x_b = np.exp(log_x_b)
+            m_null_b, _ = fit_fn(x_b, K_null, seed=seed + b, n_init=n_init_boot, reg_covar=reg_covar)
+            m_alt_b, _ = fit_fn(x_b, K_alt, seed=seed + b, n_init=n_init_boot, reg_covar=reg_covar)
+            lr_null[b] = _lr_statistic(m_null_b, m_alt_b, log_x_b)
+            if message_output is not None and (b + 1) % 10 == 0:
+                message_output(f"      bootstrap [{b + 1}/{B}]")
 
     return {
         "K_null": int(K_null),
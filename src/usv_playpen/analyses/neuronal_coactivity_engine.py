@@ -15,6 +15,7 @@ import librosa
 import numpy as np
 import polars as pls
 
+from ..neuropixels.spike_store import StoredUnit, discover_session_units, find_spike_stores, load_unit_spikes
 from ..os_utils import first_match_or_raise
 
 
@@ -944,9 +945,10 @@ def load_animal_sessions(
     of the chosen day's sessions. The tracks array is not materialised -- only its
     leading dimension is read so ``total_duration = n_frames / fs`` is cheap.
 
-    The per-session ``*_good.npy`` tree is globbed ONCE and the resulting
-    stem -> path map is reused for both filtering and spike loading; a recursive glob
-    per unit would otherwise dominate runtime over network mounts.
+    The per-session good units are discovered ONCE (from the spike store, or the
+    legacy ``*_good.npy`` tree) and the resulting stem -> unit map is reused for both
+    filtering and spike loading; a recursive glob per unit would otherwise dominate
+    runtime over network mounts.
 
     Parameters
     ----------
@@ -988,11 +990,16 @@ def load_animal_sessions(
     if not by_date:
         return []
 
-    # One good-unit tree-walk per session; reused for filtering AND spike loading.
-    good_maps: dict[str, dict[str, pathlib.Path]] = {
-        session_name: {f.stem: f for f in (data_root / session_name).glob("**/*_good.npy")}
-        for session_name in session_names
-    }
+    # One good-unit discovery per session (a spike-store index read per probe, or a
+    # single *_good.npy tree-walk for legacy sessions); reused for filtering AND
+    # spike loading.
+    good_maps: dict[str, dict[str, StoredUnit | pathlib.Path]] = {}
+    for session_name in session_names:
+        session_dir = data_root / session_name
+        if find_spike_stores(session_dir):
+            good_maps[session_name] = {unit.stem: unit for unit in discover_session_units(session_dir, groups=("good",))}
+        else:
+            good_maps[session_name] = {f.stem: f for f in session_dir.glob("**/*_good.npy")}
 
     def _score(date: str) -> tuple[int, int]:
         first_session = sorted(by_date[date])[0]
@@ -1037,7 +1044,7 @@ def load_animal_sessions(
         group_b_df = focal_usvs.filter(pls.col(category_column).is_in(group_b_ids))
 
         good = good_maps[session_name]
-        session_neural_data = {unit_id: np.load(good[unit_id])[0, :] for unit_id in common_unit_ids}
+        session_neural_data = {unit_id: load_unit_spikes(good[unit_id])[0, :] for unit_id in common_unit_ids}
 
         sessions_data.append({
             "session_id":     directory.name,
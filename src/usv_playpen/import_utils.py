@@ -0,0 +1,61 @@
+"""
+@author: bartulem
+Deferred imports for the CLI/GUI entry-point modules.
+
+The dispatcher modules (`processing.preprocess_data`, `analyses.analyze_data`,
+`visualizations.visualize_data`) name every worker class of the pipeline, and
+importing those eagerly pulls in librosa, numba, spikeinterface, polars,
+matplotlib and torch before a command has even parsed its options. `lazy_exports` turns such names into PEP 562
+module attributes that are imported on first access instead.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+
+
+def lazy_exports(module_globals: dict,
+                 exports: dict[str, str]) -> tuple[Callable[[str], object], Callable[..., None]]:
+    """
+    Description
+    -----------
+    Builds the module-level ``__getattr__`` (PEP 562) serving a set of
+    lazily imported names, plus a loader that binds some of them into the
+    module namespace before code in that module refers to them by name.
+
+    Module code looks names up in its globals directly (module ``__getattr__``
+    only serves attribute access from outside), so a function using a lazy
+    name calls the loader first. The loader never overwrites a name that is
+    already bound, which keeps ``mock.patch`` on the module attribute working.
+
+    Parameters
+    ----------
+    module_globals (dict)
+        ``globals()`` of the exporting module.
+    exports (dict)
+        ``{name: module}``; relative module names resolve against the
+        exporting module's package.
+
+    Returns
+    -------
+    module_getattr (Callable), load (Callable)
+        The module ``__getattr__`` and ``load(*names)``, which binds the
+        given names (all exports if none are given) into the module.
+    """
+
+    def _resolve(name: str) -> object:
+        value = getattr(importlib.import_module(exports[name], module_globals['__package__']), name)
+        return module_globals.setdefault(name, value)
+
+    def module_getattr(name: str) -> object:
+        if name in exports:
+            return _resolve(name)
+        raise AttributeError(f"module {module_globals['__name__']!r} has no attribute {name!r}")
+
+    def load(*names: str) -> None:
+        for name in names or tuple(exports):
+            if name not in module_globals:
+                _resolve(name)
+
+    return module_getattr, load
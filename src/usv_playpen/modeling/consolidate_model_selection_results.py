@@ -50,7 +50,7 @@ CLI
         [--output_filename my_consolidated.pkl] \\
         [--move_to_steps_subdir] \\
         [--allow_legacy] \\
-        [--ignore_provenance_keys git_commit,git_dirty,package_version]
+        [--ignore_provenance_keys git_commit,git_dirty,package_version,jax_compile_profile]
 
 If `--prefix` is omitted, the consolidator infers it as the single
 `model_selection_<descriptor>_step_` prefix shared by every `*.pkl`
@@ -372,6 +372,7 @@ def consolidate(input_dir: str,
                 allow_legacy: bool = False,
                 ignore_provenance_keys: tuple = (
                     'git_commit', 'git_dirty', 'package_version',
+                    'jax_compile_profile',
                 )) -> str:
     """
     Walks `input_dir`, merges every per-step pickle matching `prefix`
@@ -401,8 +402,10 @@ def consolidate(input_dir: str,
         When True, processes step pickles that lack the metadata
         blocks. Skips the equality assert and writes a `legacy_*.pkl`.
     ignore_provenance_keys : tuple of str, default
-        `('git_commit', 'git_dirty', 'package_version')`
+        `('git_commit', 'git_dirty', 'package_version', 'jax_compile_profile')`
         Top-level fields excluded from the metadata-equality check.
+        `jax_compile_profile` is the JAX selectors' per-step timing
+        snapshot and differs between every step pickle.
 
     Returns
     -------
@@ -609,9 +612,10 @@ if __name__ == '__main__':
     parser.add_argument('--allow_legacy', action='store_true',
                         help="Process pickles that lack metadata blocks.")
     parser.add_argument('--ignore_provenance_keys',
-                        default='git_commit,git_dirty,package_version',
+                        default='git_commit,git_dirty,package_version,jax_compile_profile',
                         help="Comma-separated metadata keys to skip during the "
-                             "equality assert (default: git_commit,git_dirty,package_version).")
+                             "equality assert (default: git_commit,git_dirty,package_version,"
+                             "jax_compile_profile).")
     cli_args = parser.parse_args()
 
     ignored = tuple(k.strip() for k in cli_args.ignore_provenance_keys.split(',') if k.strip())
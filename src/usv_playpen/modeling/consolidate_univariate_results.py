@@ -48,14 +48,15 @@ CLI
         [--output_filename my_consolidated.pkl] \\
         [--delete_individuals_after] \\
         [--allow_legacy] \\
-        [--ignore_provenance_keys git_commit,git_dirty,package_version]
+        [--ignore_provenance_keys git_commit,git_dirty,package_version,jax_compile_profile]
 
 Defaults:
     output_dir       = same as input_dir
     output_filename  = derived from `_input_metadata` →
                        `univariate_<analysis_tag>_<condition>_<ts>.pkl`
                        (the `<ts>` is the consolidation moment, UTC).
-    ignored keys     = `('git_commit', 'git_dirty', 'package_version')`
+    ignored keys     = `('git_commit', 'git_dirty', 'package_version',
+                        'jax_compile_profile')`
                        — these vary across the SLURM array (different
                        nodes can have slightly different working trees
                        or installed packages) but the resolved settings
@@ -223,6 +224,7 @@ def consolidate(input_dir: str,
                 allow_legacy: bool = False,
                 ignore_provenance_keys: tuple = (
                     'git_commit', 'git_dirty', 'package_version',
+                    'jax_compile_profile',
                 )) -> str:
     """
     Walks `input_dir`, merges every `*.pkl` it contains into a single
@@ -256,12 +258,13 @@ def consolidate(input_dir: str,
         `legacy_univariate_<utc-ts>.pkl`. Default is to abort on the first such
         file.
     ignore_provenance_keys : tuple of str, default
-        `('git_commit', 'git_dirty', 'package_version')`
+        `('git_commit', 'git_dirty', 'package_version', 'jax_compile_profile')`
         Top-level fields excluded from the metadata-equality check.
         Useful when the SLURM array runs across nodes with slightly
         divergent environments — those keys vary, but the substantive
         run configuration (settings_sha256 + numerical knobs) still
-        agrees.
+        agrees. `jax_compile_profile` is per-task timing and never
+        agrees across files.
 
     Returns
     -------
@@ -432,9 +435,10 @@ if __name__ == '__main__':
     parser.add_argument('--allow_legacy', action='store_true',
                         help="Process pickles that lack metadata blocks.")
     parser.add_argument('--ignore_provenance_keys',
-                        default='git_commit,git_dirty,package_version',
+                        default='git_commit,git_dirty,package_version,jax_compile_profile',
                         help="Comma-separated metadata keys to skip during the "
-                             "equality assert (default: git_commit,git_dirty,package_version).")
+                             "equality assert (default: git_commit,git_dirty,package_version,"
+                             "jax_compile_profile).")
     cli_args = parser.parse_args()
 
     ignored = tuple(k.strip() for k in cli_args.ignore_provenance_keys.split(',') if k.strip())
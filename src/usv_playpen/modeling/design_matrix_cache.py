@@ -0,0 +1,291 @@
+"""
+@author: bartulem
+Design-matrix cache for the forward stepwise model selection.
+
+Every candidate of every selection step fits a pyGAM on the unrolled design
+of `get_unrolled_X_for_multivariate`: one (value, time-index) column pair per
+feature, `n_samples * history_frames` rows. Only the candidate's column pair
+changes between the candidates of a step, and the rows of a fold (balanced
+subsample, permutation) are fixed by the fold's seed, so the value column of
+a given (fold, feature) pair is the same at every step. `DesignMatrixCache`
+keeps those columns (float32, already unrolled) in an LRU store capped at
+`max_memory_gb` and assembles each candidate design by copying the cached
+columns into one preallocated buffer, so pooling, balancing and unrolling
+run once per (fold, feature) instead of once per candidate and step. The
+`'sklearn'` engines cache their basis-projected blocks the same way.
+
+Hits, misses and evictions are counted; the selectors report them per step
+under `design_cache` in the step pickles.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+class DesignMatrixCache:
+    """
+    LRU store of unrolled per-(fold, feature) design columns.
+    """
+
+    def __init__(self, history_frames: int, max_memory_gb: float = 4.0) -> None:
+        """
+        Initializes the DesignMatrixCache class.
+
+        Parameters
+        ----------
+        history_frames : int
+            Time lags per sample; each cached column holds
+            `n_samples * history_frames` values.
+        max_memory_gb : float, default 4.0
+            Memory cap of the cached arrays; the least recently used entries
+            are evicted past it (`0` disables caching).
+        """
+
+        self.history_frames = int(history_frames)
+        self.max_bytes = int(float(max_memory_gb) * 2 ** 30)
+        self._entries = OrderedDict()
+        self._n_bytes = 0
+        self._shared_keys = set()
+        self.hits, self.misses, self.evictions = 0, 0, 0
+
+    @classmethod
+    def from_settings(cls, modeling_settings: dict, history_frames: int) -> DesignMatrixCache:
+        """
+        Builds the cache from the `hyperparameters.design_matrix_cache`
+        settings block; a missing block keeps the default cap.
+
+        Parameters
+        ----------
+        modeling_settings : dict
+            The loaded modeling settings.
+        history_frames : int
+            Time lags per sample.
+
+        Returns
+        -------
+        DesignMatrixCache
+            The configured cache.
+        """
+
+        block = modeling_settings.get('hyperparameters', {}).get('design_matrix_cache')
+        if block is None:
+            return cls(history_frames)
+        return cls(history_frames, max_memory_gb=block['max_memory_gb'])
+
+    def get(self, key: tuple, build_fn) -> np.ndarray:
+        """
+        Returns the array cached under `key`, building (and caching) it with
+        `build_fn()` on a miss.
+
+        Parameters
+        ----------
+        key : tuple
+            Hashable cache key, e.g. `((fold, 'train'), feature)`.
+        build_fn : callable
+            Zero-argument builder of the array.
+
+        Returns
+        -------
+        np.ndarray
+            The cached array (treat as read-only).
+        """
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        value = build_fn()
+        if value.nbytes <= self.max_bytes:
+            self._entries[key] = value
+            self._n_bytes += value.nbytes
+            while self._n_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._n_bytes -= evicted.nbytes
+                self.evictions += 1
+        return value
+
+    def design(self, fold_key: tuple, features: list, build_fn) -> np.ndarray:
+        """
+        Assembles the unrolled design of `features` for one fold split.
+
+        The result equals `get_unrolled_X_for_multivariate([build_fn(f) for f
+        in features], history_frames)`; only the features missing from the
+        cache are built.
+
+        Parameters
+        ----------
+        fold_key : tuple
+            Identifies the rows, e.g. `(fold_idx, 'train')`; the rows of a key
+            must not change during the selection.
+        features : list of str
+            Features in design-column order.
+        build_fn : callable
+            `build_fn(feature) -> np.ndarray` of shape
+            `(n_samples, history_frames)` holding the fold split's rows.
+
+        Returns
+        -------
+        np.ndarray
+            Float32 design of shape
+            `(n_samples * history_frames, 2 * len(features))`.
+        """
+
+        columns = [self._column(fold_key, feat, build_fn) for feat in features]
+        X_unrolled = np.empty((columns[0].shape[0], 2 * len(columns)), dtype=np.float32)
+        time_column = self._time_column(fold_key, columns[0].shape[0])
+        for col_idx, column in enumerate(columns):
+            if column.shape[0] != X_unrolled.shape[0]:
+                raise ValueError(f"Sample count mismatch at feature index {col_idx} of fold {fold_key}.")
+            X_unrolled[:, 2 * col_idx] = column
+            X_unrolled[:, 2 * col_idx + 1] = time_column
+        return X_unrolled
+
+    def projected(self, fold_key: tuple, features: list, build_fn, basis_matrix: np.ndarray) -> np.ndarray:
+        """
+        Assembles the basis-projected design of `features` for one fold split
+        (the `'sklearn'` engines).
+
+        The result equals `np.hstack([np.dot(build_fn(f), basis_matrix) for f
+        in features])`; only the features missing from the cache are built.
+
+        Parameters
+        ----------
+        fold_key : tuple
+            Identifies the rows, as in `design`.
+        features : list of str
+            Features in design-column order.
+        build_fn : callable
+            `build_fn(feature) -> np.ndarray` of shape
+            `(n_samples, history_frames)`.
+        basis_matrix : np.ndarray
+            The `(history_frames, n_bases)` temporal basis; must stay the
+            same for the lifetime of the cache.
+
+        Returns
+        -------
+        np.ndarray
+            Design of shape `(n_samples, n_bases * len(features))`.
+        """
+
+        return np.hstack([self._projected_block(fold_key, feat, build_fn, basis_matrix) for feat in features])
+
+    def share(self, fold_builders: dict, features: list, basis_matrix: np.ndarray | None = None) -> None:
+        """
+        Builds the columns of `features` (the features already selected, which
+        every candidate of a step reuses) for every fold split, and marks them
+        as the entries a pickled copy of the cache carries to a worker
+        process; the rest of the cache stays in this process.
+
+        Parameters
+        ----------
+        fold_builders : dict
+            `{fold_key: build_fn}`, as in `design`.
+        features : list of str
+            The features to build and share.
+        basis_matrix : np.ndarray, optional
+            Share the basis-projected blocks of `projected` instead of the
+            unrolled columns of `design`.
+
+        Returns
+        -------
+        None
+        """
+
+        self._shared_keys = set()
+        for fold_key, build_fn in fold_builders.items():
+            for feat in features:
+                if basis_matrix is not None:
+                    self._projected_block(fold_key, feat, build_fn, basis_matrix)
+                    self._shared_keys.add((fold_key, feat, 'basis'))
+                else:
+                    column = self._column(fold_key, feat, build_fn)
+                    self._time_column(fold_key, column.shape[0])
+                    self._shared_keys.update({(fold_key, feat), (fold_key, None)})
+
+    def repeated_labels(self, fold_key: tuple, y: np.ndarray) -> np.ndarray:
+        """
+        Returns `np.repeat(y, history_frames)` for the fold split, cached.
+
+        Parameters
+        ----------
+        fold_key : tuple
+            Identifies the rows, as in `design`.
+        y : np.ndarray
+            Per-sample targets of the fold split.
+
+        Returns
+        -------
+        np.ndarray
+            The per-frame targets.
+        """
+
+        return self.get((fold_key, 'labels'), lambda: np.repeat(y, self.history_frames))
+
+    def snapshot(self) -> dict:
+        """Current hit / miss / eviction counters (see `since`)."""
+
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def since(self, snapshot: dict) -> dict:
+        """
+        Counter increments since `snapshot`.
+
+        Parameters
+        ----------
+        snapshot : dict
+            An earlier `snapshot()`.
+
+        Returns
+        -------
+        dict
+            `{'hits', 'misses', 'evictions'}` increments.
+        """
+
+        return {key: count - snapshot[key] for key, count in self.snapshot().items()}
+
+    def step_report(self, counters: dict) -> dict:
+        """
+        The step-metadata record: the step's counters plus the cache's
+        current size.
+
+        Parameters
+        ----------
+        counters : dict
+            The step's summed `since` increments.
+
+        Returns
+        -------
+        dict
+            `hits`, `misses`, `evictions`, `n_entries`, `cached_mb` and
+            `max_mb`.
+        """
+
+        return {**counters, 'n_entries': len(self._entries),
+                'cached_mb': self._n_bytes / 2 ** 20, 'max_mb': self.max_bytes / 2 ** 20}
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state['_entries'] = OrderedDict((key, value) for key, value in self._entries.items()
+                                        if key in self._shared_keys)
+        state['_n_bytes'] = sum(value.nbytes for value in state['_entries'].values())
+        return state
+
+    def _column(self, fold_key: tuple, feature: str, build_fn) -> np.ndarray:
+        return self.get((fold_key, feature), lambda: self._unroll(build_fn(feature)))
+
+    def _projected_block(self, fold_key: tuple, feature: str, build_fn, basis_matrix: np.ndarray) -> np.ndarray:
+        return self.get((fold_key, feature, 'basis'), lambda: np.dot(build_fn(feature), basis_matrix))
+
+    def _time_column(self, fold_key: tuple, n_rows: int) -> np.ndarray:
+        return self.get((fold_key, None), lambda: np.tile(
+            np.arange(self.history_frames, dtype=np.float32), n_rows // self.history_frames))
+
+    def _unroll(self, X_feat: np.ndarray) -> np.ndarray:
+        if X_feat.shape[1] != self.history_frames:
+            raise ValueError(f"Frame mismatch: Data has {X_feat.shape[1]}, expected {self.history_frames}")
+        return X_feat.ravel().astype(np.float32)
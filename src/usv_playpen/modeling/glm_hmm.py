@@ -31,7 +31,10 @@ log-likelihood), and ``n_params`` (for BIC). Three emissions are provided:
 
 Sequences are per recording session: the USV events of a session, IN TEMPORAL
 ONSET ORDER (the modeling input pickle already stores them onset-sorted), are one
-observation sequence; transitions are between consecutive vocalizations.
+observation sequence; transitions are between consecutive vocalizations. The E-step
+evaluates the emissions once on the pooled rows and runs forward-backward for all
+sequences in one compiled (numba) call, the ragged sessions laid end to end and
+delimited by an offsets vector.
 """
 from __future__ import annotations
 
@@ -44,6 +47,8 @@ import optax
 from jax import lax
 from jax.scipy.special import i0e as _jax_i0e
 from jax.scipy.special import logsumexp as _jax_logsumexp
+from joblib import Parallel, delayed
+from numba import njit, prange
 from scipy.special import i0e as _np_i0e
 from sklearn.cluster import KMeans
 
@@ -98,6 +103,183 @@ def _logsumexp(a: np.ndarray, axis: int) -> np.ndarray:
     return np.squeeze(result, axis=axis)
 
 
+@njit(cache=True)
+def _nb_logsumexp(a: np.ndarray) -> float:
+    """
+    Description
+    -----------
+    Compiled log-sum-exp of a 1-D array with the same conventions as
+    :func:`_logsumexp`: the max is subtracted for stability, and an all ``-inf``
+    input yields ``-inf``.
+
+    Parameters
+    ----------
+    a (np.ndarray)
+        ``(K,)`` log-values.
+
+    Returns
+    -------
+    result (float)
+        ``log(sum(exp(a)))``.
+    """
+    a_max = -np.inf
+    for value in a:
+        if value > a_max:
+            a_max = value
+    if not np.isfinite(a_max):
+        a_max = 0.0
+    total = 0.0
+    for value in a:
+        total += np.exp(value - a_max)
+    return np.log(total) + a_max
+
+
+@njit(cache=True, parallel=True)
+def _batched_forward_backward(log_pi: np.ndarray, log_A: np.ndarray, log_B: np.ndarray,
+                              offsets: np.ndarray, posteriors: bool,
+                              full_xi: bool) -> tuple:
+    """
+    Description
+    -----------
+    Log-space forward-backward over a batch of ragged sequences laid end to end,
+    one sequence per parallel iteration. The recursions (and the order of every
+    addition in them) are those of the numpy reference, so the per-sequence
+    marginal log-likelihoods agree with it to floating-point rounding.
+
+    Parameters
+    ----------
+    log_pi (np.ndarray)
+        ``(K,)`` log initial-state distribution.
+    log_A (np.ndarray)
+        ``(1, K, K)`` stationary log transition matrix, or the ``(N, K, K)``
+        per-timestep tensor aligned to the rows of ``log_B`` (``[t]`` is the step
+        landing at row ``t``; each sequence's first row is unused).
+    log_B (np.ndarray)
+        ``(N, K)`` emission log-densities of all sequences, concatenated.
+    offsets (np.ndarray)
+        ``(S + 1,)`` int64 row offsets; sequence ``s`` is rows
+        ``offsets[s]:offsets[s + 1]`` and every sequence has at least one row.
+    posteriors (bool)
+        Run the backward pass and the responsibilities; when False only the
+        forward pass (the marginal log-likelihoods) is computed.
+    full_xi (bool)
+        Return the per-transition responsibilities instead of their per-sequence
+        sums.
+
+    Returns
+    -------
+    seq_loglik (np.ndarray)
+        ``(S,)`` sequence marginal log-likelihoods.
+    gamma (np.ndarray)
+        ``(N, K)`` posterior state responsibilities (empty unless ``posteriors``).
+    xi_sum (np.ndarray)
+        ``(S, K, K)`` per-sequence summed transition responsibilities (zeros
+        unless ``posteriors`` and not ``full_xi``).
+    xi_steps (np.ndarray)
+        ``(N - S, K, K)`` per-transition responsibilities, sequence by sequence
+        (empty unless ``posteriors`` and ``full_xi``).
+    """
+    n_total, n_states = log_B.shape
+    n_seqs = offsets.shape[0] - 1
+    per_step = log_A.shape[0] > 1
+    seq_loglik = np.empty(n_seqs)
+    log_alpha = np.empty((n_total, n_states))
+    log_beta = np.zeros((n_total if posteriors else 0, n_states))
+    gamma = np.empty((n_total if posteriors else 0, n_states))
+    xi_sum = np.zeros((n_seqs, n_states, n_states))
+    xi_steps = np.empty((n_total - n_seqs if posteriors and full_xi else 0, n_states, n_states))
+    for s in prange(n_seqs):
+        start = offsets[s]
+        stop = offsets[s + 1]
+        scratch = np.empty(n_states)
+        for j in range(n_states):
+            log_alpha[start, j] = log_pi[j] + log_B[start, j]
+        for t in range(start + 1, stop):
+            log_A_t = log_A[t] if per_step else log_A[0]
+            for j in range(n_states):
+                for i in range(n_states):
+                    scratch[i] = log_alpha[t - 1, i] + log_A_t[i, j]
+                log_alpha[t, j] = log_B[t, j] + _nb_logsumexp(scratch)
+        loglik = _nb_logsumexp(log_alpha[stop - 1])
+        seq_loglik[s] = loglik
+        if not posteriors:
+            continue
+
+        for t in range(stop - 2, start - 1, -1):
+            log_A_t = log_A[t + 1] if per_step else log_A[0]
+            for i in range(n_states):
+                for j in range(n_states):
+                    scratch[j] = log_A_t[i, j] + (log_B[t + 1, j] + log_beta[t + 1, j])
+                log_beta[t, i] = _nb_logsumexp(scratch)
+        for t in range(start, stop):
+            for k in range(n_states):
+                gamma[t, k] = np.exp(log_alpha[t, k] + log_beta[t, k] - loglik)
+        for t in range(start, stop - 1):
+            log_A_t = log_A[t + 1] if per_step else log_A[0]
+            for i in range(n_states):
+                for j in range(n_states):
+                    value = np.exp(log_alpha[t, i] + log_A_t[i, j]
+                                   + (log_B[t + 1, j] + log_beta[t + 1, j]) - loglik)
+                    if full_xi:
+                        # Sequences before ``s`` contribute one transition fewer than rows.
+                        xi_steps[t - s, i, j] = value
+                    else:
+                        xi_sum[s, i, j] += value
+    return seq_loglik, gamma, xi_sum, xi_steps
+
+
+def _sequence_offsets(sequences: list) -> np.ndarray:
+    """
+    Description
+    -----------
+    Row offsets delimiting ``(X, y)`` sequences once they are concatenated.
+
+    Parameters
+    ----------
+    sequences (list)
+        List of ``(X, y)`` per-sequence tuples.
+
+    Returns
+    -------
+    offsets (np.ndarray)
+        ``(S + 1,)`` int64; sequence ``s`` is rows ``offsets[s]:offsets[s + 1]``.
+    """
+    lengths = [np.asarray(X).shape[0] for X, _ in sequences]
+    if min(lengths) < 1:
+        raise ValueError("GLMHMM sequences must each contain at least one timestep.")
+    return np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+
+
+def _em_restart(model: "GLMHMM", sequences: list, X_all: np.ndarray, y_all: np.ndarray,
+                seed: int) -> dict:
+    """
+    Description
+    -----------
+    Worker entry point for one EM restart in a separate process: runs
+    :meth:`GLMHMM._em_once` on the worker's copy of ``model`` from the restart's
+    seed, so a parallel fit draws exactly what the serial loop would.
+
+    Parameters
+    ----------
+    model (GLMHMM)
+        The (pickled) model being fit.
+    sequences (list)
+        List of ``(X, y)`` per-sequence tuples.
+    X_all (np.ndarray)
+        Pooled design matrix across sequences.
+    y_all (np.ndarray)
+        Pooled targets, aligned to ``X_all``.
+    seed (int)
+        Seed of this restart's generator.
+
+    Returns
+    -------
+    result (dict)
+        The restart result of :meth:`GLMHMM._em_once`.
+    """
+    return model._em_once(sequences, X_all, y_all, np.random.default_rng(seed))
+
+
 def _kmeans_init_responsibilities(y_all: np.ndarray, n_states: int, seed: int) -> np.ndarray:
     """
     Description
@@ -423,7 +605,9 @@ class GLMHMM:
     highest-likelihood fit is kept.
 
     All the HMM recursions run in log space (``logsumexp``) so long sequences and
-    sharp emissions stay numerically stable.
+    sharp emissions stay numerically stable. Each E-step runs forward-backward for
+    every sequence in one compiled batch (:func:`_batched_forward_backward`), and the
+    restarts can be spread over worker processes (``n_jobs``).
 
     Parameters
     ----------
@@ -445,6 +629,10 @@ class GLMHMM:
         the chain stays ergodic.
     random_state (int)
         Seed for the restart / initialisation randomness.
+    n_jobs (int)
+        Worker processes the EM restarts are spread over (joblib ``loky``); ``1``
+        runs them serially in this process. Restart ``r`` is seeded with
+        ``random_state + r`` either way, so the kept fit does not depend on it.
     verbose (bool)
         Print per-iteration log-likelihood when True.
 
@@ -456,7 +644,7 @@ class GLMHMM:
     def __init__(self, n_states: int, emission_factory,
                  *, n_em_iters: int = 100, n_restarts: int = 5, tol: float = 1e-4,
                  transition_pseudocount: float = 1.0, transition_mode: str = 'static',
-                 transition_factory=None, random_state: int = 0,
+                 transition_factory=None, random_state: int = 0, n_jobs: int = 1,
                  verbose: bool = False) -> None:
         self.n_states = int(n_states)
         self.emission_factory = emission_factory
@@ -483,6 +671,7 @@ class GLMHMM:
                        "(a zero-argument callable returning a fresh transition classifier).")
             raise ValueError(message)
         self.random_state = int(random_state)
+        self.n_jobs = int(n_jobs)
         self.verbose = bool(verbose)
         self.log_pi_ = None
         self.log_A_ = None
@@ -530,37 +719,48 @@ class GLMHMM:
             The sequence marginal log-likelihood.
         """
         n_time = log_B.shape[0]
+        offsets = np.array([0, n_time], dtype=np.int64)
+        seq_loglik, gamma, xi_sum, xi_steps = self._forward_backward_batch(
+            log_B, log_A_seq, offsets, full_xi=return_full_xi)
+        xi = xi_steps if return_full_xi else xi_sum[0]
+        return gamma, xi, gamma[0], float(seq_loglik[0])
+
+    def _forward_backward_batch(self, log_B: np.ndarray, log_A_seq: np.ndarray | None,
+                                offsets: np.ndarray, *, posteriors: bool = True,
+                                full_xi: bool = False) -> tuple:
+        """
+        Description
+        -----------
+        Forward-backward for a batch of sequences laid end to end, under the
+        model's ``log_pi_`` and either the stationary ``log_A_`` or a per-timestep
+        transition tensor; a thin wrapper around the compiled
+        :func:`_batched_forward_backward` kernel.
 
-        def log_A_into(t: int) -> np.ndarray:
-            """Log transition matrix used for the step landing at timestep ``t``."""
-            return self.log_A_ if log_A_seq is None else log_A_seq[t]
-
-        log_alpha = np.empty((n_time, self.n_states))
-        log_alpha[0] = self.log_pi_ + log_B[0]
-        for t in range(1, n_time):
-            log_alpha[t] = log_B[t] + _logsumexp(log_alpha[t - 1][:, None] + log_A_into(t), axis=0)
-        seq_loglik = float(_logsumexp(log_alpha[-1], axis=0))
-
-        log_beta = np.zeros((n_time, self.n_states))
-        for t in range(n_time - 2, -1, -1):
-            log_beta[t] = _logsumexp(
-                log_A_into(t + 1) + (log_B[t + 1] + log_beta[t + 1])[None, :], axis=1)
-
-        log_gamma = log_alpha + log_beta - seq_loglik
-        gamma = np.exp(log_gamma)
+        Parameters
+        ----------
+        log_B (np.ndarray)
+            ``(N, K)`` emission log-densities of all sequences, concatenated.
+        log_A_seq (np.ndarray)
+            ``(N, K, K)`` per-timestep log transition tensor aligned to ``log_B``
+            (``'input_driven'`` mode), or None to use ``self.log_A_``.
+        offsets (np.ndarray)
+            ``(S + 1,)`` row offsets delimiting the sequences.
+        posteriors (bool)
+            Also compute the responsibilities (False: log-likelihoods only).
+        full_xi (bool)
+            Return the per-transition responsibilities, not their per-sequence sums.
 
-        if return_full_xi:
-            xi = np.empty((max(n_time - 1, 0), self.n_states, self.n_states))
-            for t in range(n_time - 1):
-                xi[t] = np.exp(log_alpha[t][:, None] + log_A_into(t + 1)
-                               + (log_B[t + 1] + log_beta[t + 1])[None, :] - seq_loglik)
-        else:
-            xi = np.zeros((self.n_states, self.n_states))
-            for t in range(n_time - 1):
-                log_xi = (log_alpha[t][:, None] + log_A_into(t + 1)
-                          + (log_B[t + 1] + log_beta[t + 1])[None, :] - seq_loglik)
-                xi += np.exp(log_xi)
-        return gamma, xi, gamma[0], seq_loglik
+        Returns
+        -------
+        seq_loglik, gamma, xi_sum, xi_steps (tuple)
+            As returned by :func:`_batched_forward_backward`.
+        """
+        log_A = self.log_A_[None] if log_A_seq is None else log_A_seq
+        return _batched_forward_backward(
+            np.ascontiguousarray(self.log_pi_, dtype=np.float64),
+            np.ascontiguousarray(log_A, dtype=np.float64),
+            np.ascontiguousarray(log_B, dtype=np.float64),
+            np.asarray(offsets, dtype=np.int64), posteriors, full_xi)
 
     def _emission_log_B(self, X: np.ndarray, y: np.ndarray) -> np.ndarray:
         """Stack per-state emission log-densities into a ``(T, K)`` matrix."""
@@ -676,7 +876,7 @@ class GLMHMM:
             ``log_pi``, ``log_A``, ``emissions``, ``log_likelihood``, ``n_iter``,
             ``converged``.
         """
-        n_total = X_all.shape[0]
+        offsets = _sequence_offsets(sequences)
         # Structured k-means-on-targets init so the states start differentiated
         # (a random per-sample init collapses to one state for weakly-separated
         # emissions); the restart seed varies the k-means start.
@@ -727,31 +927,18 @@ class GLMHMM:
         converged = False
         n_iter = 0
         for n_iter in range(1, self.n_em_iters + 1):
-            # E-step: forward-backward per sequence, accumulate the sufficient
-            # statistics (per-sample responsibilities, transition counts, first-
-            # state counts, total log-likelihood).
-            gamma_all = np.empty((n_total, self.n_states))
-            xi_total = np.zeros((self.n_states, self.n_states))
-            xi_trans = np.empty((n_trans, self.n_states, self.n_states)) if input_driven else None
-            gamma0_total = np.zeros(self.n_states)
-            total_loglik = 0.0
-            cursor = 0
-            cursor_tr = 0
-            for X_seq, y_seq in sequences:
-                log_B = self._emission_log_B(X_seq, y_seq)
-                log_A_seq = self._seq_log_transition(X_seq)
-                gamma, xi, gamma0, seq_loglik = self._forward_backward(
-                    log_B, log_A_seq, return_full_xi=input_driven)
-                n_seq = X_seq.shape[0]
-                gamma_all[cursor:cursor + n_seq] = gamma
-                cursor += n_seq
-                if input_driven:
-                    xi_trans[cursor_tr:cursor_tr + (n_seq - 1)] = xi
-                    cursor_tr += n_seq - 1
-                else:
-                    xi_total += xi
-                gamma0_total += gamma0
-                total_loglik += seq_loglik
+            # E-step: the emissions (and input-driven transitions) are evaluated once
+            # on the pooled rows -- they are per-row, so this equals evaluating them
+            # sequence by sequence -- and forward-backward runs for every sequence
+            # in one compiled batch, yielding the sufficient statistics (per-sample
+            # responsibilities, transition counts, first-state counts, total
+            # log-likelihood).
+            seq_loglik, gamma_all, xi_seq, xi_trans = self._forward_backward_batch(
+                self._emission_log_B(X_all, y_all), self._seq_log_transition(X_all),
+                offsets, full_xi=input_driven)
+            xi_total = xi_seq.sum(axis=0)
+            gamma0_total = gamma_all[offsets[:-1]].sum(axis=0)
+            total_loglik = float(seq_loglik.sum())
 
             if self.verbose:
                 print(f"  EM iter {n_iter}: loglik={total_loglik:.4f}", flush=True)
@@ -819,10 +1006,17 @@ class GLMHMM:
         X_all = np.concatenate([np.asarray(X) for X, _ in sequences], axis=0)
         y_all = np.concatenate([np.asarray(y) for _, y in sequences], axis=0)
 
+        seeds = [self.random_state + restart for restart in range(self.n_restarts)]
+        if self.n_jobs != 1 and self.n_restarts > 1:
+            # Each worker fits its own copy of the model; the results come back in
+            # restart order, so the kept restart matches the serial loop's.
+            results = Parallel(n_jobs=self.n_jobs, backend='loky', return_as='generator')(
+                delayed(_em_restart)(self, sequences, X_all, y_all, seed) for seed in seeds)
+        else:
+            results = (_em_restart(self, sequences, X_all, y_all, seed) for seed in seeds)
+
         best = None
-        for restart in range(self.n_restarts):
-            rng = np.random.default_rng(self.random_state + restart)
-            result = self._em_once(sequences, X_all, y_all, rng)
+        for restart, result in enumerate(results):
             if self.verbose:
                 print(f"Restart {restart}: loglik={result['log_likelihood']:.4f} "
                       f"(converged={result['converged']}, iters={result['n_iter']})", flush=True)
@@ -856,17 +1050,12 @@ class GLMHMM:
         total (float)
             Summed sequence log-likelihoods.
         """
-        total = 0.0
-        for X_seq, y_seq in sequences:
-            X_arr = np.asarray(X_seq)
-            log_B = self._emission_log_B(X_arr, np.asarray(y_seq))
-            log_A_seq = self._seq_log_transition(X_arr)
-            log_alpha = self.log_pi_ + log_B[0]
-            for t in range(1, log_B.shape[0]):
-                log_A_t = self.log_A_ if log_A_seq is None else log_A_seq[t]
-                log_alpha = log_B[t] + _logsumexp(log_alpha[:, None] + log_A_t, axis=0)
-            total += float(_logsumexp(log_alpha, axis=0))
-        return total
+        X_all = np.concatenate([np.asarray(X) for X, _ in sequences], axis=0)
+        y_all = np.concatenate([np.asarray(y) for _, y in sequences], axis=0)
+        seq_loglik = self._forward_backward_batch(
+            self._emission_log_B(X_all, y_all), self._seq_log_transition(X_all),
+            _sequence_offsets(sequences), posteriors=False)[0]
+        return float(seq_loglik.sum())
 
     def viterbi(self, X: np.ndarray, y: np.ndarray) -> np.ndarray:
         """
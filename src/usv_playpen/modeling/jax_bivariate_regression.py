@@ -84,10 +84,11 @@ import time
 from functools import partial
 from scipy.spatial import cKDTree
 from scipy.stats import spearmanr
-from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.base import BaseEstimator, RegressorMixin, clone
 from sklearn.utils.validation import check_X_y, check_array, check_is_fitted
 from typing import Tuple, Any, Optional
 
+from .jax_compilation import bucket_rows, pad_rows
 from .manifold_metric import (
     signed_diff,
     signed_diff_jax,
@@ -150,7 +151,7 @@ def _bivariate_loss_static(
 
 
 @partial(jax.jit, static_argnames=('n_feats', 'n_time', 'smoothness_derivative_order',
-                                   'metric', 'max_iter'))
+                                   'metric', 'max_iter', 'check_offset'))
 def _bivariate_train_loop_jit(
         params_init,
         opt_state_init,
@@ -169,6 +170,7 @@ def _bivariate_train_loop_jit(
         smoothness_derivative_order: int,
         metric: str,
         period: float,
+        check_offset: int = 0,
 ):
     """
     Full descent fused into a single `jax.lax.while_loop` inside one
@@ -192,6 +194,10 @@ def _bivariate_train_loop_jit(
     state pytree is identical to the one constructed externally by
     `fit()` (same shapes / dtypes), which lets the caller pass in a
     pre-initialised state without breaking JAX's structural typing.
+
+    The convergence check runs after every 100th step. `check_offset=1`
+    moves it to steps 101, 201, ..., the cadence of the Python-loop path
+    of `fit`, so a fused run can reproduce that path's stopping point.
     """
 
     # Cosine-decay the step to zero over `max_iter`, and clip the global norm of
@@ -237,7 +243,7 @@ def _bivariate_train_loop_jit(
         params_next, opt_state_next = step(params_, opt_state_)
         i_next = i_ + 1
 
-        is_check_step = (i_next > 1) & (i_next % check_interval == 0)
+        is_check_step = (i_next > 1) & ((i_next - check_offset) % check_interval == 0)
         w_diff = jnp.linalg.norm(params_next[0] - last_[0])
         b_diff = jnp.linalg.norm(params_next[1] - last_[1])
         diff = jnp.sqrt(w_diff ** 2 + b_diff ** 2)
@@ -262,6 +268,149 @@ def _bivariate_train_loop_jit(
     return params_final, i_final, converged_final
 
 
+@partial(jax.jit, static_argnames=('n_feats', 'n_time', 'smoothness_derivative_order',
+                                   'metric', 'max_iter'))
+def _bivariate_default_step(
+        params,
+        opt_state,
+        X,
+        Y,
+        w,
+        lambda_smooth,
+        l2_reg,
+        huber_delta,
+        learning_rate,
+        grad_clip_norm,
+        period,
+        n_feats: int,
+        n_time: int,
+        smoothness_derivative_order: int,
+        metric: str,
+        max_iter: int,
+):
+    """
+    One clipped-Adam step on `_bivariate_loss_static`, at module scope so
+    the Python-loop path of `fit` compiles once per shape instead of once
+    per estimator (the nested `step` closure it replaces captured `self`,
+    and with it the regularisation strengths, as trace-time constants).
+    The optimizer is rebuilt exactly as `fit` builds it; the cosine
+    schedule is driven by the step count inside `opt_state`, so this is
+    numerically the closure's step.
+    """
+
+    scheduler = optax.cosine_decay_schedule(init_value=learning_rate, decay_steps=max_iter)
+    optimizer = optax.chain(
+        optax.clip_by_global_norm(grad_clip_norm),
+        optax.adam(scheduler),
+    )
+    grads = jax.grad(_bivariate_loss_static)(
+        params, X, Y, w,
+        n_feats, n_time,
+        lambda_smooth, l2_reg, huber_delta,
+        smoothness_derivative_order,
+        metric, period,
+    )
+    updates, opt_state = optimizer.update(grads, opt_state)
+    params = optax.apply_updates(params, updates)
+    return params, opt_state
+
+
+@partial(jax.jit, static_argnames=('n_feats', 'n_time', 'smoothness_derivative_order',
+                                   'metric', 'max_iter', 'check_offset'))
+def _bivariate_grid_train_loop_jit(
+        params_init,
+        opt_state_init,
+        X,
+        Y,
+        w_folds,
+        lambda_smooth,
+        l2_reg,
+        huber_delta,
+        learning_rate,
+        grad_clip_norm,
+        tol,
+        max_iter: int,
+        n_feats: int,
+        n_time: int,
+        smoothness_derivative_order: int,
+        metric: str,
+        period: float,
+        check_offset: int = 0,
+):
+    """
+    `_bivariate_train_loop_jit` vmapped over a regularisation grid and a
+    set of training folds, so a whole inner-CV grid trains in one compiled
+    call.
+
+    The folds share `X` / `Y` (all rows); each fold selects its training
+    rows through its row of `w_folds`, which is zero off the fold. The
+    outer vmap runs over folds (axis 0 of `params_init`, `opt_state_init`
+    and `w_folds`), the inner one over the `(lambda_smooth, l2_reg)` pairs
+    (axis 0 of the two 1-D grids), so every returned array is laid out
+    `(n_folds, n_pairs, ...)`. Under vmap the `while_loop` keeps stepping
+    until every lane has stopped, but a lane's carry is frozen from the
+    moment its own stopping condition holds, so each lane returns what a
+    single fused fit would.
+    """
+
+    def fit_pair(params, opt_state, w, lam_smooth, lam_l2):
+        return _bivariate_train_loop_jit(
+            params, opt_state, X, Y, w,
+            lam_smooth, lam_l2, huber_delta, learning_rate, grad_clip_norm, tol,
+            max_iter=max_iter, n_feats=n_feats, n_time=n_time,
+            smoothness_derivative_order=smoothness_derivative_order,
+            metric=metric, period=period, check_offset=check_offset,
+        )
+
+    fit_pairs = jax.vmap(fit_pair, in_axes=(None, None, None, 0, 0))
+    fit_folds = jax.vmap(fit_pairs, in_axes=(0, 0, 0, None, None))
+    return fit_folds(params_init, opt_state_init, w_folds, lambda_smooth, l2_reg)
+
+
+def _grid_fold_weights(train_masks: np.ndarray, sample_weight: Optional[np.ndarray],
+                       n_samples: int) -> Tuple[np.ndarray, list]:
+    """
+    Validates the per-fold inputs of a batched grid fit and returns, per
+    fold, the training-row weights in the form `fit` would see them.
+
+    Parameters
+    ----------
+    train_masks : np.ndarray
+        Boolean `(n_folds, n_samples)` training-row masks.
+    sample_weight : np.ndarray, optional
+        `(n_samples,)` weights shared by every fold, `(n_folds, n_samples)`
+        per-fold weights, or `None` for uniform weights.
+    n_samples : int
+        Number of rows of the design matrix.
+
+    Returns
+    -------
+    train_masks : np.ndarray
+        The masks as a boolean array.
+    fold_weights : list
+        Per fold, the raw weights of its training rows.
+    """
+
+    train_masks = np.atleast_2d(np.asarray(train_masks, dtype=bool))
+    if train_masks.shape[1] != n_samples:
+        raise ValueError(
+            f"train_masks have {train_masks.shape[1]} columns, but X has {n_samples} samples."
+        )
+    if not train_masks.any(axis=1).all():
+        raise ValueError("Every fold in train_masks must select at least one training row.")
+    if sample_weight is None:
+        sample_weight = np.ones(n_samples)
+    sample_weight = np.asarray(sample_weight, dtype=np.float64)
+    if sample_weight.ndim == 1:
+        sample_weight = np.broadcast_to(sample_weight, train_masks.shape)
+    if sample_weight.shape != train_masks.shape:
+        raise ValueError(
+            f"sample_weight has shape {sample_weight.shape}; expected ({n_samples},) "
+            f"or {train_masks.shape}."
+        )
+    return train_masks, [weights[mask] for weights, mask in zip(sample_weight, train_masks)]
+
+
 class SmoothBivariateRegression(BaseEstimator, RegressorMixin):
     """
     2-D regression with L2 and temporal-smoothness penalties (JAX implementation).
@@ -662,9 +811,15 @@ class SmoothBivariateRegression(BaseEstimator, RegressorMixin):
         # decoupled from the absolute scale of `sample_weight`.
         sample_weight = sample_weight / (np.mean(sample_weight) + 1e-12)
 
-        X_j = jnp.array(X)
-        Y_j = jnp.array(y)
-        w_j = jnp.array(sample_weight)
+        # Pad the sample axis to its shape bucket so folds of similar size
+        # reuse one compiled executable. The padded rows carry zero weight and
+        # the real weights are scaled by n_bucket / n_samples, so the
+        # all-row mean in the loss equals the mean over the real rows.
+        n_bucket = bucket_rows(n_samples)
+        X_pad, y_pad, w_pad = pad_rows(n_bucket, X, y, sample_weight * (n_bucket / n_samples))
+        X_j = jnp.array(X_pad)
+        Y_j = jnp.array(y_pad)
+        w_j = jnp.array(w_pad)
 
         rng = jax.random.PRNGKey(self.random_state)
         params = self._initialize_params(n_inputs, rng)
@@ -682,19 +837,6 @@ class SmoothBivariateRegression(BaseEstimator, RegressorMixin):
         )
         opt_state = optimizer.init(params)
 
-        @partial(jax.jit, static_argnums=(5, 6))
-        def step(params, opt_state, X_batch, Y_batch, w_batch, n_feats, n_time):
-            grads = jax.grad(self._loss_fn)(
-                params, X_batch, Y_batch, w_batch,
-                n_feats, n_time,
-                self.lambda_smooth, self.l2_reg, self.huber_delta,
-                self.smoothness_derivative_order,
-                self.metric, self.period,
-            )
-            updates, opt_state = optimizer.update(grads, opt_state)
-            params = optax.apply_updates(params, updates)
-            return params, opt_state
-
         if self.verbose:
             print(f"Starting 2-D JAX regression for up to {self.max_iter} iterations...")
 
@@ -710,7 +852,14 @@ class SmoothBivariateRegression(BaseEstimator, RegressorMixin):
             converged = False
             completed_iter = 0
             for i in range(self.max_iter):
-                params, opt_state = step(params, opt_state, X_j, Y_j, w_j, self.n_features, self.n_time_bins)
+                params, opt_state = _bivariate_default_step(
+                    params, opt_state, X_j, Y_j, w_j,
+                    self.lambda_smooth, self.l2_reg, self.huber_delta,
+                    self.learning_rate, self.grad_clip_norm, self.period,
+                    n_feats=int(self.n_features), n_time=int(self.n_time_bins),
+                    smoothness_derivative_order=int(self.smoothness_derivative_order),
+                    metric=self.metric, max_iter=int(self.max_iter),
+                )
                 completed_iter = i + 1
                 if i > 0 and i % 100 == 0:
                     w_diff = jnp.linalg.norm(params[0] - last_check_params[0])
@@ -752,11 +901,43 @@ class SmoothBivariateRegression(BaseEstimator, RegressorMixin):
             completed_iter = int(completed_iter_j)
             converged = bool(converged_j)
 
-        self.coef_ = np.array(params[0])
-        self.intercept_ = np.array(params[1])
-        self.n_iter_ = int(completed_iter)
+        return self._store_fit(params[0], params[1], completed_iter, converged,
+                               time.perf_counter() - fit_start, y, sample_weight)
+
+    def _store_fit(self, coef: Any, intercept: Any, n_iter: int, converged: bool,
+                   fit_time: float, y: np.ndarray,
+                   sample_weight: np.ndarray) -> "SmoothBivariateRegression":
+        """
+        Stores the fitted parameters and the training-set structures
+        `predict` / `evaluate_metrics` rely on. Shared by `fit` and
+        `fit_regularization_grid`.
+
+        Parameters
+        ----------
+        coef, intercept : array-like
+            Fitted `W` `(n_inputs, 2)` and `b` `(2,)`.
+        n_iter : int
+            Completed descent iterations.
+        converged : bool
+            Whether the convergence check fired before `max_iter`.
+        fit_time : float
+            Wall time (s) attributed to this fit.
+        y : np.ndarray
+            Training targets, `(n_samples, 2)`.
+        sample_weight : np.ndarray
+            Unit-mean training weights, `(n_samples,)`.
+
+        Returns
+        -------
+        self : object
+            The fitted estimator.
+        """
+
+        self.coef_ = np.array(coef)
+        self.intercept_ = np.array(intercept)
+        self.n_iter_ = int(n_iter)
         self.converged_ = bool(converged)
-        self.fit_time_ = float(time.perf_counter() - fit_start)
+        self.fit_time_ = float(fit_time)
 
         # Store the training targets + their precomputed spatial structures.
         # The kd-tree powers `predict(snap=True)`, projecting raw linear
@@ -802,6 +983,144 @@ class SmoothBivariateRegression(BaseEstimator, RegressorMixin):
 
         return self
 
+    def fit_regularization_grid(self, X: np.ndarray, y: np.ndarray, train_masks: np.ndarray,
+                                sample_weight: Optional[np.ndarray] = None, *,
+                                lambda_smooth_grid: np.ndarray, l2_reg_grid: np.ndarray,
+                                random_states: Optional[list] = None) -> list:
+        """
+        Fits one copy of this estimator per (training fold, `lambda_smooth`,
+        `l2_reg`) combination in a single compiled call — the batched form of
+        the inner-CV tuner's "construct a fresh estimator and `fit` it" loop.
+
+        Every fold is a boolean mask over the rows of `X`, so the folds share
+        one device copy of the design matrix instead of each slicing its own.
+        Each fit runs the fused descent of `_bivariate_train_loop_jit` on the
+        same objective a `fit` on the fold's rows minimises: the masked-out
+        rows carry zero weight and the fold's weights are rescaled so the
+        all-row mean equals the fold-row mean. The convergence check follows
+        this estimator's `_use_lax_loop`: the fused-loop cadence when it is
+        set, otherwise the Python loop's one-step-later cadence. A returned
+        estimator therefore matches `clone(self).set_params(lambda_smooth=...,
+        l2_reg=..., random_state=...).fit(X[mask], y[mask], w[mask])` up to
+        float32 rounding.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Design matrix shared by all folds, shape
+            `(n_samples, n_features * n_time_bins)`.
+        y : np.ndarray
+            Target UMAP coordinates, shape `(n_samples, 2)`.
+        train_masks : np.ndarray
+            Boolean `(n_folds, n_samples)`; row `f` selects fold `f`'s
+            training rows.
+        sample_weight : np.ndarray, optional
+            `(n_samples,)` weights shared by every fold, or `(n_folds,
+            n_samples)` per-fold weights (only the masked rows are read).
+            `None` -> uniform. Normalised per fold exactly as in `fit`.
+        lambda_smooth_grid, l2_reg_grid : np.ndarray
+            1-D candidate grids; their Cartesian product is fit,
+            `lambda_smooth`-major.
+        random_states : list, optional
+            Per-fold initialisation seed; defaults to `self.random_state`
+            for every fold.
+
+        Returns
+        -------
+        fits : list
+            `fits[f][p]` is the estimator fit on fold `f` with the `p`-th
+            `(lambda_smooth, l2_reg)` pair, its `lambda_smooth`, `l2_reg` and
+            `random_state` set accordingly.
+        """
+
+        X, y = check_X_y(X, y, accept_sparse=False, multi_output=True)
+        n_samples, n_inputs = X.shape
+        expected_inputs = self.n_features * self.n_time_bins
+        if n_inputs != expected_inputs:
+            raise ValueError(
+                f"Input X has {n_inputs} columns, but init parameters expect "
+                f"n_features({self.n_features}) * n_time_bins({self.n_time_bins}) = {expected_inputs} columns."
+            )
+        if y.shape[1] != 2:
+            raise ValueError(f"Target y must have exactly 2 columns (UMAP X and Y). Found shape {y.shape}.")
+
+        train_masks, fold_weights = _grid_fold_weights(train_masks, sample_weight, n_samples)
+        n_folds = train_masks.shape[0]
+        random_states = [self.random_state] * n_folds if random_states is None else list(random_states)
+        if len(random_states) != n_folds:
+            raise ValueError(f"Got {len(random_states)} random_states for {n_folds} folds.")
+        pairs = [(float(lam_sm), float(lam_l2)) for lam_sm in lambda_smooth_grid for lam_l2 in l2_reg_grid]
+
+        unit_weights = []
+        n_bucket = bucket_rows(n_samples)
+        w_folds = np.zeros((n_folds, n_bucket))
+        for fold_idx, (mask, weights) in enumerate(zip(train_masks, fold_weights)):
+            if np.mean(weights) <= 0:
+                raise ValueError(
+                    "sample_weight must have a positive mean on every fold; an all-zero / "
+                    "non-positive weight vector would silently zero out the data term of the loss."
+                )
+            weights = weights / (np.mean(weights) + 1e-12)
+            unit_weights.append(weights)
+            # The loss averages over ALL (padded) rows here but over the fold's
+            # rows in `fit`; scaling by n_bucket / n_train makes the means equal.
+            w_folds[fold_idx, np.flatnonzero(mask)] = weights * (n_bucket / weights.shape[0])
+
+        # Same optax chain as `fit` / `_bivariate_train_loop_jit`, so the
+        # vmapped optimiser state is structurally what the loop expects.
+        scheduler = optax.cosine_decay_schedule(
+            init_value=self.learning_rate, decay_steps=self.max_iter,
+        )
+        optimizer = optax.chain(
+            optax.clip_by_global_norm(self.grad_clip_norm),
+            optax.adam(scheduler),
+        )
+        X_pad, y_pad = pad_rows(n_bucket, X, y)
+        fold_params = [self._initialize_params(n_inputs, jax.random.PRNGKey(seed)) for seed in random_states]
+        params = jax.tree_util.tree_map(lambda *leaves: jnp.stack(leaves), *fold_params)
+        opt_state = jax.vmap(optimizer.init)(params)
+
+        if self.verbose:
+            print(f"Fitting {n_folds} folds x {len(pairs)} regularisation pairs in one batched JAX call...")
+
+        fit_start = time.perf_counter()
+        (coefs, intercepts), n_iters, converged = _bivariate_grid_train_loop_jit(
+            params,
+            opt_state,
+            jnp.array(X_pad), jnp.array(y_pad), jnp.asarray(w_folds, dtype=jnp.float32),
+            jnp.asarray([pair[0] for pair in pairs], dtype=jnp.float32),
+            jnp.asarray([pair[1] for pair in pairs], dtype=jnp.float32),
+            jnp.asarray(self.huber_delta, dtype=jnp.float32),
+            jnp.asarray(self.learning_rate, dtype=jnp.float32),
+            jnp.asarray(self.grad_clip_norm, dtype=jnp.float32),
+            jnp.asarray(self.tol, dtype=jnp.float32),
+            max_iter=int(self.max_iter),
+            n_feats=int(self.n_features),
+            n_time=int(self.n_time_bins),
+            smoothness_derivative_order=int(self.smoothness_derivative_order),
+            metric=self.metric,
+            period=jnp.asarray(self.period, dtype=jnp.float32),
+            check_offset=0 if self._use_lax_loop else 1,
+        )
+        coefs, intercepts = np.asarray(coefs), np.asarray(intercepts)
+        n_iters, converged = np.asarray(n_iters), np.asarray(converged)
+        fit_time = (time.perf_counter() - fit_start) / (n_folds * len(pairs))
+
+        fits = []
+        for fold_idx, mask in enumerate(train_masks):
+            fold_fits = []
+            for pair_idx, (lam_sm, lam_l2) in enumerate(pairs):
+                model = clone(self).set_params(
+                    lambda_smooth=lam_sm, l2_reg=lam_l2, random_state=random_states[fold_idx],
+                )
+                fold_fits.append(model._store_fit(
+                    coefs[fold_idx, pair_idx], intercepts[fold_idx, pair_idx],
+                    n_iters[fold_idx, pair_idx], converged[fold_idx, pair_idx],
+                    fit_time, y[mask], unit_weights[fold_idx],
+                ))
+            fits.append(fold_fits)
+        return fits
+
     def predict(self, X: np.ndarray, snap: bool = True) -> np.ndarray:
         """
         Predicts the 2-D UMAP coordinates of upcoming vocalisations.
@@ -853,7 +1172,8 @@ class SmoothBivariateRegression(BaseEstimator, RegressorMixin):
 
     def evaluate_metrics(self, X: np.ndarray, Y_true: np.ndarray, weights: Optional[np.ndarray] = None,
                          region_labels: Optional[np.ndarray] = None, min_region_events: int = 1,
-                         *, kappa: Optional[float] = None) -> dict:
+                         *, kappa: Optional[float] = None, dcor_estimator: str = 'subsample',
+                         dcor_n_sub: int = 2500, dcor_n_rep: int = 3) -> dict:
         """
         Evaluates the fitted model on test data and returns a metric bundle
         aligned with the univariate runner and the forward-selection routine.
@@ -928,6 +1248,9 @@ class SmoothBivariateRegression(BaseEstimator, RegressorMixin):
           (`manifold_metric.dcor_prediction_truth`, subsampled). It is `nan` on
           the torus, where it is uninformative (see `vm_logscore`).
           `r2_spatial` remains a reported descriptor on both geometries.
+        - `dcor_xy_stderr` : standard error of `dcor_xy` over its subsample
+          repeats (`0.0` for the exact estimator, `nan` on the torus), so a
+          selection margin can be read against the estimator's own noise.
 
         Parameters
         ----------
@@ -956,6 +1279,15 @@ class SmoothBivariateRegression(BaseEstimator, RegressorMixin):
             gate, so their paired margins are a proper scoring rule instead of a
             mix of per-fold-refit concentrations. Ignored on Euclidean (the vM
             branch is never entered).
+        dcor_estimator : str, default 'subsample', keyword-only
+            `estimator` of `manifold_metric.dcor_prediction_truth` for
+            `dcor_xy` (Euclidean only).
+        dcor_n_sub : int, default 2500, keyword-only
+            Subsample size of the `dcor_xy` estimate (Euclidean only).
+        dcor_n_rep : int, default 3, keyword-only
+            Number of subsample repeats of the `dcor_xy` estimate (Euclidean
+            only). The three `dcor_*` arguments are normally filled from the
+            settings by `manifold_metric.resolve_manifold_dcor_settings`.
 
         Returns
         -------
@@ -1107,10 +1439,12 @@ class SmoothBivariateRegression(BaseEstimator, RegressorMixin):
                 kappa=kappa,
             )
             dcor_xy = float('nan')
+            dcor_xy_stderr = float('nan')
         else:
-            dcor_xy = dcor_prediction_truth(
+            dcor_xy, dcor_xy_stderr = dcor_prediction_truth(
                 Y_pred, Y_true, metric=self.metric, period=self.period,
-                random_state=self.random_state,
+                n_sub=dcor_n_sub, n_rep=dcor_n_rep, random_state=self.random_state,
+                estimator=dcor_estimator, return_stderr=True,
             )
             vm_logscore = float('nan')
             vm_logscore_pooled = float('nan')
@@ -1139,6 +1473,7 @@ class SmoothBivariateRegression(BaseEstimator, RegressorMixin):
             'spearman_x': spearman_x,
             'spearman_y': spearman_y,
             'dcor_xy': dcor_xy,
+            'dcor_xy_stderr': dcor_xy_stderr,
             'vm_logscore': vm_logscore,
             'vm_logscore_pooled': vm_logscore_pooled,
         }
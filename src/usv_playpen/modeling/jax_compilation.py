@@ -0,0 +1,229 @@
+"""
+@author: bartulem
+XLA compilation reuse for the JAX modeling jobs.
+
+Every SLURM array task of the univariate / model-selection dispatchers used to
+trace and compile the same graphs (`_bivariate_train_loop_jit`,
+`_multinomial_train_loop_jit`, the CNN forward / gradient functions) from
+scratch, and every outer or inner CV fold added new executables because its
+row count differed by a few samples. This module provides the three pieces
+that remove that overhead:
+
+- `configure_compilation_cache` points JAX's persistent compilation cache at a
+  shared directory (the `hyperparameters.jax_compilation` settings block), so
+  an executable compiled by one task is loaded from disk by every other task
+  on the same software stack.
+- `bucket_rows` / `pad_rows` round the sample axis up to a small ladder of
+  sizes (the top three significant bits of the row count, i.e. at most 25 %
+  padding). The estimators pad with zero-weight rows, so folds of similar
+  size share one compiled executable without changing the objective.
+- `start_compile_accounting` / `compile_profile` listen to JAX's monitoring
+  events and split a run's wall time into tracing + lowering + compiling
+  versus everything else, for the `_run_metadata` block.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import jax
+import numpy as np
+
+#: Smallest padded row count; tiny folds all share this bucket.
+MIN_BUCKET_ROWS = 64
+
+#: Default cache location when `cache_directory` is empty. On a cluster this
+#: should be overridden with a directory on the shared file system.
+DEFAULT_CACHE_DIRECTORY = Path.home() / '.cache' / 'usv_playpen' / 'jax_compilation_cache'
+
+# Module-level switch consulted by the estimators' `fit`; set from the
+# settings by `configure_compilation_cache`.
+_shape_bucketing = True
+
+# Accumulators filled by the monitoring listeners (registered once per process).
+_compile_seconds = {}
+_cache_events = {'hits': 0, 'misses': 0}
+_accounting = {'registered': False, 'started_at': None}
+
+
+def configure_compilation_cache(modeling_settings: dict) -> str | None:
+    """
+    Description
+    -----------
+    Applies the `hyperparameters.jax_compilation` settings block: enables
+    JAX's persistent compilation cache in `cache_directory` (created if
+    missing) and sets whether the estimators pad their sample axis into
+    shape buckets. A missing block leaves JAX untouched and bucketing on.
+
+    Parameters
+    ----------
+    modeling_settings (dict)
+        The loaded modeling settings.
+
+    Returns
+    -------
+    cache_directory (str | None)
+        The cache directory in use, or None when the cache is disabled.
+    """
+
+    global _shape_bucketing
+
+    block = modeling_settings.get('hyperparameters', {}).get('jax_compilation')
+    if block is None:
+        return None
+    _shape_bucketing = bool(block['shape_bucketing_bool'])
+    if not block['persistent_cache_bool']:
+        return None
+
+    cache_directory = Path(os.path.expanduser(block['cache_directory'] or DEFAULT_CACHE_DIRECTORY))
+    cache_directory.mkdir(parents=True, exist_ok=True)
+    jax.config.update('jax_compilation_cache_dir', str(cache_directory))
+    jax.config.update('jax_persistent_cache_min_compile_time_secs',
+                      float(block['min_compile_time_secs']))
+    return str(cache_directory)
+
+
+def shape_bucketing_enabled() -> bool:
+    """
+    Description
+    -----------
+    Whether the estimators pad their sample axis into shape buckets.
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    enabled (bool)
+        The switch set by `configure_compilation_cache` (True by default).
+    """
+
+    return _shape_bucketing
+
+
+def bucket_rows(n_rows: int) -> int:
+    """
+    Description
+    -----------
+    Rounds a row count up to its shape bucket: keep the three most significant
+    bits, so consecutive buckets differ by at most 25 % (64, 80, 96, 112, 128,
+    160, ...). Returns `n_rows` unchanged when bucketing is disabled.
+
+    Parameters
+    ----------
+    n_rows (int)
+        Number of real rows.
+
+    Returns
+    -------
+    n_bucket (int)
+        Padded row count, `>= n_rows`.
+    """
+
+    n_rows = int(n_rows)
+    if not _shape_bucketing:
+        return n_rows
+    n_bucket = max(n_rows, MIN_BUCKET_ROWS)
+    shift = max(n_bucket.bit_length() - 3, 0)
+    return -(-n_bucket >> shift) << shift
+
+
+def pad_rows(n_bucket: int, *arrays: np.ndarray) -> tuple:
+    """
+    Description
+    -----------
+    Zero-pads the leading axis of every array to `n_bucket` rows. The caller
+    masks the padded rows out of its objective (zero sample weight).
+
+    Parameters
+    ----------
+    n_bucket (int)
+        Target row count (from `bucket_rows`).
+    *arrays (np.ndarray)
+        Arrays sharing the same leading length.
+
+    Returns
+    -------
+    padded (tuple)
+        The padded arrays, in order.
+    """
+
+    padded = []
+    for array in arrays:
+        array = np.asarray(array)
+        pad_width = [(0, n_bucket - array.shape[0])] + [(0, 0)] * (array.ndim - 1)
+        padded.append(np.pad(array, pad_width))
+    return tuple(padded)
+
+
+def _record_duration(event: str, duration_secs: float, **kwargs) -> None:
+    if '/jax/core/compile/' in event:
+        name = event.rsplit('/', 1)[-1]
+        _compile_seconds[name] = _compile_seconds.get(name, 0.0) + float(duration_secs)
+
+
+def _record_event(event: str, **kwargs) -> None:
+    if event.endswith('cache_hits'):
+        _cache_events['hits'] += 1
+    elif event.endswith('cache_misses'):
+        _cache_events['misses'] += 1
+
+
+def start_compile_accounting() -> None:
+    """
+    Description
+    -----------
+    Starts (or restarts) compile-time accounting for the current run: resets
+    the accumulators and, on first use in the process, registers listeners
+    for JAX's compile-duration and persistent-cache events.
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    None
+    """
+
+    if not _accounting['registered']:
+        jax.monitoring.register_event_duration_secs_listener(_record_duration)
+        jax.monitoring.register_event_listener(_record_event)
+        _accounting['registered'] = True
+    _compile_seconds.clear()
+    _cache_events.update(hits=0, misses=0)
+    _accounting['started_at'] = time.perf_counter()
+
+
+def compile_profile() -> dict | None:
+    """
+    Description
+    -----------
+    Compile-versus-run split of the wall time since `start_compile_accounting`.
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    profile (dict | None)
+        `wall_s`, `compile_s` (tracing + lowering + backend compilation),
+        `run_s` (the rest), the per-stage `compile_stages_s`, the persistent
+        cache `cache_hits` / `cache_misses`, and whether `shape_bucketing`
+        was on. None if accounting was never started.
+    """
+
+    if _accounting['started_at'] is None:
+        return None
+    wall_s = time.perf_counter() - _accounting['started_at']
+    compile_s = float(sum(_compile_seconds.values()))
+    return {
+        'wall_s': float(wall_s),
+        'compile_s': compile_s,
+        'run_s': float(max(wall_s - compile_s, 0.0)),
+        'compile_stages_s': dict(_compile_seconds),
+        'cache_hits': int(_cache_events['hits']),
+        'cache_misses': int(_cache_events['misses']),
+        'shape_bucketing': bool(_shape_bucketing),
+    }
@@ -23,10 +23,13 @@ import numpy as np
 import optax
 import time
 from functools import partial
-from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.base import BaseEstimator, ClassifierMixin, clone
 from sklearn.utils.validation import check_X_y, check_array, check_is_fitted
 from sklearn.preprocessing import LabelBinarizer
-from typing import Tuple, Any
+from typing import Tuple, Any, Optional
+
+from .jax_bivariate_regression import _grid_fold_weights
+from .jax_compilation import bucket_rows, pad_rows
 
 
 def _multinomial_loss_static(
@@ -90,7 +93,7 @@ def _multinomial_loss_static(
 
 @partial(
     jax.jit,
-    static_argnames=('n_feats', 'n_time', 'smoothness_derivative_order', 'max_iter'),
+    static_argnames=('n_feats', 'n_time', 'smoothness_derivative_order', 'max_iter', 'check_offset'),
 )
 def _multinomial_train_loop_jit(
         params_init,
@@ -109,6 +112,7 @@ def _multinomial_train_loop_jit(
         n_feats: int,
         n_time: int,
         smoothness_derivative_order: int,
+        check_offset: int = 0,
 ):
     """
     Full multinomial descent fused into a single
@@ -122,6 +126,10 @@ def _multinomial_train_loop_jit(
     distinct values seen at runtime are the outer fit's `max_iter` and
     the inner-CV's `inner_max_iter`, so the cache holds at most two
     compiled variants per shape.
+
+    The convergence check runs after every 100th step; `check_offset=1`
+    moves it to steps 101, 201, ..., the cadence of the Python-loop path
+    of `fit`.
     """
 
     scheduler = optax.cosine_decay_schedule(
@@ -165,7 +173,7 @@ def _multinomial_train_loop_jit(
         params_next, opt_state_next = step(params_, opt_state_)
         i_next = i_ + 1
 
-        is_check_step = (i_next > 1) & (i_next % check_interval == 0)
+        is_check_step = (i_next > 1) & ((i_next - check_offset) % check_interval == 0)
         w_diff = jnp.linalg.norm(params_next[0] - last_[0])
         b_diff = jnp.linalg.norm(params_next[1] - last_[1])
         diff = jnp.sqrt(w_diff ** 2 + b_diff ** 2)
@@ -190,6 +198,138 @@ def _multinomial_train_loop_jit(
     return params_final, i_final, converged_final
 
 
+@partial(
+    jax.jit,
+    static_argnames=('n_feats', 'n_time', 'smoothness_derivative_order', 'max_iter', 'check_offset'),
+)
+def _multinomial_grid_train_loop_jit(
+        params_init,
+        opt_state_init,
+        X,
+        Y_onehot,
+        sw_folds,
+        class_weights,
+        lambda_smooth,
+        l2_reg,
+        focal_gamma,
+        learning_rate,
+        grad_clip_norm,
+        tol,
+        max_iter: int,
+        n_feats: int,
+        n_time: int,
+        smoothness_derivative_order: int,
+        check_offset: int = 0,
+):
+    """
+    `_multinomial_train_loop_jit` vmapped over a set of training folds and a
+    regularisation grid, so an inner-CV grid trains in one compiled call.
+
+    The folds share `X` / `Y_onehot` (all rows) and select their training
+    rows through `sw_folds`, which is zero off the fold; the focal term is a
+    weighted mean, so the zero rows drop out of the objective exactly. The
+    outer vmap runs over folds (axis 0 of `params_init`, `opt_state_init`,
+    `sw_folds` and `class_weights`), the inner one over the
+    `(lambda_smooth, l2_reg)` pairs, so every returned array is laid out
+    `(n_folds, n_pairs, ...)`. Each lane's carry is frozen once its own
+    stopping condition holds, so it returns what a single fused fit would.
+    """
+
+    def fit_pair(params, opt_state, sw, c_weights, lam_smooth, lam_l2):
+        return _multinomial_train_loop_jit(
+            params, opt_state, X, Y_onehot, sw, c_weights,
+            lam_smooth, lam_l2, focal_gamma, learning_rate, grad_clip_norm, tol,
+            max_iter=max_iter, n_feats=n_feats, n_time=n_time,
+            smoothness_derivative_order=smoothness_derivative_order, check_offset=check_offset,
+        )
+
+    fit_pairs = jax.vmap(fit_pair, in_axes=(None, None, None, None, 0, 0))
+    fit_folds = jax.vmap(fit_pairs, in_axes=(0, 0, 0, 0, None, None))
+    return fit_folds(params_init, opt_state_init, sw_folds, class_weights, lambda_smooth, l2_reg)
+
+
+def _class_weights_and_log_priors(Y_onehot: jnp.ndarray,
+                                  uniform_class_weights: bool) -> Tuple[jnp.ndarray, jnp.ndarray]:
+    """
+    Per-class focal-alpha / smoothness weights and log class priors of a
+    one-hot training target. Shared by `fit` and `fit_regularization_grid`
+    so both derive them with the same operations.
+
+    Parameters
+    ----------
+    Y_onehot : jnp.ndarray
+        One-hot training targets, shape (n_samples, n_classes).
+    uniform_class_weights : bool
+        Use uniform instead of softened inverse-frequency class weights.
+
+    Returns
+    -------
+    c_weights : jnp.ndarray
+        Unit-mean class weights, shape (n_classes,).
+    log_priors : jnp.ndarray
+        `log(count_c / N + eps)`, shape (n_classes,).
+    """
+
+    n_classes = Y_onehot.shape[1]
+    class_counts = jnp.sum(Y_onehot, axis=0)
+    if uniform_class_weights:
+        # Training fold was already sample-level balanced upstream (e.g., the
+        # runner's `balance_train_bool` path). Replace the softened
+        # inverse-frequency weights with uniform weights so the focal-alpha
+        # does not double-correct an already balanced batch.
+        c_weights = jnp.ones(n_classes, dtype=Y_onehot.dtype)
+    else:
+        # Soften the extreme class imbalance by using the square root of the counts
+        sqrt_counts = jnp.sqrt(class_counts + 1e-8)
+        c_weights = jnp.sum(sqrt_counts) / (n_classes * sqrt_counts)
+
+    # Normalise to unit mean in both branches so `lambda_smooth` has the
+    # same effective meaning regardless of whether the uniform or the
+    # softened-inverse-frequency path is active. `_loss_fn` uses
+    # `class_weights` twice — once as the focal-loss alpha, once as the
+    # per-class scaler on the smoothness penalty — and both uses are
+    # scale-equivariant, so the mean-1 normalisation preserves the
+    # intended *shape* of the reweighting while pinning the scale.
+    c_weights = c_weights / (jnp.mean(c_weights) + 1e-12)
+
+    # Log-priors for the intercepts
+    priors = class_counts / Y_onehot.shape[0]
+    log_priors = jnp.log(priors + 1e-8)
+    return c_weights, log_priors
+
+
+def _binarize_labels(y: np.ndarray, lb: Optional[LabelBinarizer] = None) -> Tuple[LabelBinarizer, np.ndarray]:
+    """
+    One-hot encodes `y`, fitting a new `LabelBinarizer` unless one is
+    given, and expands the single binary column to two so the softmax
+    always sees one column per class.
+
+    Parameters
+    ----------
+    y : np.ndarray
+        Class labels, shape (n_samples,).
+    lb : LabelBinarizer, optional
+        An already fitted binarizer; labels it does not know encode as zeros.
+
+    Returns
+    -------
+    lb : LabelBinarizer
+        The binarizer.
+    Y_onehot : np.ndarray
+        One-hot targets, shape (n_samples, n_classes).
+    """
+
+    if lb is None:
+        lb = LabelBinarizer()
+        Y_onehot = lb.fit_transform(y)
+    else:
+        Y_onehot = lb.transform(y)
+
+    if Y_onehot.shape[1] == 1:
+        Y_onehot = np.hstack([1 - Y_onehot, Y_onehot])
+    return lb, Y_onehot
+
+
 @partial(
     jax.jit,
     static_argnames=('loss_fn', 'n_feats', 'n_time', 'smoothness_derivative_order', 'max_iter'),
@@ -658,15 +798,9 @@ class SmoothMultinomialLogisticRegression(BaseEstimator, ClassifierMixin):
 
         X, y = check_X_y(X, y, accept_sparse=False)
 
-        self.lb_ = LabelBinarizer()
-        Y_onehot = self.lb_.fit_transform(y)
-
-        if Y_onehot.shape[1] == 1:
-            Y_onehot = np.hstack([1 - Y_onehot, Y_onehot])
-
-        self.classes_ = self.lb_.classes_
+        lb, Y_onehot = _binarize_labels(y)
         _, n_inputs = X.shape
-        n_classes = len(self.classes_)
+        n_classes = len(lb.classes_)
 
         expected_inputs = self.n_features * self.n_time_bins
         if n_inputs != expected_inputs:
@@ -698,37 +832,23 @@ class SmoothMultinomialLogisticRegression(BaseEstimator, ClassifierMixin):
             # not truncated to 0/1.
             sw_j = jnp.asarray(sample_weight / mean_sw, dtype=jnp.float32)
 
-        class_counts = jnp.sum(Y_j, axis=0)
-        if self.uniform_class_weights:
-            # Training fold was already sample-level balanced upstream (e.g., the
-            # runner's `balance_train_bool` path). Replace the softened
-            # inverse-frequency weights with uniform weights so the focal-alpha
-            # does not double-correct an already balanced batch.
-            c_weights = jnp.ones(n_classes, dtype=Y_j.dtype)
-        else:
-            # Soften the extreme class imbalance by using the square root of the counts
-            sqrt_counts = jnp.sqrt(class_counts + 1e-8)
-            c_weights = jnp.sum(sqrt_counts) / (n_classes * sqrt_counts)
-
-        # Normalise to unit mean in both branches so `lambda_smooth` has the
-        # same effective meaning regardless of whether the uniform or the
-        # softened-inverse-frequency path is active. `_loss_fn` uses
-        # `class_weights` twice — once as the focal-loss alpha, once as the
-        # per-class scaler on the smoothness penalty — and both uses are
-        # scale-equivariant, so the mean-1 normalisation preserves the
-        # intended *shape* of the reweighting while pinning the scale.
-        c_weights = c_weights / (jnp.mean(c_weights) + 1e-12)
-
-        # 1. Calculate log-priors for the intercepts
-        total_samples = Y_j.shape[0]
-        priors = class_counts / total_samples
-        log_priors = jnp.log(priors + 1e-8)
+        c_weights, log_priors = _class_weights_and_log_priors(Y_j, self.uniform_class_weights)
+
+        # Pad the sample axis to its shape bucket (after the class statistics,
+        # which must see only the real rows) so folds of similar size reuse one
+        # compiled executable. The padded rows carry zero sample weight, which
+        # removes them from the weighted-mean focal term exactly.
+        n_bucket = bucket_rows(X.shape[0])
+        X_pad, Y_pad, sw_pad = pad_rows(n_bucket, X, Y_onehot, np.asarray(sw_j))
+        X_j = jnp.array(X_pad)
+        Y_j = jnp.array(Y_pad)
+        sw_j = jnp.asarray(sw_pad, dtype=jnp.float32)
 
         # Pass log_priors into the initialization
         rng = jax.random.PRNGKey(self.random_state)
         params = self._initialize_params(n_inputs, n_classes, rng, log_priors)
 
-        # 2. Setup Cosine Decay Learning Rate
+        # Setup Cosine Decay Learning Rate
         scheduler = optax.cosine_decay_schedule(
             init_value=self.learning_rate,
             decay_steps=self.max_iter
@@ -814,19 +934,201 @@ class SmoothMultinomialLogisticRegression(BaseEstimator, ClassifierMixin):
             completed_iter = int(completed_iter_j)
             converged = bool(converged_j)
 
-        self.coef_ = np.array(params[0].T)
-        self.intercept_ = np.array(params[1])
+        return self._store_fit(lb, params[0], params[1], log_priors, completed_iter, converged,
+                               time.perf_counter() - fit_start)
+
+    def _store_fit(self, lb: LabelBinarizer, W: Any, b: Any, log_priors: Any, n_iter: int,
+                   converged: bool, fit_time: float) -> "SmoothMultinomialLogisticRegression":
+        """
+        Stores the fitted parameters and diagnostics. Shared by `fit` and
+        `fit_regularization_grid`.
+
+        Parameters
+        ----------
+        lb : LabelBinarizer
+            The binarizer fitted to the training targets.
+        W, b : array-like
+            Fitted weights `(n_inputs, n_classes)` and biases `(n_classes,)`.
+        log_priors : array-like
+            Training log class priors, shape (n_classes,).
+        n_iter : int
+            Completed optimizer steps.
+        converged : bool
+            Whether the tolerance check fired before `max_iter`.
+        fit_time : float
+            Wall time (s) attributed to this fit.
+
+        Returns
+        -------
+        self : object
+            Fitted estimator.
+        """
+
+        self.lb_ = lb
+        self.classes_ = lb.classes_
+        self.coef_ = np.array(W).T
+        self.intercept_ = np.array(b)
         self.log_priors_ = np.array(log_priors)
         # Expose fit-time diagnostics so callers can persist per-fold convergence
         # evidence alongside the learned weights — the most common silent-failure
         # mode for this estimator is hitting `max_iter` without converging.
-        self.n_iter_ = int(completed_iter)
+        self.n_iter_ = int(n_iter)
         self.converged_ = bool(converged)
-        self.fit_time_ = float(time.perf_counter() - fit_start)
+        self.fit_time_ = float(fit_time)
         self.is_fitted_ = True
 
         return self
 
+    def fit_regularization_grid(self, X: np.ndarray, y: np.ndarray, train_masks: np.ndarray,
+                                sample_weight: Optional[np.ndarray] = None, *,
+                                lambda_smooth_grid: np.ndarray, l2_reg_grid: np.ndarray,
+                                random_states: Optional[list] = None) -> list:
+        """
+        Fits one copy of this estimator per (training fold, `lambda_smooth`,
+        `l2_reg`) combination with one compiled call per distinct training
+        class set — the batched form of the inner-CV tuner's "construct a
+        fresh estimator and `fit` it" loop.
+
+        Every fold is a boolean mask over the rows of `X`. Rows off the fold
+        carry zero sample weight, which removes them from the weighted-mean
+        focal term exactly, while the class weights and log priors are
+        computed from the fold's rows as in `fit`. Folds whose training rows
+        cover different class sets get different one-hot layouts, so the
+        folds are grouped by class set and each group runs as one vmapped
+        `_multinomial_train_loop_jit`, whose convergence check follows this
+        estimator's `_use_lax_loop` (the fused-loop cadence when set, the
+        Python loop's one-step-later cadence otherwise). A returned estimator
+        therefore matches `clone(self).set_params(lambda_smooth=...,
+        l2_reg=..., random_state=...).fit(X[mask], y[mask], w[mask])` up to
+        float32 rounding.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Design matrix shared by all folds, shape
+            (n_samples, n_features * n_time_bins).
+        y : np.ndarray
+            Target values, shape (n_samples,).
+        train_masks : np.ndarray
+            Boolean (n_folds, n_samples); row `f` selects fold `f`'s
+            training rows.
+        sample_weight : np.ndarray, optional
+            (n_samples,) weights shared by every fold, or (n_folds, n_samples)
+            per-fold weights (only the masked rows are read). `None` -> uniform.
+        lambda_smooth_grid, l2_reg_grid : np.ndarray
+            1-D candidate grids; their Cartesian product is fit,
+            `lambda_smooth`-major.
+        random_states : list, optional
+            Per-fold initialisation seed; defaults to `self.random_state`
+            for every fold.
+
+        Returns
+        -------
+        fits : list
+            `fits[f][p]` is the estimator fit on fold `f` with the `p`-th
+            `(lambda_smooth, l2_reg)` pair, its `lambda_smooth`, `l2_reg` and
+            `random_state` set accordingly.
+        """
+
+        X, y = check_X_y(X, y, accept_sparse=False)
+        n_samples, n_inputs = X.shape
+        expected_inputs = self.n_features * self.n_time_bins
+        if n_inputs != expected_inputs:
+            raise ValueError(
+                f"Input X has {n_inputs} columns, but init parameters expect "
+                f"n_features({self.n_features}) * n_time_bins({self.n_time_bins}) = "
+                f"{expected_inputs} columns."
+            )
+
+        train_masks, fold_weights = _grid_fold_weights(train_masks, sample_weight, n_samples)
+        n_folds = train_masks.shape[0]
+        random_states = [self.random_state] * n_folds if random_states is None else list(random_states)
+        if len(random_states) != n_folds:
+            raise ValueError(f"Got {len(random_states)} random_states for {n_folds} folds.")
+        pairs = [(float(lam_sm), float(lam_l2)) for lam_sm in lambda_smooth_grid for lam_l2 in l2_reg_grid]
+        lam_smooth_j = jnp.asarray([pair[0] for pair in pairs], dtype=jnp.float32)
+        lam_l2_j = jnp.asarray([pair[1] for pair in pairs], dtype=jnp.float32)
+
+        # Same optax chain as `fit` / `_multinomial_train_loop_jit`, so the
+        # vmapped optimiser state is structurally what the loop expects.
+        scheduler = optax.cosine_decay_schedule(
+            init_value=self.learning_rate, decay_steps=self.max_iter,
+        )
+        optimizer = optax.chain(
+            optax.clip_by_global_norm(self.grad_clip_norm),
+            optax.adam(scheduler),
+        )
+
+        class_groups = {}
+        for fold_idx, mask in enumerate(train_masks):
+            class_groups.setdefault(tuple(np.unique(y[mask])), []).append(fold_idx)
+
+        n_bucket = bucket_rows(n_samples)
+        X_j = jnp.array(pad_rows(n_bucket, X)[0])
+        fits = [None] * n_folds
+        for fold_indices in class_groups.values():
+            lb, Y_onehot = _binarize_labels(y[train_masks[fold_indices[0]]])
+            _, Y_all = _binarize_labels(y, lb)
+            Y_j = jnp.array(pad_rows(n_bucket, Y_all)[0])
+            n_classes = Y_all.shape[1]
+
+            sw_folds, c_weights, log_priors, fold_params = [], [], [], []
+            for fold_idx in fold_indices:
+                mask = train_masks[fold_idx]
+                weights = fold_weights[fold_idx]
+                if float(np.mean(weights)) <= 0.0:
+                    raise ValueError("sample_weight must have a positive mean.")
+                sw_full = np.zeros(n_bucket)
+                sw_full[np.flatnonzero(mask)] = weights / float(np.mean(weights))
+                sw_folds.append(jnp.asarray(sw_full, dtype=jnp.float32))
+                fold_c_weights, fold_log_priors = _class_weights_and_log_priors(
+                    jnp.array(Y_all[mask]), self.uniform_class_weights)
+                c_weights.append(fold_c_weights)
+                log_priors.append(fold_log_priors)
+                fold_params.append(self._initialize_params(
+                    n_inputs, n_classes, jax.random.PRNGKey(random_states[fold_idx]), fold_log_priors))
+
+            params = jax.tree_util.tree_map(lambda *leaves: jnp.stack(leaves), *fold_params)
+            opt_state = jax.vmap(optimizer.init)(params)
+
+            if self.verbose:
+                print(f"Fitting {len(fold_indices)} folds x {len(pairs)} regularisation pairs "
+                      f"in one batched JAX call...")
+
+            fit_start = time.perf_counter()
+            (coefs, intercepts), n_iters, converged = _multinomial_grid_train_loop_jit(
+                params,
+                opt_state,
+                X_j, Y_j, jnp.stack(sw_folds), jnp.stack(c_weights),
+                lam_smooth_j, lam_l2_j,
+                jnp.asarray(self.focal_gamma, dtype=jnp.float32),
+                jnp.asarray(self.learning_rate, dtype=jnp.float32),
+                jnp.asarray(self.grad_clip_norm, dtype=jnp.float32),
+                jnp.asarray(self.tol, dtype=jnp.float32),
+                max_iter=int(self.max_iter),
+                n_feats=int(self.n_features),
+                n_time=int(self.n_time_bins),
+                smoothness_derivative_order=int(self.smoothness_derivative_order),
+                check_offset=0 if self._use_lax_loop else 1,
+            )
+            coefs, intercepts = np.asarray(coefs), np.asarray(intercepts)
+            n_iters, converged = np.asarray(n_iters), np.asarray(converged)
+            fit_time = (time.perf_counter() - fit_start) / (len(fold_indices) * len(pairs))
+
+            for group_idx, fold_idx in enumerate(fold_indices):
+                fold_fits = []
+                for pair_idx, (lam_sm, lam_l2) in enumerate(pairs):
+                    model = clone(self).set_params(
+                        lambda_smooth=lam_sm, l2_reg=lam_l2, random_state=random_states[fold_idx],
+                    )
+                    fold_fits.append(model._store_fit(
+                        lb, coefs[group_idx, pair_idx], intercepts[group_idx, pair_idx],
+                        log_priors[group_idx], n_iters[group_idx, pair_idx],
+                        converged[group_idx, pair_idx], fit_time,
+                    ))
+                fits[fold_idx] = fold_fits
+        return fits
+
     def predict_proba(self, X: np.ndarray, balanced: bool = False) -> np.ndarray:
         """
         Compute probability estimates for each class.
@@ -37,6 +37,7 @@ os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 os.environ['GLOG_minloglevel'] = '2'
 os.environ['XLA_PYTHON_CLIENT_PREALLOCATE'] = 'false'
 
+import collections
 import jax
 import jax.numpy as jnp
 import json
@@ -46,13 +47,18 @@ import pathlib
 import pickle
 from datetime import datetime
 from functools import partial
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Tuple
 
 from .acoustic_manifold_geometry import (
     derive_cluster_centers_empirically,
     derive_cluster_geometry,
     usv_in_circle,
 )
+from .jax_compilation import (
+    compile_profile,
+    configure_compilation_cache,
+    start_compile_accounting,
+)
 from .manifold_metric import (
     pairwise_distance,
     signed_diff_jax,
@@ -60,6 +66,7 @@ from .manifold_metric import (
     sin_cos_encode_jax,
     angle_decode_jax,
 )
+from .modeling_input_store import load_modeling_input
 from .modeling_usv_manifold_position import (
     get_stratified_spatial_splits_stable as _manifold_spatial_splits,
 )
@@ -219,6 +226,126 @@ def apply_temporal_warping(x_seq: np.ndarray, warp_factors: np.ndarray) -> np.nd
     return warped_batch
 
 
+def apply_kinematic_masking_jax(x_seq: jax.Array, key: jax.Array, mask_prob: float,
+                                mask_length: int) -> jax.Array:
+    """
+    Device-side (traceable) counterpart of `apply_kinematic_masking`.
+
+    Draws the same two quantities per (sequence, feature channel) pair -- a
+    Bernoulli mask decision and a uniform start index in
+    `[0, max(1, Time_Bins - mask_length))` -- from the JAX PRNG `key` instead of
+    a NumPy generator, and zeroes the chunk with a broadcast comparison rather
+    than a Python loop, so it runs inside `jit` / `lax.scan`. The draws are a
+    function of `key` alone: the same key always blinds the same chunks.
+
+    Parameters
+    ----------
+    x_seq : jax.Array
+        A 3D array of shape (Batch, Features, Time_Bins) representing the kinematics.
+    key : jax.Array
+        JAX PRNG key for the mask decisions and start indices.
+    mask_prob : float
+        The probability (0.0 to 1.0) that any specific feature channel gets blinded.
+    mask_length : int
+        The duration (in frames) of the masked chunk.
+
+    Returns
+    -------
+    masked_batch : jax.Array
+        The augmented 3D tensor with random temporal chunks zeroed out.
+    """
+
+    batch_size, n_feats, n_bins = x_seq.shape
+    decision_key, start_key = jax.random.split(key)
+
+    mask_decisions = jax.random.uniform(decision_key, (batch_size, n_feats, 1)) < mask_prob
+    max_start = max(1, n_bins - mask_length)
+    start_idx = jax.random.randint(start_key, (batch_size, n_feats, 1), 0, max_start)
+
+    time_idx = jnp.arange(n_bins)[None, None, :]
+    in_chunk = (time_idx >= start_idx) & (time_idx < start_idx + mask_length)
+
+    return jnp.where(mask_decisions & in_chunk, jnp.zeros_like(x_seq), x_seq)
+
+
+def apply_temporal_warping_jax(x_seq: jax.Array, warp_factors: jax.Array) -> jax.Array:
+    """
+    Device-side (traceable) counterpart of `apply_temporal_warping`.
+
+    Same center-anchored warp and clipped linear interpolation, with the two
+    bracketing frames gathered by `jnp.take_along_axis`. The interpolation
+    weights are computed in the input dtype (float32 for the pipeline's
+    kinematics) rather than float64, so results agree with the NumPy version
+    to float32 rounding, not bit for bit.
+
+    Parameters
+    ----------
+    x_seq : jax.Array
+        A 3D array of shape (Batch, Features, Time_Bins).
+    warp_factors : jax.Array
+        A 1D array of shape (Batch, ) with each sequence's scaling factor.
+
+    Returns
+    -------
+    warped_batch : jax.Array
+        A 3D array of shape (Batch, Features, Time_Bins) containing the
+        temporally warped kinematics.
+    """
+
+    n_bins = x_seq.shape[2]
+    input_t = jnp.arange(n_bins, dtype=x_seq.dtype)
+    center = (n_bins - 1) / 2.0
+
+    t_query = center + (input_t[None, :] - center) * warp_factors[:, None].astype(x_seq.dtype)
+    t_query = jnp.clip(t_query, 0.0, n_bins - 1)
+
+    t0 = jnp.clip(jnp.floor(t_query).astype(jnp.int32), 0, n_bins - 1)
+    t1 = jnp.minimum(t0 + 1, n_bins - 1)
+    frac = (t_query - t0)[:, None, :]
+
+    x0 = jnp.take_along_axis(x_seq, jnp.broadcast_to(t0[:, None, :], x_seq.shape), axis=2)
+    x1 = jnp.take_along_axis(x_seq, jnp.broadcast_to(t1[:, None, :], x_seq.shape), axis=2)
+
+    return (x0 * (1.0 - frac) + x1 * frac).astype(x_seq.dtype)
+
+
+@partial(jax.jit, static_argnames=['hp'])
+def augment_batch_jax(x_seq: jax.Array, key: jax.Array, hp: Dict[str, Any]) -> jax.Array:
+    """
+    Jitted training-batch augmentation: temporal warping followed by (optional)
+    kinematic masking, both keyed by `key`.
+
+    The warp factors are drawn uniformly from `1 +/- hp['warp_range']` and the
+    masking is active when `hp['use_kinematic_masking']` is set, exactly as in
+    the host-side loop of `NeuralContinuousCNNRunner.run_cnn_training`; the two
+    steps consume independent halves of `key`.
+
+    Parameters
+    ----------
+    x_seq : jax.Array
+        A 3D batch of shape (Batch, Features, Time_Bins).
+    key : jax.Array
+        JAX PRNG key of this batch.
+    hp : dict
+        The (hashable) `cnn_continuous` hyperparameter dictionary.
+
+    Returns
+    -------
+    x_aug : jax.Array
+        The augmented batch, same shape and dtype as `x_seq`.
+    """
+
+    warp_key, mask_key = jax.random.split(key)
+    warp_range = hp['warp_range']
+    warps = jax.random.uniform(warp_key, (x_seq.shape[0],), minval=1.0 - warp_range, maxval=1.0 + warp_range)
+    x_aug = apply_temporal_warping_jax(x_seq, warps)
+
+    if hp['use_kinematic_masking']:
+        x_aug = apply_kinematic_masking_jax(x_aug, mask_key, hp['masking_prob'], hp['masking_length_frames'])
+
+    return x_aug
+
+
 def get_grid_balanced_indices(Y_vals: np.ndarray, grid_size: int = 25,
                               base_samples: int = 40, alpha: float = 0.5,
                               rng: np.random.Generator | None = None) -> np.ndarray:
@@ -826,6 +953,311 @@ def build_lr_schedule(peak_lr: float, total_epochs: int, steps_per_epoch: int, w
     return schedule
 
 
+def prefetch_to_device(batches: Iterable[Any], depth: int = 2) -> Iterator[Any]:
+    """
+    Double-buffered host-to-device batch iterator.
+
+    Keeps up to `depth` batches in flight: each batch (any pytree of NumPy
+    arrays) is handed to `jax.device_put` as soon as the previous one is yielded,
+    so its transfer overlaps the (asynchronously dispatched) training step that
+    consumes the batch before it. `depth=1` degenerates to a plain transfer per
+    batch.
+
+    Parameters
+    ----------
+    batches : iterable
+        Host-side batches, in consumption order.
+    depth : int, default 2
+        Number of batches resident on the device ahead of the consumer.
+
+    Yields
+    ------
+    batch
+        The next batch, already on the default device.
+    """
+
+    queue = collections.deque()
+    for batch in batches:
+        queue.append(jax.device_put(batch))
+        if len(queue) >= max(1, depth):
+            yield queue.popleft()
+    while queue:
+        yield queue.popleft()
+
+
+def make_device_train_step(compute_grads: Callable, optimizer: optax.GradientTransformation,
+                           hp: Dict[str, Any]) -> Callable:
+    """
+    Builds one optimiser step with the batch augmentation on the device.
+
+    The returned `train_step(carry, x_raw, y_batch, aug_key, y_center, y_scale)`
+    augments the raw batch with `augment_batch_jax`, runs `compute_grads` and
+    applies the `optimizer` update; `carry` is `(params, state, opt_state,
+    dropout_key)`. It is a plain traceable function: jit it for the per-batch
+    (prefetching) loop, or pass it to `make_scan_epoch`.
+
+    Parameters
+    ----------
+    compute_grads : callable
+        `compute_grads(params, state, x, y, dropout_key, y_center, y_scale)`
+        returning `(grads, new_state, new_dropout_key)`.
+    optimizer : optax.GradientTransformation
+        The fold's optimiser.
+    hp : dict
+        The (hashable) `cnn_continuous` hyperparameter dictionary.
+
+    Returns
+    -------
+    train_step : callable
+        The step function, returning the updated carry.
+    """
+
+    def train_step(carry, x_raw, y_batch, aug_key, y_center, y_scale):
+        params, state, opt_state, dropout_key = carry
+        x_batch = augment_batch_jax(x_raw, aug_key, hp)
+        grads, state, dropout_key = compute_grads(params, state, x_batch, y_batch, dropout_key, y_center, y_scale)
+        updates, opt_state = optimizer.update(grads, opt_state, params)
+        params = optax.apply_updates(params, updates)
+        return params, state, opt_state, dropout_key
+
+    return train_step
+
+
+def make_scan_epoch(train_step: Callable) -> Callable:
+    """
+    Builds a jitted full-epoch trainer that runs `train_step` under `lax.scan`.
+
+    The returned `scan_epoch(carry, X_dev, Y_dev, batch_idx, epoch_key, y_center,
+    y_scale)` gathers every batch from the device-resident training arrays by
+    the `(n_steps, batch_size)` index matrix, so a whole epoch is a single
+    dispatch with no host round-trip. Batch `b` is augmented with
+    `jax.random.fold_in(epoch_key, b)` -- the same key the per-batch loop uses
+    -- so both paths draw identical augmentations.
+
+    Parameters
+    ----------
+    train_step : callable
+        A step built by `make_device_train_step`.
+
+    Returns
+    -------
+    scan_epoch : callable
+        The jitted epoch function, returning the carry after the last step.
+    """
+
+    @jax.jit
+    def scan_epoch(carry, X_dev, Y_dev, batch_idx, epoch_key, y_center, y_scale):
+        step_keys = jax.vmap(partial(jax.random.fold_in, epoch_key))(jnp.arange(batch_idx.shape[0]))
+
+        def body(step_carry, step_inputs):
+            idx, aug_key = step_inputs
+            return train_step(step_carry, X_dev[idx], Y_dev[idx], aug_key, y_center, y_scale), None
+
+        carry, _ = jax.lax.scan(body, carry, (batch_idx, step_keys))
+        return carry
+
+    return scan_epoch
+
+
+def _jaxpr_intermediate_bytes(jaxpr) -> int:
+    # Bytes of every equation output of `jaxpr`, including those of the jaxprs
+    # nested in its equations (jit, scan, cond branches, custom derivatives).
+    n_bytes = 0
+    for eqn in jaxpr.eqns:
+        n_bytes += sum(int(np.prod(var.aval.shape)) * var.aval.dtype.itemsize
+                       for var in eqn.outvars if hasattr(var.aval, 'shape'))
+        for param in eqn.params.values():
+            for sub in (param if isinstance(param, (tuple, list)) else (param,)):
+                inner = getattr(sub, 'jaxpr', sub)
+                if hasattr(inner, 'eqns'):
+                    n_bytes += _jaxpr_intermediate_bytes(inner)
+    return n_bytes
+
+
+class PermutationImportanceEngine:
+    """
+    Vectorized permutation-importance scorer for one trained CNN.
+
+    Scores the manifold-distance error of the model on copies of the test
+    tensor in which one feature channel is shuffled across trials. Instead of
+    building each permuted copy on the host and running the padded
+    mini-batch evaluation once per (feature, permutation) pair, the engine
+    keeps the (once-padded) test tensor on the device, builds a whole chunk of
+    permuted copies there -- any mix of features -- and evaluates them with
+    `vmap` over the permutation axis and `lax.map` over the mini-batches in a
+    single jitted call. The chunk size is set by `memory_budget_gb`: each
+    permutation of a chunk holds two test-tensor copies plus the CNN
+    activations of one mini-batch. A budget of `0` (the default) evaluates the
+    permutations one at a time exactly as the original loop did.
+
+    The permutations are drawn from the caller's generator one chunk at a
+    time, in job order, so the draws (and the state the generator is left
+    in) do not depend on the chunking. The vectorized errors agree with the
+    per-permutation evaluation only to float32 rounding: XLA tiles the
+    convolutions by batch size, so the last bits of a prediction can differ
+    between batch shapes.
+    """
+
+    def __init__(self, params: Dict[str, jax.Array], state: Dict[str, jax.Array],
+                 X: np.ndarray, Y_true: np.ndarray, y_center: jax.Array, y_scale: jax.Array,
+                 hp: Dict[str, Any], memory_budget_gb: float = 0.0) -> None:
+        """
+        Initializes the PermutationImportanceEngine class.
+
+        Parameters
+        ----------
+        params : dict
+            Trainable weights of the scored model.
+        state : dict
+            BN moving averages of the scored model.
+        X : np.ndarray
+            Test tensor of shape (Batch, Features, Time_Bins).
+        Y_true : np.ndarray
+            True manifold coordinates of shape (Batch, 2).
+        y_center : jax.Array
+            The model's prediction-box center.
+        y_scale : jax.Array
+            The model's prediction-box half-width.
+        hp : dict
+            The (hashable) `cnn_continuous` hyperparameter dictionary, carrying
+            the promoted `manifold_metric` / `manifold_period`.
+        memory_budget_gb : float, default 0.0
+            Device memory allowed for one chunk (permuted copies and forward
+            activations); `0` scores the permutations sequentially.
+        """
+
+        self.params, self.state = params, state
+        self.y_center, self.y_scale = y_center, y_scale
+        self.hp = hp
+        self.metric = hp['manifold_metric']
+        self.period = hp['manifold_period']
+        self.batch_size = int(hp['batch_size'])
+
+        self.X = np.asarray(X)
+        self.Y_true = np.asarray(Y_true)
+        self.n_samples = self.X.shape[0]
+        self.n_padded = -(-self.n_samples // self.batch_size) * self.batch_size
+
+        self.bytes_per_permutation, self.chunk_size = 0, 0
+        if memory_budget_gb > 0:
+            self.bytes_per_permutation = 2 * self.n_padded * self.X[0].nbytes + self._batch_activation_bytes()
+            self.chunk_size = int(float(memory_budget_gb) * 2 ** 30 // self.bytes_per_permutation)
+
+        self._X_dev, self._Y_dev, self._chunk_errors = None, None, None
+        if self.chunk_size > 0:
+            pad_width = ((0, self.n_padded - self.n_samples), (0, 0), (0, 0))
+            self._X_dev = jnp.asarray(np.pad(self.X, pad_width, mode='constant'))
+            self._Y_dev = jnp.asarray(self.Y_true)
+            self._chunk_errors = jax.jit(self._vectorized_errors)
+
+    def errors(self, feature_indices: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """
+        Model error with feature `feature_indices[j]` shuffled by a trial
+        permutation drawn from `rng`, for every job `j`. The permutations are
+        drawn in job order, one chunk at a time, so only one chunk of them is
+        held on the host.
+
+        Parameters
+        ----------
+        feature_indices : np.ndarray
+            Shape (n_jobs, ) feature-channel index per job.
+        rng : np.random.Generator
+            Generator drawing one `rng.permutation(Batch)` per job.
+
+        Returns
+        -------
+        errors : np.ndarray
+            Shape (n_jobs, ) float32 mean manifold distance between the true
+            coordinates and the predictions on each permuted copy.
+        """
+
+        feature_indices = np.asarray(feature_indices, dtype=np.int32)
+        n_jobs = len(feature_indices)
+
+        if self.chunk_size == 0:
+            return np.array([self._sequential_error(f_idx, rng.permutation(self.n_samples))
+                             for f_idx in feature_indices], dtype=np.float32)
+
+        # Padding rows keep their own positions, so they never enter a real row.
+        tail = np.arange(self.n_samples, self.n_padded)
+
+        chunk_size = min(self.chunk_size, n_jobs)
+        errors = []
+        for start in range(0, n_jobs, chunk_size):
+            chunk_f = feature_indices[start:start + chunk_size]
+            n_real = len(chunk_f)
+            chunk_p = np.array([np.concatenate([rng.permutation(self.n_samples), tail]) for _ in range(n_real)],
+                               dtype=np.int32)
+            # Pad the last chunk with repeats of its first job so every call
+            # reuses the one compiled chunk shape.
+            if n_real < chunk_size:
+                chunk_f = np.concatenate([chunk_f, np.repeat(chunk_f[:1], chunk_size - n_real)])
+                chunk_p = np.concatenate([chunk_p, np.repeat(chunk_p[:1], chunk_size - n_real, axis=0)])
+            chunk_err = self._chunk_errors(self.params, self.state, self.y_center, self.y_scale,
+                                           self._X_dev, self._Y_dev,
+                                           jnp.asarray(chunk_f), jnp.asarray(chunk_p))
+            errors.append(chunk_err[:n_real])
+        return np.asarray(jnp.concatenate(errors))
+
+    def _batch_activation_bytes(self) -> int:
+        # Every intermediate of one mini-batch forward pass, traced abstractly;
+        # counting them all as live over-estimates what XLA keeps, which errs
+        # on the safe side of the budget.
+        batch_spec = jax.ShapeDtypeStruct((self.batch_size, *self.X.shape[1:]), jnp.float32)
+        forward = jax.make_jaxpr(lambda batch_x: cnn_forward(self.params, self.state, batch_x, self.y_center,
+                                                             self.y_scale, self.hp, rng_key=None,
+                                                             is_training=False)[0])
+        return _jaxpr_intermediate_bytes(forward(batch_spec).jaxpr)
+
+    def _decode(self, preds_raw: jax.Array) -> jax.Array:
+        if _use_sin_cos_torus_output(self.hp):
+            return angle_decode_jax(preds_raw, jnp.asarray(self.period))
+        return preds_raw
+
+    def _mean_distance(self, Y_true: jax.Array, Y_pred: jax.Array) -> jax.Array:
+        return jnp.mean(jnp.sqrt(jnp.sum(signed_diff_jax(
+            Y_true, Y_pred, metric=self.metric, period=self.period,
+        ) ** 2, axis=-1)))
+
+    def _sequential_error(self, f_idx: int, perm: np.ndarray) -> float:
+        # The original per-permutation path: a host copy with one channel
+        # shuffled, then the padded mini-batch evaluation of `evaluate_batched`.
+        X_perm = self.X.copy()
+        X_perm[:, f_idx, :] = X_perm[perm, f_idx, :]
+        x_s = jnp.array(X_perm)
+
+        preds = []
+        for i in range(0, len(x_s), self.batch_size):
+            batch_x = x_s[i:i + self.batch_size]
+            actual_size = len(batch_x)
+            if actual_size < self.batch_size:
+                batch_x = jnp.pad(batch_x, ((0, self.batch_size - actual_size), (0, 0), (0, 0)), mode='constant')
+            pred_batch, _ = cnn_forward(self.params, self.state, batch_x, self.y_center, self.y_scale, self.hp,
+                                        rng_key=None, is_training=False)
+            preds.append(pred_batch[:actual_size])
+
+        Y_pred = self._decode(jnp.concatenate(preds, axis=0))
+        return float(self._mean_distance(jnp.array(self.Y_true), Y_pred))
+
+    def _vectorized_errors(self, params, state, y_center, y_scale, X_dev, Y_true, feature_indices, permutations):
+        n_feats, n_bins = X_dev.shape[1], X_dev.shape[2]
+        n_batches = self.n_padded // self.batch_size
+        channel_ids = jnp.arange(n_feats)[None, :, None]
+
+        def predict_batch(batch_x):
+            preds, _ = cnn_forward(params, state, batch_x, y_center, y_scale, self.hp,
+                                   rng_key=None, is_training=False)
+            return preds
+
+        def permuted_error(f_idx, perm):
+            X_perm = jnp.where(channel_ids == f_idx, X_dev[perm], X_dev)
+            preds_raw = jax.lax.map(predict_batch, X_perm.reshape(n_batches, self.batch_size, n_feats, n_bins))
+            Y_pred = self._decode(preds_raw.reshape(self.n_padded, -1)[:self.n_samples])
+            return self._mean_distance(Y_true, Y_pred)
+
+        return jax.vmap(permuted_error)(feature_indices, permutations)
+
+
 # PHASE 4: THE TRAINING ENGINE
 
 class NeuralContinuousCNNRunner:
@@ -879,6 +1311,11 @@ class NeuralContinuousCNNRunner:
         self.split_strategy = self.modeling_settings['model_validation']['split_strategy']
         self.random_seed = self.modeling_settings['model_validation']['random_seed']
 
+        # Persistent XLA cache: the forward / gradient executables are keyed on
+        # the fixed batch shape, so every array task after the first loads
+        # them from disk instead of recompiling.
+        configure_compilation_cache(self.modeling_settings)
+
         # Manifold-metric configuration. Threaded through the spatial
         # splitter, the training loss / RMSE evaluations, and the
         # region-saliency centroid distance — so a settings flip from
@@ -908,6 +1345,10 @@ class NeuralContinuousCNNRunner:
         # (the default) trains every fold as usual.
         self.restrict_to_fold_indices: list[int] | None = None
 
+        # Jitted per-objective saliency gradient functions, built on first use
+        # by `_input_gradients` and shared by every cluster centroid.
+        self._saliency_grad_fns = {}
+
     def get_stratified_spatial_splits_stable(self, groups: np.ndarray,
                                              Y: np.ndarray,
                                              split_strategy: str = 'session',
@@ -999,8 +1440,7 @@ class NeuralContinuousCNNRunner:
             - 'num_bins': The finalized length of the temporal dimension after binning.
         """
         print(f"Loading and fusing multivariate data from: {pkl_path}")
-        with open(pkl_path, 'rb') as f:
-            raw_data = pickle.load(f)
+        raw_data = load_modeling_input(pkl_path)
 
         # Strip top-level metadata keys (e.g. `_input_metadata`,
         # `_run_metadata`); only feature dicts are session-keyed and carry
@@ -1070,6 +1510,84 @@ class NeuralContinuousCNNRunner:
             block['category'] = np.concatenate(cat_list)
         return block
 
+    def _input_gradients(self, objective: str, params: Dict[str, jax.Array], state: Dict[str, jax.Array],
+                         X_te: jax.Array, Y_center: jax.Array, Y_scale: jax.Array,
+                         target: jax.Array) -> np.ndarray:
+        """
+        Description
+        -----------
+        Per-trial input gradients of a saliency objective, for the whole test tensor.
+
+        `'region'` is the negative wrap-aware Euclidean distance from the (decoded)
+        prediction to `target` (a cluster centroid); `'global'` is the wrap-aware L1
+        distance from `target` (the origin). The tensor is padded once to a whole
+        number of `batch_size` mini-batches and the batches run under `lax.map` in a
+        single jitted call, so memory use stays at one mini-batch of backward passes
+        while the padding, the per-batch dispatch and the host-side concatenation
+        happen once per call instead of once per batch. `target` is a traced argument,
+        so every cluster centroid reuses the executable compiled for the first. The
+        gradients agree with the former per-batch loop to float32 rounding.
+
+        Parameters
+        ----------
+        objective : str
+            `'region'` or `'global'`.
+        params : Dict[str, jax.Array]
+            Trainable network weights.
+        state : Dict[str, jax.Array]
+            Non-trainable network states (BN moving means and variances).
+        X_te : jax.Array
+            The 3D temporal input tensor, shape (Batch, Features, Time_Bins).
+        Y_center : jax.Array
+            The 2D spatial center of the training manifold.
+        Y_scale : jax.Array
+            The 2D spatial half-width of the training manifold.
+        target : jax.Array
+            The 2-D point the objective is measured from.
+
+        Returns
+        -------
+        np.ndarray
+            Gradients of shape (Batch, Features, Time_Bins).
+        """
+
+        if objective not in self._saliency_grad_fns:
+            # On the torus `'sin_cos'` head the raw 4-D `(sin, cos)` output is folded
+            # back to a 2-D angle (`atan2`, smooth and differentiable) so the objective
+            # keeps its euclidean / `'raw'`-head geometric meaning.
+            torus_sin_cos = _use_sin_cos_torus_output(self.hp)
+            period_jax = jnp.asarray(self.manifold_period)
+
+            def scalar_fn(x_single, p, s, y_center, y_scale, point):
+                preds_raw, _ = cnn_forward(p, s, x_single[jnp.newaxis, ...],
+                                           y_center, y_scale, self.hp, is_training=False)
+                preds = angle_decode_jax(preds_raw, period_jax) if torus_sin_cos else preds_raw
+                diff = signed_diff_jax(
+                    preds[0], point,
+                    metric=self.manifold_metric, period=self.manifold_period,
+                )
+                if objective == 'region':
+                    return -jnp.sqrt(jnp.sum(diff ** 2))
+                return jnp.sum(jnp.abs(diff))
+
+            batch_grads = jax.vmap(jax.grad(scalar_fn), in_axes=(0, None, None, None, None, None))
+
+            @jax.jit
+            def blocked_grads(p, s, x_blocks, y_center, y_scale, point):
+                return jax.lax.map(lambda x_batch: batch_grads(x_batch, p, s, y_center, y_scale, point), x_blocks)
+
+            self._saliency_grad_fns[objective] = blocked_grads
+
+        batch_size = self.hp['batch_size']
+        n_samples, n_feats, n_bins = X_te.shape
+        n_padded = -(-n_samples // batch_size) * batch_size
+        x_blocks = jnp.pad(jnp.asarray(X_te), ((0, n_padded - n_samples), (0, 0), (0, 0)), mode='constant')
+        grads = self._saliency_grad_fns[objective](
+            params, state, x_blocks.reshape(n_padded // batch_size, batch_size, n_feats, n_bins),
+            Y_center, Y_scale, target,
+        )
+        return np.asarray(grads).reshape(n_padded, n_feats, n_bins)[:n_samples]
+
     def _compute_global_saliency_template(self, params: Dict[str, jax.Array], state: Dict[str, jax.Array],
                                           X_te: jax.Array, Y_center: jax.Array, Y_scale: jax.Array) -> np.ndarray:
         """
@@ -1082,9 +1600,8 @@ class NeuralContinuousCNNRunner:
         origin -- it never references any cluster centroid -- so the trial-averaged
         Input x Gradient template it produces is identical for every cluster. Factoring
         it out lets the per-cluster saliency loop compute it once instead of re-running
-        a full-batch backward pass per cluster (K redundant passes -> 1). The body is
-        the exact global path previously inlined in compute_centroid_saliency, so the
-        returned template is byte-identical.
+        a full-batch backward pass per cluster (K redundant passes -> 1). The gradients
+        come from the shared `_input_gradients` path.
 
         Parameters
         ----------
@@ -1106,52 +1623,7 @@ class NeuralContinuousCNNRunner:
             i.e. ``mean(X_te * |grad_glob|, axis=0)``.
         """
 
-        torus_sin_cos = _use_sin_cos_torus_output(self.hp)
-
-        def _decode(preds_raw):
-            if torus_sin_cos:
-                return angle_decode_jax(preds_raw, jnp.asarray(self.manifold_period))
-            return preds_raw
-
-        # L1 "distance from origin" baseline (wrap-aware on torus); the origin is the
-        # 2-D zero vector, matching jnp.zeros_like(polygon_centroid_jax) in the
-        # original inlined path.
-        origin_jax = jnp.zeros(2)
-
-        def glob_scalar_fn(x_single):
-            preds_raw, _ = cnn_forward(params, state, x_single[jnp.newaxis, ...],
-                                       Y_center, Y_scale, self.hp, is_training=False)
-            preds = _decode(preds_raw)
-
-            diff_origin = signed_diff_jax(
-                preds[0], origin_jax,
-                metric=self.manifold_metric, period=self.manifold_period,
-            )
-            return jnp.sum(jnp.abs(diff_origin))
-
-        compute_glob_grad = jax.grad(glob_scalar_fn)
-
-        @jax.jit
-        def get_batched_glob_grads(x_batch):
-            return jax.vmap(compute_glob_grad)(x_batch)
-
-        batch_size = self.hp['batch_size']
-        n_samples = len(X_te)
-        glob_grads_list = []
-
-        for i in range(0, n_samples, batch_size):
-            batch_x = X_te[i:i + batch_size]
-            actual_size = len(batch_x)
-
-            # JAX requires strict static shapes. Pad the final remainder batch.
-            if actual_size < batch_size:
-                pad_width = ((0, batch_size - actual_size), (0, 0), (0, 0))
-                batch_x = jnp.pad(batch_x, pad_width, mode='constant')
-
-            batch_g_grad = get_batched_glob_grads(batch_x)
-            glob_grads_list.append(np.array(batch_g_grad[:actual_size]))
-
-        glob_grads = np.concatenate(glob_grads_list, axis=0)
+        glob_grads = self._input_gradients('global', params, state, X_te, Y_center, Y_scale, jnp.zeros(2))
         X_te_np = np.array(X_te)
         glob_saliency = X_te_np * np.abs(glob_grads)
         return np.mean(glob_saliency, axis=0)
@@ -1228,83 +1700,12 @@ class NeuralContinuousCNNRunner:
 
         print(f"   > Extracting drivers for centroid {polygon_centroid}...")
 
-        # 1. Define the differentiable region objective. The negative
-        #    distance is the wrap-aware Euclidean norm of the signed
-        #    diff between the prediction and the polygon centroid; on
-        #    `metric='euclidean'` this reduces to the original
-        #    flat-space distance, on torus the diff folds into the
-        #    shortest-path representation before squaring.
-        polygon_centroid_jax = jnp.asarray(polygon_centroid)
-
-        # On the torus `'sin_cos'` head `cnn_forward` returns a raw 4-D
-        # `(sin, cos)` vector per axis; the saliency objectives below
-        # need to operate on the 2-D angle representation so the
-        # wrap-aware distance to the polygon centroid keeps the same
-        # geometric meaning it had on euclidean / the legacy `'raw'`
-        # head. The `_decode` closure folds the raw output back to a
-        # 2-D angle via `atan2`. `atan2` is smooth and JAX-
-        # differentiable, so the gradient flows back through the
-        # decoding step into the network parameters; saliency for the
-        # `sin_cos` head is therefore the gradient of "angle distance
-        # to centroid" w.r.t. the input, exactly what the euclidean /
-        # raw heads already compute.
-        torus_sin_cos = _use_sin_cos_torus_output(self.hp)
-
-        def _decode(preds_raw):
-            if torus_sin_cos:
-                # Build the period array only on the torus `sin_cos` path; on
-                # euclidean / legacy `'raw'` runs the decode is the identity and
-                # the period is never consulted.
-                return angle_decode_jax(preds_raw, jnp.asarray(self.manifold_period))
-            return preds_raw
-
-        def region_scalar_fn(x_single):
-            preds_raw, _ = cnn_forward(params, state, x_single[jnp.newaxis, ...],
-                                       Y_center, Y_scale, self.hp, is_training=False)
-            preds = _decode(preds_raw)
-
-            diff = signed_diff_jax(
-                preds[0], polygon_centroid_jax,
-                metric=self.manifold_metric, period=self.manifold_period,
-            )
-            dist_to_centroid = jnp.sqrt(jnp.sum(diff ** 2))
-            return -dist_to_centroid
-
-        # The global ("postural baseline") saliency template is cluster-invariant
-        # (its objective is the L1 distance from the origin, not from this centroid),
-        # so it is computed once by `_compute_global_saliency_template` and passed in
-        # via `global_template` instead of being recomputed here for every cluster.
-
-        # 2. Transform the region scalar into its gradient function.
-        compute_region_grad = jax.grad(region_scalar_fn)
-
-        # 3. JIT compile the vectorized region-gradient function for fast batched execution
-        @jax.jit
-        def get_batched_grads(x_batch):
-            return jax.vmap(compute_region_grad)(x_batch)
-
-        # 4. Execute in memory-safe mini-batches
-        batch_size = self.hp['batch_size']
-        n_samples = len(X_te)
-
-        region_grads_list = []
-
-        for i in range(0, n_samples, batch_size):
-            batch_x = X_te[i:i + batch_size]
-            actual_size = len(batch_x)
-
-            # JAX requires strict static shapes. Pad the final remainder batch.
-            if actual_size < batch_size:
-                pad_width = ((0, batch_size - actual_size), (0, 0), (0, 0))
-                batch_x = jnp.pad(batch_x, pad_width, mode='constant')
-
-            batch_r_grad = get_batched_grads(batch_x)
-
-            # Truncate any padding and pull directly to CPU RAM as NumPy arrays
-            region_grads_list.append(np.array(batch_r_grad[:actual_size]))
-
-        # Reconstruct the full dataset gradients on the CPU
-        region_grads = np.concatenate(region_grads_list, axis=0)
+        # 1.-4. Per-trial input gradients of the region objective (the negative
+        #    wrap-aware distance to the centroid) in memory-safe mini-batches; see
+        #    `_input_gradients`. The cluster-invariant global template is computed
+        #    once by `_compute_global_saliency_template` and passed in.
+        region_grads = self._input_gradients('region', params, state, X_te, Y_center, Y_scale,
+                                             jnp.asarray(polygon_centroid))
 
         # 5. Input * Gradient Saliency (Computed on CPU to save VRAM)
         X_te_np = np.array(X_te)
@@ -1339,6 +1740,7 @@ class NeuralContinuousCNNRunner:
         print("=" * 75)
         print(" EXECUTING 1D-CNN TRAINING PIPELINE (RESIDUAL & PURE JAX)")
         print("=" * 75)
+        start_compile_accounting()
 
         # The per-fold training loop tracks `best_params` across epochs,
         # starting at `None` and only assigning inside the epoch loop. With
@@ -1447,6 +1849,8 @@ class NeuralContinuousCNNRunner:
         batch_size = self.hp['batch_size']
         warp_range = self.hp['warp_range']
         perm_iters = self.hp['permutation_iterations']
+        input_pipeline = self.hp['input_pipeline']
+        device_augmentation = input_pipeline['device_augmentation']
 
         # Fold the DEVELOPMENT sessions only, then remap the dev-relative indices
         # the splitter returns back into full-array index space via
@@ -1684,7 +2088,11 @@ class NeuralContinuousCNNRunner:
         # the training loop (batch sampling, warping, masking, permutation test).
         # This replaces the previous mix of a local RandomState and unseeded global
         # `np.random` calls, so fold / epoch-level randomness is fully reproducible
-        # from `self.random_seed`.
+        # from `self.random_seed`. With `input_pipeline.device_augmentation` the
+        # generator only draws the batch indices; warping and masking are keyed by a
+        # JAX PRNG key derived from `self.random_seed`, the fold and the epoch (see
+        # the epoch loop), which is just as reproducible but a different stream, so
+        # the two settings do not produce identical weights.
         rng = np.random.default_rng(self.random_seed)
 
         # We only persist the heavy parameters for the actual strategy
@@ -1730,6 +2138,14 @@ class NeuralContinuousCNNRunner:
 
             fold_results = {'fold_idx': fold, 'test_indices': test_idx, 'Y_true': Y_te}
 
+            # Device-resident training kinematics for the `lax.scan` epoch path,
+            # shared by the 'null' and 'actual' strategies. A fold larger than
+            # `scan_max_memory_gb` stays on the host and streams through the
+            # double-buffered prefetcher instead.
+            X_tr_dev = None
+            if device_augmentation and X_tr.nbytes <= input_pipeline['scan_max_memory_gb'] * 2 ** 30:
+                X_tr_dev = jnp.asarray(X_tr)
+
             for strategy in strategies:
                 Y_tr = Y_tr_base.copy()
 
@@ -1822,6 +2238,21 @@ class NeuralContinuousCNNRunner:
                     p_new = optax.apply_updates(p, updates)
                     return p_new, o_state_new
 
+                if device_augmentation:
+                    # Built per fold / strategy because they close over the fold's
+                    # `optimizer`; the conv forward / backward inside is the shared
+                    # `_compute_grads` trace.
+                    device_train_step = make_device_train_step(_compute_grads, optimizer, self.hp)
+                    if X_tr_dev is not None:
+                        scan_epoch = make_scan_epoch(device_train_step)
+                        Y_tr_dev = jnp.asarray(Y_tr)
+                    else:
+                        device_train_step = jax.jit(device_train_step)
+                    # Augmentation keys: one per epoch (`fold_in(aug_rng, epoch)`),
+                    # then one per batch (`fold_in(epoch_key, b)`), independent of the
+                    # dropout stream seeded from the same value.
+                    aug_rng = jax.random.fold_in(jax.random.PRNGKey(self.random_seed + fold), 1)
+
                 best_err = float('inf')
                 best_params, best_state = None, None
                 patience_counter = 0
@@ -1843,28 +2274,51 @@ class NeuralContinuousCNNRunner:
                         b_idx = get_grid_balanced_indices(Y_tr, self.hp['grid_size'], self.hp['samples_per_cell'], rng=rng)
                         rng.shuffle(b_idx)
 
-                    for b in range(len(b_idx) // self.hp['batch_size']):
-                        idx = b_idx[b * self.hp['batch_size']:(b + 1) * self.hp['batch_size']]
-
-                        # 1. Temporal Warping
-                        warps = rng.uniform(1.0 - warp_range, 1.0 + warp_range, len(idx))
-                        X_batch = apply_temporal_warping(X_tr[idx], warps)
-
-                        # 2. Kinematic Masking (1D Cutout: randomly blind feature channels)
-                        if self.hp['use_kinematic_masking']:
-                            X_batch = apply_kinematic_masking(
-                                X_batch,
-                                mask_prob=self.hp['masking_prob'],
-                                mask_length=self.hp['masking_length_frames'],
-                                rng=rng
+                    if device_augmentation:
+                        n_steps = len(b_idx) // batch_size
+                        batch_idx = b_idx[:n_steps * batch_size].reshape(n_steps, batch_size)
+                        epoch_key = jax.random.fold_in(aug_rng, epoch)
+                        carry = (params, state, opt_state, dropout_rng)
+
+                        if X_tr_dev is not None:
+                            # Whole epoch as one `lax.scan` dispatch over the
+                            # device-resident fold.
+                            carry = scan_epoch(carry, X_tr_dev, Y_tr_dev, jnp.asarray(batch_idx),
+                                               epoch_key, Y_center, Y_scale)
+                        else:
+                            # Host gather of the raw rows, transferred ahead of the
+                            # step that consumes them; augmentation runs on the device.
+                            host_batches = (
+                                (X_tr[idx], Y_tr[idx], jax.random.fold_in(epoch_key, b))
+                                for b, idx in enumerate(batch_idx)
                             )
+                            for x_raw, y_batch, aug_key in prefetch_to_device(host_batches, input_pipeline['prefetch_depth']):
+                                carry = device_train_step(carry, x_raw, y_batch, aug_key, Y_center, Y_scale)
 
-                        # 3. Forward / backward (once-compiled) then optimiser step
-                        grads, state, dropout_rng = _compute_grads(
-                            params, state, jnp.array(X_batch), jnp.array(Y_tr[idx]), dropout_rng,
-                            Y_center, Y_scale
-                        )
-                        params, opt_state = _apply_update(params, opt_state, grads)
+                        params, state, opt_state, dropout_rng = carry
+                    else:
+                        for b in range(len(b_idx) // self.hp['batch_size']):
+                            idx = b_idx[b * self.hp['batch_size']:(b + 1) * self.hp['batch_size']]
+
+                            # 1. Temporal Warping
+                            warps = rng.uniform(1.0 - warp_range, 1.0 + warp_range, len(idx))
+                            X_batch = apply_temporal_warping(X_tr[idx], warps)
+
+                            # 2. Kinematic Masking (1D Cutout: randomly blind feature channels)
+                            if self.hp['use_kinematic_masking']:
+                                X_batch = apply_kinematic_masking(
+                                    X_batch,
+                                    mask_prob=self.hp['masking_prob'],
+                                    mask_length=self.hp['masking_length_frames'],
+                                    rng=rng
+                                )
+
+                            # 3. Forward / backward (once-compiled) then optimiser step
+                            grads, state, dropout_rng = _compute_grads(
+                                params, state, jnp.array(X_batch), jnp.array(Y_tr[idx]), dropout_rng,
+                                Y_center, Y_scale
+                            )
+                            params, opt_state = _apply_update(params, opt_state, grads)
 
                     if epoch % 5 == 0:
                         Y_pred_te = evaluate_batched(params, state, jnp.array(X_te), Y_center, Y_scale)
@@ -1990,23 +2444,19 @@ class NeuralContinuousCNNRunner:
         feature_snrs = {}
         significant_features = []
 
-        for f_idx, feat_name in enumerate(features):
-            feat_scores = []
-            for k in range(perm_iters):
-                X_perm = X_te_base.copy()
-                perm_idx = rng.permutation(len(Y_te_final))
-
-                # Decouple the specific feature across the trial dimension
-                X_perm[:, f_idx, :] = X_perm[perm_idx, f_idx, :]
-
-                Y_pred_perm = evaluate_batched(best_params, best_state, jnp.array(X_perm), best_Y_center, best_Y_scale)
-                err_perm = float(jnp.mean(jnp.sqrt(jnp.sum(signed_diff_jax(
-                    jnp.array(Y_te_final), Y_pred_perm,
-                    metric=self.manifold_metric, period=self.manifold_period,
-                ) ** 2, axis=-1))))
+        # Every (feature, iteration) permutation is drawn from the same generator,
+        # in the same feature-major order as the original per-permutation loop,
+        # and scored in device-side chunks; each permutation decouples one
+        # feature across the trial dimension.
+        perm_features = np.repeat(np.arange(len(features)), perm_iters)
+        importance_engine = PermutationImportanceEngine(
+            best_params, best_state, X_te_base, Y_te_final, best_Y_center, best_Y_scale, self.hp,
+            memory_budget_gb=self.hp['permutation_importance']['memory_budget_gb'],
+        )
+        perm_errors = importance_engine.errors(perm_features, rng).reshape(len(features), perm_iters)
 
-                delta_e = err_perm - base_err
-                feat_scores.append(delta_e)
+        for f_idx, feat_name in enumerate(features):
+            feat_scores = [float(err_perm) - base_err for err_perm in perm_errors[f_idx]]
 
             mu, sigma = np.mean(feat_scores), np.std(feat_scores)
 
@@ -2176,6 +2626,7 @@ class NeuralContinuousCNNRunner:
                 }
 
         # SERIALIZATION
+        deep_storage['metadata']['jax_compile_profile'] = compile_profile()
         print("\nConverting JAX device arrays to NumPy and saving Deep Storage...")
         numpy_storage = jax.device_get(deep_storage)
 
@@ -4,7 +4,7 @@ Module for loading raw data and orchestrating the data preparation pipeline for
 and regression analysis.
 
 Key Capabilities:
-1.  Data ingestion: Loading 3D behavioral features (CSV), track metadata (H5),
+1.  Data ingestion: Loading 3D behavioral features (Parquet / CSV), track metadata (H5),
     and USV summaries.
 2.  Epoch sampling: Identifying USV and No-USV event times using dynamic mixture-model
     clustering (bout mode), individual syllable onsets, or state-based sampling.
@@ -21,16 +21,23 @@ Key Capabilities:
 import h5py
 import numpy as np
 from pathlib import Path
-import pickle
 import polars as pls
 from astropy.convolution import convolve
 from astropy.convolution import Gaussian1DKernel
 
+from ..analyses.behavioral_feature_table import find_behavioral_feature_table, load_behavioral_feature_sessions
+from .modeling_input_store import load_modeling_input
+
 
 def load_behavioral_feature_data(behavior_file_paths: list = None,
-                                 csv_sep: str = ',') -> tuple:
+                                 csv_sep: str = ',',
+                                 columns: list = None) -> tuple:
     """
-    Loads behavior data from a 3D behavioral features .csv file.
+    Loads behavior data from the 3D behavioral features tables of many sessions.
+
+    Each session's `*_behavioral_features.parquet` is preferred over its .csv;
+    the Parquet tables of all sessions are read as one multi-file scan (see
+    `load_behavioral_feature_sessions`).
 
     Parameters
     ----------
@@ -38,6 +45,8 @@ def load_behavioral_feature_data(behavior_file_paths: list = None,
         Paths to the sessions containing behavioral feature data.
     csv_sep : str, optional
         Separator used in the .csv file.
+    columns : list, optional
+        Feature columns to load; None loads all.
 
     Returns
     -------
@@ -45,25 +54,31 @@ def load_behavioral_feature_data(behavior_file_paths: list = None,
         Behavior, camera frame rate and track name data (keys are file names and values polars.DataFrames, float, list).
     """
 
-    beh_feature_data_dict = {}
+    features_file_paths = {}
     camera_fr_dict = {}
     mouse_track_names_dict = {}
     for behavior_file_path in behavior_file_paths:
         beh_root = Path(behavior_file_path)
         sess_id = beh_root.name
-        features_csv_file_path = next((beh_root / 'video').glob('**/*_points3d_translated_rotated_metric_behavioral_features.csv'), None)
+        try:
+            features_file_path = find_behavioral_feature_table(
+                root=beh_root / 'video', pattern='*_points3d_translated_rotated_metric_behavioral_features')
+        except FileNotFoundError:
+            features_file_path = None
         track_file_path = next((beh_root / 'video').glob('**/[!speaker]*_points3d_translated_rotated_metric.h5'), None)
         # Guard against missing input files (glob found no match) before passing
         # the path to h5py/polars, mirroring the `csv_path is None` skip in the
-        # sibling USV loaders. Passing None to h5py.File/pls.read_csv would raise
+        # sibling USV loaders. Passing None to h5py.File/polars would raise
         # an opaque low-level TypeError/OSError instead of a clear warning.
-        if features_csv_file_path is None or track_file_path is None:
+        if features_file_path is None or track_file_path is None:
             print(f"Warning: Missing behavioral feature/track file for {sess_id}. Skipping.")
             continue
         with h5py.File(name=track_file_path, mode='r') as h5_file_mouse_obj:
             camera_fr_dict[sess_id] = float(h5_file_mouse_obj['recording_frame_rate'][()])
             mouse_track_names_dict[sess_id] = [item.decode('utf-8') for item in list(h5_file_mouse_obj['track_names'])]
-        beh_feature_data_dict[sess_id] = pls.read_csv(source=features_csv_file_path, separator=csv_sep)
+        features_file_paths[sess_id] = features_file_path
+
+    beh_feature_data_dict = load_behavioral_feature_sessions(features_file_paths, columns=columns, csv_sep=csv_sep)
 
     return beh_feature_data_dict, camera_fr_dict, mouse_track_names_dict
 
@@ -1149,20 +1164,18 @@ def find_variable_length_bouts(root_directories: list = None,
 
 def load_pickle_modeling_data(pickle_file_path: str = None) -> dict:
     """
-    Loads data from a .pickle file.
+    Loads a modeling-input artifact: the per-feature HDF5 store or a
+    legacy .pickle file (see `modeling_input_store`).
 
     Parameters
     ----------
     pickle_file_path : str
-        Path to the .pickle file.
+        Path to the .h5 store or .pickle file.
 
     Returns
     -------
     modeling_data : dict
-        Modeling data.
+        Modeling data, every feature plus the metadata blocks.
     """
 
-    with open(pickle_file_path, 'rb') as pickle_file:
-        modeling_data = pickle.load(pickle_file)
-
-    return modeling_data
+    return load_modeling_input(pickle_file_path)
@@ -16,19 +16,23 @@ The dispatcher manages five distinct analysis frameworks:
 
 Computational & Structural Features:
 ------------------------------------
-- Memory Guarding: Implements a two-phase loading strategy. For every analysis
-  type, a key-only indexing pass loads the pickle solely to map the feature
-  index to a feature name, then releases that CPU memory (del + gc.collect()).
-  The CPU paths (onset/category/params) subsequently re-load the full data via
-  load_pickle_modeling_data, whereas the JAX/GPU paths defer loading to the
-  runner via pkl_path, which is what actually preserves GPU headroom and
-  prevents Out-of-Memory (OOM) errors during heavy GPU allocation.
+- Memory Guarding: The input is read through `ModelingInputReader`. For the
+  per-feature HDF5 store the indexing pass reads only the feature list and the
+  metadata block, and the CPU paths (onset/category/params) then read just the
+  mapped feature; a legacy pickle is deserialized once and released
+  (del + gc.collect()) after the feature is picked. The JAX/GPU paths defer
+  loading to the runner via pkl_path, which is what actually preserves GPU
+  headroom and prevents Out-of-Memory (OOM) errors during heavy GPU allocation.
 - Atomic Plotting Lock: Uses a file-based signaling mechanism ('.basis_plotted')
   to ensure that basis set verification plots are generated exactly once per
   batch run, preventing race conditions and I/O collisions across cluster nodes.
 - Headless Stability: Explicitly configures the Matplotlib 'Agg' backend
   before any pipeline imports to ensure compatibility with non-interactive
   remote compute environments.
+- Compilation Reuse: The JAX tasks share a persistent XLA compilation cache
+  (`hyperparameters.jax_compilation`), so only the first array task on a
+  given software stack pays for compiling the training loops; the compile vs
+  run time split lands in `_run_metadata['jax_compile_profile']`.
 - Model Symmetry: Standardizes the 'Actual vs. Null' experimental design across
   all analysis types, ensuring that p-values and information gain metrics
   remain statistically comparable across the entire project.
@@ -53,7 +57,10 @@ from .modeling_vocal_categories_multinomial import MultinomialModelingPipeline,
 from .modeling_usv_manifold_position import ContinuousModelingPipeline, ContinuousModelRunner
 from .modeling_bases_functions import (raised_cosine, bsplines, identity,
                                       laplacian_pyramid, _normalizecols)
-from .modeling_metadata import (build_run_metadata, inject_metadata, RESERVED_METADATA_KEYS)
+from .modeling_metadata import build_run_metadata, inject_metadata
+from .modeling_input_store import ModelingInputReader
+from .jax_compilation import (compile_profile, configure_compilation_cache,
+                              start_compile_accounting)
 from .modeling_utils import (format_run_header, format_run_summary,
                              extract_univariate_headline,
                              held_out_session_ids_from_metadata)
@@ -203,7 +210,7 @@ def dispatch_univariate_job(args: argparse.Namespace) -> None:
         The command-line arguments containing:
         - analysis_type: The modeling framework to use.
         - feature_idx: The integer index from the SLURM job array.
-        - input_data: Path to the source .pkl data.
+        - input_data: Path to the modeling input (`.h5` store or legacy `.pkl`).
         - output_dir: Destination for the results file.
 
     The settings JSON path is not taken as input. It is auto-resolved
@@ -233,32 +240,29 @@ def dispatch_univariate_job(args: argparse.Namespace) -> None:
 
     # 2. Semantic Feature Mapping + upstream-metadata harvest
     try:
-        with open(args.input_data, 'rb') as f:
-            # `pickle.load` deserializes the entire dict; we keep the
-            # sorted *non-reserved* key list (so `_input_metadata` and
-            # any future reserved blocks are not mistaken for features)
-            # and stash the upstream `_input_metadata` block to copy
-            # verbatim into the per-feature pickle.
-            loaded = pickle.load(f)
-            input_metadata = loaded['_input_metadata'] if '_input_metadata' in loaded else None
-            all_features = sorted([k for k in loaded.keys() if k not in RESERVED_METADATA_KEYS])
-
-            # Guard both bounds: a negative index would otherwise wrap via
-            # Python negative indexing into a valid-but-wrong feature, silently
-            # writing a result pickle for the wrong feature with a negative
-            # index embedded in the filename.
-            if args.feature_idx < 0 or args.feature_idx >= len(all_features):
-                print(f"FATAL: Index {args.feature_idx} out of bounds.")
-                return
-
-            feature_name = all_features[args.feature_idx]
-            # Capture this feature's data from THIS load so the CPU branch below does
-            # not re-deserialize the whole pickle again (load_pickle_modeling_data is
-            # a bare pickle.load of the same file); the JAX branches defer loading and
-            # never use feat_data. `del loaded` then frees the other features --
-            # feat_data holds only this one, so the memory profile is unchanged.
-            feat_data = loaded[feature_name] if args.analysis_type in ['onset', 'category', 'params'] else None
-            del loaded
+        # The reader lists the features and hands back the upstream
+        # `_input_metadata` block (copied verbatim into the per-feature
+        # pickle) without reading any feature data from a per-feature
+        # store; a legacy pickle is deserialized once, here.
+        input_reader = ModelingInputReader(args.input_data)
+        input_metadata = input_reader.input_metadata
+        all_features = input_reader.feature_names
+
+        # Guard both bounds: a negative index would otherwise wrap via
+        # Python negative indexing into a valid-but-wrong feature, silently
+        # writing a result pickle for the wrong feature with a negative
+        # index embedded in the filename.
+        if args.feature_idx < 0 or args.feature_idx >= len(all_features):
+            print(f"FATAL: Index {args.feature_idx} out of bounds.")
+            return
+
+        feature_name = all_features[args.feature_idx]
+        # Read only this feature for the CPU branch below; the JAX branches
+        # defer loading to the runner and never use feat_data. Dropping the
+        # reader frees a legacy pickle's other features.
+        feat_data = (input_reader.load(features=feature_name)[feature_name]
+                     if args.analysis_type in ['onset', 'category', 'params'] else None)
+        del input_reader
 
         print(f"[{timestamp}] Mapped Index {args.feature_idx} -> Feature: {feature_name}")
         if input_metadata is None:
@@ -292,6 +296,14 @@ def dispatch_univariate_job(args: argparse.Namespace) -> None:
     Path(args.output_dir).mkdir(parents=True, exist_ok=True)
     results = None
 
+    # JAX tasks: point XLA at the shared persistent cache so executables
+    # compiled by an earlier array task are loaded rather than rebuilt, and
+    # time the compile / run split for `_run_metadata`.
+    jax_task = args.analysis_type in ['multinomial', 'continuous']
+    if jax_task:
+        configure_compilation_cache(settings)
+        start_compile_accounting()
+
     try:
         # CATEGORY A: CPU-based Modeling (Onset, Category, Params)
         if args.analysis_type in ['onset', 'category', 'params']:
@@ -378,6 +390,7 @@ def dispatch_univariate_job(args: argparse.Namespace) -> None:
         n_outer_folds=int(settings['model_validation']['n_cv_folds']),
         split_strategy=settings['model_validation']['split_strategy'],
         settings_path=settings_path,
+        jax_compile_profile=compile_profile() if jax_task else None,
     )
 
     # 5. Atomic Result Serialization
@@ -439,13 +452,13 @@ if __name__ == "__main__":
         '--feature_idx',
         type=int,
         required=True,
-        help="Deterministic index of the behavioral feature from the input pickle."
+        help="Deterministic index of the behavioral feature from the modeling input."
     )
 
     parser.add_argument(
         '--input_data',
         required=True,
-        help="Path to the .pkl file containing aligned feature history."
+        help="Path to the modeling input (.h5 per-feature store or legacy .pkl) containing aligned feature history."
     )
 
     parser.add_argument(
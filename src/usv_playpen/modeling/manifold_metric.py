@@ -35,6 +35,7 @@ floating-point noise.
 
 import numpy as np
 import jax.numpy as jnp
+from numba import njit, prange
 from scipy.stats import spearmanr
 from scipy.special import i0e, i1e
 from scipy.optimize import brentq
@@ -267,10 +268,187 @@ def distance_correlation(A: np.ndarray, B: np.ndarray) -> float:
     return float(np.sqrt(ratio)) if ratio > 0.0 else 0.0
 
 
+@njit(cache=True, parallel=True)
+def _nb_distance_row_sums(Y: np.ndarray, torus: bool, period: float) -> np.ndarray:
+    """
+    Description
+    -----------
+    Row sums of the pairwise wrap-aware distance matrix of ``Y`` without
+    materialising it: one parallel iteration per row, each distance computed
+    on the fly with the wrap rule of :func:`signed_diff`.
+
+    Parameters
+    ----------
+    Y (np.ndarray)
+        ``(n, D)`` float64 coordinates.
+    torus (bool)
+        Wrap each per-axis difference into ``[-period/2, period/2]``.
+    period (float)
+        Per-axis wrap period (unused when ``torus`` is False).
+
+    Returns
+    -------
+    row_sums (np.ndarray)
+        ``(n,)`` sums ``sum_j d(Y[i], Y[j])``.
+    """
+    n, n_dims = Y.shape
+    row_sums = np.zeros(n)
+    for i in prange(n):
+        total = 0.0
+        for j in range(n):
+            sq = 0.0
+            for k in range(n_dims):
+                diff = Y[i, k] - Y[j, k]
+                if torus:
+                    diff = diff - period * np.round(diff / period)
+                sq += diff * diff
+            total += np.sqrt(sq)
+        row_sums[i] = total
+    return row_sums
+
+
+@njit(cache=True, parallel=True)
+def _nb_centered_cross_sums(A: np.ndarray, B: np.ndarray, row_a: np.ndarray, row_b: np.ndarray,
+                            grand_a: float, grand_b: float, torus: bool, period: float,
+                            skip_diagonal: bool) -> np.ndarray:
+    """
+    Description
+    -----------
+    Second pass of the blocked distance correlation: per row ``i``, the sums
+    over ``j`` of ``a_c * b_c``, ``a_c ** 2`` and ``b_c ** 2``, where the
+    centred entry is ``a_c = d(A[i], A[j]) - row_a[i] - row_a[j] + grand_a``
+    (likewise for ``b``). With row / grand means this is the double-centred
+    V-statistic; with the U-centring terms and ``skip_diagonal`` it is the
+    unbiased U-statistic.
+
+    Parameters
+    ----------
+    A, B (np.ndarray)
+        ``(n, D)`` float64 coordinates of the two variables.
+    row_a, row_b (np.ndarray)
+        ``(n,)`` per-row centring terms.
+    grand_a, grand_b (float)
+        Grand centring terms.
+    torus (bool)
+        Wrap each per-axis difference.
+    period (float)
+        Per-axis wrap period.
+    skip_diagonal (bool)
+        Leave out the ``i == j`` terms (U-statistic).
+
+    Returns
+    -------
+    sums (np.ndarray)
+        ``(n, 3)`` per-row sums of ``a_c * b_c``, ``a_c ** 2`` and ``b_c ** 2``.
+    """
+    n, n_dims = A.shape
+    sums = np.zeros((n, 3))
+    for i in prange(n):
+        s_ab = 0.0
+        s_aa = 0.0
+        s_bb = 0.0
+        for j in range(n):
+            if skip_diagonal and i == j:
+                continue
+            sq_a = 0.0
+            sq_b = 0.0
+            for k in range(n_dims):
+                diff_a = A[i, k] - A[j, k]
+                diff_b = B[i, k] - B[j, k]
+                if torus:
+                    diff_a = diff_a - period * np.round(diff_a / period)
+                    diff_b = diff_b - period * np.round(diff_b / period)
+                sq_a += diff_a * diff_a
+                sq_b += diff_b * diff_b
+            a_c = np.sqrt(sq_a) - row_a[i] - row_a[j] + grand_a
+            b_c = np.sqrt(sq_b) - row_b[i] - row_b[j] + grand_b
+            s_ab += a_c * b_c
+            s_aa += a_c * a_c
+            s_bb += b_c * b_c
+        sums[i, 0] = s_ab
+        sums[i, 1] = s_aa
+        sums[i, 2] = s_bb
+    return sums
+
+
+def blocked_distance_correlation(A: np.ndarray, B: np.ndarray, *,
+                                 metric: str, period: float,
+                                 unbiased: bool = False) -> float:
+    """
+    Description
+    -----------
+    Distance correlation between two paired coordinate sets in ``O(n)``
+    memory. Instead of building the two ``(n, n)`` distance matrices (and the
+    ``(n, n, D)`` signed-difference tensors behind them) the statistic is
+    computed in two compiled passes over the rows: the first accumulates the
+    row and grand sums of each distance matrix, the second the sums of the
+    products of the centred entries, each distance recomputed on the fly. The
+    V-statistic (``unbiased=False``) equals :func:`distance_correlation` of the
+    full matrices up to floating-point summation order, on either metric.
+
+    With ``unbiased=True`` the matrices are U-centred (Szekely & Rizzo, 2014),
+    which makes the squared distance covariance an unbiased estimator of its
+    population value; the V-statistic is biased upward for small ``n`` and
+    independent variables. The returned value is the square root of the
+    bias-corrected squared correlation, clipped at ``0``.
+
+    Parameters
+    ----------
+    A (np.ndarray)
+        ``(n, D)`` coordinates of the first variable.
+    B (np.ndarray)
+        ``(n, D)`` coordinates of the second variable (paired rows).
+    metric (str)
+        ``'euclidean'`` or ``'torus'``.
+    period (float)
+        Per-axis wrap period.
+    unbiased (bool)
+        U-statistic instead of the V-statistic (needs ``n > 3``).
+
+    Returns
+    -------
+    dcor (float)
+        Distance correlation in ``[0, 1]`` (``0.0`` if either variable is
+        constant).
+    """
+
+    _validate_metric_period(metric, period)
+    A = np.ascontiguousarray(A, dtype=np.float64)
+    B = np.ascontiguousarray(B, dtype=np.float64)
+    n = A.shape[0]
+    if B.shape[0] != n:
+        raise ValueError(f'blocked_distance_correlation received mismatched lengths: '
+                         f'{n} and {B.shape[0]} rows.')
+    if unbiased and n <= 3:
+        raise ValueError(f'The unbiased distance correlation needs more than 3 points; got {n}.')
+
+    torus = metric == 'torus'
+    row_sums_a = _nb_distance_row_sums(A, torus, float(period))
+    row_sums_b = _nb_distance_row_sums(B, torus, float(period))
+    if unbiased:
+        row_a, row_b = row_sums_a / (n - 2), row_sums_b / (n - 2)
+        grand_a = row_sums_a.sum() / ((n - 1) * (n - 2))
+        grand_b = row_sums_b.sum() / ((n - 1) * (n - 2))
+    else:
+        row_a, row_b = row_sums_a / n, row_sums_b / n
+        grand_a, grand_b = row_a.mean(), row_b.mean()
+    sums = _nb_centered_cross_sums(A, B, row_a, row_b, float(grand_a), float(grand_b),
+                                   torus, float(period), unbiased).sum(axis=0)
+
+    # The 1 / n**2 (or 1 / (n (n - 3))) normalisation cancels in the ratio.
+    dcov2, dvar_a, dvar_b = sums
+    if dvar_a <= 0.0 or dvar_b <= 0.0:
+        return 0.0
+    ratio = dcov2 / np.sqrt(dvar_a * dvar_b)
+    return float(np.sqrt(ratio)) if ratio > 0.0 else 0.0
+
+
 def dcor_prediction_truth(Y_pred: np.ndarray, Y_true: np.ndarray, *,
                           metric: str, period: float,
                           n_sub: int = 2500, n_rep: int = 3,
-                          random_state: int = 0) -> float:
+                          random_state: int = 0, estimator: str = 'subsample',
+                          blocked_min_n: int = 4096,
+                          return_stderr: bool = False) -> float | tuple:
     """
     Description
     -----------
@@ -278,7 +456,11 @@ def dcor_prediction_truth(Y_pred: np.ndarray, Y_true: np.ndarray, *,
     coordinates and the true coordinates, averaged over ``n_rep`` random
     subsamples of ``n_sub`` points each. Distance correlation is ``O(n^2)`` in
     memory and compute, so the subsampling keeps it tractable on large test
-    folds; averaging over repeats reduces the subsample variance.
+    folds; averaging over repeats reduces the subsample variance. Above
+    ``blocked_min_n`` points the statistic is evaluated by
+    :func:`blocked_distance_correlation` in ``O(n)`` memory instead of on the
+    full matrices, so large ``n_sub`` values (or ``estimator='exact'`` on a
+    20-40k event fold) no longer need the ``(n, n, D)`` tensors.
 
     This is the model-based feature-selection score on the **torus**: it
     measures how strongly the decoded prediction co-varies with the truth on
@@ -322,12 +504,26 @@ def dcor_prediction_truth(Y_pred: np.ndarray, Y_true: np.ndarray, *,
         extra cost.
     random_state (int)
         Seed for the deterministic subsample draws (reproducibility).
+    estimator (str)
+        ``'subsample'`` (default) averages the V-statistic over the repeats;
+        ``'u_statistic'`` averages the unbiased U-statistic over the same
+        subsamples (free of the small-sample upward bias of the V-statistic);
+        ``'exact'`` evaluates the V-statistic once on all ``n`` points
+        (``n_sub`` and ``n_rep`` are ignored).
+    blocked_min_n (int)
+        Sample size above which the V-statistic is computed by the blocked
+        ``O(n)``-memory kernel rather than on the full distance matrices.
+    return_stderr (bool)
+        Also return the standard error of the mean over the repeats
+        (``0.0`` for ``'exact'``, ``nan`` for a single repeat).
 
     Returns
     -------
     dcor (float)
         Mean distance correlation over the repeats, in ``[0, 1]``
         (``nan`` only if ``n_rep < 1``).
+    stderr (float)
+        Only with ``return_stderr``: the standard error of ``dcor``.
     """
 
     Y_pred = np.asarray(Y_pred, dtype=np.float64)
@@ -338,15 +534,33 @@ def dcor_prediction_truth(Y_pred: np.ndarray, Y_true: np.ndarray, *,
             f'{len(Y_pred)} rows but Y_true has {len(Y_true)}; the subsample '
             f'indices must address paired rows.'
         )
+    if estimator not in ('subsample', 'u_statistic', 'exact'):
+        raise ValueError(f"estimator must be 'subsample', 'u_statistic' or 'exact', got {estimator!r}.")
+
+    def _dcor(a, b):
+        if estimator == 'u_statistic':
+            return blocked_distance_correlation(a, b, metric=metric, period=period, unbiased=True)
+        if len(a) > blocked_min_n:
+            return blocked_distance_correlation(a, b, metric=metric, period=period)
+        a_mat = _geodesic_distance_matrix(a, metric=metric, period=period)
+        b_mat = _geodesic_distance_matrix(b, metric=metric, period=period)
+        return distance_correlation(a_mat, b_mat)
+
     n = len(Y_true)
+    if estimator == 'exact':
+        dcor = _dcor(Y_pred, Y_true)
+        return (dcor, 0.0) if return_stderr else dcor
+
     rng = np.random.default_rng(random_state)
     vals = []
     for _ in range(int(n_rep)):
         idx = rng.choice(n, size=min(int(n_sub), n), replace=False)
-        a_mat = _geodesic_distance_matrix(Y_pred[idx], metric=metric, period=period)
-        b_mat = _geodesic_distance_matrix(Y_true[idx], metric=metric, period=period)
-        vals.append(distance_correlation(a_mat, b_mat))
-    return float(np.mean(vals)) if vals else float('nan')
+        vals.append(_dcor(Y_pred[idx], Y_true[idx]))
+    dcor = float(np.mean(vals)) if vals else float('nan')
+    if not return_stderr:
+        return dcor
+    stderr = float(np.std(vals, ddof=1) / np.sqrt(len(vals))) if len(vals) > 1 else float('nan')
+    return dcor, stderr
 
 
 def _fit_von_mises_kappa(r: np.ndarray, weights: np.ndarray = None) -> float:
@@ -647,7 +861,10 @@ def manifold_prediction_metrics(Y_true: np.ndarray, Y_pred: np.ndarray,
                                 random_state: int = 0,
                                 region_labels: np.ndarray = None,
                                 min_region_events: int = 1,
-                                kappa: float = None) -> dict:
+                                kappa: float = None,
+                                dcor_estimator: str = 'subsample',
+                                dcor_n_sub: int = 2500,
+                                dcor_n_rep: int = 3) -> dict:
     """
     Description
     -----------
@@ -706,6 +923,17 @@ def manifold_prediction_metrics(Y_true: np.ndarray, Y_pred: np.ndarray,
         baseline scored on the SAME dispersion scale as the fitted strategies and
         the gate, so their margins are a proper scoring rule. Ignored on
         euclidean (the vM branch is never entered).
+    dcor_estimator (str)
+        ``estimator`` of :func:`dcor_prediction_truth` for ``dcor_xy``
+        (euclidean only). Large subsamples and ``'exact'`` switch to the
+        blocked ``O(n)``-memory kernel automatically.
+    dcor_n_sub (int)
+        ``n_sub`` of :func:`dcor_prediction_truth` (euclidean only).
+    dcor_n_rep (int)
+        ``n_rep`` of :func:`dcor_prediction_truth` (euclidean only). The
+        three ``dcor_*`` arguments are normally filled from the
+        ``vocal_features.usv_manifold_dcor`` settings block by
+        :func:`resolve_manifold_dcor_settings`.
 
     Returns
     -------
@@ -714,8 +942,10 @@ def manifold_prediction_metrics(Y_true: np.ndarray, Y_pred: np.ndarray,
         ``euclidean_rmse``, ``euclidean_mae_weighted``, ``euclidean_mae_raw``,
         ``mahalanobis_mae``, ``mae_x``, ``mae_y``, ``pearson_x``,
         ``pearson_y``, ``spearman_x``, ``spearman_y``, ``dcor_xy``,
-        ``vm_logscore`` (macro / region-balanced) and ``vm_logscore_pooled``
-        (the micro / event-weighted twin; both ``nan`` on euclidean).
+        ``dcor_xy_stderr`` (its standard error over the subsample repeats;
+        ``nan`` on the torus), ``vm_logscore`` (macro / region-balanced) and
+        ``vm_logscore_pooled`` (the micro / event-weighted twin; both ``nan``
+        on euclidean).
     """
 
     Y_true = np.asarray(Y_true, dtype=np.float64)
@@ -783,9 +1013,12 @@ def manifold_prediction_metrics(Y_true: np.ndarray, Y_pred: np.ndarray,
             kappa=kappa,
         )
         dcor_xy = float('nan')
+        dcor_xy_stderr = float('nan')
     else:
-        dcor_xy = dcor_prediction_truth(
+        dcor_xy, dcor_xy_stderr = dcor_prediction_truth(
             Y_pred, Y_true, metric=metric, period=period, random_state=random_state,
+            n_sub=dcor_n_sub, n_rep=dcor_n_rep, estimator=dcor_estimator,
+            return_stderr=True,
         )
         vm_logscore = float('nan')
         vm_logscore_pooled = float('nan')
@@ -814,6 +1047,7 @@ def manifold_prediction_metrics(Y_true: np.ndarray, Y_pred: np.ndarray,
         'spearman_x': _spear(Y_true[:, 0], Y_pred[:, 0]),
         'spearman_y': _spear(Y_true[:, 1], Y_pred[:, 1]),
         'dcor_xy': dcor_xy,
+        'dcor_xy_stderr': dcor_xy_stderr,
         'vm_logscore': vm_logscore,
         'vm_logscore_pooled': vm_logscore_pooled,
     }
@@ -1176,3 +1410,52 @@ def resolve_manifold_selection_score_key(modeling_settings: dict, metric: str) -
             f"'micro'; got {mode!r}."
         )
     return 'vm_logscore_pooled' if mode == 'micro' else 'vm_logscore'
+
+
+def resolve_manifold_dcor_settings(modeling_settings: dict) -> dict:
+    """
+    Resolves how the euclidean selection score ``dcor_xy`` is estimated.
+
+    The optional ``vocal_features.usv_manifold_dcor`` block sets the
+    ``estimator``, ``n_sub`` and ``n_rep`` of :func:`dcor_prediction_truth`
+    for every metric bundle of a run (the fitted strategies, the non-fitted
+    baselines and the inner-CV tuner), so all of them are scored the same
+    way. An ``n_sub`` above the blocked-kernel threshold (4096 points) or
+    ``estimator='exact'`` evaluates the statistic in ``O(n)`` memory. An
+    absent block (or key) resolves to the historical defaults
+    (``'subsample'``, ``2500``, ``3``), following the additive convention of
+    :func:`resolve_manifold_selection_score_key`.
+
+    Parameters
+    ----------
+    modeling_settings : dict
+        Fully loaded ``modeling_settings.json``.
+
+    Returns
+    -------
+    dict
+        ``{'dcor_estimator', 'dcor_n_sub', 'dcor_n_rep'}``, the keyword
+        arguments of :func:`manifold_prediction_metrics` and
+        ``SmoothBivariateRegression.evaluate_metrics``.
+
+    Raises
+    ------
+    ValueError
+        If the estimator is unknown, or ``n_sub`` / ``n_rep`` is below 1.
+    """
+
+    block = modeling_settings.get('vocal_features', {}).get('usv_manifold_dcor', {})
+    estimator = block.get('estimator', 'subsample')
+    n_sub = int(block.get('n_sub', 2500))
+    n_rep = int(block.get('n_rep', 3))
+    if estimator not in ('subsample', 'u_statistic', 'exact'):
+        raise ValueError(
+            f"vocal_features.usv_manifold_dcor.estimator must be 'subsample', "
+            f"'u_statistic' or 'exact'; got {estimator!r}."
+        )
+    if n_sub < 1 or n_rep < 1:
+        raise ValueError(
+            f"vocal_features.usv_manifold_dcor needs n_sub >= 1 and n_rep >= 1; "
+            f"got n_sub={n_sub}, n_rep={n_rep}."
+        )
+    return {'dcor_estimator': estimator, 'dcor_n_sub': n_sub, 'dcor_n_rep': n_rep}
@@ -19,6 +19,7 @@ from sklearn.metrics import (log_loss, roc_auc_score, f1_score, recall_score,
                              balanced_accuracy_score, mean_squared_log_error,
                              mean_gamma_deviance, brier_score_loss)
 from .load_input_files import load_pickle_modeling_data
+from .modeling_input_store import load_modeling_input
 from .modeling_bases_functions import _normalizecols, bsplines, identity, laplacian_pyramid, raised_cosine
 from .modeling_utils import (
     pool_session_arrays,
@@ -48,6 +49,7 @@ from .manifold_metric import (
     circular_mean,
     dcor_prediction_truth,
     manifold_prediction_metrics,
+    resolve_manifold_dcor_settings,
     resolve_manifold_metric,
     resolve_manifold_selection_score_key,
     signed_diff,
@@ -60,16 +62,23 @@ from .modeling_usv_manifold_position import (
     _log_spaced_grid,
     _tune_manifold_regularization,
 )
+from .jax_compilation import (
+    compile_profile,
+    configure_compilation_cache,
+    start_compile_accounting,
+)
 from .jax_multinomial_logistic_regression import SmoothMultinomialLogisticRegression
 from .manifold_torus_regression import resolve_manifold_regressor_cls
 from .modeling_torus_geodesics import (
-    build_torus_geodesic_context,
+    cached_torus_geodesic_context,
     geodesic_mae_columns,
     make_qlvm_decode_fn_from_npz,
 )
 from .modeling_metadata import (
     build_selection_metadata, inject_metadata, RESERVED_METADATA_KEYS,
 )
+from .design_matrix_cache import DesignMatrixCache
+from .selection_scheduler import CandidateScheduler, checkpoint_run_digest
 from ..os_utils import resolve_modeling_setting
 
 # Forward-selection significance level and the Expected-Calibration-Error
@@ -142,7 +151,8 @@ def _harvest_upstream_metadata(univariate_data: dict,
     return in_md, univ_md
 
 
-def _make_step_wrapper(input_md: dict, univariate_md: dict, run_md: dict):
+def _make_step_wrapper(input_md: dict, univariate_md: dict, run_md: dict,
+                       compile_profile_fn=None):
     """
     Returns a closure `wrap(payload) -> dict` that injects the three
     metadata blocks into a step-pickle payload before serialization.
@@ -151,7 +161,10 @@ def _make_step_wrapper(input_md: dict, univariate_md: dict, run_md: dict):
     its own `_run_metadata`, and then uses the closure to attach all
     three blocks at every `pickle.dump` site. The closure short-
     circuits cleanly when an upstream block is `None` (legacy
-    artifact); the run-level block is always emitted.
+    artifact); the run-level block is always emitted. The JAX selectors
+    pass `compile_profile_fn`, whose snapshot of the compile / run time
+    split so far is stored under `_run_metadata['jax_compile_profile']`
+    of every step pickle.
 
     Parameters
     ----------
@@ -161,6 +174,9 @@ def _make_step_wrapper(input_md: dict, univariate_md: dict, run_md: dict):
         `_univariate_metadata` block to embed.
     run_md : dict
         `_run_metadata` block to embed (always present for new runs).
+    compile_profile_fn : callable, optional
+        Zero-argument callable returning the current compile profile
+        (`jax_compilation.compile_profile`); None for the CPU selectors.
 
     Returns
     -------
@@ -170,7 +186,10 @@ def _make_step_wrapper(input_md: dict, univariate_md: dict, run_md: dict):
     """
 
     def wrap(payload: dict) -> dict:
-        blocks = {'_run_metadata': run_md}
+        step_run_md = run_md
+        if compile_profile_fn is not None:
+            step_run_md = {**run_md, 'jax_compile_profile': compile_profile_fn()}
+        blocks = {'_run_metadata': step_run_md}
         if input_md is not None:
             blocks['_input_metadata'] = input_md
         if univariate_md is not None:
@@ -192,7 +211,8 @@ def _fold_paired_margin_bootstrap(
         event_to_region: np.ndarray = None,
         min_region_events: int = 1,
         min_fold_events: int = 30,
-        kappa: float = None) -> dict:
+        kappa: float = None,
+        dcor_settings: dict = None) -> dict:
     """
     Description
     -----------
@@ -265,6 +285,11 @@ def _fold_paired_margin_bootstrap(
         concentration removes the per-fold-refit floor that can corrupt the margin
         on weak folds and keeps ``actual`` / ``null`` on one dispersion scale.
         Ignored on euclidean.
+    dcor_settings (dict)
+        :func:`manifold_metric.resolve_manifold_dcor_settings` keyword
+        arguments; their estimator and subsample size score each euclidean
+        fold, so the gate uses the estimator the candidates were ranked with.
+        ``None`` (default) keeps the estimator defaults. Ignored on the torus.
 
     Returns
     -------
@@ -311,6 +336,8 @@ def _fold_paired_margin_bootstrap(
                     # (`n_rep`) would only recompute the identical full-sample
                     # dcor -- fix it at 1 to avoid that waste.
                     n_rep=1,
+                    n_sub=dcor_settings['dcor_n_sub'] if dcor_settings else 2500,
+                    estimator=dcor_settings['dcor_estimator'] if dcor_settings else 'subsample',
                 )
             scores.append(score)
         return np.asarray(scores, dtype=float)
@@ -675,6 +702,11 @@ def vocal_onset_model_selection(univariate_results_path: str,
 
     model_selection_dir = Path(output_directory)
     model_selection_dir.mkdir(parents=True, exist_ok=True)
+    # Candidate checkpoints stay in the shared directory (`selection_root`); a
+    # non-primary task of a SLURM job array publishes its step pickles privately.
+    scheduler = CandidateScheduler.from_settings(settings)
+    selection_root = model_selection_dir
+    model_selection_dir = scheduler.publish_directory(model_selection_dir)
 
     with open(univariate_results_path, 'rb') as f:
         univariate_data = pickle.load(f)
@@ -884,6 +916,7 @@ def vocal_onset_model_selection(univariate_results_path: str,
         cat_seg = ""
 
     prefix = f"model_selection_{target_condition}_{prediction_mode}{cat_seg}_{split_strategy}_step_"
+    run_digest = checkpoint_run_digest(settings_path, input_data_path, univariate_results_path, prefix)
 
     existing_steps = []
     if model_selection_dir.is_dir():
@@ -1055,27 +1088,16 @@ def vocal_onset_model_selection(univariate_results_path: str,
                 pickle.dump(_wrap_step(step_0_metadata), f)
             step_counter = 1
 
-    while True:
-        print(format_selection_step(f"Step {step_counter}",
-                                    detail=f"best so far LL={best_current_score:.4f}"))
-        step_results_metadata = {
-            'step_idx': step_counter, 'current_features': list(current_model_features),
-            'baseline_score': best_current_score, 'candidates_summary': {},
-            'selected_feature': None
-        }
-
-        best_candidate, best_candidate_score, best_candidate_se = None, float('inf'), 0.0
-
-        # 'session' folds: the anchor pooling, the fold's balanced subsample indices
-        # (trial_rng is seeded by fold only, so idx_p/idx_n are identical across
-        # candidates), and the base-feature pooled+subsampled design columns are all
-        # candidate-invariant. Precompute them once per fold here; the candidate loop then
-        # pools only the new feature. pool_session_arrays is a pure per-feature
-        # concatenate, so pool(base+[new]) == pool(base)+pool([new]) -- byte-identical.
-        session_fold_base = {}
-        for fold_i, fold_info in enumerate(cv_folds):
-            if fold_info['type'] != 'session':
-                continue
+    # The rows of every fold split are candidate- and step-invariant: 'session'
+    # folds pool the anchor and draw the balanced subsample with a fold-seeded
+    # rng (idx_p/idx_n), 'mixed' folds balance with a fold-seeded rng as well.
+    # Each (fold, feature) design column is therefore built once -- pooled,
+    # subsampled and unrolled -- and then served from `design_cache`;
+    # pool_session_arrays is a pure per-feature concatenate, so a column built
+    # alone is byte-identical to the same column of a jointly pooled design.
+    fold_rows = {}
+    for fold_i, fold_info in enumerate(cv_folds):
+        if fold_info['type'] == 'session':
             train_sess, test_sess = fold_info['train_sessions'], fold_info['test_sessions']
             anc_data = all_feature_data[anchor_feature]
             X_p_tr, X_n_tr = pool_session_arrays(anc_data, train_sess, pos_key="usv_feature_arr", neg_key="no_usv_feature_arr", n_frames=pipeline.history_frames)
@@ -1086,17 +1108,69 @@ def vocal_onset_model_selection(univariate_results_path: str,
             y_tr_fold = np.concatenate((np.ones(n_k), np.zeros(n_k)))
             X_p_te_anc, X_n_te_anc = pool_session_arrays(anc_data, test_sess, pos_key="usv_feature_arr", neg_key="no_usv_feature_arr", n_frames=pipeline.history_frames)
             y_te_fold = np.concatenate((np.ones(X_p_te_anc.shape[0]), np.zeros(X_n_te_anc.shape[0])))
-            base_train_list, base_test_list = [], []
-            for f_name in current_model_features:
+
+            def _train_rows(f_name, train_sess=train_sess, idx_p=idx_p, idx_n=idx_n):
                 f_p_tr, f_n_tr = pool_session_arrays(all_feature_data[f_name], train_sess, pos_key="usv_feature_arr", neg_key="no_usv_feature_arr", n_frames=pipeline.history_frames)
+                return np.concatenate((f_p_tr[idx_p], f_n_tr[idx_n]))
+
+            def _test_rows(f_name, test_sess=test_sess):
                 f_p_te, f_n_te = pool_session_arrays(all_feature_data[f_name], test_sess, pos_key="usv_feature_arr", neg_key="no_usv_feature_arr", n_frames=pipeline.history_frames)
-                base_train_list.append(np.concatenate((f_p_tr[idx_p], f_n_tr[idx_n])))
-                base_test_list.append(np.concatenate((f_p_te, f_n_te)))
-            session_fold_base[fold_i] = (train_sess, test_sess, idx_p, idx_n, y_tr_fold, y_te_fold, base_train_list, base_test_list)
+                return np.concatenate((f_p_te, f_n_te))
+        elif fold_info['type'] == 'mixed':
+            train_ix, test_ix = fold_info['train_idx'], fold_info['test_idx']
+            y_full = np.concatenate((np.ones(fold_info['n_pos_total']), np.zeros(fold_info['n_neg_total'])))
+            y_tr_all = y_full[train_ix]
+            y_te_fold = y_full[test_ix]
+
+            # Determine balanced-train indices once (shared across all trial features).
+            pos_positions = np.where(y_tr_all == 1)[0]
+            neg_positions = np.where(y_tr_all == 0)[0]
+            n_tr_keep = min(pos_positions.size, neg_positions.size)
+            if n_tr_keep == 0:
+                # Raised per candidate below, so the fold scores NaN as before.
+                fold_rows[fold_i] = None
+                continue
+            fs_rng = np.random.default_rng(random_seed + fold_i)
+            sel_pos = fs_rng.choice(pos_positions.size, n_tr_keep, replace=False)
+            sel_neg = fs_rng.choice(neg_positions.size, n_tr_keep, replace=False)
+            bal_train_local = np.concatenate((pos_positions[sel_pos], neg_positions[sel_neg]))
+            y_tr_fold = np.concatenate((np.ones(n_tr_keep), np.zeros(n_tr_keep)))
+
+            # Slice the pre-pooled cache rather than re-running
+            # `pool_session_arrays` for every fold and trial feature.
+            def _train_rows(f_name, train_ix=train_ix, bal_train_local=bal_train_local):
+                return pooled_feature_cache[f_name]['X_full'][train_ix][bal_train_local]
+
+            def _test_rows(f_name, test_ix=test_ix):
+                return pooled_feature_cache[f_name]['X_full'][test_ix]
+        else:
+            continue
+        fold_rows[fold_i] = (_train_rows, _test_rows, y_tr_fold, y_te_fold)
+
+    design_cache = DesignMatrixCache.from_settings(settings, history_frames)
+    while True:
+        print(format_selection_step(f"Step {step_counter}",
+                                    detail=f"best so far LL={best_current_score:.4f}"))
+        step_results_metadata = {
+            'step_idx': step_counter, 'current_features': list(current_model_features),
+            'baseline_score': best_current_score, 'candidates_summary': {},
+            'selected_feature': None
+        }
+
+        best_candidate, best_candidate_score, best_candidate_se = None, float('inf'), 0.0
 
-        for i_feat, feat in enumerate(ranked_features):
-            if feat in current_model_features: continue
+        # Build the already-selected features' columns once here, so that worker
+        # processes of the candidate scheduler receive them with the cache.
+        step_cache_start = design_cache.snapshot()
+        design_cache.share({(fold_i, split): rows[split_idx]
+                            for fold_i, rows in fold_rows.items() if rows is not None
+                            for split_idx, split in enumerate(('train', 'test'))},
+                           current_model_features)
+        step_cache_counters = design_cache.since(step_cache_start)
+
+        def _evaluate_candidate(feat):
             gc.collect()
+            cache_start = design_cache.snapshot()
             trial_features = current_model_features + [feat]
 
             gam_terms = te(0, 1, n_splines=[n_splines_value, n_splines_time])
@@ -1108,54 +1182,16 @@ def vocal_onset_model_selection(univariate_results_path: str,
                        'confusion_matrix': [], 'n_iter': [], 'converged': [], 'fit_time': []}
             for fold_i, fold_info in enumerate(cv_folds):
                 try:
-                    X_train_list, X_test_list = [], []
-                    if fold_info['type'] == 'session':
-                        # Anchor pool, balanced subsample indices, and base-feature columns
-                        # were precomputed once per fold above; pool only the new feature
-                        # and append (list() copy so the cached base list is not mutated).
-                        train_sess, test_sess, idx_p, idx_n, y_tr_fold, y_te_fold, base_train_list, base_test_list = session_fold_base[fold_i]
-                        X_train_list = list(base_train_list)
-                        X_test_list = list(base_test_list)
-                        f_p_tr, f_n_tr = pool_session_arrays(all_feature_data[feat], train_sess, pos_key="usv_feature_arr", neg_key="no_usv_feature_arr", n_frames=pipeline.history_frames)
-                        f_p_te, f_n_te = pool_session_arrays(all_feature_data[feat], test_sess, pos_key="usv_feature_arr", neg_key="no_usv_feature_arr", n_frames=pipeline.history_frames)
-                        X_train_list.append(np.concatenate((f_p_tr[idx_p], f_n_tr[idx_n])))
-                        X_test_list.append(np.concatenate((f_p_te, f_n_te)))
-                    elif fold_info['type'] == 'mixed':
-                        train_ix, test_ix = fold_info['train_idx'], fold_info['test_idx']
-                        n_pos_total = fold_info['n_pos_total']
-                        n_neg_total = fold_info['n_neg_total']
-                        y_full = np.concatenate((np.ones(n_pos_total), np.zeros(n_neg_total)))
-                        y_tr_all = y_full[train_ix]
-                        y_te_fold = y_full[test_ix]
-
-                        # Determine balanced-train indices once (shared across all trial features).
-                        pos_mask = (y_tr_all == 1)
-                        neg_mask = (y_tr_all == 0)
-                        pos_positions = np.where(pos_mask)[0]
-                        neg_positions = np.where(neg_mask)[0]
-                        n_tr_keep = min(pos_positions.size, neg_positions.size)
-                        if n_tr_keep == 0:
-                            raise ValueError("Training fold has no samples in one class after split.")
-                        fs_rng = np.random.default_rng(random_seed + fold_i)
-                        sel_pos = fs_rng.choice(pos_positions.size, n_tr_keep, replace=False)
-                        sel_neg = fs_rng.choice(neg_positions.size, n_tr_keep, replace=False)
-                        bal_train_local = np.concatenate((pos_positions[sel_pos], neg_positions[sel_neg]))
-                        y_tr_fold = np.concatenate((np.ones(n_tr_keep), np.zeros(n_tr_keep)))
-
-                        for f_name in trial_features:
-                            # Use the pre-pooled cache rather than re-running
-                            # `pool_session_arrays` on every fold for every
-                            # trial feature (the dominant cost of the forward
-                            # loop under 'mixed' strategy).
-                            X_full = pooled_feature_cache[f_name]['X_full']
-                            X_tr_all = X_full[train_ix]
-                            X_train_list.append(X_tr_all[bal_train_local])
-                            X_test_list.append(X_full[test_ix])
-
-                    X_tr_gam = get_unrolled_X_for_multivariate(X_train_list, history_frames)
-                    X_te_gam = get_unrolled_X_for_multivariate(X_test_list, history_frames)
+                    if fold_i not in fold_rows:
+                        raise ValueError(f"Unsupported fold type {fold_info['type']!r}.")
+                    if fold_rows[fold_i] is None:
+                        raise ValueError("Training fold has no samples in one class after split.")
+                    train_rows, test_rows, y_tr_fold, y_te_fold = fold_rows[fold_i]
+
+                    X_tr_gam = design_cache.design((fold_i, 'train'), trial_features, train_rows)
+                    X_te_gam = design_cache.design((fold_i, 'test'), trial_features, test_rows)
                     fit_start = time.perf_counter()
-                    gam = LogisticGAM(gam_terms, **gam_kwargs).fit(X_tr_gam, np.repeat(y_tr_fold.astype(float), history_frames))
+                    gam = LogisticGAM(gam_terms, **gam_kwargs).fit(X_tr_gam, design_cache.repeated_labels((fold_i, 'train'), y_tr_fold.astype(float)))
                     fit_time = float(time.perf_counter() - fit_start)
 
                     y_proba_tiled = gam.predict_proba(X_te_gam)
@@ -1195,7 +1231,20 @@ def vocal_onset_model_selection(univariate_results_path: str,
                             metrics[_k].append(np.full((2, 2), np.nan))
                         else:
                             metrics[_k].append(np.nan)
-
+            metrics['design_cache'] = design_cache.since(cache_start)
+            return metrics
+
+        remaining_features = [feat for feat in ranked_features if feat not in current_model_features]
+        candidate_metrics = scheduler.evaluate(
+            remaining_features, _evaluate_candidate,
+            checkpoint_dir=selection_root / f"{prefix}{step_counter}_candidates",
+            context=current_model_features,
+            run_digest=run_digest,
+        )
+        for feat in remaining_features:
+            metrics = candidate_metrics[feat]
+            for counter, count in metrics.pop('design_cache').items():
+                step_cache_counters[counter] += count
             valid = [x for x in metrics['ll'] if np.isfinite(x)]
 
             if valid:
@@ -1222,6 +1271,7 @@ def vocal_onset_model_selection(univariate_results_path: str,
             else:
                 print(format_selection_step(f"Step {step_counter}", feature=feat,
                                             decision='FAILED (no valid scores)'))
+        step_results_metadata['design_cache'] = design_cache.step_report(step_cache_counters)
 
         if (best_current_score - best_candidate_score) > best_candidate_se:
             print(format_selection_step(f"Step {step_counter}", feature=best_candidate,
@@ -1232,6 +1282,7 @@ def vocal_onset_model_selection(univariate_results_path: str,
             fname = f"{prefix}{step_counter}.pkl"
             with open(model_selection_dir / fname, 'wb') as f:
                 pickle.dump(_wrap_step(step_results_metadata), f)
+            scheduler.discard(selection_root / f"{prefix}{step_counter}_candidates")
 
             best_current_score, best_current_se, step_counter = best_candidate_score, best_candidate_se, step_counter + 1
         else:
@@ -1241,11 +1292,16 @@ def vocal_onset_model_selection(univariate_results_path: str,
             fname = f"{prefix}{step_counter}.pkl"
             with open(model_selection_dir / fname, 'wb') as f:
                 pickle.dump(_wrap_step(step_results_metadata), f)
+            scheduler.discard(selection_root / f"{prefix}{step_counter}_candidates")
             break
 
         if len(current_model_features) == len(ranked_features):
             break
 
+    if not scheduler.is_primary:
+        # The primary task of the job array refits and publishes the final model.
+        return
+
     print("\n--- Final Model Fit for Visualization (per-fold) ---")
     last_file = model_selection_dir / fname
 
@@ -1589,6 +1645,11 @@ def vocal_category_model_selection(
 
     model_selection_dir = Path(output_directory)
     model_selection_dir.mkdir(parents=True, exist_ok=True)
+    # Candidate checkpoints stay in the shared directory (`selection_root`); a
+    # non-primary task of a SLURM job array publishes its step pickles privately.
+    scheduler = CandidateScheduler.from_settings(settings)
+    selection_root = model_selection_dir
+    model_selection_dir = scheduler.publish_directory(model_selection_dir)
 
     # Extract target metadata safely
     fname = Path(univariate_results_path).name
@@ -1852,6 +1913,7 @@ def vocal_category_model_selection(
     # instead of `category_<col>_category_<idx>`.
     _cat_idx = target_category.replace('category_', '', 1)
     prefix = f"model_selection_category_{_column_name_cats}_{_cat_idx}_{target_condition}_step_"
+    run_digest = checkpoint_run_digest(settings_path, input_data_path, univariate_results_path, prefix)
     existing_steps = []
     if model_selection_dir.is_dir():
         for f_name in (p.name for p in model_selection_dir.iterdir()):
@@ -2031,6 +2093,47 @@ def vocal_category_model_selection(
                 pickle.dump(_wrap_step(step_results), f)
             step_counter = 1
 
+    # The rows of every fold split are candidate- and step-invariant: the
+    # training classes are balanced and shuffled with fold-seeded rngs, and every
+    # feature shares the event layout. Each (fold, feature) block -- pooled,
+    # balanced, permuted and then unrolled (pyGAM) or basis-projected (sklearn)
+    # -- is therefore built once and served from `design_cache`.
+    # `_balance_multivariate_arrays` draws its indices from the class counts
+    # alone, so balancing one feature at a time picks the rows it would pick for
+    # the whole trial list.
+    def _fold_class_arrays(f_name, idx):
+        if split_strategy == 'session':
+            (X_t,), (X_o,) = _pool_category_features(all_feature_data, [f_name], all_sessions_arr[idx], history_frames)
+            return X_t, X_o
+        return (pooled_category_cache[f_name]['target'][idx[idx < n_targ_total]],
+                pooled_category_cache[f_name]['other'][idx[idx >= n_targ_total] - n_targ_total])
+
+    fold_rows = []
+    for fold_i, (tr_idx, te_idx) in enumerate(cv_folds):
+        ref_tr_t, ref_tr_o = _fold_class_arrays(ranked_features[0], tr_idx)
+        ref_te_t, ref_te_o = _fold_class_arrays(ranked_features[0], te_idx)
+        _, _, y_tr_t, y_tr_o = _balance_multivariate_arrays([ref_tr_t], [ref_tr_o], random_seed + fold_i)
+        # Folds with a missing training class or no test events are skipped.
+        n_te_targ, n_te_other = ref_te_t.shape[0], ref_te_o.shape[0]
+        if y_tr_t is None or (n_te_targ + n_te_other) == 0:
+            fold_rows.append(None)
+            continue
+        y_tr = np.concatenate([y_tr_t, y_tr_o])
+        perm = np.random.default_rng(random_seed + fold_i).permutation(len(y_tr))
+        # Test set: natural class prior (no balancing).
+        y_te = np.concatenate([np.ones(n_te_targ), np.zeros(n_te_other)]).astype(int)
+
+        def _train_rows(f_name, tr_idx=tr_idx, fold_seed=random_seed + fold_i, perm=perm):
+            X_t, X_o = _fold_class_arrays(f_name, tr_idx)
+            X_t_bal, X_o_bal, _, _ = _balance_multivariate_arrays([X_t], [X_o], fold_seed)
+            return np.concatenate([X_t_bal[0], X_o_bal[0]], axis=0)[perm]
+
+        def _test_rows(f_name, te_idx=te_idx):
+            return np.concatenate(_fold_class_arrays(f_name, te_idx), axis=0)
+
+        fold_rows.append((_train_rows, _test_rows, y_tr[perm], y_te))
+
+    design_cache = DesignMatrixCache.from_settings(settings, history_frames)
     print("\n--- Starting Forward Selection ---")
     while True:
         print(format_selection_step(f"Step {step_counter}",
@@ -2041,24 +2144,18 @@ def vocal_category_model_selection(
         }
         best_cand_name, best_cand_score, best_cand_se = None, float('inf'), 0.0
 
-        # 'session' branch: pool the already-selected (base) features once per fold here
-        # (identical across candidates within the step), so the candidate loop below only
-        # pools the single new feature. _pool_category_features pools each feature
-        # independently in features_to_load order, so pool(base + [new]) is byte-identical
-        # to pool(base) + pool([new]). Empty when current_model_features is empty (step 0).
-        fold_base_pooled = []
-        if split_strategy == 'session':
-            for tr_idx, te_idx in cv_folds:
-                if current_model_features:
-                    b_tr_t, b_tr_o = _pool_category_features(all_feature_data, current_model_features, all_sessions_arr[tr_idx], history_frames)
-                    b_te_t, b_te_o = _pool_category_features(all_feature_data, current_model_features, all_sessions_arr[te_idx], history_frames)
-                else:
-                    b_tr_t, b_tr_o, b_te_t, b_te_o = [], [], [], []
-                fold_base_pooled.append((b_tr_t, b_tr_o, b_te_t, b_te_o))
+        # Build the already-selected features' blocks once here, so that worker
+        # processes of the candidate scheduler receive them with the cache.
+        step_cache_start = design_cache.snapshot()
+        design_cache.share({(fold_i, split): rows[split_idx]
+                            for fold_i, rows in enumerate(fold_rows) if rows is not None
+                            for split_idx, split in enumerate(('train', 'test'))},
+                           current_model_features, basis_matrix=basis_matrix)
+        step_cache_counters = design_cache.since(step_cache_start)
 
-        for i_feat, feat in enumerate(ranked_features):
-            if feat in current_model_features: continue
+        def _evaluate_candidate(feat):
             gc.collect()
+            cache_start = design_cache.snapshot()
             trial_feats = current_model_features + [feat]
 
             if model_type == 'pygam':
@@ -2070,55 +2167,15 @@ def vocal_category_model_selection(
                        'brier': [], 'ece': [], 'mcc': [],
                        'confusion_matrix': [], 'n_iter': [], 'converged': [], 'fit_time': []}
 
-            for fold_i, (tr_idx, te_idx) in enumerate(cv_folds):
+            for fold_i in range(len(cv_folds)):
                 try:
-                    if split_strategy == 'session':
-                        # Pool only the new candidate feature; the base features were
-                        # pooled once per fold above. List order matches trial_feats
-                        # (base first, then the new feat), so this is byte-identical.
-                        b_tr_t, b_tr_o, b_te_t, b_te_o = fold_base_pooled[fold_i]
-                        n_tr_t, n_tr_o = _pool_category_features(all_feature_data, [feat], all_sessions_arr[tr_idx], history_frames)
-                        n_te_t, n_te_o = _pool_category_features(all_feature_data, [feat], all_sessions_arr[te_idx], history_frames)
-                        X_tr_t_raw, X_tr_o_raw = b_tr_t + n_tr_t, b_tr_o + n_tr_o
-                        X_te_t_raw, X_te_o_raw = b_te_t + n_te_t, b_te_o + n_te_o
-                    else:
-                        # Reassemble the per-trial feature list from the
-                        # pre-pooled cache so every fold reuses the same dense
-                        # (target, other) arrays without re-concatenating per
-                        # session on each iteration.
-                        X_all_t_raw = [pooled_category_cache[f]['target'] for f in trial_feats]
-                        X_all_o_raw = [pooled_category_cache[f]['other'] for f in trial_feats]
-
-                        tr_targ_idx = tr_idx[tr_idx < n_targ_total]
-                        tr_other_idx = tr_idx[tr_idx >= n_targ_total] - n_targ_total
-                        te_targ_idx = te_idx[te_idx < n_targ_total]
-                        te_other_idx = te_idx[te_idx >= n_targ_total] - n_targ_total
-
-                        X_tr_t_raw = [x[tr_targ_idx] for x in X_all_t_raw]
-                        X_tr_o_raw = [x[tr_other_idx] for x in X_all_o_raw]
-                        X_te_t_raw = [x[te_targ_idx] for x in X_all_t_raw]
-                        X_te_o_raw = [x[te_other_idx] for x in X_all_o_raw]
-
-                    X_tr_t, X_tr_o, y_tr_t, y_tr_o = _balance_multivariate_arrays(X_tr_t_raw, X_tr_o_raw, random_seed + fold_i)
-
-                    # Test set: natural class prior (no balancing).
-                    if not X_tr_t or len(X_te_t_raw) == 0:
-                        continue
-                    n_te_targ = X_te_t_raw[0].shape[0]
-                    n_te_other = X_te_o_raw[0].shape[0]
-                    if (n_te_targ + n_te_other) == 0:
+                    if fold_rows[fold_i] is None:
                         continue
-
-                    X_tr_list = [np.concatenate([t, o], axis=0) for t, o in zip(X_tr_t, X_tr_o)]
-                    y_tr = np.concatenate([y_tr_t, y_tr_o])
-                    perm = np.random.default_rng(random_seed + fold_i).permutation(len(y_tr))
-
-                    X_te_list = [np.concatenate([t, o], axis=0) for t, o in zip(X_te_t_raw, X_te_o_raw)]
-                    y_te = np.concatenate([np.ones(n_te_targ), np.zeros(n_te_other)]).astype(int)
+                    train_rows, test_rows, y_tr, y_te = fold_rows[fold_i]
 
                     if model_type == 'sklearn':
-                        X_tr_stacked = np.hstack([np.dot(x[perm], basis_matrix) for x in X_tr_list])
-                        X_te_stacked = np.hstack([np.dot(x, basis_matrix) for x in X_te_list])
+                        X_tr_stacked = design_cache.projected((fold_i, 'train'), trial_feats, train_rows, basis_matrix)
+                        X_te_stacked = design_cache.projected((fold_i, 'test'), trial_feats, test_rows, basis_matrix)
 
                         model = LogisticRegressionCV(
                             penalty=lr_params['penalty'],
@@ -2130,7 +2187,7 @@ def vocal_category_model_selection(
                             random_state=random_seed
                         )
                         fit_start = time.perf_counter()
-                        model.fit(X_tr_stacked, y_tr[perm])
+                        model.fit(X_tr_stacked, y_tr)
                         fit_time = float(time.perf_counter() - fit_start)
                         y_proba = model.predict_proba(X_te_stacked)[:, 1]
                         y_pred = model.predict(X_te_stacked)
@@ -2140,13 +2197,13 @@ def vocal_category_model_selection(
                         except Exception:
                             fold_n_iter, fold_converged = np.nan, False
                     else:
-                        X_tr_gam = get_unrolled_X_for_multivariate([x[perm] for x in X_tr_list], history_frames)
-                        y_tr_gam = np.repeat(y_tr[perm].astype(float), history_frames)
+                        X_tr_gam = design_cache.design((fold_i, 'train'), trial_feats, train_rows)
+                        y_tr_gam = design_cache.repeated_labels((fold_i, 'train'), y_tr.astype(float))
                         fit_start = time.perf_counter()
                         gam = LogisticGAM(gam_terms, **gam_kwargs).fit(X_tr_gam, y_tr_gam)
                         fit_time = float(time.perf_counter() - fit_start)
 
-                        X_te_gam = get_unrolled_X_for_multivariate(X_te_list, history_frames)
+                        X_te_gam = design_cache.design((fold_i, 'test'), trial_feats, test_rows)
                         y_proba_tiled = gam.predict_proba(X_te_gam)
                         y_proba = np.mean(y_proba_tiled.reshape(len(y_te), history_frames), axis=1)
                         y_pred = (y_proba >= settings['diagnostics']['binary_decision_threshold']).astype(int)
@@ -2182,7 +2239,20 @@ def vocal_category_model_selection(
                             metrics[_k].append(np.full((2, 2), np.nan))
                         else:
                             metrics[_k].append(np.nan)
-
+            metrics['design_cache'] = design_cache.since(cache_start)
+            return metrics
+
+        remaining_features = [feat for feat in ranked_features if feat not in current_model_features]
+        candidate_metrics = scheduler.evaluate(
+            remaining_features, _evaluate_candidate,
+            checkpoint_dir=selection_root / f"{prefix}{step_counter}_candidates",
+            context=current_model_features,
+            run_digest=run_digest,
+        )
+        for feat in remaining_features:
+            metrics = candidate_metrics[feat]
+            for counter, count in metrics.pop('design_cache').items():
+                step_cache_counters[counter] += count
             valid = [x for x in metrics['ll'] if np.isfinite(x)]
             if not valid:
                 print(format_selection_step(f"Step {step_counter}", feature=feat,
@@ -2209,6 +2279,7 @@ def vocal_category_model_selection(
             }
             if mean_ll < best_cand_score:
                 best_cand_score, best_cand_se, best_cand_name = mean_ll, se_ll, feat
+        step_results_metadata['design_cache'] = design_cache.step_report(step_cache_counters)
 
         if best_cand_name and (best_current_score - best_cand_score) > best_cand_se:
             print(format_selection_step(f"Step {step_counter}", feature=best_cand_name,
@@ -2217,6 +2288,7 @@ def vocal_category_model_selection(
             step_results_metadata['selected_feature'] = best_cand_name
             with open(model_selection_dir / f"{prefix}{step_counter}.pkl", 'wb') as f:
                 pickle.dump(_wrap_step(step_results_metadata), f)
+            scheduler.discard(selection_root / f"{prefix}{step_counter}_candidates")
             # Track `best_current_se` alongside the score so the 1SE acceptance
             # test always compares against the *current* accepted model's
             # sampling variability rather than a stale Step-0 value.
@@ -2228,8 +2300,13 @@ def vocal_category_model_selection(
             step_results_metadata['selected_feature'] = None
             with open(model_selection_dir / f"{prefix}{step_counter}.pkl", 'wb') as f:
                 pickle.dump(_wrap_step(step_results_metadata), f)
+            scheduler.discard(selection_root / f"{prefix}{step_counter}_candidates")
             break
 
+    if not scheduler.is_primary:
+        # The primary task of the job array refits and publishes the final model.
+        return
+
     print("\n--- Final Refit for Visualization (CV-based) ---")
     try:
         last_file = model_selection_dir / f"{prefix}{step_counter}.pkl"
@@ -2534,6 +2611,11 @@ def bout_parameter_model_selection(
 
     model_selection_dir = Path(output_directory)
     model_selection_dir.mkdir(parents=True, exist_ok=True)
+    # Candidate checkpoints stay in the shared directory (`selection_root`); a
+    # non-primary task of a SLURM job array publishes its step pickles privately.
+    scheduler = CandidateScheduler.from_settings(settings)
+    selection_root = model_selection_dir
+    model_selection_dir = scheduler.publish_directory(model_selection_dir)
 
     with open(univariate_results_path, 'rb') as f:
         univariate_data = pickle.load(f)
@@ -2756,6 +2838,7 @@ def bout_parameter_model_selection(
     target_condition = cond_match.group(1) if cond_match else "unknown"
 
     prefix = f"model_selection_{target_variable}_{target_condition}_{split_strategy}_step_"
+    run_digest = checkpoint_run_digest(settings_path, input_data_path, univariate_results_path, prefix)
 
     # Selection-level run metadata + step-wrapper, frozen here so every
     # step file carries an identical block.
@@ -2988,26 +3071,24 @@ def bout_parameter_model_selection(
                                             detail='<= 0; reverting to empty start'))
 
     # 6. Forward Selection Loop
+    # Every (fold, feature) block -- the fold's rows, unrolled (pyGAM) or
+    # basis-projected (sklearn) -- is the same at every step, so it is built once
+    # and served from `design_cache`; a step only adds the candidate's block to
+    # the already-selected ones. Byte-identical: hstack is associative, so
+    # hstack(base_projs + [new_proj]) == hstack([hstack(base_projs), new_proj]).
+    fold_rows = {}
+    for fold_idx, (tr_idx, te_idx) in enumerate(cv_folds):
+        fold_rows[(fold_idx, 'train')] = lambda f_name, tr_idx=tr_idx: all_feature_data[f_name]['X'][tr_idx]
+        fold_rows[(fold_idx, 'test')] = lambda f_name, te_idx=te_idx: all_feature_data[f_name]['X'][te_idx]
+
+    design_cache = DesignMatrixCache.from_settings(settings, history_frames)
     print("\n--- Starting Forward Selection ---")
     while True:
-        fold_base_X_tr, fold_base_X_te = [], []
-        for tr_idx, te_idx in cv_folds:
-            fold_base_X_tr.append([all_feature_data[f]['X'][tr_idx] for f in current_model_features])
-            fold_base_X_te.append([all_feature_data[f]['X'][te_idx] for f in current_model_features])
-
-        # For the sklearn path the basis projection of the already-selected features is
-        # identical across every candidate in this step, so project the fixed base once
-        # per fold here instead of re-projecting it inside the candidate loop. `None`
-        # marks the step-0 empty base (np.hstack of [] would raise); the candidate loop
-        # then projects only the new feature and hstacks it on. Byte-identical: hstack is
-        # associative, so hstack([base_proj, new_proj]) == hstack(base_projs + [new_proj]).
-        fold_base_proj_tr, fold_base_proj_te = [], []
-        if model_type == 'sklearn':
-            for fold_idx in range(len(cv_folds)):
-                base_tr = fold_base_X_tr[fold_idx]
-                base_te = fold_base_X_te[fold_idx]
-                fold_base_proj_tr.append(np.hstack([np.dot(x, basis_matrix) for x in base_tr]) if base_tr else None)
-                fold_base_proj_te.append(np.hstack([np.dot(x, basis_matrix) for x in base_te]) if base_te else None)
+        # Build the already-selected features' blocks once here, so that worker
+        # processes of the candidate scheduler receive them with the cache.
+        step_cache_start = design_cache.snapshot()
+        design_cache.share(fold_rows, current_model_features, basis_matrix=basis_matrix)
+        step_cache_counters = design_cache.since(step_cache_start)
 
         best_cand, best_cand_score, best_cand_se = None, -float('inf'), 0.0
         step_results = {
@@ -3016,9 +3097,10 @@ def bout_parameter_model_selection(
             'selected_feature': None
         }
 
-        for feat in ranked_features:
-            if feat in current_model_features: continue
+        def _evaluate_candidate(feat):
             gc.collect()
+            cache_start = design_cache.snapshot()
+            trial_features = current_model_features + [feat]
 
             metrics = {
                 'explained_deviance': [], 'residual_deviance': [],
@@ -3035,19 +3117,11 @@ def bout_parameter_model_selection(
 
             for fold_idx, (tr_idx, te_idx) in enumerate(cv_folds):
                 try:
-                    trial_tr = fold_base_X_tr[fold_idx] + [all_feature_data[feat]['X'][tr_idx]]
-                    trial_te = fold_base_X_te[fold_idx] + [all_feature_data[feat]['X'][te_idx]]
                     y_tr, y_te = y_global[tr_idx], y_global[te_idx]
 
                     if model_type == 'sklearn':
-                        # Project only the new candidate feature; the fixed base
-                        # projection was precomputed once per fold above and hstacked on.
-                        new_proj_tr = np.dot(all_feature_data[feat]['X'][tr_idx], basis_matrix)
-                        new_proj_te = np.dot(all_feature_data[feat]['X'][te_idx], basis_matrix)
-                        base_proj_tr = fold_base_proj_tr[fold_idx]
-                        base_proj_te = fold_base_proj_te[fold_idx]
-                        X_tr_stacked = np.hstack([base_proj_tr, new_proj_tr]) if base_proj_tr is not None else new_proj_tr
-                        X_te_stacked = np.hstack([base_proj_te, new_proj_te]) if base_proj_te is not None else new_proj_te
+                        X_tr_stacked = design_cache.projected((fold_idx, 'train'), trial_features, fold_rows[(fold_idx, 'train')], basis_matrix)
+                        X_te_stacked = design_cache.projected((fold_idx, 'test'), trial_features, fold_rows[(fold_idx, 'test')], basis_matrix)
 
                         # Gamma GLM (log link), matching the anchor fit and the
                         # pyGAM branch — fit and Gamma-deviance score share one
@@ -3067,11 +3141,11 @@ def bout_parameter_model_selection(
                         fold_n_iter = int(np.max(np.atleast_1d(best.n_iter_)))
                         fold_converged = bool(fold_n_iter < best.max_iter)
                     else:
-                        X_tr_gam = get_unrolled_X_for_multivariate(trial_tr, history_frames)
-                        X_te_gam = get_unrolled_X_for_multivariate(trial_te, history_frames)
+                        X_tr_gam = design_cache.design((fold_idx, 'train'), trial_features, fold_rows[(fold_idx, 'train')])
+                        X_te_gam = design_cache.design((fold_idx, 'test'), trial_features, fold_rows[(fold_idx, 'test')])
 
                         fit_start = time.perf_counter()
-                        gam = GAM(gam_terms, distribution='gamma', link='log', **gam_kwargs).fit(X_tr_gam, np.repeat(y_tr + 1e-6, history_frames))
+                        gam = GAM(gam_terms, distribution='gamma', link='log', **gam_kwargs).fit(X_tr_gam, design_cache.repeated_labels((fold_idx, 'train'), y_tr + 1e-6))
                         fit_time = float(time.perf_counter() - fit_start)
 
                         # Aggregate the H per-frame predictions on the linear-predictor scale (see anchor fit).
@@ -3120,7 +3194,20 @@ def bout_parameter_model_selection(
                     metrics['n_iter'].append(np.nan)
                     metrics['converged'].append(False)
                     metrics['fit_time'].append(np.nan)
-
+            metrics['design_cache'] = design_cache.since(cache_start)
+            return metrics
+
+        remaining_features = [feat for feat in ranked_features if feat not in current_model_features]
+        candidate_metrics = scheduler.evaluate(
+            remaining_features, _evaluate_candidate,
+            checkpoint_dir=selection_root / f"{prefix}{step_counter}_candidates",
+            context=current_model_features,
+            run_digest=run_digest,
+        )
+        for feat in remaining_features:
+            metrics = candidate_metrics[feat]
+            for counter, count in metrics.pop('design_cache').items():
+                step_cache_counters[counter] += count
             valid = [m for m in metrics['explained_deviance'] if np.isfinite(m)]
             if not valid:
                 print(format_selection_step(f"Step {step_counter}", feature=feat,
@@ -3142,6 +3229,7 @@ def bout_parameter_model_selection(
 
             if m_dev > best_cand_score:
                 best_cand_score, best_cand_se, best_cand = m_dev, s_dev, feat
+        step_results['design_cache'] = design_cache.step_report(step_cache_counters)
 
         if (best_cand_score - best_cand_se) > best_current_score:
             print(format_selection_step(f"Step {step_counter}", feature=best_cand,
@@ -3151,6 +3239,7 @@ def bout_parameter_model_selection(
 
             with open(model_selection_dir / f"{prefix}{step_counter}.pkl", 'wb') as f:
                 pickle.dump(_wrap_step(step_results), f)
+            scheduler.discard(selection_root / f"{prefix}{step_counter}_candidates")
 
             best_current_score = best_cand_score
             best_current_se = best_cand_se
@@ -3161,10 +3250,15 @@ def bout_parameter_model_selection(
             step_results['selected_feature'] = None
             with open(model_selection_dir / f"{prefix}{step_counter}.pkl", 'wb') as f:
                 pickle.dump(_wrap_step(step_results), f)
+            scheduler.discard(selection_root / f"{prefix}{step_counter}_candidates")
             break
 
         if len(current_model_features) == len(ranked_features): break
 
+    if not scheduler.is_primary:
+        # The primary task of the job array refits and publishes the final model.
+        return
+
     # 7. Final Model Fit for Visualization
     print("\n--- Final Model Fit for Visualization (CV-based) ---")
     try:
@@ -3449,8 +3543,17 @@ def multinomial_vocal_category_model_selection(
     except FileNotFoundError:
         raise FileNotFoundError(f"Settings file not found at {settings_path}")
 
+    # Persistent XLA cache + compile-time accounting for the whole selection run.
+    configure_compilation_cache(settings)
+    start_compile_accounting()
+
     model_selection_dir = Path(output_directory)
     model_selection_dir.mkdir(parents=True, exist_ok=True)
+    # Candidate checkpoints stay in the shared directory (`selection_root`); a
+    # non-primary task of a SLURM job array publishes its step pickles privately.
+    scheduler = CandidateScheduler.from_settings(settings)
+    selection_root = model_selection_dir
+    model_selection_dir = scheduler.publish_directory(model_selection_dir)
 
     # Standardized run header (files used + config). The multinomial task always
     # runs the JAX estimator, so the engine label is 'jax'.
@@ -3510,8 +3613,9 @@ def multinomial_vocal_category_model_selection(
         return
 
     print("Loading and binning raw input data...")
-    with open(input_data_path, 'rb') as f:
-        raw_data = pickle.load(f)
+    # Only the ranked candidates are read; a per-feature store never touches
+    # the rest of the feature zoo.
+    raw_data = load_modeling_input(input_data_path, features=ranked_features)
 
     # Final upstream-metadata harvest. The univariate-side blocks were
     # captured above; the input-side block falls back to the Level-1
@@ -3751,6 +3855,7 @@ def multinomial_vocal_category_model_selection(
     # `qlvm_category`.
     _column_name_cats = _input_md['analysis_specific']['usv_category_column_name']
     prefix = f"model_selection_multinomial_{_column_name_cats}_{target_condition}_{split_strategy}_step_"
+    run_digest = checkpoint_run_digest(settings_path, input_data_path, univariate_results_path, prefix)
 
     _run_md = build_selection_metadata(
         modeling_settings=settings,
@@ -3779,7 +3884,8 @@ def multinomial_vocal_category_model_selection(
         },
         settings_path=settings_path,
     )
-    _wrap_step = _make_step_wrapper(_input_md, _univariate_md, _run_md)
+    _wrap_step = _make_step_wrapper(_input_md, _univariate_md, _run_md,
+                                    compile_profile_fn=compile_profile)
 
     existing_steps = []
     if model_selection_dir.is_dir():
@@ -4159,8 +4265,7 @@ def multinomial_vocal_category_model_selection(
         # alongside. `None` marks the step-0 empty base (np.hstack of [] would
         # raise); the candidate loop then slices only the new feature and
         # hstacks it on. Byte-identical: hstack is associative column-wise, so
-        # hstack([base, new]) == hstack(base_cols + [new]). Mirrors the
-        # bout-parameter selector's fold_base_proj caching.
+        # hstack([base, new]) == hstack(base_cols + [new]).
         fold_tr_idx_model, fold_base_tr, fold_base_te = [], [], []
         for fold_idx, (tr_idx, te_idx) in enumerate(cv_folds):
             tr_idx_model = _fold_train_indices_for_model(tr_idx, fold_idx)
@@ -4174,9 +4279,7 @@ def multinomial_vocal_category_model_selection(
                 if current_model_features else None
             )
 
-        for i_feat, feat in enumerate(ranked_features):
-            if feat in current_model_features:
-                continue
+        def _evaluate_candidate(feat):
             gc.collect()
 
             trial_feats = current_model_features + [feat]
@@ -4330,7 +4433,17 @@ def multinomial_vocal_category_model_selection(
                         'one_se_applied': False, 'one_se_threshold': None,
                     })
                     cand_data['folds']['hyperparams_tuned'].append(False)
-
+            return cand_data
+
+        remaining_features = [feat for feat in ranked_features if feat not in current_model_features]
+        candidate_data = scheduler.evaluate(
+            remaining_features, _evaluate_candidate,
+            checkpoint_dir=selection_root / f"{prefix}{step_counter}_candidates",
+            context=current_model_features,
+            run_digest=run_digest,
+        )
+        for feat in remaining_features:
+            cand_data = candidate_data[feat]
             valid_auc = [x for x in cand_data['folds']['metrics']['auc'] if np.isfinite(x)]
             # Surface PARTIAL fold failure for this candidate (some folds
             # diverged, others survived): otherwise the candidate's mean AUC is
@@ -4367,6 +4480,7 @@ def multinomial_vocal_category_model_selection(
             current_model_features.append(best_cand)
             with open(model_selection_dir / f"{prefix}{step_counter}.pkl", 'wb') as f:
                 pickle.dump(_wrap_step(step_results), f)
+            scheduler.discard(selection_root / f"{prefix}{step_counter}_candidates")
             best_current_score, best_current_se, step_counter = best_cand_score, best_cand_se, step_counter + 1
         else:
             print(format_selection_step(f"Step {step_counter}", decision='REJECT',
@@ -4374,11 +4488,16 @@ def multinomial_vocal_category_model_selection(
             step_results['selected_feature'] = None
             with open(model_selection_dir / f"{prefix}{step_counter}.pkl", 'wb') as f:
                 pickle.dump(_wrap_step(step_results), f)
+            scheduler.discard(selection_root / f"{prefix}{step_counter}_candidates")
             break
 
         if len(current_model_features) == len(ranked_features):
             break
 
+    if not scheduler.is_primary:
+        # The primary task of the job array refits and publishes the final model.
+        return
+
     # 7. Final Data Promotion for Visualization
     print("\n--- Finalizing Results for Visualization ---")
     try:
@@ -4713,8 +4832,17 @@ def continuous_vocal_manifold_model_selection(
     except FileNotFoundError:
         raise FileNotFoundError(f"Settings file not found at {settings_path}")
 
+    # Persistent XLA cache + compile-time accounting for the whole selection run.
+    configure_compilation_cache(settings)
+    start_compile_accounting()
+
     model_selection_dir = Path(output_directory)
     model_selection_dir.mkdir(parents=True, exist_ok=True)
+    # Candidate checkpoints stay in the shared directory (`selection_root`); a
+    # non-primary task of a SLURM job array publishes its step pickles privately.
+    scheduler = CandidateScheduler.from_settings(settings)
+    selection_root = model_selection_dir
+    model_selection_dir = scheduler.publish_directory(model_selection_dir)
 
     # Standardized run header (files used + config). The continuous/manifold
     # task always runs the JAX estimators, so the engine label is 'jax'.
@@ -4774,6 +4902,9 @@ def continuous_vocal_manifold_model_selection(
     SELECTION_SCORE_KEY = resolve_manifold_selection_score_key(
         settings, _selection_manifold_metric
     )
+    # How `dcor_xy` is estimated (`vocal_features.usv_manifold_dcor`): shared by
+    # the Step-0 baseline, every candidate fit, the inner-CV tuner and the gate.
+    dcor_kwargs = resolve_manifold_dcor_settings(settings)
     # The screen tests `actual` against the within-session-shuffle `null`
     # baseline on BOTH geometries: the shuffle preserves session-level structure
     # and destroys the trial-level X->Y pairing, so beating it isolates genuine
@@ -4851,6 +4982,7 @@ def continuous_vocal_manifold_model_selection(
             # below uses the per-region MACRO score once `region_global` exists.
             event_to_region=None,
             min_region_events=_min_region_events,
+            dcor_settings=dcor_kwargs,
         )
         if stat['n_folds'] < 2:
             continue
@@ -4918,12 +5050,11 @@ def continuous_vocal_manifold_model_selection(
           f"(effect floor {_effect_floor:.4f} = {_SELECTION_EFFECT_FLOOR:.2g} x top margin "
           f"{_top_margin:.4f}). Top: {ranked_features[0]}")
 
-    # Load the raw input pickle only NOW, after the screen has confirmed there is
+    # Load the raw modeling input only NOW, after the screen has confirmed there is
     # something to fit -- so the abort / stale-ranking-raise paths above never
     # touch `input_data_path` (the contract two abort tests rely on).
     print("Loading and binning raw continuous input data...")
-    with open(input_data_path, 'rb') as f:
-        raw_data = pickle.load(f)
+    raw_data = load_modeling_input(input_data_path, features=ranked_features)
 
     # Final upstream-metadata harvest: prefer the univariate copy, fall back to
     # the input pickle's own block for legacy runs.
@@ -5187,6 +5318,7 @@ def continuous_vocal_manifold_model_selection(
     # in the filename.
     _column_name_cats = _input_md['analysis_specific']['usv_category_column_name']
     prefix = f"model_selection_continuous_manifold_{_column_name_cats}_{target_condition}_{split_strategy}_step_"
+    run_digest = checkpoint_run_digest(settings_path, input_data_path, univariate_results_path, prefix)
 
     _run_md = build_selection_metadata(
         modeling_settings=settings,
@@ -5233,7 +5365,8 @@ def continuous_vocal_manifold_model_selection(
         },
         settings_path=settings_path,
     )
-    _wrap_step = _make_step_wrapper(_input_md, _univariate_md, _run_md)
+    _wrap_step = _make_step_wrapper(_input_md, _univariate_md, _run_md,
+                                    compile_profile_fn=compile_profile)
 
     existing_steps = []
     if model_selection_dir.is_dir():
@@ -5336,6 +5469,7 @@ def continuous_vocal_manifold_model_selection(
         'spearman_x',
         'spearman_y',
         'dcor_xy',
+        'dcor_xy_stderr',
         'vm_logscore',
         'vm_logscore_pooled',
         'density_geodesic_mae',
@@ -5365,13 +5499,14 @@ def continuous_vocal_manifold_model_selection(
                     except Exception as _decode_err:
                         print(f"    [geodesic] decoder unavailable ({_decode_err}); "
                               f"pullback_geodesic_mae -> NaN")
-                geodesic_ctx = build_torus_geodesic_context(
-                    np.asarray(y_global, dtype=np.float64), decode_fn=_geo_decode_fn,
+                geodesic_ctx, _geo_hit = cached_torus_geodesic_context(
+                    np.asarray(y_global, dtype=np.float64), cache_dir=_geo_cfg.get('cache_dir'),
+                    decode_fn=_geo_decode_fn, decoder_weights_npz_path=_geo_weights_path,
                     n_per_dim=int(_geo_cfg['grid_n_per_dim']), period=manifold_period,
                     k=int(_geo_cfg['graph_k']),
                     density_exponent=float(_geo_cfg['density_exponent']),
                 )
-                print(f"    [geodesic] reference map built: "
+                print(f"    [geodesic] reference map {'loaded from cache' if _geo_hit else 'built'}: "
                       f"{int(_geo_cfg['grid_n_per_dim'])}^2 grid, "
                       f"pullback={'on' if _geo_decode_fn is not None else 'off'}")
             except Exception as _geo_err:
@@ -5437,6 +5572,7 @@ def continuous_vocal_manifold_model_selection(
                 train_cov_inv=cov_inv, random_state=random_seed + fold_idx,
                 region_labels=region_global[te_idx], min_region_events=_min_region_events,
                 kappa=kappa_frozen,
+                **dcor_kwargs,
             )
             bundle.update(geodesic_mae_columns(y_pred_xy, Y_te, geodesic_ctx))
             f_met = baseline_data['folds']['metrics']
@@ -5609,6 +5745,7 @@ def continuous_vocal_manifold_model_selection(
             period=manifold_period,
             region_train=region_tr_,
             kappa=kappa_frozen,
+            dcor_settings=dcor_kwargs,
         )
         return lam_sm_win, lam_l2_win, grid_audit_, True
 
@@ -5660,6 +5797,7 @@ def continuous_vocal_manifold_model_selection(
                     X_te, Y_te, weights=w_te,
                     region_labels=region_te, min_region_events=_min_region_events,
                     kappa=kappa_frozen,
+                    **dcor_kwargs,
                 )
                 y_pred_xy = model.predict(X_te, snap=True).astype(np.float32)
                 metrics.update(geodesic_mae_columns(y_pred_xy, Y_te, geodesic_ctx))
@@ -5729,6 +5867,7 @@ def continuous_vocal_manifold_model_selection(
                 random_state=random_seed,
                 event_to_region=event_to_region, min_region_events=_min_region_events,
                 kappa=kappa_frozen,
+                dcor_settings=dcor_kwargs,
             )
             cand_data['fold_improvement'] = anchor_improvement
             if anchor_improvement['ci_low'] > 0.0:
@@ -5782,7 +5921,7 @@ def continuous_vocal_manifold_model_selection(
         # (np.hstack of [] would raise); the candidate loop then slices only the
         # new feature and hstacks it on. Byte-identical: hstack is associative
         # column-wise, so hstack([base, new]) == hstack(base_cols + [new]).
-        # Mirrors the bout-parameter / multinomial selectors' base caching.
+        # Mirrors the multinomial selector's base caching.
         fold_base_tr, fold_base_te = [], []
         for tr_idx, te_idx in cv_folds:
             fold_base_tr.append(
@@ -5794,8 +5933,7 @@ def continuous_vocal_manifold_model_selection(
                 if current_model_features else None
             )
 
-        for i_feat, feat in enumerate(ranked_features):
-            if feat in current_model_features: continue
+        def _evaluate_candidate(feat):
             gc.collect()
 
             trial_feats = current_model_features + [feat]
@@ -5857,6 +5995,7 @@ def continuous_vocal_manifold_model_selection(
                         X_te_stacked, Y_te, weights=w_te,
                         region_labels=region_te, min_region_events=_min_region_events,
                         kappa=kappa_frozen,
+                        **dcor_kwargs,
                     )
                     y_pred_xy = model.predict(X_te_stacked, snap=True).astype(np.float32)
                     metrics.update(geodesic_mae_columns(y_pred_xy, Y_te, geodesic_ctx))
@@ -5884,7 +6023,17 @@ def continuous_vocal_manifold_model_selection(
                 except Exception as e:
                     print(f"    [!] Error fitting {feat} (Fold {fold_idx}): {e}")
                     _append_failed_fold(cand_data)
-
+            return cand_data
+
+        remaining_features = [feat for feat in ranked_features if feat not in current_model_features]
+        candidate_data = scheduler.evaluate(
+            remaining_features, _evaluate_candidate,
+            checkpoint_dir=selection_root / f"{prefix}{step_counter}_candidates",
+            context=current_model_features,
+            run_digest=run_digest,
+        )
+        for feat in remaining_features:
+            cand_data = candidate_data[feat]
             _all_cand_scores = np.asarray(
                 cand_data['folds']['metrics'][SELECTION_SCORE_KEY], dtype=float
             )
@@ -5942,6 +6091,7 @@ def continuous_vocal_manifold_model_selection(
                 random_state=random_seed,
                 event_to_region=event_to_region, min_region_events=_min_region_events,
                 kappa=kappa_frozen,
+                dcor_settings=dcor_kwargs,
             )
             step_results['candidates_summary'][best_cand]['fold_improvement'] = step_improvement
 
@@ -5956,6 +6106,7 @@ def continuous_vocal_manifold_model_selection(
 
             with open(model_selection_dir / f"{prefix}{step_counter}.pkl", 'wb') as f:
                 pickle.dump(_wrap_step(step_results), f)
+            scheduler.discard(selection_root / f"{prefix}{step_counter}_candidates")
 
             best_current_score = best_cand_score
             best_current_se = best_cand_se
@@ -5974,11 +6125,16 @@ def continuous_vocal_manifold_model_selection(
             step_results['selected_feature'] = None
             with open(model_selection_dir / f"{prefix}{step_counter}.pkl", 'wb') as f:
                 pickle.dump(_wrap_step(step_results), f)
+            scheduler.discard(selection_root / f"{prefix}{step_counter}_candidates")
             break
 
         if len(current_model_features) == len(ranked_features):
             break
 
+    if not scheduler.is_primary:
+        # The primary task of the job array refits and publishes the final model.
+        return
+
     print("\n--- Finalizing Results ---")
     try:
         last_file_path = model_selection_dir / f"{prefix}{step_counter}.pkl"
@@ -6052,6 +6208,7 @@ def continuous_vocal_manifold_model_selection(
                     X_held, Y_held, weights=w_held,
                     region_labels=region_held, min_region_events=_min_region_events,
                     kappa=kappa_frozen,
+                    **dcor_kwargs,
                 )
                 held_pred_xy = held_model.predict(X_held, snap=True).astype(np.float32)
                 held_metrics.update(geodesic_mae_columns(held_pred_xy, Y_held, geodesic_ctx))
@@ -6097,6 +6254,7 @@ def continuous_vocal_manifold_model_selection(
                     train_cov_inv=cov_inv, random_state=held_seed,
                     region_labels=region_held, min_region_events=_min_region_events,
                     kappa=kappa_frozen,
+                    **dcor_kwargs,
                 )
                 held_bundle.update(geodesic_mae_columns(held_pred_xy, Y_held, geodesic_ctx))
                 heldout_result = {
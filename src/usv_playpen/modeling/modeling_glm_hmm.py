@@ -44,6 +44,7 @@ from .modeling_metadata import (
     get_package_version,
     inject_metadata,
 )
+from .modeling_input_store import load_modeling_input
 from .modeling_utils import held_out_session_ids_from_metadata
 
 
@@ -327,6 +328,7 @@ def run_glm_hmm_state_selection(input_data_path: str, settings_path: str,
     n_em_iters = int(glm_hmm_settings['n_em_iters'])
     n_lbfgs = int(glm_hmm_settings['n_lbfgs'])
     n_restarts = int(glm_hmm_settings['n_restarts'])
+    n_jobs = int(glm_hmm_settings['n_jobs'])
     em_tol = float(glm_hmm_settings['em_tol'])
     transition_pseudocount = float(glm_hmm_settings['transition_pseudocount'])
     lambda_smooth = float(glm_hmm_settings['lambda_smooth'])
@@ -334,8 +336,8 @@ def run_glm_hmm_state_selection(input_data_path: str, settings_path: str,
     l2_reg = float(glm_hmm_settings['l2_reg'])
     random_seed = int(settings['model_validation']['random_seed'])
 
-    with open(input_data_path, 'rb') as input_file:
-        raw_data = pickle.load(input_file)
+    # Only the selected emission features are read from a per-feature store.
+    raw_data = load_modeling_input(input_data_path, features=emission_features)
     input_metadata = raw_data.pop('_input_metadata', {})
 
     # Manifold geometry from the pickle's own record (the extraction stage writes
@@ -434,7 +436,8 @@ def run_glm_hmm_state_selection(input_data_path: str, settings_path: str,
         model = GLMHMM(
             n_states=n_states, emission_factory=factory, n_em_iters=n_em_iters,
             n_restarts=n_restarts, tol=em_tol,
-            transition_pseudocount=transition_pseudocount, random_state=random_seed)
+            transition_pseudocount=transition_pseudocount, random_state=random_seed,
+            n_jobs=n_jobs)
         return model.fit(train_sequences)
 
     print(f"GLM-HMM state selection | emission={emission_descriptor} | "
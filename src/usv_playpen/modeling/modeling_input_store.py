@@ -0,0 +1,261 @@
+"""
+@author: bartulem
+Per-feature, random-access storage for the Level-1 modeling inputs.
+
+The `extract_and_save_*` methods of the modeling pipelines used to write one
+monolithic pickle holding every feature of every session, and every consumer
+-- each SLURM array task of `main_univariate_dispatcher`, the model-selection
+entry points, the JAX runners -- had to deserialize all of it to use one
+feature or a handful. This module writes the same artifact as an HDF5 store
+instead:
+
+    /                      attrs: format, format_version
+    /features/<feature>    one group per feature, mirroring the artifact's
+                           nested dict (sessions -> arrays)
+    /metadata/<block>      the reserved metadata blocks (`_input_metadata`, ...)
+
+Numeric arrays become contiguous, uncompressed datasets, so a reader can open
+one feature's group without touching the others and, optionally, memory-map
+its arrays straight from the file. Anything else (string label arrays, the
+metadata blocks, non-string keys) is stored as a pickled blob and round-trips
+exactly. Readers list the features in sorted order (as the legacy reader
+does); the order of the nested dicts within a feature is preserved.
+
+`ModelingInputReader` is the single entry point for consumers. It reads both
+the HDF5 store and the legacy pickle, so every artifact written before the
+switch still loads. Which format the extractors write is set by
+`io.modeling_input_format` (`'hdf5'` or `'pickle'`).
+"""
+
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+import h5py
+import numpy as np
+
+from .modeling_metadata import RESERVED_METADATA_KEYS
+from ..os_utils import atomic_output_path
+
+#: File suffix per `io.modeling_input_format` value.
+MODELING_INPUT_FORMATS = {'hdf5': '.h5', 'pickle': '.pkl'}
+
+STORE_FORMAT = 'usv_playpen.modeling_input'
+STORE_FORMAT_VERSION = 1
+
+# dtype kinds written as plain (memory-mappable) datasets; everything else is pickled.
+_NUMERIC_KINDS = 'biufc'
+
+
+def modeling_input_suffix(modeling_settings: dict) -> str:
+    """
+    Description
+    -----------
+    File suffix of the modeling-input artifact the extractors write, from
+    `io.modeling_input_format`.
+
+    Parameters
+    ----------
+    modeling_settings (dict)
+        The loaded modeling settings.
+
+    Returns
+    -------
+    suffix (str)
+        `'.h5'` for the per-feature store, `'.pkl'` for the legacy pickle.
+    """
+
+    input_format = modeling_settings['io']['modeling_input_format']
+    if input_format not in MODELING_INPUT_FORMATS:
+        raise ValueError(f"io.modeling_input_format must be one of {sorted(MODELING_INPUT_FORMATS)}, "
+                         f"got {input_format!r}.")
+    return MODELING_INPUT_FORMATS[input_format]
+
+
+def _encode_key(key: str) -> str:
+    # HDF5 reserves '/' as the path separator (and '.' as a lone name).
+    return quote(key, safe='') if key != '.' else '%2E'
+
+
+def _write_blob(group: h5py.Group, name: str, value) -> None:
+    dataset = group.create_dataset(name, data=np.void(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+    dataset.attrs['encoding'] = 'pickle'
+
+
+def _write_node(group: h5py.Group, node: dict) -> None:
+    for key, value in node.items():
+        name = _encode_key(key)
+        if isinstance(value, dict) and all(isinstance(k, str) for k in value):
+            _write_node(group.create_group(name, track_order=True), value)
+        elif isinstance(value, np.ndarray) and value.dtype.kind in _NUMERIC_KINDS:
+            group.create_dataset(name, data=value)
+        else:
+            _write_blob(group, name, value)
+
+
+def save_modeling_input(artifact: dict, save_path: str | Path) -> Path:
+    """
+    Description
+    -----------
+    Writes a modeling-input artifact (feature dicts plus the reserved
+    metadata blocks, as built by `inject_metadata`) atomically. A `.pkl`
+    path writes the legacy pickle; any other suffix writes the per-feature
+    HDF5 store.
+
+    Parameters
+    ----------
+    artifact (dict)
+        `{feature: {session: {name: array}}, '_input_metadata': {...}}`.
+    save_path (str | Path)
+        Destination; its directory must exist.
+
+    Returns
+    -------
+    save_path (Path)
+        The written file.
+    """
+
+    save_path = Path(save_path)
+    with atomic_output_path(save_path) as tmp_path:
+        if save_path.suffix == MODELING_INPUT_FORMATS['pickle']:
+            with tmp_path.open('wb') as pickle_file:
+                pickle.dump(artifact, pickle_file)
+        else:
+            with h5py.File(tmp_path, 'w', track_order=True) as h5_file:
+                h5_file.attrs['format'] = STORE_FORMAT
+                h5_file.attrs['format_version'] = STORE_FORMAT_VERSION
+                features = h5_file.create_group('features', track_order=True)
+                metadata = h5_file.create_group('metadata', track_order=True)
+                for key, value in artifact.items():
+                    if key in RESERVED_METADATA_KEYS:
+                        _write_blob(metadata, key, value)
+                    elif isinstance(value, dict) and all(isinstance(k, str) for k in value):
+                        _write_node(features.create_group(_encode_key(key), track_order=True), value)
+                    else:
+                        _write_blob(features, _encode_key(key), value)
+    return save_path
+
+
+def _read_node(node: h5py.Group | h5py.Dataset, mmap: bool):
+    if isinstance(node, h5py.Group):
+        return {unquote(name): _read_node(child, mmap) for name, child in node.items()}
+    if node.attrs.get('encoding') == 'pickle':
+        return pickle.loads(node[()].tobytes())
+    if mmap and node.chunks is None and node.compression is None:
+        offset = node.id.get_offset()
+        if offset is not None:
+            return np.memmap(node.file.filename, dtype=node.dtype, mode='r',
+                             offset=offset, shape=node.shape)
+    return node[()]
+
+
+class ModelingInputReader:
+    """
+    Reader for a modeling-input artifact, either the per-feature HDF5 store
+    or a legacy pickle.
+
+    For a store, the feature list and the metadata blocks are read without
+    touching any feature data, and `load` reads only the requested features.
+    A legacy pickle is deserialized once, on construction, and served from
+    memory.
+    """
+
+    def __init__(self, input_path: str | Path) -> None:
+        """
+        Opens the artifact at `input_path`.
+
+        Parameters
+        ----------
+        input_path : str or Path
+            Path to a `.h5` store or a legacy `.pkl` modeling input.
+
+        Raises
+        ------
+        ValueError
+            If an HDF5 file is not a modeling-input store.
+        """
+
+        self.input_path = Path(input_path)
+        self.is_store = h5py.is_hdf5(self.input_path)
+        self._legacy = None
+
+        if self.is_store:
+            with h5py.File(self.input_path, 'r') as h5_file:
+                if h5_file.attrs.get('format') != STORE_FORMAT:
+                    raise ValueError(f"{self.input_path} is an HDF5 file but not a modeling-input store.")
+                self.feature_names = sorted(unquote(name) for name in h5_file['features'])
+                self.metadata = {name: _read_node(block, mmap=False)
+                                 for name, block in h5_file['metadata'].items()}
+        else:
+            with self.input_path.open('rb') as pickle_file:
+                self._legacy = pickle.load(pickle_file)
+            self.feature_names = sorted(k for k in self._legacy if k not in RESERVED_METADATA_KEYS)
+            self.metadata = {k: self._legacy[k] for k in RESERVED_METADATA_KEYS if k in self._legacy}
+
+    @property
+    def input_metadata(self) -> dict | None:
+        """The `_input_metadata` block, or None for a legacy artifact without one."""
+
+        return self.metadata['_input_metadata'] if '_input_metadata' in self.metadata else None
+
+    def load(self, features=None, mmap: bool = False) -> dict:
+        """
+        Returns the artifact dict, restricted to `features`.
+
+        Parameters
+        ----------
+        features : iterable of str or str, optional
+            Features to read; names absent from the artifact are skipped.
+            Default (`None`) reads every feature.
+        mmap : bool, default False
+            Memory-map the numeric arrays of a store read-only instead of
+            reading them into memory. Ignored for legacy pickles.
+
+        Returns
+        -------
+        dict
+            `{feature: ..., <reserved metadata key>: ...}`, i.e. exactly the
+            structure the legacy pickle held.
+        """
+
+        if features is None:
+            wanted = self.feature_names
+        else:
+            wanted_set = {features} if isinstance(features, str) else set(features)
+            wanted = [feat for feat in self.feature_names if feat in wanted_set]
+
+        if self._legacy is not None:
+            data = {feat: self._legacy[feat] for feat in wanted}
+        else:
+            with h5py.File(self.input_path, 'r') as h5_file:
+                group = h5_file['features']
+                data = {feat: _read_node(group[_encode_key(feat)], mmap) for feat in wanted}
+        data.update(self.metadata)
+        return data
+
+
+def load_modeling_input(input_path: str | Path, features=None, mmap: bool = False) -> dict:
+    """
+    Description
+    -----------
+    Loads a modeling-input artifact (store or legacy pickle), optionally only
+    some of its features. Shorthand for `ModelingInputReader(path).load(...)`.
+
+    Parameters
+    ----------
+    input_path (str | Path)
+        Path to the artifact.
+    features (iterable of str | str | None)
+        Features to read; None reads all.
+    mmap (bool)
+        Memory-map the store's numeric arrays.
+
+    Returns
+    -------
+    data (dict)
+        The artifact dict with the requested features and every metadata block.
+    """
+
+    return ModelingInputReader(input_path).load(features=features, mmap=mmap)
@@ -543,7 +543,8 @@ def build_run_metadata(modeling_settings: dict,
                        null_strategy: str,
                        n_outer_folds: int,
                        split_strategy: str,
-                       settings_path: str = None) -> dict:
+                       settings_path: str = None,
+                       jax_compile_profile: dict = None) -> dict:
     """
     Builds the Level-2 (`_run_metadata`) provenance block for a single
     per-feature univariate fit.
@@ -595,6 +596,10 @@ def build_run_metadata(modeling_settings: dict,
       `split_strategy`).
     - **Provenance** (`git_commit`, `git_dirty`, `package_version`,
       `settings_sha256`, `_schema_version`).
+    - **Compile profile** (`jax_compile_profile`) — JAX paths only: the
+      run's wall time split into XLA compilation vs execution, plus the
+      persistent-cache hit / miss counts. Per-task by nature, so the
+      consolidators exclude it from the equality check.
 
     Parameters
     ----------
@@ -614,6 +619,9 @@ def build_run_metadata(modeling_settings: dict,
     settings_path : str, optional
         Filesystem path to the settings JSON for SHA-256 hashing. See
         `compute_settings_sha256`.
+    jax_compile_profile : dict, optional
+        Output of `jax_compilation.compile_profile()` for the run; the
+        key is omitted when None.
 
     Returns
     -------
@@ -735,6 +743,8 @@ def build_run_metadata(modeling_settings: dict,
     metadata['git_dirty'] = git_info['dirty']
     metadata['package_version'] = get_package_version()
     metadata['settings_sha256'] = compute_settings_sha256(settings_source)
+    if jax_compile_profile is not None:
+        metadata['jax_compile_profile'] = dict(jax_compile_profile)
 
     return metadata
 
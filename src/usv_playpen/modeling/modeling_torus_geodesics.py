@@ -40,11 +40,16 @@ Geometries (2) and (3) share one k-NN-graph + Dijkstra core and differ only in
 the edge-weight source (density ratio vs local G-length). All shortest paths are
 computed on a manageable node set -- a regular ``torus_grid`` or a set of cluster
 centroids -- because all-pairs geodesics over every USV are infeasible; per-USV
-queries snap to their nearest node.
+queries snap to their nearest node. ``cached_torus_geodesic_context`` stores the
+precomputed grid geometry on disk under a content hash, so the many single-
+feature processes of one run build it once.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import pathlib
 from collections import namedtuple
 
 import jax
@@ -54,6 +59,7 @@ from scipy.sparse import csr_matrix
 from scipy.sparse.csgraph import dijkstra
 from scipy.stats import gaussian_kde
 
+from ..os_utils import atomic_output_path
 from ..processing.qlvm_latents import load_decoder_params
 from ..processing.qlvm_model import decoder_forward, torus_basis_forward
 from .manifold_metric import _geodesic_distance_matrix, signed_diff
@@ -568,6 +574,132 @@ def build_torus_geodesic_context(embedded_points: np.ndarray, *, decode_fn=None,
                                 pullback_matrix=pullback_matrix)
 
 
+_CONTEXT_CACHE_ARRAYS = ('grid', 'density', 'density_matrix', 'pullback_matrix')
+
+
+def _file_digest(path: str, chunk_bytes: int = 2 ** 20) -> str:
+    """SHA-256 hex digest of a file's bytes, read in chunks."""
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(chunk_bytes), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def geodesic_context_key(embedded_points: np.ndarray, *, decoder_weights_npz_path: str | None = None,
+                         n_per_dim: int = 40, period: float = 1.0, k: int = 8,
+                         density_exponent: float = 1.0, bw_method=None) -> str:
+    """
+    Content address of a :class:`TorusGeodesicContext`.
+
+    Hashes everything the context is a function of: the embedded points (their
+    shape and float64 bytes), the grid / graph settings and the KDE bandwidth,
+    and the bytes of the decoder ``.npz`` (not its path, so a moved or
+    re-exported copy of the same weights maps to the same entry). Two processes
+    that would build the same geometry compute the same key, independently of
+    which stage or feature they serve.
+
+    Parameters
+    ----------
+    embedded_points : np.ndarray
+        ``(m, 2)`` embedded torus coordinates the density is estimated from.
+    decoder_weights_npz_path : str | None, default None
+        Decoder weights the pullback geometry is built from; ``None`` keys a
+        context without the pullback matrix.
+    n_per_dim, period, k, density_exponent, bw_method
+        As in :func:`build_torus_geodesic_context`.
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest.
+    """
+
+    points = np.ascontiguousarray(embedded_points, dtype=np.float64)
+    digest = hashlib.sha256()
+    digest.update(repr(points.shape).encode())
+    digest.update(points.tobytes())
+    digest.update(repr((int(n_per_dim), float(period), int(k), float(density_exponent),
+                        repr(bw_method))).encode())
+    digest.update(_file_digest(decoder_weights_npz_path).encode()
+                  if decoder_weights_npz_path else b'no-decoder')
+    return digest.hexdigest()
+
+
+def cached_torus_geodesic_context(embedded_points: np.ndarray, *, cache_dir: str | None,
+                                  decode_fn=None, decoder_weights_npz_path: str | None = None,
+                                  n_per_dim: int = 40, period: float = 1.0, k: int = 8,
+                                  density_exponent: float = 1.0,
+                                  bw_method=None) -> tuple[TorusGeodesicContext, bool]:
+    """
+    :func:`build_torus_geodesic_context` behind a content-addressed on-disk
+    cache shared by every process that points at the same ``cache_dir``.
+
+    Each SLURM array task of the univariate screen (and the selection run
+    after it) would otherwise repeat the all-pairs Dijkstra and the decoder
+    Jacobians for the same ``Y`` and decoder. Entries are keyed by
+    :func:`geodesic_context_key` and stored as one ``.npy`` per array plus a
+    ``.json`` manifest, each published with ``os_utils.atomic_output_path``;
+    the manifest is written last, so a reader that finds it also finds the
+    complete arrays. Concurrent writers of one key produce identical bytes and
+    the last rename wins, so no locking is needed. Hits are opened as
+    read-only memmaps (only the snapped rows are paged in).
+
+    Parameters
+    ----------
+    embedded_points : np.ndarray
+        ``(m, 2)`` embedded torus coordinates the density is estimated from.
+    cache_dir : str | None
+        Directory of the cache entries (created if missing); ``None`` or an
+        empty string builds the context without caching.
+    decode_fn : callable | None, default None
+        Differentiable decoder for the pullback geometry (built on a miss).
+    decoder_weights_npz_path : str | None, default None
+        The ``.npz`` ``decode_fn`` was loaded from; keys the entry. Pass
+        ``None`` when ``decode_fn`` is ``None``.
+    n_per_dim, period, k, density_exponent, bw_method
+        As in :func:`build_torus_geodesic_context`.
+
+    Returns
+    -------
+    ctx : TorusGeodesicContext
+        The geometry (memmapped arrays on a hit).
+    hit : bool
+        True when the context was read from the cache.
+    """
+
+    build_kwargs = dict(n_per_dim=n_per_dim, period=period, k=k,
+                        density_exponent=density_exponent, bw_method=bw_method)
+    if not cache_dir:
+        return build_torus_geodesic_context(embedded_points, decode_fn=decode_fn, **build_kwargs), False
+
+    cache_root = pathlib.Path(cache_dir)
+    key = geodesic_context_key(
+        embedded_points, decoder_weights_npz_path=decoder_weights_npz_path if decode_fn is not None else None,
+        **build_kwargs)
+    manifest_path = cache_root / f"{key}.json"
+    if manifest_path.is_file():
+        with open(manifest_path, 'r') as manifest_file:
+            manifest = json.load(manifest_file)
+        arrays = {name: np.load(cache_root / f"{key}.{name}.npy", mmap_mode='r') if name in manifest['arrays'] else None
+                  for name in _CONTEXT_CACHE_ARRAYS}
+        return TorusGeodesicContext(n_per_dim=int(manifest['n_per_dim']), period=float(manifest['period']),
+                                    **arrays), True
+
+    ctx = build_torus_geodesic_context(embedded_points, decode_fn=decode_fn, **build_kwargs)
+    cache_root.mkdir(parents=True, exist_ok=True)
+    stored = [name for name in _CONTEXT_CACHE_ARRAYS if getattr(ctx, name) is not None]
+    for name in stored:
+        with atomic_output_path(cache_root / f"{key}.{name}.npy") as tmp_path:
+            with open(tmp_path, 'wb') as array_file:
+                np.save(array_file, np.asarray(getattr(ctx, name)))
+    with atomic_output_path(manifest_path) as tmp_path:
+        with open(tmp_path, 'w') as manifest_file:
+            json.dump({'n_per_dim': ctx.n_per_dim, 'period': ctx.period, 'arrays': stored}, manifest_file)
+    return ctx, False
+
+
 def per_event_geodesic_error(y_pred: np.ndarray, y_true: np.ndarray,
                              ctx: TorusGeodesicContext, *, method: str) -> np.ndarray:
     """
@@ -49,7 +49,6 @@ Key scientific capabilities:
 import json
 import numpy as np
 from pathlib import Path
-import pickle
 from datetime import datetime
 from scipy.stats import gaussian_kde, wilcoxon
 from sklearn.cluster import KMeans
@@ -63,6 +62,7 @@ from .modeling_metadata import (
     derive_feature_zoo_full, derive_camera_fps_field, inject_metadata,
     RESERVED_METADATA_KEYS,
 )
+from .modeling_input_store import load_modeling_input, modeling_input_suffix, save_modeling_input
 from .load_input_files import _calculate_ibi_threshold
 from .modeling_utils import (
     prepare_modeling_sessions,
@@ -83,11 +83,12 @@ from .manifold_metric import (
     circular_mean,
     torus_embed,
     resolve_manifold_metric,
+    resolve_manifold_dcor_settings,
     manifold_prediction_metrics,
     inverse_region_frequency_weights,
 )
 from .modeling_torus_geodesics import (
-    build_torus_geodesic_context,
+    cached_torus_geodesic_context,
     geodesic_mae_columns,
     make_qlvm_decode_fn_from_npz,
 )
@@ -433,7 +434,8 @@ def _tune_manifold_regularization(X_train: np.ndarray,
                                   metric: str,
                                   period: float,
                                   region_train: np.ndarray = None,
-                                  kappa: float = None) -> tuple:
+                                  kappa: float = None,
+                                  dcor_settings: dict = None) -> tuple:
     """
     Selects `(lambda_smooth, l2_reg)` jointly by inner cross-validation on
     the supplied training fold, with an optional 1-SE rule biased toward
@@ -513,7 +515,10 @@ def _tune_manifold_regularization(X_train: np.ndarray,
         term; forwarded unchanged to `regressor_cls` on every inner fit.
     use_lax_loop : bool
         Whether the estimator's fused `lax`-scan training loop is enabled;
-        forwarded unchanged to `regressor_cls` on every inner fit.
+        forwarded unchanged to `regressor_cls` on every inner fit. When
+        `regressor_cls` provides `fit_regularization_grid`, the grid is fit
+        in one batched fused call whose convergence check follows this flag,
+        so it stops where the per-pair fits would and selects the same pair.
     metric : str
         Manifold geometry (`'euclidean'` or `'torus'`) forwarded both to
         the inner spatial splitter (`get_stratified_spatial_splits_stable`)
@@ -535,6 +540,11 @@ def _tune_manifold_regularization(X_train: np.ndarray,
         `(lambda_smooth, l2_reg)` on the same dispersion scale as the outer gate.
         `None` (default) preserves the historical per-inner-fold self-refit.
         Ignored on euclidean.
+    dcor_settings : dict, optional
+        `resolve_manifold_dcor_settings` keyword arguments forwarded to the
+        inner-CV `evaluate_metrics` scoring, so a `dcor_xy` tuner uses the
+        same estimator as the outer run. `None` (default) keeps the
+        estimator defaults.
 
     Returns
     -------
@@ -605,39 +615,71 @@ def _tune_manifold_regularization(X_train: np.ndarray,
         period=period,
     )
 
+    def _inner_train_weights(in_tr):
+        # Equal-region fit reweighting (torus only) on the inner training
+        # rows, mirroring the outer fit so the tuned (lambda_smooth, l2_reg)
+        # is chosen under the same reweighted objective the outer model is
+        # fit with. No-op on euclidean or when no region labels are threaded in.
+        _w_in_tr = w_train[in_tr]
+        if region_train is not None and metric == 'torus':
+            _w_in_tr = _w_in_tr * inverse_region_frequency_weights(region_train[in_tr])
+        return _w_in_tr
+
+    def _inner_regressor(lam_sm, lam_l2, inner_idx):
+        return regressor_cls(
+            n_features=n_features,
+            n_time_bins=n_time_bins,
+            lambda_smooth=float(lam_sm),
+            l2_reg=float(lam_l2),
+            smoothness_derivative_order=smoothness_derivative_order,
+            huber_delta=huber_delta,
+            learning_rate=learning_rate,
+            max_iter=inner_max_iter,
+            tol=tol,
+            random_state=random_state + inner_idx,
+            verbose=False,
+            _use_lax_loop=use_lax_loop,
+            metric=metric,
+            period=period,
+        )
+
+    # Estimators exposing `fit_regularization_grid` fit the whole
+    # (inner fold x lambda_smooth x l2_reg) grid in one batched call; the
+    # per-pair loop below then only scores. A batched call rejected by the
+    # estimator's input checks (ValueError) or by the device / host
+    # allocator (jax's runtime errors subclass RuntimeError) falls back to
+    # fitting pair by pair, which isolates the failing pair.
+    grid_fits = None
+    if hasattr(regressor_cls, 'fit_regularization_grid'):
+        train_masks = np.zeros((len(inner_folds), len(Y_train)), dtype=bool)
+        fold_weights = np.zeros((len(inner_folds), len(Y_train)))
+        for inner_idx, (in_tr, _) in enumerate(inner_folds):
+            train_masks[inner_idx, in_tr] = True
+            fold_weights[inner_idx, in_tr] = _inner_train_weights(in_tr)
+        try:
+            grid_fits = _inner_regressor(lambda_smooth_grid[0], l2_reg_grid[0], 0).fit_regularization_grid(
+                X_train, Y_train, train_masks, fold_weights,
+                lambda_smooth_grid=lambda_smooth_grid,
+                l2_reg_grid=l2_reg_grid,
+                random_states=[random_state + inner_idx for inner_idx in range(len(inner_folds))],
+            )
+        except (ValueError, RuntimeError, MemoryError) as exc:
+            if verbose:
+                print(f"        [inner-cv] batched grid fit failed ({exc}); fitting pair by pair.")
+
     grid_scores = {}
     grid_ses = {}
-    for lam_sm in lambda_smooth_grid:
-        for lam_l2 in l2_reg_grid:
+    for ls_idx, lam_sm in enumerate(lambda_smooth_grid):
+        for l2_idx, lam_l2 in enumerate(l2_reg_grid):
             fold_scores = []
             pair_diverged = False
             for inner_idx, (in_tr, in_va) in enumerate(inner_folds):
                 try:
-                    model = regressor_cls(
-                        n_features=n_features,
-                        n_time_bins=n_time_bins,
-                        lambda_smooth=float(lam_sm),
-                        l2_reg=float(lam_l2),
-                        smoothness_derivative_order=smoothness_derivative_order,
-                        huber_delta=huber_delta,
-                        learning_rate=learning_rate,
-                        max_iter=inner_max_iter,
-                        tol=tol,
-                        random_state=random_state + inner_idx,
-                        verbose=False,
-                        _use_lax_loop=use_lax_loop,
-                        metric=metric,
-                        period=period,
-                    )
-                    # Equal-region fit reweighting (torus only) on the inner
-                    # training rows, mirroring the outer fit so the tuned
-                    # (lambda_smooth, l2_reg) is chosen under the same reweighted
-                    # objective the outer model is fit with. No-op on euclidean or
-                    # when no region labels are threaded in.
-                    _w_in_tr = w_train[in_tr]
-                    if region_train is not None and metric == 'torus':
-                        _w_in_tr = _w_in_tr * inverse_region_frequency_weights(region_train[in_tr])
-                    model.fit(X_train[in_tr], Y_train[in_tr], sample_weight=_w_in_tr)
+                    if grid_fits is not None:
+                        model = grid_fits[inner_idx][ls_idx * len(l2_reg_grid) + l2_idx]
+                    else:
+                        model = _inner_regressor(lam_sm, lam_l2, inner_idx)
+                        model.fit(X_train[in_tr], Y_train[in_tr], sample_weight=_inner_train_weights(in_tr))
                     # A non-finite coefficient matrix means the optimiser
                     # diverged on this inner sub-fold. Such a (lambda_smooth,
                     # l2_reg) is numerically unusable, so flag the whole pair as
@@ -658,7 +700,7 @@ def _tune_manifold_regularization(X_train: np.ndarray,
                         continue
                     metrics = model.evaluate_metrics(
                         X_train[in_va], Y_train[in_va], weights=w_train[in_va],
-                        kappa=kappa,
+                        kappa=kappa, **(dcor_settings or {}),
                     )
                     fold_scores.append(metrics[inner_cv_scoring_metric])
                 except Exception as exc:
@@ -844,7 +886,7 @@ class ContinuousModelingPipeline(FeatureZoo):
         Returns
         -------
         None
-            Saves a highly structured `.pkl` file to the configured `save_dir`. The output is a
+            Saves a highly structured modeling input (`.h5` store or `.pkl`) to the configured `save_dir`. The output is a
             nested dictionary explicitly organized for the downstream JAX engine:
             `data[feature_name][session_id] = {'X': array, 'Y': array, 'w': array}`
 
@@ -1061,7 +1103,7 @@ class ContinuousModelingPipeline(FeatureZoo):
         # source clustering explicit.
         analysis_tag = f"manifold_{column_name_cats}"
         ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-        fname = f"modeling_{analysis_tag}_{cohort_condition}_{ts}.pkl"
+        fname = f"modeling_{analysis_tag}_{cohort_condition}_{ts}{modeling_input_suffix(self.modeling_settings)}"
 
         # Predictor diagnostics audit. The continuous pipeline stores
         # onsets as frame indices in `continuous_targets_dict[sess]`;
@@ -1264,8 +1306,7 @@ class ContinuousModelingPipeline(FeatureZoo):
         artifact = inject_metadata(final_data, _input_metadata=input_metadata)
 
         print(f"Saving continuous extraction results to:\n{save_path}")
-        with save_path.open('wb') as f:
-            pickle.dump(artifact, f)
+        save_modeling_input(artifact, save_path)
         print("[+] Save Complete.")
 
 
@@ -1385,8 +1426,9 @@ class ContinuousModelRunner:
         Parameters
         ----------
         pkl_path : str
-            The full path to the .pkl file containing the extracted (X, Y, w)
-            dictionaries from the ContinuousModelingPipeline.
+            The full path to the modeling input (`.h5` per-feature store or
+            legacy `.pkl`) containing the extracted (X, Y, w) dictionaries
+            from the ContinuousModelingPipeline.
         bin_size : int, optional
             The resizing factor for temporal downsampling. A value of 10
             means every 10 frames are averaged into 1 bin. Default is 1,
@@ -1396,11 +1438,11 @@ class ContinuousModelRunner:
             default.
         feature_filter : iterable of str or str, optional
             If provided, only bin and return the listed features. The HPC
-            dispatcher runs one feature per process, so paying the binning
-            cost for every feature in the pickle on every call is wasteful;
-            pass the feature(s) actually needed to skip the rest. The
-            default (`None`) retains the behaviour of binning every
-            feature in the pickle.
+            dispatcher runs one feature per process, so paying the loading
+            and binning cost for every feature on every call is wasteful;
+            pass the feature(s) actually needed to skip the rest (a store
+            then reads only those from disk). The default (`None`) retains
+            the behaviour of binning every feature.
 
         Returns
         -------
@@ -1421,8 +1463,9 @@ class ContinuousModelRunner:
 
         print(f"Loading and binning continuous data (bin_size={bin_size}) from: {pkl_path}")
 
-        with open(pkl_path, 'rb') as f:
-            raw_data = pickle.load(f)
+        # Only the requested features are read (memory-mapped) from a
+        # per-feature store; a legacy pickle is loaded whole.
+        raw_data = load_modeling_input(pkl_path, features=feature_filter, mmap=True)
 
         # Reserved held-out session list (schema-v2+). Threaded onto every
         # returned feature block so the training loop can exclude these
@@ -1520,6 +1563,10 @@ class ContinuousModelRunner:
         rather than rebuilt for each of the (potentially dozens of) univariate
         features. Per fold, each event's (prediction, truth) pair snaps to the
         grid and looks up its geodesic distance via `geodesic_mae_columns`.
+        With `usv_manifold_geodesic_metrics.cache_dir` set, the map is also
+        stored on disk under a hash of `Y`, the grid settings and the decoder
+        weights, so the other array tasks of the run (one feature each) and
+        the selection stage memmap it instead of rebuilding it.
 
         Torus-only. Any failure mode -- the metric is not `'torus'`, the
         `usv_manifold_geodesic_metrics` block is absent or its `compute` flag is
@@ -1568,13 +1615,14 @@ class ContinuousModelRunner:
                         except Exception as _decode_err:
                             print(f"    [geodesic] decoder unavailable ({_decode_err}); "
                                   f"pullback_geodesic_mae -> NaN")
-                    geodesic_ctx = build_torus_geodesic_context(
-                        np.asarray(Y, dtype=np.float64), decode_fn=_geo_decode_fn,
+                    geodesic_ctx, _geo_hit = cached_torus_geodesic_context(
+                        np.asarray(Y, dtype=np.float64), cache_dir=_geo_cfg.get('cache_dir'),
+                        decode_fn=_geo_decode_fn, decoder_weights_npz_path=_geo_weights_path,
                         n_per_dim=int(_geo_cfg['grid_n_per_dim']), period=manifold_period,
                         k=int(_geo_cfg['graph_k']),
                         density_exponent=float(_geo_cfg['density_exponent']),
                     )
-                    print(f"    [geodesic] reference map built: "
+                    print(f"    [geodesic] reference map {'loaded from cache' if _geo_hit else 'built'}: "
                           f"{int(_geo_cfg['grid_n_per_dim'])}^2 grid, "
                           f"pullback={'on' if _geo_decode_fn is not None else 'off'}")
                 except Exception as _geo_err:
@@ -1796,6 +1844,9 @@ class ContinuousModelRunner:
         # knob), so it always equals the geometry's selection score.
         # `tune_regularization_bool` follows the settings flag as-is.
         inner_cv_scoring_metric = 'vm_logscore' if manifold_metric == 'torus' else 'dcor_xy'
+        # How `dcor_xy` is estimated (`vocal_features.usv_manifold_dcor`), shared
+        # by the fitted strategies, the empirical-density baseline and the tuner.
+        dcor_kwargs = resolve_manifold_dcor_settings(self.modeling_settings)
 
         print("Generating deterministic, spatially-stratified folds...")
         _folds_dev = get_stratified_spatial_splits_stable(
@@ -1838,6 +1889,7 @@ class ContinuousModelRunner:
             'spearman_x',
             'spearman_y',
             'dcor_xy',
+            'dcor_xy_stderr',
             'vm_logscore',
             'vm_logscore_pooled',
             'density_geodesic_mae',
@@ -2010,6 +2062,7 @@ class ContinuousModelRunner:
                         metric=manifold_metric, period=manifold_period,
                         train_cov_inv=cov_inv, random_state=random_seed + fold_idx,
                         region_labels=region_test, min_region_events=min_region_events,
+                        **dcor_kwargs,
                     )
 
                     fold_weights, fold_intercepts = None, None
@@ -2056,20 +2109,19 @@ class ContinuousModelRunner:
                             tol=tol,
                             random_state=random_seed + fold_idx,
                             verbose=verbose,
-                            # Inner-CV tuner: force-disable lax_loop. Per
-                            # SmoothBivariateRegression docstring, the
-                            # lax_loop cache is per-instance and the tuner
-                            # builds ~175 short-lived estimators per outer
-                            # fold, each paying a fresh JIT compile. The
-                            # Python-loop path is the docstring-recommended
-                            # choice here. The univariate runner's outer
-                            # fit (a few lines below) still honours the
-                            # user `use_lax_loop` setting.
+                            # Inner-CV tuner: Python-loop stopping rule. The
+                            # grid is fit in one batched fused call, which
+                            # reproduces this path's convergence cadence, and
+                            # the per-pair fallback pays no per-estimator
+                            # compile. The univariate runner's outer fit (a
+                            # few lines below) still honours the user
+                            # `use_lax_loop` setting.
                             use_lax_loop=False,
                             regressor_cls=regressor_cls,
                             metric=manifold_metric,
                             period=manifold_period,
                             region_train=region_train,
+                            dcor_settings=dcor_kwargs,
                         )
                         fold_tuned_flag = True
                     else:
@@ -2104,6 +2156,7 @@ class ContinuousModelRunner:
                     metrics = model.evaluate_metrics(
                         X_test, Y_test, weights=w_test,
                         region_labels=region_test, min_region_events=min_region_events,
+                        **dcor_kwargs,
                     )
 
                     y_pred_xy = model.predict(X_test, snap=True).astype(np.float32)
@@ -2201,6 +2254,7 @@ class ContinuousModelRunner:
                     metric=manifold_metric, period=manifold_period,
                     train_cov_inv=cov_inv, random_state=held_seed,
                     region_labels=region_held, min_region_events=min_region_events,
+                    **dcor_kwargs,
                 )
                 h_weights, h_intercepts = None, None
                 h_n_iter, h_converged, h_fit_time = 0, True, 0.0
@@ -2241,6 +2295,7 @@ class ContinuousModelRunner:
                         metric=manifold_metric,
                         period=manifold_period,
                         region_train=region_dev,
+                        dcor_settings=dcor_kwargs,
                     )
                     h_tuned_flag = True
                 else:
@@ -2275,6 +2330,7 @@ class ContinuousModelRunner:
                 metrics_h = model_h.evaluate_metrics(
                     Xh_test, Yh_test, weights=wh_test,
                     region_labels=region_held, min_region_events=min_region_events,
+                    **dcor_kwargs,
                 )
                 yh_pred_xy = model_h.predict(Xh_test, snap=True).astype(np.float32)
                 h_weights = model_h.coef_
@@ -2347,6 +2403,9 @@ class ContinuousModelRunner:
         print("=" * 90)
 
         for metric in metric_keys:
+            if metric == 'dcor_xy_stderr':
+                # the estimator's own noise on `dcor_xy`, not a score to test
+                continue
             act_vals = np.asarray(results['actual']['folds']['metrics'][metric], dtype=float)
             if act_vals.size == 0 or np.all(np.isnan(act_vals)):
                 # Metric not live on this manifold geometry (`dcor_xy` is the
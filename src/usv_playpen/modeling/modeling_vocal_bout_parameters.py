@@ -35,7 +35,6 @@ from datetime import datetime
 import numpy as np
 from numpy.lib.stride_tricks import sliding_window_view
 from pathlib import Path
-import pickle
 import gc
 import time
 import warnings
@@ -51,6 +50,7 @@ from .modeling_metadata import (
     build_input_metadata, derive_experimental_condition,
     derive_feature_zoo_full, derive_camera_fps_field, inject_metadata,
 )
+from .modeling_input_store import modeling_input_suffix, save_modeling_input
 from .load_input_files import _calculate_ibi_threshold
 from .modeling_utils import (
     prepare_modeling_sessions,
@@ -287,7 +287,7 @@ class BoutParameterPipeline(VocalOnsetModelingPipeline):
         # downstream filename (modeling input → univariate → step → final).
         analysis_tag = target_variable
         ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-        fname = f"modeling_{analysis_tag}_{cohort_condition}_{ts}.pkl"
+        fname = f"modeling_{analysis_tag}_{cohort_condition}_{ts}{modeling_input_suffix(self.modeling_settings)}"
 
         ibi_thresholds_md = {}
         mixture_model_params_md = self.modeling_settings['mixture_model_params']
@@ -538,8 +538,7 @@ class BoutParameterPipeline(VocalOnsetModelingPipeline):
         input_metadata['feature_zoo_kept'] = sorted(final_data_dict.keys())
 
         artifact = inject_metadata(final_data_dict, _input_metadata=input_metadata)
-        with save_path.open('wb') as f:
-            pickle.dump(artifact, f)
+        save_modeling_input(artifact, save_path)
         print(f"[+] Saved: {save_path}")
 
     def create_data_splits(self, feature_data: dict, strategy_override: str = None):
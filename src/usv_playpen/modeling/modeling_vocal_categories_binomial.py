@@ -29,7 +29,6 @@ import json
 import numpy as np
 from numpy.lib.stride_tricks import sliding_window_view
 from pathlib import Path
-import pickle
 import time
 from pygam import LogisticGAM, te
 from sklearn.linear_model import LogisticRegressionCV
@@ -42,6 +41,7 @@ from .modeling_metadata import (
     build_input_metadata, derive_experimental_condition,
     derive_feature_zoo_full, derive_camera_fps_field, inject_metadata,
 )
+from .modeling_input_store import modeling_input_suffix, save_modeling_input
 from .load_input_files import _calculate_ibi_threshold
 from .modeling_utils import (
     prepare_modeling_sessions,
@@ -229,7 +229,7 @@ class VocalCategoryModelingPipeline(FeatureZoo):
             defined in `feature_boundaries` while bypassing USV traces.
         5.  Slices continuous data into fixed-length history windows using
             precise rounding to align behavioral frames with USV onset timestamps.
-        6.  Dumps processed data into a `.pkl` file structured by feature -> session.
+        6.  Dumps processed data into the modeling input (`.h5` store or `.pkl`) structured by feature -> session.
 
         Parameters
         ----------
@@ -240,7 +240,7 @@ class VocalCategoryModelingPipeline(FeatureZoo):
         Returns
         -------
         None
-            Saves a pickle file containing 'target_feature_arr' and 'other_feature_arr' for each feature.
+            Saves a modeling input file containing 'target_feature_arr' and 'other_feature_arr' for each feature.
         """
 
         txt_sessions = prepare_modeling_sessions(self.modeling_settings)
@@ -359,7 +359,7 @@ class VocalCategoryModelingPipeline(FeatureZoo):
         # consolidated artifact — pins both axes of the choice.
         analysis_tag = f"category_{column_name_cats}_{target_category}"
         ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-        fname = f"modeling_{analysis_tag}_{cohort_condition}_{ts}.pkl"
+        fname = f"modeling_{analysis_tag}_{cohort_condition}_{ts}{modeling_input_suffix(self.modeling_settings)}"
 
         # Build `_input_metadata` once. Per-session event counts are
         # backfilled at the dump site (after epoch slicing).
@@ -553,8 +553,7 @@ class VocalCategoryModelingPipeline(FeatureZoo):
         input_metadata['feature_zoo_kept'] = sorted(final_data.keys())
 
         artifact = inject_metadata(final_data, _input_metadata=input_metadata)
-        with save_path.open('wb') as f:
-            pickle.dump(artifact, f)
+        save_modeling_input(artifact, save_path)
         print(f"\n[+] Successfully saved category input data to:\n    {save_path}")
 
     def create_category_splits(self, feature_data: dict, strategy: str = 'actual'):
@@ -22,7 +22,6 @@ Key scientific capabilities:
 import json
 import numpy as np
 from pathlib import Path
-import pickle
 from datetime import datetime
 from sklearn.metrics import (
     balanced_accuracy_score, log_loss, f1_score,
@@ -38,6 +37,12 @@ from .modeling_metadata import (
     derive_feature_zoo_full, derive_camera_fps_field, inject_metadata,
     RESERVED_METADATA_KEYS,
 )
+from .modeling_input_store import (
+    ModelingInputReader,
+    load_modeling_input,
+    modeling_input_suffix,
+    save_modeling_input,
+)
 from .load_input_files import _calculate_ibi_threshold
 from .modeling_utils import (
     prepare_modeling_sessions,
@@ -419,6 +424,10 @@ def _tune_multinomial_regularization(X_train: np.ndarray,
     scope. `inner_max_iter` caps iterations on every inner fit — kept
     smaller than the outer-fit iteration budget so the tuner produces
     usable ranking scores without paying full-convergence wall time per pair.
+    As in the manifold tuner, an estimator providing `fit_regularization_grid`
+    fits the whole grid in batched fused-loop calls that stop where the
+    `use_lax_loop` path of `fit` would, so the batched and per-pair fits
+    select the same pair.
 
     Returns
     -------
@@ -496,30 +505,58 @@ def _tune_multinomial_regularization(X_train: np.ndarray,
             return float('nan')
         return float('nan')
 
+    def _inner_regressor(lam_sm, lam_l2, inner_idx):
+        return regressor_cls(
+            n_features=n_features,
+            n_time_bins=n_time_bins,
+            lambda_smooth=float(lam_sm),
+            l2_reg=float(lam_l2),
+            smoothness_derivative_order=smoothness_derivative_order,
+            focal_gamma=focal_gamma,
+            uniform_class_weights=uniform_class_weights,
+            learning_rate=learning_rate,
+            max_iter=inner_max_iter,
+            tol=tol,
+            random_state=random_state + inner_idx,
+            verbose=False,
+            _use_lax_loop=use_lax_loop,
+        )
+
+    # Estimators exposing `fit_regularization_grid` fit the whole
+    # (inner fold x lambda_smooth x l2_reg) grid in batched calls; the
+    # per-pair loop below then only scores. A batched call rejected by the
+    # estimator's input checks (ValueError) or by the device / host
+    # allocator (jax's runtime errors subclass RuntimeError) falls back to
+    # fitting pair by pair, which isolates the failing pair.
+    grid_fits = None
+    if hasattr(regressor_cls, 'fit_regularization_grid'):
+        train_masks = np.zeros((len(inner_folds), len(y_train)), dtype=bool)
+        for inner_idx, (in_tr, _) in enumerate(inner_folds):
+            train_masks[inner_idx, in_tr] = True
+        try:
+            grid_fits = _inner_regressor(lambda_smooth_grid[0], l2_reg_grid[0], 0).fit_regularization_grid(
+                X_train, y_train, train_masks,
+                lambda_smooth_grid=lambda_smooth_grid,
+                l2_reg_grid=l2_reg_grid,
+                random_states=[random_state + inner_idx for inner_idx in range(len(inner_folds))],
+            )
+        except (ValueError, RuntimeError, MemoryError) as exc:
+            if verbose:
+                print(f"        [inner-cv] batched grid fit failed ({exc}); fitting pair by pair.")
+
     grid_scores = {}
     grid_ses = {}
-    for lam_sm in lambda_smooth_grid:
-        for lam_l2 in l2_reg_grid:
+    for ls_idx, lam_sm in enumerate(lambda_smooth_grid):
+        for l2_idx, lam_l2 in enumerate(l2_reg_grid):
             fold_scores = []
             pair_diverged = False
             for inner_idx, (in_tr, in_va) in enumerate(inner_folds):
                 try:
-                    model = regressor_cls(
-                        n_features=n_features,
-                        n_time_bins=n_time_bins,
-                        lambda_smooth=float(lam_sm),
-                        l2_reg=float(lam_l2),
-                        smoothness_derivative_order=smoothness_derivative_order,
-                        focal_gamma=focal_gamma,
-                        uniform_class_weights=uniform_class_weights,
-                        learning_rate=learning_rate,
-                        max_iter=inner_max_iter,
-                        tol=tol,
-                        random_state=random_state + inner_idx,
-                        verbose=False,
-                        _use_lax_loop=use_lax_loop,
-                    )
-                    model.fit(X_train[in_tr], y_train[in_tr])
+                    if grid_fits is not None:
+                        model = grid_fits[inner_idx][ls_idx * len(l2_reg_grid) + l2_idx]
+                    else:
+                        model = _inner_regressor(lam_sm, lam_l2, inner_idx)
+                        model.fit(X_train[in_tr], y_train[in_tr])
                     # A non-finite coefficient matrix means the optimiser
                     # diverged on this inner sub-fold. This is observed at the
                     # near-zero-l2 grid corner on severely imbalanced targets
@@ -865,7 +902,7 @@ class MultinomialModelingPipeline(FeatureZoo):
         # selector was trained against.
         analysis_tag = f"multinomial_{column_name_cats}"
         ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-        fname = f"modeling_{analysis_tag}_{cohort_condition}_{ts}.pkl"
+        fname = f"modeling_{analysis_tag}_{cohort_condition}_{ts}{modeling_input_suffix(self.modeling_settings)}"
 
         # Predictor diagnostics audit. Multinomial stores onsets as frame
         # indices keyed by category; convert to seconds-per-session for the
@@ -1069,8 +1106,7 @@ class MultinomialModelingPipeline(FeatureZoo):
         artifact = inject_metadata(final_data, _input_metadata=input_metadata)
 
         print(f"Saving extraction results to:\n{save_path} ...")
-        with save_path.open('wb') as f:
-            pickle.dump(artifact, f)
+        save_modeling_input(artifact, save_path)
         print("[+] Save Complete.")
 
 
@@ -1189,18 +1225,19 @@ class MultinomialModelRunner:
         Parameters
         ----------
         pkl_path : str
-            The full path to the .pkl file containing the extracted (X, y)
-            dictionaries from the MultinomialModelingPipeline.
+            The full path to the modeling input (`.h5` per-feature store or
+            legacy `.pkl`) containing the extracted (X, y) dictionaries from
+            the MultinomialModelingPipeline.
         bin_size : int, optional
             The resizing factor for temporal downsampling. A value of 10
             means every 10 frames are averaged into 1 bin. Default is 10.
         feature_filter : iterable of str or str, optional
             If provided, only bin and return the listed features. The HPC
-            dispatcher runs one feature per process, so paying the binning
-            cost for every feature in the pickle on every call is wasteful;
-            pass the feature(s) actually needed to skip the rest. The default
-            (`None`) retains the legacy behaviour of binning every feature in
-            the pickle.
+            dispatcher runs one feature per process, so paying the loading
+            and binning cost for every feature on every call is wasteful;
+            pass the feature(s) actually needed to skip the rest (a store
+            then reads only those from disk). The default (`None`) retains
+            the legacy behaviour of binning every feature.
 
         Returns
         -------
@@ -1219,8 +1256,9 @@ class MultinomialModelRunner:
 
         print(f"Loading and binning data (bin_size={bin_size}) from: {pkl_path}")
 
-        with open(pkl_path, 'rb') as f:
-            raw_data = pickle.load(f)
+        # Only the requested features are read (memory-mapped) from a
+        # per-feature store; a legacy pickle is loaded whole.
+        raw_data = load_modeling_input(pkl_path, features=feature_filter, mmap=True)
 
         # Strip metadata blocks before iterating features. Without this
         # filter, the underscore-prefixed reserved keys (`_input_metadata`
@@ -1382,8 +1420,7 @@ class MultinomialModelRunner:
         # validates against the same count the extractor observed,
         # independent of whatever `usv_category_column_name` or
         # `usv_noise_categories` are currently configured.
-        with open(pkl_path, 'rb') as _md_fh:
-            _input_md = pickle.load(_md_fh)['_input_metadata']
+        _input_md = ModelingInputReader(pkl_path).input_metadata
         n_categories_total = int(_input_md['analysis_specific']['usv_category_number'])
 
         # Joint-tuning configuration. Fixed-fallback `lambda_smooth_fixed`
@@ -1627,13 +1664,12 @@ class MultinomialModelRunner:
                             tol=hp['tol'],
                             random_state=hp['random_state'] + fold,
                             verbose=hp['verbose'],
-                            # Inner-CV tuner: force-disable lax_loop. Per
-                            # SmoothMultinomialLogisticRegression docstring,
-                            # the lax_loop cache is per-instance and the
-                            # tuner builds many short-lived estimators per
-                            # outer fold, each paying a fresh JIT compile.
-                            # The outer-fit call site below still honours
-                            # the user `use_lax_loop` setting.
+                            # Inner-CV tuner: Python-loop stopping rule. The
+                            # grid is fit in batched fused calls, which
+                            # reproduce this path's convergence cadence, and
+                            # the per-pair fallback pays no per-estimator
+                            # compile. The outer-fit call site below still
+                            # honours the user `use_lax_loop` setting.
                             use_lax_loop=False,
                             regressor_cls=SmoothMultinomialLogisticRegression,
                         )
@@ -13,7 +13,6 @@ import json
 import numpy as np
 from pathlib import Path
 from pygam import LogisticGAM, te
-import pickle
 import time
 from sklearn.linear_model import LogisticRegressionCV
 from sklearn.metrics import balanced_accuracy_score, log_loss, f1_score, recall_score, roc_auc_score, brier_score_loss
@@ -25,6 +24,7 @@ from .modeling_metadata import (
     build_input_metadata, derive_experimental_condition,
     derive_feature_zoo_full, derive_camera_fps_field, inject_metadata,
 )
+from .modeling_input_store import modeling_input_suffix, save_modeling_input
 from .load_input_files import _calculate_ibi_threshold
 from .modeling_utils import (
     prepare_modeling_sessions,
@@ -179,14 +179,15 @@ class VocalOnsetModelingPipeline(FeatureZoo):
             preceding every valid USV and No-USV event.
         7.  Renames features to generic 'self.*' / 'other.*' prefixes
             and organizes data into a nested dictionary: `Feature -> Session -> {usv_arr, no_usv_arr}`.
-        8.  Serializes the final dictionary to a .pkl file for downstream modeling.
+        8.  Serializes the final dictionary to the modeling input (`.h5` per-feature
+            store, or `.pkl` per `io.modeling_input_format`) for downstream modeling.
 
         Settings are controlled via the `self.modeling_settings` attribute.
 
         Outputs
         -------
-        .pkl file
-            A pickle file containing a nested dictionary. Structure:
+        modeling input file
+            A per-feature store (or pickle) holding a nested dictionary. Structure:
             `{'generic_feature_name': {'session_id1': {'usv_feature_arr': ..., 'no_usv_feature_arr': ...},
                                       'session_id2': {...}, ...},
              'another_feature': {...}, ...}`
@@ -366,7 +367,7 @@ class VocalOnsetModelingPipeline(FeatureZoo):
         else:
             analysis_tag = target_vocal_type
         ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-        file_name_ = f"modeling_{analysis_tag}_{cohort_condition}_{ts}.pkl"
+        file_name_ = f"modeling_{analysis_tag}_{cohort_condition}_{ts}{modeling_input_suffix(self.modeling_settings)}"
 
         # Build the `_input_metadata` block once. The collinearity /
         # timescale audits embed it verbatim into their artifacts, the
@@ -621,11 +622,10 @@ class VocalOnsetModelingPipeline(FeatureZoo):
 
         try:
             save_dir.mkdir(parents=True, exist_ok=True)
-            with save_path.open('wb') as f:
-                pickle.dump(artifact, f)
+            save_modeling_input(artifact, save_path)
             print(f"\n[+] Successfully saved PER-SESSION renamed modeling input data to:\n    {save_path}")
         except Exception as e:
-            print(f"\n[!] Error saving final pickle file: {e}")
+            print(f"\n[!] Error saving final modeling input file: {e}")
 
     def create_data_splits(self, feature_data: dict, strategy_override: str = None):
         """
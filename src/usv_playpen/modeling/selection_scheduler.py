@@ -0,0 +1,293 @@
+"""
+@author: bartulem
+Candidate scheduler for the forward stepwise model selection.
+
+Every step of the five selectors in `model_selection` scores each remaining
+candidate feature over every CV fold, and the candidates are independent of
+one another within a step. `CandidateScheduler.evaluate` fans them out:
+
+- `executor='local'` runs the candidates on a joblib `loky` pool of
+  `n_workers` processes (`1` keeps the serial, in-process loop). The pooled
+  design matrices the candidate closures reference (`pooled_feature_cache`,
+  `binned_data`, ...) are large numpy arrays, which joblib memory-maps into
+  shared memory once instead of copying them into every worker.
+- `executor='slurm_array'` shards the candidates of every step across the
+  tasks of a SLURM job array (`sbatch --array=0-N`) that all run the same
+  selection command. Each task scores its share, and the tasks meet at a
+  file-system barrier before deciding the step, so every task reaches the
+  same decision. Task 0 publishes the step pickles; the other tasks keep
+  theirs in a private `.shard_<k>` subdirectory.
+
+Each candidate result is checkpointed as it finishes, in a
+`<step prefix><step>_candidates/` directory next to the step pickles. A step
+interrupted by preemption therefore resumes with only its unfinished
+candidates. A checkpoint is only reused when it was written by the same
+run (`checkpoint_run_digest`: the settings file, the input and univariate
+paths and the step prefix) under the same selected-feature context; any
+other checkpoint is stale and its candidate is re-evaluated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import shutil
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+from joblib import Parallel, delayed
+
+from .modeling_metadata import compute_settings_sha256
+from ..os_utils import atomic_output_path
+
+#: Values accepted by `hyperparameters.selection_scheduler.executor`.
+SCHEDULER_EXECUTORS = ('local', 'slurm_array')
+
+
+def checkpoint_run_digest(settings_path, input_data_path, univariate_results_path, step_prefix: str) -> str:
+    """
+    Identifies the selection run a candidate checkpoint belongs to. Job-array
+    tasks keep their checkpoints after a step, and an output directory can be
+    reused with edited settings or inputs, so the selected-feature context
+    alone does not tell a stale checkpoint from a valid one.
+
+    Parameters
+    ----------
+    settings_path : str, Path or dict
+        The modeling settings the run read (hashed by `compute_settings_sha256`).
+    input_data_path : str or Path
+        The run's modeling input.
+    univariate_results_path : str or Path
+        The univariate results that rank the candidates.
+    step_prefix : str
+        The selector's step-pickle prefix.
+
+    Returns
+    -------
+    str
+        Hex SHA-256 digest of the four components.
+    """
+
+    digest = hashlib.sha256()
+    for part in (compute_settings_sha256(settings_path),
+                 str(Path(input_data_path).resolve()),
+                 str(Path(univariate_results_path).resolve()),
+                 step_prefix):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _evaluate_one(evaluate_fn, candidate: str) -> tuple:
+    return candidate, evaluate_fn(candidate)
+
+
+class CandidateScheduler:
+    """
+    Scores the candidates of one forward-selection step in parallel, with
+    per-candidate checkpoints.
+    """
+
+    def __init__(self, executor: str = 'local', n_workers: int = 1,
+                 poll_interval_secs: float = 30.0, barrier_timeout_hours: float = 48.0) -> None:
+        """
+        Initializes the CandidateScheduler class.
+
+        Parameters
+        ----------
+        executor : str, default 'local'
+            `'local'` (process pool on this node) or `'slurm_array'` (shard the
+            candidates across the tasks of a SLURM job array).
+        n_workers : int, default 1
+            Worker processes per node (joblib semantics: `-1` uses every core);
+            `1` evaluates the candidates serially in-process.
+        poll_interval_secs : float, default 30.0
+            How often a `'slurm_array'` task checks for the other tasks' results.
+        barrier_timeout_hours : float, default 48.0
+            How long a `'slurm_array'` task waits for the other tasks before
+            giving up on a step.
+
+        Raises
+        ------
+        ValueError
+            If `executor` is unknown.
+        """
+
+        if executor not in SCHEDULER_EXECUTORS:
+            raise ValueError(f"selection_scheduler executor must be one of {SCHEDULER_EXECUTORS}, got {executor!r}.")
+        self.executor = executor
+        self.n_workers = int(n_workers)
+        self.poll_interval_secs = float(poll_interval_secs)
+        self.barrier_timeout_secs = float(barrier_timeout_hours) * 3600.0
+
+        # Outside a job array (or with the local executor) this task is the only shard.
+        self.shard_index, self.n_shards = 0, 1
+        if executor == 'slurm_array' and 'SLURM_ARRAY_TASK_ID' in os.environ:
+            self.shard_index = int(os.environ['SLURM_ARRAY_TASK_ID']) - int(os.environ.get('SLURM_ARRAY_TASK_MIN', 0))
+            self.n_shards = int(os.environ['SLURM_ARRAY_TASK_COUNT'])
+
+    @classmethod
+    def from_settings(cls, modeling_settings: dict) -> CandidateScheduler:
+        """
+        Builds the scheduler from the `hyperparameters.selection_scheduler`
+        settings block; a missing block gives the serial scheduler.
+
+        Parameters
+        ----------
+        modeling_settings : dict
+            The loaded modeling settings.
+
+        Returns
+        -------
+        CandidateScheduler
+            The configured scheduler.
+        """
+
+        block = modeling_settings.get('hyperparameters', {}).get('selection_scheduler')
+        if block is None:
+            return cls()
+        return cls(executor=block['executor'], n_workers=block['n_workers'],
+                   poll_interval_secs=block['poll_interval_secs'],
+                   barrier_timeout_hours=block['barrier_timeout_hours'])
+
+    @property
+    def is_primary(self) -> bool:
+        """Whether this task publishes the selection results (always true outside a job array)."""
+
+        return self.shard_index == 0
+
+    def publish_directory(self, model_selection_dir: Path) -> Path:
+        """
+        Directory this task writes its step pickles to: the model-selection
+        directory itself for the primary task, a private `.shard_<k>`
+        subdirectory for the other tasks of a job array.
+
+        Parameters
+        ----------
+        model_selection_dir : Path
+            The shared model-selection output directory.
+
+        Returns
+        -------
+        Path
+            The (existing) directory to publish into.
+        """
+
+        if self.is_primary:
+            return model_selection_dir
+        shard_dir = model_selection_dir / f".shard_{self.shard_index}"
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        return shard_dir
+
+    def evaluate(self, candidates: list, evaluate_fn, checkpoint_dir: Path, context: list,
+                 run_digest: str = '') -> dict:
+        """
+        Scores every candidate of a step, resuming from the checkpoints in
+        `checkpoint_dir`.
+
+        Parameters
+        ----------
+        candidates : list of str
+            The step's remaining candidate features, in rank order.
+        evaluate_fn : callable
+            `evaluate_fn(candidate) -> result`, the selector's per-candidate
+            loop over the CV folds. Must be picklable by joblib (closures are)
+            when `n_workers != 1`.
+        checkpoint_dir : Path
+            Per-step checkpoint directory (shared between the tasks of a job
+            array).
+        context : list of str
+            The features already in the model; a checkpoint written under a
+            different context is stale and re-evaluated.
+        run_digest : str, default ''
+            `checkpoint_run_digest` of the run; a checkpoint written by a
+            different run is stale and re-evaluated.
+
+        Returns
+        -------
+        dict
+            `{candidate: result}` in the order of `candidates`.
+
+        Raises
+        ------
+        TimeoutError
+            If a `'slurm_array'` task waits longer than the barrier timeout for
+            the other tasks' results.
+        """
+
+        checkpoint_dir = Path(checkpoint_dir)
+        checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        context = list(context)
+
+        results = self._load_checkpoints(candidates, checkpoint_dir, context, run_digest)
+        # Shares follow rank positions, not the pending list, so the split does not
+        # depend on which other tasks' checkpoints this task happens to see.
+        own_share = [cand for cand in candidates[self.shard_index::self.n_shards] if cand not in results]
+        if len(results) < len(candidates):
+            print(f"  Scheduler: {len(candidates)} candidate(s), {len(results)} from checkpoints, "
+                  f"{len(own_share)} to evaluate here (shard {self.shard_index + 1}/{self.n_shards}, "
+                  f"{self.n_workers} worker(s)).", flush=True)
+
+        if self.n_workers == 1 or len(own_share) < 2:
+            finished = (_evaluate_one(evaluate_fn, cand) for cand in own_share)
+        else:
+            finished = Parallel(n_jobs=self.n_workers, backend='loky', return_as='generator_unordered')(
+                delayed(_evaluate_one)(evaluate_fn, cand) for cand in own_share)
+        for cand, result in finished:
+            self._save_checkpoint(checkpoint_dir, cand, context, run_digest, result)
+            results[cand] = result
+
+        # Job-array barrier: wait for the candidates scored by the other tasks.
+        waited_since = time.monotonic()
+        while len(results) < len(candidates):
+            if time.monotonic() - waited_since > self.barrier_timeout_secs:
+                missing = [cand for cand in candidates if cand not in results]
+                raise TimeoutError(f"Timed out waiting for {len(missing)} candidate result(s) in {checkpoint_dir}: {missing}")
+            time.sleep(self.poll_interval_secs)
+            results.update(self._load_checkpoints(
+                [cand for cand in candidates if cand not in results], checkpoint_dir, context, run_digest))
+
+        return {cand: results[cand] for cand in candidates}
+
+    def discard(self, checkpoint_dir: Path) -> None:
+        """
+        Removes a step's checkpoints once its step pickle is written. Kept
+        when sharded across a job array, where another task may still be
+        reading them.
+
+        Parameters
+        ----------
+        checkpoint_dir : Path
+            The step's checkpoint directory.
+
+        Returns
+        -------
+        None
+        """
+
+        if self.n_shards == 1:
+            shutil.rmtree(checkpoint_dir, ignore_errors=True)
+
+    @staticmethod
+    def _checkpoint_path(checkpoint_dir: Path, candidate: str) -> Path:
+        return checkpoint_dir / f"{quote(candidate, safe='')}.pkl"
+
+    def _save_checkpoint(self, checkpoint_dir: Path, candidate: str, context: list, run_digest: str, result) -> None:
+        with atomic_output_path(self._checkpoint_path(checkpoint_dir, candidate)) as tmp_path:
+            with tmp_path.open('wb') as checkpoint_file:
+                pickle.dump({'candidate': candidate, 'context': context, 'run_digest': run_digest,
+                             'result': result}, checkpoint_file)
+
+    def _load_checkpoints(self, candidates: list, checkpoint_dir: Path, context: list, run_digest: str) -> dict:
+        loaded = {}
+        for cand in candidates:
+            path = self._checkpoint_path(checkpoint_dir, cand)
+            if not path.is_file():
+                continue
+            with path.open('rb') as checkpoint_file:
+                record = pickle.load(checkpoint_file)
+            if record['context'] == context and record.get('run_digest') == run_digest:
+                loaded[cand] = record['result']
+        return loaded
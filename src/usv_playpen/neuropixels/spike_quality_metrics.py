@@ -83,6 +83,7 @@ from usv_playpen.neuropixels.histology_ibl_alignment_export import (
 from usv_playpen.neuropixels.monopolar_triangulation import (
     solve_monopolar_triangulation_3d,
 )
+from usv_playpen.neuropixels.spike_store import session_unit_spike_counts
 from usv_playpen.neuropixels.spikeinterface_helpers import (
     classify_somatic,
     compute_amplitude_cv,
@@ -1012,8 +1013,9 @@ class SpikeQualityMetricsExtractor:
 
         Each session's ``changepoints_info`` entry points at a raw data
         directory; a unit "appears" in a session when its
-        ``<unit_id>.npy`` spike-time file is present in that session's
-        ``ephys/<probe_id>/cluster_data`` directory. The per-session
+        spikes are in that session's spike store (or, for sessions split
+        before the store existed, its ``<unit_id>.npy`` file is present in
+        ``ephys/<probe_id>/cluster_data``). The per-session
         firing rate is the unit's spike count divided by that session's
         ``total_video_time_least``, and the catalog firing rate is the
         median across the sessions the unit appears in.
@@ -1040,9 +1042,11 @@ class SpikeQualityMetricsExtractor:
         session_ids = list(changepoints_info.keys())
         probe_sn = changepoints_info[session_ids[0]]['imec_probe_sn']
 
-        # Cache each session's video time and its cluster-data file listing.
+        # Cache each session's video time and its per-unit spike counts (one
+        # spike-store index read per session; legacy cluster_data sessions read
+        # only the .npy headers).
         session_video_time = {}
-        session_cluster_files = {}
+        session_spike_counts = {}
         for session_id in session_ids:
             root_directory = changepoints_info[session_id]['root_directory']
             frame_count_path = sorted(
@@ -1050,30 +1054,23 @@ class SpikeQualityMetricsExtractor:
             )[0]
             with frame_count_path.open() as frame_count_infile:
                 session_video_time[session_id] = json.load(frame_count_infile)['total_video_time_least']
-            cluster_data_dir = Path(root_directory) / 'ephys' / self.probe_id / 'cluster_data'
-            session_cluster_files[session_id] = {
-                npy_path.name for npy_path in cluster_data_dir.glob('*.npy')
-            }
+            session_spike_counts[session_id] = session_unit_spike_counts(
+                root_directory=root_directory, probe_id=self.probe_id
+            )
 
         result = {}
         for unit_id, unit_file_name in unit_file_names.items():
+            unit_name = Path(unit_file_name).stem
             rec_sessions = []
             hs_ids = []
             firing_rate_dict = {}
             for session_id in session_ids:
-                if unit_file_name in session_cluster_files[session_id]:
+                if unit_name in session_spike_counts[session_id]:
                     root_directory = changepoints_info[session_id]['root_directory']
                     rec_sessions.append(Path(root_directory).name)
                     hs_ids.append(changepoints_info[session_id]['headstage_sn'])
-
-                    cluster_data_dir = Path(root_directory) / 'ephys' / self.probe_id / 'cluster_data'
-                    # mmap_mode='r' reads only the .npy header (shape/dtype), not the
-                    # payload -- only shape[1] is needed, so this avoids pulling the
-                    # whole per-unit spike-time array over the I/O-bound network mount
-                    # once per (unit, session) pair.
-                    loaded_spike_times = np.load(cluster_data_dir / unit_file_name, mmap_mode='r')
                     firing_rate_dict[session_id] = round(
-                        loaded_spike_times.shape[1] / session_video_time[session_id], 3
+                        session_spike_counts[session_id][unit_name] / session_video_time[session_id], 3
                     )
 
             median_fr = round(np.median(np.array(list(firing_rate_dict.values()))), 3) if firing_rate_dict else np.nan
@@ -0,0 +1,650 @@
+"""
+@author: bartulem
+Consolidated per-probe, per-session spike store.
+
+`Operator.split_clusters_to_sessions` historically wrote one
+``cluster_data/<unit>.npy`` file (row 0 = spike seconds, row 1 = spike
+frames) per unit per session. Every consumer then globbed and opened
+hundreds of tiny files, which is dominated by per-file latency on the
+lab's CIFS/NFS shares. This module stores all units of one probe in one
+session in a single HDF5 file:
+
+    <root>/ephys/<probe_id>/<probe_id>_spike_store.h5
+        spike_seconds   (n_spikes_total,) float64
+        spike_frames    (n_spikes_total,) int64
+        unit_offsets    (n_units + 1,)    int64   CSR index into the above
+        units/          per-unit metadata columns (unit_name, cluster_id,
+                        channel, group, n_spikes, region)
+
+Unit ``i`` owns ``spike_*[unit_offsets[i]:unit_offsets[i + 1]]``. The
+spike arrays are written contiguous and uncompressed, so the reader maps
+them straight from the file with ``np.memmap`` and every per-unit access
+is a zero-copy slice; opening the store reads only the small offsets and
+metadata columns.
+
+The unit names are the legacy file stems
+(``imec0_cl0017_ch042_good``), so catalogs, tuning-curve pkls and the
+``find_region_by_channel`` channel parser keep working unchanged, and
+:meth:`SpikeStore.export_legacy_npy` reproduces the legacy
+``cluster_data`` layout byte-for-byte.
+"""
+
+from __future__ import annotations
+
+import functools
+import pathlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+import h5py
+import numpy as np
+
+from ..os_utils import atomic_output_path
+
+
+SPIKE_STORE_SUFFIX = "_spike_store.h5"
+SPIKE_STORE_FORMAT_VERSION = 1
+
+_UNIT_STRING_COLUMNS = ("unit_name", "group", "region")
+_UNIT_INT_COLUMNS = ("cluster_id", "channel", "n_spikes")
+
+
+def spike_store_path(root_directory: str | pathlib.Path, probe_id: str) -> pathlib.Path:
+    """
+    Description
+    -----------
+    Location of the spike store of one probe in one session.
+
+    Parameters
+    ----------
+    root_directory (str | pathlib.Path)
+        Session root directory.
+    probe_id (str)
+        Probe identifier, e.g. "imec0".
+
+    Returns
+    -------
+    store_path (pathlib.Path)
+        `<root>/ephys/<probe_id>/<probe_id>_spike_store.h5`.
+    """
+
+    return pathlib.Path(root_directory) / "ephys" / probe_id / f"{probe_id}{SPIKE_STORE_SUFFIX}"
+
+
+def find_spike_stores(root_directory: str | pathlib.Path) -> list[pathlib.Path]:
+    """
+    Description
+    -----------
+    Finds every probe's spike store in one session, sorted by probe.
+
+    Parameters
+    ----------
+    root_directory (str | pathlib.Path)
+        Session root directory.
+
+    Returns
+    -------
+    store_paths (list[pathlib.Path])
+        Spike stores under `<root>/ephys/<probe_id>/`.
+    """
+
+    return sorted((pathlib.Path(root_directory) / "ephys").glob(f"imec*/imec*{SPIKE_STORE_SUFFIX}"))
+
+
+def parse_unit_name(unit_name: str) -> dict:
+    """
+    Description
+    -----------
+    Splits a legacy unit name `<probe>_cl<cluster_id>_ch<channel>_<group>`
+    into its metadata fields.
+
+    Parameters
+    ----------
+    unit_name (str)
+        Unit name / legacy cluster file stem.
+
+    Returns
+    -------
+    fields (dict)
+        Keys `probe_id`, `cluster_id`, `channel` and `group`.
+    """
+
+    probe_id, cluster_token, channel_token, group = unit_name.split("_", 3)
+    return {
+        "probe_id": probe_id,
+        "cluster_id": int(cluster_token[2:]),
+        "channel": int(channel_token[2:]),
+        "group": group,
+    }
+
+
+def write_spike_store(store_path: str | pathlib.Path,
+                      unit_names: list[str],
+                      spike_seconds: list[np.ndarray],
+                      spike_frames: list[np.ndarray],
+                      unit_regions: list[str] | None = None,
+                      attrs: dict | None = None) -> pathlib.Path:
+    """
+    Description
+    -----------
+    Writes one probe-session spike store. The per-unit spike trains are
+    concatenated in `unit_names` order into contiguous, uncompressed
+    datasets (so readers can memory-map them) and indexed by a CSR
+    `unit_offsets` array. Cluster id, channel and group are parsed from
+    the unit names. The file is published atomically, so a reader never
+    sees a half-written store.
+
+    Parameters
+    ----------
+    store_path (str | pathlib.Path)
+        Destination .h5 path; its parent directory must exist.
+    unit_names (list[str])
+        Unit names, `<probe>_cl<cluster_id>_ch<channel>_<group>`.
+    spike_seconds (list[np.ndarray])
+        Per-unit spike times in seconds.
+    spike_frames (list[np.ndarray])
+        Per-unit spike times in video frames.
+    unit_regions (list[str] | None)
+        Per-unit brain region acronyms; empty strings when None.
+    attrs (dict | None)
+        Extra file attributes (e.g. probe id, session name).
+
+    Returns
+    -------
+    store_path (pathlib.Path)
+        The written store.
+    """
+
+    store_path = pathlib.Path(store_path)
+    n_units = len(unit_names)
+    if not (len(spike_seconds) == len(spike_frames) == n_units):
+        raise ValueError(
+            f"Got {n_units} unit names, {len(spike_seconds)} second arrays and "
+            f"{len(spike_frames)} frame arrays; they must match."
+        )
+    if unit_regions is None:
+        unit_regions = [""] * n_units
+
+    n_spikes = np.array([np.asarray(arr).shape[0] for arr in spike_seconds], dtype=np.int64)
+    unit_offsets = np.zeros(n_units + 1, dtype=np.int64)
+    np.cumsum(n_spikes, out=unit_offsets[1:])
+
+    if n_units:
+        all_seconds = np.concatenate([np.asarray(arr, dtype=np.float64) for arr in spike_seconds])
+        all_frames = np.concatenate([np.asarray(arr).astype(np.int64) for arr in spike_frames])
+    else:
+        all_seconds = np.empty(0, dtype=np.float64)
+        all_frames = np.empty(0, dtype=np.int64)
+
+    parsed = [parse_unit_name(unit_name) for unit_name in unit_names]
+    string_dtype = h5py.string_dtype(encoding="utf-8")
+
+    with atomic_output_path(store_path) as tmp_path:
+        with h5py.File(tmp_path, mode="w") as store_file:
+            store_file.attrs["format_version"] = SPIKE_STORE_FORMAT_VERSION
+            for attr_key, attr_value in (attrs or {}).items():
+                store_file.attrs[attr_key] = attr_value
+            store_file.create_dataset("spike_seconds", data=all_seconds)
+            store_file.create_dataset("spike_frames", data=all_frames)
+            store_file.create_dataset("unit_offsets", data=unit_offsets)
+            units_group = store_file.create_group("units")
+            units_group.create_dataset("unit_name", data=list(unit_names), dtype=string_dtype)
+            units_group.create_dataset("group", data=[fields["group"] for fields in parsed], dtype=string_dtype)
+            units_group.create_dataset("region", data=list(unit_regions), dtype=string_dtype)
+            units_group.create_dataset("cluster_id", data=np.array([fields["cluster_id"] for fields in parsed], dtype=np.int64))
+            units_group.create_dataset("channel", data=np.array([fields["channel"] for fields in parsed], dtype=np.int64))
+            units_group.create_dataset("n_spikes", data=n_spikes)
+
+    return store_path
+
+
+def _memmap_or_read(store_path: pathlib.Path, dataset: h5py.Dataset) -> np.ndarray:
+    """
+    Description
+    -----------
+    Returns a read-only view of a 1-D dataset: a zero-copy `np.memmap`
+    when the dataset is stored contiguously and uncompressed (the layout
+    `write_spike_store` produces), otherwise an in-memory copy.
+
+    Parameters
+    ----------
+    store_path (pathlib.Path)
+        Path of the open HDF5 file.
+    dataset (h5py.Dataset)
+        Dataset to map.
+
+    Returns
+    -------
+    values (np.ndarray)
+        Read-only array of the dataset's values.
+    """
+
+    offset = dataset.id.get_offset()
+    if dataset.shape[0] == 0 or offset is None or dataset.chunks is not None:
+        values = dataset[()]
+        values.flags.writeable = False
+        return values
+    return np.memmap(store_path, mode="r", dtype=dataset.dtype, offset=offset, shape=dataset.shape)
+
+
+class SpikeStore:
+    """
+    Description
+    -----------
+    Read-only access to one probe-session spike store. Opening the store
+    reads the offsets index and the per-unit metadata; the spike arrays
+    are memory-mapped, so `seconds` / `frames` return zero-copy views and
+    bulk region selections touch only the pages of the selected units.
+    """
+
+    def __init__(self, store_path: str | pathlib.Path) -> None:
+        """
+        Description
+        -----------
+        Opens the store and loads its index.
+
+        Parameters
+        ----------
+        store_path (str | pathlib.Path)
+            Path to a `*_spike_store.h5` file.
+
+        Returns
+        -------
+        None
+        """
+
+        self.store_path = pathlib.Path(store_path)
+        with h5py.File(self.store_path, mode="r") as store_file:
+            self.attrs = dict(store_file.attrs)
+            self.unit_offsets = store_file["unit_offsets"][()]
+            self._spike_seconds = _memmap_or_read(self.store_path, store_file["spike_seconds"])
+            self._spike_frames = _memmap_or_read(self.store_path, store_file["spike_frames"])
+            units_group = store_file["units"]
+            self.unit_metadata = {
+                **{column: units_group[column].asstr()[()].tolist() for column in _UNIT_STRING_COLUMNS},
+                **{column: units_group[column][()] for column in _UNIT_INT_COLUMNS},
+            }
+        self.unit_names = self.unit_metadata["unit_name"]
+        self._unit_index = {unit_name: unit_idx for unit_idx, unit_name in enumerate(self.unit_names)}
+
+    def __enter__(self) -> SpikeStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.unit_names)
+
+    def __contains__(self, unit_name: str) -> bool:
+        return unit_name in self._unit_index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.unit_names)
+
+    def close(self) -> None:
+        """
+        Description
+        -----------
+        Drops the memory maps; views handed out earlier stay valid.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None
+        """
+
+        self._spike_seconds = None
+        self._spike_frames = None
+
+    def _bounds(self, unit_name: str) -> tuple[int, int]:
+        if unit_name not in self._unit_index:
+            raise KeyError(f"Unit '{unit_name}' is not in spike store {self.store_path}.")
+        unit_idx = self._unit_index[unit_name]
+        return int(self.unit_offsets[unit_idx]), int(self.unit_offsets[unit_idx + 1])
+
+    def seconds(self, unit_name: str) -> np.ndarray:
+        """
+        Description
+        -----------
+        Zero-copy view of one unit's spike times in seconds.
+
+        Parameters
+        ----------
+        unit_name (str)
+            Unit name.
+
+        Returns
+        -------
+        spike_seconds (np.ndarray)
+            Read-only (n_spikes,) float64 view.
+        """
+
+        lo, hi = self._bounds(unit_name)
+        return self._spike_seconds[lo:hi]
+
+    def frames(self, unit_name: str) -> np.ndarray:
+        """
+        Description
+        -----------
+        Zero-copy view of one unit's spike times in video frames.
+
+        Parameters
+        ----------
+        unit_name (str)
+            Unit name.
+
+        Returns
+        -------
+        spike_frames (np.ndarray)
+            Read-only (n_spikes,) int64 view.
+        """
+
+        lo, hi = self._bounds(unit_name)
+        return self._spike_frames[lo:hi]
+
+    def unit_array(self, unit_name: str) -> np.ndarray:
+        """
+        Description
+        -----------
+        One unit's spikes in the legacy `cluster_data` layout.
+
+        Parameters
+        ----------
+        unit_name (str)
+            Unit name.
+
+        Returns
+        -------
+        spikes (np.ndarray)
+            (2, n_spikes) float64 array: seconds (row 0), frames (row 1).
+        """
+
+        return np.vstack((self.seconds(unit_name), self.frames(unit_name).astype(np.float64)))
+
+    def n_spikes(self, unit_name: str) -> int:
+        """
+        Description
+        -----------
+        Spike count of one unit, read from the index only.
+
+        Parameters
+        ----------
+        unit_name (str)
+            Unit name.
+
+        Returns
+        -------
+        n_spikes (int)
+            Number of spikes.
+        """
+
+        lo, hi = self._bounds(unit_name)
+        return hi - lo
+
+    def select_units(self,
+                     groups: Iterable[str] | None = None,
+                     regions: Iterable[str] | None = None,
+                     channels: Iterable[int] | None = None) -> list[str]:
+        """
+        Description
+        -----------
+        Unit names matching every given metadata criterion, in store order.
+
+        Parameters
+        ----------
+        groups (Iterable[str] | None)
+            Allowed curation groups ("good", "mua").
+        regions (Iterable[str] | None)
+            Allowed stored region acronyms.
+        channels (Iterable[int] | None)
+            Allowed Kilosort-row channels.
+
+        Returns
+        -------
+        unit_names (list[str])
+            Selected units.
+        """
+
+        group_set = None if groups is None else set(groups)
+        region_set = None if regions is None else set(regions)
+        channel_set = None if channels is None else {int(ch) for ch in channels}
+        selected = []
+        for unit_idx, unit_name in enumerate(self.unit_names):
+            if group_set is not None and self.unit_metadata["group"][unit_idx] not in group_set:
+                continue
+            if region_set is not None and self.unit_metadata["region"][unit_idx] not in region_set:
+                continue
+            if channel_set is not None and int(self.unit_metadata["channel"][unit_idx]) not in channel_set:
+                continue
+            selected.append(unit_name)
+        return selected
+
+    def units_in_region(self,
+                        region: str,
+                        region_ranges: dict | None = None) -> list[str]:
+        """
+        Description
+        -----------
+        Unit names in one brain region. With `region_ranges` (one probe's
+        block of `neuropixels_sites_to_anatomy_converter.json`, i.e.
+        `{region: [[lo, hi], ...]}` in Kilosort-row space, `hi` exclusive)
+        units are matched by channel, as `find_region_by_channel` does;
+        otherwise the region stored in the file is used.
+
+        Parameters
+        ----------
+        region (str)
+            Region acronym.
+        region_ranges (dict | None)
+            Region-to-channel-range map of this probe.
+
+        Returns
+        -------
+        unit_names (list[str])
+            Units in the region, in store order.
+        """
+
+        if region_ranges is None:
+            return self.select_units(regions=[region])
+        channels = [
+            channel
+            for channel_lo, channel_hi in region_ranges.get(region, [])
+            for channel in range(int(channel_lo), int(channel_hi))
+        ]
+        return self.select_units(channels=channels)
+
+    def region_seconds(self,
+                       region: str,
+                       region_ranges: dict | None = None) -> dict[str, np.ndarray]:
+        """
+        Description
+        -----------
+        Bulk access: spike-second views of every unit in one region.
+
+        Parameters
+        ----------
+        region (str)
+            Region acronym.
+        region_ranges (dict | None)
+            See `units_in_region`.
+
+        Returns
+        -------
+        spike_seconds (dict[str, np.ndarray])
+            Unit name to zero-copy spike-second view.
+        """
+
+        return {unit_name: self.seconds(unit_name) for unit_name in self.units_in_region(region, region_ranges)}
+
+    def export_legacy_npy(self, cluster_data_dir: str | pathlib.Path) -> list[pathlib.Path]:
+        """
+        Description
+        -----------
+        Writes the legacy per-unit `cluster_data/<unit>.npy` files.
+
+        Parameters
+        ----------
+        cluster_data_dir (str | pathlib.Path)
+            Output directory (created if missing).
+
+        Returns
+        -------
+        npy_paths (list[pathlib.Path])
+            Written files, in store order.
+        """
+
+        cluster_data_dir = pathlib.Path(cluster_data_dir)
+        cluster_data_dir.mkdir(parents=True, exist_ok=True)
+        npy_paths = []
+        for unit_name in self.unit_names:
+            npy_path = cluster_data_dir / f"{unit_name}.npy"
+            np.save(file=npy_path, arr=self.unit_array(unit_name))
+            npy_paths.append(npy_path)
+        return npy_paths
+
+
+@functools.lru_cache(maxsize=32)
+def _open_spike_store_cached(store_path: str, mtime_ns: int) -> SpikeStore:
+    return SpikeStore(store_path)
+
+
+def open_spike_store(store_path: str | pathlib.Path) -> SpikeStore:
+    """
+    Description
+    -----------
+    Cached `SpikeStore` opener, so per-unit loads through `StoredUnit`
+    handles reuse one index read and one memory map per store (and per
+    process, in pool workers). The cache is keyed on the file's mtime, so
+    a store rewritten by a new split is reopened.
+
+    Parameters
+    ----------
+    store_path (str | pathlib.Path)
+        Path to a `*_spike_store.h5` file.
+
+    Returns
+    -------
+    store (SpikeStore)
+        The opened store.
+    """
+
+    store_path = pathlib.Path(store_path)
+    return _open_spike_store_cached(str(store_path), store_path.stat().st_mtime_ns)
+
+
+@dataclass(frozen=True)
+class StoredUnit:
+    """
+    Description
+    -----------
+    Picklable handle to one unit in a spike store. It exposes `name` and
+    `stem` like the legacy `pathlib.Path` cluster files, so code that keys
+    outputs by file stem treats both kinds of unit the same.
+    """
+
+    store_path: str
+    unit_name: str
+
+    @property
+    def name(self) -> str:
+        return self.unit_name
+
+    @property
+    def stem(self) -> str:
+        return self.unit_name
+
+
+def discover_session_units(root_directory: str | pathlib.Path,
+                           groups: Iterable[str] | None = None) -> list[StoredUnit | pathlib.Path]:
+    """
+    Description
+    -----------
+    Lists the spike-sorted units of one session, sorted by unit name.
+    Probes with a spike store contribute `StoredUnit` handles (one index
+    read per probe); probes without one fall back to the legacy
+    `cluster_data/*.npy` files.
+
+    Parameters
+    ----------
+    root_directory (str | pathlib.Path)
+        Session root directory.
+    groups (Iterable[str] | None)
+        Keep only these curation groups ("good", "mua"); all when None.
+
+    Returns
+    -------
+    units (list[StoredUnit | pathlib.Path])
+        Unit handles; load them with `load_unit_spikes`.
+    """
+
+    ephys_dir = pathlib.Path(root_directory) / "ephys"
+    group_set = None if groups is None else set(groups)
+    units = []
+    stored_probes = set()
+    for store_path in find_spike_stores(root_directory):
+        stored_probes.add(store_path.parent.name)
+        store = open_spike_store(store_path)
+        units.extend(StoredUnit(store_path=str(store_path), unit_name=unit_name) for unit_name in store.select_units(groups=group_set))
+    for npy_path in ephys_dir.rglob("cluster_data/*.npy"):
+        if npy_path.parent.parent.name in stored_probes:
+            continue
+        if group_set is not None and npy_path.stem.rsplit("_", 1)[-1] not in group_set:
+            continue
+        units.append(npy_path)
+    return sorted(units, key=lambda unit: unit.name)
+
+
+def load_unit_spikes(unit: StoredUnit | pathlib.Path) -> np.ndarray:
+    """
+    Description
+    -----------
+    Loads one unit in the legacy (2, n_spikes) layout from either a
+    spike-store handle or a legacy .npy file.
+
+    Parameters
+    ----------
+    unit (StoredUnit | pathlib.Path)
+        Unit handle from `discover_session_units`.
+
+    Returns
+    -------
+    spikes (np.ndarray)
+        Seconds (row 0) and frames (row 1).
+    """
+
+    if isinstance(unit, StoredUnit):
+        return open_spike_store(unit.store_path).unit_array(unit.unit_name)
+    return np.load(file=unit)
+
+
+def session_unit_spike_counts(root_directory: str | pathlib.Path, probe_id: str) -> dict[str, int]:
+    """
+    Description
+    -----------
+    Spike count of every unit of one probe in one session, read from the
+    spike-store index, or from the legacy .npy headers when the session
+    has no store.
+
+    Parameters
+    ----------
+    root_directory (str | pathlib.Path)
+        Session root directory.
+    probe_id (str)
+        Probe identifier, e.g. "imec0".
+
+    Returns
+    -------
+    spike_counts (dict[str, int])
+        Unit name to spike count.
+    """
+
+    store_path = spike_store_path(root_directory, probe_id)
+    if store_path.is_file():
+        store = open_spike_store(store_path)
+        return {unit_name: store.n_spikes(unit_name) for unit_name in store.unit_names}
+    cluster_data_dir = pathlib.Path(root_directory) / "ephys" / probe_id / "cluster_data"
+    # mmap_mode='r' reads only the .npy header (shape/dtype), not the payload
+    return {npy_path.stem: int(np.load(npy_path, mmap_mode="r").shape[1]) for npy_path in cluster_data_dir.glob("*.npy")}
@@ -10,9 +10,7 @@ import json
 import pathlib
 import sys
 
-import librosa
-import numpy as np
-from scipy.io import wavfile
+from usv_playpen.processing.hpss_streaming import hpss_wav_file
 
 
 def hpss_func(
@@ -58,49 +56,21 @@ def hpss_func(
         '_parameter_settings', 'processing_settings.json'
     )
     hpss_params = json.loads(settings_traversable.read_text())['modify_files']['Operator']['hpss_audio']
-    stft_window_length, stft_hop_size = hpss_params['stft_window_length_hop_size']
 
-    # read the audio file (use Scipy, not Librosa because Librosa performs scaling)
-    sampling_rate_audio, audio_data = wavfile.read(wav_file)
-
-    # convert to float32 because librosa.stft() requires float32
-    audio_data = audio_data.astype(np.float32)
-
-    # perform Short-Time Fourier Transform (STFT) on the audio data
-    spectrogram_data = librosa.stft(
-        y=audio_data, n_fft=stft_window_length, hop_length=stft_hop_size
-    )
-
-    # perform HPSS on the spectrogram data
-    D_harmonic, D_percussive = librosa.decompose.hpss(
-        S=spectrogram_data,
-        kernel_size=hpss_params['kernel_size'],
-        power=hpss_params['hpss_power'],
-        mask=False,
-        margin=hpss_params['margin'],
-    )
-
-    # convert the harmonic component back to the time domain
-    harmonic_data = librosa.istft(
-        stft_matrix=D_harmonic,
-        length=audio_data.shape[0],
-        win_length=stft_window_length,
-        hop_length=stft_hop_size,
-    )
-
-    # ensure the float values are within the range of 16-bit integers. Clip values outside the range to the minimum and maximum representable values.
-    harmonic_data_clipped = np.clip(
-        harmonic_data, np.iinfo(np.int16).min, np.iinfo(np.int16).max
-    ).astype(np.int16)
-
-    # save the harmonic component as a new WAV file
+    # save the harmonic component as a new WAV file; with a positive 'block_seconds'
+    # the channel is memory-mapped and separated in blocks, so the job's memory
+    # request no longer has to cover the whole recording several times over
     hpss_dir = pathlib.Path('/mnt/cup/labs') / cup_recording_directory / recording_identifier / 'audio' / 'hpss'
     hpss_dir.mkdir(parents=True, exist_ok=True)
 
-    wavfile.write(
-        filename=hpss_dir / f"{wav_file.stem}_hpss.wav",
-        rate=sampling_rate_audio,
-        data=harmonic_data_clipped,
+    hpss_wav_file(
+        wav_file=wav_file,
+        output_file=hpss_dir / f"{wav_file.stem}_hpss.wav",
+        stft_window_length_hop_size=hpss_params['stft_window_length_hop_size'],
+        kernel_size=hpss_params['kernel_size'],
+        hpss_power=hpss_params['hpss_power'],
+        margin=hpss_params['margin'],
+        block_seconds=hpss_params['block_seconds'],
     )
 
 
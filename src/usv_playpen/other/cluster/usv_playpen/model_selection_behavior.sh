@@ -10,6 +10,9 @@
 #SBATCH --mail-type=FAIL
 
 # Usage: sbatch model_selection_behavior.sh (onset|params|category|multinomial|continuous)
+# To shard each step's candidates across array tasks, set
+# hyperparameters.selection_scheduler.executor to "slurm_array" and submit with
+# e.g. --array=0-7 (log names then also need %a); task 0 writes the results.
 ANALYSIS_TYPE=$1
 
 # Define core variables
@@ -36,7 +36,6 @@ from datetime import datetime
 import click
 import h5py
 import numpy as np
-import polars as pls
 from click.core import ParameterSource
 
 from ..cli_utils import modify_settings_json_for_cli
@@ -420,6 +419,8 @@ class USVAcousticFeatureExtractor:
         # for every USV when the session has no mask group at all).
         features["mask_number"] = mask_counts
 
+        import polars as pls  # noqa: PLC0415 (lazy: keeps polars off the CLI import path)
+
         features_df = pls.DataFrame(
             {"_usv_row": usv_indices, **{name: features[name].astype(np.float64) for name in FEATURE_COLUMNS}}
         )
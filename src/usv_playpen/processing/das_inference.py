@@ -20,7 +20,7 @@ import librosa
 import matplotlib.pyplot as plt
 import numpy as np
 import polars as pls
-from scipy.signal import find_peaks
+from joblib import Parallel, delayed
 from tqdm import tqdm
 
 from ..os_utils import configure_path, first_match_or_raise, wait_for_subprocesses
@@ -113,6 +113,15 @@ def _watershed_merge_segments(
     segment can neither create a peak nor fill a valley, which is precisely the
     over-merge failure mode of the greedy union it replaces.
 
+    The grid is never materialized: each channel's segments are unioned into
+    disjoint bin intervals, the coverage is kept as a run-length profile built
+    from the sorted interval start/stop events, and the peaks, valleys and
+    trimmed edges are located on its runs. The detected channels of each USV
+    are found by binary search on every channel's interval ends. Memory and
+    time therefore scale with the number of segments, not with the recording
+    length divided by ``coverage_bin_ms``, and the result is bin-for-bin the
+    one a dense coverage array would give.
+
     Parameters
     ----------
     all_segments : list
@@ -146,61 +155,104 @@ def _watershed_merge_segments(
     t1 = max(seg[1] for seg in all_segments)
     n_bins = math.ceil((t1 - t0) / dt) + 2
 
-    # Per-channel coverage masks (a channel votes at most once per bin), summed
-    # across channels into the integer coverage profile.
+    # Per-channel coverage intervals (a channel votes at most once per bin):
+    # each channel's segments are binned to half-open [bin_start, bin_stop)
+    # intervals and unioned into sorted, disjoint runs, which double as the
+    # channel's interval index for the detected-channel lookup below.
     segments_by_channel = defaultdict(list)
     for start, stop, ch_idx in all_segments:
         segments_by_channel[ch_idx].append((start, stop))
 
-    channel_masks = {}
-    coverage = np.zeros(n_bins, dtype=np.int32)
+    channel_intervals = {}
     for ch_idx, channel_segments in segments_by_channel.items():
-        mask = np.zeros(n_bins, dtype=bool)
-        for start, stop in channel_segments:
-            bin_start = int((start - t0) / dt)
-            bin_stop = math.ceil((stop - t0) / dt)
-            mask[bin_start:bin_stop] = True
-        channel_masks[ch_idx] = mask
-        coverage += mask
-
-    # Active regions: maximal runs where coverage >= 1.
-    padded = np.concatenate(([0], (coverage >= 1).astype(np.int8), [0]))
-    region_edges = np.flatnonzero(np.diff(padded))
+        bin_starts = np.array([int((start - t0) / dt) for start, _ in channel_segments], dtype=np.int64)
+        bin_stops = np.minimum(np.array([math.ceil((stop - t0) / dt) for _, stop in channel_segments], dtype=np.int64), n_bins)
+        keep = bin_stops > bin_starts
+        bin_starts, bin_stops = bin_starts[keep], bin_stops[keep]
+        order = np.argsort(bin_starts, kind="stable")
+        bin_starts, bin_stops = bin_starts[order], bin_stops[order]
+        if bin_starts.size == 0:
+            channel_intervals[ch_idx] = (bin_starts, bin_stops)
+            continue
+        reach = np.maximum.accumulate(bin_stops)
+        new_run = np.ones(bin_starts.size, dtype=bool)
+        new_run[1:] = bin_starts[1:] > reach[:-1]
+        run_first = np.flatnonzero(new_run)
+        run_last = np.append(run_first[1:], bin_starts.size) - 1
+        channel_intervals[ch_idx] = (bin_starts[run_first], reach[run_last])
+
+    # Coverage as a run-length profile from the sorted +1/-1 interval events:
+    # ``coverage`` holds the value on [run_starts[k], run_starts[k + 1]), only
+    # value changes are kept, and the profile is 0 before the first and after
+    # the last event, so memory and time follow the number of segments rather
+    # than the recording length.
+    event_bins = np.concatenate([bins for intervals in channel_intervals.values() for bins in intervals])
+    event_deltas = np.concatenate([
+        np.concatenate((np.ones(starts.size, dtype=np.int64), -np.ones(stops.size, dtype=np.int64)))
+        for starts, stops in channel_intervals.values()
+    ])
+    if event_bins.size == 0:
+        return []
+    event_positions, event_inverse = np.unique(event_bins, return_inverse=True)
+    coverage = np.cumsum(np.bincount(event_inverse, weights=event_deltas).astype(np.int64))
+    changed = np.ones(coverage.size, dtype=bool)
+    changed[1:] = coverage[1:] != coverage[:-1]
+    run_starts = event_positions[changed]
+    coverage = coverage[changed]
+    run_stops = np.append(run_starts[1:], n_bins)
+
+    # Active regions: maximal runs of consecutive coverage >= 1 runs (the value
+    # changes between them, so no two adjacent runs are both zero).
+    active = coverage >= 1
+    region_edges = np.flatnonzero(np.diff(np.concatenate(([0], active.astype(np.int8), [0]))))
     active_regions = list(zip(region_edges[0::2], region_edges[1::2], strict=False))
 
     # Watershed split each active region at valleys between consecutive
-    # significant peaks. The region coverage is zero-padded on both ends (the
-    # true coverage just outside an active region is 0), so a call sitting at the
-    # very start or end of a region -- whose peak would otherwise be a boundary
-    # sample find_peaks cannot see -- is still detected.
+    # significant peaks, on the run-length profile. The true coverage just
+    # outside an active region is 0, so a call sitting at the very start or
+    # end of a region is still a peak. A peak is a run higher than both of its
+    # neighbours and, as in scipy.signal.find_peaks, sits at the middle bin of
+    # its plateau; the valley between two peaks is the first bin of the first
+    # lowest run between them.
     pieces = []
-    for region_start, region_stop in active_regions:
-        padded_coverage = np.concatenate(([0], coverage[region_start:region_stop], [0]))
-        peaks, _ = find_peaks(padded_coverage, height=peak_min)
-        if len(peaks) <= 1:
+    for first_run, stop_run in active_regions:
+        region_start, region_stop = int(run_starts[first_run]), int(run_stops[stop_run - 1])
+        region_coverage = coverage[first_run:stop_run]
+        padded_coverage = np.concatenate(([0], region_coverage, [0]))
+        peak_runs = np.flatnonzero(
+            (region_coverage > padded_coverage[:-2])
+            & (region_coverage > padded_coverage[2:])
+            & (region_coverage >= peak_min)
+        ) + first_run
+        if len(peak_runs) <= 1:
             pieces.append((region_start, region_stop))
             continue
-        peak_heights = padded_coverage[peaks]
         split_bins = []
-        for i in range(len(peaks) - 1):
-            lo, hi = peaks[i], peaks[i + 1]
-            valley_offset = lo + int(np.argmin(padded_coverage[lo:hi + 1]))
-            if padded_coverage[valley_offset] < valley_frac * min(peak_heights[i], peak_heights[i + 1]):
-                # map the padded index back to a global coverage-bin index
-                split_bins.append(region_start + valley_offset - 1)
+        for i in range(len(peak_runs) - 1):
+            lo, hi = peak_runs[i], peak_runs[i + 1]
+            valley_run = lo + int(np.argmin(coverage[lo:hi + 1]))
+            if coverage[valley_run] < valley_frac * min(coverage[lo], coverage[hi]):
+                split_bins.append(int(run_starts[valley_run]))
         boundaries = [region_start, *split_bins, region_stop]
         pieces.extend((boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1))
 
-    # Trim each piece to its call extent and assign detected channels.
+    # Trim each piece to its call extent and assign detected channels: a
+    # channel is detected if one of its disjoint intervals overlaps the trimmed
+    # bins [left, right], found by binary search on the interval ends.
     merged = []
     for piece_start, piece_stop in pieces:
-        piece_coverage = coverage[piece_start:piece_stop]
+        first_run = int(np.searchsorted(run_starts, piece_start, side="right")) - 1
+        stop_run = int(np.searchsorted(run_starts, piece_stop, side="left"))
+        piece_coverage = coverage[first_run:stop_run]
         level = valley_frac * int(piece_coverage.max())
-        above = np.flatnonzero(piece_coverage >= level)
-        left = piece_start + int(above[0])
-        right = piece_start + int(above[-1])
-        chs_detected = {ch_idx for ch_idx, mask in channel_masks.items()
-                        if mask[left:right + 1].any()}
+        above = np.flatnonzero(piece_coverage >= level) + first_run
+        left = max(piece_start, int(run_starts[above[0]]))
+        right = min(piece_stop, int(run_stops[above[-1]])) - 1
+        chs_detected = set()
+        for ch_idx, (starts, stops) in channel_intervals.items():
+            interval_idx = int(np.searchsorted(stops, left, side="right"))
+            if interval_idx < stops.size and starts[interval_idx] <= right:
+                chs_detected.add(ch_idx)
         merged.append({
             'start': t0 + left * dt,
             'stop': t0 + (right + 1) * dt,
@@ -213,6 +265,187 @@ def _watershed_merge_segments(
     return merged
 
 
+# Number of consecutive (start-sorted) USVs whose windows are read from the
+# audio memmap and scored together; also the unit of work handed to a worker
+# when the Phase-4 noise rejection runs on a process pool.
+DAS_NOISE_BLOCK_USVS = 256
+
+# Upper bound (bytes) on the complex STFT one vectorized Phase-4 batch may
+# hold; the batch size adapts to the window lengths and channel counts.
+DAS_NOISE_BATCH_STFT_BYTES = 128 * 1024 ** 2
+
+
+def _usv_noise_descriptors(
+    audio_file_loc: pathlib.Path,
+    data_type: str,
+    sample_num: int,
+    channel_num: int,
+    sample_starts: np.ndarray,
+    sample_stops: np.ndarray,
+    chs_detected: list,
+    len_win_signal: int,
+    lower_bin: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the Phase-4 noise-rejection descriptors of a block of USVs.
+
+    Batched replacement for the per-USV Phase-4 loop. The windows are read from
+    the audio memmap in the given (start-sorted) order, so the reads sweep the
+    file sequentially. They are then grouped by detected-channel count, sorted
+    by length and cut into batches whose complex STFT stays under
+    ``DAS_NOISE_BATCH_STFT_BYTES``. Within a batch every window is zero-padded
+    to the longest one and a single ``librosa.stft`` call transforms all of
+    them; with ``center=True`` the zero padding is exactly the padding the STFT
+    would add to the shorter window anyway, so its native frames are unchanged
+    and the frames past them are masked out of every statistic.
+
+    The descriptors are the ones the per-USV loop computed:
+
+    * peak amplitude channel: channel of the first maximum of the window
+      (``np.argmax`` over the row-major window);
+    * mean amplitude channel: channel with the largest mean absolute sample;
+    * for USVs detected on more than one channel, the mean pairwise Pearson
+      correlation (``np.corrcoef``) of the detected channels' STFT magnitudes
+      above ``lower_bin``;
+    * for USVs detected on a single channel, the variance of its max-normalized
+      STFT power.
+
+    The memmap is opened here (rather than passed in) so the function can run
+    in a pool worker without pickling the recording.
+
+    Parameters
+    ----------
+    audio_file_loc : pathlib.Path
+        Location of the concatenated hpss_filtered audio memmap.
+    data_type : str
+        Sample dtype of the memmap.
+    sample_num : int
+        Number of samples (rows) in the memmap.
+    channel_num : int
+        Number of channels (columns) in the memmap.
+    sample_starts : np.ndarray
+        First sample of every USV window.
+    sample_stops : np.ndarray
+        Stop sample (exclusive) of every USV window.
+    chs_detected : list
+        Sorted list of detected channel indices of every USV.
+    len_win_signal : int
+        STFT window length.
+    lower_bin : int
+        First STFT frequency bin entering the channel correlations.
+
+    Returns
+    -------
+    peak_amp_ch : np.ndarray
+        Peak amplitude channel of every USV.
+    mean_amp_ch : np.ndarray
+        Mean amplitude channel of every USV.
+    mean_signal_correlations : np.ndarray
+        Mean spectrogram correlation across detected channels (NaN for
+        single-channel USVs).
+    signal_variance : np.ndarray
+        Normalized spectral variance (NaN for multi-channel USVs).
+    """
+    audio_file_data = np.memmap(
+        filename=audio_file_loc,
+        mode="r",
+        dtype=data_type,
+        shape=(sample_num, channel_num),
+    )
+
+    n_usv = len(sample_starts)
+    peak_amp_ch = np.zeros(n_usv, dtype=np.int64)
+    mean_amp_ch = np.zeros(n_usv, dtype=np.int64)
+    mean_signal_correlations = np.full(n_usv, np.nan)
+    signal_variance = np.full(n_usv, np.nan)
+
+    # one sequential pass over the memmap
+    windows = [np.asarray(audio_file_data[start:stop, :]) for start, stop in zip(sample_starts, sample_stops)]
+    for i, window in enumerate(windows):
+        if window.shape[0] == 0:
+            msg = (
+                f"USV window [{sample_starts[i]}, {sample_stops[i]}) is empty; the DAS "
+                f"annotations extend past the end of the audio memmap ({sample_num} samples)"
+            )
+            raise ValueError(msg)
+
+    hop_length = len_win_signal // 4
+    n_stft_bins = 1 + len_win_signal // 2
+    peak_fill = np.iinfo(data_type).min if np.issubdtype(data_type, np.integer) else -np.inf
+
+    order = sorted(range(n_usv), key=lambda usv_idx: (len(chs_detected[usv_idx]), windows[usv_idx].shape[0]))
+    batch_start = 0
+    while batch_start < n_usv:
+        # grow the batch while the padded complex STFT stays within budget
+        n_chs = len(chs_detected[order[batch_start]])
+        batch_stop = batch_start + 1
+        while batch_stop < n_usv:
+            next_idx = order[batch_stop]
+            stft_bytes = (batch_stop - batch_start + 1) * n_chs * n_stft_bins * (1 + windows[next_idx].shape[0] // hop_length) * 8
+            if len(chs_detected[next_idx]) != n_chs or stft_bytes > DAS_NOISE_BATCH_STFT_BYTES:
+                break
+            batch_stop += 1
+        batch_indices = order[batch_start:batch_stop]
+        batch_start = batch_stop
+
+        lengths = np.array([windows[usv_idx].shape[0] for usv_idx in batch_indices])
+        sample_valid = np.arange(lengths.max())[None, :] < lengths[:, None]
+        padded_windows = np.zeros((len(batch_indices), lengths.max(), channel_num), dtype=data_type)
+        for row_idx, usv_idx in enumerate(batch_indices):
+            padded_windows[row_idx, :lengths[row_idx]] = windows[usv_idx]
+
+        # peak / mean amplitude channels over all channels of the window
+        peak_flat = np.where(sample_valid[:, :, None], padded_windows, peak_fill).reshape(len(batch_indices), -1).argmax(axis=1)
+        peak_amp_ch[batch_indices] = peak_flat % channel_num
+        mean_abs = np.abs(padded_windows).sum(axis=1, dtype=np.float64) / lengths[:, None]
+        mean_amp_ch[batch_indices] = mean_abs.argmax(axis=1)
+
+        # (batch, detected channel, freq, frame) STFT of the detected channels
+        signals = np.stack([
+            padded_windows[row_idx][:, chs_detected[usv_idx]].T
+            for row_idx, usv_idx in enumerate(batch_indices)
+        ]).astype("float32")
+        del padded_windows
+        magnitude = np.abs(librosa.stft(signals, n_fft=len_win_signal))
+        del signals
+        native_frames = 1 + lengths // hop_length
+        frame_valid = np.arange(magnitude.shape[-1])[None, :] < native_frames[:, None]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if n_chs > 1:
+                # Defensive: if lower_bin sits past the STFT's freq axis the
+                # slice is empty and the correlations are meaningless; surface
+                # the real problem here.
+                if lower_bin >= magnitude.shape[2]:
+                    msg = (
+                        f"lower_bin ({lower_bin}) exceeds STFT freq-axis "
+                        f"length ({magnitude.shape[2]}); "
+                        "check `low_freq_cutoff` vs `len_win_signal` / sampling rate"
+                    )
+                    raise ValueError(msg)
+                # masked np.corrcoef: center each channel over its native
+                # frames, then normalize the channel covariance matrix
+                band = magnitude[:, :, lower_bin:, :].astype(np.float64) * frame_valid[:, None, None, :]
+                n_values = (band.shape[2] * native_frames)[:, None, None, None]
+                band -= band.sum(axis=(2, 3), keepdims=True) / n_values
+                band *= frame_valid[:, None, None, :]
+                band = band.reshape(len(batch_indices), n_chs, -1)
+                covariance = np.matmul(band, band.transpose(0, 2, 1))
+                del band
+                std = np.sqrt(np.diagonal(covariance, axis1=1, axis2=2))
+                correlation_matrix = np.clip(covariance / (std[:, :, None] * std[:, None, :]), -1, 1)
+                upper_rows, upper_cols = np.triu_indices(n=n_chs, k=1)
+                mean_signal_correlations[batch_indices] = correlation_matrix[:, upper_rows, upper_cols].mean(axis=1)
+            else:
+                power = magnitude[:, 0].astype(np.float64) ** 2 * frame_valid[:, None, :]
+                n_values = power.shape[1] * native_frames
+                normalized_power = power / power.max(axis=(1, 2))[:, None, None]
+                normalized_mean = normalized_power.sum(axis=(1, 2)) / n_values
+                squared_deviation = ((normalized_power - normalized_mean[:, None, None]) ** 2) * frame_valid[:, None, :]
+                signal_variance[batch_indices] = squared_deviation.sum(axis=(1, 2)) / n_values
+
+    return peak_amp_ch, mean_amp_ch, mean_signal_correlations, signal_variance
+
+
 class FindMouseVocalizations:
     def __init__(
         self,
@@ -491,13 +724,6 @@ class FindMouseVocalizations:
                     int(audio_file_name.split("_")[-3]),
                     int(audio_file_name.split("_")[-4]),
                 )
-                audio_file_data = np.memmap(
-                    filename=audio_file_loc,
-                    mode="r",
-                    dtype=data_type,
-                    shape=(sample_num, channel_num),
-                )
-
                 len_win_signal = self.input_parameter_dict["summarize_das_findings"][
                     "len_win_signal"
                 ]
@@ -507,86 +733,53 @@ class FindMouseVocalizations:
                 frequency_resolution = audio_sampling_rate / len_win_signal
                 lower_bin = int(np.floor(low_freq_cutoff / frequency_resolution))
 
-                condition_0_list = np.full(shape=n_usv, fill_value=False)
-                mean_signal_correlations = np.full(n_usv, np.nan)
-                signal_variance = np.full(n_usv, np.nan)
-
-                for i, usv in tqdm(
-                    enumerate(merged),
+                # Batched descriptors: blocks of DAS_NOISE_BLOCK_USVS consecutive
+                # (start-sorted) USVs, each scored by _usv_noise_descriptors with
+                # vectorized multi-window STFTs, in-process or on a joblib pool.
+                n_jobs = self.input_parameter_dict["summarize_das_findings"]["n_jobs"]
+                sample_starts = np.array([int(np.floor(usv['start'] * audio_sampling_rate)) for usv in merged], dtype=np.int64)
+                sample_stops = np.array([int(np.ceil(usv['stop'] * audio_sampling_rate)) for usv in merged], dtype=np.int64)
+                block_kwargs = [
+                    {
+                        "audio_file_loc": audio_file_loc,
+                        "data_type": data_type,
+                        "sample_num": sample_num,
+                        "channel_num": channel_num,
+                        "sample_starts": sample_starts[block_start:block_start + DAS_NOISE_BLOCK_USVS],
+                        "sample_stops": sample_stops[block_start:block_start + DAS_NOISE_BLOCK_USVS],
+                        "chs_detected": [usv['chs_detected'] for usv in merged[block_start:block_start + DAS_NOISE_BLOCK_USVS]],
+                        "len_win_signal": len_win_signal,
+                        "lower_bin": lower_bin,
+                    }
+                    for block_start in range(0, n_usv, DAS_NOISE_BLOCK_USVS)
+                ]
+                if n_jobs == 1 or len(block_kwargs) < 2:
+                    block_results = (_usv_noise_descriptors(**one_block) for one_block in block_kwargs)
+                else:
+                    block_results = Parallel(n_jobs=n_jobs, backend="loky", return_as="generator")(
+                        delayed(_usv_noise_descriptors)(**one_block) for one_block in block_kwargs
+                    )
+                block_results = list(tqdm(
+                    block_results,
                     desc="Computing spectrogram correlations/variance in progress...",
-                    total=n_usv,
+                    total=len(block_kwargs),
                     position=0,
                     leave=True,
-                ):
-                    start_usv = int(np.floor(usv['start'] * audio_sampling_rate))
-                    stop_usv = int(np.ceil(usv['stop'] * audio_sampling_rate))
-                    # Materialize the USV sample window once: each fresh memmap index
-                    # re-reads the same byte range from disk, and this window is used
-                    # three times (peak/mean amplitude channel + the STFT input below).
-                    window = np.asarray(audio_file_data[start_usv:stop_usv, :])
-                    peak_amp_ch = np.unravel_index(
-                        np.argmax(window),
-                        window.shape,
-                    )[1]
-                    mean_amp_ch = np.argmax(
-                        np.abs(window).mean(axis=0)
-                    )
-                    usv['peak_amp_ch'] = int(peak_amp_ch)
-                    usv['mean_amp_ch'] = int(mean_amp_ch)
-                    usv_detected_chs = usv['chs_detected']
+                ))
+                peak_amp_chs, mean_amp_chs, mean_signal_correlations, signal_variance = (
+                    np.concatenate(descriptor) for descriptor in zip(*block_results, strict=True)
+                )
 
-                    # remove USV segments if they don't appear on both peak and mean amplitude channels; this is clearly noise
+                # remove USV segments if they don't appear on both peak and mean amplitude channels; this is clearly noise
+                condition_0_list = np.full(shape=n_usv, fill_value=False)
+                for i, usv in enumerate(merged):
+                    usv['peak_amp_ch'] = int(peak_amp_chs[i])
+                    usv['mean_amp_ch'] = int(mean_amp_chs[i])
                     condition_0_list[i] = (
-                        peak_amp_ch not in usv_detected_chs
-                        or mean_amp_ch not in usv_detected_chs
+                        usv['peak_amp_ch'] not in usv['chs_detected']
+                        or usv['mean_amp_ch'] not in usv['chs_detected']
                     )
 
-                    # the following section computes channel-wise signal correlations in the frequency domain
-                    if len(usv_detected_chs) > 1:
-                        spectrogram_data_selected_ch = np.abs(
-                            librosa.stft(
-                                window[:, usv_detected_chs]
-                                .astype("float32")
-                                .T,
-                                n_fft=len_win_signal,
-                            )
-                        )
-                        # Defensive: if lower_bin sits past the STFT's
-                        # freq axis the slice is empty and corrcoef
-                        # would later raise an obscure broadcasting
-                        # error; surface the real problem here.
-                        if lower_bin >= spectrogram_data_selected_ch.shape[1]:
-                            msg = (
-                                f"lower_bin ({lower_bin}) exceeds STFT freq-axis "
-                                f"length ({spectrogram_data_selected_ch.shape[1]}); "
-                                "check `low_freq_cutoff` vs `len_win_signal` / sampling rate"
-                            )
-                            raise ValueError(msg)
-                        reshaped_spectrogram = spectrogram_data_selected_ch[
-                            :, lower_bin:, :
-                        ].reshape(len(usv_detected_chs), -1)
-                        correlation_matrix = np.corrcoef(reshaped_spectrogram)
-                        unique_correlations = correlation_matrix[
-                            np.triu_indices(n=len(usv_detected_chs), k=1)
-                        ]
-                        mean_signal_correlations[i] = np.mean(unique_correlations)
-                    else:
-                        spectrogram_data_selected_ch = (
-                            np.abs(
-                                librosa.stft(
-                                    window[:, usv_detected_chs[0]]
-                                    .astype("float32")
-                                    .T,
-                                    n_fft=len_win_signal,
-                                )
-                            )
-                            ** 2
-                        )
-                        signal_variance[i] = np.var(
-                            spectrogram_data_selected_ch
-                            / np.max(spectrogram_data_selected_ch)
-                        )
-
                 # mean_signal_correlations is filled only on the multi-channel branch
                 # and signal_variance only on the single-channel branch, so either array
                 # can be entirely NaN (e.g. every USV detected on a single channel leaves
@@ -42,7 +42,6 @@ from datetime import datetime
 
 import click
 import h5py
-import matplotlib
 import numpy as np
 from click.core import ParameterSource
 
@@ -301,6 +300,7 @@ class MaskGenerator:
             build_predictor,
             process_session_batch_boxprompt,
         )
+        import matplotlib  # noqa: PLC0415 (lazy: keeps matplotlib off the CLI import path)
 
         logger = logging.getLogger("usv_playpen.generate_masks")
 
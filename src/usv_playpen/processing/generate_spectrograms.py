@@ -25,50 +25,93 @@ before trusting downstream embeddings.
 from __future__ import annotations
 
 import pathlib
+import time
 from collections.abc import Callable
 from datetime import datetime
 
 import click
 import h5py
-import librosa
 import numpy as np
-import polars as pls
 from click.core import ParameterSource
 
 from ..cli_utils import modify_settings_json_for_cli
-from ..os_utils import first_match_or_raise
+from ..os_utils import atomic_output_path, first_match_or_raise
 from ..time_utils import is_gui_context, smart_wait
 
 # Numerical floor reused from the original spectrogram code for normalization.
 _NORMALIZE_EPS = 1e-6
 
+# ``librosa.power_to_db`` defaults (amplitude floor and dynamic-range clip),
+# applied here to a whole batch at once.
+_POWER_TO_DB_AMIN = 1e-10
+_POWER_TO_DB_TOP_DB = 80.0
 
-def compute_usv_spectrogram(
-    audio_segment_channels: np.ndarray,
+# Upper bound on the complex STFT a single batched call may hold (bytes); the
+# batch size adapts to the segment length and channel count under this budget.
+SPECTROGRAM_BATCH_STFT_BYTES = 256 * 1024 ** 2
+
+# Number of consecutive usv_summary rows computed and written to the HDF5
+# dataset at a time (bounds how many spectrograms are held in memory).
+SPECTROGRAM_WRITE_CHUNK_USVS = 512
+
+
+def _frequency_interpolation_matrix(n_band_bins: int, num_freq_bins: int) -> np.ndarray:
+    """
+    Description
+    -----------
+    Builds the (num_freq_bins, n_band_bins) matrix that resamples a band-limited
+    spectrogram along frequency in one matrix product. Column ``k`` is
+    ``np.interp`` of the ``k``-th unit vector, so by linearity ``W @ spec``
+    equals interpolating every time slice of ``spec`` with ``np.interp`` from
+    ``linspace(0, 1, n_band_bins)`` onto ``linspace(0, 1, num_freq_bins)``.
+
+    Parameters
+    ----------
+    n_band_bins (int)
+        Number of STFT bins inside ``[min_freq, max_freq]``.
+    num_freq_bins (int)
+        Target number of frequency bins.
+
+    Returns
+    -------
+    interpolation_matrix (np.ndarray)
+        Linear-interpolation weights, at most two non-zero entries per row.
+    """
+
+    freq_interp = np.linspace(0, 1, num_freq_bins)
+    freq_orig = np.linspace(0, 1, n_band_bins)
+    return np.stack([np.interp(freq_interp, freq_orig, unit_vector) for unit_vector in np.eye(n_band_bins)], axis=1)
+
+
+def compute_usv_spectrogram_batch(
+    audio_segments: list[np.ndarray],
     sampling_rate: int,
     spec_params: dict,
     normalize: bool = True,
-) -> tuple[np.ndarray | None, int]:
+) -> tuple[np.ndarray, np.ndarray]:
     """
     Description
     -----------
-    Computes the variance-weighted, multi-channel average spectrogram of a
-    single (already-sliced) USV audio segment.
-
-    For every channel the power STFT is computed (``librosa.stft`` magnitude
-    squared), band-limited to ``[min_freq, max_freq]``, converted to dB
-    (``power_to_db`` with ``ref=max``), resampled along frequency to
-    ``num_freq_bins`` and fixed along time to ``num_time_bins``. The per-channel
-    spectrograms are then averaged with weights equal to each channel's audio
-    variance (louder/cleaner channels dominate); if every channel has zero
-    variance the weights fall back to uniform. The averaged spectrogram is
-    optionally min-max normalized to ``[0, 1]``.
+    Computes the variance-weighted, multi-channel average spectrogram of many
+    USV audio segments at once (see ``compute_usv_spectrogram`` for the
+    per-segment definition).
+
+    Valid segments are sorted by length and cut into batches whose complex
+    STFT stays under ``SPECTROGRAM_BATCH_STFT_BYTES``. Within a batch every
+    channel of every segment is mean-centered and zero-padded to the batch's
+    longest segment, and one ``librosa.stft`` call transforms them all; with
+    ``center=True`` the zero padding is exactly the padding the STFT would
+    add to the shorter segment anyway, so its native frames are unchanged and
+    the frames beyond them are masked out of the dB reference and of the
+    output. The dB conversion, frequency resampling (one precomputed
+    interpolation matrix), time fixing, channel averaging and normalization
+    are then applied to the whole batch.
 
     Parameters
     ----------
-    audio_segment_channels (np.ndarray)
-        The ``(n_samples, n_channels)`` slice of the audio memmap covering the
-        segment (already sliced by the caller for memory efficiency).
+    audio_segments (list of np.ndarray)
+        The ``(n_samples, n_channels)`` audio of every segment (e.g., memmap
+        slices, which are only read here).
     sampling_rate (int)
         Audio sampling rate in Hz.
     spec_params (dict)
@@ -76,16 +119,16 @@ def compute_usv_spectrogram(
         ``nperseg``, ``min_freq``, ``max_freq``, ``hop_length``,
         ``window``.
     normalize (bool)
-        Whether to min-max normalize the averaged spectrogram. Defaults to True.
+        Whether to min-max normalize each averaged spectrogram. Defaults to True.
 
     Returns
     -------
-    avg_spectrogram (np.ndarray | None)
-        A ``(num_freq_bins, num_time_bins)`` array, or None if no channel
-        produced a valid spectrogram.
-    original_time_bins (int)
-        The native (pre-``fix_length``) STFT time-bin count for the segment;
-        this is the USV's ``duration`` in spectrogram frames.
+    spectrograms (np.ndarray)
+        A ``(n_segments, num_freq_bins, num_time_bins)`` float64 array; rows
+        of segments that produce no spectrogram are all-zero.
+    original_time_bins (np.ndarray)
+        The native (pre-``fix_length``) STFT time-bin count of every segment,
+        0 for segments that produce no spectrogram.
     """
 
     num_freq_bins = spec_params['num_freq_bins']
@@ -97,10 +140,9 @@ def compute_usv_spectrogram(
     hop_length = spec_params['hop_length'] if spec_params['hop_length'] is not None else nperseg // 4
 
     # Validate the frequency band up front. If min_freq >= max_freq the band
-    # mask below is empty, `freq_orig` collapses to a zero-length grid, and the
-    # per-slice np.interp later fails with an opaque "array of sample points is
-    # empty" error deep in the channel loop. Raise a clear, actionable message
-    # here instead.
+    # mask below is empty and the frequency resampling has nothing to
+    # interpolate from, which would fail with an opaque error deep in the
+    # batch loop. Raise a clear, actionable message here instead.
     if min_freq >= max_freq:
         error_message = (
             f"generate_spectrograms requires min_freq < max_freq, got "
@@ -108,73 +150,154 @@ def compute_usv_spectrogram(
         )
         raise ValueError(error_message)
 
-    n_channels = audio_segment_channels.shape[1]
-    per_channel_specs: list[np.ndarray] = []
-    per_channel_vars: list[float] = []
-    original_time_bins = 0
-
-    # The FFT-frequency axis, the band mask and the frequency-resample
-    # interpolation grids depend only on call-invariant parameters
-    # (``sampling_rate``, ``nperseg``, ``min_freq``, ``max_freq`` and
-    # ``num_freq_bins``), so they are computed once here rather than
-    # rebuilt on every channel iteration. ``freq_orig`` is the
-    # interpolation grid over the band-masked bin count, which equals
-    # ``int(freq_mask.sum())`` for every channel that reaches the
-    # resample branch.
+    n_segments = len(audio_segments)
+    spectrograms = np.zeros((n_segments, num_freq_bins, num_time_bins), dtype=np.float64)
+    original_time_bins = np.zeros(n_segments, dtype=np.int64)
+
+    import librosa  # noqa: PLC0415 (lazy: keeps librosa off the CLI import path)
+
+    # The FFT-frequency axis, the band mask and the frequency-resample matrix
+    # depend only on call-invariant parameters, so they are computed once.
     freqs = librosa.fft_frequencies(sr=sampling_rate, n_fft=nperseg)
     freq_mask = (freqs >= min_freq) & (freqs <= max_freq)
-    freq_interp = np.linspace(0, 1, num_freq_bins)
-    freq_orig = np.linspace(0, 1, int(freq_mask.sum()))
-
-    for ch_idx in range(n_channels):
-        audio_segment = audio_segment_channels[:, ch_idx].astype(np.float64)
-        if audio_segment.shape[0] < nperseg:
-            continue
-        audio_segment = audio_segment - np.mean(audio_segment)
-
-        power_spec = (
-            np.abs(
-                librosa.stft(
-                    audio_segment,
-                    n_fft=nperseg,
-                    hop_length=hop_length,
-                    win_length=nperseg,
-                    window=window,
-                    center=True,
-                )
-            )
-            ** 2
-        )
+    n_band_bins = int(freq_mask.sum())
+    interpolation_matrix = None
+    if n_band_bins != num_freq_bins:
+        interpolation_matrix = _frequency_interpolation_matrix(n_band_bins=n_band_bins, num_freq_bins=num_freq_bins)
+
+    # Segments shorter than one window (on every channel, since channels share
+    # a length) produce no spectrogram; the rest are batched by length.
+    valid_order = sorted(
+        (seg_idx for seg_idx, segment in enumerate(audio_segments) if segment.shape[0] >= nperseg and segment.shape[1] > 0),
+        key=lambda seg_idx: (audio_segments[seg_idx].shape[1], audio_segments[seg_idx].shape[0]),
+    )
 
-        power_spec = power_spec[freq_mask]
-        spec_db = librosa.power_to_db(power_spec, ref=np.max)
+    batch_start = 0
+    while batch_start < len(valid_order):
+        # grow the batch while the padded complex STFT stays within budget
+        n_channels = audio_segments[valid_order[batch_start]].shape[1]
+        batch_stop = batch_start + 1
+        while batch_stop < len(valid_order):
+            next_segment = audio_segments[valid_order[batch_stop]]
+            stft_bytes = (batch_stop - batch_start + 1) * n_channels * freqs.size * (1 + next_segment.shape[0] // hop_length) * 16
+            if next_segment.shape[1] != n_channels or stft_bytes > SPECTROGRAM_BATCH_STFT_BYTES:
+                break
+            batch_stop += 1
+        batch_indices = valid_order[batch_start:batch_stop]
+        batch_start = batch_stop
+
+        segment_lengths = np.array([audio_segments[seg_idx].shape[0] for seg_idx in batch_indices])
+        padded_signals = np.zeros((len(batch_indices), n_channels, segment_lengths.max()), dtype=np.float64)
+        for row_idx, seg_idx in enumerate(batch_indices):
+            segment_channels = np.asarray(audio_segments[seg_idx]).T.astype(np.float64)
+            padded_signals[row_idx, :, :segment_lengths[row_idx]] = segment_channels - segment_channels.mean(axis=1, keepdims=True)
+        channel_vars = np.stack([padded_signals[row_idx, :, :segment_lengths[row_idx]].var(axis=1) for row_idx in range(len(batch_indices))])
+
+        # (batch, channel, band_bins, frames) power spectrogram
+        stft_matrix = librosa.stft(
+            padded_signals,
+            n_fft=nperseg,
+            hop_length=hop_length,
+            win_length=nperseg,
+            window=window,
+            center=True,
+        )[:, :, freq_mask, :]
+        del padded_signals
+        power_spec = stft_matrix.real ** 2 + stft_matrix.imag ** 2
+        del stft_matrix
+
+        # frames past a segment's own length only exist because of the padding;
+        # zeroed, they never win the per-channel maximum below
+        native_frames = 1 + segment_lengths // hop_length
+        frame_valid = np.arange(power_spec.shape[-1])[None, :] < native_frames[:, None]
+        power_spec *= frame_valid[:, None, None, :]
+
+        # power_to_db(ref=np.max) per channel. With the reference at the
+        # channel's own power maximum its dB peak is exactly 0, so the top_db
+        # clip is a fixed floor; the log itself is only needed for the frames
+        # that are kept (fix_length: at most num_time_bins, zero, i.e., 0 dB,
+        # past the native ones).
+        kept_frames = min(power_spec.shape[-1], num_time_bins)
+        log_ref = 10.0 * np.log10(np.maximum(_POWER_TO_DB_AMIN, power_spec.max(axis=(2, 3), keepdims=True)))
+        spec_db = 10.0 * np.log10(np.maximum(_POWER_TO_DB_AMIN, power_spec[..., :kept_frames])) - log_ref
+        del power_spec
+        spec_db = np.maximum(spec_db, -_POWER_TO_DB_TOP_DB)
+        spec_db *= frame_valid[:, None, None, :kept_frames]
 
         # Resample along the frequency axis to the target bin count.
-        if spec_db.shape[0] != num_freq_bins:
-            spec_db = np.stack(
-                [np.interp(freq_interp, freq_orig, spec_slice) for spec_slice in spec_db.T]
-            ).T
+        if interpolation_matrix is not None:
+            spec_db = np.matmul(interpolation_matrix, spec_db)
 
-        original_time_bins = spec_db.shape[1]
-        if spec_db.shape[1] != num_time_bins:
-            spec_db = librosa.util.fix_length(spec_db, size=num_time_bins, axis=1)
+        weights = np.where(channel_vars.sum(axis=1, keepdims=True) == 0, 1.0, channel_vars)
+        avg_spectrogram = np.zeros((len(batch_indices), num_freq_bins, num_time_bins), dtype=np.float64)
+        avg_spectrogram[..., :kept_frames] = np.einsum('bc,bcft->bft', weights, spec_db) / weights.sum(axis=1)[:, None, None]
 
-        per_channel_specs.append(spec_db)
-        per_channel_vars.append(float(np.var(audio_segment)))
+        if normalize:
+            avg_spectrogram = avg_spectrogram - avg_spectrogram.min(axis=(1, 2), keepdims=True)
+            avg_spectrogram = avg_spectrogram / (avg_spectrogram.max(axis=(1, 2), keepdims=True) + _NORMALIZE_EPS)
 
-    if not per_channel_specs:
-        return None, 0
+        spectrograms[batch_indices] = avg_spectrogram
+        original_time_bins[batch_indices] = native_frames
+
+    return spectrograms, original_time_bins
+
+
+def compute_usv_spectrogram(
+    audio_segment_channels: np.ndarray,
+    sampling_rate: int,
+    spec_params: dict,
+    normalize: bool = True,
+) -> tuple[np.ndarray | None, int]:
+    """
+    Description
+    -----------
+    Computes the variance-weighted, multi-channel average spectrogram of a
+    single (already-sliced) USV audio segment.
+
+    For every channel the power STFT is computed (``librosa.stft`` magnitude
+    squared), band-limited to ``[min_freq, max_freq]``, converted to dB
+    (``power_to_db`` with ``ref=max``), resampled along frequency to
+    ``num_freq_bins`` and fixed along time to ``num_time_bins``. The per-channel
+    spectrograms are then averaged with weights equal to each channel's audio
+    variance (louder/cleaner channels dominate); if every channel has zero
+    variance the weights fall back to uniform. The averaged spectrogram is
+    optionally min-max normalized to ``[0, 1]``. This is a one-segment call of
+    ``compute_usv_spectrogram_batch``.
+
+    Parameters
+    ----------
+    audio_segment_channels (np.ndarray)
+        The ``(n_samples, n_channels)`` slice of the audio memmap covering the
+        segment (already sliced by the caller for memory efficiency).
+    sampling_rate (int)
+        Audio sampling rate in Hz.
+    spec_params (dict)
+        Spectrogram parameters: ``num_freq_bins``, ``num_time_bins``,
+        ``nperseg``, ``min_freq``, ``max_freq``, ``hop_length``,
+        ``window``.
+    normalize (bool)
+        Whether to min-max normalize the averaged spectrogram. Defaults to True.
 
-    weights = np.asarray(per_channel_vars, dtype=np.float64)
-    if weights.sum() == 0:
-        weights = np.ones_like(weights)
-    avg_spectrogram = np.average(np.asarray(per_channel_specs), axis=0, weights=weights)
+    Returns
+    -------
+    avg_spectrogram (np.ndarray | None)
+        A ``(num_freq_bins, num_time_bins)`` array, or None if no channel
+        produced a valid spectrogram.
+    original_time_bins (int)
+        The native (pre-``fix_length``) STFT time-bin count for the segment;
+        this is the USV's ``duration`` in spectrogram frames.
+    """
 
-    if normalize:
-        avg_spectrogram = avg_spectrogram - avg_spectrogram.min()
-        avg_spectrogram = avg_spectrogram / (avg_spectrogram.max() + _NORMALIZE_EPS)
+    spectrograms, original_time_bins = compute_usv_spectrogram_batch(
+        audio_segments=[audio_segment_channels],
+        sampling_rate=sampling_rate,
+        spec_params=spec_params,
+        normalize=normalize,
+    )
+    if original_time_bins[0] == 0:
+        return None, 0
 
-    return avg_spectrogram, original_time_bins
+    return spectrograms[0], int(original_time_bins[0])
 
 
 class SpectrogramGenerator:
@@ -232,6 +355,11 @@ class SpectrogramGenerator:
         ``duration == 0``. File-level attrs: ``created``, ``total_spectrograms``,
         ``valid_spectrograms``.
 
+        USVs are computed with ``compute_usv_spectrogram_batch`` in consecutive
+        blocks of ``SPECTROGRAM_WRITE_CHUNK_USVS`` rows, each written into the
+        pre-sized ``spectrograms`` dataset before the next one is computed, and
+        the file is published atomically once complete.
+
         Parameters
         ----------
 
@@ -259,6 +387,8 @@ class SpectrogramGenerator:
             recursive=True,
             label="USV summary CSV",
         )
+        import polars as pls  # noqa: PLC0415 (lazy: keeps polars off the CLI import path)
+
         usv_summary_df = pls.read_csv(source=str(usv_summary_loc))
 
         audio_file_loc = first_match_or_raise(
@@ -290,58 +420,34 @@ class SpectrogramGenerator:
         # consumers skip ``duration == 0`` rows.
         n_freq = int(spec_params['num_freq_bins'])
         n_time = int(spec_params['num_time_bins'])
-        blank_spec = np.zeros((n_freq, n_time), dtype=np.float32)
-
-        all_specs: list[np.ndarray] = []
-        all_durations: list[int] = []
-
-        starts = usv_summary_df["start"].to_numpy()
-        stops = usv_summary_df["stop"].to_numpy()
-        for usv_idx in range(usv_summary_df.height):
-            t0 = float(starts[usv_idx]) - offset
-            t1 = float(stops[usv_idx]) + offset
-            # Match the DAS segment-bound convention (das_inference: floor the
-            # onset, ceil the offset) so a USV's spectrogram spans exactly the
-            # same samples DAS attributed to it. round() on both ends could drop
-            # the boundary frame on either side and desync the two pipelines.
-            s0 = max(0, int(np.floor(t0 * audio_sampling_rate)))
-            s1 = min(sample_num, int(np.ceil(t1 * audio_sampling_rate)))
-            spectrogram = None
-            original_time_bins = 0
-            if s1 > s0:
-                segment = np.asarray(audio_file_data[s0:s1, :])
-                spectrogram, original_time_bins = compute_usv_spectrogram(
-                    audio_segment_channels=segment,
-                    sampling_rate=audio_sampling_rate,
-                    spec_params=spec_params,
-                    normalize=normalize,
-                )
-            if spectrogram is None:
-                all_specs.append(blank_spec)
-                all_durations.append(0)
-            else:
-                all_specs.append(spectrogram.astype(np.float32))
-                all_durations.append(int(original_time_bins))
-
-        if not all_specs:
+        n_usvs = usv_summary_df.height
+
+        if n_usvs == 0:
             self.message_output(
                 f"No USVs in summary for '{self.root_directory}'; no spectrograms written."
             )
             return
 
+        # Match the DAS segment-bound convention (das_inference: floor the
+        # onset, ceil the offset) so a USV's spectrogram spans exactly the
+        # same samples DAS attributed to it. round() on both ends could drop
+        # the boundary frame on either side and desync the two pipelines.
+        sample_starts = np.maximum(0, np.floor((usv_summary_df["start"].to_numpy().astype(np.float64) - offset) * audio_sampling_rate).astype(np.int64))
+        sample_stops = np.minimum(sample_num, np.ceil((usv_summary_df["stop"].to_numpy().astype(np.float64) + offset) * audio_sampling_rate).astype(np.int64))
+
         # Clean linspace axis (30000..120000); the ~0.1% offset from the true
         # band-limited STFT bin frequencies is sub-bin (rows span ~703 Hz) and
         # matches the feature-extraction axis, so round numbers are kept.
         freq_bins = np.linspace(spec_params['min_freq'], spec_params['max_freq'], spec_params['num_freq_bins'])
 
-        durations_arr = np.asarray(all_durations, dtype=np.int64)
+        durations_arr = np.zeros(n_usvs, dtype=np.int64)
         spectrograms_dir = root / "audio" / "spectrograms"
         spectrograms_dir.mkdir(parents=True, exist_ok=True)
         h5_file_path = spectrograms_dir / f"{session_id}_spectrograms.h5"
-        with h5py.File(h5_file_path, "w") as h5_file:
+        compute_start = time.perf_counter()
+        with atomic_output_path(h5_file_path) as tmp_h5_file_path, h5py.File(tmp_h5_file_path, "w") as h5_file:
             h5_file.attrs["created"] = "generate_spectrograms"
-            h5_file.attrs["total_spectrograms"] = len(all_specs)
-            h5_file.attrs["valid_spectrograms"] = int(np.count_nonzero(durations_arr > 0))
+            h5_file.attrs["total_spectrograms"] = n_usvs
             # Consolidated-store layout (one session per file here, mergeable into
             # a multi-session store): a SHARED top-level ``frequency_bins`` axis and
             # a per-session ``spectrogram/<session>`` group whose ``spectrograms``
@@ -349,11 +455,40 @@ class SpectrogramGenerator:
             # make_usv_spectrograms / usv_embedding_explorer read.
             h5_file.create_dataset("frequency_bins", data=freq_bins, compression="gzip", compression_opts=6)
             session_group = h5_file.create_group(f"spectrogram/{session_id}")
-            session_group.create_dataset("spectrograms", data=np.asarray(all_specs), compression="gzip", compression_opts=6)
+            spectrograms_ds = session_group.create_dataset(
+                "spectrograms", shape=(n_usvs, n_freq, n_time), dtype=np.float32, chunks=True, compression="gzip", compression_opts=6
+            )
+
+            # The spectrogram array is 1:1 with usv_summary.csv rows: row ``i`` is the
+            # spectrogram of USV ``i``, in original on-disk order with NO skipping.
+            # This is the index convention the consolidated-store readers rely on
+            # (``/spectrogram/<session>/spectrograms[row_index]`` in
+            # make_usv_spectrograms / usv_embedding_explorer, where ``row_index`` is
+            # the usv_summary row). Invalid / too-short USVs get an all-zero
+            # placeholder + duration 0 so alignment is never broken; downstream
+            # consumers skip ``duration == 0`` rows. Rows are computed and written
+            # SPECTROGRAM_WRITE_CHUNK_USVS at a time, in that order.
+            for chunk_start in range(0, n_usvs, SPECTROGRAM_WRITE_CHUNK_USVS):
+                chunk_stop = min(chunk_start + SPECTROGRAM_WRITE_CHUNK_USVS, n_usvs)
+                chunk_specs, chunk_durations = compute_usv_spectrogram_batch(
+                    audio_segments=[
+                        audio_file_data[s0:max(s0, s1), :]
+                        for s0, s1 in zip(sample_starts[chunk_start:chunk_stop], sample_stops[chunk_start:chunk_stop])
+                    ],
+                    sampling_rate=audio_sampling_rate,
+                    spec_params=spec_params,
+                    normalize=normalize,
+                )
+                spectrograms_ds[chunk_start:chunk_stop] = chunk_specs.astype(np.float32)
+                durations_arr[chunk_start:chunk_stop] = chunk_durations
+
+            h5_file.attrs["valid_spectrograms"] = int(np.count_nonzero(durations_arr > 0))
             session_group.create_dataset("durations", data=durations_arr, compression="gzip", compression_opts=6)
+        compute_seconds = time.perf_counter() - compute_start
 
         self.message_output(
-            f"Generated {len(all_specs)} spectrograms for session {session_id} -> {h5_file_path}."
+            f"Generated {n_usvs} spectrograms for session {session_id} -> {h5_file_path} "
+            f"({n_usvs / max(compute_seconds, 1e-9):.1f} USVs/s)."
         )
         self.message_output(
             f"Spectrogram generation ended at: {datetime.now().hour:02d}:{datetime.now().minute:02d}:{datetime.now().second:02d}."
@@ -0,0 +1,317 @@
+"""
+@author: bartulem
+Block-streaming harmonic-percussive source separation (HPSS) of single
+channel WAV files.
+
+The whole-recording HPSS (``librosa.stft`` -> ``librosa.decompose.hpss``
+-> ``librosa.istft``) holds the float32 signal, its complex STFT, two
+median-filtered magnitude copies and the harmonic STFT in memory at once,
+which is several times the WAV size and does not fit for hour-long
+250 kHz channels on smaller nodes. Every step has a finite reach in time,
+though:
+
+* a centered STFT frame sees ``n_fft // 2`` samples either side of it,
+* the harmonic median filter runs along time over ``kernel_size[0]``
+  frames (the percussive one runs along frequency, within a frame), and
+  the soft masks are elementwise,
+* an ISTFT sample is the overlap-add of the frames whose windows cover it.
+
+An output sample therefore only depends on input samples within
+``n_fft + (kernel_size[0] // 2) * hop`` of it. The streaming path walks the
+recording in hop-aligned blocks, runs the unchanged librosa pipeline on
+each block padded with that much context on both sides (clipped at the
+recording ends, where the padding is the same as in the whole-file run),
+and keeps only the block's own samples. Frame grids line up with the
+whole-file STFT, so the stitched output matches it to float32 round-off;
+the input is read from a memory map of the WAV and the output written
+straight into a memory-mapped WAV, so peak memory scales with the block,
+not the recording.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import struct
+
+import librosa
+import numpy as np
+from joblib import Parallel, delayed
+from scipy.io import wavfile
+
+from ..os_utils import atomic_output_path
+
+WAV_PCM16_HEADER_BYTES = 44
+
+
+def hpss_harmonic(audio_data: np.ndarray,
+                  n_fft: int,
+                  hop_length: int,
+                  kernel_size: list | tuple,
+                  power: float,
+                  margin: list | tuple) -> np.ndarray:
+    """
+    Description
+    -----------
+    Runs HPSS on one in-memory signal and returns the harmonic component
+    back in the time domain (the original whole-recording computation).
+
+    Parameters
+    ----------
+    audio_data (np.ndarray)
+        1-D audio signal.
+    n_fft (int)
+        STFT window length.
+    hop_length (int)
+        STFT hop size.
+    kernel_size (list / tuple)
+        Median filter kernel size (harmonic, percussive).
+    power (float)
+        Soft mask exponent.
+    margin (list / tuple)
+        Mask margin (harmonic, percussive).
+
+    Returns
+    -------
+    harmonic_data (np.ndarray)
+        Float32 harmonic signal with the same length as the input.
+    """
+
+    # convert to float32 because librosa.stft() requires float32
+    audio_data = np.asarray(audio_data, dtype='float32')
+
+    # perform Short-Time Fourier Transform (STFT) on the audio data
+    spectrogram_data = librosa.stft(y=audio_data,
+                                    n_fft=n_fft,
+                                    hop_length=hop_length)
+
+    # perform HPSS on the spectrogram data
+    D_harmonic, _ = librosa.decompose.hpss(S=spectrogram_data,
+                                           kernel_size=kernel_size,
+                                           power=power,
+                                           mask=False,
+                                           margin=margin)
+
+    # convert the harmonic component back to the time domain
+    return librosa.istft(stft_matrix=D_harmonic,
+                         length=audio_data.shape[0],
+                         win_length=n_fft,
+                         hop_length=hop_length)
+
+
+def hpss_context_samples(n_fft: int,
+                         hop_length: int,
+                         kernel_size: list | tuple) -> int:
+    """
+    Description
+    -----------
+    Number of samples of context a streaming block needs on each side for
+    its own samples to come out as in the whole-recording HPSS: half a
+    window for the STFT, half the harmonic (time-axis) median kernel in
+    frames, and half a window for the ISTFT overlap-add, rounded up to a
+    whole number of hops so block frames stay on the global frame grid.
+
+    Parameters
+    ----------
+    n_fft (int)
+        STFT window length.
+    hop_length (int)
+        STFT hop size.
+    kernel_size (list / tuple)
+        Median filter kernel size (harmonic, percussive).
+
+    Returns
+    -------
+    context_samples (int)
+        Context on each side of a block, in samples.
+    """
+
+    harmonic_kernel = kernel_size[0] if isinstance(kernel_size, (list, tuple)) else kernel_size
+    reach = n_fft + (int(harmonic_kernel) // 2) * hop_length
+    return int(-(-reach // hop_length) * hop_length)
+
+
+def _open_pcm16_wav_memmap(wav_path: pathlib.Path,
+                           sampling_rate: int,
+                           n_samples: int) -> np.memmap:
+    """
+    Description
+    -----------
+    Creates a mono 16-bit PCM WAV of the given length (canonical 44-byte
+    header, sparse zeroed data) and returns a writable memory map of its
+    samples.
+
+    Parameters
+    ----------
+    wav_path (pathlib.Path)
+        WAV file to create.
+    sampling_rate (int)
+        Sampling rate written to the header.
+    n_samples (int)
+        Number of samples.
+
+    Returns
+    -------
+    data_memmap (np.memmap)
+        Writable little-endian int16 view of the sample data.
+    """
+
+    data_bytes = 2 * n_samples
+    with open(wav_path, 'wb') as wav_handle:
+        wav_handle.write(b'RIFF')
+        wav_handle.write(struct.pack('<I', WAV_PCM16_HEADER_BYTES - 8 + data_bytes))
+        wav_handle.write(b'WAVE')
+        wav_handle.write(b'fmt ')
+        wav_handle.write(struct.pack('<IHHIIHH', 16, 1, 1, sampling_rate, 2 * sampling_rate, 2, 16))
+        wav_handle.write(b'data')
+        wav_handle.write(struct.pack('<I', data_bytes))
+        wav_handle.truncate(WAV_PCM16_HEADER_BYTES + data_bytes)
+
+    return np.memmap(filename=wav_path,
+                     dtype='<i2',
+                     mode='r+',
+                     offset=WAV_PCM16_HEADER_BYTES,
+                     shape=(n_samples,))
+
+
+def hpss_wav_file(wav_file: str | pathlib.Path,
+                  output_file: str | pathlib.Path,
+                  stft_window_length_hop_size: list | tuple,
+                  kernel_size: list | tuple,
+                  hpss_power: float,
+                  margin: list | tuple,
+                  block_seconds: float = 0.0) -> pathlib.Path:
+    """
+    Description
+    -----------
+    Runs HPSS on one single channel WAV file and saves the harmonic
+    component, clipped to int16, as a new WAV file.
+
+    With ``block_seconds`` <= 0 the whole recording is separated in memory.
+    Otherwise the input is memory-mapped and separated in blocks of about
+    ``block_seconds`` (each padded with ``hpss_context_samples`` of context
+    on both sides) whose centers are written straight into a memory-mapped
+    output WAV.
+
+    Parameters
+    ----------
+    wav_file (str / pathlib.Path)
+        Input mono WAV file.
+    output_file (str / pathlib.Path)
+        Output WAV file; written atomically.
+    stft_window_length_hop_size (list / tuple)
+        STFT window length and hop size.
+    kernel_size (list / tuple)
+        Median filter kernel size (harmonic, percussive).
+    hpss_power (float)
+        Soft mask exponent.
+    margin (list / tuple)
+        Mask margin (harmonic, percussive).
+    block_seconds (float)
+        Length of one streaming block in seconds; defaults to 0 (no blocks).
+
+    Returns
+    -------
+    output_file (pathlib.Path)
+        Path of the written harmonic WAV file.
+    """
+
+    n_fft, hop_length = (int(value) for value in stft_window_length_hop_size)
+    output_file = pathlib.Path(output_file)
+
+    # read the audio file (use Scipy, not Librosa because Librosa performs scaling)
+    sampling_rate_audio, audio_data = wavfile.read(wav_file, mmap=block_seconds > 0)
+    n_samples = audio_data.shape[0]
+    block_samples = max(int(round(block_seconds * sampling_rate_audio / hop_length)), 1) * hop_length
+
+    if block_seconds <= 0 or n_samples <= block_samples:
+        harmonic_data = hpss_harmonic(audio_data=audio_data,
+                                      n_fft=n_fft,
+                                      hop_length=hop_length,
+                                      kernel_size=kernel_size,
+                                      power=hpss_power,
+                                      margin=margin)
+
+        # ensure the float values are within the range of 16-bit integers
+        # clip values outside the range to the minimum and maximum representable values
+        harmonic_data_clipped = np.clip(a=harmonic_data,
+                                        a_min=-32768,
+                                        a_max=32767).astype('int16')
+
+        with atomic_output_path(output_file) as tmp_output_file:
+            wavfile.write(filename=tmp_output_file,
+                          rate=sampling_rate_audio,
+                          data=harmonic_data_clipped)
+        return output_file
+
+    context_samples = hpss_context_samples(n_fft=n_fft, hop_length=hop_length, kernel_size=kernel_size)
+
+    with atomic_output_path(output_file) as tmp_output_file:
+        harmonic_memmap = _open_pcm16_wav_memmap(wav_path=tmp_output_file,
+                                                 sampling_rate=sampling_rate_audio,
+                                                 n_samples=n_samples)
+        try:
+            for block_start in range(0, n_samples, block_samples):
+                block_stop = min(block_start + block_samples, n_samples)
+                padded_start = max(block_start - context_samples, 0)
+                padded_stop = min(block_stop + context_samples, n_samples)
+
+                harmonic_block = hpss_harmonic(audio_data=audio_data[padded_start:padded_stop],
+                                               n_fft=n_fft,
+                                               hop_length=hop_length,
+                                               kernel_size=kernel_size,
+                                               power=hpss_power,
+                                               margin=margin)
+
+                harmonic_memmap[block_start:block_stop] = np.clip(
+                    a=harmonic_block[block_start - padded_start:block_stop - padded_start],
+                    a_min=-32768,
+                    a_max=32767).astype('int16')
+            harmonic_memmap.flush()
+        finally:
+            del harmonic_memmap
+
+    return output_file
+
+
+def hpss_wav_files(wav_files: list[pathlib.Path],
+                   output_files: list[pathlib.Path],
+                   n_jobs: int = 1,
+                   parallel_backend: str = 'loky',
+                   **hpss_kwargs) -> list[pathlib.Path]:
+    """
+    Description
+    -----------
+    Runs ``hpss_wav_file`` over several WAV files (e.g., the 24 audio
+    channels of a session), one after another or spread over a joblib
+    pool of threads or processes.
+
+    Parameters
+    ----------
+    wav_files (list of pathlib.Path)
+        Input mono WAV files.
+    output_files (list of pathlib.Path)
+        Output WAV file per input file.
+    n_jobs (int)
+        Number of channels separated concurrently (1 = serial, -1 = all cores).
+    parallel_backend (str)
+        'loky' (processes) or 'threading' (threads).
+    **hpss_kwargs
+        Forwarded to ``hpss_wav_file``.
+
+    Returns
+    -------
+    output_files (list of pathlib.Path)
+        Paths of the written harmonic WAV files, in input order.
+    """
+
+    if parallel_backend not in ('loky', 'threading'):
+        raise ValueError(f"parallel_backend must be 'loky' or 'threading', got '{parallel_backend}'.")
+
+    if n_jobs == 1 or len(wav_files) < 2:
+        return [hpss_wav_file(wav_file=wav_file, output_file=output_file, **hpss_kwargs)
+                for wav_file, output_file in zip(wav_files, output_files)]
+
+    return Parallel(n_jobs=n_jobs, backend=parallel_backend)(
+        delayed(hpss_wav_file)(wav_file=wav_file, output_file=output_file, **hpss_kwargs)
+        for wav_file, output_file in zip(wav_files, output_files)
+    )
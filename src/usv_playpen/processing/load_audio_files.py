@@ -12,8 +12,126 @@ import subprocess
 import warnings
 
 import librosa
+import numpy as np
 from scipy.io import wavfile
 
+# WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT and WAVE_FORMAT_EXTENSIBLE; for the
+# latter the actual format tag is the first two bytes of the sub-format GUID
+WAV_FORMAT_PCM = 0x0001
+WAV_FORMAT_IEEE_FLOAT = 0x0003
+WAV_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def read_wav_header(wav_file: str | pathlib.Path) -> dict:
+    """
+    Description
+    -----------
+    Parses the RIFF chunks of a WAV file without touching its samples and
+    returns where the data chunk sits and how to interpret it.
+
+    Chunks other than 'fmt ' and 'data' (e.g., Avisoft's metadata) are
+    skipped. A data chunk whose declared size runs past the end of the file
+    (as left behind by an interrupted recorder) is clipped to the whole
+    frames actually on disk.
+
+    Parameters
+    ----------
+    wav_file (str / pathlib.Path)
+        WAV file to inspect.
+
+    Returns
+    -------
+    wav_header (dict)
+        "sampling_rate", "n_channels", "n_samples", "dtype" (numpy dtype of
+        one sample) and "data_offset" (byte offset of the first sample).
+    """
+
+    file_size = pathlib.Path(wav_file).stat().st_size
+    with open(wav_file, 'rb') as wav_handle:
+        riff_id, _, wave_id = struct.unpack('<4sI4s', wav_handle.read(12))
+        if riff_id not in (b'RIFF', b'RIFX') or wave_id != b'WAVE':
+            raise struct.error(f"'{wav_file}' is not a RIFF/WAVE file.")
+        byte_order = '<' if riff_id == b'RIFF' else '>'
+
+        fmt_chunk = None
+        while True:
+            chunk_header = wav_handle.read(8)
+            if len(chunk_header) < 8:
+                raise struct.error(f"'{wav_file}' has no data chunk.")
+            chunk_id, chunk_size = struct.unpack(f'{byte_order}4sI', chunk_header)
+            if chunk_id == b'fmt ':
+                fmt_chunk = wav_handle.read(chunk_size)
+            elif chunk_id == b'data':
+                data_offset = wav_handle.tell()
+                break
+            else:
+                wav_handle.seek(chunk_size, 1)
+            # chunks are word-aligned
+            if chunk_size % 2:
+                wav_handle.seek(1, 1)
+
+    if fmt_chunk is None or len(fmt_chunk) < 16:
+        raise struct.error(f"'{wav_file}' has no valid fmt chunk before its data chunk.")
+
+    format_tag, n_channels, sampling_rate, _, block_align, bits_per_sample = struct.unpack(f'{byte_order}HHIIHH', fmt_chunk[:16])
+    if format_tag == WAV_FORMAT_EXTENSIBLE and len(fmt_chunk) >= 26:
+        format_tag = struct.unpack(f'{byte_order}H', fmt_chunk[24:26])[0]
+
+    bytes_per_sample = bits_per_sample // 8
+    if format_tag == WAV_FORMAT_PCM and bytes_per_sample in (2, 4, 8):
+        sample_dtype = np.dtype(f'{byte_order}i{bytes_per_sample}')
+    elif format_tag == WAV_FORMAT_PCM and bytes_per_sample == 1:
+        sample_dtype = np.dtype('u1')
+    elif format_tag == WAV_FORMAT_IEEE_FLOAT and bytes_per_sample in (4, 8):
+        sample_dtype = np.dtype(f'{byte_order}f{bytes_per_sample}')
+    else:
+        raise ValueError(f"'{wav_file}' holds {bits_per_sample}-bit samples of WAV format {format_tag:#06x}, which cannot be memory-mapped.")
+
+    if block_align != bytes_per_sample * n_channels:
+        raise ValueError(f"'{wav_file}' has an unexpected block alignment of {block_align} bytes.")
+
+    data_size = min(chunk_size, file_size - data_offset)
+
+    return {
+        "sampling_rate": int(sampling_rate),
+        "n_channels": int(n_channels),
+        "n_samples": int(data_size // block_align),
+        "dtype": sample_dtype,
+        "data_offset": int(data_offset),
+    }
+
+
+def memmap_wav_data(wav_file: str | pathlib.Path) -> tuple[int, np.memmap]:
+    """
+    Description
+    -----------
+    Memory-maps the samples of a WAV file read-only, so that they are paged
+    in from disk only as they are accessed.
+
+    Parameters
+    ----------
+    wav_file (str / pathlib.Path)
+        WAV file to map.
+
+    Returns
+    -------
+    sampling_rate (int)
+        Sampling rate of the recording.
+    wav_data (np.memmap)
+        Samples, shaped (n_samples,) for mono and (n_samples, n_channels)
+        otherwise, as scipy.io.wavfile.read would return them.
+    """
+
+    wav_header = read_wav_header(wav_file)
+    shape = (wav_header["n_samples"],) if wav_header["n_channels"] == 1 else (wav_header["n_samples"], wav_header["n_channels"])
+    wav_data = np.memmap(filename=wav_file,
+                         dtype=wav_header["dtype"],
+                         mode='r',
+                         offset=wav_header["data_offset"],
+                         shape=shape)
+
+    return wav_header["sampling_rate"], wav_data
+
 
 class DataLoader:
     def __init__(self, input_parameter_dict: dict | None = None) -> None:
@@ -75,6 +193,8 @@ class DataLoader:
             A dictionary with all desired sound outputs;
             the top-level key is the WAV file's name (one_file.name),
             with "sampling_rate", "wav_data" and "dtype" as sub-keys.
+            With the "memmap" library only the headers are parsed and
+            "wav_data" is a read-only memory map of each file's data chunk.
         """
 
         wave_data_dict = {}
@@ -109,10 +229,7 @@ class DataLoader:
                         "wav_data": 0,
                         "dtype": 0,
                     }
-                    if (
-                        library
-                        == "scipy"
-                    ):
+                    if library in ("scipy", "memmap"):
                         try:
                             with warnings.catch_warnings():
                                 # scipy.io.wavfile.read emits a WavFileWarning on
@@ -123,7 +240,7 @@ class DataLoader:
                                 (
                                     wave_data_dict[one_file.name]["sampling_rate"],
                                     wave_data_dict[one_file.name]["wav_data"],
-                                ) = wavfile.read(one_file)
+                                ) = memmap_wav_data(one_file) if library == "memmap" else wavfile.read(one_file)
                         except struct.error:
                             # The .wav header is malformed; try to rewrite it with sox.
                             # We do NOT delete the original until sox has successfully
@@ -158,7 +275,7 @@ class DataLoader:
                                 (
                                     wave_data_dict[one_file.name]["sampling_rate"],
                                     wave_data_dict[one_file.name]["wav_data"],
-                                ) = wavfile.read(one_file)
+                                ) = memmap_wav_data(one_file) if library == "memmap" else wavfile.read(one_file)
                     else:
                         with warnings.catch_warnings():
                             # librosa imports the stdlib `aifc` module, which is
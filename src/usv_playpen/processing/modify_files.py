@@ -23,15 +23,15 @@ import subprocess
 from collections.abc import Callable
 from datetime import datetime
 
-import librosa
 import numpy as np
 import polars as pls
 from imgstore import new_for_filename
-from scipy.io import wavfile
 from spikeinterface.curation.curation_tools import find_duplicated_spikes
 from tqdm import tqdm
 
+from ..neuropixels.spike_store import SpikeStore, spike_store_path, write_spike_store
 from ..os_utils import (
+    atomic_output_path,
     configure_path,
     ephys_base_for_data_root,
     first_match_or_raise,
@@ -39,8 +39,12 @@ from ..os_utils import (
 )
 from ..time_utils import is_gui_context, smart_wait
 from ..yaml_utils import load_session_metadata, save_session_metadata
+from .hpss_streaming import hpss_wav_file, hpss_wav_files
 from .load_audio_files import DataLoader
 
+# number of samples (rows) per block when copying channel WAVs into the audio memmap
+AUDIO_CONCAT_BLOCK_SAMPLES = 2**20
+
 
 class Operator:
 
@@ -101,9 +105,11 @@ class Operator:
 
         Returns
         -------
-         spike times (np.ndarray)
-            Arrays that contain spike times: seconds (row 0) and frames (row 1);
-            saved as .npy files in a separate directory.
+         spike times (.h5 file)
+            One spike store per probe per session, `ephys/<probe_id>/<probe_id>_spike_store.h5`,
+            holding spike times in seconds and frames for every unit (see
+            `neuropixels.spike_store`); optionally also exported as legacy
+            `cluster_data/<cluster>.npy` arrays, seconds (row 0) and frames (row 1).
         """
 
         self.message_output(f"Splitting clusters to sessions started at: {datetime.now().hour:02d}:{datetime.now().minute:02d}:{datetime.now().second:02d}")
@@ -119,6 +125,10 @@ class Operator:
         remove_duplicate_spikes = bool(self.input_parameter_dict['get_spike_times']['remove_duplicate_spikes'])
         duplicate_censored_period_ms = float(self.input_parameter_dict['get_spike_times']['duplicate_censored_period_ms'])
 
+        # the per-probe spike store is always written; the legacy one-.npy-per-cluster
+        # layout is an optional export for tools that still read cluster_data/
+        export_legacy_cluster_npy = bool(self.input_parameter_dict['get_spike_times']['export_legacy_cluster_npy'])
+
         for one_root_dir in self.root_directory:
             _ephys_base = ephys_base_for_data_root(one_root_dir) / pathlib.Path(one_root_dir).name.split('_')[0]
             for ephys_dir in sorted(_ephys_base.parent.glob(f"{_ephys_base.name}_imec*")):
@@ -147,9 +157,11 @@ class Operator:
                 frame_least_dict = {}
                 root_dict = {}
                 unit_count_dict = {'noise': 0, 'unsorted': 0}
+                session_units_dict = {}
                 for session_key in binary_files_info.keys():
 
                     unit_count_dict[session_key] = {'good': 0, 'mua': 0}
+                    session_units_dict[session_key] = {'unit_names': [], 'spike_seconds': [], 'spike_frames': []}
 
                     # load info from camera_frame_count_dict
                     with open(
@@ -170,7 +182,7 @@ class Operator:
                     else:
                         se_dict[session_key] = binary_files_info[session_key]['tracking_start_end']
 
-                    (pathlib.Path(root_dict[session_key]) / 'ephys' / probe_id / 'cluster_data').mkdir(parents=True, exist_ok=True)
+                    (pathlib.Path(root_dict[session_key]) / 'ephys' / probe_id).mkdir(parents=True, exist_ok=True)
 
                 # duplicate-removal censored period in samples, at this probe's
                 # calibrated headstage rate (shared across the probe's sessions)
@@ -240,12 +252,12 @@ class Operator:
                             # so row 1 of session_spikes never indexes out of bounds into an array of length frame_least
                             session_spikes_fps[session_spikes_fps >= frame_least_dict[session_key]] = frame_least_dict[session_key]-1
 
-                            session_spikes = np.vstack((session_spikes_sec, session_spikes_fps))
-
-                            # save spiking data
+                            # collect spiking data for the session's spike store
                             if session_spikes_sec.shape[0] > self.input_parameter_dict['get_spike_times']['min_spike_num']:
                                 cluster_id = f"{probe_id}_cl{cluster_info[idx, 'cluster_id']:04d}_ch{cluster_info[idx, 'ch']:03d}_{cluster_info[idx, 'group']}"
-                                np.save(file=pathlib.Path(root_dict[session_key]) / 'ephys' / probe_id / 'cluster_data' / cluster_id, arr=session_spikes)
+                                session_units_dict[session_key]['unit_names'].append(cluster_id)
+                                session_units_dict[session_key]['spike_seconds'].append(session_spikes_sec)
+                                session_units_dict[session_key]['spike_frames'].append(session_spikes_fps)
 
                                 unit_count_dict[session_key][cluster_info[idx, 'group']] += 1
 
@@ -255,6 +267,18 @@ class Operator:
                     else:
                         unit_count_dict['unsorted'] += 1
 
+                # one spike store per probe per session (plus the legacy per-cluster .npy files, if requested)
+                for session_key in binary_files_info.keys():
+                    session_store_path = write_spike_store(store_path=spike_store_path(root_directory=root_dict[session_key], probe_id=probe_id),
+                                                           unit_names=session_units_dict[session_key]['unit_names'],
+                                                           spike_seconds=session_units_dict[session_key]['spike_seconds'],
+                                                           spike_frames=session_units_dict[session_key]['spike_frames'],
+                                                           attrs={'probe_id': probe_id,
+                                                                  'session_id': pathlib.Path(root_dict[session_key]).name})
+                    if export_legacy_cluster_npy:
+                        with SpikeStore(store_path=session_store_path) as session_store:
+                            session_store.export_legacy_npy(cluster_data_dir=pathlib.Path(root_dict[session_key]) / 'ephys' / probe_id / 'cluster_data')
+
                 self.message_output(f"For {ephys_dir}, there were {unit_count_dict['noise']} noise clusters and {unit_count_dict['unsorted']} unsorted clusters.")
                 for session_key in binary_files_info.keys():
                     self.message_output(f"For {root_dict[session_key]} probe {probe_id}, there were {unit_count_dict[session_key]['good']} good and {unit_count_dict[session_key]['mua']} MUA clusters.")
@@ -586,6 +610,12 @@ class Operator:
         on the provided audio (WAV) files. The harmonic component is then converted
         back to the time domain and saved as a new WAV file.
 
+        With a positive 'block_seconds' setting each channel is memory-mapped and
+        separated block by block (see hpss_streaming), which keeps peak memory
+        independent of the recording length; with 'n_jobs' != 1 the channels are
+        separated concurrently on a joblib pool of processes ('loky') or threads
+        ('threading').
+
         Parameters
         ----------
 
@@ -598,49 +628,38 @@ class Operator:
         self.message_output(f"Harmonic-percussive source separation started at: {datetime.now().hour:02d}:{datetime.now().minute:02d}:{datetime.now().second:02d}")
         smart_wait(app_context_bool=self.app_context_bool, seconds=1)
 
-        wav_file_lst = sorted((pathlib.Path(self.root_directory) / 'audio' / 'cropped_to_video').glob('*.wav'))
-
-        for one_wav_file in wav_file_lst:
-            self.message_output(f"Working on file: {one_wav_file}")
-            smart_wait(app_context_bool=self.app_context_bool, seconds=1)
-
-            # read the audio file (use Scipy, not Librosa because Librosa performs scaling)
-            sampling_rate_audio, audio_data = wavfile.read(one_wav_file)
+        hpss_params = self.input_parameter_dict['hpss_audio']
 
-            # convert to float32 because librosa.stft() requires float32
-            audio_data = np.array(audio_data, dtype='float32')
-
-            # perform Short-Time Fourier Transform (STFT) on the audio data
-            spectrogram_data = librosa.stft(y=audio_data,
-                                            n_fft=self.input_parameter_dict['hpss_audio']['stft_window_length_hop_size'][0],
-                                            hop_length=self.input_parameter_dict['hpss_audio']['stft_window_length_hop_size'][1])
-
-            # perform HPSS on the spectrogram data
-            D_harmonic, _ = librosa.decompose.hpss(S=spectrogram_data,
-                                                              kernel_size=self.input_parameter_dict['hpss_audio']['kernel_size'],
-                                                              power=self.input_parameter_dict['hpss_audio']['hpss_power'],
-                                                              mask=False,
-                                                              margin=self.input_parameter_dict['hpss_audio']['margin'])
+        wav_file_lst = sorted((pathlib.Path(self.root_directory) / 'audio' / 'cropped_to_video').glob('*.wav'))
 
-            # convert the harmonic component back to the time domain
-            harmonic_data = librosa.istft(stft_matrix=D_harmonic,
-                                          length=audio_data.shape[0],
-                                          win_length=self.input_parameter_dict['hpss_audio']['stft_window_length_hop_size'][0],
-                                          hop_length=self.input_parameter_dict['hpss_audio']['stft_window_length_hop_size'][1])
+        hpss_dir = pathlib.Path(self.root_directory) / 'audio' / 'hpss'
+        hpss_dir.mkdir(parents=True, exist_ok=True)
 
-            # ensure the float values are within the range of 16-bit integers
-            # clip values outside the range to the minimum and maximum representable values
-            harmonic_data_clipped = np.clip(a=harmonic_data,
-                                            a_min=-32768,
-                                            a_max=32767).astype('int16')
+        if hpss_params['n_jobs'] == 1:
+            for one_wav_file in wav_file_lst:
+                self.message_output(f"Working on file: {one_wav_file}")
+                smart_wait(app_context_bool=self.app_context_bool, seconds=1)
 
-            # save the harmonic component as a new WAV file
-            hpss_dir = pathlib.Path(self.root_directory) / 'audio' / 'hpss'
-            hpss_dir.mkdir(parents=True, exist_ok=True)
+                hpss_wav_file(wav_file=one_wav_file,
+                              output_file=hpss_dir / f'{one_wav_file.stem}_hpss.wav',
+                              stft_window_length_hop_size=hpss_params['stft_window_length_hop_size'],
+                              kernel_size=hpss_params['kernel_size'],
+                              hpss_power=hpss_params['hpss_power'],
+                              margin=hpss_params['margin'],
+                              block_seconds=hpss_params['block_seconds'])
+        else:
+            self.message_output(f"Working on {len(wav_file_lst)} files with n_jobs={hpss_params['n_jobs']} ({hpss_params['parallel_backend']} backend).")
+            smart_wait(app_context_bool=self.app_context_bool, seconds=1)
 
-            wavfile.write(filename=hpss_dir / f'{one_wav_file.stem}_hpss.wav',
-                          rate=sampling_rate_audio,
-                          data=harmonic_data_clipped)
+            hpss_wav_files(wav_files=wav_file_lst,
+                           output_files=[hpss_dir / f'{one_wav_file.stem}_hpss.wav' for one_wav_file in wav_file_lst],
+                           n_jobs=hpss_params['n_jobs'],
+                           parallel_backend=hpss_params['parallel_backend'],
+                           stft_window_length_hop_size=hpss_params['stft_window_length_hop_size'],
+                           kernel_size=hpss_params['kernel_size'],
+                           hpss_power=hpss_params['hpss_power'],
+                           margin=hpss_params['margin'],
+                           block_seconds=hpss_params['block_seconds'])
 
     def filter_audio_files(self) -> None:
         """
@@ -709,6 +728,11 @@ class Operator:
         -----------
         This method concatenates audio files into a memmap array.
 
+        The channel WAVs are memory-mapped rather than read, and copied into the
+        memmap in blocks of AUDIO_CONCAT_BLOCK_SAMPLES rows, so peak memory does
+        not grow with the recording length or the number of channels. The memmap
+        is published atomically once it is complete.
+
         Parameters
         ----------
 
@@ -728,8 +752,10 @@ class Operator:
 
             if len(all_audio_files) > 1:
 
+                # only the WAV headers are parsed here; every channel's samples stay
+                # on disk as a read-only memmap and are copied over block by block
                 data_dict = DataLoader(input_parameter_dict={'wave_data_loc': [str(audio_type_dir)],
-                                                             'load_wavefile_data': {'library': 'scipy', 'conditional_arg': []}}).load_wavefile_data()
+                                                             'load_wavefile_data': {'library': 'memmap', 'conditional_arg': []}}).load_wavefile_data()
 
                 first_key = next(iter(data_dict.keys()))
                 name_origin = first_key.split('_')[1]
@@ -738,15 +764,30 @@ class Operator:
                 sr = data_dict[first_key]['sampling_rate']
                 complete_mm_file_name = str(audio_type_dir / f"{name_origin}_concatenated_audio_{audio_file_type}_{sr}_{dim_1}_{dim_2}_int16.mmap")
 
-                audio_mm_arr = np.memmap(filename=complete_mm_file_name,
-                                         dtype='int16',
-                                         mode='w+',
-                                         shape=(dim_1, dim_2))
-
-                for file_idx, one_file in enumerate(data_dict.keys()):
-                    audio_mm_arr[:, file_idx] = data_dict[one_file]['wav_data']
-
-                audio_mm_arr.flush()
+                mismatched_files = [one_file for one_file in data_dict if data_dict[one_file]['wav_data'].shape != (dim_1,)]
+                if mismatched_files:
+                    raise ValueError(f"Audio files in '{audio_type_dir}' must all be single channel with {dim_1} samples to be concatenated, "
+                                     f"but these are not: {mismatched_files}.")
+
+                with atomic_output_path(complete_mm_file_name) as tmp_mm_file_name:
+                    audio_mm_arr = np.memmap(filename=tmp_mm_file_name,
+                                             dtype='int16',
+                                             mode='w+',
+                                             shape=(dim_1, dim_2))
+
+                    # fill the (n_samples, n_channels) array one block of rows at a time, so
+                    # each write is a contiguous stretch of the output file and only one block
+                    # of every channel is resident at once (instead of all channels in full)
+                    block_buffer = np.empty((min(AUDIO_CONCAT_BLOCK_SAMPLES, dim_1), dim_2), dtype='int16')
+                    for block_start in range(0, dim_1, AUDIO_CONCAT_BLOCK_SAMPLES):
+                        block_stop = min(block_start + AUDIO_CONCAT_BLOCK_SAMPLES, dim_1)
+                        one_block = block_buffer[:block_stop - block_start]
+                        for file_idx, one_file in enumerate(data_dict.keys()):
+                            one_block[:, file_idx] = data_dict[one_file]['wav_data'][block_start:block_stop]
+                        audio_mm_arr[block_start:block_stop] = one_block
+
+                    audio_mm_arr.flush()
+                    del audio_mm_arr
 
             else:
                 self.message_output(f"There are <2 audio files per provided directory: '{pathlib.Path(self.root_directory) / 'audio' / 'cropped_to_video'}', "
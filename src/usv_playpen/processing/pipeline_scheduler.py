@@ -0,0 +1,614 @@
+"""
+@author: bartulem
+Session-level step scheduler for the preprocessing pipeline.
+
+`Stylist.prepare_data_for_analyses` used to run every enabled Branch-B step
+strictly in order, one session after another, and always re-ran every step
+even when its artifacts were already up to date. This module runs the same
+steps as a dependency graph:
+
+* every step declares the steps it must follow (``after``), the session files
+  it reads (``inputs``) and writes (``outputs``) as glob patterns relative to
+  the session root, and the settings blocks that shape its output;
+* a per-session manifest, ``<root>/.processing_manifest.json``, records for
+  every completed step the size/mtime (optionally content) fingerprint of its
+  inputs and outputs and a digest of its settings, and a step whose record
+  still matches the files on disk is skipped;
+* steps whose dependencies have finished are launched concurrently, within
+  the session and across sessions, as long as the CPU/RAM/IO budget allows.
+
+With one session and one step at a time (the shipped defaults) the steps run
+in the calling thread in their declared order, exactly as before. When steps
+run concurrently, only the calling thread talks to ``message_output`` (which
+may be a GUI widget): messages logged from worker threads are queued by a
+``MessageRelay`` and delivered by the scheduler loop, and steps that plot
+with pyplot (``main_thread``) still run in the calling thread, one at a time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+import queue
+import threading
+import traceback
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+
+from ..os_utils import atomic_output_path
+
+MANIFEST_NAME = '.processing_manifest.json'
+
+# Exceptions a step may raise without aborting the whole run: the step's
+# session is marked as failed and the other sessions carry on (the set
+# Stylist.prepare_data_for_analyses has always caught per root directory).
+STEP_EXCEPTIONS = (OSError, RuntimeError, TypeError, IndexError, IOError, EOFError, TimeoutError, NameError, KeyError, ValueError, AttributeError)
+
+# Chunk size for the optional content fingerprint.
+_HASH_CHUNK_BYTES = 8 * 1024 ** 2
+
+# How often (s) the scheduler loop delivers queued worker messages while it
+# waits for running steps.
+_RELAY_POLL_SECONDS = 0.2
+
+
+@dataclass(frozen=True)
+class PipelineStep:
+    """
+    Description
+    -----------
+    One per-session preprocessing step.
+
+    Parameters
+    ----------
+    name (str)
+        Step name; the ``processing_booleans`` key that enables it.
+    run (Callable)
+        Called as ``run(root_directory, session_idx)``. Returns None on
+        success, or a message recorded as a failure when the step declined
+        to run (the session itself continues, and the step is not recorded
+        in the manifest).
+    after (tuple of str)
+        Steps that must finish first, if they are enabled; dependencies of a
+        disabled step are inherited.
+    inputs (tuple of str)
+        Glob patterns (relative to the session root) of the files the step reads.
+    outputs (tuple of str)
+        Glob patterns of the files the step writes; a step without outputs
+        is never considered up to date.
+    settings (tuple of tuple of str)
+        Key paths of the settings blocks the step depends on.
+    cpu (int)
+        CPU cores the step occupies.
+    ram_gb (float)
+        Memory the step occupies (GB).
+    io (int)
+        Heavy-IO slots the step occupies (0 or 1).
+    main_thread (bool)
+        Run the step in the calling thread even when steps run concurrently
+        (e.g., steps plotting with pyplot, which is not thread-safe, or
+        changing the working directory); such steps never overlap each other.
+    """
+
+    name: str
+    run: Callable[[str, int], str | None]
+    after: tuple[str, ...] = ()
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    settings: tuple[tuple[str, ...], ...] = ()
+    cpu: int = 1
+    ram_gb: float = 1.0
+    io: int = 0
+    main_thread: bool = False
+
+
+class MessageRelay:
+    """
+    Description
+    -----------
+    Thread-safe front for a logging function that must only be called from
+    the thread that created the relay (e.g., a Qt widget's append method).
+    Calls from that thread are passed straight on (after any queued
+    messages); calls from other threads are queued until ``flush`` runs in
+    the owning thread.
+
+    Parameters
+    ----------
+    message_output (Callable)
+        The logging function to relay to.
+    """
+
+    def __init__(self, message_output: Callable) -> None:
+        self.message_output = message_output
+        self._owner = threading.get_ident()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    def __call__(self, message) -> None:
+        if threading.get_ident() != self._owner:
+            self._queue.put(message)
+            return
+        self.flush()
+        self.message_output(message)
+
+    def flush(self) -> None:
+        """Delivers the queued messages (a no-op outside the owning thread)."""
+
+        if threading.get_ident() != self._owner:
+            return
+        while True:
+            try:
+                message = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            self.message_output(message)
+
+
+def fingerprint_files(root_directory: str | pathlib.Path,
+                      patterns: tuple[str, ...],
+                      content: bool = False) -> dict:
+    """
+    Description
+    -----------
+    Fingerprints the files matching a set of glob patterns.
+
+    Parameters
+    ----------
+    root_directory (str | pathlib.Path)
+        Session root directory the patterns are relative to.
+    patterns (tuple of str)
+        Glob patterns.
+    content (bool)
+        Also hash the file contents (BLAKE2b); defaults to False, in which
+        case size and modification time identify a file version.
+
+    Returns
+    -------
+    fingerprint (dict)
+        ``{pattern: {relative_path: [size, mtime_ns(, digest)]}}``.
+    """
+
+    root = pathlib.Path(root_directory)
+    fingerprint = {}
+    for pattern in patterns:
+        matched = {}
+        for one_file in sorted(root.glob(pattern)):
+            if not one_file.is_file():
+                continue
+            file_stat = one_file.stat()
+            entry = [file_stat.st_size, file_stat.st_mtime_ns]
+            if content:
+                digest = hashlib.blake2b(digest_size=16)
+                with open(one_file, 'rb') as file_in:
+                    for chunk in iter(lambda: file_in.read(_HASH_CHUNK_BYTES), b''):
+                        digest.update(chunk)
+                entry.append(digest.hexdigest())
+            matched[one_file.relative_to(root).as_posix()] = entry
+        fingerprint[pattern] = matched
+    return fingerprint
+
+
+def settings_digest(input_parameter_dict: dict,
+                    settings_paths: tuple[tuple[str, ...], ...]) -> str:
+    """
+    Description
+    -----------
+    Digests the settings blocks a step depends on, so that changing one of
+    them makes the step's previous output stale.
+
+    Parameters
+    ----------
+    input_parameter_dict (dict)
+        Processing settings.
+    settings_paths (tuple of tuple of str)
+        Key paths of the relevant settings blocks.
+
+    Returns
+    -------
+    digest (str)
+        Hex digest of the JSON-serialized blocks (missing paths hash as null).
+    """
+
+    blocks = []
+    for key_path in settings_paths:
+        block = input_parameter_dict
+        for key in key_path:
+            block = block.get(key) if isinstance(block, dict) else None
+        blocks.append(block)
+    return hashlib.blake2b(json.dumps(blocks, sort_keys=True, default=str).encode(), digest_size=16).hexdigest()
+
+
+def load_manifest(root_directory: str | pathlib.Path) -> dict:
+    """
+    Description
+    -----------
+    Loads the session's processing manifest (empty if absent or unreadable).
+
+    Parameters
+    ----------
+    root_directory (str | pathlib.Path)
+        Session root directory.
+
+    Returns
+    -------
+    manifest (dict)
+        ``{step_name: record}``.
+    """
+
+    manifest_path = pathlib.Path(root_directory) / MANIFEST_NAME
+    try:
+        with open(manifest_path) as manifest_in:
+            manifest = json.load(manifest_in)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(root_directory: str | pathlib.Path, manifest: dict) -> None:
+    """
+    Description
+    -----------
+    Atomically writes the session's processing manifest.
+
+    Parameters
+    ----------
+    root_directory (str | pathlib.Path)
+        Session root directory.
+    manifest (dict)
+        ``{step_name: record}``.
+
+    Returns
+    -------
+    None
+    """
+
+    with atomic_output_path(pathlib.Path(root_directory) / MANIFEST_NAME) as tmp_path:
+        with open(tmp_path, 'w') as manifest_out:
+            json.dump(manifest, manifest_out, indent=1, sort_keys=True)
+
+
+def step_record(step: PipelineStep,
+                root_directory: str | pathlib.Path,
+                input_parameter_dict: dict,
+                content: bool = False) -> dict:
+    """
+    Description
+    -----------
+    Builds the manifest record describing the current state of a step's
+    inputs, outputs and settings.
+
+    Parameters
+    ----------
+    step (PipelineStep)
+        The step.
+    root_directory (str | pathlib.Path)
+        Session root directory.
+    input_parameter_dict (dict)
+        Processing settings.
+    content (bool)
+        Hash file contents as well; defaults to False.
+
+    Returns
+    -------
+    record (dict)
+        ``inputs``, ``outputs`` and ``settings`` fingerprints.
+    """
+
+    return {
+        'inputs': fingerprint_files(root_directory, step.inputs, content=content),
+        'outputs': fingerprint_files(root_directory, step.outputs, content=content),
+        'settings': settings_digest(input_parameter_dict, step.settings),
+    }
+
+
+def step_is_current(step: PipelineStep,
+                    record: dict,
+                    manifest: dict) -> bool:
+    """
+    Description
+    -----------
+    Decides whether a step's previous output can be reused: the step declares
+    outputs, every output pattern matches at least one file, and the recorded
+    input/output fingerprints and settings digest equal the current ones.
+
+    Parameters
+    ----------
+    step (PipelineStep)
+        The step.
+    record (dict)
+        Current record (see ``step_record``).
+    manifest (dict)
+        The session's manifest.
+
+    Returns
+    -------
+    current (bool)
+        True if the step may be skipped.
+    """
+
+    if not step.outputs or step.name not in manifest:
+        return False
+    if not all(record['outputs'][pattern] for pattern in step.outputs):
+        return False
+    previous = manifest[step.name]
+    return all(previous.get(key) == record[key] for key in ('inputs', 'outputs', 'settings'))
+
+
+def enabled_dependencies(steps: list[PipelineStep], enabled: set[str]) -> dict[str, set[str]]:
+    """
+    Description
+    -----------
+    Resolves, for every enabled step, the enabled steps it has to wait for;
+    a disabled step in between passes its own dependencies on.
+
+    Parameters
+    ----------
+    steps (list of PipelineStep)
+        All declared steps.
+    enabled (set of str)
+        Names of the enabled steps.
+
+    Returns
+    -------
+    dependencies (dict)
+        ``{step_name: set of enabled step names}`` for the enabled steps.
+    """
+
+    declared = {step.name: step for step in steps}
+    resolved: dict[str, set[str]] = {}
+
+    def _resolve(step_name: str) -> set[str]:
+        if step_name not in resolved:
+            resolved[step_name] = set()
+            dependencies = set()
+            for parent in declared[step_name].after:
+                if parent not in declared:
+                    continue
+                dependencies |= {parent} if parent in enabled else _resolve(parent)
+            resolved[step_name] = dependencies
+        return resolved[step_name]
+
+    return {step.name: _resolve(step.name) for step in steps if step.name in enabled}
+
+
+class _InlineExecutor:
+    """Runs submitted calls immediately in the calling thread (serial mode)."""
+
+    @staticmethod
+    def submit(fn: Callable, *args) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+class _SessionState:
+    """Book-keeping of one session while its steps are scheduled."""
+
+    def __init__(self, root_directory: str, session_idx: int, dependencies: dict[str, set[str]], manifest: dict) -> None:
+        self.root_directory = root_directory
+        self.session_idx = session_idx
+        self.dependencies = dependencies
+        self.manifest = manifest
+        self.pending = list(dependencies)
+        self.running: set[str] = set()
+        self.done: set[str] = set()
+        self.failed = False
+
+    def ready_steps(self) -> list[str]:
+        if self.failed:
+            return []
+        return [name for name in self.pending if self.dependencies[name] <= self.done]
+
+    def finished(self) -> bool:
+        return not self.running and (self.failed or not self.pending)
+
+
+def run_session_pipeline(steps: list[PipelineStep],
+                         root_directories: list,
+                         input_parameter_dict: dict,
+                         scheduler_params: dict,
+                         message_output: Callable = print,
+                         enabled: set[str] | None = None,
+                         prepare_session: Callable[[str], None] | None = None) -> list[tuple[str, str]]:
+    """
+    Description
+    -----------
+    Runs the enabled steps of every session as a dependency graph.
+
+    Sessions are started in order, at most ``max_concurrent_sessions`` at a
+    time. Within the started sessions a step is launched once its
+    dependencies are done, at most ``max_concurrent_steps`` steps at a time
+    and only while the summed ``cpu``/``ram_gb``/``io`` demands of the
+    running steps stay within ``cpu_budget``/``ram_gb_budget``/``io_budget``
+    (a step is always admitted when nothing else runs). Ready steps are
+    launched in declaration order, so with one session and one step at a
+    time the steps run serially in the calling thread, in declaration order.
+
+    When ``skip_up_to_date_steps`` is set, a step whose manifest record
+    matches the current files and settings is skipped. When a session ends,
+    the records of all its steps that ran or were skipped are refreshed from
+    the files on disk, so that later steps rewriting an earlier step's
+    output in place (e.g., features merged into the USV summary) do not make
+    that earlier step look stale on the next run.
+
+    A step raising one of ``STEP_EXCEPTIONS`` stops its session (no further
+    steps of it are launched); the other sessions continue.
+
+    ``message_output`` is only ever called from the calling thread: it is
+    wrapped in a ``MessageRelay`` (unless it already is one, which lets the
+    steps share the relay), and the messages of worker threads are delivered
+    while the scheduler waits. ``main_thread`` steps run in the calling
+    thread even in concurrent mode.
+
+    Parameters
+    ----------
+    steps (list of PipelineStep)
+        All declared steps, in their serial order.
+    root_directories (list)
+        Session root directories.
+    input_parameter_dict (dict)
+        Processing settings; ``processing_booleans`` select the steps unless
+        ``enabled`` is given.
+    scheduler_params (dict)
+        ``skip_up_to_date_steps``, ``fingerprint_file_contents``,
+        ``max_concurrent_sessions``, ``max_concurrent_steps``, ``cpu_budget``
+        (0 = all cores), ``ram_gb_budget`` (0 = unlimited), ``io_budget``.
+    message_output (Callable | MessageRelay)
+        Logging function; defaults to print.
+    enabled (set of str | None)
+        Names of the steps to run; defaults to the ``processing_booleans``
+        that are set.
+    prepare_session (Callable | None)
+        Called with the root directory when a session starts.
+
+    Returns
+    -------
+    failed_preprocessing (list of tuple)
+        ``(root_directory, reason)`` for every failed session or declined step.
+    """
+
+    if not isinstance(message_output, MessageRelay):
+        message_output = MessageRelay(message_output)
+    if enabled is None:
+        enabled = {step.name for step in steps if input_parameter_dict['processing_booleans'].get(step.name, False)}
+    declared = {step.name: step for step in steps}
+    dependencies = enabled_dependencies(steps, enabled)
+
+    skip_current = bool(scheduler_params['skip_up_to_date_steps'])
+    content = bool(scheduler_params['fingerprint_file_contents'])
+    max_sessions = max(1, int(scheduler_params['max_concurrent_sessions']))
+    max_steps = max(1, int(scheduler_params['max_concurrent_steps']))
+    cpu_budget = int(scheduler_params['cpu_budget']) or (os.cpu_count() or 1)
+    ram_budget = float(scheduler_params['ram_gb_budget']) or float('inf')
+    io_budget = max(1, int(scheduler_params['io_budget']))
+
+    failed_preprocessing: list[tuple[str, str]] = []
+    queued_sessions = list(enumerate(root_directories))
+    active_sessions: list[_SessionState] = []
+    futures: dict[Future, tuple[_SessionState, PipelineStep]] = {}
+    usage = {'cpu': 0, 'ram_gb': 0.0, 'io': 0}
+
+    def _fits(step: PipelineStep) -> bool:
+        if not futures:
+            return True
+        return (len(futures) < max_steps
+                and usage['cpu'] + step.cpu <= cpu_budget
+                and usage['ram_gb'] + step.ram_gb <= ram_budget
+                and usage['io'] + step.io <= io_budget)
+
+    def _execute(step: PipelineStep, session: _SessionState) -> tuple[str, str | None]:
+        try:
+            return 'done', step.run(session.root_directory, session.session_idx)
+        except STEP_EXCEPTIONS as exc:
+            message_output(traceback.format_exc())
+            return 'failed', f"{type(exc).__name__}: {exc}"
+
+    def _finish_session(session: _SessionState) -> None:
+        for step_name in session.done:
+            if session.manifest.get(step_name, {}).get('completed') is not None:
+                session.manifest[step_name] = {
+                    **step_record(declared[step_name], session.root_directory, input_parameter_dict, content=content),
+                    'completed': session.manifest[step_name]['completed'],
+                }
+        if session.done and pathlib.Path(session.root_directory).is_dir():
+            save_manifest(session.root_directory, session.manifest)
+        if not session.failed:
+            message_output(f"Preprocessing data in {session.root_directory} finished at: "
+                           f"{datetime.now().hour:02d}:{datetime.now().minute:02d}:{datetime.now().second:02d}.")
+
+    parallel = max_sessions > 1 or max_steps > 1
+    executor = ThreadPoolExecutor(max_workers=max_steps) if parallel else _InlineExecutor()
+    inline_executor = _InlineExecutor()
+    try:
+        while queued_sessions or active_sessions:
+            while queued_sessions and len(active_sessions) < max_sessions:
+                session_idx, root_directory = queued_sessions.pop(0)
+                message_output(f"Preprocessing data in {root_directory} started at: "
+                               f"{datetime.now().hour:02d}:{datetime.now().minute:02d}:{datetime.now().second:02d}.")
+                session = _SessionState(root_directory=root_directory, session_idx=session_idx,
+                                        dependencies=dependencies, manifest=load_manifest(root_directory))
+                try:
+                    if prepare_session is not None:
+                        prepare_session(root_directory)
+                except STEP_EXCEPTIONS as exc:
+                    message_output(traceback.format_exc())
+                    failed_preprocessing.append((root_directory, f"{type(exc).__name__}: {exc}"))
+                    session.failed = True
+                active_sessions.append(session)
+
+            # launch every ready step that fits, in session then declaration order
+            launched = False
+            for session in active_sessions:
+                for step_name in session.ready_steps():
+                    step = declared[step_name]
+                    if not _fits(step):
+                        continue
+                    session.pending.remove(step_name)
+                    if skip_current:
+                        record = step_record(step, session.root_directory, input_parameter_dict, content=content)
+                        if step_is_current(step, record, session.manifest):
+                            message_output(f"Skipped '{step_name}' in {session.root_directory} (up to date): its outputs, "
+                                           f"inputs and settings match the processing manifest.")
+                            session.done.add(step_name)
+                            launched = True
+                            continue
+                    session.manifest.pop(step_name, None)
+                    session.running.add(step_name)
+                    usage['cpu'] += step.cpu
+                    usage['ram_gb'] += step.ram_gb
+                    usage['io'] += step.io
+                    step_executor = inline_executor if step.main_thread else executor
+                    futures[step_executor.submit(_execute, step, session)] = (session, step)
+                    launched = True
+                    if not parallel:
+                        break
+                if launched and not parallel:
+                    break
+
+            if futures:
+                completed = set()
+                while not completed:
+                    completed, _ = wait(list(futures), timeout=_RELAY_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                    message_output.flush()
+                for future in completed:
+                    session, step = futures.pop(future)
+                    session.running.discard(step.name)
+                    usage['cpu'] -= step.cpu
+                    usage['ram_gb'] -= step.ram_gb
+                    usage['io'] -= step.io
+                    status, note = future.result()
+                    if status == 'failed':
+                        session.failed = True
+                        failed_preprocessing.append((session.root_directory, note))
+                    else:
+                        # a declined step is reported but, as in the serial
+                        # loop, does not hold back the steps after it
+                        session.done.add(step.name)
+                        if note is None:
+                            session.manifest[step.name] = {'completed': datetime.now().isoformat(timespec='seconds')}
+                        else:
+                            failed_preprocessing.append((session.root_directory, note))
+            elif not launched:
+                # nothing running and nothing launchable: every remaining
+                # session is either failed or waiting on a declined step
+                for session in active_sessions:
+                    session.failed = session.failed or bool(session.pending)
+                    session.pending.clear()
+
+            for session in [one_session for one_session in active_sessions if one_session.finished()]:
+                active_sessions.remove(session)
+                _finish_session(session)
+    finally:
+        executor.shutdown(wait=True)
+        message_output.flush()
+
+    return failed_preprocessing
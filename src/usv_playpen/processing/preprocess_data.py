@@ -11,27 +11,50 @@ import traceback
 from collections.abc import Callable
 from datetime import datetime
 from importlib import metadata
+from typing import TYPE_CHECKING
 
 import click
 import yaml
 from click.core import ParameterSource
 
 from ..cli_utils import StringTuple, modify_settings_json_for_cli
+from ..import_utils import lazy_exports
 from ..os_utils import atomic_output_path
 from ..send_email import Messenger
 from ..yaml_utils import SmartDumper
-from .anipose_operations import ConvertTo3D
-from .assign_vocalizations import Vocalocator
-from .compute_usv_acoustic_features import USVAcousticFeatureExtractor
-from .das_inference import FindMouseVocalizations
-from .extract_phidget_data import Gatherer
-from .generate_masks import MaskGenerator
-from .generate_spectrograms import SpectrogramGenerator
-from .modify_files import Operator
-from .prepare_cluster_job import PrepareClusterJob
-from .preprocessing_plot import SummaryPlotter
-from .qlvm_latents import QLVMLatentInference
-from .synchronize_files import Synchronizer
+from .pipeline_scheduler import MessageRelay, PipelineStep, load_manifest, run_session_pipeline, step_is_current, step_record
+
+if TYPE_CHECKING:
+    from .anipose_operations import ConvertTo3D
+    from .assign_vocalizations import Vocalocator
+    from .compute_usv_acoustic_features import USVAcousticFeatureExtractor
+    from .das_inference import FindMouseVocalizations
+    from .extract_phidget_data import Gatherer
+    from .generate_masks import MaskGenerator
+    from .generate_spectrograms import SpectrogramGenerator
+    from .modify_files import Operator
+    from .prepare_cluster_job import PrepareClusterJob
+    from .preprocessing_plot import SummaryPlotter
+    from .qlvm_latents import QLVMLatentInference
+    from .synchronize_files import Synchronizer
+
+# The worker classes pull in the audio, video and e-phys stacks (librosa,
+# numba, spikeinterface, torch, ...), so they are only imported once a step
+# needs them; `--help` and light commands start without them.
+__getattr__, _load_workers = lazy_exports(globals(), {
+    'ConvertTo3D': '.anipose_operations',
+    'Vocalocator': '.assign_vocalizations',
+    'USVAcousticFeatureExtractor': '.compute_usv_acoustic_features',
+    'FindMouseVocalizations': '.das_inference',
+    'Gatherer': '.extract_phidget_data',
+    'MaskGenerator': '.generate_masks',
+    'SpectrogramGenerator': '.generate_spectrograms',
+    'Operator': '.modify_files',
+    'PrepareClusterJob': '.prepare_cluster_job',
+    'SummaryPlotter': '.preprocessing_plot',
+    'QLVMLatentInference': '.qlvm_latents',
+    'Synchronizer': '.synchronize_files',
+})
 
 
 def _stamp_processing_version(root_directory: str | pathlib.Path) -> None:
@@ -73,6 +96,288 @@ def _stamp_processing_version(root_directory: str | pathlib.Path) -> None:
             yaml.dump(session_metadata, yaml_out, Dumper=SmartDumper, default_flow_style=False, sort_keys=False, indent=2)
 
 
+def session_pipeline_steps(input_parameter_dict: dict,
+                           root_directories: list,
+                           message_output: Callable = print) -> list[PipelineStep]:
+    """
+    Description
+    -----------
+    Declares the per-session (Branch B) preprocessing steps for the pipeline
+    scheduler, in their serial order. Every step makes exactly the calls the
+    per-directory loop of `Stylist.prepare_data_for_analyses` made, and
+    declares the steps it depends on, the session files it reads and writes,
+    the settings it depends on and its (rough) CPU/RAM/IO footprint.
+
+    Steps without declared outputs (video re-encoding, sync checks, Anipose,
+    vocal assignment, and the mask/feature/latent steps that rewrite the
+    spectrogram store and the USV summary in place) are never considered up
+    to date and always run when enabled. The steps plotting with pyplot (the
+    audio-video sync summary and the DAS summary figures) and the USV mask
+    step (which changes the process working directory while it builds the
+    SAM2 predictor) are ``main_thread`` steps, so they never leave the calling
+    thread and never overlap each other.
+
+    Parameters
+    ----------
+    input_parameter_dict (dict)
+        Processing settings.
+    root_directories (list)
+        All root directories of the run (the experimental-code check of the
+        coordinate transformation compares against their number).
+    message_output (Callable)
+        Logging function; defaults to print. When the steps may run
+        concurrently, pass the ``MessageRelay`` handed to the scheduler, so
+        messages from worker threads reach it through the calling thread.
+
+    Returns
+    -------
+    steps (list of PipelineStep)
+        Declared steps, in the order the serial loop ran them.
+    """
+
+    def _conduct_video_concatenation(root_directory, session_idx):
+        _load_workers('Operator')
+        Operator(root_directory=root_directory,
+                 input_parameter_dict=input_parameter_dict,
+                 message_output=message_output).concatenate_video_files()
+
+    def _conduct_video_fps_change(root_directory, session_idx):
+        _load_workers('Operator')
+        Operator(root_directory=root_directory,
+                 input_parameter_dict=input_parameter_dict,
+                 message_output=message_output).rectify_video_fps(conduct_concat=input_parameter_dict['processing_booleans']['conduct_video_concatenation'])
+
+    def _conduct_audio_multichannel_to_single_ch(root_directory, session_idx):
+        _load_workers('Operator')
+        if len(list((pathlib.Path(root_directory) / 'audio' / 'original').iterdir())) == 0:
+            Operator(root_directory=root_directory,
+                     input_parameter_dict=input_parameter_dict,
+                     message_output=message_output).multichannel_to_channel_audio()
+
+    def _conduct_audio_cropping(root_directory, session_idx):
+        _load_workers('Synchronizer')
+        Synchronizer(root_directory=root_directory,
+                     input_parameter_dict=input_parameter_dict,
+                     message_output=message_output).crop_wav_files_to_video()
+
+    def _conduct_audio_video_sync(root_directory, session_idx):
+        _load_workers('Gatherer', 'Synchronizer', 'SummaryPlotter')
+        phidget_data_dictionary = Gatherer(root_directory=root_directory,
+                                           input_parameter_dict=input_parameter_dict).prepare_data_for_analyses()
+
+        ipi_discrepancy_dict = Synchronizer(root_directory=root_directory,
+                                            input_parameter_dict=input_parameter_dict,
+                                            message_output=message_output).find_audio_sync_trains()
+
+        SummaryPlotter(root_directory=root_directory,
+                       message_output=message_output).preprocessing_summary(ipi_discrepancy_dict=ipi_discrepancy_dict,
+                                                                            phidget_data_dictionary=phidget_data_dictionary)
+
+    def _conduct_ephys_video_sync(root_directory, session_idx):
+        _load_workers('Synchronizer')
+        Synchronizer(root_directory=root_directory,
+                     input_parameter_dict=input_parameter_dict,
+                     message_output=message_output).validate_ephys_video_sync()
+
+    def _conduct_hpss(root_directory, session_idx):
+        _load_workers('Operator')
+        Operator(root_directory=root_directory,
+                 input_parameter_dict=input_parameter_dict,
+                 message_output=message_output).hpss_audio()
+
+    def _conduct_audio_filtering(root_directory, session_idx):
+        _load_workers('Operator')
+        Operator(root_directory=root_directory,
+                 input_parameter_dict=input_parameter_dict,
+                 message_output=message_output).filter_audio_files()
+
+    def _conduct_audio_to_mmap(root_directory, session_idx):
+        _load_workers('Operator')
+        Operator(root_directory=root_directory,
+                 input_parameter_dict=input_parameter_dict,
+                 message_output=message_output).concatenate_audio_files()
+
+    def _sleap_h5_conversion(root_directory, session_idx):
+        _load_workers('ConvertTo3D')
+        ConvertTo3D(root_directory=root_directory,
+                    input_parameter_dict=input_parameter_dict,
+                    message_output=message_output).sleap_file_conversion()
+
+    def _anipose_calibration(root_directory, session_idx):
+        _load_workers('ConvertTo3D')
+        ConvertTo3D(root_directory=root_directory,
+                    input_parameter_dict=input_parameter_dict,
+                    message_output=message_output).conduct_anipose_calibration()
+
+    def _anipose_triangulation(root_directory, session_idx):
+        _load_workers('ConvertTo3D')
+        ConvertTo3D(root_directory=root_directory,
+                    input_parameter_dict=input_parameter_dict,
+                    message_output=message_output).conduct_anipose_triangulation()
+
+    def _anipose_trm(root_directory, session_idx):
+        _load_workers('ConvertTo3D')
+        if (input_parameter_dict['anipose_operations']['ConvertTo3D']['conduct_anipose_triangulation']['triangulate_arena_points_bool'] or
+                len(input_parameter_dict['anipose_operations']['ConvertTo3D']['translate_rotate_metric']['experimental_codes']) == len(root_directories)):
+            ConvertTo3D(root_directory=root_directory,
+                        input_parameter_dict=input_parameter_dict,
+                        message_output=message_output).translate_rotate_metric(session_idx=session_idx)
+            return None
+        message_output("Please provide the experimental code for each session in the root directory, their number does not match.")
+        # The requested anipose translate/rotate/metric step was skipped
+        # (experimental-code count mismatch), so it is reported as a failure
+        # instead of silently dropped -- otherwise the run reports success
+        # despite the 3D transform never running for this session.
+        return "anipose_trm skipped: experimental-code count does not match the number of root directories"
+
+    def _das_infer(root_directory, session_idx):
+        _load_workers('FindMouseVocalizations')
+        FindMouseVocalizations(root_directory=root_directory,
+                               input_parameter_dict=input_parameter_dict,
+                               message_output=message_output).das_command_line_inference()
+
+    def _das_summarize(root_directory, session_idx):
+        _load_workers('FindMouseVocalizations')
+        FindMouseVocalizations(root_directory=root_directory,
+                               input_parameter_dict=input_parameter_dict,
+                               message_output=message_output).summarize_das_findings()
+
+    def _prepare_assign_vocalizations(root_directory, session_idx):
+        _load_workers('Vocalocator')
+        Vocalocator(root_directory=root_directory,
+                    input_parameter_dict=input_parameter_dict,
+                    message_output=message_output).prepare_for_vocalocator()
+
+    def _assign_vocalizations(root_directory, session_idx):
+        _load_workers('Vocalocator')
+        if input_parameter_dict['vocalocator']['vcl_version'] == 'vcl':
+            Vocalocator(root_directory=root_directory,
+                        input_parameter_dict=input_parameter_dict,
+                        message_output=message_output).run_vocalocator()
+        else:
+            Vocalocator(root_directory=root_directory,
+                        input_parameter_dict=input_parameter_dict,
+                        message_output=message_output).run_vocalocator_ssl()
+
+    def _generate_usv_spectrograms(root_directory, session_idx):
+        _load_workers('SpectrogramGenerator')
+        SpectrogramGenerator(root_directory=root_directory,
+                             input_parameter_dict=input_parameter_dict,
+                             message_output=message_output).generate_session_spectrograms()
+
+    def _generate_usv_masks(root_directory, session_idx):
+        _load_workers('MaskGenerator')
+        MaskGenerator(root_directory=root_directory,
+                      input_parameter_dict=input_parameter_dict,
+                      message_output=message_output).generate_session_masks()
+
+    def _compute_usv_acoustic_features(root_directory, session_idx):
+        _load_workers('USVAcousticFeatureExtractor')
+        USVAcousticFeatureExtractor(root_directory=root_directory,
+                                    input_parameter_dict=input_parameter_dict,
+                                    message_output=message_output).merge_features_into_summary()
+
+    def _infer_qlvm_latents(root_directory, session_idx):
+        _load_workers('QLVMLatentInference')
+        QLVMLatentInference(root_directory=root_directory,
+                            input_parameter_dict=input_parameter_dict,
+                            message_output=message_output).infer_and_merge()
+
+    hpss_n_jobs = input_parameter_dict['modify_files']['Operator']['hpss_audio']['n_jobs']
+    das_summary_n_jobs = input_parameter_dict['usv_inference']['FindMouseVocalizations']['summarize_das_findings']['n_jobs']
+
+    return [
+        PipelineStep(name='conduct_video_concatenation', run=_conduct_video_concatenation,
+                     settings=(('modify_files', 'Operator', 'concatenate_video_files'),),
+                     cpu=2, io=1),
+        PipelineStep(name='conduct_video_fps_change', run=_conduct_video_fps_change,
+                     after=('conduct_video_concatenation',),
+                     settings=(('modify_files', 'Operator', 'rectify_video_fps'),),
+                     cpu=4, ram_gb=2.0, io=1),
+        PipelineStep(name='conduct_audio_multichannel_to_single_ch', run=_conduct_audio_multichannel_to_single_ch,
+                     outputs=('audio/original/*.wav',),
+                     io=1),
+        PipelineStep(name='conduct_audio_cropping', run=_conduct_audio_cropping,
+                     after=('conduct_video_fps_change', 'conduct_audio_multichannel_to_single_ch'),
+                     inputs=('audio/original/*.wav', 'video/*.json'),
+                     outputs=('audio/cropped_to_video/*.wav',),
+                     settings=(('synchronize_files', 'Synchronizer', 'crop_wav_files_to_video'),),
+                     io=1),
+        PipelineStep(name='conduct_audio_video_sync', run=_conduct_audio_video_sync,
+                     after=('conduct_audio_cropping',),
+                     cpu=2, ram_gb=4.0, io=1, main_thread=True),
+        PipelineStep(name='conduct_ephys_video_sync', run=_conduct_ephys_video_sync,
+                     after=('conduct_audio_cropping',),
+                     ram_gb=4.0, io=1),
+        PipelineStep(name='conduct_hpss', run=_conduct_hpss,
+                     after=('conduct_audio_cropping',),
+                     inputs=('audio/cropped_to_video/*.wav',),
+                     outputs=('audio/hpss/*.wav',),
+                     settings=(('modify_files', 'Operator', 'hpss_audio'),),
+                     cpu=max(1, hpss_n_jobs), ram_gb=2.0 * max(1, hpss_n_jobs)),
+        PipelineStep(name='conduct_audio_filtering', run=_conduct_audio_filtering,
+                     after=('conduct_hpss',),
+                     inputs=tuple(f'audio/{one_dir}/*.wav' for one_dir in input_parameter_dict['modify_files']['Operator']['filter_audio_files']['filter_dirs']),
+                     outputs=tuple(f'audio/{one_dir}_filtered/*.wav' for one_dir in input_parameter_dict['modify_files']['Operator']['filter_audio_files']['filter_dirs']),
+                     settings=(('modify_files', 'Operator', 'filter_audio_files'),),
+                     io=1),
+        PipelineStep(name='conduct_audio_to_mmap', run=_conduct_audio_to_mmap,
+                     after=('conduct_audio_filtering',),
+                     inputs=tuple(f'audio/{one_dir}/*.wav' for one_dir in input_parameter_dict['modify_files']['Operator']['concatenate_audio_files']['concat_dirs']),
+                     outputs=tuple(f'audio/{one_dir}/*.mmap' for one_dir in input_parameter_dict['modify_files']['Operator']['concatenate_audio_files']['concat_dirs']),
+                     settings=(('modify_files', 'Operator', 'concatenate_audio_files'),),
+                     io=1),
+        PipelineStep(name='sleap_h5_conversion', run=_sleap_h5_conversion,
+                     inputs=('video/*/*/*.slp',),
+                     outputs=('video/*/*/*.analysis.h5',),
+                     cpu=2),
+        PipelineStep(name='anipose_calibration', run=_anipose_calibration,
+                     after=('conduct_video_fps_change',),
+                     settings=(('anipose_operations', 'ConvertTo3D', 'conduct_anipose_calibration'),),
+                     cpu=2, ram_gb=2.0),
+        PipelineStep(name='anipose_triangulation', run=_anipose_triangulation,
+                     after=('sleap_h5_conversion', 'anipose_calibration'),
+                     settings=(('anipose_operations', 'ConvertTo3D', 'conduct_anipose_triangulation'),),
+                     cpu=2, ram_gb=2.0),
+        PipelineStep(name='anipose_trm', run=_anipose_trm,
+                     after=('anipose_triangulation',),
+                     settings=(('anipose_operations', 'ConvertTo3D', 'translate_rotate_metric'),)),
+        PipelineStep(name='das_infer', run=_das_infer,
+                     after=('conduct_audio_filtering',),
+                     inputs=('audio/hpss_filtered/*.wav',),
+                     outputs=('audio/das_annotations/*.csv',),
+                     settings=(('usv_inference', 'FindMouseVocalizations', 'das_command_line_inference'),),
+                     cpu=4, ram_gb=8.0),
+        PipelineStep(name='das_summarize', run=_das_summarize,
+                     after=('das_infer', 'conduct_audio_to_mmap'),
+                     inputs=('audio/das_annotations/*.csv', 'audio/hpss_filtered/*.mmap'),
+                     outputs=('audio/*_usv_summary.csv',),
+                     settings=(('usv_inference', 'FindMouseVocalizations', 'summarize_das_findings'),),
+                     cpu=max(1, das_summary_n_jobs), ram_gb=2.0 * max(1, das_summary_n_jobs), main_thread=True),
+        PipelineStep(name='prepare_assign_vocalizations', run=_prepare_assign_vocalizations,
+                     after=('das_summarize', 'anipose_trm', 'conduct_audio_to_mmap'),
+                     ram_gb=4.0, io=1),
+        PipelineStep(name='assign_vocalizations', run=_assign_vocalizations,
+                     after=('prepare_assign_vocalizations',),
+                     cpu=4, ram_gb=8.0),
+        PipelineStep(name='generate_usv_spectrograms', run=_generate_usv_spectrograms,
+                     after=('das_summarize', 'assign_vocalizations'),
+                     inputs=('audio/*_usv_summary.csv', 'audio/hpss_filtered/*.mmap'),
+                     outputs=('audio/spectrograms/*_spectrograms.h5',),
+                     settings=(('generate_spectrograms',),),
+                     cpu=2, ram_gb=4.0, io=1),
+        PipelineStep(name='generate_usv_masks', run=_generate_usv_masks,
+                     after=('generate_usv_spectrograms',),
+                     cpu=4, ram_gb=8.0, main_thread=True),
+        PipelineStep(name='compute_usv_acoustic_features', run=_compute_usv_acoustic_features,
+                     after=('generate_usv_masks',),
+                     cpu=2, ram_gb=2.0),
+        PipelineStep(name='infer_qlvm_latents', run=_infer_qlvm_latents,
+                     after=('compute_usv_acoustic_features',),
+                     cpu=2, ram_gb=4.0),
+    ]
+
+
 class Stylist:
 
     def __init__(self,
@@ -126,8 +431,12 @@ class Stylist:
         (2) splits e-phys clusters to individual sessions
         (3) prepares SLEAP inference cluster job for videos
 
-        Branch B (run separately for EACH root directory, in the order
-        below; taken only when none of the Branch A booleans are set):
+        Branch B (run for EACH root directory by the pipeline scheduler,
+        see `session_pipeline_steps`; taken only when none of the Branch A
+        booleans are set). Steps run in the order below unless
+        preprocess_data/pipeline_scheduler allows independent steps and
+        sessions to overlap, and steps whose recorded outputs are still up
+        to date are skipped:
         (1) concatenates video files (necessary for sessions >15 min)
         (2) re-encodes videos (compresses and adjusts sampling rate)
         (3) splits multichannel to single-channel audio files
@@ -185,6 +494,8 @@ class Stylist:
                 for _dir in (self.root_directories if isinstance(self.root_directories, list) else [self.root_directories]):
                     _stamp_processing_version(_dir)
 
+                _load_workers('Operator', 'PrepareClusterJob')
+
                 # # # concatenate e-phys files
                 if self.input_parameter_dict['processing_booleans']['conduct_ephys_file_chaining']:
                     Operator(root_directory=self.root_directories,
@@ -212,168 +523,19 @@ class Stylist:
 
         # analyze data in each root directory separately
         else:
-            for one_directory_idx, one_directory in enumerate(self.root_directories):
-                try:
-                    self.message_output(f"Preprocessing data in {one_directory} started at: "
-                                        f"{datetime.now().hour:02d}:{datetime.now().minute:02d}:{datetime.now().second:02d}.")
-
-                    _stamp_processing_version(one_directory)
-
-                    # # # concatenate video files
-                    if self.input_parameter_dict['processing_booleans']['conduct_video_concatenation']:
-                        Operator(root_directory=one_directory,
-                                 input_parameter_dict=self.input_parameter_dict,
-                                 message_output=self.message_output).concatenate_video_files()
-
-                    # # # rectify video fps (re-encode)
-                    if self.input_parameter_dict['processing_booleans']['conduct_video_fps_change']:
-                        Operator(root_directory=one_directory,
-                                 input_parameter_dict=self.input_parameter_dict,
-                                 message_output=self.message_output).rectify_video_fps(conduct_concat=self.input_parameter_dict['processing_booleans']['conduct_video_concatenation'])
-
-                    # # # convert multichannel to single channel files
-                    if self.input_parameter_dict['processing_booleans']['conduct_audio_multichannel_to_single_ch']:
-                        if len(list((pathlib.Path(one_directory) / 'audio' / 'original').iterdir())) == 0:
-                            Operator(root_directory=one_directory,
-                                     input_parameter_dict=self.input_parameter_dict,
-                                     message_output=self.message_output).multichannel_to_channel_audio()
-
-                    # # # crop audio files to match video
-                    if self.input_parameter_dict['processing_booleans']['conduct_audio_cropping']:
-                        Synchronizer(root_directory=one_directory,
-                                     input_parameter_dict=self.input_parameter_dict,
-                                     message_output=self.message_output).crop_wav_files_to_video()
-
-                    # # # check audio-video sync
-                    if self.input_parameter_dict['processing_booleans']['conduct_audio_video_sync']:
-                        phidget_data_dictionary = Gatherer(root_directory=one_directory,
-                                                           input_parameter_dict=self.input_parameter_dict).prepare_data_for_analyses()
-
-                        ipi_discrepancy_dict = Synchronizer(root_directory=one_directory,
-                                                            input_parameter_dict=self.input_parameter_dict,
-                                                            message_output=self.message_output).find_audio_sync_trains()
-
-                        SummaryPlotter(root_directory=one_directory,
-                                       message_output=self.message_output).preprocessing_summary(ipi_discrepancy_dict=ipi_discrepancy_dict,
-                                                                                                 phidget_data_dictionary=phidget_data_dictionary)
-
-                    # # # check e-phys-video sync
-                    if self.input_parameter_dict['processing_booleans']['conduct_ephys_video_sync']:
-                        Synchronizer(root_directory=one_directory,
+            # steps may log from worker threads; the relay hands their messages
+            # to message_output (e.g., the GUI log) in this thread
+            message_relay = MessageRelay(self.message_output)
+            failed_preprocessing.extend(
+                run_session_pipeline(steps=session_pipeline_steps(input_parameter_dict=self.input_parameter_dict,
+                                                                  root_directories=self.root_directories,
+                                                                  message_output=message_relay),
+                                     root_directories=self.root_directories,
                                      input_parameter_dict=self.input_parameter_dict,
-                                     message_output=self.message_output).validate_ephys_video_sync()
-
-                    # # # harmonic-percussive source separation
-                    if self.input_parameter_dict['processing_booleans']['conduct_hpss']:
-                        Operator(root_directory=one_directory,
-                                 input_parameter_dict=self.input_parameter_dict,
-                                 message_output=self.message_output).hpss_audio()
-
-                    # # # band-pass filter audio files in memmap
-                    if self.input_parameter_dict['processing_booleans']['conduct_audio_filtering']:
-                        Operator(root_directory=one_directory,
-                                 input_parameter_dict=self.input_parameter_dict,
-                                 message_output=self.message_output).filter_audio_files()
-
-                    # # # stack audio files in memmap
-                    if self.input_parameter_dict['processing_booleans']['conduct_audio_to_mmap']:
-                        Operator(root_directory=one_directory,
-                                 input_parameter_dict=self.input_parameter_dict,
-                                 message_output=self.message_output).concatenate_audio_files()
-
-                    # # # convert .slp to .h5 files
-                    if self.input_parameter_dict['processing_booleans']['sleap_h5_conversion']:
-                        ConvertTo3D(root_directory=one_directory,
-                                    input_parameter_dict=self.input_parameter_dict,
-                                    message_output=self.message_output).sleap_file_conversion()
-
-                    # # # conduct Anipose calibration
-                    if self.input_parameter_dict['processing_booleans']['anipose_calibration']:
-                        ConvertTo3D(root_directory=one_directory,
-                                    input_parameter_dict=self.input_parameter_dict,
-                                    message_output=self.message_output).conduct_anipose_calibration()
-
-                    # # # conduct Anipose triangulation
-                    if self.input_parameter_dict['processing_booleans']['anipose_triangulation']:
-                        ConvertTo3D(root_directory=one_directory,
-                                    input_parameter_dict=self.input_parameter_dict,
-                                    message_output=self.message_output).conduct_anipose_triangulation()
-
-                    # # # conduct coordinate transformation of Anipose data
-                    if self.input_parameter_dict['processing_booleans']['anipose_trm']:
-                        if (self.input_parameter_dict['anipose_operations']['ConvertTo3D']['conduct_anipose_triangulation']['triangulate_arena_points_bool'] or
-                                len(self.input_parameter_dict['anipose_operations']['ConvertTo3D']['translate_rotate_metric']['experimental_codes']) == len(self.root_directories)):
-                            ConvertTo3D(root_directory=one_directory,
-                                        input_parameter_dict=self.input_parameter_dict,
-                                        message_output=self.message_output).translate_rotate_metric(session_idx=one_directory_idx)
-                        else:
-                            self.message_output("Please provide the experimental code for each session in the root directory, their number does not match.")
-                            # The requested anipose translate/rotate/metric step
-                            # was skipped (experimental-code count mismatch), so
-                            # record it as a failure instead of silently dropping
-                            # it -- otherwise the run reports success despite the
-                            # 3D transform never running for this session.
-                            failed_preprocessing.append((one_directory, "anipose_trm skipped: experimental-code count does not match the number of root directories"))
-
-                    # # # conduct DAS inference on audio data
-                    if self.input_parameter_dict['processing_booleans']['das_infer']:
-                        FindMouseVocalizations(root_directory=one_directory,
-                                               input_parameter_dict=self.input_parameter_dict,
-                                               message_output=self.message_output).das_command_line_inference()
-
-                    # # # conduct DAS summary
-                    if self.input_parameter_dict['processing_booleans']['das_summarize']:
-                        FindMouseVocalizations(root_directory=one_directory,
-                                               input_parameter_dict=self.input_parameter_dict,
-                                               message_output=self.message_output).summarize_das_findings()
-
-                    # # # prepare data for vocal assignment
-                    if self.input_parameter_dict['processing_booleans']['prepare_assign_vocalizations']:
-                        Vocalocator(root_directory=one_directory,
-                                    input_parameter_dict=self.input_parameter_dict,
-                                    message_output=self.message_output).prepare_for_vocalocator()
-
-                    # # # assign vocalizations to mice
-                    if self.input_parameter_dict['processing_booleans']['assign_vocalizations']:
-                        if self.input_parameter_dict['vocalocator']['vcl_version'] == 'vcl':
-                            Vocalocator(root_directory=one_directory,
-                                        input_parameter_dict=self.input_parameter_dict,
-                                        message_output=self.message_output).run_vocalocator()
-                        else:
-                            Vocalocator(root_directory=one_directory,
-                                        input_parameter_dict=self.input_parameter_dict,
-                                        message_output=self.message_output).run_vocalocator_ssl()
-
-                    # # # generate USV spectrograms
-                    if self.input_parameter_dict['processing_booleans']['generate_usv_spectrograms']:
-                        SpectrogramGenerator(root_directory=one_directory,
-                                             input_parameter_dict=self.input_parameter_dict,
-                                             message_output=self.message_output).generate_session_spectrograms()
-
-                    # # # generate USV masks
-                    if self.input_parameter_dict['processing_booleans']['generate_usv_masks']:
-                        MaskGenerator(root_directory=one_directory,
-                                      input_parameter_dict=self.input_parameter_dict,
-                                      message_output=self.message_output).generate_session_masks()
-
-                    # # # compute USV acoustic features
-                    if self.input_parameter_dict['processing_booleans']['compute_usv_acoustic_features']:
-                        USVAcousticFeatureExtractor(root_directory=one_directory,
-                                                    input_parameter_dict=self.input_parameter_dict,
-                                                    message_output=self.message_output).merge_features_into_summary()
-
-                    # # # infer QLVM latents
-                    if self.input_parameter_dict['processing_booleans']['infer_qlvm_latents']:
-                        QLVMLatentInference(root_directory=one_directory,
-                                            input_parameter_dict=self.input_parameter_dict,
-                                            message_output=self.message_output).infer_and_merge()
-
-                    self.message_output(f"Preprocessing data in {one_directory} finished at: "
-                                        f"{datetime.now().hour:02d}:{datetime.now().minute:02d}:{datetime.now().second:02d}.")
-
-                except (OSError, RuntimeError, TypeError, IndexError, IOError, EOFError, TimeoutError, NameError, KeyError, ValueError, AttributeError) as exc:
-                    self.message_output(traceback.format_exc())
-                    failed_preprocessing.append((one_directory, f"{type(exc).__name__}: {exc}"))
+                                     scheduler_params=self.input_parameter_dict['preprocess_data']['pipeline_scheduler'],
+                                     message_output=message_relay,
+                                     prepare_session=_stamp_processing_version)
+            )
 
         # Report failures honestly: the completion e-mail previously always
         # announced success even when steps/directories had errored and been
@@ -404,6 +566,57 @@ class Stylist:
                   credentials_file=pathlib.Path(self.input_parameter_dict['credentials_directory']) / 'email_config.ini',
                   exp_settings_dict=self.exp_settings_dict).send_message(subject=completion_subject, message=completion_message)
 
+
+def _run_cli_step(root_directory: str,
+                  step_name: str,
+                  processing_settings_dict: dict,
+                  force: bool = False) -> None:
+    """
+    Description
+    -----------
+    Runs one per-session step for a single-step CLI command through the
+    pipeline scheduler, so the command skips a step whose outputs are up to
+    date and keeps the session's processing manifest current. A skipped
+    step is reported with a pointer to ``--force``, which re-runs it anyway.
+
+    Parameters
+    ----------
+    root_directory (str)
+        Session root directory path.
+    step_name (str)
+        Name of the step (its processing_booleans key).
+    processing_settings_dict (dict)
+        Processing settings with the command-line overrides applied.
+    force (bool)
+        Run the step even if its outputs are up to date; defaults to False.
+
+    Returns
+    -------
+    None
+    """
+
+    steps = session_pipeline_steps(input_parameter_dict=processing_settings_dict,
+                                   root_directories=[root_directory])
+    scheduler_params = processing_settings_dict['preprocess_data']['pipeline_scheduler']
+
+    if scheduler_params['skip_up_to_date_steps'] and not force:
+        step = next(one_step for one_step in steps if one_step.name == step_name)
+        record = step_record(step, root_directory, processing_settings_dict,
+                             content=bool(scheduler_params['fingerprint_file_contents']))
+        if step_is_current(step, record, load_manifest(root_directory)):
+            click.echo(f"'{step_name}' skipped in {root_directory} (up to date): its outputs, inputs and settings "
+                       f"match the processing manifest. Pass --force to run it anyway.")
+            return
+
+    failed_steps = run_session_pipeline(steps=steps,
+                                        root_directories=[root_directory],
+                                        input_parameter_dict=processing_settings_dict,
+                                        scheduler_params={**scheduler_params, 'skip_up_to_date_steps': False},
+                                        enabled={step_name},
+                                        prepare_session=_stamp_processing_version)
+    if failed_steps:
+        raise click.ClickException("; ".join(reason for _, reason in failed_steps))
+
 @click.command(name="concatenate-video-files")
 @click.option('--root-directory', type=click.Path(exists=True, file_okay=False, dir_okay=True), required=True, help='Session root directory path.')
 @click.option('--camera-serial', 'concatenate_camera_serial_num', multiple=True, type=str, default=None, required=False, help='Camera serial number(s).')
@@ -437,6 +650,7 @@ def concatenate_video_files_cli(ctx, root_directory, **kwargs) -> None:
 
     _stamp_processing_version(root_directory)
 
+    _load_workers('Operator')
     Operator(
         root_directory=root_directory,
         input_parameter_dict=processing_settings_dict
@@ -479,6 +693,7 @@ def rectify_video_fps_cli(ctx, root_directory, conduct_concat, **kwargs) -> None
 
     _stamp_processing_version(root_directory)
 
+    _load_workers('Operator')
     Operator(
         root_directory=root_directory,
         input_parameter_dict=processing_settings_dict
@@ -502,14 +717,16 @@ def multichannel_to_channel_audio_cli(root_directory) -> None:
 
     _stamp_processing_version(root_directory)
 
+    _load_workers('Operator')
     Operator(root_directory=root_directory).multichannel_to_channel_audio()
 
 @click.command(name="crop-wav-files")
 @click.option('--root-directory', type=click.Path(exists=True, file_okay=False, dir_okay=True), required=True, help='Session root directory path.')
 @click.option('--trigger-device', 'device_receiving_input', type=click.Choice(['both', 'm', 'r'], case_sensitive=False), default=None, required=False, help='USGH device(s) receiving triggerbox input.')
 @click.option('--trigger-channel', 'triggerbox_ch_receiving_input', type=int, default=None, required=False, help='USGH channel receiving triggerbox input.')
+@click.option('--force', is_flag=True, default=False, help='Run the step even if its outputs are up to date.')
 @click.pass_context
-def crop_wav_files_to_video_cli(ctx, root_directory, **kwargs) -> None:
+def crop_wav_files_to_video_cli(ctx, root_directory, force, **kwargs) -> None:
     """
     Description
     -----------
@@ -531,12 +748,10 @@ def crop_wav_files_to_video_cli(ctx, root_directory, **kwargs) -> None:
         settings_dict='processing_settings'
     )
 
-    _stamp_processing_version(root_directory)
-
-    Synchronizer(
-        root_directory=root_directory,
-        input_parameter_dict=processing_settings_dict
-    ).crop_wav_files_to_video()
+    _run_cli_step(root_directory=root_directory,
+                  step_name='conduct_audio_cropping',
+                  processing_settings_dict=processing_settings_dict,
+                  force=force)
 
 @click.command(name="av-sync-check")
 @click.option('--root-directory', type=click.Path(exists=True, file_okay=False, dir_okay=True), required=True, help='Session root directory path.')
@@ -550,6 +765,7 @@ def crop_wav_files_to_video_cli(ctx, root_directory, **kwargs) -> None:
 @click.option('--video-sync-camera', 'sync_camera_serial_num', multiple=True, type=str, default=None, required=False, help='Camera serial number for video sync.')
 @click.option('--led-version', 'led_px_version', type=str, default=None, required=False, help='Version of the LED pixel used for sync.')
 @click.option('--led-dev', 'led_px_dev', type=int, default=None, required=False, help='LED pixel deviation value.')
+@click.option('--led-sampler', 'led_px_sampler', type=click.Choice(['opencv', 'ffmpeg']), default=None, required=False, help='Backend sampling the LED pixels from the sync video.')
 @click.option('--video-extension', 'sync_video_extension', type=str, default=None, required=False, help='Video extension for sync files.')
 @click.option('--intensity-thresh', 'relative_intensity_threshold', type=float, default=None, required=False, help='Relative intensity threshold for LED detection.')
 @click.option('--ms-tolerance', 'millisecond_divergence_tolerance', type=int, default=None, required=False, help='Divergence tolerance (in ms).')
@@ -581,6 +797,7 @@ def av_sync_check_cli(ctx, root_directory, **kwargs) -> None:
 
     _stamp_processing_version(root_directory)
 
+    _load_workers('Gatherer', 'Synchronizer', 'SummaryPlotter')
     phidget_data_dictionary = Gatherer(
         root_directory=root_directory,
         input_parameter_dict=processing_settings_dict
@@ -628,6 +845,7 @@ def ev_sync_check_cli(ctx, root_directory, **kwargs) -> None:
 
     _stamp_processing_version(root_directory)
 
+    _load_workers('Synchronizer')
     Synchronizer(
         root_directory=root_directory,
         input_parameter_dict=processing_settings_dict
@@ -639,8 +857,12 @@ def ev_sync_check_cli(ctx, root_directory, **kwargs) -> None:
 @click.option('--kernel-size', 'kernel_size', nargs=2, type=int, default=None, required=False, help='Median filter kernel size (harmonic, percussive).')
 @click.option('--power', 'hpss_power', type=float, default=None, required=False, help='HPSS power parameter.')
 @click.option('--margin', 'margin', nargs=2, type=int, default=None, required=False, help='HPSS margin (harmonic, percussive).')
+@click.option('--block-seconds', 'block_seconds', type=float, default=None, required=False, help='Streaming block length in seconds (0 = whole recording in memory).')
+@click.option('--n-jobs', 'n_jobs', type=int, default=None, required=False, help='Number of channels separated concurrently (1 = serial, -1 = all cores).')
+@click.option('--parallel-backend', 'parallel_backend', type=click.Choice(['loky', 'threading']), default=None, required=False, help='Run concurrent channels in processes (loky) or threads (threading).')
+@click.option('--force', is_flag=True, default=False, help='Run the step even if its outputs are up to date.')
 @click.pass_context
-def hpss_audio_cli(ctx, root_directory, **kwargs) -> None:
+def hpss_audio_cli(ctx, root_directory, force, **kwargs) -> None:
     """
     Description
     -----------
@@ -662,23 +884,23 @@ def hpss_audio_cli(ctx, root_directory, **kwargs) -> None:
         ctx=ctx,
         parameters_lists=parameters_lists,
         provided_params=provided_params,
-        settings_dict='processing_settings'
+        settings_dict='processing_settings',
+        block='modify_files'
     )
 
-    _stamp_processing_version(root_directory)
-
-    Operator(
-        root_directory=root_directory,
-        input_parameter_dict=processing_settings_dict
-    ).hpss_audio()
+    _run_cli_step(root_directory=root_directory,
+                  step_name='conduct_hpss',
+                  processing_settings_dict=processing_settings_dict,
+                  force=force)
 
 @click.command(name="bp-filter-audio")
 @click.option('--root-directory', type=click.Path(exists=True, file_okay=False, dir_okay=True), required=True, help='Session root directory path.')
 @click.option('--format', 'filter_audio_format', type=str, default=None, required=False, help='Audio file format.')
 @click.option('--dirs', 'filter_dirs', multiple=True, type=str, default=None, required=False, help='Directory/ies containing files to filter.')
 @click.option('--freq-bounds', 'filter_freq_bounds', nargs=2, type=int, default=None, required=False, help='Frequency bounds for the band-pass filter (Hz).')
+@click.option('--force', is_flag=True, default=False, help='Run the step even if its outputs are up to date.')
 @click.pass_context
-def bp_filter_audio_files_cli(ctx, root_directory, **kwargs) -> None:
+def bp_filter_audio_files_cli(ctx, root_directory, force, **kwargs) -> None:
     """
     Description
     -----------
@@ -703,19 +925,18 @@ def bp_filter_audio_files_cli(ctx, root_directory, **kwargs) -> None:
         settings_dict='processing_settings'
     )
 
-    _stamp_processing_version(root_directory)
-
-    Operator(
-        root_directory=root_directory,
-        input_parameter_dict=processing_settings_dict
-    ).filter_audio_files()
+    _run_cli_step(root_directory=root_directory,
+                  step_name='conduct_audio_filtering',
+                  processing_settings_dict=processing_settings_dict,
+                  force=force)
 
 @click.command(name="concatenate-audio-files")
 @click.option('--root-directory', type=click.Path(exists=True, file_okay=False, dir_okay=True), required=True, help='Session root directory path.')
 @click.option('--format', 'concatenate_audio_format', type=str, default=None, required=False, help='Audio file format.')
 @click.option('--dirs', 'concat_dirs', multiple=True, type=str, default=None, required=False, help='Directory/ies to search for files to concatenate.')
+@click.option('--force', is_flag=True, default=False, help='Run the step even if its outputs are up to date.')
 @click.pass_context
-def concatenate_audio_files_cli(ctx, root_directory, **kwargs) -> None:
+def concatenate_audio_files_cli(ctx, root_directory, force, **kwargs) -> None:
     """
     Description
     -----------
@@ -740,17 +961,16 @@ def concatenate_audio_files_cli(ctx, root_directory, **kwargs) -> None:
         settings_dict='processing_settings'
     )
 
-    _stamp_processing_version(root_directory)
-
-    Operator(
-        root_directory=root_directory,
-        input_parameter_dict=processing_settings_dict
-    ).concatenate_audio_files()
+    _run_cli_step(root_directory=root_directory,
+                  step_name='conduct_audio_to_mmap',
+                  processing_settings_dict=processing_settings_dict,
+                  force=force)
 
 @click.command(name="sleap-to-h5")
 @click.option('--root-directory', type=click.Path(exists=True, file_okay=False, dir_okay=True), required=True, help='Session root directory path.')
+@click.option('--force', is_flag=True, default=False, help='Run the step even if its outputs are up to date.')
 @click.pass_context
-def sleap_file_conversion_cli(ctx, root_directory, **kwargs) -> None:
+def sleap_file_conversion_cli(ctx, root_directory, force, **kwargs) -> None:
     """
     Description
     -----------
@@ -772,12 +992,10 @@ def sleap_file_conversion_cli(ctx, root_directory, **kwargs) -> None:
         settings_dict='processing_settings'
     )
 
-    _stamp_processing_version(root_directory)
-
-    ConvertTo3D(
-        root_directory=root_directory,
-        input_parameter_dict=processing_settings_dict
-    ).sleap_file_conversion()
+    _run_cli_step(root_directory=root_directory,
+                  step_name='sleap_h5_conversion',
+                  processing_settings_dict=processing_settings_dict,
+                  force=force)
 
 @click.command(name="anipose-calibrate")
 @click.option('--root-directory', type=click.Path(exists=True, file_okay=False, dir_okay=True), required=True, help='Session root directory path.')
@@ -815,6 +1033,7 @@ def conduct_anipose_calibration_cli(ctx, root_directory, **kwargs) -> None:
 
     _stamp_processing_version(root_directory)
 
+    _load_workers('ConvertTo3D')
     ConvertTo3D(
         root_directory=root_directory,
         input_parameter_dict=processing_settings_dict
@@ -864,6 +1083,7 @@ def conduct_anipose_triangulation_cli(ctx, root_directory, **kwargs) -> None:
 
     _stamp_processing_version(root_directory)
 
+    _load_workers('ConvertTo3D')
     ConvertTo3D(
         root_directory=root_directory,
         input_parameter_dict=processing_settings_dict
@@ -904,6 +1124,7 @@ def translate_rotate_metric_cli(ctx, root_directory, **kwargs) -> None:
 
     _stamp_processing_version(root_directory)
 
+    _load_workers('ConvertTo3D')
     ConvertTo3D(
         root_directory=root_directory,
         input_parameter_dict=processing_settings_dict
@@ -918,8 +1139,9 @@ def translate_rotate_metric_cli(ctx, root_directory, **kwargs) -> None:
 @click.option('--confidence-thresh', 'segment_confidence_threshold', type=float, default=None, required=False, help='Confidence threshold for segment detection.')
 @click.option('--min-len', 'segment_minlen', type=float, default=None, required=False, help='Minimum length for a detected segment (s).')
 @click.option('--fill-gap', 'segment_fillgap', type=float, default=None, required=False, help='Gap duration to fill between segments (s).')
+@click.option('--force', is_flag=True, default=False, help='Run the step even if its outputs are up to date.')
 @click.pass_context
-def das_command_line_inference_cli(ctx, root_directory, **kwargs):
+def das_command_line_inference_cli(ctx, root_directory, force, **kwargs):
     """
     Description
     -----------
@@ -941,12 +1163,10 @@ def das_command_line_inference_cli(ctx, root_directory, **kwargs):
         settings_dict='processing_settings'
     )
 
-    _stamp_processing_version(root_directory)
-
-    FindMouseVocalizations(
-        root_directory=root_directory,
-        input_parameter_dict=processing_settings_dict
-    ).das_command_line_inference()
+    _run_cli_step(root_directory=root_directory,
+                  step_name='das_infer',
+                  processing_settings_dict=processing_settings_dict,
+                  force=force)
 
 @click.command(name="das-summarize")
 @click.option('--root-directory', type=click.Path(exists=True, file_okay=False, dir_okay=True), required=True, help='Session root directory path.')
@@ -958,8 +1178,10 @@ def das_command_line_inference_cli(ctx, root_directory, **kwargs):
 @click.option('--peak-min', 'peak_min', type=int, default=None, required=False, help='Watershed merge: minimum distinct channels for a coverage peak to count as a call.')
 @click.option('--valley-frac', 'valley_frac', type=float, default=None, required=False, help='Watershed merge: relative valley depth (0-1) that both splits at a gap and trims each USV edge.')
 @click.option('--coverage-bin-ms', 'coverage_bin_ms', type=float, default=None, required=False, help='Watershed merge: coverage-grid bin width in milliseconds (temporal resolution).')
+@click.option('--n-jobs', 'n_jobs', type=int, default=None, required=False, help='Number of worker processes for the amplitude/spectrogram checks (1 = serial, -1 = all cores).')
+@click.option('--force', is_flag=True, default=False, help='Run the step even if its outputs are up to date.')
 @click.pass_context
-def summarize_das_findings_cli(ctx, root_directory, **kwargs):
+def summarize_das_findings_cli(ctx, root_directory, force, **kwargs):
     """
     Description
     -----------
@@ -978,15 +1200,14 @@ def summarize_das_findings_cli(ctx, root_directory, **kwargs):
     processing_settings_dict = modify_settings_json_for_cli(
         ctx=ctx,
         provided_params=provided_params,
-        settings_dict='processing_settings'
+        settings_dict='processing_settings',
+        block='usv_inference'
     )
 
-    _stamp_processing_version(root_directory)
-
-    FindMouseVocalizations(
-        root_directory=root_directory,
-        input_parameter_dict=processing_settings_dict
-    ).summarize_das_findings()
+    _run_cli_step(root_directory=root_directory,
+                  step_name='das_summarize',
+                  processing_settings_dict=processing_settings_dict,
+                  force=force)
 
 @click.command(name="concatenate-ephys-files")
 @click.option('--root-directories', type=str, required=True, help='Comma-separated string of session root directory paths.')
@@ -1007,6 +1228,7 @@ def concatenate_binary_files_cli(root_directories):
     all_paths = [d.strip() for d in root_directories.split(',')]
     valid_dirs = [path for path in all_paths if pathlib.Path(path).is_dir()]
 
+    _load_workers('Operator')
     if len(valid_dirs) > 0:
         for _dir in valid_dirs:
             _stamp_processing_version(_dir)
@@ -1022,6 +1244,7 @@ def concatenate_binary_files_cli(root_directories):
 @click.option('--kilosort-version', type=str, default=None, required=False, help='Version of Kilosort used for spike sorting.')
 @click.option('--remove-duplicate-spikes/--no-remove-duplicate-spikes', 'remove_duplicate_spikes', default=None, help='Drop near-coincident duplicate spikes (e.g. from Phy merges) per unit.')
 @click.option('--censored-period-ms', 'duplicate_censored_period_ms', type=float, default=None, required=False, help='Censored period (in ms) for duplicate-spike removal.')
+@click.option('--export-legacy-npy/--no-export-legacy-npy', 'export_legacy_cluster_npy', default=None, help='Also write the legacy one-.npy-per-cluster files next to the spike store.')
 @click.pass_context
 def split_clusters_to_sessions_cli(ctx, root_directories, **kwargs):
     """
@@ -1048,6 +1271,7 @@ def split_clusters_to_sessions_cli(ctx, root_directories, **kwargs):
         settings_dict='processing_settings'
     )
 
+    _load_workers('Operator')
     if len(valid_dirs) > 0:
         for _dir in valid_dirs:
             _stamp_processing_version(_dir)
@@ -1081,6 +1305,7 @@ def prepare_vcl_assign_cli(root_directory, arena_directory) -> None:
 
     _stamp_processing_version(root_directory)
 
+    _load_workers('Vocalocator')
     Vocalocator(
         root_directory=root_directory,
         input_parameter_dict=processing_settings_dict,
@@ -1126,6 +1351,7 @@ def vcl_assign_cli(ctx, root_directory, **kwargs) -> None:
 
     _stamp_processing_version(root_directory)
 
+    _load_workers('Vocalocator')
     if vcl_version == 'vcl':
         Vocalocator(
             root_directory=root_directory,
@@ -33,7 +33,6 @@ import click
 import h5py
 import jax.numpy as jnp
 import numpy as np
-import polars as pls
 from click.core import ParameterSource
 
 from ..cli_utils import modify_settings_json_for_cli
@@ -258,6 +257,8 @@ class QLVMLatentInference:
         coords = np.asarray(embed_data(lattice, data, params))           # (N, 2)
         category, supercategory = labels_for_coords(coords, fine_grid, coarse_grid)
 
+        import polars as pls  # noqa: PLC0415 (lazy: keeps polars off the CLI import path)
+
         qlvm_df = pls.DataFrame({
             "_usv_row": usv_indices,
             "qlvm_dim1": coords[:, 0].astype(np.float64),
@@ -17,6 +17,7 @@ import shutil
 import subprocess
 from collections import Counter
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import cv2
@@ -35,7 +36,162 @@ from ..os_utils import (
     wait_for_subprocesses,
 )
 from ..time_utils import is_gui_context, smart_wait
-from .load_audio_files import DataLoader
+from .load_audio_files import DataLoader, memmap_wav_data
+
+
+# samples of one channel read per block by `find_digital_edges` (8 MB of int16);
+# bounds the edge detector's memory independently of the recording length
+DIGITAL_EDGE_BLOCK_SAMPLES = 2 ** 22
+
+
+def find_digital_edges(recording: np.ndarray,
+                       bit_positions: list | tuple | None,
+                       num_channels: int = 1,
+                       channel: int = -1,
+                       block_samples: int = DIGITAL_EDGE_BLOCK_SAMPLES) -> dict:
+    """
+    Description
+    -----------
+    This function streams one channel of an interleaved integer recording
+    (e.g., a NIDQ / SpikeGLX .bin memmap) in fixed-size blocks and finds the
+    rising and falling edges of the requested bits. Only the channel's
+    samples of one block (plus one overlap sample, so edges straddling a
+    block boundary are neither lost nor counted twice) are held in memory
+    at a time, instead of expanding the full channel into a bit matrix.
+
+    Edge indices follow the `np.where(np.diff(x) > 0)[0]` convention used
+    throughout this module: an edge at index i means the bit changed
+    between samples i and i + 1.
+
+    Parameters
+    ----------
+    recording (np.ndarray)
+        1D interleaved recording (channel-fastest, as SpikeGLX writes it).
+    bit_positions (list | tuple | None)
+        Bits to extract edges for; None compares whole sample values instead
+        (e.g., a Neuropixels sync channel or an already-extracted TTL line).
+    num_channels (int)
+        Number of interleaved channels in the recording.
+    channel (int)
+        Channel carrying the digital word; negative values count from the end.
+    block_samples (int)
+        Number of channel samples processed per block.
+
+    Returns
+    -------
+    edges_dict (dict)
+        Maps every requested bit position (or None) to a tuple of
+        (rising_edges, falling_edges) sample-index arrays.
+    """
+
+    sample_num = recording.shape[0] // num_channels
+    channel = channel % num_channels
+    edge_keys = [None] if bit_positions is None else [int(bit_position) for bit_position in bit_positions]
+
+    rising_parts = {edge_key: [] for edge_key in edge_keys}
+    falling_parts = {edge_key: [] for edge_key in edge_keys}
+    for block_start in range(0, max(sample_num - 1, 0), block_samples):
+        block_stop = min(block_start + block_samples + 1, sample_num)
+        block = np.asarray(recording[block_start * num_channels + channel:block_stop * num_channels:num_channels])
+        for edge_key in edge_keys:
+            block_values = block if edge_key is None else (block >> edge_key) & 1
+            block_diffs = block_values[1:] - block_values[:-1]
+            rising_parts[edge_key].append(np.flatnonzero(block_diffs > 0) + block_start)
+            falling_parts[edge_key].append(np.flatnonzero(block_diffs < 0) + block_start)
+
+    return {edge_key: (np.concatenate(rising_parts[edge_key] or [np.empty(0, dtype=np.int64)]).astype(np.int64),
+                       np.concatenate(falling_parts[edge_key] or [np.empty(0, dtype=np.int64)]).astype(np.int64))
+            for edge_key in edge_keys}
+
+
+# LED pixels are cut out of the decoded stream as 2x2 crops (the smallest
+# window every chroma-subsampled pixel format crops cleanly), and the raw
+# RGB stream is read back this many frames at a time
+LED_CROP_SIZE = 2
+LED_SAMPLER_BATCH_FRAMES = 4096
+
+
+def sample_led_pixels_ffmpeg(video_of_interest: str,
+                             led_coords: np.ndarray,
+                             frame_height: int,
+                             frame_width: int,
+                             out_arr: np.ndarray) -> int:
+    """
+    Description
+    -----------
+    This function samples the RGB values of the sync-LED pixels of every
+    frame with a single ffmpeg pipe: the decoded frames are cropped to a
+    tiny window around each LED (before any color conversion), the crops
+    are stacked side by side and only that small raw RGB stream is piped
+    back, instead of converting and transferring every full frame to
+    Python. Values can differ from a full-frame OpenCV conversion by a
+    few intensity levels (chroma is not interpolated across the crop),
+    which the relative-intensity sync detection is insensitive to.
+
+    Parameters
+    ----------
+    video_of_interest (str)
+        Location of relevant sync video.
+    led_coords (np.ndarray)
+        (n_leds, 2) array of LED (row, column) pixel coordinates.
+    frame_height (int)
+        Video frame height (in px).
+    frame_width (int)
+        Video frame width (in px).
+    out_arr (np.ndarray)
+        (total_frame_number, n_leds, 3) uint8 array (e.g., the sync_px
+        memmap) to fill with per-frame LED RGB values.
+
+    Returns
+    -------
+    decoded_frame_num (int)
+        Number of frames written to out_arr (smaller than its length only
+        if the video ended early).
+    """
+
+    led_num = led_coords.shape[0]
+    total_frame_number = out_arr.shape[0]
+
+    # top-left corner of each LED's crop (kept inside the frame) and the LED's
+    # position within its crop
+    crop_y = np.clip(led_coords[:, 0], 0, frame_height - LED_CROP_SIZE)
+    crop_x = np.clip(led_coords[:, 1], 0, frame_width - LED_CROP_SIZE)
+    in_crop_y = led_coords[:, 0] - crop_y
+    in_crop_x = led_coords[:, 1] - crop_x + np.arange(led_num) * LED_CROP_SIZE
+
+    split_labels = ''.join(f'[s{led_idx}]' for led_idx in range(led_num))
+    crop_filters = ';'.join(f'[s{led_idx}]crop={LED_CROP_SIZE}:{LED_CROP_SIZE}:{crop_x[led_idx]}:{crop_y[led_idx]}:exact=1[c{led_idx}]'
+                            for led_idx in range(led_num))
+    crop_labels = ''.join(f'[c{led_idx}]' for led_idx in range(led_num))
+    filter_graph = f"[0:v]split={led_num}{split_labels};{crop_filters};{crop_labels}hstack=inputs={led_num},format=rgb24[leds]"
+
+    frame_bytes = LED_CROP_SIZE * LED_CROP_SIZE * led_num * 3
+    ffmpeg_process = subprocess.Popen(args=["ffmpeg", "-loglevel", "error", "-nostdin", "-i", video_of_interest,
+                                            "-filter_complex", filter_graph, "-map", "[leds]",
+                                            "-frames:v", str(total_frame_number), "-fps_mode", "passthrough",
+                                            "-f", "rawvideo", "-pix_fmt", "rgb24", "pipe:1"],
+                                      stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    decoded_frame_num = 0
+    try:
+        while decoded_frame_num < total_frame_number:
+            batch_frame_num = min(LED_SAMPLER_BATCH_FRAMES, total_frame_number - decoded_frame_num)
+            raw_bytes = ffmpeg_process.stdout.read(batch_frame_num * frame_bytes)
+            batch_frame_num = len(raw_bytes) // frame_bytes
+            if batch_frame_num == 0:
+                break
+            crops = np.frombuffer(raw_bytes[:batch_frame_num * frame_bytes], dtype=np.uint8).reshape((batch_frame_num, LED_CROP_SIZE, LED_CROP_SIZE * led_num, 3))
+            out_arr[decoded_frame_num:decoded_frame_num + batch_frame_num] = crops[:, in_crop_y, in_crop_x, :]
+            decoded_frame_num += batch_frame_num
+    finally:
+        ffmpeg_process.stdout.close()
+        error_output = ffmpeg_process.stderr.read().decode(errors='replace').strip()
+        ffmpeg_process.stderr.close()
+        return_code = ffmpeg_process.wait()
+
+    if return_code != 0 and decoded_frame_num == 0:
+        raise RuntimeError(f"ffmpeg LED pixel sampling failed for {video_of_interest} (return code {return_code}): {error_output}")
+
+    return decoded_frame_num
 
 
 def find_events(diffs: np.ndarray,
@@ -489,8 +645,9 @@ class Synchronizer:
                                                    num_channels=total_probe_ch,
                                                    sampling_frequency=float(calibrated_sr_config['CalibratedHeadStages'][headstage_sn]))
 
-            # search for tracking start and end
-            ch_sync_data = np.load(file=f'{sync_ch_file}.npy')
+            # search for tracking start and end (the sync channel is memory-mapped
+            # and streamed through the block-wise edge detector)
+            ch_sync_data = np.load(file=f'{sync_ch_file}.npy', mmap_mode='r')
             (tracking_start, tracking_end, largest_break_duration,
              _, _) = self.find_lsb_changes(relevant_array=ch_sync_data, lsb_bool=False, total_frame_number=total_frame_number_least)
 
@@ -569,7 +726,7 @@ class Synchronizer:
         Parameters
         ----------
         relevant_array (np.ndarray)
-            Array to extract sync signal from.
+            Array to extract sync signal from; may be a memmap, as it is read in blocks.
         lsb_bool (bool)
             Whether to extract the least significant bit.
         total_frame_number (int)
@@ -584,11 +741,10 @@ class Synchronizer:
             marks the end of the largest break (i.e. the recording-start hop), not a sample position.
         """
 
-        if lsb_bool:
-            lsb_array = relevant_array & 1
-            ttl_break_end_samples = np.where((lsb_array[1:] - lsb_array[:-1]) > 0)[0]
-        else:
-            ttl_break_end_samples = np.where((relevant_array[1:] - relevant_array[:-1]) > 0)[0]
+        # rising edges of the LSB (or of the whole value), streamed block-wise so
+        # memory-mapped multi-hour inputs are never expanded in full
+        edge_key = 0 if lsb_bool else None
+        ttl_break_end_samples = find_digital_edges(recording=relevant_array, bit_positions=None if edge_key is None else [edge_key])[edge_key][0]
 
         # With fewer than two TTL break-ends the inter-break diff array is empty,
         # so np.argmax / np.max would raise on a degenerate signal (no usable sync
@@ -607,7 +763,7 @@ class Synchronizer:
             return None, None, int(largest_break_duration), ttl_break_end_samples, largest_break_end_hop
 
     @staticmethod
-    @njit(parallel=True)
+    @njit(parallel=True, cache=True)
     def find_ipi_intervals(sound_array: np.ndarray,
                            audio_sr_rate: int = 250000) -> tuple:
 
@@ -787,22 +943,32 @@ class Synchronizer:
                 self.led_px_dict[led_px_version][used_camera]['LED_bottom']
             ])
 
-            cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            if self.input_parameter_dict['find_video_sync_trains']['led_px_sampler'] == 'ffmpeg':
+                cap.release()
+                decoded_frame_num = sample_led_pixels_ffmpeg(video_of_interest=video_of_interest,
+                                                             led_coords=led_coords,
+                                                             frame_height=frame_height,
+                                                             frame_width=frame_width,
+                                                             out_arr=mm_arr)
+                if decoded_frame_num < total_frame_number:
+                    self.message_output(f"WARNING: Reached end of decodable frames at index {decoded_frame_num}, while total_frame_number was {total_frame_number}.")
+            else:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
 
-            for fr_idx in range(total_frame_number):
-                ret, frame = cap.read()
+                for fr_idx in range(total_frame_number):
+                    ret, frame = cap.read()
 
-                if not ret:
-                    self.message_output(f"WARNING: Reached end of decodable frames at index {fr_idx}, while total_frame_number was {total_frame_number}.")
-                    break
+                    if not ret:
+                        self.message_output(f"WARNING: Reached end of decodable frames at index {fr_idx}, while total_frame_number was {total_frame_number}.")
+                        break
 
-                if frame.ndim == 3:
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    pixel_values = frame_rgb[led_coords[:, 0], led_coords[:, 1]]
-                    mm_arr[fr_idx] = pixel_values
-                else:
-                    pixel_values = frame[led_coords[:, 0], led_coords[:, 1]]
-                    mm_arr[fr_idx] = np.repeat(pixel_values[:, np.newaxis], repeats=3, axis=1)
+                    if frame.ndim == 3:
+                        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                        pixel_values = frame_rgb[led_coords[:, 0], led_coords[:, 1]]
+                        mm_arr[fr_idx] = pixel_values
+                    else:
+                        pixel_values = frame[led_coords[:, 0], led_coords[:, 1]]
+                        mm_arr[fr_idx] = np.repeat(pixel_values[:, np.newaxis], repeats=3, axis=1)
 
             mm_arr.flush()
         finally:
@@ -959,6 +1125,10 @@ class Synchronizer:
                     break
         arduino_ipi_durations = np.array(arduino_ipi_durations)
 
+        # collect the sync videos first, so the LED pixels of all sync cameras are
+        # gathered concurrently (decoding runs outside the GIL, in OpenCV or in
+        # ffmpeg subprocesses) before the per-camera sequence matching below
+        sync_videos = []
         for video_subdir in (pathlib.Path(self.root_directory) / 'video').iterdir():
             if '_' in video_subdir.name or not video_subdir.is_dir(): continue
 
@@ -974,53 +1144,58 @@ class Synchronizer:
                 if ('calibration' in video_name or video_name.split('-')[0] not in self.input_parameter_dict['find_video_sync_trains']['sync_camera_serial_num']
                         or self.input_parameter_dict['find_video_sync_trains']['sync_video_extension'] not in video_name): continue
 
-                video_of_interest = str(camera_dir / video_name)
-
-                if not (pathlib.Path(self.root_directory) / 'sync' / f'sync_px_{video_name[:-4]}').exists():
-                    self.gather_px_information(
-                        video_of_interest=video_of_interest,
-                        sync_camera_fps=camera_fps[sync_cam_idx],
-                        camera_id=camera_dir.name,
-                        video_name=video_name,
-                        total_frame_number=total_frame_number
-                    )
-
-                leds_array = np.memmap(filename=pathlib.Path(self.root_directory) / 'sync' / f'sync_px_{video_name[:-4]}',
-                                       dtype=np.uint8, mode='r', shape=(total_frame_number, 3, 3))
+                sync_videos.append((camera_dir, video_name, camera_fps[sync_cam_idx]))
+                sync_cam_idx += 1
 
-                mean_across_rgb = leds_array.mean(axis=-1)
+        pending_sync_videos = [(camera_dir, video_name, sync_camera_fps) for camera_dir, video_name, sync_camera_fps in sync_videos
+                               if not (pathlib.Path(self.root_directory) / 'sync' / f'sync_px_{video_name[:-4]}').exists()]
+        if pending_sync_videos:
+            with ThreadPoolExecutor(max_workers=len(pending_sync_videos)) as px_executor:
+                px_futures = [px_executor.submit(self.gather_px_information,
+                                                 video_of_interest=str(camera_dir / video_name),
+                                                 sync_camera_fps=sync_camera_fps,
+                                                 camera_id=camera_dir.name,
+                                                 video_name=video_name,
+                                                 total_frame_number=total_frame_number)
+                              for camera_dir, video_name, sync_camera_fps in pending_sync_videos]
+                for px_future in px_futures:
+                    px_future.result()
+
+        for camera_dir, video_name, sync_camera_fps in sync_videos:
+            leds_array = np.memmap(filename=pathlib.Path(self.root_directory) / 'sync' / f'sync_px_{video_name[:-4]}',
+                                   dtype=np.uint8, mode='r', shape=(total_frame_number, 3, 3))
+
+            mean_across_rgb = leds_array.mean(axis=-1)
+
+            # Use MEDIAN (robust to bright noise)
+            self.message_output(f"Attempting sync detection for {camera_dir.name} with MEDIAN signal...")
+            brightness_signal_median = np.median(mean_across_rgb, axis=1) + 1e-6
+
+            temp_sync_dict, temp_ipi_frames, sequence_found = self.attempt_sequence_match(
+                brightness_signal=brightness_signal_median,
+                camera_fps=sync_camera_fps,
+                arduino_ipi_durations=arduino_ipi_durations,
+                camera_dir=camera_dir
+            )
 
-                # Use MEDIAN (robust to bright noise)
-                self.message_output(f"Attempting sync detection for {camera_dir.name} with MEDIAN signal...")
-                brightness_signal_median = np.median(mean_across_rgb, axis=1) + 1e-6
+            # Fallback to MAX if MEDIAN fails (robust to occlusions)
+            if not sequence_found:
+                self.message_output(f"Median method failed for {camera_dir}. Falling back to MAX signal...")
+                brightness_signal_max = np.max(mean_across_rgb, axis=1) + 1e-6
 
                 temp_sync_dict, temp_ipi_frames, sequence_found = self.attempt_sequence_match(
-                    brightness_signal=brightness_signal_median,
-                    camera_fps=camera_fps[sync_cam_idx],
+                    brightness_signal=brightness_signal_max,
+                    camera_fps=sync_camera_fps,
                     arduino_ipi_durations=arduino_ipi_durations,
                     camera_dir=camera_dir
                 )
 
-                # Fallback to MAX if MEDIAN fails (robust to occlusions)
-                if not sequence_found:
-                    self.message_output(f"Median method failed for {camera_dir}. Falling back to MAX signal...")
-                    brightness_signal_max = np.max(mean_across_rgb, axis=1) + 1e-6
-
-                    temp_sync_dict, temp_ipi_frames, sequence_found = self.attempt_sequence_match(
-                        brightness_signal=brightness_signal_max,
-                        camera_fps=camera_fps[sync_cam_idx],
-                        arduino_ipi_durations=arduino_ipi_durations,
-                        camera_dir=camera_dir
-                    )
-
-                if sequence_found:
-                    self.message_output(f"SUCCESS: Sync sequence found for {camera_dir}!")
-                    sync_sequence_dict.update(temp_sync_dict)
-                    ipi_start_frames = temp_ipi_frames
-                else:
-                    self.message_output(f"No sequence match found in '{video_name}'!")
-
-                sync_cam_idx += 1
+            if sequence_found:
+                self.message_output(f"SUCCESS: Sync sequence found for {camera_dir}!")
+                sync_sequence_dict.update(temp_sync_dict)
+                ipi_start_frames = temp_ipi_frames
+            else:
+                self.message_output(f"No sequence match found in '{video_name}'!")
 
         return ipi_start_frames, sync_sequence_dict
 
@@ -1049,7 +1224,7 @@ class Synchronizer:
         smart_wait(app_context_bool=self.app_context_bool, seconds=1)
 
         wave_data_dict = DataLoader(input_parameter_dict={'wave_data_loc': [str(pathlib.Path(self.root_directory) / 'audio' / 'cropped_to_video')],
-                                                          'load_wavefile_data': {'library': 'scipy',
+                                                          'load_wavefile_data': {'library': 'memmap',
                                                                                  'conditional_arg': [f"_ch{self.input_parameter_dict['find_audio_sync_trains']['sync_ch_receiving_input']:02d}"]}}).load_wavefile_data()
 
         # get the total number of frames in the video
@@ -1086,14 +1261,19 @@ class Synchronizer:
         nidq_file = next(iter(sorted(pathlib.Path(self.root_directory).glob("**/*.nidq.bin"))), None)
         nidq_ipi_data_file = pathlib.Path(self.root_directory) / 'sync' / 'nidq_ipi_data.npy'
         if nidq_file is not None and not nidq_ipi_data_file.is_file():
-            nidq_recording = np.memmap(filename=nidq_file, mode='r', dtype=np.int16, order='C')
-            nidq_sample_num = nidq_recording.shape[0] // self.input_parameter_dict['find_audio_sync_trains']['nidq_num_channels']
-            nidq_digital_ch = nidq_recording.reshape((self.input_parameter_dict['find_audio_sync_trains']['nidq_num_channels'], nidq_sample_num), order='F')[-1, :].reshape([-1, 1])
-            nidq_digital_bits = (nidq_digital_ch & (2 ** np.arange(16).reshape([1, 16]))).astype(bool).astype(int)
-
             # find start/end of recording
             if self.input_parameter_dict['find_audio_sync_trains']['nidq_bool']:
-                triggerbox_bit_changes = np.where((nidq_digital_bits[1:, self.input_parameter_dict['find_audio_sync_trains']['nidq_triggerbox_input_bit_position']] - nidq_digital_bits[:-1, self.input_parameter_dict['find_audio_sync_trains']['nidq_triggerbox_input_bit_position']]) > 0)[0]
+                # stream the digital channel once, extracting edges of only the
+                # triggerbox and sync bits (bounded memory for multi-hour recordings)
+                nidq_recording = np.memmap(filename=nidq_file, mode='r', dtype=np.int16, order='C')
+                triggerbox_bit_position = self.input_parameter_dict['find_audio_sync_trains']['nidq_triggerbox_input_bit_position']
+                sync_bit_position = self.input_parameter_dict['find_audio_sync_trains']['nidq_sync_input_bit_position']
+                nidq_edges = find_digital_edges(recording=nidq_recording,
+                                                bit_positions=sorted({triggerbox_bit_position, sync_bit_position}),
+                                                num_channels=self.input_parameter_dict['find_audio_sync_trains']['nidq_num_channels'],
+                                                channel=-1)
+
+                triggerbox_bit_changes = nidq_edges[triggerbox_bit_position][0]
                 triggerbox_diffs = triggerbox_bit_changes[1:] - triggerbox_bit_changes[:-1]
                 largest_break_end_hop = np.argmax(triggerbox_diffs) + 1
                 largest_break_end_hop_sec = round((triggerbox_bit_changes[largest_break_end_hop] - triggerbox_bit_changes[largest_break_end_hop - 1]) / self.input_parameter_dict['find_audio_sync_trains']['nidq_sr'], 3)
@@ -1117,10 +1297,14 @@ class Synchronizer:
                 nidq_video_difference = nidq_rec_duration - total_video_time_least
                 self.message_output(f"For NIDQ, video recording starts at {loopbio_start_nidq_sample} NIDQ sample and ends at {loopbio_end_nidq_sample} NIDQ sample, giving a total NIDQ duration of {nidq_rec_duration:.4f}, which is {nidq_video_difference:.4f} off relative to video duration.")
 
-                # find NIDQ IPI starts and durations in milliseconds
-                nidq_rec_ = nidq_digital_bits[loopbio_start_nidq_sample:loopbio_end_nidq_sample, self.input_parameter_dict['find_audio_sync_trains']['nidq_sync_input_bit_position']].copy()
-                ipi_start_samples = np.where(np.diff(nidq_rec_) < 0)[0] + 1
-                ipi_end_samples = np.where(np.diff(nidq_rec_) > 0)[0]
+                # find NIDQ IPI starts and durations in milliseconds; sync-bit edges are
+                # restricted to changes between samples of the [start, end) video window
+                # and expressed relative to its start
+                sync_rising_edges, sync_falling_edges = nidq_edges[sync_bit_position]
+                sync_falling_in_window = sync_falling_edges[(sync_falling_edges >= loopbio_start_nidq_sample) & (sync_falling_edges < loopbio_end_nidq_sample - 1)]
+                sync_rising_in_window = sync_rising_edges[(sync_rising_edges >= loopbio_start_nidq_sample) & (sync_rising_edges < loopbio_end_nidq_sample - 1)]
+                ipi_start_samples = sync_falling_in_window - loopbio_start_nidq_sample + 1
+                ipi_end_samples = sync_rising_in_window - loopbio_start_nidq_sample
 
                 if ipi_start_samples[0] < ipi_end_samples[0]:
                     if ipi_start_samples.size == ipi_end_samples.size:
@@ -1329,7 +1513,7 @@ class Synchronizer:
 
         # load audio channels receiving camera triggerbox input
         wave_data_dict = DataLoader(input_parameter_dict={'wave_data_loc': [str(pathlib.Path(self.root_directory) / 'audio' / 'original')],
-                                                          'load_wavefile_data': {'library': 'scipy',
+                                                          'load_wavefile_data': {'library': 'memmap',
                                                                                  'conditional_arg': [f"_ch{self.input_parameter_dict['crop_wav_files_to_video']['triggerbox_ch_receiving_input']:02d}"]}}).load_wavefile_data()
 
         # determine device ID(s) that get(s) camera frame trigger pulses
@@ -1511,7 +1695,7 @@ class Synchronizer:
                         outfile_loc = str(pathlib.Path(self.root_directory) / 'audio' / 'cropped_to_video' / f'{modified_base_name}_cropped_to_video.wav')
 
                         # extract original LSB data
-                        m_sr_original, m_data_original = wavfile.read(f'{audio_file}')
+                        m_sr_original, m_data_original = memmap_wav_data(audio_file)
                         m_lsb_original = m_data_original[start_end_video['m']['start_first_recorded_frame']:start_end_video['m']['end_last_recorded_frame'] + 1] & 1
 
                         # resample the LSB data
@@ -1541,7 +1725,7 @@ class Synchronizer:
                         outfile_loc = str(pathlib.Path(self.root_directory) / 'audio' / 'cropped_to_video' / f'{modified_base_name}_cropped_to_video.wav')
 
                         # extract original LSB data
-                        s_sr_original, s_data_original = wavfile.read(f'{audio_file}')
+                        s_sr_original, s_data_original = memmap_wav_data(audio_file)
                         s_lsb_original = s_data_original[start_end_video['s']['start_first_recorded_frame']:start_end_video['s']['end_last_recorded_frame'] + 1] & 1
 
                         # resample the LSB data
@@ -18,13 +18,16 @@ from functools import partial
 from importlib import metadata
 from pathlib import Path
 
-# torch MUST be imported before PyQt6. On Windows, importing Qt first makes
+# On Windows, torch MUST be imported before PyQt6: importing Qt first makes
 # torch's c10.dll fail to initialise (OSError [WinError 1114]) because Qt and
-# torch ship conflicting low-level DLLs and the first loader wins. The GUI pulls
-# torch in transitively anyway (via noisereduce in the analyses package), so it
-# is hoisted to the front here so its native DLLs load first. Keep it first;
-# do not re-sort below the PyQt6 imports.
-import torch  # noqa: F401
+# torch ship conflicting low-level DLLs and the first loader wins. The analyses
+# and processing workers (which pull torch in) are imported lazily, so torch
+# could otherwise first load after Qt; it is hoisted to the front here so its
+# native DLLs load first. Other platforms have no such conflict and skip the
+# (multi-second) import at startup. Keep it first; do not re-sort below the
+# PyQt6 imports.
+if platform.system() == 'Windows':
+    import torch  # noqa: F401
 
 import platformdirs
 import toml
@@ -65,7 +68,6 @@ from PyQt6.QtWidgets import (
 )
 
 from .analyses.analyze_data import Analyst
-from .analyses.generate_audio_files import _PLAYBACK_CONTEXTS
 from .os_utils import configure_path, rebase_experimenter_in_paths, resolve_data_root
 from .processing.preprocess_data import Stylist
 from .recording.behavioral_experiments import ExperimentController
@@ -3327,7 +3329,7 @@ class USVPlaypenWindow(QMainWindow):
         self.ProcessSettings = ProcessSettings(self)
         self.setWindowTitle(f'{app_name} (Process recordings > Settings)')
         self.setCentralWidget(self.ProcessSettings)
-        process_one_x, process_one_y = (1080, 935)
+        process_one_x, process_one_y = (1080, 1055)
         self.setFixedSize(process_one_x, process_one_y)
 
         # column 1
@@ -3533,6 +3535,38 @@ class USVPlaypenWindow(QMainWindow):
         self.min_spike_num.setStyleSheet('QLineEdit { width: 108px; }')
         self.min_spike_num.move(225, 857)
 
+        scheduler_label = QLabel('Pipeline scheduler settings', self.ProcessSettings)
+        scheduler_label.setFont(QFont(self.font_id, 13 + self.font_size_increase))
+        scheduler_label.setStyleSheet('QLabel { padding-top: 3px; font-weight: bold;}')
+        scheduler_label.move(10, 895)
+
+        skip_up_to_date_steps_cb_label = QLabel('Skip up-to-date steps:', self.ProcessSettings)
+        skip_up_to_date_steps_cb_label.setFont(QFont(self.font_id, 12 + self.font_size_increase))
+        skip_up_to_date_steps_cb_label.move(10, 925)
+        self.skip_up_to_date_steps_cb_list = [x for _, x in sorted(zip([self.skip_up_to_date_steps_cb_bool, not self.skip_up_to_date_steps_cb_bool], self.boolean_list), reverse=True)]
+        self.skip_up_to_date_steps_cb = QComboBox(self.ProcessSettings)
+        self.skip_up_to_date_steps_cb.addItems(self.skip_up_to_date_steps_cb_list)
+        self.skip_up_to_date_steps_cb.setStyleSheet('QComboBox { width: 80px; }')
+        self.skip_up_to_date_steps_cb.activated.connect(partial(self._combo_box_prior_true if self.skip_up_to_date_steps_cb_list[0] == 'Yes' else self._combo_box_prior_false,
+                                                                variable_id='skip_up_to_date_steps_cb_bool'))
+        self.skip_up_to_date_steps_cb.move(225, 925)
+
+        max_concurrent_sessions_label = QLabel('Concurrent sessions:', self.ProcessSettings)
+        max_concurrent_sessions_label.setFont(QFont(self.font_id, 12 + self.font_size_increase))
+        max_concurrent_sessions_label.move(10, 955)
+        self.max_concurrent_sessions = QLineEdit(f"{self.processing_input_dict['preprocess_data']['pipeline_scheduler']['max_concurrent_sessions']}", self.ProcessSettings)
+        self.max_concurrent_sessions.setFont(QFont(self.font_id, 10 + self.font_size_increase))
+        self.max_concurrent_sessions.setStyleSheet('QLineEdit { width: 108px; }')
+        self.max_concurrent_sessions.move(225, 957)
+
+        max_concurrent_steps_label = QLabel('Concurrent steps:', self.ProcessSettings)
+        max_concurrent_steps_label.setFont(QFont(self.font_id, 12 + self.font_size_increase))
+        max_concurrent_steps_label.move(10, 985)
+        self.max_concurrent_steps = QLineEdit(f"{self.processing_input_dict['preprocess_data']['pipeline_scheduler']['max_concurrent_steps']}", self.ProcessSettings)
+        self.max_concurrent_steps.setFont(QFont(self.font_id, 10 + self.font_size_increase))
+        self.max_concurrent_steps.setStyleSheet('QLineEdit { width: 108px; }')
+        self.max_concurrent_steps.move(225, 987)
+
         # column 2
         column_two_x1 = 440
         column_two_x2 = 630
@@ -5329,6 +5363,7 @@ class USVPlaypenWindow(QMainWindow):
 
         qlabel_strings = ['conversion_target_file', 'constant_rate_factor', 'ch_receiving_input',
                           'a_ch_receiving_input', 'pc_usage_process', 'min_spike_num', 'phidget_extra_data_camera',
+                          'max_concurrent_sessions', 'max_concurrent_steps',
                           'n_deriv_smooth', 'das_model_base', 'das_output_type',
                           'smooth_scale', 'static_reference_len', 'weight_rigid', 'weight_weak',
                           'reprojection_error_threshold', 'regularization_function',
@@ -5384,6 +5419,9 @@ class USVPlaypenWindow(QMainWindow):
         self.processing_input_dict['synchronize_files']['Synchronizer']['crop_wav_files_to_video']['triggerbox_ch_receiving_input'] = int(_safe_literal_eval(self.ch_receiving_input))
         self.processing_input_dict['modify_files']['Operator']['filter_audio_files']['filter_freq_bounds'] = [int(_safe_literal_eval(freq_bound)) for freq_bound in self.filter_freq_bounds]
         self.processing_input_dict['modify_files']['Operator']['get_spike_times']['min_spike_num'] = int(_safe_literal_eval(self.min_spike_num))
+        self.processing_input_dict['preprocess_data']['pipeline_scheduler']['max_concurrent_sessions'] = int(_safe_literal_eval(self.max_concurrent_sessions))
+        self.processing_input_dict['preprocess_data']['pipeline_scheduler']['max_concurrent_steps'] = int(_safe_literal_eval(self.max_concurrent_steps))
+        self.processing_input_dict['preprocess_data']['pipeline_scheduler']['skip_up_to_date_steps'] = self.skip_up_to_date_steps_cb_bool
         self.processing_input_dict['synchronize_files']['Synchronizer']['find_audio_sync_trains']['sync_ch_receiving_input'] = int(_safe_literal_eval(self.a_ch_receiving_input))
         self.processing_input_dict['extract_phidget_data']['Gatherer']['prepare_data_for_analyses']['extra_data_camera'] = self.phidget_extra_data_camera
 
@@ -5887,6 +5925,8 @@ class USVPlaypenWindow(QMainWindow):
             Context labels with at least one built repository (or all labels as a fallback).
         """
 
+        from .analyses.generate_audio_files import _PLAYBACK_CONTEXTS  # noqa: PLC0415 (lazy: pulls librosa + noisereduce)
+
         try:
             repository_root = resolve_data_root('naturalistic_usv_repository_dir')
         except Exception:
@@ -7591,6 +7631,7 @@ def initialize_main_window(no_splash: bool = False) -> tuple[QApplication, QMain
                            'sleap_cluster_cb_bool': False, 'das_inference_cb_bool': False, 'das_summary_cb_bool': False, 'assign_usv_cb_bool': False,
                            'prepare_assign_usv_cb_bool': False, 'delete_con_file_cb_bool': True, 'board_provided_cb_bool': False, 'triangulate_arena_points_cb_bool': False,
                            'display_progress_cb_bool': True, 'ransac_cb_bool': False, 'delete_original_h5_cb_bool': True,
+                           'skip_up_to_date_steps_cb_bool': processing_input_dict['preprocess_data']['pipeline_scheduler']['skip_up_to_date_steps'],
                            'compute_behavioral_features_cb_bool': False, 'plot_behavioral_tuning_cb_bool': False, 'make_behavioral_video_cb_bool': False,
                            'visualization_type_cb_bool': False, 'plot_theme': visualizations_input_dict['make_behavioral_videos']['plot_theme'],
                            'fig_format': visualizations_input_dict['make_behavioral_videos']['general_figure_specs']['fig_format'], 'view_angle': visualizations_input_dict['make_behavioral_videos']['view_angle'],
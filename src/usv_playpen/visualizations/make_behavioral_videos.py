@@ -24,8 +24,10 @@ from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 from numba import njit
 from scipy.io import wavfile
 
+from ..analyses.behavioral_feature_table import find_behavioral_feature_table, load_behavioral_features
 from ..analyses.decode_experiment_label import extract_information
 from ..analyses.generate_audio_files import AudioGenerator
+from ..neuropixels.spike_store import discover_session_units, load_unit_spikes
 from ..os_utils import first_match_or_raise
 from .plot_style import apply_plot_style
 from ..time_utils import is_gui_context, smart_wait
@@ -159,7 +161,7 @@ _VIDEO_LAYOUT = {
 }
 
 
-@njit
+@njit(cache=True)
 def read_ttl_events(input_array: np.ndarray) -> tuple:
     """
     Description
@@ -183,7 +185,7 @@ def read_ttl_events(input_array: np.ndarray) -> tuple:
     return off_to_on[0], on_to_off[0]
 
 
-@njit
+@njit(cache=True)
 def filter_spikes_for_raster(input_arr: np.ndarray,
                              ra_st_fr: int,
                              ra_end_fr: int,
@@ -1410,14 +1412,19 @@ class Create3DVideo:
         self.color_mode_preferences = _VIDEO_COLOR_MODES
 
 
-    def load_beh_features_file(self) -> pls.DataFrame:
+    def load_beh_features_file(self, columns: list | None = None,
+                               frame_range: tuple | None = None) -> pls.DataFrame:
         """
         Description
         -----------
-        Loads the CSV file containing 3D behavioral features.
+        Loads the Parquet (or, failing that, CSV) file containing 3D behavioral features.
 
         Parameters
         ----------
+        columns (list)
+            Feature columns to load; None loads all.
+        frame_range (tuple)
+            Half-open (start, stop) camera-frame range to load; None loads all.
 
         Returns
         -------
@@ -1426,13 +1433,8 @@ class Create3DVideo:
         """
 
         # load behavioral feature data
-        behavioral_data_file = first_match_or_raise(
-            root=pathlib.Path(self.root_directory),
-            pattern='*_behavioral_features.csv*',
-            recursive=True,
-            label="behavioral features CSV",
-        )
-        beh_feature_data = pls.read_csv(str(behavioral_data_file))
+        behavioral_data_file = find_behavioral_feature_table(root=pathlib.Path(self.root_directory))
+        beh_feature_data = load_behavioral_features(behavioral_data_file, columns=columns, frame_range=frame_range)
 
         return beh_feature_data
 
@@ -1641,8 +1643,8 @@ class Create3DVideo:
                 ) as anatomy_converter_json:
                     neuropixels_sites_to_anatomy_converter = json.load(anatomy_converter_json)
 
-                # find cluster data files and sort them in ascending order (0 channel first)
-                cluster_files = sorted((pathlib.Path(self.root_directory) / 'ephys').rglob('cluster_data/*.npy'), key=lambda p: p.name)
+                # find cluster units (spike store, or legacy cluster data files) sorted in ascending order (0 channel first)
+                cluster_files = discover_session_units(root_directory=self.root_directory)
 
                 # filter cluster data files
                 if (len(self.visualizations_parameter_dict['make_behavioral_videos']['raster_selection_criteria']['other']) > 0 or
@@ -1672,7 +1674,7 @@ class Create3DVideo:
                 # load cluster data files
                 cluster_data_dict = {}
                 for cluster_file in cluster_files:
-                    cluster_data_dict[cluster_file.stem] = np.load(file=cluster_file)[1, :]
+                    cluster_data_dict[cluster_file.stem] = load_unit_spikes(unit=cluster_file)[1, :]
 
                 # Order units by brain-area bucket so the raster groups areas in
                 # a fixed sequence (CENT, SC, PAG, MRN, MB, VTA, other) read top
@@ -1754,13 +1756,12 @@ class Create3DVideo:
                     # a non-empty setting would hit an UnboundLocalError at the slice below.
                     beh_features_to_plot = self.visualizations_parameter_dict['make_behavioral_videos']['beh_features_to_plot']
 
-                # get feature data
-                beh_feature_data = self.load_beh_features_file()
-
+                # get feature data (only the plotted columns within the plotted window)
                 beh_window_start = frame_start - beh_half_window_size_frames
                 beh_window_end = frame_start + frame_span + beh_half_window_size_frames
 
-                beh_feature_data = beh_feature_data[beh_window_start:beh_window_end, beh_features_to_plot]
+                beh_feature_data = self.load_beh_features_file(columns=beh_features_to_plot,
+                                                               frame_range=(beh_window_start, beh_window_end))
 
             if self.visualizations_parameter_dict['make_behavioral_videos']['spectrogram_bool']:
 
@@ -45,6 +45,7 @@ from ..analyses.compute_neuronal_tuning_curves import (
     CATEGORICAL_FEATURES,
 )
 from ..analyses.decode_experiment_label import extract_information
+from ..neuropixels.spike_store import discover_session_units, load_unit_spikes
 from ..os_utils import first_match_or_raise
 from .plot_style import apply_plot_style
 from ..time_utils import is_gui_context, smart_wait
@@ -6238,17 +6239,19 @@ class NeuronalTuningFigureMaker(FeatureZoo):
             return
 
         # spike data: the spike file path is not stored in the pkl;
-        # locate the cluster's spike .npy under <session_root>/ephys
-        # via session_root + cluster_id stored in metadata.
+        # locate the cluster's unit (spike store or legacy spike .npy)
+        # under <session_root>/ephys via session_root + cluster_id
+        # stored in metadata.
         spike_path_hint = cluster_data["usv_metadata"]["session_root"]
         if spike_path_hint is not None:
             cluster_id = cluster_data["usv_metadata"]["cluster_id"]
             if cluster_id:
-                spike_npy_candidates = list(
-                    pathlib.Path(spike_path_hint).rglob(f"cluster_data/{cluster_id}.npy")
-                )
-                if spike_npy_candidates:
-                    arr = np.load(spike_npy_candidates[0])
+                spike_unit_candidates = [
+                    unit for unit in discover_session_units(root_directory=spike_path_hint)
+                    if unit.stem == cluster_id
+                ]
+                if spike_unit_candidates:
+                    arr = load_unit_spikes(unit=spike_unit_candidates[0])
                     spike_times = np.sort(np.asarray(arr[0, :], dtype=float))
                 else:
                     spike_times = np.empty(0, dtype=float)
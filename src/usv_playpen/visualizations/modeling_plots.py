@@ -65,6 +65,7 @@ from scipy.ndimage import gaussian_filter1d
 
 from ..modeling.modeling_metadata import RESERVED_METADATA_KEYS, load_selection_results
 from ..modeling.manifold_metric import pairwise_distance
+from ..modeling.modeling_input_store import load_modeling_input
 from ..analyses.compute_behavioral_features import FeatureZoo
 from ..processing.qlvm_latents import load_decoder_params
 from ..processing.qlvm_model import decode_lattice_atlas
@@ -851,7 +852,8 @@ def plot_raw_feature_difference(
     """
     Visualizes the raw difference of a specific feature between two conditions.
 
-    This function loads modeling data from a pickle file, automatically detects the
+    This function loads the feature from a modeling input (HDF5 store or legacy
+    pickle), automatically detects the
     data structure (either "Vocal Onset" or "Vocal Category"), and generates two
     complementary visualizations:
     1.  **Bootstrap Average Plot:** A line plot comparing the mean feature value
@@ -865,7 +867,7 @@ def plot_raw_feature_difference(
     Parameters
     ----------
     pickle_file_path : str
-        The absolute path to the .pkl file containing the modeling input data.
+        The absolute path to the modeling input (.h5 store or legacy .pkl).
     feature_key : str
         The dictionary key representing the specific feature to analyze
         (e.g., 'nose-nose_1st_der').
@@ -899,11 +901,10 @@ def plot_raw_feature_difference(
         output_dir = configure_path(str(output_dir))
 
     print(f"Loading data from: {pickle_file_path}")
-    with open(pickle_file_path, 'rb') as pickle_file:
-        modeling_input_data = pickle.load(pickle_file)
+    modeling_input_data = load_modeling_input(pickle_file_path, features=feature_key)
 
     if feature_key not in modeling_input_data:
-        print(f"Error: Feature '{feature_key}' not found in pickle file.")
+        print(f"Error: Feature '{feature_key}' not found in modeling input.")
         return
 
     first_session = next(iter(modeling_input_data[feature_key].values()))
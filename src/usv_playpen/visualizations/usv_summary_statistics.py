@@ -24,6 +24,11 @@ from statsmodels.stats.multicomp import pairwise_tukeyhsd
 # analyses<->visualizations near-cycle); re-imported here so this module and its
 # importers keep using them unchanged.
 from ..analyses._usv_io import extract_session_metadata, load_and_filter_usv_data
+from ..analyses.behavioral_feature_table import (
+    behavioral_feature_columns,
+    find_behavioral_feature_table,
+    load_behavioral_features,
+)
 
 
 # Load the project-wide default cmap from `visualizations_settings.json`
@@ -162,12 +167,12 @@ def extract_category_embedding_data(
 
     return pls.concat(all_data) if all_data else pls.DataFrame()
 
-def get_session_behavioral_features(session_root: str) -> pls.DataFrame:
+def get_session_behavioral_features(session_root: str, column_suffixes: tuple | None = None) -> pls.DataFrame:
     """
     Description
     -----------
-    This function loads the behavioral features CSV (e.g., distances, angles) for a
-    specific session.
+    This function loads the behavioral features table (e.g., distances, angles) for a
+    specific session, preferring the Parquet table over the CSV.
 
     This function specifically targets the file containing calculated
     metrics like 'nose-nose' distance and 'allo_yaw' angles. It adds
@@ -177,21 +182,30 @@ def get_session_behavioral_features(session_root: str) -> pls.DataFrame:
     ----------
     session_root (str)
         The absolute path to the session directory.
+    column_suffixes (tuple)
+        If given, only the first column ending with each suffix is read
+        (suffixes without a matching column are skipped); defaults to None,
+        which reads every column.
 
     Returns
     -------
     behavioral_features (pls.DataFrame)
-        Contains all frame-by-frame behavioral metrics.
+        Contains all (or the selected) frame-by-frame behavioral metrics.
     """
 
-    session_path = Path(session_root)
-    features_file = next(iter(sorted(session_path.glob('**/*_behavioral_features.csv'))), None)
-
-    if features_file is None:
+    try:
+        features_file = find_behavioral_feature_table(root=Path(session_root))
+    except FileNotFoundError:
         msg = f"Behavioral features file missing in {session_root}"
-        raise FileNotFoundError(msg)
+        raise FileNotFoundError(msg) from None
+
+    columns = None
+    if column_suffixes is not None:
+        available = behavioral_feature_columns(features_file)
+        columns = [col for col in (next((c for c in available if c.endswith(suffix)), None)
+                                   for suffix in column_suffixes) if col is not None]
 
-    return pls.read_csv(str(features_file)).with_row_index("frame_index")
+    return load_behavioral_features(features_file, columns=columns, row_index_name="frame_index")
 
 def merge_usv_and_behavioral_features(
     usv_info: pls.DataFrame,
@@ -435,7 +449,8 @@ def build_master_usv_dataframe(
 
         has_behavioral = False
         try:
-            behavioral_features = get_session_behavioral_features(session_root)
+            behavioral_features = get_session_behavioral_features(
+                session_root, column_suffixes=(distance_suffix, mf_angle_suffix, fm_angle_suffix))
             dist_col = next((c for c in behavioral_features.columns if c.endswith(distance_suffix)), None)
             mf_col = next((c for c in behavioral_features.columns if c.endswith(mf_angle_suffix)), None)
             fm_col = next((c for c in behavioral_features.columns if c.endswith(fm_angle_suffix)), None)
@@ -11,16 +11,30 @@ import traceback
 import warnings
 from collections.abc import Callable
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 import click
 from click.core import ParameterSource
 
 from ..cli_utils import modify_settings_json_for_cli
+from ..import_utils import lazy_exports
 from ..send_email import Messenger
-from .make_behavioral_videos import Create3DVideo
-from .make_neuronal_tuning_figures import NeuronalTuningFigureMaker
-from .make_usv_spectrograms import USVSpectrogramPlotter, render_embedding_thumbnails_for_cohort
-from .qlvm_torus_traversal_video import QLVMTorusTraversalVideo
+
+if TYPE_CHECKING:
+    from .make_behavioral_videos import Create3DVideo
+    from .make_neuronal_tuning_figures import NeuronalTuningFigureMaker
+    from .make_usv_spectrograms import USVSpectrogramPlotter, render_embedding_thumbnails_for_cohort
+    from .qlvm_torus_traversal_video import QLVMTorusTraversalVideo
+
+# The plotting workers pull in matplotlib, librosa and polars, so they are
+# only imported once a visualization needs them.
+__getattr__, _load_workers = lazy_exports(globals(), {
+    'Create3DVideo': '.make_behavioral_videos',
+    'NeuronalTuningFigureMaker': '.make_neuronal_tuning_figures',
+    'USVSpectrogramPlotter': '.make_usv_spectrograms',
+    'render_embedding_thumbnails_for_cohort': '.make_usv_spectrograms',
+    'QLVMTorusTraversalVideo': '.qlvm_torus_traversal_video',
+})
 
 
 class Visualizer:
@@ -117,12 +131,14 @@ class Visualizer:
 
                 # # # # plot per-cluster combined neuronal tuning figures (behavioral + vocal)
                 if self.input_parameter_dict['visualize_booleans']['make_neuronal_tuning_figures_bool']:
+                    _load_workers('NeuronalTuningFigureMaker')
                     NeuronalTuningFigureMaker(root_directory=one_directory,
                                               visualizations_parameter_dict=self.input_parameter_dict,
                                               message_output=self.message_output).make_neuronal_tuning_figures()
 
                 # # # # make behavioral videos
                 if self.input_parameter_dict['visualize_booleans']['make_behavioral_videos_bool']:
+                    _load_workers('Create3DVideo')
                     Create3DVideo(root_directory=one_directory,
                                   arena_directory=self.input_parameter_dict['make_behavioral_videos']['arena_directory'],
                                   speaker_audio_file=self.input_parameter_dict['make_behavioral_videos']['speaker_audio_file'],
@@ -132,6 +148,7 @@ class Visualizer:
 
                 # # # # make USV spectrogram figures (per-session; mode set in settings, e.g. 'sequence')
                 if self.input_parameter_dict['visualize_booleans']['make_usv_spectrograms_bool']:
+                    _load_workers('USVSpectrogramPlotter')
                     USVSpectrogramPlotter(root_directory=one_directory,
                                           visualizations_parameter_dict=self.input_parameter_dict,
                                           message_output=self.message_output).make_usv_spectrograms()
@@ -148,6 +165,7 @@ class Visualizer:
         # session directory), so it runs ONCE outside the per-session loop.
         if self.input_parameter_dict['visualize_booleans']['make_qlvm_torus_traversal_video_bool']:
             try:
+                _load_workers('QLVMTorusTraversalVideo')
                 QLVMTorusTraversalVideo(output_path=None,
                                         input_parameter_dict=self.input_parameter_dict,
                                         message_output=self.message_output).make_video()
@@ -160,6 +178,7 @@ class Visualizer:
         # settings (not a session directory), so it runs ONCE outside the loop.
         if self.input_parameter_dict['visualize_booleans']['make_embedding_thumbnails_bool']:
             try:
+                _load_workers('render_embedding_thumbnails_for_cohort')
                 render_embedding_thumbnails_for_cohort(self.input_parameter_dict,
                                                        message_output=self.message_output)
             except (OSError, RuntimeError, TypeError, IndexError, IOError, EOFError, TimeoutError, NameError, KeyError, ValueError, AttributeError) as exc:
@@ -292,6 +311,7 @@ def visualize_3D_data_cli(ctx, root_directory, arena_directory, exp_id, speaker_
                                                                           parameters_lists=parameters_lists,
                                                                           settings_dict='visualizations_settings')
 
+    _load_workers('Create3DVideo')
     Create3DVideo(root_directory=root_directory,
                   arena_directory=arena_directory,
                   exp_id=exp_id,
@@ -328,6 +348,7 @@ def generate_rm_figures_cli(ctx, root_directory, **kwargs) -> None:
     visualizations_settings_parameter_dict = modify_settings_json_for_cli(ctx=ctx,
                                                                           provided_params=provided_params,
                                                                           settings_dict='visualizations_settings')
+    _load_workers('NeuronalTuningFigureMaker')
     NeuronalTuningFigureMaker(root_directory=root_directory,
                               visualizations_parameter_dict=visualizations_settings_parameter_dict,
                               message_output=print).make_neuronal_tuning_figures()
@@ -6,6 +6,7 @@ Test analyses module.
 import json
 import math
 import pathlib
+import pickle
 import subprocess as _subprocess
 from unittest.mock import MagicMock
 
@@ -24,6 +25,8 @@ from usv_playpen.analyses.analyze_data import Analyst
 from usv_playpen.analyses.decode_experiment_label import extract_information
 from usv_playpen.analyses.compute_behavioral_features import (
     FeatureZoo,
+    _WORKING_VALUES_PER_MOUSE,
+    _WORKING_VALUES_PER_PAIR,
     calculate_derivatives,
     calculate_sei,
     calculate_speed,
@@ -34,6 +37,8 @@ from usv_playpen.analyses.compute_behavioral_features import (
     get_egocentric_direction,
     get_euler_ang,
     get_head_root,
+    estimate_feature_session_memory_gb,
+    save_behavioral_features_batch,
 )
 from usv_playpen.analyses.compute_inter_usv_interval_distributions import (
     _read_session_lists,
@@ -43,6 +48,7 @@ from usv_playpen.analyses.compute_inter_usv_interval_distributions import (
 from usv_playpen.analyses.compute_neuronal_tuning_curves import (
     generate_ratemaps,
     shuffle_spikes,
+    circular_shift_null_counts,
     NeuronalTuning,
     _longest_run,
     _peak_z_info,
@@ -58,6 +64,8 @@ from usv_playpen.analyses.compute_neuronal_tuning_curves import (
     _gaussian_smooth_1d,
     _gaussian_smooth_2d,
     _generate_shuffle_offsets,
+    _generate_shuffle_frame_offsets,
+    _frame_bin_indices,
     _circular_shift_spike_times,
     _percentiles_block,
     _within_usv_validity,
@@ -225,6 +233,34 @@ def test_compute_behavioral_features_logic(mock_settings, mock_dependencies):
     assert mock_feature_zoo.return_value.save_behavioral_features_to_file.call_count == len(root_dirs)
 
 
+def test_compute_behavioral_features_batch_mode(mock_settings, mock_dependencies, mocker):
+    """
+    With `batch_n_jobs` other than 1 the features of every directory are
+    computed by one batch call; a directory whose features failed is reported
+    in the completion e-mail and skipped by the per-directory analyses.
+    """
+    mock_settings['analyses_booleans']['compute_behavioral_features_bool'] = True
+    mock_settings['analyses_booleans']['compute_neuronal_tuning_bool'] = True
+    mock_settings['compute_behavioral_features']['batch_n_jobs'] = 4
+    batch = mocker.patch('usv_playpen.analyses.analyze_data.save_behavioral_features_batch', return_value=[
+        {'root_directory': '/fake/dir1', 'status': 'ok', 'seconds': 1.0, 'error': None},
+        {'root_directory': '/fake/dir2', 'status': 'failed', 'seconds': 0.5,
+         'error': 'Traceback (most recent call last):\nRuntimeError: boom\n'},
+    ])
+
+    analyst = Analyst(input_parameter_dict=mock_settings, root_directories=['/fake/dir1', '/fake/dir2'])
+    analyst.analyze_data()
+
+    assert batch.call_args.kwargs['n_jobs'] == 4
+    assert mock_dependencies['FeatureZoo'].call_count == 0
+    assert mock_dependencies['NeuronalTuning'].call_count == 1
+    assert mock_dependencies['NeuronalTuning'].call_args.kwargs['root_directory'] == '/fake/dir1'
+
+    last_call = mock_dependencies['Messenger'].return_value.send_message.call_args_list[-1]
+    assert "failure(s)" in last_call.kwargs['subject']
+    assert "/fake/dir2: RuntimeError: boom" in last_call.kwargs['message']
+
+
 def test_compute_tuning_curves_logic(mock_settings, mock_dependencies):
     """
     Tests that `NeuronalTuning.calculate_neuronal_tuning_curves` is called when the flag is True.
@@ -662,6 +698,37 @@ def test_shuffle_spikes_seed_is_reproducible_and_varies():
     assert not np.array_equal(same_a, different)
 
 
+def test_circular_shift_null_counts_matches_direct_sh_counts():
+    """The FFT null engine must reproduce the direct engine's `sh_counts`
+    exactly for the same frame offsets -- including NaN / out-of-range frames,
+    repeated spike frames and offsets that wrap past the recording end."""
+    rng = np.random.default_rng(3)
+    n_frames, num_bins = 997, 12
+    feature = rng.uniform(-0.2, 1.2, n_frames)
+    feature[rng.choice(n_frames, 40, replace=False)] = np.nan
+    spikes = np.sort(rng.integers(0, n_frames, 600))
+    shuffle_kwargs = dict(n_shuffles=50, shuffle_min_fr=100, shuffle_max_fr=2 * n_frames, seed=7)
+
+    _, sh_direct, _, edges = generate_ratemaps(
+        feature_arr=feature,
+        spike_arr=spikes,
+        shuffled_spike_arr=shuffle_spikes(spike_array=spikes, total_fr_num=n_frames, **shuffle_kwargs),
+        min_val=0.0,
+        max_val=1.0,
+        num_bins=num_bins,
+        camera_fr=100,
+    )
+    sh_fft = circular_shift_null_counts(
+        frame_bin_idx=_frame_bin_indices(feature, edges),
+        spike_arr=spikes,
+        shuffle_offsets=_generate_shuffle_frame_offsets(**shuffle_kwargs),
+        num_bins=num_bins,
+    )
+    assert sh_fft.shape == sh_direct.shape
+    assert sh_fft.dtype == sh_direct.dtype
+    assert np.array_equal(sh_fft, sh_direct)
+
+
 def test_fit_log_gmm_recovers_two_modes():
     rng = np.random.default_rng(0)
     short = np.exp(rng.normal(loc=np.log(0.05), scale=0.1, size=300))
@@ -1728,7 +1795,7 @@ def synthetic_compute_session(tmp_path):
     return _make_synthetic_session(tmp_path)
 
 
-def _make_neuronal_tuning(root, *, n_shuffles=5, smoothing_sd=0.0):
+def _make_neuronal_tuning(root, *, n_shuffles=5, smoothing_sd=0.0, shuffle_null_engine="direct", n_jobs=1):
     """Construct a NeuronalTuning instance with small, fast settings."""
     return NeuronalTuning(
         root_directory=str(root),
@@ -1736,6 +1803,7 @@ def _make_neuronal_tuning(root, *, n_shuffles=5, smoothing_sd=0.0):
             "temporal_offsets": [0],
             "n_shuffles": n_shuffles,
             "shuffle_seed": 0,
+            "shuffle_null_engine": shuffle_null_engine,
             "total_bin_num": 10,
             "n_spatial_bins": 36,
             "spatial_scale_cm": 32,
@@ -1753,6 +1821,8 @@ def _make_neuronal_tuning(root, *, n_shuffles=5, smoothing_sd=0.0):
             "include_partner_vocalization_tuning_bool": False,
             "smoothing_sd": smoothing_sd,
             "circular_features": ["allo_yaw", "body_dir"],
+            "n_jobs": n_jobs,
+            "cluster_chunk_size": 2,
         },
         message_output=lambda *a, **k: None,
     )
@@ -1823,6 +1893,64 @@ def test_compute_one_cluster_behavioral_attaches_triage_stats(synthetic_compute_
         assert k in sp
 
 
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_compute_one_cluster_behavioral_fft_engine_matches_direct(synthetic_compute_session):
+    """Switching `shuffle_null_engine` to 'fft' must not change a single null statistic."""
+    root, cluster_path = synthetic_compute_session
+    partials = {}
+    for engine in ("direct", "fft"):
+        nt = _make_neuronal_tuning(root, smoothing_sd=1.0, shuffle_null_engine=engine)
+        partials[engine] = nt._compute_one_cluster_behavioral(cluster_path, nt._load_behavioral_inputs())
+    assert partials["fft"]["behavioral_metadata"]["shuffle_null_engine"] == "fft"
+    for column, payload in partials["direct"]["beh_offset=0s"].items():
+        for key, value in payload.items():
+            np.testing.assert_array_equal(partials["fft"]["beh_offset=0s"][column][key], value)
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_calculate_neuronal_tuning_curves_process_pool_matches_serial(tmp_path):
+    """`n_jobs` > 1 must write exactly the per-cluster pkls the serial path writes."""
+    payloads = {}
+    for n_jobs in (1, 2):
+        root, cluster_path = _make_synthetic_session(tmp_path / f"n_jobs_{n_jobs}")
+        rng = np.random.default_rng(1)
+        for cluster_idx in range(2, 5):
+            cluster_arr = np.load(cluster_path)
+            keep = np.sort(rng.choice(cluster_arr.shape[1], size=cluster_arr.shape[1] // cluster_idx, replace=False))
+            np.save(cluster_path.with_name(f"imec0_cl000{cluster_idx}_ch001_good.npy"), cluster_arr[:, keep])
+        _make_neuronal_tuning(root, n_jobs=n_jobs).calculate_neuronal_tuning_curves()
+        payloads[n_jobs] = {}
+        for pkl_path in sorted((root / "ephys" / "tuning_curves").glob("*.pkl")):
+            with pkl_path.open("rb") as fh:
+                payloads[n_jobs][pkl_path.name] = pickle.load(fh)
+
+    assert len(payloads[1]) == 4
+    assert payloads[2].keys() == payloads[1].keys()
+
+    def _assert_same(a, b, path=""):
+        if isinstance(a, dict):
+            assert a.keys() == b.keys(), path
+            for key in a:
+                if key not in ("generated_at", "session_root"):
+                    _assert_same(a[key], b[key], f"{path}/{key}")
+        elif isinstance(a, np.ndarray):
+            np.testing.assert_array_equal(a, b, err_msg=path)
+        elif isinstance(a, float) and np.isnan(a):
+            assert np.isnan(b), path
+        else:
+            assert a == b, path
+
+    for pkl_name, payload in payloads[1].items():
+        _assert_same(payload, payloads[2][pkl_name], pkl_name)
+
+
+def test_compute_one_cluster_behavioral_rejects_unknown_engine(synthetic_compute_session):
+    root, cluster_path = synthetic_compute_session
+    nt = _make_neuronal_tuning(root, shuffle_null_engine="bogus")
+    with pytest.raises(ValueError, match="shuffle_null_engine"):
+        nt._compute_one_cluster_behavioral(cluster_path, nt._load_behavioral_inputs())
+
+
 @pytest.mark.filterwarnings("ignore::RuntimeWarning")
 def test_compute_one_cluster_behavioral_with_smoothing(synthetic_compute_session):
     """With smoothing_sd > 0, smoothed payloads must be present."""
@@ -2785,6 +2913,9 @@ def test_feature_zoo_save_behavioral_features_end_to_end(tmp_path, mocker):
             "spatial_hist_min_val": -32,
             "spatial_hist_max_val": 32,
             "spatial_hist_num_bins": 196,
+            "plot_feature_distributions": True,
+            "feature_table_formats": ["csv", "parquet"],
+            "feature_table_float32": True,
         },
         message_output=lambda *_a, **_kw: None,
     )
@@ -2873,6 +3004,9 @@ def test_feature_zoo_save_behavioral_features_single_mouse_skips_social(tmp_path
             "spatial_hist_min_val": -32,
             "spatial_hist_max_val": 32,
             "spatial_hist_num_bins": 196,
+            "plot_feature_distributions": True,
+            "feature_table_formats": ["csv", "parquet"],
+            "feature_table_float32": True,
         },
         message_output=lambda *_a, **_kw: None,
     )
@@ -2888,6 +3022,109 @@ def test_feature_zoo_save_behavioral_features_single_mouse_skips_social(tmp_path
     )
 
 
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_feature_zoo_skips_distribution_pdf_when_disabled(tmp_path, mocker):
+    """With ``plot_feature_distributions`` off the feature table is still
+    written, but no distributions are computed and no PDF is rendered."""
+
+    video_dir = tmp_path / "video" / "vid1"
+    video_dir.mkdir(parents=True)
+    _build_behavioral_tracking_h5(video_dir / "vid1_points3d_translated_rotated_metric.h5", n_frames=120)
+
+    mocker.patch("usv_playpen.analyses.compute_behavioral_features.smart_wait")
+    distributions_spy = mocker.patch("usv_playpen.analyses.compute_behavioral_features.generate_feature_distributions")
+    fz = FeatureZoo(
+        root_directory=str(tmp_path),
+        behavioral_parameters_dict={
+            "head_points":      ["Head", "Ear_R", "Ear_L", "Nose"],
+            "tail_points":      ["TTI", "Tail_0", "Tail_1", "Tail_2", "TailTip"],
+            "back_root_points": ["Neck", "Trunk", "TTI"],
+            "derivative_bins":  10,
+            "speed_smoothing_time_window": 0.015,
+            "plot_feature_distributions": False,
+            "feature_table_formats": ["parquet"],
+            "feature_table_float32": True,
+        },
+        message_output=lambda *_a, **_kw: None,
+    )
+    plot_spy = mocker.patch.object(fz, "plot_feature_distributions")
+
+    fz.save_behavioral_features_to_file()
+
+    assert (video_dir / "vid1_points3d_translated_rotated_metric_behavioral_features.parquet").exists()
+    assert not list(video_dir.glob("*_histograms.pdf"))
+    distributions_spy.assert_not_called()
+    plot_spy.assert_not_called()
+
+
+def _fake_feature_zoo(root_directory, **_kwargs):
+    """FeatureZoo stand-in whose save fails for sessions named 'bad*'."""
+    zoo = MagicMock()
+    if pathlib.Path(root_directory).name.startswith("bad"):
+        zoo.save_behavioral_features_to_file.side_effect = RuntimeError("boom")
+    return zoo
+
+
+def test_save_behavioral_features_batch_reports_failures_and_continues(mocker):
+    """A failing session is reported with its traceback and the batch carries
+    on; reports come back once per session, in input order, with timings."""
+
+    feature_zoo = mocker.patch("usv_playpen.analyses.compute_behavioral_features.FeatureZoo",
+                               side_effect=_fake_feature_zoo)
+    messages = []
+
+    reports = save_behavioral_features_batch(
+        root_directories=["/fake/s1", "/fake/bad2", "/fake/s1", "/fake/s3"],
+        behavioral_parameters_dict={},
+        n_jobs=1,
+        message_output=messages.append,
+    )
+
+    assert [r["root_directory"] for r in reports] == ["/fake/s1", "/fake/bad2", "/fake/s3"]
+    assert [r["status"] for r in reports] == ["ok", "failed", "ok"]
+    assert "RuntimeError: boom" in reports[1]["error"]
+    assert reports[0]["error"] is None and all(r["seconds"] >= 0 for r in reports)
+    assert feature_zoo.call_count == 3
+    assert "2 of 3 session(s)" in messages[-1] and "1 failed" in messages[-1]
+
+
+def test_save_behavioral_features_batch_memory_budget_caps_workers(tmp_path, mocker):
+    """The session memory estimate follows the tracks shape, and a budget
+    that fits one session at a time runs the batch serially."""
+
+    session_roots = []
+    for session_name in ("s1", "s2"):
+        video_dir = tmp_path / session_name / "video" / "vid1"
+        video_dir.mkdir(parents=True)
+        _build_behavioral_tracking_h5(video_dir / "vid1_points3d_translated_rotated_metric.h5", n_frames=100)
+        session_roots.append(str(tmp_path / session_name))
+
+    session_gb = estimate_feature_session_memory_gb(session_roots[0])
+    values_per_frame = 2 * len(_BEH_NODES) * 3 + 2 * _WORKING_VALUES_PER_MOUSE + _WORKING_VALUES_PER_PAIR
+    assert session_gb == pytest.approx(2.0 * 100 * values_per_frame * 8 / 2 ** 30)
+
+    # A pool worker would not see this patch; the in-process run does.
+    feature_zoo = mocker.patch("usv_playpen.analyses.compute_behavioral_features.FeatureZoo",
+                               side_effect=_fake_feature_zoo)
+    reports = save_behavioral_features_batch(root_directories=session_roots, behavioral_parameters_dict={},
+                                             n_jobs=2, max_memory_gb=1.5 * session_gb,
+                                             message_output=lambda *_a: None)
+    assert [r["status"] for r in reports] == ["ok", "ok"]
+    assert feature_zoo.call_count == 2
+
+
+def test_save_behavioral_features_batch_pool_isolates_failures(tmp_path):
+    """In a process pool, sessions that raise come back as failed reports
+    instead of aborting the batch."""
+
+    missing = [str(tmp_path / "missing1"), str(tmp_path / "missing2")]
+    reports = save_behavioral_features_batch(root_directories=missing, behavioral_parameters_dict={},
+                                             n_jobs=2, message_output=lambda *_a: None)
+
+    assert [r["root_directory"] for r in reports] == missing
+    assert all(r["status"] == "failed" and "FileNotFoundError" in r["error"] for r in reports)
+
+
 # ---- calculate_sei --------------------------------------------------------
 
 
@@ -0,0 +1,134 @@
+"""
+@author: bartulem
+Unit tests for ``usv_playpen.analyses.behavioral_feature_table`` — the safe
+float32 downcast, the Parquet footer metadata, Parquet-over-CSV discovery,
+projected / frame-sliced scans, and the multi-session loader against
+per-session reads of mixed Parquet / CSV cohorts.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import polars as pls
+import pytest
+
+from usv_playpen.analyses.behavioral_feature_table import (
+    behavioral_feature_columns,
+    downcast_float_columns,
+    find_behavioral_feature_table,
+    load_behavioral_feature_sessions,
+    load_behavioral_features,
+    read_behavioral_feature_metadata,
+    write_behavioral_feature_table,
+)
+
+STEM = 'x_points3d_translated_rotated_metric_behavioral_features'
+
+
+def _feature_table(n_frames: int = 60, social: bool = True, seed: int = 0) -> pls.DataFrame:
+    rng = np.random.default_rng(seed)
+    columns = {'m1.spaceX': rng.normal(size=n_frames) * 20, 'm1.speed': np.abs(rng.normal(size=n_frames))}
+    if social:
+        columns['m1-m2.nose-nose'] = np.abs(rng.normal(size=n_frames)) * 10
+    columns['m1.speed'][0] = np.nan
+    return pls.DataFrame(columns)
+
+
+def _write_session(root, sess_id, df, formats):
+    video_dir = root / sess_id / 'video' / 'cam'
+    video_dir.mkdir(parents=True)
+    write_behavioral_feature_table(df, video_dir / STEM, formats=formats, session_metadata={'session_id': sess_id})
+    return root / sess_id
+
+
+def test_downcast_keeps_unsafe_columns_float64():
+    """Ordinary features go to float32; overflowing columns and large whole
+    numbers stay float64; non-float columns are untouched."""
+
+    df = pls.DataFrame({
+        'feature': [0.5, -1.25, np.nan],
+        'huge': [1e300, 0.0, 1.0],
+        'frame_count': [float(2 ** 24 + 1), 1.0, 2.0],
+        'label': [1, 2, 3],
+    })
+    out, downcast = downcast_float_columns(df)
+    assert downcast == ['feature']
+    assert out.schema['feature'] == pls.Float32
+    assert out.schema['huge'] == pls.Float64 and out.schema['frame_count'] == pls.Float64
+    assert out.schema['label'] == df.schema['label']
+
+
+def test_parquet_round_trip_footer_and_discovery(tmp_path):
+    """The Parquet table matches the CSV to float32 precision, carries the
+    session metadata in its footer, and is found ahead of the CSV."""
+
+    df = _feature_table()
+    session_root = _write_session(tmp_path, 's1', df, ['csv', 'parquet'])
+
+    table_path = find_behavioral_feature_table(session_root)
+    assert table_path.suffix == '.parquet'
+    assert read_behavioral_feature_metadata(table_path) == {'session_id': 's1'}
+    assert behavioral_feature_columns(table_path) == df.columns
+
+    parquet_df = load_behavioral_features(table_path)
+    csv_df = pls.read_csv(table_path.with_suffix('.csv'))
+    assert parquet_df.schema['m1.speed'] == pls.Float32
+    np.testing.assert_allclose(parquet_df.to_numpy(), csv_df.to_numpy(), rtol=1e-6, equal_nan=True)
+    assert not list(table_path.parent.glob('.*tmp*'))
+
+    table_path.unlink()
+    assert find_behavioral_feature_table(session_root).suffix == '.csv'
+    assert read_behavioral_feature_metadata(find_behavioral_feature_table(session_root)) == {}
+    with pytest.raises(FileNotFoundError):
+        find_behavioral_feature_table(tmp_path / 'missing')
+
+
+@pytest.mark.parametrize('formats', [['parquet'], ['csv']])
+def test_projection_and_frame_range_match_eager_slice(tmp_path, formats):
+    """A projected, frame-ranged scan equals slicing the full table, with the
+    frame index counted from the start of the session."""
+
+    df = _feature_table(n_frames=80)
+    table_path = find_behavioral_feature_table(_write_session(tmp_path, 's1', df, formats))
+    full = load_behavioral_features(table_path)
+
+    window = load_behavioral_features(table_path, columns=['m1-m2.nose-nose', 'm1.spaceX'],
+                                      frame_range=(10, 25), row_index_name='frame_index')
+    assert window.columns == ['frame_index', 'm1-m2.nose-nose', 'm1.spaceX']
+    assert window['frame_index'].to_list() == list(range(10, 25))
+    assert window.drop('frame_index').equals(full[10:25, ['m1-m2.nose-nose', 'm1.spaceX']])
+    assert load_behavioral_features(table_path, frame_range=(70, None)).height == 10
+
+
+def test_multi_session_scan_matches_per_session_reads(tmp_path):
+    """One multi-file load returns every session as its own read would, in
+    input order, across schema groups and legacy CSV sessions, and widens a
+    column that is float64 somewhere to float64 everywhere."""
+
+    tables = {
+        's_b': _feature_table(n_frames=40, seed=1),
+        's_a': _feature_table(n_frames=55, seed=2),
+        's_solo': _feature_table(n_frames=30, social=False, seed=3),
+        's_csv': _feature_table(n_frames=20, seed=4),
+    }
+    paths = {}
+    for sess_id, df in tables.items():
+        formats = ['csv'] if sess_id == 's_csv' else ['parquet']
+        paths[sess_id] = find_behavioral_feature_table(_write_session(tmp_path, sess_id, df, formats))
+
+    loaded = load_behavioral_feature_sessions(paths)
+    assert list(loaded) == list(paths)
+    assert loaded['s_solo'].columns == ['m1.spaceX', 'm1.speed']
+    for sess_id, df in loaded.items():
+        assert df.schema['m1.speed'] == pls.Float64
+        np.testing.assert_allclose(df.to_numpy(), tables[sess_id].to_numpy(), rtol=1e-6, equal_nan=True)
+
+    projected = load_behavioral_feature_sessions(paths, columns=['m1-m2.nose-nose', 'm1.speed'])
+    assert projected['s_a'].columns == ['m1-m2.nose-nose', 'm1.speed']
+    assert projected['s_solo'].columns == ['m1.speed']
+    assert projected['s_b'].equals(loaded['s_b'].select(['m1-m2.nose-nose', 'm1.speed']))
+
+
+def test_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError, match='feature_table_formats'):
+        write_behavioral_feature_table(_feature_table(), tmp_path / STEM, formats=['feather'])
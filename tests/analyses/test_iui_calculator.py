@@ -80,6 +80,8 @@ def _make_settings(tmp_path, fit_mixture_model=False):
             "bootstrap_lrt_n_subsample": 50,
             "bootstrap_lrt_alpha": 0.05,
             "bootstrap_lrt_bonferroni": True,
+            "mixture_em_engine": "batched",
+            "mixture_em_n_jobs": 1,
         }
     }
 
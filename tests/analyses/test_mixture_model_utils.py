@@ -8,7 +8,8 @@ fixed-point mode finder in :func:`gmm_modes`, the 1D Newton gradient-fallback
 step, the linear/negative-discriminant branches of
 :func:`gmm_boundaries_logspace`, the degrees-of-freedom solver fallback in
 :func:`_t_update_nu`, the empty-component skip in :func:`_sample_from_mixture`,
-and the Student-t dispatch / progress-callback paths of :func:`bootstrap_lrt`.
+the Student-t dispatch / progress-callback paths of :func:`bootstrap_lrt`,
+and the batched EM engine against the serial fits it replaces.
 
 Conventions mirror ``tests/analyses/test_analyze.py``: headless matplotlib,
 seeded ``numpy`` RNG, sklearn ``GaussianMixture`` fixtures built from synthetic
@@ -33,8 +34,13 @@ from usv_playpen.analyses.mixture_model_utils import (
     _sample_from_mixture,
     _t_update_nu,
     bootstrap_lrt,
+    fit_log_gmm,
+    fit_log_mixtures_batched,
+    fit_log_t_mixture,
     gmm_boundaries_logspace,
+    gmm_cv_neg_loglik,
     gmm_modes,
+    t_mixture_cv_neg_loglik,
 )
 
 
@@ -419,3 +425,83 @@ def test_bootstrap_lrt_gauss_dispatch_no_callback():
     assert result["model_class"] == "gauss"
     assert result["lr_null"].shape == (3,)
     assert math.isfinite(result["lr_obs"])
+
+
+def _two_regime_intervals(seed, n_short, n_long):
+    """Strictly positive intervals from a short / long log-normal pair."""
+    rng = np.random.default_rng(seed)
+    return np.exp(np.concatenate([rng.normal(np.log(0.05), 0.3, n_short),
+                                  rng.normal(np.log(1.0), 0.5, n_long)]))
+
+
+@pytest.mark.parametrize("model_class", ["gauss", "t"])
+def test_fit_log_mixtures_batched_matches_serial_fits(model_class):
+    """
+    Fitting ragged datasets with :func:`fit_log_mixtures_batched` must give
+    the same per-dataset log-likelihood as :func:`fit_log_gmm` /
+    :func:`fit_log_t_mixture` with the same seeds and restarts: both start
+    from identical KMeans initialisations and stop at the same iteration.
+    """
+    datasets = [_two_regime_intervals(seed, n, n // 2) for seed, n in ((0, 200), (1, 350), (2, 500))]
+    seeds = [3, 4, 5]
+    serial_fn = fit_log_gmm if model_class == "gauss" else fit_log_t_mixture
+
+    fits = fit_log_mixtures_batched(datasets, 2, seeds=seeds, model_class=model_class, n_init=3)
+
+    for (model, order), x, seed in zip(fits, datasets, seeds):
+        ref, ref_order = serial_fn(x, 2, seed=seed, n_init=3)
+        log_x = np.log(x).reshape(-1, 1)
+        assert model.score(log_x) == pytest.approx(ref.score(log_x), rel=1e-8)
+        np.testing.assert_allclose(model.means_.flatten()[order], ref.means_.flatten()[ref_order], rtol=1e-6)
+        assert model.bic(log_x) == pytest.approx(ref.bic(log_x), rel=1e-8)
+
+
+@pytest.mark.parametrize("cv_fn", [gmm_cv_neg_loglik, t_mixture_cv_neg_loglik])
+def test_cv_neg_loglik_batched_engine_matches_serial(cv_fn):
+    """
+    The batched CV path fits the (unequal-size) training folds together
+    through the sample mask and must reproduce the serial deviance, including
+    the ``inf`` short-data return.
+    """
+    intervals = _two_regime_intervals(7, 151, 80)
+    serial = cv_fn(intervals, n_components=2, seed=1, n_folds=4, n_init=2)
+    batched = cv_fn(intervals, n_components=2, seed=1, n_folds=4, n_init=2, engine="batched")
+    assert batched == pytest.approx(serial, rel=1e-8)
+    assert cv_fn(intervals[:6], n_components=5, seed=0, n_folds=5, engine="batched") == float("inf")
+
+
+@pytest.mark.parametrize("model_class", ["gauss", "t"])
+def test_bootstrap_lrt_batched_engine_matches_serial(model_class):
+    """
+    The batched bootstrap draws the same synthetic datasets in the same order
+    and refits them from the same initialisations, so its null distribution
+    matches the serial one replicate by replicate.
+    """
+    intervals = _two_regime_intervals(11, 150, 100)
+    kwargs = dict(K_null=1, K_alt=2, B=4, n_subsample=200, model_class=model_class,
+                  n_init_obs=2, n_init_boot=2, seed=3)
+    serial = bootstrap_lrt(intervals, **kwargs)
+    progress = MagicMock()
+    batched = bootstrap_lrt(intervals, engine="batched", message_output=progress, **kwargs)
+
+    assert batched["lr_obs"] == serial["lr_obs"]
+    np.testing.assert_allclose(batched["lr_null"], serial["lr_null"], rtol=1e-6, atol=1e-6)
+    assert batched["p_value"] == serial["p_value"]
+    assert progress.call_count == 2
+
+
+def test_fit_log_mixtures_batched_chunks_and_rejects_unknown_class():
+    """
+    A tiny memory cap splits the problems into many batches without changing
+    the result; an unknown model class raises.
+    """
+    datasets = [_two_regime_intervals(seed, 120, 60) for seed in range(3)]
+    whole = fit_log_mixtures_batched(datasets, 2, seeds=[0, 1, 2], model_class="gauss", n_init=2)
+    chunked = fit_log_mixtures_batched(datasets, 2, seeds=[0, 1, 2], model_class="gauss", n_init=2,
+                                       max_batch_mb=1e-6)
+    for (a, _), (b, _) in zip(whole, chunked):
+        np.testing.assert_allclose(a.means_, b.means_)
+        assert a.lower_bound_ == b.lower_bound_
+
+    with pytest.raises(ValueError, match="model_class"):
+        fit_log_mixtures_batched(datasets, 2, model_class="laplace")
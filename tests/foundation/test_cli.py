@@ -3,6 +3,9 @@
 Test CLI.
 """
 
+import json
+import pathlib
+
 import pytest
 from click.testing import CliRunner
 
@@ -92,6 +95,23 @@ def test_generate_rm_files_cli_success(runner, mocker, tmp_path):
     mock_tuning.assert_called_once()
     mock_tuning.return_value.calculate_neuronal_tuning_curves.assert_called_once()
 
+def test_generate_rm_files_cli_n_jobs_targets_tuning_block(runner, mocker, tmp_path):
+    """
+    Tests that '--n-jobs' is applied to the tuning block without an
+    ambiguity warning, although 'n_jobs' also occurs in other blocks.
+    """
+
+    mock_tuning = mocker.patch('usv_playpen.analyses.analyze_data.NeuronalTuning')
+
+    result = runner.invoke(generate_rm_files_cli, [
+        '--root-directory', str(tmp_path),
+        '--n-jobs', '4'
+    ])
+
+    assert result.exit_code == 0, f"CLI failed: {result.output}"
+    assert 'ambiguous' not in result.output
+    assert mock_tuning.call_args.kwargs['tuning_parameters_dict']['n_jobs'] == 4
+
 def test_visualize_3d_data_cli_success(runner, mocker, tmp_path):
     """
     Tests that the 'generate-viz' command successfully calls the
@@ -196,9 +216,14 @@ def test_crop_wav_cli_success(runner, mocker, tmp_path):
     """
 
     mock_synchronizer = mocker.patch('usv_playpen.processing.preprocess_data.Synchronizer')
+    # the step runs through the pipeline scheduler, which declares every
+    # session step from the full processing settings
+    settings_path = pathlib.Path(__file__).parents[2] / 'src/usv_playpen/_parameter_settings/processing_settings.json'
+    with settings_path.open() as settings_file:
+        processing_settings = json.load(settings_file)
     mocker.patch(
         'usv_playpen.processing.preprocess_data.modify_settings_json_for_cli',
-        return_value={'synchronize_files': {'Synchronizer': {}}}
+        return_value=processing_settings
     )
 
     result = runner.invoke(crop_wav_files_to_video_cli, [
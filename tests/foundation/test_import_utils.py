@@ -0,0 +1,162 @@
+"""
+@author: bartulem
+Test import_utils module and entry-point import times.
+"""
+
+from __future__ import annotations
+
+import collections
+import os
+import subprocess
+import sys
+import tomllib
+from pathlib import Path
+
+import pytest
+
+from usv_playpen.import_utils import lazy_exports
+
+PYPROJECT_PATH = Path(__file__).resolve().parents[2] / 'pyproject.toml'
+
+# Console-script modules that load a heavy stack on import by design, with the reason.
+HEAVY_ENTRY_MODULES = {
+    'usv_playpen.analyses.build_naturalistic_usv_repository':
+        'reads sessions through the polars-based _usv_io and inter-USV interval helpers it shares with the analyses',
+    'usv_playpen.neuropixels.sglx_meta_to_coords':
+        'standalone SpikeGLX tool whose main opens a Qt / matplotlib probe-layout window',
+    'usv_playpen.visualizations.make_usv_spectrograms':
+        'plotting module; librosa, matplotlib and polars are used throughout its figure builders',
+    'usv_playpen.visualizations.qlvm_torus_traversal_video':
+        'selects the Agg backend and applies the shared plot style when imported',
+}
+
+
+def _console_script_modules() -> list[str]:
+    with PYPROJECT_PATH.open('rb') as pyproject_file:
+        scripts = tomllib.load(pyproject_file)['project']['scripts']
+    return sorted({target.split(':')[0] for target in scripts.values()})
+
+
+# Every module behind a console script must start light, unless exempted above.
+LAZY_ENTRY_MODULES = tuple(module_name for module_name in _console_script_modules()
+                           if module_name not in HEAVY_ENTRY_MODULES)
+
+# Modules no entry module may import before a command needs them.
+HEAVY_MODULES = ('librosa', 'numba', 'spikeinterface', 'polars', 'matplotlib', 'torch', 'cv2')
+
+# Startup budget (s) for importing one entry module in a fresh interpreter;
+# override with USV_PLAYPEN_IMPORT_BUDGET_S on slow (e.g., network) file systems.
+IMPORT_TIME_BUDGET_S = float(os.environ.get('USV_PLAYPEN_IMPORT_BUDGET_S', '3.0'))
+
+
+def _fake_module_globals() -> dict:
+    return {'__name__': 'fake_module', '__package__': None}
+
+
+def test_lazy_exports_resolves_and_binds_on_first_access():
+    """
+    Description
+    -----------
+    The module ``__getattr__`` imports an exported name on first access and
+    binds it in the module namespace; unknown names raise AttributeError.
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    None
+    """
+
+    module_globals = _fake_module_globals()
+    module_getattr, _ = lazy_exports(module_globals, {'OrderedDict': 'collections'})
+
+    assert 'OrderedDict' not in module_globals
+    assert module_getattr('OrderedDict') is collections.OrderedDict
+    assert module_globals['OrderedDict'] is collections.OrderedDict
+
+    with pytest.raises(AttributeError, match="has no attribute 'Counter'"):
+        module_getattr('Counter')
+
+
+def test_lazy_exports_load_keeps_existing_bindings():
+    """
+    Description
+    -----------
+    ``load`` binds only names that are not bound yet, so a name patched on
+    the module (as ``mock.patch`` does) is left in place.
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    None
+    """
+
+    module_globals = _fake_module_globals()
+    _, load = lazy_exports(module_globals, {'OrderedDict': 'collections', 'Counter': 'collections'})
+
+    patched = object()
+    module_globals['Counter'] = patched
+    load('Counter')
+    assert module_globals['Counter'] is patched
+    assert 'OrderedDict' not in module_globals
+
+    load()
+    assert module_globals['OrderedDict'] is collections.OrderedDict
+    assert module_globals['Counter'] is patched
+
+
+def test_heavy_entry_exemptions_name_console_scripts():
+    """
+    Description
+    -----------
+    Every exemption from the light-import check still names a module behind
+    a console script, so a removed or renamed script drops its exemption.
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    None
+    """
+
+    assert set(HEAVY_ENTRY_MODULES) <= set(_console_script_modules())
+
+
+@pytest.mark.parametrize('module_name', LAZY_ENTRY_MODULES)
+def test_entry_module_import_stays_light(module_name):
+    """
+    Description
+    -----------
+    Importing a console-script module in a fresh interpreter (what every
+    console script does before parsing ``--help``) must not pull in any of
+    the heavy scientific stacks, and must stay within the startup budget as
+    measured by ``python -X importtime``.
+
+    Parameters
+    ----------
+    module_name (str)
+        Console-script module to import.
+
+    Returns
+    -------
+    None
+    """
+
+    probe = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         f"import sys, {module_name}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"],
+        capture_output=True, text=True, check=True,
+    )
+
+    assert probe.stdout.strip() == '', f"{module_name} imports {probe.stdout.strip()} at import time"
+
+    # '-X importtime' lines read 'import time: <self us> | <cumulative us> | <module>'
+    cumulative_us = next(int(line.split('|')[1])
+                         for line in probe.stderr.splitlines()
+                         if line.startswith('import time:') and line.split('|')[-1].strip() == module_name)
+    assert cumulative_us / 1e6 <= IMPORT_TIME_BUDGET_S, \
+        f"importing {module_name} took {cumulative_us / 1e6:.2f} s (budget {IMPORT_TIME_BUDGET_S:.2f} s)"
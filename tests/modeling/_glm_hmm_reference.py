@@ -0,0 +1,126 @@
+"""
+@author: bartulem
+Reference forward-backward for the GLM-HMM test-suite (and the benchmark in
+``benchmarks/glm_hmm_forward_backward.py``).
+
+Not a test file (the leading underscore keeps it out of pytest's collection).
+`forward_backward_reference` is the per-sequence numpy recursion `GLMHMM` ran
+before the compiled kernel `glm_hmm._batched_forward_backward`, kept as the
+correctness oracle; `synthetic_hmm_inputs` draws random kernel inputs.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from usv_playpen.modeling.glm_hmm import _logsumexp
+
+
+def forward_backward_reference(log_pi: np.ndarray, log_A: np.ndarray, log_B: np.ndarray,
+                               log_A_seq: np.ndarray | None = None,
+                               return_full_xi: bool = False) -> tuple:
+    """
+    Description
+    -----------
+    The numpy log-space forward-backward for one sequence, exactly as
+    `GLMHMM._forward_backward` ran it before the compiled batch kernel: Python
+    loops over timesteps, one `_logsumexp` per ``(K, K)`` reduction.
+
+    Parameters
+    ----------
+    log_pi (np.ndarray)
+        ``(K,)`` log initial-state distribution.
+    log_A (np.ndarray)
+        ``(K, K)`` stationary log transition matrix (used when ``log_A_seq`` is None).
+    log_B (np.ndarray)
+        ``(T, K)`` per-timestep, per-state emission log-density.
+    log_A_seq (np.ndarray)
+        ``(T, K, K)`` per-timestep log transition tensor (``[0]`` unused), or None.
+    return_full_xi (bool)
+        Return the ``(T - 1, K, K)`` per-transition responsibilities instead of
+        their sum.
+
+    Returns
+    -------
+    gamma (np.ndarray)
+        ``(T, K)`` posterior state responsibilities.
+    xi (np.ndarray)
+        ``(K, K)`` summed (or ``(T - 1, K, K)`` full) transition responsibilities.
+    gamma0 (np.ndarray)
+        ``(K,)`` posterior over the first state.
+    seq_loglik (float)
+        The sequence marginal log-likelihood.
+    """
+    n_time, n_states = log_B.shape
+
+    def log_A_into(t: int) -> np.ndarray:
+        """Log transition matrix used for the step landing at timestep ``t``."""
+        return log_A if log_A_seq is None else log_A_seq[t]
+
+    log_alpha = np.empty((n_time, n_states))
+    log_alpha[0] = log_pi + log_B[0]
+    for t in range(1, n_time):
+        log_alpha[t] = log_B[t] + _logsumexp(log_alpha[t - 1][:, None] + log_A_into(t), axis=0)
+    seq_loglik = float(_logsumexp(log_alpha[-1], axis=0))
+
+    log_beta = np.zeros((n_time, n_states))
+    for t in range(n_time - 2, -1, -1):
+        log_beta[t] = _logsumexp(
+            log_A_into(t + 1) + (log_B[t + 1] + log_beta[t + 1])[None, :], axis=1)
+
+    gamma = np.exp(log_alpha + log_beta - seq_loglik)
+
+    if return_full_xi:
+        xi = np.empty((max(n_time - 1, 0), n_states, n_states))
+        for t in range(n_time - 1):
+            xi[t] = np.exp(log_alpha[t][:, None] + log_A_into(t + 1)
+                           + (log_B[t + 1] + log_beta[t + 1])[None, :] - seq_loglik)
+    else:
+        xi = np.zeros((n_states, n_states))
+        for t in range(n_time - 1):
+            xi += np.exp(log_alpha[t][:, None] + log_A_into(t + 1)
+                         + (log_B[t + 1] + log_beta[t + 1])[None, :] - seq_loglik)
+    return gamma, xi, gamma[0], seq_loglik
+
+
+def synthetic_hmm_inputs(seq_lengths: list, n_states: int, input_driven: bool = False,
+                         random_state: int = 0) -> tuple:
+    """
+    Description
+    -----------
+    Random forward-backward inputs for a batch of sequences: a Dirichlet initial
+    state, a sticky stationary transition matrix (or, when ``input_driven``, a
+    random per-timestep row-stochastic tensor) and Gaussian emission
+    log-densities.
+
+    Parameters
+    ----------
+    seq_lengths (list)
+        Length of every sequence in the batch.
+    n_states (int)
+        Number of latent states ``K``.
+    input_driven (bool)
+        Draw a per-timestep transition tensor instead of a stationary matrix.
+    random_state (int)
+        Seed of the generator.
+
+    Returns
+    -------
+    log_pi (np.ndarray), log_A (np.ndarray), log_B (np.ndarray), offsets (np.ndarray)
+        ``(K,)``; ``(1, K, K)`` or ``(N, K, K)``; ``(N, K)``; ``(S + 1,)``, with the
+        sequences laid end to end as the compiled kernel expects.
+    """
+    rng = np.random.default_rng(random_state)
+    offsets = np.concatenate(([0], np.cumsum(seq_lengths))).astype(np.int64)
+    n_total = int(offsets[-1])
+    log_pi = np.log(rng.dirichlet(np.ones(n_states)))
+    if input_driven:
+        logits = rng.standard_normal((n_total, n_states, n_states)) + 2.0 * np.eye(n_states)
+        log_A = logits - _logsumexp(logits, axis=2)[:, :, None]
+    else:
+        stay = 0.9
+        A = np.full((n_states, n_states), (1.0 - stay) / max(n_states - 1, 1))
+        np.fill_diagonal(A, stay)
+        log_A = np.log(A)[None]
+    log_B = -0.5 * rng.standard_normal((n_total, n_states)) ** 2 - rng.uniform(0.0, 3.0, n_states)
+    return log_pi, log_A, log_B, offsets
@@ -503,6 +503,8 @@ def build_modeling_settings(
         construction never spawns matplotlib figures.
       - ``diagnostics``: collinearity / timescale audits left off (the input
         extraction still invokes the audit wrapper, which no-ops cleanly).
+      - ``hyperparameters.jax_compilation.persistent_cache_bool`` -> ``False``
+        so test runs never write XLA executables outside ``tmp_path``.
 
     Parameters
     ----------
@@ -615,6 +617,8 @@ def build_modeling_settings(
         if 'plot_bool' in basis_cfg:
             basis_cfg['plot_bool'] = False
 
+    settings['hyperparameters']['jax_compilation']['persistent_cache_bool'] = False
+
     return settings
 
 
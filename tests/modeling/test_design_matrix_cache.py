@@ -0,0 +1,114 @@
+"""
+@author: bartulem
+Unit tests for ``usv_playpen.modeling.design_matrix_cache`` — assembled
+designs against ``get_unrolled_X_for_multivariate`` and the basis-projected
+hstack, hit / miss / eviction accounting under the memory cap, and the
+entries a pickled cache carries to a worker process.
+"""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+from usv_playpen.modeling.design_matrix_cache import DesignMatrixCache
+from usv_playpen.modeling.model_selection import get_unrolled_X_for_multivariate
+
+HISTORY_FRAMES = 6
+FEATURES = ['self.speed', 'other.speed', 'allo/nose-nose']
+
+
+def _feature_rows() -> dict:
+    rng = np.random.default_rng(0)
+    return {feat: rng.normal(size=(9, HISTORY_FRAMES)) for feat in FEATURES}
+
+
+def test_design_matches_unrolled_and_counts_hits():
+    """The assembled design is byte-identical to the unrolled list, and a
+    second candidate only builds its own column."""
+
+    rows = _feature_rows()
+    built = []
+
+    def build_fn(feat):
+        built.append(feat)
+        return rows[feat]
+
+    cache = DesignMatrixCache(HISTORY_FRAMES)
+    first = cache.design((0, 'train'), FEATURES[:2], build_fn)
+    np.testing.assert_array_equal(
+        first, get_unrolled_X_for_multivariate([rows[f] for f in FEATURES[:2]], HISTORY_FRAMES))
+    assert first.dtype == np.float32
+
+    start = cache.snapshot()
+    second = cache.design((0, 'train'), [FEATURES[0], FEATURES[2]], build_fn)
+    np.testing.assert_array_equal(
+        second, get_unrolled_X_for_multivariate([rows[FEATURES[0]], rows[FEATURES[2]]], HISTORY_FRAMES))
+    assert built == FEATURES
+    # Feature 0 and the fold's time column hit; feature 2 misses.
+    assert cache.since(start) == {'hits': 2, 'misses': 1, 'evictions': 0}
+
+    labels = np.array([1.0, 0.0, 1.0])
+    np.testing.assert_array_equal(cache.repeated_labels((0, 'train'), labels), np.repeat(labels, HISTORY_FRAMES))
+
+
+def test_projected_matches_hstack():
+    """Basis-projected designs equal the per-feature projections hstacked."""
+
+    rows = _feature_rows()
+    basis = np.random.default_rng(1).normal(size=(HISTORY_FRAMES, 3))
+    cache = DesignMatrixCache(HISTORY_FRAMES)
+
+    projected = cache.projected((1, 'test'), FEATURES, rows.__getitem__, basis)
+    np.testing.assert_array_equal(projected, np.hstack([np.dot(rows[f], basis) for f in FEATURES]))
+    assert cache.misses == len(FEATURES)
+
+
+def test_lru_cap_evicts_least_recently_used():
+    """Past the cap the oldest block is dropped and rebuilt on its next use;
+    a zero cap caches nothing."""
+
+    rows = _feature_rows()
+    column_bytes = 9 * HISTORY_FRAMES * 4
+    cache = DesignMatrixCache(HISTORY_FRAMES, max_memory_gb=2.5 * column_bytes / 2 ** 30)
+    for feat in FEATURES:
+        cache.get(((0, 'train'), feat), lambda feat=feat: rows[feat].ravel().astype(np.float32))
+    assert cache.evictions == 1
+    report = cache.step_report(cache.snapshot())
+    assert report['n_entries'] == 2 and report['cached_mb'] * 2 ** 20 == 2 * column_bytes
+
+    cache.get(((0, 'train'), FEATURES[0]), lambda: rows[FEATURES[0]].ravel().astype(np.float32))
+    assert cache.misses == 4
+
+    disabled = DesignMatrixCache(HISTORY_FRAMES, max_memory_gb=0)
+    disabled.design((0, 'train'), FEATURES, rows.__getitem__)
+    disabled.design((0, 'train'), FEATURES, rows.__getitem__)
+    assert disabled.hits == 0 and disabled.step_report(disabled.snapshot())['n_entries'] == 0
+
+
+def test_pickled_cache_carries_only_shared_blocks():
+    """A worker copy holds the step's shared base columns, not the rest."""
+
+    rows = _feature_rows()
+    cache = DesignMatrixCache(HISTORY_FRAMES)
+    cache.design((0, 'train'), FEATURES, rows.__getitem__)
+    cache.share({(0, 'train'): rows.__getitem__}, FEATURES[:1])
+
+    worker_copy = pickle.loads(pickle.dumps(cache))
+    start = worker_copy.snapshot()
+    worker_copy.design((0, 'train'), FEATURES[:2], rows.__getitem__)
+    assert worker_copy.since(start) == {'hits': 2, 'misses': 1, 'evictions': 0}
+
+
+def test_from_settings_and_frame_check():
+    """The settings block sets the cap; wrong window lengths raise."""
+
+    cache = DesignMatrixCache.from_settings({'hyperparameters': {'design_matrix_cache': {'max_memory_gb': 0.5}}},
+                                            HISTORY_FRAMES)
+    assert cache.max_bytes == 2 ** 29
+    assert DesignMatrixCache.from_settings({'hyperparameters': {}}, HISTORY_FRAMES).max_bytes == 4 * 2 ** 30
+
+    with pytest.raises(ValueError, match='Frame mismatch'):
+        cache.design((0, 'train'), ['self.speed'], lambda feat: np.zeros((4, HISTORY_FRAMES + 1)))
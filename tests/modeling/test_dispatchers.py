@@ -453,6 +453,9 @@ class TestDispatchUnivariate:
         with written[0].open('rb') as fh:
             payload = pickle.load(fh)
         assert payload['self.speed'] == {'r2': 0.9}
+        # JAX tasks record the compile / run split of the job.
+        assert set(payload['_run_metadata']['jax_compile_profile']) >= {
+            'wall_s', 'compile_s', 'run_s', 'cache_hits', 'cache_misses'}
 
     def test_pipeline_exception_is_caught(self, tmp_path, mocker, capsys):
         """An exception raised inside the modeling block is caught,
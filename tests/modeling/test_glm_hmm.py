@@ -32,6 +32,7 @@ with warnings.catch_warnings():
         InputDrivenManifoldGLMHMM,
         ManifoldEmission,
         MultinomialEmission,
+        _batched_forward_backward,
         resolve_emission_cls,
     )
     from usv_playpen.modeling.jax_multinomial_logistic_regression import (
@@ -48,6 +49,8 @@ with warnings.catch_warnings():
         _fit_von_mises_kappa,
     )
 
+from ._glm_hmm_reference import forward_backward_reference, synthetic_hmm_inputs
+
 REPO_SETTINGS = pathlib.Path(__file__).resolve().parents[2] / \
     "src" / "usv_playpen" / "_parameter_settings" / "modeling_settings.json"
 
@@ -161,6 +164,55 @@ def test_bic_prefers_true_state_count_over_one():
     assert bics[2] < bics[1]
 
 
+@pytest.mark.parametrize('input_driven', [False, True])
+def test_batched_forward_backward_matches_numpy_reference(input_driven):
+    """The compiled ragged-batch kernel reproduces the numpy recursion per sequence:
+    matching marginal log-likelihoods, gamma and xi, forward-only agrees."""
+    lengths = [1, 37, 5, 120]
+    log_pi, log_A, log_B, offsets = synthetic_hmm_inputs(
+        lengths, 3, input_driven=input_driven, random_state=1)
+    seq_loglik, gamma, xi_sum, xi_steps = _batched_forward_backward(
+        log_pi, log_A, log_B, offsets, True, input_driven)
+    assert xi_steps.shape[0] == (sum(lengths) - len(lengths) if input_driven else 0)
+    forward_only = _batched_forward_backward(log_pi, log_A, log_B, offsets, False, input_driven)[0]
+    assert np.array_equal(forward_only, seq_loglik)
+
+    cursor_tr = 0
+    for s, (begin, end) in enumerate(zip(offsets[:-1], offsets[1:])):
+        gamma_ref, xi_ref, _, loglik_ref = forward_backward_reference(
+            log_pi, log_A[0], log_B[begin:end],
+            log_A[begin:end] if input_driven else None, return_full_xi=input_driven)
+        np.testing.assert_allclose(seq_loglik[s], loglik_ref, rtol=1e-12)
+        assert np.allclose(gamma[begin:end], gamma_ref, rtol=1e-12, atol=1e-15)
+        if input_driven:
+            n_trans = end - begin - 1
+            assert np.allclose(xi_steps[cursor_tr:cursor_tr + n_trans], xi_ref, rtol=1e-12, atol=1e-15)
+            cursor_tr += n_trans
+        else:
+            assert np.allclose(xi_sum[s], xi_ref, rtol=1e-12, atol=1e-15)
+
+
+def test_glmhmm_parallel_restarts_match_serial():
+    """Restarts spread over worker processes keep the serial fit: same kept restart,
+    same parameters, same held-out score."""
+    rng = np.random.default_rng(4)
+    true_means = np.array([[0.0, 0.0], [4.0, 4.0]])
+    transition = np.array([[0.9, 0.1], [0.1, 0.9]])
+    sequences = []
+    for states in _simulate_markov_states(4, 60, transition, rng):
+        y = true_means[states] + 0.6 * rng.standard_normal((states.shape[0], 2))
+        sequences.append((np.zeros((states.shape[0], 1)), y))
+
+    fits = [GLMHMM(2, lambda: GaussianEmission(n_targets=2), n_em_iters=40, n_restarts=3,
+                   random_state=0, n_jobs=n_jobs).fit(sequences) for n_jobs in (1, 2)]
+    serial, parallel = fits
+    assert parallel.log_likelihood_ == serial.log_likelihood_
+    assert parallel.n_iter_ == serial.n_iter_
+    assert np.array_equal(parallel.log_A_, serial.log_A_)
+    assert np.array_equal(parallel.log_pi_, serial.log_pi_)
+    assert parallel.log_likelihood(sequences) == serial.log_likelihood(sequences)
+
+
 # Manifold (torus vM) emission integration
 def test_manifold_emission_separates_two_torus_states():
     """
@@ -283,6 +283,54 @@ class TestLaxLoopPath:
         assert model.n_iter_ < 600
 
 
+class TestRegularizationGrid:
+
+    @pytest.mark.parametrize('use_lax_loop', [True, False])
+    def test_grid_fits_match_individual_fits(self, use_lax_loop):
+        """Every estimator returned by ``fit_regularization_grid`` matches a
+        ``fit`` on its fold's rows with the same ``(lambda_smooth, l2_reg)``,
+        weights, seed and loop path, up to float32 rounding, and stops at the
+        same iteration (the two paths check convergence one step apart)."""
+
+        X, y = _make_linear_2d(n_samples=150, n_inputs=4)
+        sw = np.random.default_rng(4).uniform(0.5, 2.0, size=150)
+        train_masks = np.stack([np.arange(150) % 3 != k for k in range(3)])
+        lambda_grid, l2_grid = np.array([0.0, 1.0]), np.array([1e-3, 1e-1])
+        kwargs = _fit_kwargs(X.shape[1])
+        kwargs.update(max_iter=400, tol=1e-3, _use_lax_loop=use_lax_loop)
+
+        fits = SmoothBivariateRegression(**kwargs).fit_regularization_grid(
+            X, y, train_masks, sw,
+            lambda_smooth_grid=lambda_grid, l2_reg_grid=l2_grid,
+            random_states=[0, 1, 2],
+        )
+
+        assert len(fits) == 3 and all(len(fold) == 4 for fold in fits)
+        pairs = [(a, b) for a in lambda_grid for b in l2_grid]
+        for fold_idx, mask in enumerate(train_masks):
+            for pair_idx, (lam_sm, lam_l2) in enumerate(pairs):
+                grid_model = fits[fold_idx][pair_idx]
+                assert grid_model.random_state == fold_idx
+                single_kwargs = dict(kwargs, lambda_smooth=lam_sm, l2_reg=lam_l2, random_state=fold_idx)
+                single = SmoothBivariateRegression(**single_kwargs).fit(
+                    X[mask], y[mask], sample_weight=sw[mask])
+                np.testing.assert_allclose(grid_model.coef_, single.coef_, atol=1e-4, rtol=1e-3)
+                np.testing.assert_allclose(grid_model.intercept_, single.intercept_, atol=1e-4, rtol=1e-3)
+                assert grid_model.n_iter_ == single.n_iter_
+                np.testing.assert_allclose(grid_model.predict(X, snap=False),
+                                           single.predict(X, snap=False), atol=1e-3)
+
+    def test_mask_shape_mismatch_raises(self):
+        """Training masks must have one column per row of ``X``."""
+
+        X, y = _make_linear_2d(n_samples=60)
+        with pytest.raises(ValueError, match="train_masks"):
+            SmoothBivariateRegression(**_fit_kwargs(X.shape[1])).fit_regularization_grid(
+                X, y, np.ones((2, 59), dtype=bool),
+                lambda_smooth_grid=np.array([1.0]), l2_reg_grid=np.array([0.1]),
+            )
+
+
 class TestTorusMetric:
 
     def test_torus_fit_predict_evaluate(self):
@@ -0,0 +1,118 @@
+"""
+@author: bartulem
+Unit tests for ``usv_playpen.modeling.jax_compilation`` — the shape-bucket
+ladder, the zero padding the estimators mask out, the settings block that
+switches the persistent compilation cache on, and the compile-profile
+bookkeeping recorded in ``_run_metadata``.
+
+``jax.config.update`` is patched in the cache tests so the test process
+never points its real compilation cache at a ``tmp_path`` that is deleted
+afterwards.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from usv_playpen.modeling import jax_compilation
+
+
+@pytest.fixture
+def bucketing_on(monkeypatch):
+    """Restore the module-level bucketing switch after each test."""
+
+    monkeypatch.setattr(jax_compilation, '_shape_bucketing', True)
+
+
+class TestBucketRows:
+
+    @pytest.mark.parametrize('n_rows, expected', [
+        (1, 64), (64, 64), (65, 80), (80, 80), (81, 96), (100, 112),
+        (129, 160), (1000, 1024), (1025, 1280), (12345, 12288 + 2048),
+    ])
+    def test_ladder(self, n_rows, expected, bucketing_on):
+        """Buckets keep the three leading bits of the row count, with a
+        floor of ``MIN_BUCKET_ROWS``."""
+
+        assert jax_compilation.bucket_rows(n_rows) == expected
+
+    def test_padding_is_bounded(self, bucketing_on):
+        """Every bucket covers its row count with at most 25 % padding
+        above the minimum bucket."""
+
+        for n_rows in range(jax_compilation.MIN_BUCKET_ROWS, 20000, 7):
+            n_bucket = jax_compilation.bucket_rows(n_rows)
+            assert n_rows <= n_bucket <= 1.25 * n_rows
+
+    def test_disabled_bucketing_is_identity(self, monkeypatch):
+        """With bucketing switched off the row count passes through."""
+
+        monkeypatch.setattr(jax_compilation, '_shape_bucketing', False)
+        assert jax_compilation.bucket_rows(101) == 101
+
+
+def test_pad_rows_zero_pads_leading_axis():
+    """Every array is zero-padded along axis 0 only; the real rows are
+    untouched."""
+
+    X = np.arange(12.0).reshape(4, 3)
+    y = np.arange(4)
+    X_pad, y_pad = jax_compilation.pad_rows(6, X, y)
+    assert X_pad.shape == (6, 3) and y_pad.shape == (6,)
+    np.testing.assert_array_equal(X_pad[:4], X)
+    np.testing.assert_array_equal(y_pad[:4], y)
+    assert not X_pad[4:].any() and not y_pad[4:].any()
+
+
+class TestConfigureCompilationCache:
+
+    def test_enables_cache_in_directory(self, tmp_path, mocker, bucketing_on):
+        """The cache directory is created and handed to ``jax.config``
+        together with the minimum compile time."""
+
+        update = mocker.patch.object(jax_compilation.jax.config, 'update')
+        cache_dir = tmp_path / 'xla_cache'
+        settings = {'hyperparameters': {'jax_compilation': {
+            'persistent_cache_bool': True, 'cache_directory': str(cache_dir),
+            'min_compile_time_secs': 2.5, 'shape_bucketing_bool': False}}}
+
+        assert jax_compilation.configure_compilation_cache(settings) == str(cache_dir)
+        assert cache_dir.is_dir()
+        update.assert_any_call('jax_compilation_cache_dir', str(cache_dir))
+        update.assert_any_call('jax_persistent_cache_min_compile_time_secs', 2.5)
+        assert jax_compilation.shape_bucketing_enabled() is False
+
+    def test_disabled_cache_leaves_jax_untouched(self, mocker, bucketing_on):
+        """With the cache off (or the block missing) ``jax.config`` is never
+        touched and None is returned."""
+
+        update = mocker.patch.object(jax_compilation.jax.config, 'update')
+        settings = {'hyperparameters': {'jax_compilation': {
+            'persistent_cache_bool': False, 'cache_directory': '',
+            'min_compile_time_secs': 1.0, 'shape_bucketing_bool': True}}}
+
+        assert jax_compilation.configure_compilation_cache(settings) is None
+        assert jax_compilation.configure_compilation_cache({'hyperparameters': {}}) is None
+        update.assert_not_called()
+        assert jax_compilation.shape_bucketing_enabled() is True
+
+
+def test_compile_profile_splits_wall_time(bucketing_on):
+    """Compile events recorded after ``start_compile_accounting`` are
+    summed into ``compile_s``; the remainder of the wall time is
+    ``run_s``."""
+
+    jax_compilation.start_compile_accounting()
+    jax_compilation._record_duration('/jax/core/compile/backend_compile_duration', 0.0)
+    jax_compilation._record_duration('/jax/some/other_duration', 5.0)
+    jax_compilation._record_event('/jax/compilation_cache/cache_hits')
+    jax_compilation._record_event('/jax/compilation_cache/cache_misses')
+    jax_compilation._record_event('/jax/compilation_cache/cache_misses')
+
+    profile = jax_compilation.compile_profile()
+    assert profile['compile_stages_s'] == {'backend_compile_duration': 0.0}
+    assert profile['compile_s'] == 0.0
+    assert profile['run_s'] == pytest.approx(profile['wall_s'])
+    assert (profile['cache_hits'], profile['cache_misses']) == (1, 2)
+    assert profile['shape_bucketing'] is True
@@ -376,6 +376,57 @@ class TestLaxLoopPath:
         assert model.n_iter_ < 600
 
 
+class TestRegularizationGrid:
+
+    @pytest.mark.parametrize('use_lax_loop', [True, False])
+    def test_grid_fits_match_individual_fits(self, use_lax_loop):
+        """Every estimator returned by ``fit_regularization_grid`` matches a
+        ``fit`` on its fold's rows with the same ``(lambda_smooth, l2_reg)``,
+        seed and loop path, up to float32 rounding — including the
+        fold-specific class weights and log priors and the stopping
+        iteration."""
+
+        X, y = _make_imbalanced_3class()
+        train_masks = np.stack([np.arange(len(y)) % 3 != k for k in range(3)])
+        lambda_grid, l2_grid = np.array([0.0, 1.0]), np.array([1e-3, 1e-1])
+        kwargs = _fit_kwargs(X.shape[1])
+        kwargs.update(uniform_class_weights=False, focal_gamma=2.0, max_iter=400, tol=1e-3,
+                      _use_lax_loop=use_lax_loop)
+
+        fits = SmoothMultinomialLogisticRegression(**kwargs).fit_regularization_grid(
+            X, y, train_masks,
+            lambda_smooth_grid=lambda_grid, l2_reg_grid=l2_grid,
+            random_states=[0, 1, 2],
+        )
+
+        pairs = [(a, b) for a in lambda_grid for b in l2_grid]
+        for fold_idx, mask in enumerate(train_masks):
+            for pair_idx, (lam_sm, lam_l2) in enumerate(pairs):
+                grid_model = fits[fold_idx][pair_idx]
+                single_kwargs = dict(kwargs, lambda_smooth=lam_sm, l2_reg=lam_l2, random_state=fold_idx)
+                single = SmoothMultinomialLogisticRegression(**single_kwargs).fit(X[mask], y[mask])
+                assert grid_model.n_iter_ == single.n_iter_
+                np.testing.assert_array_equal(grid_model.classes_, single.classes_)
+                np.testing.assert_allclose(grid_model.log_priors_, single.log_priors_, atol=1e-6)
+                np.testing.assert_allclose(grid_model.coef_, single.coef_, atol=1e-4, rtol=1e-3)
+                np.testing.assert_allclose(grid_model.predict_proba(X), single.predict_proba(X), atol=1e-4)
+
+    def test_folds_with_different_class_sets(self):
+        """A fold missing a class gets a model over its own class set, as a
+        ``fit`` on its rows would."""
+
+        X, y = _make_separable_3class(n_per_class=40)
+        train_masks = np.stack([np.ones(len(y), dtype=bool), y != 2])
+        fits = SmoothMultinomialLogisticRegression(**_fit_kwargs(X.shape[1])).fit_regularization_grid(
+            X, y, train_masks,
+            lambda_smooth_grid=np.array([0.0]), l2_reg_grid=np.array([1e-3]),
+        )
+
+        np.testing.assert_array_equal(fits[0][0].classes_, [0, 1, 2])
+        np.testing.assert_array_equal(fits[1][0].classes_, [0, 1])
+        assert fits[1][0].predict_proba(X).shape == (len(y), 2)
+
+
 class TestSmoothnessBoundary:
     """The order-2 temporal-smoothness penalty uses reflective (Neumann)
     boundary conditions: in addition to the interior second-differences it
@@ -33,15 +33,25 @@ with warnings.catch_warnings():
     warnings.simplefilter("ignore", DeprecationWarning)
     from usv_playpen.modeling.jax_neural_network_cnn import (
         HashableDict,
+        PermutationImportanceEngine,
         _batch_norm_1d,
         _output_axes_count,
         _use_sin_cos_torus_output,
         apply_kinematic_masking,
+        apply_kinematic_masking_jax,
+        apply_temporal_warping,
+        apply_temporal_warping_jax,
+        augment_batch_jax,
         build_lr_schedule,
         cnn_forward,
         get_grid_balanced_indices,
         init_cnn_params_and_state,
+        make_device_train_step,
+        make_scan_epoch,
+        prefetch_to_device,
     )
+    from usv_playpen.modeling.manifold_metric import angle_decode_jax, signed_diff_jax
+    import optax
 
 
 def _load_cnn_hp(metric='euclidean', period=1.0):
@@ -100,6 +110,230 @@ class TestApplyKinematicMasking:
         assert set(np.unique(out)).issubset({0.0, 1.0})
 
 
+# Device-side augmentation
+
+
+class TestDeviceAugmentation:
+
+    def test_warping_matches_host_version(self):
+        """The JAX warp agrees with ``apply_temporal_warping`` to float32
+        rounding, and a unit warp factor is the identity."""
+
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=(6, 3, 40)).astype(np.float32)
+        warps = rng.uniform(0.85, 1.15, 6).astype(np.float32)
+        out = np.asarray(apply_temporal_warping_jax(jnp.asarray(x), jnp.asarray(warps)))
+        np.testing.assert_allclose(out, apply_temporal_warping(x, warps), atol=1e-5)
+        np.testing.assert_array_equal(
+            np.asarray(apply_temporal_warping_jax(jnp.asarray(x), jnp.ones(6))), x)
+
+    def test_masking_is_keyed_and_zeros_contiguous_chunks(self):
+        """The same key blinds the same chunks; with ``mask_prob=1`` every
+        channel loses exactly one ``mask_length`` run; ``mask_prob=0`` is
+        the identity."""
+
+        x = jnp.ones((3, 4, 16), dtype=jnp.float32)
+        key = jax.random.PRNGKey(5)
+        out_a = np.asarray(apply_kinematic_masking_jax(x, key, mask_prob=1.0, mask_length=4))
+        out_b = np.asarray(apply_kinematic_masking_jax(x, key, mask_prob=1.0, mask_length=4))
+        np.testing.assert_array_equal(out_a, out_b)
+        assert out_a.dtype == np.float32
+        assert (np.sum(out_a == 0.0, axis=2) == 4).all()
+        for row in out_a.reshape(-1, 16):
+            zeros = np.flatnonzero(row == 0.0)
+            assert zeros[-1] - zeros[0] == 3
+        np.testing.assert_array_equal(
+            np.asarray(apply_kinematic_masking_jax(x, key, mask_prob=0.0, mask_length=4)), np.asarray(x))
+
+    def test_augment_batch_reproducible_per_key(self):
+        """``augment_batch_jax`` is a pure function of the batch key."""
+
+        hp = _load_cnn_hp()
+        x = jnp.asarray(np.random.default_rng(1).normal(size=(4, 3, 80)).astype(np.float32))
+        out_a = augment_batch_jax(x, jax.random.PRNGKey(0), hp)
+        out_b = augment_batch_jax(x, jax.random.PRNGKey(0), hp)
+        out_c = augment_batch_jax(x, jax.random.PRNGKey(1), hp)
+        np.testing.assert_array_equal(np.asarray(out_a), np.asarray(out_b))
+        assert not np.array_equal(np.asarray(out_a), np.asarray(out_c))
+
+    def test_prefetch_yields_every_batch_in_order(self):
+        """The prefetcher returns each batch once, in order, on the device."""
+
+        batches = [(np.full((2, 3), i, dtype=np.float32), np.array([i])) for i in range(5)]
+        for depth in (1, 2, 8):
+            out = list(prefetch_to_device(iter(batches), depth=depth))
+            assert len(out) == 5
+            for i, (x_dev, tag) in enumerate(out):
+                assert isinstance(x_dev, jax.Array)
+                np.testing.assert_array_equal(np.asarray(x_dev), batches[i][0])
+                assert int(tag[0]) == i
+
+    def test_scan_epoch_matches_per_batch_steps(self):
+        """A ``lax.scan`` epoch reproduces the per-batch jitted steps fed the
+        same rows and ``fold_in(epoch_key, b)`` keys (plain SGD, so the
+        comparison is not amplified by Adam's sign-like first steps)."""
+
+        hp = _load_cnn_hp()
+        rng = np.random.default_rng(2)
+        X = rng.normal(size=(48, 3, 32)).astype(np.float32)
+        Y = rng.uniform(-0.5, 0.5, size=(48, 2)).astype(np.float32)
+        params, state = init_cnn_params_and_state(jax.random.PRNGKey(0), 3, 32, hp)
+        y_center, y_scale = jnp.zeros(2), jnp.ones(2)
+
+        @jax.jit
+        def compute_grads(p, s, xs, yt, rng_key, yc, ys):
+            rng_key, drop_key = jax.random.split(rng_key)
+
+            def loss_fn(weights, current_state):
+                preds, new_state = cnn_forward(weights, current_state, xs, yc, ys, hp,
+                                               rng_key=drop_key, is_training=True)
+                return jnp.mean(jnp.sum((preds - yt) ** 2, axis=-1)), new_state
+
+            (_, s_new), grads = jax.value_and_grad(loss_fn, has_aux=True)(p, s)
+            return grads, s_new, rng_key
+
+        optimizer = optax.sgd(1e-2)
+        train_step = make_device_train_step(compute_grads, optimizer, hp)
+        carry = (params, state, optimizer.init(params), jax.random.PRNGKey(1))
+        batch_idx = rng.permutation(48).reshape(3, 16)
+        epoch_key = jax.random.PRNGKey(7)
+
+        stepwise = carry
+        for b, idx in enumerate(batch_idx):
+            stepwise = jax.jit(train_step)(stepwise, jnp.asarray(X[idx]), jnp.asarray(Y[idx]),
+                                           jax.random.fold_in(epoch_key, b), y_center, y_scale)
+        scanned = make_scan_epoch(train_step)(carry, jnp.asarray(X), jnp.asarray(Y), jnp.asarray(batch_idx),
+                                              epoch_key, y_center, y_scale)
+        for name in params:
+            np.testing.assert_allclose(np.asarray(scanned[0][name]), np.asarray(stepwise[0][name]), atol=1e-5)
+        np.testing.assert_array_equal(np.asarray(scanned[3]), np.asarray(stepwise[3]))
+
+    def test_scan_epochs_match_prefetched_steps(self):
+        """The two device pipelines train to the same weights: ``lax.scan``
+        epochs over the device-resident fold and per-batch steps fed through
+        ``prefetch_to_device`` see the same rows and keys, so they agree to
+        float32 rounding after several epochs. Plain SGD keeps the comparison
+        tight: Adam's first normalised step turns float32 noise in near-zero
+        gradients into differences of the order of the learning rate."""
+
+        hp = _load_cnn_hp()
+        hp['block_channels'] = [8, 16]
+        hp['hidden_dim'] = 8
+        rng = np.random.default_rng(3)
+        X = rng.normal(size=(64, 3, 32)).astype(np.float32)
+        Y = rng.uniform(-0.5, 0.5, size=(64, 2)).astype(np.float32)
+        params, state = init_cnn_params_and_state(jax.random.PRNGKey(0), 3, 32, hp)
+        y_center, y_scale = jnp.zeros(2), jnp.ones(2)
+
+        @jax.jit
+        def compute_grads(p, s, xs, yt, rng_key, yc, ys):
+            rng_key, drop_key = jax.random.split(rng_key)
+
+            def loss_fn(weights, current_state):
+                preds, new_state = cnn_forward(weights, current_state, xs, yc, ys, hp,
+                                               rng_key=drop_key, is_training=True)
+                return jnp.mean(jnp.sum((preds - yt) ** 2, axis=-1)), new_state
+
+            (_, s_new), grads = jax.value_and_grad(loss_fn, has_aux=True)(p, s)
+            return grads, s_new, rng_key
+
+        optimizer = optax.sgd(learning_rate=1e-2)
+        train_step = make_device_train_step(compute_grads, optimizer, hp)
+        step_jit = jax.jit(train_step)
+        scan_epoch = make_scan_epoch(train_step)
+        carry = (params, state, optimizer.init(params), jax.random.PRNGKey(1))
+        aug_key = jax.random.PRNGKey(7)
+
+        prefetched, scanned = carry, carry
+        for epoch in range(3):
+            batch_idx = rng.permutation(64).reshape(4, 16)
+            epoch_key = jax.random.fold_in(aug_key, epoch)
+            host_batches = ((X[idx], Y[idx], jax.random.fold_in(epoch_key, b)) for b, idx in enumerate(batch_idx))
+            for x_raw, y_batch, batch_key in prefetch_to_device(host_batches, 2):
+                prefetched = step_jit(prefetched, x_raw, y_batch, batch_key, y_center, y_scale)
+            scanned = scan_epoch(scanned, jnp.asarray(X), jnp.asarray(Y), jnp.asarray(batch_idx),
+                                 epoch_key, y_center, y_scale)
+
+        for name in params:
+            np.testing.assert_allclose(np.asarray(scanned[0][name]), np.asarray(prefetched[0][name]),
+                                       rtol=1e-5, atol=1e-6)
+        np.testing.assert_array_equal(np.asarray(scanned[3]), np.asarray(prefetched[3]))
+
+
+# PermutationImportanceEngine
+
+
+class TestPermutationImportanceEngine:
+
+    @staticmethod
+    def _legacy_errors(hp, params, state, X, Y, y_center, y_scale, feature_indices, permutations):
+        """The per-permutation loop the engine replaces: host copy, padded
+        mini-batch forward, concatenation, decode, mean distance."""
+
+        batch_size = hp['batch_size']
+        errors = []
+        for f_idx, perm in zip(feature_indices, permutations):
+            X_perm = X.copy()
+            X_perm[:, f_idx, :] = X_perm[perm, f_idx, :]
+            x_s = jnp.array(X_perm)
+            preds = []
+            for i in range(0, len(x_s), batch_size):
+                batch_x = x_s[i:i + batch_size]
+                actual_size = len(batch_x)
+                if actual_size < batch_size:
+                    batch_x = jnp.pad(batch_x, ((0, batch_size - actual_size), (0, 0), (0, 0)), mode='constant')
+                pred_batch, _ = cnn_forward(params, state, batch_x, y_center, y_scale, hp,
+                                            rng_key=None, is_training=False)
+                preds.append(pred_batch[:actual_size])
+            Y_pred = jnp.concatenate(preds, axis=0)
+            if _use_sin_cos_torus_output(hp):
+                Y_pred = angle_decode_jax(Y_pred, jnp.asarray(hp['manifold_period']))
+            errors.append(float(jnp.mean(jnp.sqrt(jnp.sum(signed_diff_jax(
+                jnp.array(Y), Y_pred, metric=hp['manifold_metric'], period=hp['manifold_period'],
+            ) ** 2, axis=-1)))))
+        return np.array(errors)
+
+    @pytest.mark.parametrize('metric', ['euclidean', 'torus'])
+    def test_vectorized_matches_sequential_loop(self, metric):
+        """A budget of 0 reproduces the per-permutation loop exactly; chunked
+        vectorized evaluation (including a padded last chunk) agrees with it
+        to float32 rounding, and every chunking draws the same permutations
+        and leaves the generator in the same state."""
+
+        hp = _load_cnn_hp(metric=metric)
+        hp['batch_size'] = 8
+        rng = np.random.default_rng(3)
+        X = rng.normal(size=(21, 3, 32)).astype(np.float32)
+        Y = rng.uniform(0.0, 1.0, size=(21, 2)).astype(np.float32)
+        params, state = init_cnn_params_and_state(jax.random.PRNGKey(0), 3, 32, hp)
+        y_center, y_scale = jnp.full(2, 0.5), jnp.full(2, 0.55)
+        feature_indices = np.repeat(np.arange(3), 3)
+        perm_rng = np.random.default_rng(11)
+        permutations = np.array([perm_rng.permutation(21) for _ in feature_indices])
+        next_draw = perm_rng.permutation(21)
+
+        legacy = self._legacy_errors(hp, params, state, X, Y, y_center, y_scale, feature_indices, permutations)
+        sequential = PermutationImportanceEngine(params, state, X, Y, y_center, y_scale, hp)
+        assert sequential.chunk_size == 0
+        draw_rng = np.random.default_rng(11)
+        np.testing.assert_array_equal(sequential.errors(feature_indices, draw_rng), legacy.astype(np.float32))
+        np.testing.assert_array_equal(draw_rng.permutation(21), next_draw)
+
+        # Each permutation costs two padded test-tensor copies plus the
+        # activations of one mini-batch forward pass.
+        copy_bytes = 2 * 24 * X[0].nbytes
+        per_permutation = PermutationImportanceEngine(params, state, X, Y, y_center, y_scale, hp,
+                                                      memory_budget_gb=1.0).bytes_per_permutation
+        assert per_permutation > copy_bytes
+        for budget_permutations in (4, 100):
+            engine = PermutationImportanceEngine(params, state, X, Y, y_center, y_scale, hp,
+                                                 memory_budget_gb=budget_permutations * per_permutation / 2 ** 30)
+            assert engine.chunk_size == budget_permutations
+            draw_rng = np.random.default_rng(11)
+            np.testing.assert_allclose(engine.errors(feature_indices, draw_rng), legacy, rtol=1e-5)
+            np.testing.assert_array_equal(draw_rng.permutation(21), next_draw)
+
+
 # M3 — get_grid_balanced_indices
 
 
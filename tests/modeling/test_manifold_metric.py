@@ -23,11 +23,13 @@ import pytest
 from usv_playpen.modeling.manifold_metric import (
     _validate_metric_period,
     angle_decode_jax,
+    blocked_distance_correlation,
     circular_mean,
     dcor_prediction_truth,
     distance_correlation,
     manifold_prediction_metrics,
     pairwise_distance,
+    resolve_manifold_dcor_settings,
     resolve_manifold_metric,
     resolve_manifold_selection_score_key,
     signed_diff,
@@ -409,6 +411,39 @@ class TestResolveManifoldSelectionScoreKey:
             resolve_manifold_selection_score_key(bad, 'torus')
 
 
+class TestResolveManifoldDcorSettings:
+    """`resolve_manifold_dcor_settings` — the `dcor_xy` estimator knob."""
+
+    def test_absent_block_keeps_the_historical_estimator(self):
+        """No block resolves to the subsampled V-statistic at 2500 x 3."""
+
+        assert resolve_manifold_dcor_settings({'vocal_features': {}}) == {
+            'dcor_estimator': 'subsample', 'dcor_n_sub': 2500, 'dcor_n_rep': 3}
+
+    def test_block_is_forwarded_as_bundle_kwargs(self):
+        """The block maps onto the `manifold_prediction_metrics` keywords, and a
+        bundle built from it equals a direct `dcor_prediction_truth` call."""
+
+        settings = {'vocal_features': {'usv_manifold_dcor': {'estimator': 'u_statistic', 'n_sub': 150, 'n_rep': 2}}}
+        kwargs = resolve_manifold_dcor_settings(settings)
+        assert kwargs == {'dcor_estimator': 'u_statistic', 'dcor_n_sub': 150, 'dcor_n_rep': 2}
+
+        rng = np.random.default_rng(3)
+        Y = rng.random((400, 2)); Yp = Y + 0.1 * rng.standard_normal((400, 2))
+        bundle = manifold_prediction_metrics(Y, Yp, metric='euclidean', period=1.0, random_state=5, **kwargs)
+        dcor, stderr = dcor_prediction_truth(Yp, Y, metric='euclidean', period=1.0, n_sub=150, n_rep=2,
+                                             random_state=5, estimator='u_statistic', return_stderr=True)
+        assert bundle['dcor_xy'] == pytest.approx(dcor, rel=1e-12)
+        assert bundle['dcor_xy_stderr'] == pytest.approx(stderr, rel=1e-12)
+
+    @pytest.mark.parametrize('block', [{'estimator': 'bootstrap'}, {'n_sub': 0}, {'n_rep': 0}])
+    def test_invalid_block_raises(self, block):
+        """An unknown estimator or an empty subsample is a settings-file bug."""
+
+        with pytest.raises(ValueError):
+            resolve_manifold_dcor_settings({'vocal_features': {'usv_manifold_dcor': block}})
+
+
 # Distance correlation (the torus selection score)
 
 
@@ -479,6 +514,80 @@ class TestDistanceCorrelation:
         assert a == b
 
 
+class TestBlockedDistanceCorrelation:
+    """`blocked_distance_correlation` and the estimators of
+    `dcor_prediction_truth` that use it."""
+
+    @staticmethod
+    def _u_statistic_reference(A, B, metric):
+        """Unbiased dCor from explicitly U-centred full matrices."""
+
+        from usv_playpen.modeling.manifold_metric import _geodesic_distance_matrix
+
+        def _u_center(M):
+            n = M.shape[0]
+            C = (M - M.sum(axis=0, keepdims=True) / (n - 2) - M.sum(axis=1, keepdims=True) / (n - 2)
+                 + M.sum() / ((n - 1) * (n - 2)))
+            np.fill_diagonal(C, 0.0)
+            return C
+
+        a = _u_center(_geodesic_distance_matrix(A, metric=metric, period=1.0))
+        b = _u_center(_geodesic_distance_matrix(B, metric=metric, period=1.0))
+        ratio = (a * b).sum() / np.sqrt((a * a).sum() * (b * b).sum())
+        return float(np.sqrt(max(ratio, 0.0)))
+
+    @pytest.mark.parametrize('metric', ['euclidean', 'torus'])
+    def test_matches_full_matrices(self, metric):
+        """The V-statistic equals `distance_correlation` of the full matrices
+        and the U-statistic the explicitly U-centred reference, on both
+        metrics."""
+
+        from usv_playpen.modeling.manifold_metric import _geodesic_distance_matrix
+        _, Y = TestDistanceCorrelation._wound(400, 11)
+        Yp = (Y + 0.1 * np.random.default_rng(12).standard_normal(Y.shape)) % 1.0
+        full = distance_correlation(_geodesic_distance_matrix(Yp, metric=metric, period=1.0),
+                                    _geodesic_distance_matrix(Y, metric=metric, period=1.0))
+        assert blocked_distance_correlation(Yp, Y, metric=metric, period=1.0) == pytest.approx(full, rel=1e-10)
+        assert (blocked_distance_correlation(Yp, Y, metric=metric, period=1.0, unbiased=True)
+                == pytest.approx(self._u_statistic_reference(Yp, Y, metric), rel=1e-10))
+
+    def test_unbiased_removes_independence_bias(self):
+        """For independent samples the V-statistic sits well above zero at
+        small n, while the U-statistic is near zero; constant input gives 0."""
+
+        rng = np.random.default_rng(13)
+        A, B = rng.random((200, 2)), rng.random((200, 2))
+        v_stat = blocked_distance_correlation(A, B, metric='torus', period=1.0)
+        u_stat = blocked_distance_correlation(A, B, metric='torus', period=1.0, unbiased=True)
+        assert u_stat < v_stat
+        assert blocked_distance_correlation(A, np.zeros_like(B), metric='euclidean', period=1.0) == 0.0
+        with pytest.raises(ValueError, match='more than 3'):
+            blocked_distance_correlation(A[:3], B[:3], metric='euclidean', period=1.0, unbiased=True)
+
+    def test_estimators_and_blocked_threshold(self):
+        """The blocked kernel replaces the full matrices above the threshold
+        without changing the subsampled estimate; 'exact' uses every point and
+        the standard error is reported across the repeats."""
+
+        _, Y = TestDistanceCorrelation._wound(600, 14)
+        Yp = (Y + 0.05 * np.random.default_rng(15).standard_normal(Y.shape)) % 1.0
+        kwargs = dict(metric='torus', period=1.0, n_sub=300, n_rep=4, random_state=0)
+        legacy = dcor_prediction_truth(Yp, Y, **kwargs)
+        assert dcor_prediction_truth(Yp, Y, blocked_min_n=100, **kwargs) == pytest.approx(legacy, rel=1e-10)
+
+        dcor, stderr = dcor_prediction_truth(Yp, Y, return_stderr=True, **kwargs)
+        assert dcor == legacy and 0.0 < stderr < 0.05
+        u_dcor, u_stderr = dcor_prediction_truth(Yp, Y, estimator='u_statistic', return_stderr=True, **kwargs)
+        assert u_dcor < dcor and np.isfinite(u_stderr)
+
+        exact, exact_err = dcor_prediction_truth(Yp, Y, estimator='exact', blocked_min_n=100,
+                                                 return_stderr=True, **kwargs)
+        assert exact_err == 0.0
+        assert exact == pytest.approx(blocked_distance_correlation(Yp, Y, metric='torus', period=1.0), rel=1e-12)
+        with pytest.raises(ValueError, match='estimator'):
+            dcor_prediction_truth(Yp, Y, estimator='jackknife', **kwargs)
+
+
 class TestManifoldPredictionMetrics:
     """`manifold_prediction_metrics` — the shared bundle scorer for the
     non-fitted baselines (the `null_model_free` empirical-density draw and the
@@ -488,7 +597,7 @@ class TestManifoldPredictionMetrics:
         'r2_spatial', 'euclidean_mae', 'euclidean_rmse', 'euclidean_mae_weighted',
         'euclidean_mae_raw', 'mahalanobis_mae', 'mae_x', 'mae_y',
         'pearson_x', 'pearson_y', 'spearman_x', 'spearman_y', 'dcor_xy',
-        'vm_logscore', 'vm_logscore_pooled',
+        'dcor_xy_stderr', 'vm_logscore', 'vm_logscore_pooled',
     }
 
     def test_bundle_keys_and_raw_equals_mae(self):
@@ -530,10 +639,12 @@ class TestManifoldPredictionMetrics:
         Y = rng.random((200, 2)); Yp = rng.random((200, 2))
         euc = manifold_prediction_metrics(Y, Yp, metric='euclidean', period=1.0)
         assert np.isfinite(euc['dcor_xy'])
+        assert np.isfinite(euc['dcor_xy_stderr'])
         assert np.isnan(euc['vm_logscore'])
         tor = manifold_prediction_metrics(Y, Yp, metric='torus', period=1.0)
         assert np.isfinite(tor['vm_logscore'])
         assert np.isnan(tor['dcor_xy'])
+        assert np.isnan(tor['dcor_xy_stderr'])
 
     def test_frozen_kappa_is_forwarded_to_vm_scores(self):
         """A supplied `kappa` is reused for BOTH torus vM keys instead of the
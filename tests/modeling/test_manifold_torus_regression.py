@@ -278,6 +278,40 @@ def test_fit_is_deterministic():
     np.testing.assert_array_equal(a.intercept_, b.intercept_)
 
 
+def test_regularization_grid_matches_individual_fits():
+    """``fit_regularization_grid`` solves a whole (fold x lambda_smooth x
+    l2_reg) grid from one Gram matrix per fold; every returned estimator
+    equals a ``fit`` on that fold's rows with the same pair and weights, and
+    carries the pair in its parameters."""
+
+    n_features, n_time_bins = 2, 4
+    n_inputs = n_features * n_time_bins
+    X, Y = _make_wrapped_torus_2d(n_samples=240, n_inputs=n_inputs, seed=9)
+    sw = np.random.default_rng(9).uniform(0.3, 2.0, size=240)
+    train_masks = np.stack([np.arange(240) % 3 != k for k in range(3)])
+    lambda_grid, l2_grid = np.array([0.1, 10.0]), np.array([0.001, 0.1, 1.0])
+
+    template = SmoothTorusManifoldRegression(**_torus_kwargs(n_features, n_time_bins))
+    fits = template.fit_regularization_grid(
+        X, Y, train_masks, sw, lambda_smooth_grid=lambda_grid, l2_reg_grid=l2_grid,
+    )
+
+    assert len(fits) == 3 and all(len(fold) == 6 for fold in fits)
+    for fold_idx, mask in enumerate(train_masks):
+        for pair_idx, (lam_sm, lam_l2) in enumerate(
+                [(a, b) for a in lambda_grid for b in l2_grid]):
+            grid_model = fits[fold_idx][pair_idx]
+            assert (grid_model.lambda_smooth, grid_model.l2_reg) == (lam_sm, lam_l2)
+            single = SmoothTorusManifoldRegression(**_torus_kwargs(
+                n_features, n_time_bins, l2_reg=lam_l2, lambda_smooth=lam_sm,
+            )).fit(X[mask], Y[mask], sample_weight=sw[mask])
+            np.testing.assert_allclose(grid_model.coef_, single.coef_, atol=1e-10, rtol=0)
+            np.testing.assert_allclose(grid_model.intercept_, single.intercept_, atol=1e-10, rtol=0)
+            np.testing.assert_allclose(grid_model.train_cov_inv_, single.train_cov_inv_,
+                                       atol=1e-10, rtol=0)
+            np.testing.assert_allclose(grid_model.predict(X), single.predict(X), atol=1e-10, rtol=0)
+
+
 def test_evaluate_metrics_bundle_inherited():
     """The inherited ``evaluate_metrics`` produces the same wrap-aware metric
     schema as the coordinate model (so the persisted ledger is unchanged in
@@ -0,0 +1,115 @@
+"""
+@author: bartulem
+Unit tests for ``usv_playpen.modeling.modeling_input_store`` — the per-feature
+HDF5 store the extractors write, its round-trip against the in-memory
+artifact, feature-subset and memory-mapped reads, the legacy pickle reader,
+and the ``io.modeling_input_format`` switch.
+"""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+from usv_playpen.modeling.modeling_input_store import (
+    ModelingInputReader,
+    load_modeling_input,
+    modeling_input_suffix,
+    save_modeling_input,
+)
+
+
+def _artifact() -> dict:
+    rng = np.random.default_rng(0)
+    return {
+        'self.speed': {
+            '20230119_155302': {'usv_feature_arr': rng.normal(size=(5, 8)),
+                                'no_usv_feature_arr': rng.normal(size=(7, 8))},
+            '20230119_162529': {'usv_feature_arr': rng.normal(size=(3, 8)),
+                                'no_usv_feature_arr': rng.normal(size=(4, 8))},
+        },
+        'other/nose-nose': {
+            '20230119_155302': {'X': rng.normal(size=(5, 8)).astype(np.float32),
+                                'labels': np.array(['a', 'b', 'a', 'c', 'b']),
+                                'session_idx': np.arange(5)},
+        },
+        '_input_metadata': {'session_ids': ['20230119_155302', '20230119_162529'],
+                            'filter_history_frames': 8, 'ibi_thresholds': {'male': np.nan}},
+    }
+
+
+def _assert_same(loaded, expected) -> None:
+    if isinstance(expected, dict):
+        assert list(loaded) == list(expected)
+        for key in expected:
+            _assert_same(loaded[key], expected[key])
+    elif isinstance(expected, np.ndarray):
+        assert loaded.dtype == expected.dtype
+        np.testing.assert_array_equal(loaded, expected)
+    else:
+        assert loaded == expected or (loaded != loaded and expected != expected)
+
+
+def test_store_round_trips_artifact(tmp_path):
+    """Features (including ``/`` in names, string labels and float32 arrays),
+    dict order and the metadata block all round-trip exactly."""
+
+    artifact = _artifact()
+    path = save_modeling_input(artifact, tmp_path / 'modeling_test.h5')
+    reader = ModelingInputReader(path)
+
+    assert reader.is_store
+    assert reader.feature_names == ['other/nose-nose', 'self.speed']
+    assert reader.input_metadata['filter_history_frames'] == 8
+    loaded = reader.load()
+    assert sorted(loaded) == sorted(artifact)
+    for key in artifact:
+        _assert_same(loaded[key], artifact[key])
+    assert [p.name for p in tmp_path.iterdir()] == ['modeling_test.h5']
+
+
+def test_feature_subset_and_mmap(tmp_path):
+    """Only the requested features are read (unknown names are skipped), and
+    ``mmap=True`` returns read-only memory maps of the numeric arrays."""
+
+    artifact = _artifact()
+    path = save_modeling_input(artifact, tmp_path / 'modeling_test.h5')
+
+    loaded = load_modeling_input(path, features=['self.speed', 'absent'], mmap=True)
+    assert sorted(loaded) == ['_input_metadata', 'self.speed']
+    arr = loaded['self.speed']['20230119_155302']['usv_feature_arr']
+    assert isinstance(arr, np.memmap) and not arr.flags.writeable
+    np.testing.assert_array_equal(arr, artifact['self.speed']['20230119_155302']['usv_feature_arr'])
+
+    single = load_modeling_input(path, features='other/nose-nose', mmap=True)
+    assert list(single['other/nose-nose']['20230119_155302']['labels']) == ['a', 'b', 'a', 'c', 'b']
+
+
+def test_legacy_pickle_is_read_through_the_same_interface(tmp_path):
+    """A pre-store ``.pkl`` input loads to the same dict, feature list and
+    metadata as the store, and a ``.pkl`` destination still writes a pickle."""
+
+    artifact = _artifact()
+    legacy_path = tmp_path / 'modeling_legacy.pkl'
+    with legacy_path.open('wb') as fh:
+        pickle.dump(artifact, fh)
+
+    reader = ModelingInputReader(legacy_path)
+    assert not reader.is_store
+    assert reader.feature_names == ['other/nose-nose', 'self.speed']
+    assert sorted(reader.load(features='self.speed')) == ['_input_metadata', 'self.speed']
+
+    written = save_modeling_input(artifact, tmp_path / 'modeling_written.pkl')
+    with written.open('rb') as fh:
+        assert list(pickle.load(fh)) == list(artifact)
+
+
+def test_modeling_input_suffix():
+    """``io.modeling_input_format`` maps to the file suffix; unknown values raise."""
+
+    assert modeling_input_suffix({'io': {'modeling_input_format': 'hdf5'}}) == '.h5'
+    assert modeling_input_suffix({'io': {'modeling_input_format': 'pickle'}}) == '.pkl'
+    with pytest.raises(ValueError, match='modeling_input_format'):
+        modeling_input_suffix({'io': {'modeling_input_format': 'parquet'}})
@@ -969,6 +969,28 @@ class TestBuildRunMetadata:
         assert jax['focal_loss_gamma'] == 2.0
         assert 'tune_regularization_params' not in jax
 
+    def test_compile_profile_is_recorded_only_when_given(self, mocker):
+        """The JAX compile profile lands under ``jax_compile_profile`` when
+        passed and is absent otherwise, leaving the rest of the block equal."""
+
+        settings = _full_modeling_settings(tune_regularization=False)
+        md_plain = self._build(settings, 'multinomial', mocker)
+        profile = {'wall_s': 10.0, 'compile_s': 4.0, 'run_s': 6.0,
+                   'compile_stages_s': {}, 'cache_hits': 3, 'cache_misses': 1,
+                   'shape_bucketing': True}
+        md_profiled = build_run_metadata(
+            modeling_settings=settings,
+            analysis_type='multinomial',
+            null_strategy='y_permutation',
+            n_outer_folds=5,
+            split_strategy='mixed',
+            jax_compile_profile=profile,
+        )
+        assert 'jax_compile_profile' not in md_plain
+        assert md_profiled['jax_compile_profile'] == profile
+        assert metadata_blocks_equal(md_plain, md_profiled,
+                                     ignore_keys=('jax_compile_profile',))
+
 
 # build_selection_metadata
 
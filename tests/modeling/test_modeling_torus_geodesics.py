@@ -21,8 +21,10 @@ from usv_playpen.modeling.manifold_metric import _geodesic_distance_matrix
 from usv_playpen.modeling.modeling_torus_geodesics import (
     _snap_to_grid,
     build_torus_geodesic_context,
+    cached_torus_geodesic_context,
     density_geodesic_matrix,
     flat_torus_distance_matrix,
+    geodesic_context_key,
     geodesic_mae_columns,
     per_event_geodesic_error,
     pullback_geodesic_matrix,
@@ -232,3 +234,62 @@ class TestPerEventHelpers:
         cols = geodesic_mae_columns(yp, yt, None)
         assert np.isnan(cols['density_geodesic_mae'])
         assert np.isnan(cols['pullback_geodesic_mae'])
+
+
+class TestContextCache:
+    def test_miss_then_memmapped_hit_matches_build(self, tmp_path):
+        """The first call builds and stores the context; the second reads the
+        same arrays back as memmaps without rebuilding, and the cache holds no
+        temporary files."""
+
+        rng = np.random.default_rng(7)
+        emb = rng.random((300, 2))
+        a = jnp.array([[2.0, 0.0], [0.0, 1.0]])
+        npz_path = tmp_path / 'decoder.npz'
+        np.savez(npz_path, w=np.ones(3))
+        kwargs = dict(cache_dir=str(tmp_path / 'cache'), decode_fn=lambda z: a @ z,
+                      decoder_weights_npz_path=str(npz_path), n_per_dim=10, period=1.0, k=8)
+
+        built, hit = cached_torus_geodesic_context(emb, **kwargs)
+        assert not hit
+        loaded, hit = cached_torus_geodesic_context(emb, **kwargs)
+        assert hit
+        assert isinstance(loaded.density_matrix, np.memmap)
+        assert (loaded.n_per_dim, loaded.period) == (10, 1.0)
+        for name in ('grid', 'density', 'density_matrix', 'pullback_matrix'):
+            np.testing.assert_array_equal(getattr(loaded, name), getattr(built, name))
+        assert not [f for f in (tmp_path / 'cache').iterdir() if f.name.startswith('.')]
+
+        yp, yt = rng.random((20, 2)), rng.random((20, 2))
+        assert geodesic_mae_columns(yp, yt, loaded) == geodesic_mae_columns(yp, yt, built)
+
+    def test_key_tracks_inputs_and_decoder_bytes(self, tmp_path):
+        """The key changes with ``Y``, the grid settings and the decoder
+        bytes, but not with the decoder's path; a context without a decoder is
+        stored without a pullback matrix."""
+
+        emb = np.random.default_rng(8).random((100, 2))
+        first, moved, other = tmp_path / 'a.npz', tmp_path / 'b.npz', tmp_path / 'c.npz'
+        np.savez(first, w=np.ones(3))
+        moved.write_bytes(first.read_bytes())
+        np.savez(other, w=np.zeros(3))
+
+        base = geodesic_context_key(emb, decoder_weights_npz_path=str(first), n_per_dim=10)
+        assert geodesic_context_key(emb, decoder_weights_npz_path=str(moved), n_per_dim=10) == base
+        assert geodesic_context_key(emb, decoder_weights_npz_path=str(other), n_per_dim=10) != base
+        assert geodesic_context_key(emb, decoder_weights_npz_path=str(first), n_per_dim=12) != base
+        assert geodesic_context_key(emb[::-1], decoder_weights_npz_path=str(first), n_per_dim=10) != base
+        assert geodesic_context_key(emb, n_per_dim=10) != base
+
+        cached_torus_geodesic_context(emb, cache_dir=str(tmp_path), n_per_dim=10)
+        ctx, hit = cached_torus_geodesic_context(emb, cache_dir=str(tmp_path), n_per_dim=10)
+        assert hit and ctx.pullback_matrix is None
+
+    def test_empty_cache_dir_builds_without_writing(self, tmp_path, monkeypatch):
+        """An empty ``cache_dir`` builds in memory and writes nothing."""
+
+        monkeypatch.chdir(tmp_path)
+        emb = np.random.default_rng(9).random((100, 2))
+        ctx, hit = cached_torus_geodesic_context(emb, cache_dir='', n_per_dim=8)
+        assert not hit and ctx.density_matrix.shape == (64, 64)
+        assert list(tmp_path.iterdir()) == []
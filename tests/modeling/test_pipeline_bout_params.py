@@ -95,6 +95,7 @@ with warnings.catch_warnings():
     import usv_playpen.modeling.main_univariate_dispatcher as univ_dispatcher
     import usv_playpen.modeling.modeling_vocal_bout_parameters as bout_params_module
     from usv_playpen.modeling.model_selection import bout_parameter_model_selection
+    from usv_playpen.modeling.modeling_input_store import load_modeling_input
     from usv_playpen.modeling.modeling_vocal_bout_parameters import BoutParameterPipeline
 
 
@@ -360,11 +361,10 @@ class TestBoutParameterExtraction:
         pipeline = BoutParameterPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_modeling_input_data()
 
-        pkls = list(save_dir.glob('modeling_bout_durations_*.pkl'))
+        pkls = list(save_dir.glob('modeling_bout_durations_*.h5'))
         assert len(pkls) == 1, f"expected exactly one regression input pickle, got {pkls}"
 
-        with pkls[0].open('rb') as fh:
-            artifact = pickle.load(fh)
+        artifact = load_modeling_input(pkls[0])
 
         assert '_input_metadata' in artifact
         feature_keys = sorted(k for k in artifact if not k.startswith('_'))
@@ -418,7 +418,7 @@ class TestBoutParameterExtraction:
         monkeypatch.setattr(bout_params_module.np, "array_equal", lambda *a, **k: False)
         with pytest.raises(RuntimeError, match="alignment FAILED"):
             pipeline.extract_and_save_modeling_input_data()
-        assert list(save_dir.glob('modeling_bout_durations_*.pkl')) == []
+        assert list(save_dir.glob('modeling_bout_durations_*.h5')) == []
 
 
 class TestUnivariateParamsDispatcher:
@@ -621,6 +621,9 @@ class TestBoutParameterModelSelection:
             assert 'current_features' in step
             assert 'baseline_score' in step
             assert 'candidates_summary' in step
+            if step['step_idx'] >= 1:
+                # Forward steps report the design-matrix cache's traffic.
+                assert step['design_cache']['misses'] > 0
             accepted_counts.append(len(step['current_features']))
 
         # The anchored search starts with one feature and never shrinks.
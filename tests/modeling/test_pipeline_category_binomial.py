@@ -86,6 +86,7 @@ with warnings.catch_warnings():
     import usv_playpen.modeling.main_univariate_dispatcher as univ_dispatcher
     import usv_playpen.modeling.modeling_vocal_categories_binomial as category_module
     from usv_playpen.modeling.model_selection import vocal_category_model_selection
+    from usv_playpen.modeling.modeling_input_store import load_modeling_input
     from usv_playpen.modeling.modeling_vocal_categories_binomial import (
         VocalCategoryModelingPipeline,
         _collect_category_windows,
@@ -500,8 +501,8 @@ def _extract_category_input(settings, save_dir, target_category=TARGET_CATEGORY)
     Description
     -----------
     Runs the real ``VocalCategoryModelingPipeline.extract_and_save_category_input_data``
-    once for ``target_category`` and returns both the on-disk pickle path and
-    the loaded artifact dict, asserting exactly one ``modeling_*.pkl`` was
+    once for ``target_category`` and returns both the on-disk input path and
+    the loaded artifact dict, asserting exactly one ``modeling_*.h5`` was
     produced under ``save_dir``.
 
     Parameters
@@ -509,25 +510,24 @@ def _extract_category_input(settings, save_dir, target_category=TARGET_CATEGORY)
     settings (dict)
         The synthetic ``modeling_settings`` dict.
     save_dir (pathlib.Path)
-        The pipeline output directory; the input pickle is written here.
+        The pipeline output directory; the modeling input is written here.
     target_category (int)
         The positive-class category index to extract (one-vs-rest).
 
     Returns
     -------
     pkl_path (pathlib.Path)
-        Path to the single extracted modeling input pickle.
+        Path to the single extracted modeling input.
     artifact (dict)
-        The deserialized pickle contents.
+        The loaded modeling-input contents.
     """
 
     pipeline = VocalCategoryModelingPipeline(modeling_settings_dict=settings)
     pipeline.extract_and_save_category_input_data(target_category=target_category)
 
-    pkls = list(save_dir.glob('modeling_*.pkl'))
+    pkls = list(save_dir.glob('modeling_*.h5'))
     assert len(pkls) == 1, f"expected exactly one input pickle, got {pkls}"
-    with pkls[0].open('rb') as fh:
-        artifact = pickle.load(fh)
+    artifact = load_modeling_input(pkls[0])
     return pkls[0], artifact
 
 
@@ -77,6 +77,7 @@ with warnings.catch_warnings():
     import jax.numpy as jnp
     from usv_playpen.modeling.jax_neural_network_cnn import (
         NeuralContinuousCNNRunner,
+        cnn_forward,
         init_cnn_params_and_state,
     )
 
@@ -589,6 +590,48 @@ class TestRunCnnTrainingConfigVariants:
         for cname in deep['saliency_maps']:
             assert cname.startswith('category_')
 
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    @pytest.mark.parametrize('scan_max_memory_gb', [2.0, 0.0], ids=['scan', 'prefetch'])
+    def test_device_augmentation_is_reproducible(self, tmp_path, scan_max_memory_gb):
+        """
+        With ``input_pipeline.device_augmentation`` on (masking active), the
+        fold is trained either by whole-epoch ``lax.scan`` (the fold fits
+        under ``scan_max_memory_gb``) or through the double-buffered
+        prefetcher (cap ``0``). Two runs from the same seed write identical
+        per-fold predictions.
+        """
+
+        input_pkl = _build_cnn_input_pickle(
+            save_path=tmp_path / 'manifold_input.pkl',
+            feature_names=FEATURE_NAMES,
+            session_ids=[f'session_{i}' for i in range(N_SESSIONS)],
+            history_frames=HISTORY_FRAMES,
+            n_per_session=N_PER_SESSION,
+        )
+        runs = []
+        for run_idx in range(2):
+            save_dir = tmp_path / f'out_{run_idx}'
+            settings = _build_cnn_settings(save_dir, input_pkl)
+            hp = settings['hyperparameters']['deep_learning']['cnn_continuous']
+            hp['epochs'] = 2
+            hp['use_kinematic_masking'] = True
+            hp['masking_prob'] = 0.5
+            hp['masking_length_frames'] = 3
+            hp['saliency']['enable'] = False
+            hp['input_pipeline']['device_augmentation'] = True
+            hp['input_pipeline']['scan_max_memory_gb'] = scan_max_memory_gb
+            runner = NeuralContinuousCNNRunner(modeling_settings=settings)
+            data_blocks = runner.load_multivariate_data_blocks(pkl_path=str(input_pkl))
+            runner.run_cnn_training(data_blocks=data_blocks)
+            with next(save_dir.glob('cnn_manifold_integrated_predictions_*.pkl')).open('rb') as fh:
+                runs.append(pickle.load(fh))
+
+        assert len(runs[0]['cross_validation']) == 2
+        for fold_a, fold_b in zip(runs[0]['cross_validation'], runs[1]['cross_validation']):
+            assert np.isfinite(fold_a['error_actual'])
+            np.testing.assert_array_equal(np.asarray(fold_a['Y_pred_actual']), np.asarray(fold_b['Y_pred_actual']))
+            np.testing.assert_array_equal(np.asarray(fold_a['Y_pred_null']), np.asarray(fold_b['Y_pred_null']))
+
 
 class TestRunCnnTrainingTorus:
     """The torus ``sin_cos`` output-head / wrap-aware loss + eval branches."""
@@ -784,3 +827,20 @@ class TestComputeCentroidSaliencyDirect:
         assert sal.shape == (n_take, n_feats, n_bins)
         assert sal.dtype == np.float32
         assert np.isfinite(sal).all()
+
+        # The blocked gradients match a per-mini-batch vmap(grad) over the
+        # padded tensor, and a second centroid reuses the compiled function.
+        centroid = jnp.asarray((float(Y_center[0]) + 0.1, float(Y_center[1])))
+
+        def region_scalar(x_single):
+            preds, _ = cnn_forward(params, state, x_single[jnp.newaxis, ...], Y_center, Y_scale, runner.hp)
+            return -jnp.sqrt(jnp.sum((preds[0] - centroid) ** 2))
+
+        X_pad = jnp.pad(X_te, ((0, batch_size - 1), (0, 0), (0, 0)))
+        reference = np.concatenate([
+            np.asarray(jax.vmap(jax.grad(region_scalar))(X_pad[i:i + batch_size]))
+            for i in range(0, len(X_pad), batch_size)
+        ])[:n_take]
+        blocked = runner._input_gradients('region', params, state, X_te, Y_center, Y_scale, centroid)
+        np.testing.assert_allclose(blocked, reference, rtol=1e-4, atol=1e-6)
+        assert sorted(runner._saliency_grad_fns) == ['global', 'region']
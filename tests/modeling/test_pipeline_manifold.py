@@ -69,6 +69,7 @@ from tests.modeling._synth import (
 # ["error"]`` before any per-test marker can take effect.
 with warnings.catch_warnings():
     warnings.simplefilter('ignore', DeprecationWarning)
+    from usv_playpen.modeling.modeling_input_store import load_modeling_input
     from usv_playpen.modeling.modeling_usv_manifold_position import (
         ContinuousModelingPipeline,
         ContinuousModelRunner,
@@ -80,6 +81,9 @@ with warnings.catch_warnings():
     from usv_playpen.modeling.jax_bivariate_regression import (
         SmoothBivariateRegression,
     )
+    from usv_playpen.modeling.manifold_torus_regression import (
+        SmoothTorusManifoldRegression,
+    )
     from usv_playpen.modeling.model_selection import (
         continuous_vocal_manifold_model_selection,
     )
@@ -316,11 +320,10 @@ class TestContinuousInputExtraction:
         pipeline = ContinuousModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_continuous_data()
 
-        pkls = list(save_dir.glob('modeling_manifold_*.pkl'))
+        pkls = list(save_dir.glob('modeling_manifold_*.h5'))
         assert len(pkls) == 1, f"expected exactly one manifold pickle, got {pkls}"
 
-        with pkls[0].open('rb') as fh:
-            artifact = pickle.load(fh)
+        artifact = load_modeling_input(pkls[0])
 
         assert '_input_metadata' in artifact
         feature_keys = sorted(k for k in artifact if not k.startswith('_'))
@@ -388,8 +391,7 @@ class TestContinuousInputExtraction:
         pipeline = ContinuousModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_continuous_data()
 
-        with next(save_dir.glob('modeling_manifold_*.pkl')).open('rb') as fh:
-            artifact = pickle.load(fh)
+        artifact = load_modeling_input(next(save_dir.glob('modeling_manifold_*.h5')))
 
         feature_keys = [k for k in artifact if not k.startswith('_')]
         anchor = sorted(feature_keys)[0]
@@ -444,7 +446,7 @@ class TestContinuousModelRunner:
         )
         pipeline = ContinuousModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_continuous_data()
-        input_pkl = str(next(save_dir.glob('modeling_manifold_*.pkl')))
+        input_pkl = str(next(save_dir.glob('modeling_manifold_*.h5')))
 
         runner = ContinuousModelRunner(pipeline)
         results = runner.run_univariate_training(input_pkl, 'self.speed')
@@ -496,7 +498,7 @@ class TestContinuousModelRunner:
 
         pipeline = ContinuousModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_continuous_data()
-        input_pkl = str(next(save_dir.glob('modeling_manifold_*.pkl')))
+        input_pkl = str(next(save_dir.glob('modeling_manifold_*.h5')))
 
         runner = ContinuousModelRunner(pipeline)
         results = runner.run_univariate_training(input_pkl, 'self.speed')
@@ -535,7 +537,7 @@ class TestContinuousModelRunner:
         settings['vocal_features']['usv_manifold_metric'] = 'torus'
         pipeline = ContinuousModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_continuous_data()
-        input_pkl = str(next(save_dir.glob('modeling_manifold_*.pkl')))
+        input_pkl = str(next(save_dir.glob('modeling_manifold_*.h5')))
 
         runner = ContinuousModelRunner(pipeline)
         results = runner.run_univariate_training(input_pkl, 'self.speed')
@@ -588,7 +590,7 @@ class TestContinuousModelRunner:
         }
         pipeline = ContinuousModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_continuous_data()
-        input_pkl = str(next(save_dir.glob('modeling_manifold_*.pkl')))
+        input_pkl = str(next(save_dir.glob('modeling_manifold_*.h5')))
 
         runner = ContinuousModelRunner(pipeline)
         results = runner.run_univariate_training(input_pkl, 'self.speed')
@@ -1657,6 +1659,108 @@ class TestManifoldTuner:
         assert best_lam == 10.0          # smoothest in the lower-is-better band
         assert audit['one_se_applied'] is True
 
+    def test_batched_grid_fit_matches_per_pair_loop(self, monkeypatch):
+        """
+        With the closed-form torus estimator the tuner fits the whole inner-CV
+        grid through ``fit_regularization_grid``; hiding that method forces the
+        per-pair construct-and-fit loop. Both routes see identical inner fits,
+        so the scored grid, the argmax pair and the 1-SE winner are identical.
+        """
+
+        rng = np.random.default_rng(5)
+        Y_list, groups_list = [], []
+        for sess in range(2):
+            Yc, _ = _spatial_blob(n_clusters=2, per_cluster=20, seed=sess)
+            Y_list.append((Yc / 20.0 + 0.25) % 1.0)
+            groups_list.append(np.full(len(Yc), sess))
+        Y = np.vstack(Y_list).astype(np.float64)
+        groups = np.concatenate(groups_list)
+        X = np.hstack([Y, Y ** 2, np.sin(Y)]) + 0.05 * rng.standard_normal((len(Y), 6))
+        w = rng.uniform(0.5, 1.5, size=len(Y))
+        tuner_kwargs = dict(
+            lambda_smooth_grid=np.array([0.1, 1.0, 10.0]),
+            l2_reg_grid=np.array([0.001, 0.1]),
+            inner_cv_folds=2,
+            inner_cv_scoring_metric='vm_logscore',
+            inner_cv_use_one_se_rule=True,
+            n_features=2, n_time_bins=3, spatial_cluster_num=4,
+            smoothness_derivative_order=2, huber_delta=1.0, learning_rate=0.05,
+            inner_max_iter=5, tol=0.01, random_state=0,
+            verbose=False, use_lax_loop=False,
+            regressor_cls=SmoothTorusManifoldRegression,
+            metric='torus', period=1.0,
+        )
+
+        batched = _tune_manifold_regularization(X, Y, w, groups, **tuner_kwargs)
+        monkeypatch.delattr(SmoothTorusManifoldRegression, 'fit_regularization_grid')
+        monkeypatch.delattr(SmoothBivariateRegression, 'fit_regularization_grid')
+        per_pair = _tune_manifold_regularization(X, Y, w, groups, **tuner_kwargs)
+
+        assert batched[:2] == per_pair[:2]
+        assert batched[2]['argmax_pair'] == per_pair[2]['argmax_pair']
+        assert batched[2]['grid_scores'].keys() == per_pair[2]['grid_scores'].keys()
+        np.testing.assert_allclose(
+            list(batched[2]['grid_scores'].values()),
+            list(per_pair[2]['grid_scores'].values()),
+            rtol=1e-10, atol=1e-12,
+        )
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_batched_iterative_grid_picks_the_per_pair_winner(self, monkeypatch):
+        """
+        The iterative euclidean estimator under the runners' Python-loop
+        setting (``use_lax_loop=False``): the batched grid fit stops each lane
+        where that loop would, so the tuner selects the same
+        ``(lambda_smooth, l2_reg)`` as the legacy construct-and-fit loop, with
+        grid scores equal up to float32 rounding.
+        """
+
+        rng = np.random.default_rng(11)
+        Y_list, groups_list = [], []
+        for sess in range(2):
+            Yc, _ = _spatial_blob(n_clusters=2, per_cluster=25, seed=sess)
+            Y_list.append(Yc)
+            groups_list.append(np.full(len(Yc), sess))
+        Y = np.vstack(Y_list).astype(np.float64)
+        groups = np.concatenate(groups_list)
+        X = np.hstack([Y, Y ** 2, np.sin(Y)]) + 0.1 * rng.standard_normal((len(Y), 6))
+        X = (X - X.mean(axis=0)) / X.std(axis=0)
+        w = rng.uniform(0.5, 1.5, size=len(Y))
+        tuner_kwargs = dict(
+            lambda_smooth_grid=np.array([0.01, 1.0, 100.0]),
+            l2_reg_grid=np.array([0.001, 1.0]),
+            inner_cv_folds=2,
+            inner_cv_scoring_metric='r2_spatial',
+            inner_cv_use_one_se_rule=False,
+            n_features=2, n_time_bins=3, spatial_cluster_num=4,
+            smoothness_derivative_order=2, huber_delta=1.0, learning_rate=0.05,
+            inner_max_iter=300, tol=1e-3, random_state=0,
+            verbose=False, use_lax_loop=False,
+            regressor_cls=SmoothBivariateRegression,
+            metric='euclidean', period=1.0,
+        )
+
+        grid_calls = []
+        grid_fit = SmoothBivariateRegression.fit_regularization_grid
+
+        def _counting_grid_fit(self, *args, **kwargs):
+            grid_calls.append(self._use_lax_loop)
+            return grid_fit(self, *args, **kwargs)
+
+        monkeypatch.setattr(SmoothBivariateRegression, 'fit_regularization_grid', _counting_grid_fit)
+        batched = _tune_manifold_regularization(X, Y, w, groups, **tuner_kwargs)
+        assert grid_calls == [False]
+        monkeypatch.delattr(SmoothBivariateRegression, 'fit_regularization_grid')
+        per_pair = _tune_manifold_regularization(X, Y, w, groups, **tuner_kwargs)
+
+        assert batched[:2] == per_pair[:2]
+        assert batched[2]['argmax_pair'] == per_pair[2]['argmax_pair']
+        np.testing.assert_allclose(
+            list(batched[2]['grid_scores'].values()),
+            list(per_pair[2]['grid_scores'].values()),
+            rtol=1e-4, atol=1e-5,
+        )
+
 
 class TestInverseDensityWeights:
     """Direct coverage of the KDE inverse-density weighting helper."""
@@ -1733,7 +1837,7 @@ class TestContinuousRunnerExtra:
         )
         pipeline = ContinuousModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_continuous_data()
-        input_pkl = str(next(save_dir.glob('modeling_manifold_*.pkl')))
+        input_pkl = str(next(save_dir.glob('modeling_manifold_*.h5')))
 
         runner = ContinuousModelRunner(pipeline)
         with pytest.raises(KeyError, match="not found"):
@@ -1750,7 +1854,7 @@ class TestContinuousRunnerExtra:
         settings, save_dir = _build_manifold_settings(tmp_path)
         pipeline = ContinuousModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_continuous_data()
-        input_pkl = str(next(save_dir.glob('modeling_manifold_*.pkl')))
+        input_pkl = str(next(save_dir.glob('modeling_manifold_*.h5')))
 
         blocks = ContinuousModelRunner.load_univariate_data_blocks(
             input_pkl, bin_size=10, feature_filter=None,
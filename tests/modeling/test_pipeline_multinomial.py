@@ -83,6 +83,7 @@ with warnings.catch_warnings():
     from usv_playpen.modeling.jax_multinomial_logistic_regression import (
         SmoothMultinomialLogisticRegression,
     )
+    from usv_playpen.modeling.modeling_input_store import load_modeling_input
     from usv_playpen.modeling.modeling_vocal_categories_multinomial import (
         MultinomialModelingPipeline,
         MultinomialModelRunner,
@@ -630,11 +631,10 @@ class TestMultinomialInputExtraction:
         pipeline = MultinomialModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_multinomial_input_data()
 
-        pkls = list(save_dir.glob('modeling_multinomial_*.pkl'))
+        pkls = list(save_dir.glob('modeling_multinomial_*.h5'))
         assert len(pkls) == 1, f"expected exactly one input pickle, got {pkls}"
 
-        with pkls[0].open('rb') as fh:
-            artifact = pickle.load(fh)
+        artifact = load_modeling_input(pkls[0])
 
         assert '_input_metadata' in artifact
         feature_keys = sorted(k for k in artifact if not k.startswith('_'))
@@ -958,6 +958,65 @@ class TestMultinomialUnivariateRunner:
         }
         assert len(audit['grid_scores']) == lambda_grid.size * l2_grid.size
 
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_batched_grid_picks_the_per_pair_winner(self, monkeypatch):
+        """
+        Under the runners' Python-loop setting (``use_lax_loop=False``) the
+        batched grid fit stops each lane where that loop would, so the tuner
+        selects the same ``(lambda_smooth, l2_reg)`` as the legacy
+        construct-and-fit loop. The grid scores agree to the float32 drift of
+        300 Adam steps (the batched lanes sum over padded, masked rows), which
+        is largest in the stiff ``lambda_smooth=100`` corner.
+        """
+
+        rng = np.random.default_rng(3)
+        n_per_class, n_time = 30, 3
+        y = np.repeat([0, 1, 2], n_per_class).astype(np.int32)
+        shift = (y.astype(float) - 1.0)[:, None]
+        X = (0.6 * shift + rng.standard_normal((y.size, n_time))).astype(np.float32)
+        tuner_kwargs = dict(
+            lambda_smooth_grid=np.array([0.01, 1.0, 100.0]),
+            l2_reg_grid=np.array([0.001, 1.0]),
+            inner_cv_folds=2,
+            inner_cv_scoring_metric='ll',
+            inner_cv_use_one_se_rule=False,
+            n_features=1,
+            n_time_bins=n_time,
+            smoothness_derivative_order=1,
+            focal_gamma=0.0,
+            uniform_class_weights=False,
+            learning_rate=0.05,
+            inner_max_iter=300,
+            tol=1e-3,
+            random_state=0,
+            verbose=False,
+            use_lax_loop=False,
+            regressor_cls=SmoothMultinomialLogisticRegression,
+        )
+
+        grid_calls = []
+        grid_fit = SmoothMultinomialLogisticRegression.fit_regularization_grid
+
+        def _counting_grid_fit(self, *args, **kwargs):
+            grid_calls.append(self._use_lax_loop)
+            return grid_fit(self, *args, **kwargs)
+
+        monkeypatch.setattr(SmoothMultinomialLogisticRegression, 'fit_regularization_grid', _counting_grid_fit)
+        batched = _tune_multinomial_regularization(X, y, **tuner_kwargs)
+        assert grid_calls == [False]
+        monkeypatch.delattr(SmoothMultinomialLogisticRegression, 'fit_regularization_grid')
+        per_pair = _tune_multinomial_regularization(X, y, **tuner_kwargs)
+
+        assert batched[:2] == per_pair[:2]
+        assert batched[2]['argmax_pair'] == per_pair[2]['argmax_pair']
+        np.testing.assert_allclose(
+            list(batched[2]['grid_scores'].values()),
+            list(per_pair[2]['grid_scores'].values()),
+            rtol=0.0, atol=5e-3,
+        )
+
 
 class TestMultinomialModelSelection:
     """The real JAX-driven forward-stepwise multinomial selection orchestrator."""
@@ -1037,6 +1096,70 @@ class TestMultinomialModelSelection:
         # The forward search never drops an already-accepted feature.
         assert accepted_counts == sorted(accepted_counts)
 
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_multinomial_selection_process_pool_matches_serial(self, tmp_path):
+        """
+        With ``selection_scheduler.n_workers=2`` the candidates of every step
+        are scored on a loky process pool (the selector's candidate closure is
+        shipped to the workers); the run selects the same features with the
+        same per-fold candidate scores as the serial scheduler.
+        """
+
+        settings, _ = _build_extraction_settings(
+            tmp_path, model_engine='sklearn', split_strategy='mixed', split_num=2,
+            test_proportion=0.4,
+        )
+        feature_names = ['self.speed', 'other.speed', 'self.neck_elevation']
+        input_pkl = str(build_multinomial_input_pickle(
+            save_path=tmp_path / 'modeling_multinomial_input.pkl',
+            feature_names=feature_names,
+            session_ids=[f'session_{i}' for i in range(N_SESSIONS)],
+            history_frames=HISTORY_FRAMES,
+            n_categories=N_CATEGORIES,
+            n_per_class_per_session=18,
+        ))
+        univ_pkl = str(build_univariate_ranking_pickle(
+            save_path=tmp_path / 'univariate_combined.pkl',
+            feature_names=feature_names,
+            n_splits=settings['model_validation']['n_cv_folds'],
+        ))
+
+        steps = {}
+        for n_workers in (1, 2):
+            settings['hyperparameters']['selection_scheduler'] = {
+                'executor': 'local', 'n_workers': n_workers,
+                'poll_interval_secs': 30.0, 'barrier_timeout_hours': 48.0,
+            }
+            settings_json = tmp_path / f'settings_{n_workers}.json'
+            settings_json.write_text(json.dumps(settings))
+            ms_dir = tmp_path / f'model_selection_{n_workers}'
+            ms_dir.mkdir()
+            multinomial_vocal_category_model_selection(
+                univariate_results_path=univ_pkl,
+                input_data_path=input_pkl,
+                settings_path=str(settings_json),
+                output_directory=str(ms_dir),
+                use_top_rank_as_anchor=True,
+                p_val=0.05,
+            )
+            steps[n_workers] = []
+            for step_pkl in sorted(ms_dir.glob('model_selection_multinomial_*_step_*.pkl')):
+                with step_pkl.open('rb') as fh:
+                    steps[n_workers].append(pickle.load(fh))
+            assert not list(ms_dir.glob('*_candidates'))
+
+        assert len(steps[2]) == len(steps[1]) >= 2
+        for pooled, serial in zip(steps[2], steps[1]):
+            assert pooled['current_features'] == serial['current_features']
+            assert pooled['candidates_summary'].keys() == serial['candidates_summary'].keys()
+            for cand, summary in serial['candidates_summary'].items():
+                np.testing.assert_allclose(
+                    pooled['candidates_summary'][cand]['folds']['metrics']['auc'],
+                    summary['folds']['metrics']['auc'],
+                )
+
     @pytest.mark.filterwarnings("ignore::RuntimeWarning")
     @pytest.mark.filterwarnings("ignore::UserWarning")
     @pytest.mark.filterwarnings("ignore::DeprecationWarning")
@@ -1570,10 +1693,9 @@ class TestMultinomialExtractionEdgeCases:
         pipeline = MultinomialModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_multinomial_input_data()
 
-        pkls = list(save_dir.glob('modeling_multinomial_*.pkl'))
+        pkls = list(save_dir.glob('modeling_multinomial_*.h5'))
         assert len(pkls) == 1
-        with pkls[0].open('rb') as fh:
-            artifact = pickle.load(fh)
+        artifact = load_modeling_input(pkls[0])
         ibi = artifact['_input_metadata']['ibi_thresholds']
         assert np.isnan(ibi['male']) and np.isnan(ibi['female'])
 
@@ -1614,7 +1736,7 @@ class TestMultinomialExtractionEdgeCases:
         pipeline = MultinomialModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_multinomial_input_data()
 
-        assert list(save_dir.glob('modeling_multinomial_*.pkl')) == []
+        assert list(save_dir.glob('modeling_multinomial_*.h5')) == []
 
     @pytest.mark.filterwarnings("ignore:Bitwise inversion:DeprecationWarning")
     @pytest.mark.filterwarnings("ignore::astropy.utils.exceptions.AstropyUserWarning")
@@ -1637,10 +1759,9 @@ class TestMultinomialExtractionEdgeCases:
         pipeline = MultinomialModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_multinomial_input_data()
 
-        pkls = list(save_dir.glob('modeling_multinomial_*.pkl'))
+        pkls = list(save_dir.glob('modeling_multinomial_*.h5'))
         assert len(pkls) == 1
-        with pkls[0].open('rb') as fh:
-            artifact = pickle.load(fh)
+        artifact = load_modeling_input(pkls[0])
         feature_keys = [k for k in artifact if not k.startswith('_')]
         assert any(
             tok in k for k in feature_keys
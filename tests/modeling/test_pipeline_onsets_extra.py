@@ -51,7 +51,6 @@ plotting code is pulled in transitively.
 
 from __future__ import annotations
 
-import pickle
 import warnings
 from pathlib import Path
 
@@ -75,6 +74,7 @@ from tests.modeling._synth import (
 # ["error"]`` before any per-test marker can take effect.
 with warnings.catch_warnings():
     warnings.simplefilter('ignore', DeprecationWarning)
+    from usv_playpen.modeling.modeling_input_store import load_modeling_input
     from usv_playpen.modeling.modeling_vocal_onsets import VocalOnsetModelingPipeline
 
 
@@ -655,16 +655,16 @@ class TestExtractionGuards:
         pipeline = VocalOnsetModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_modeling_input_data()
 
-        pkls = list(save_dir.glob('modeling_*.pkl'))
+        pkls = list(save_dir.glob('modeling_*.h5'))
         assert len(pkls) == 1
 
     @pytest.mark.filterwarnings("ignore:Bitwise inversion:DeprecationWarning")
     @pytest.mark.filterwarnings("ignore::astropy.utils.exceptions.AstropyUserWarning")
     def test_extraction_save_failure_is_caught(self, tmp_path, monkeypatch):
         """
-        When the terminal ``pickle.dump`` raises, the extraction's save ``try``
-        swallows it and prints an error rather than propagating — the
-        save-failure ``except`` branch. The module-level ``pickle.dump`` is
+        When writing the modeling-input store raises, the extraction's save
+        ``try`` swallows it and prints an error rather than propagating — the
+        save-failure ``except`` branch. The store's feature writer is
         monkeypatched to raise; everything upstream still runs to completion.
         """
 
@@ -690,20 +690,19 @@ class TestExtractionGuards:
         )
         settings['model_params']['usv_bout_time'] = FILTER_HISTORY
 
-        import usv_playpen.modeling.modeling_vocal_onsets as onsets_mod
+        import usv_playpen.modeling.modeling_input_store as store_mod
 
         def _boom(*_args, **_kwargs):
-            raise OSError("simulated pickle write failure")
+            raise OSError("simulated store write failure")
 
-        monkeypatch.setattr(onsets_mod.pickle, 'dump', _boom)
+        monkeypatch.setattr(store_mod, '_write_node', _boom)
 
         pipeline = VocalOnsetModelingPipeline(modeling_settings_dict=settings)
-        # Must NOT raise: the save failure is caught and logged. The
-        # ``save_path.open('wb')`` may leave a zero-byte file behind (the failure
-        # happens during ``pickle.dump``), so any artifact present is empty.
+        # Must NOT raise: the save failure is caught and logged. The store is
+        # written through ``atomic_output_path``, so neither the artifact nor
+        # its temporary sibling is left behind.
         pipeline.extract_and_save_modeling_input_data()
-        for pkl in save_dir.glob('modeling_*.pkl'):
-            assert pkl.stat().st_size == 0
+        assert [p for p in save_dir.iterdir() if 'modeling_' in p.name] == []
 
     @pytest.mark.filterwarnings("ignore:Bitwise inversion:DeprecationWarning")
     @pytest.mark.filterwarnings("ignore::astropy.utils.exceptions.AstropyUserWarning")
@@ -783,13 +782,12 @@ class TestExtractionGuards:
         pipeline = VocalOnsetModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_modeling_input_data()
 
-        pkls = list(save_dir.glob('modeling_*.pkl'))
+        pkls = list(save_dir.glob('modeling_*.h5'))
         assert len(pkls) == 1
         expected_tag = 'individual_cat_vae_supercategory_1'
         assert expected_tag in pkls[0].name
 
-        with pkls[0].open('rb') as fh:
-            artifact = pickle.load(fh)
+        artifact = load_modeling_input(pkls[0])
         md = artifact['_input_metadata']
         assert md['analysis_tag'] == expected_tag
         assert md['analysis_specific']['onset_target_category'] == 1
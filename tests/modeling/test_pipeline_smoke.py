@@ -69,6 +69,7 @@ with warnings.catch_warnings():
     import usv_playpen.modeling.main_model_selection_dispatcher as ms_dispatcher
     import usv_playpen.modeling.main_univariate_dispatcher as univ_dispatcher
     from usv_playpen.modeling.model_selection import vocal_onset_model_selection
+    from usv_playpen.modeling.modeling_input_store import load_modeling_input
     from usv_playpen.modeling.modeling_vocal_onsets import VocalOnsetModelingPipeline
 
 
@@ -222,11 +223,10 @@ class TestOnsetInputExtraction:
         pipeline = VocalOnsetModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_modeling_input_data()
 
-        pkls = list(save_dir.glob('modeling_*.pkl'))
+        pkls = list(save_dir.glob('modeling_*.h5'))
         assert len(pkls) == 1, f"expected exactly one input pickle, got {pkls}"
 
-        with pkls[0].open('rb') as fh:
-            artifact = pickle.load(fh)
+        artifact = load_modeling_input(pkls[0])
 
         assert '_input_metadata' in artifact
         feature_keys = sorted(k for k in artifact if not k.startswith('_'))
@@ -281,8 +281,7 @@ class TestOnsetInputExtraction:
         pipeline = VocalOnsetModelingPipeline(modeling_settings_dict=settings)
         pipeline.extract_and_save_modeling_input_data()
 
-        with next(save_dir.glob('modeling_*.pkl')).open('rb') as fh:
-            artifact = pickle.load(fh)
+        artifact = load_modeling_input(next(save_dir.glob('modeling_*.h5')))
 
         feature_keys = {k for k in artifact if not k.startswith('_')}
         assert 'other.usv_cat_1' in feature_keys
@@ -0,0 +1,167 @@
+"""
+@author: bartulem
+Unit tests for ``usv_playpen.modeling.selection_scheduler`` — serial and
+process-pool candidate evaluation, per-candidate checkpoint resume and its
+run digest, SLURM job-array sharding with its file-system barrier, and the
+settings block.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from usv_playpen.modeling.selection_scheduler import CandidateScheduler, checkpoint_run_digest
+
+CANDIDATES = ['self.speed', 'other.speed', 'allo/nose-nose', 'self.acceleration']
+
+
+def _score(candidate: str) -> dict:
+    return {'candidate': candidate, 'score': float(len(candidate))}
+
+
+@pytest.fixture
+def no_slurm_env(monkeypatch):
+    for key in ('SLURM_ARRAY_TASK_ID', 'SLURM_ARRAY_TASK_MIN', 'SLURM_ARRAY_TASK_COUNT'):
+        monkeypatch.delenv(key, raising=False)
+
+
+def test_serial_evaluate_resumes_from_checkpoints(tmp_path, no_slurm_env):
+    """Results come back in candidate order; a rerun with the same context
+    re-evaluates nothing, a different context re-evaluates everything, and
+    ``discard`` removes the step's checkpoints."""
+
+    calls = []
+
+    def evaluate_fn(candidate):
+        calls.append(candidate)
+        return _score(candidate)
+
+    scheduler = CandidateScheduler()
+    checkpoint_dir = tmp_path / 'onset_step_1_candidates'
+    results = scheduler.evaluate(CANDIDATES, evaluate_fn, checkpoint_dir=checkpoint_dir, context=['self.x'])
+    assert list(results) == CANDIDATES
+    assert results['other.speed'] == _score('other.speed')
+    assert calls == CANDIDATES
+    assert len(list(checkpoint_dir.glob('*.pkl'))) == len(CANDIDATES)
+
+    calls.clear()
+    assert scheduler.evaluate(CANDIDATES, evaluate_fn, checkpoint_dir=checkpoint_dir, context=['self.x']) == results
+    assert calls == []
+
+    scheduler.evaluate(CANDIDATES[:2], evaluate_fn, checkpoint_dir=checkpoint_dir, context=['self.x', 'self.y'])
+    assert calls == CANDIDATES[:2]
+
+    scheduler.discard(checkpoint_dir)
+    assert not checkpoint_dir.exists()
+
+
+def test_changed_run_digest_forces_reevaluation(tmp_path, no_slurm_env):
+    """Checkpoints left by a run with other settings, inputs or selector are
+    stale: a step whose run digest differs re-evaluates every candidate even
+    under the same selected-feature context."""
+
+    settings_json = tmp_path / 'settings.json'
+    settings_json.write_text('{"model_validation": {"n_cv_folds": 5}}')
+    digest = checkpoint_run_digest(settings_json, tmp_path / 'input.pkl', tmp_path / 'univariate.pkl', 'onset_step_')
+    assert digest == checkpoint_run_digest(str(settings_json), tmp_path / 'input.pkl',
+                                           tmp_path / 'univariate.pkl', 'onset_step_')
+    assert digest != checkpoint_run_digest(settings_json, tmp_path / 'other.pkl', tmp_path / 'univariate.pkl', 'onset_step_')
+    assert digest != checkpoint_run_digest(settings_json, tmp_path / 'input.pkl', tmp_path / 'univariate.pkl', 'bout_step_')
+
+    calls = []
+
+    def evaluate_fn(candidate):
+        calls.append(candidate)
+        return _score(candidate)
+
+    scheduler = CandidateScheduler()
+    checkpoint_dir = tmp_path / 'onset_step_1_candidates'
+    scheduler.evaluate(CANDIDATES, evaluate_fn, checkpoint_dir=checkpoint_dir, context=['self.x'], run_digest=digest)
+    calls.clear()
+    scheduler.evaluate(CANDIDATES, evaluate_fn, checkpoint_dir=checkpoint_dir, context=['self.x'], run_digest=digest)
+    assert calls == []
+
+    settings_json.write_text('{"model_validation": {"n_cv_folds": 10}}')
+    edited = checkpoint_run_digest(settings_json, tmp_path / 'input.pkl', tmp_path / 'univariate.pkl', 'onset_step_')
+    assert edited != digest
+    scheduler.evaluate(CANDIDATES, evaluate_fn, checkpoint_dir=checkpoint_dir, context=['self.x'], run_digest=edited)
+    assert calls == CANDIDATES
+
+
+def test_process_pool_matches_serial(tmp_path, no_slurm_env):
+    """A two-worker loky pool returns the serial results, in candidate order,
+    for a closure over a (memory-mapped) numpy array."""
+
+    weights = np.arange(200_000, dtype=np.float64)
+
+    def evaluate_fn(candidate):
+        return float(weights[:len(candidate)].sum())
+
+    serial = CandidateScheduler().evaluate(CANDIDATES, evaluate_fn, checkpoint_dir=tmp_path / 'serial', context=[])
+    pooled = CandidateScheduler(n_workers=2).evaluate(CANDIDATES, evaluate_fn, checkpoint_dir=tmp_path / 'pooled', context=[])
+    assert list(pooled) == CANDIDATES
+    assert pooled == serial
+
+
+def test_slurm_array_shards_and_waits_for_peers(tmp_path, monkeypatch):
+    """Task 1 of a two-task array scores every other candidate by rank, even
+    when task 0 has already finished its share, combines both shares, and
+    publishes privately."""
+
+    monkeypatch.setenv('SLURM_ARRAY_TASK_ID', '5')
+    monkeypatch.setenv('SLURM_ARRAY_TASK_MIN', '4')
+    monkeypatch.setenv('SLURM_ARRAY_TASK_COUNT', '2')
+    checkpoint_dir = tmp_path / 'onset_step_1_candidates'
+
+    # Task 0's share, already checkpointed.
+    peer = CandidateScheduler()
+    peer.evaluate(CANDIDATES[0::2], _score, checkpoint_dir=checkpoint_dir, context=[])
+
+    calls = []
+
+    def evaluate_fn(candidate):
+        calls.append(candidate)
+        return _score(candidate)
+
+    scheduler = CandidateScheduler(executor='slurm_array', poll_interval_secs=0.0)
+    assert (scheduler.shard_index, scheduler.n_shards) == (1, 2)
+    assert not scheduler.is_primary
+    assert scheduler.publish_directory(tmp_path) == tmp_path / '.shard_1'
+    assert (tmp_path / '.shard_1').is_dir()
+
+    results = scheduler.evaluate(CANDIDATES, evaluate_fn, checkpoint_dir=checkpoint_dir, context=[])
+    assert calls == CANDIDATES[1::2]
+    assert results == {cand: _score(cand) for cand in CANDIDATES}
+
+    scheduler.discard(checkpoint_dir)
+    assert checkpoint_dir.is_dir()
+
+
+def test_slurm_array_barrier_times_out(tmp_path, monkeypatch):
+    """A task whose peers never deliver gives up after the barrier timeout."""
+
+    monkeypatch.setenv('SLURM_ARRAY_TASK_ID', '0')
+    monkeypatch.setenv('SLURM_ARRAY_TASK_COUNT', '2')
+    scheduler = CandidateScheduler(executor='slurm_array', poll_interval_secs=0.01, barrier_timeout_hours=1e-6)
+    assert scheduler.is_primary
+
+    with pytest.raises(TimeoutError, match='other.speed'):
+        scheduler.evaluate(CANDIDATES, _score, checkpoint_dir=tmp_path / 'candidates', context=[])
+
+
+def test_from_settings(no_slurm_env):
+    """The settings block configures the scheduler; a missing block is serial;
+    unknown executors raise."""
+
+    default = CandidateScheduler.from_settings({'hyperparameters': {}})
+    assert (default.executor, default.n_workers, default.n_shards) == ('local', 1, 1)
+
+    configured = CandidateScheduler.from_settings({'hyperparameters': {'selection_scheduler': {
+        'executor': 'slurm_array', 'n_workers': 4, 'poll_interval_secs': 5.0, 'barrier_timeout_hours': 2.0}}})
+    assert configured.n_workers == 4 and configured.barrier_timeout_secs == 7200.0
+    # Outside a job array a 'slurm_array' scheduler is the only shard.
+    assert configured.n_shards == 1 and configured.is_primary
+
+    with pytest.raises(ValueError, match='executor'):
+        CandidateScheduler(executor='dask')
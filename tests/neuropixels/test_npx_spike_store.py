@@ -0,0 +1,176 @@
+"""
+@author: bartulem
+Tests for ``usv_playpen.neuropixels.spike_store``.
+
+A small store is written from synthetic spike trains and read back:
+per-unit views must be exact, zero-copy memory maps, region selection
+must follow the Kilosort-row converter ranges, the legacy export must
+reproduce the ``cluster_data`` arrays, and unit discovery must prefer a
+probe's store while falling back to legacy files for probes without one.
+"""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+from usv_playpen.neuropixels.spike_store import (
+    SpikeStore,
+    StoredUnit,
+    discover_session_units,
+    load_unit_spikes,
+    session_unit_spike_counts,
+    spike_store_path,
+    write_spike_store,
+)
+
+
+def _write_session_store(session_root):
+    """
+    Description
+    -----------
+    Write a three-unit imec0 store (one unit without spikes) into a
+    synthetic session and return the spike trains it holds.
+
+    Parameters
+    ----------
+    session_root : pathlib.Path
+        Session root directory.
+
+    Returns
+    -------
+    dict
+        Unit name to ``(seconds, frames)``.
+    """
+    rng = np.random.default_rng(3)
+    units = {}
+    for unit_name, n_spikes in (
+        ("imec0_cl0003_ch012_good", 40),
+        ("imec0_cl0007_ch130_mua", 25),
+        ("imec0_cl0009_ch131_good", 0),
+    ):
+        seconds = np.sort(rng.uniform(0.0, 100.0, n_spikes))
+        units[unit_name] = (seconds, np.round(seconds * 150.0))
+    store_path = spike_store_path(session_root, "imec0")
+    store_path.parent.mkdir(parents=True)
+    write_spike_store(
+        store_path=store_path,
+        unit_names=list(units),
+        spike_seconds=[seconds for seconds, _ in units.values()],
+        spike_frames=[frames for _, frames in units.values()],
+        unit_regions=["PAG", "MRN", "MRN"],
+        attrs={"probe_id": "imec0"},
+    )
+    return units
+
+
+def test_spike_store_round_trip_is_zero_copy(tmp_path):
+    """
+    Description
+    -----------
+    Per-unit views must match the written spike trains exactly, come out
+    of one memory map of the file, and rebuild the legacy (2, n) arrays.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Per-test temp directory.
+
+    Returns
+    -------
+    None
+    """
+    units = _write_session_store(tmp_path)
+    with SpikeStore(spike_store_path(tmp_path, "imec0")) as store:
+        assert store.unit_names == list(units)
+        assert store.attrs["probe_id"] == "imec0"
+        assert store.unit_metadata["cluster_id"].tolist() == [3, 7, 9]
+        assert store.unit_metadata["group"] == ["good", "mua", "good"]
+        for unit_name, (seconds, frames) in units.items():
+            np.testing.assert_array_equal(store.seconds(unit_name), seconds)
+            np.testing.assert_array_equal(store.frames(unit_name), frames.astype(np.int64))
+            legacy = store.unit_array(unit_name)
+            assert legacy.shape == (2, seconds.size)
+            np.testing.assert_array_equal(legacy, np.vstack((seconds, frames)))
+            assert store.n_spikes(unit_name) == seconds.size
+        first_view = store.seconds("imec0_cl0003_ch012_good")
+        assert isinstance(first_view.base, np.memmap) or isinstance(first_view, np.memmap)
+        assert not first_view.flags.writeable
+        with pytest.raises(KeyError):
+            store.seconds("imec0_cl9999_ch000_good")
+
+
+def test_spike_store_region_selection(tmp_path):
+    """
+    Description
+    -----------
+    Region access must use the stored region column by default and the
+    Kilosort-row channel ranges (``hi`` exclusive) when converter ranges
+    are given.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Per-test temp directory.
+
+    Returns
+    -------
+    None
+    """
+    units = _write_session_store(tmp_path)
+    with SpikeStore(spike_store_path(tmp_path, "imec0")) as store:
+        assert store.units_in_region("MRN") == ["imec0_cl0007_ch130_mua", "imec0_cl0009_ch131_good"]
+        region_ranges = {"SCdg": [[0, 20]], "PAG": [[100, 131]]}
+        assert store.units_in_region("PAG", region_ranges) == ["imec0_cl0007_ch130_mua"]
+        assert store.units_in_region("VTA", region_ranges) == []
+        bulk = store.region_seconds("SCdg", region_ranges)
+        np.testing.assert_array_equal(bulk["imec0_cl0003_ch012_good"], units["imec0_cl0003_ch012_good"][0])
+        assert store.select_units(groups=["good"], regions=["MRN"]) == ["imec0_cl0009_ch131_good"]
+
+
+def test_spike_store_legacy_export_and_discovery(tmp_path):
+    """
+    Description
+    -----------
+    The legacy export must write one loadable (2, n) .npy per unit;
+    discovery must return picklable store handles for a probe with a
+    store and legacy files for a probe without one, and spike counts must
+    come from either source.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Per-test temp directory.
+
+    Returns
+    -------
+    None
+    """
+    units = _write_session_store(tmp_path)
+    export_dir = tmp_path / "export"
+    with SpikeStore(spike_store_path(tmp_path, "imec0")) as store:
+        npy_paths = store.export_legacy_npy(export_dir)
+    assert [p.stem for p in npy_paths] == list(units)
+    for unit_name, (seconds, frames) in units.items():
+        np.testing.assert_array_equal(np.load(export_dir / f"{unit_name}.npy"), np.vstack((seconds, frames)))
+
+    legacy_dir = tmp_path / "ephys" / "imec1" / "cluster_data"
+    legacy_dir.mkdir(parents=True)
+    np.save(legacy_dir / "imec1_cl0001_ch005_good.npy", np.zeros((2, 12)))
+
+    discovered = discover_session_units(tmp_path)
+    assert [unit.stem for unit in discovered] == list(units) + ["imec1_cl0001_ch005_good"]
+    assert isinstance(discovered[0], StoredUnit)
+    assert pickle.loads(pickle.dumps(discovered[0])) == discovered[0]
+    np.testing.assert_array_equal(load_unit_spikes(discovered[1]), np.vstack(units["imec0_cl0007_ch130_mua"]))
+    assert load_unit_spikes(discovered[-1]).shape == (2, 12)
+    assert [unit.stem for unit in discover_session_units(tmp_path, groups=("good",))] == [
+        "imec0_cl0003_ch012_good", "imec0_cl0009_ch131_good", "imec1_cl0001_ch005_good",
+    ]
+
+    assert session_unit_spike_counts(tmp_path, "imec0") == {
+        unit_name: seconds.size for unit_name, (seconds, _) in units.items()
+    }
+    assert session_unit_spike_counts(tmp_path, "imec1") == {"imec1_cl0001_ch005_good": 12}
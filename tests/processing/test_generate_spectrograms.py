@@ -12,12 +12,14 @@ with the expected datasets and shapes.
 from __future__ import annotations
 
 import h5py
+import librosa
 import numpy as np
 import polars as pls
 
 from usv_playpen.processing.generate_spectrograms import (
     SpectrogramGenerator,
     compute_usv_spectrogram,
+    compute_usv_spectrogram_batch,
 )
 
 _SPEC_PARAMS = {
@@ -84,6 +86,65 @@ def test_compute_usv_spectrogram_too_short_returns_none():
     assert n_time == 0
 
 
+def _reference_usv_spectrogram(segment, sr, spec_params):
+    """Per-channel, per-time-slice computation the batched engine replaced:
+    one librosa.stft + power_to_db per channel and one np.interp per time
+    slice, then the variance-weighted channel average and normalization."""
+    nperseg, hop = spec_params["nperseg"], spec_params["hop_length"]
+    freqs = librosa.fft_frequencies(sr=sr, n_fft=nperseg)
+    freq_mask = (freqs >= spec_params["min_freq"]) & (freqs <= spec_params["max_freq"])
+    freq_interp = np.linspace(0, 1, spec_params["num_freq_bins"])
+    freq_orig = np.linspace(0, 1, int(freq_mask.sum()))
+    specs, variances, n_time = [], [], 0
+    for ch_idx in range(segment.shape[1]):
+        channel = segment[:, ch_idx].astype(np.float64)
+        channel = channel - np.mean(channel)
+        power = np.abs(librosa.stft(channel, n_fft=nperseg, hop_length=hop, win_length=nperseg,
+                                    window=spec_params["window"], center=True)) ** 2
+        spec_db = librosa.power_to_db(power[freq_mask], ref=np.max)
+        spec_db = np.stack([np.interp(freq_interp, freq_orig, spec_slice) for spec_slice in spec_db.T]).T
+        n_time = spec_db.shape[1]
+        specs.append(librosa.util.fix_length(spec_db, size=spec_params["num_time_bins"], axis=1))
+        variances.append(float(np.var(channel)))
+    weights = np.asarray(variances) if sum(variances) > 0 else np.ones(len(variances))
+    avg = np.average(np.asarray(specs), axis=0, weights=weights)
+    avg = avg - avg.min()
+    return avg / (avg.max() + 1e-6), n_time
+
+
+def test_compute_usv_spectrogram_batch_matches_per_channel_reference():
+    """The batched engine (length-sorted, zero-padded multi-segment STFT and a
+    frequency-interpolation matrix) must reproduce the per-channel reference
+    for segments shorter and longer than num_time_bins frames, a silent
+    segment (uniform weights), and must leave too-short segments as zero rows
+    with duration 0, in input order."""
+    sr = 250000
+    rng = np.random.default_rng(5)
+    t = np.arange(90000) / sr
+    chirp = (6000 * np.sin(2 * np.pi * (40000 + 20000 * t) * t)).astype(np.int16)
+    segments = [
+        rng.integers(-8000, 8000, size=(12500, 4), dtype=np.int16),
+        np.zeros((900, 4), dtype=np.int16),
+        (chirp[:, None] + rng.integers(-500, 500, size=(90000, 4))).astype(np.int16),
+        rng.integers(-8000, 8000, size=(2048, 4), dtype=np.int16),
+        np.zeros((6000, 4), dtype=np.int16),
+        rng.integers(-300, 300, size=(31337, 4), dtype=np.int16),
+    ]
+    specs, durations = compute_usv_spectrogram_batch(segments, sr, _SPEC_PARAMS, normalize=True)
+    assert specs.shape == (len(segments), 128, 128)
+    for seg_idx, segment in enumerate(segments):
+        if segment.shape[0] < _SPEC_PARAMS["nperseg"]:
+            assert durations[seg_idx] == 0 and not specs[seg_idx].any()
+            continue
+        reference, reference_time_bins = _reference_usv_spectrogram(segment, sr, _SPEC_PARAMS)
+        assert durations[seg_idx] == reference_time_bins
+        np.testing.assert_allclose(specs[seg_idx], reference, rtol=0, atol=1e-9)
+        # alone in its batch, no longer segment sets the padded frame count
+        single_spec, _ = compute_usv_spectrogram(segment, sr, _SPEC_PARAMS)
+        np.testing.assert_allclose(single_spec, reference, rtol=0, atol=1e-9)
+    assert durations[2] > 128 > durations[0]
+
+
 def test_generate_session_spectrograms_writes_h5(tmp_path, mocker):
     """End-to-end: a session with N valid USVs writes the consolidated layout
     (top-level ``frequency_bins`` + a ``spectrogram/<session>`` group with
@@ -26,6 +26,7 @@ matplotlib.use("Agg")
 from usv_playpen.processing.das_inference import (
     FindMouseVocalizations,
     _DAS_ANNOTATION_FILE_RE,
+    _usv_noise_descriptors,
     _watershed_merge_segments,
 )
 from usv_playpen.processing.assign_vocalizations import Vocalocator
@@ -736,6 +737,126 @@ def test_watershed_merge_output_is_sorted_and_schema_complete():
         assert usv["mean_amp_ch"] == 0.0
 
 
+def _dense_watershed_reference(all_segments, peak_min, valley_frac, coverage_bin_ms):
+    """Dense-grid formulation of the watershed merge (one boolean coverage mask
+    per channel over the whole span, scipy find_peaks per region) that the
+    event-sweep implementation replaced."""
+    from collections import defaultdict
+    import math
+    from scipy.signal import find_peaks
+    if not all_segments:
+        return []
+    dt = coverage_bin_ms / 1000.0
+    t0 = min(seg[0] for seg in all_segments)
+    n_bins = math.ceil((max(seg[1] for seg in all_segments) - t0) / dt) + 2
+    channel_masks = defaultdict(lambda: np.zeros(n_bins, dtype=bool))
+    for start, stop, ch in all_segments:
+        channel_masks[ch][int((start - t0) / dt):math.ceil((stop - t0) / dt)] = True
+    coverage = np.sum(list(channel_masks.values()), axis=0)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], (coverage >= 1).astype(np.int8), [0]))))
+    pieces = []
+    for r0, r1 in zip(edges[0::2], edges[1::2]):
+        padded = np.concatenate(([0], coverage[r0:r1], [0]))
+        peaks, _ = find_peaks(padded, height=peak_min)
+        splits = []
+        for lo, hi in zip(peaks[:-1], peaks[1:]):
+            valley = lo + int(np.argmin(padded[lo:hi + 1]))
+            if padded[valley] < valley_frac * min(padded[lo], padded[hi]):
+                splits.append(r0 + valley - 1)
+        bounds = [r0, *splits, r1]
+        pieces.extend(zip(bounds[:-1], bounds[1:]))
+    merged = []
+    for p0, p1 in pieces:
+        above = np.flatnonzero(coverage[p0:p1] >= valley_frac * int(coverage[p0:p1].max()))
+        left, right = p0 + int(above[0]), p0 + int(above[-1])
+        merged.append({
+            "start": t0 + left * dt,
+            "stop": t0 + (right + 1) * dt,
+            "chs_detected": {ch for ch, mask in channel_masks.items() if mask[left:right + 1].any()},
+            "peak_amp_ch": 0.0,
+            "mean_amp_ch": 0.0,
+        })
+    return sorted(merged, key=lambda usv: usv["start"])
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_watershed_merge_matches_dense_reference_on_random_segments(seed):
+    """Property test: on random multi-channel segment sets (overlapping,
+    abutting, zero-length and long bridging segments, several bin widths) the
+    run-length event sweep returns exactly what the dense coverage grid gives."""
+    rng = np.random.default_rng(seed)
+    for _ in range(50):
+        n_channels = int(rng.integers(1, 25))
+        segs = []
+        for _ in range(int(rng.integers(0, 80))):
+            start = float(rng.uniform(0, 2.0))
+            segs.append((start, start + float(rng.exponential(0.03) * rng.integers(0, 2) * rng.uniform(0, 3)), int(rng.integers(0, n_channels))))
+        if rng.random() < 0.2:
+            segs = [(round(start, 3), round(stop, 3), ch) for start, stop, ch in segs]
+        segs.sort(key=lambda seg: seg[0])
+        params = {
+            "peak_min": int(rng.integers(1, 10)),
+            "valley_frac": float(rng.uniform(0.1, 1.0)),
+            "coverage_bin_ms": float(rng.choice([0.1, 0.5, 1.0, 2.0])),
+        }
+        assert _watershed_merge_segments(segs, **params) == _dense_watershed_reference(segs, **params)
+
+
+def _reference_noise_descriptors(audio, sample_starts, sample_stops, chs_detected, len_win_signal, lower_bin):
+    """Per-USV Phase-4 loop the batched engine replaced: one window read, one
+    librosa.stft and one np.corrcoef (or normalized-power variance) per USV."""
+    import librosa
+    n_usv = len(sample_starts)
+    peak, mean = np.zeros(n_usv, dtype=int), np.zeros(n_usv, dtype=int)
+    corr, var = np.full(n_usv, np.nan), np.full(n_usv, np.nan)
+    for i in range(n_usv):
+        window = np.asarray(audio[sample_starts[i]:sample_stops[i], :])
+        peak[i] = np.unravel_index(np.argmax(window), window.shape)[1]
+        mean[i] = np.argmax(np.abs(window).mean(axis=0))
+        chs = chs_detected[i]
+        if len(chs) > 1:
+            spec = np.abs(librosa.stft(window[:, chs].astype("float32").T, n_fft=len_win_signal))
+            cc = np.corrcoef(spec[:, lower_bin:, :].reshape(len(chs), -1))
+            corr[i] = np.mean(cc[np.triu_indices(n=len(chs), k=1)])
+        else:
+            spec = np.abs(librosa.stft(window[:, chs[0]].astype("float32").T, n_fft=len_win_signal)) ** 2
+            var[i] = np.var(spec / np.max(spec))
+    return peak, mean, corr, var
+
+
+def test_usv_noise_descriptors_match_per_usv_reference(tmp_path):
+    """The batched Phase-4 engine (length-sorted, zero-padded multi-window
+    STFTs with masked correlations/variances) must reproduce the per-USV loop's
+    amplitude channels, spectrogram correlations and variances, for windows of
+    very different lengths (padded into one batch), multi- and single-channel
+    detections mixed in one block, and in the caller's order."""
+    sampling_rate, n_samples, n_channels = 250000, 250000, 6
+    rng = np.random.default_rng(11)
+    audio = rng.integers(-3000, 3000, size=(n_samples, n_channels), dtype=np.int16)
+    audio[100000:130000, 2] = (9000 * np.sin(np.arange(30000) * 0.9)).astype(np.int16)
+    audio_file_loc = tmp_path / f"sess_{sampling_rate}_{n_samples}_{n_channels}_int16.mmap"
+    audio.tofile(audio_file_loc)
+
+    # every window spans at least n_fft=512 samples, the shortest USV the
+    # reference's librosa.stft accepts without a short-input warning
+    sample_starts = np.array([1000, 5000, 40000, 100000, 150000, 200000, 220000])
+    sample_stops = np.array([1600, 17000, 52011, 130000, 150600, 203000, 249999])
+    chs_detected = [[0, 1], [1, 2, 5], [3], [1, 2, 5], [4], [0, 1], [2]]
+    lower_bin = int(np.floor(30000 / (sampling_rate / 512)))
+
+    batched = _usv_noise_descriptors(
+        audio_file_loc=audio_file_loc, data_type="int16", sample_num=n_samples, channel_num=n_channels,
+        sample_starts=sample_starts, sample_stops=sample_stops, chs_detected=chs_detected,
+        len_win_signal=512, lower_bin=lower_bin,
+    )
+    reference = _reference_noise_descriptors(audio, sample_starts, sample_stops, chs_detected, 512, lower_bin)
+
+    np.testing.assert_array_equal(batched[0], reference[0])
+    np.testing.assert_array_equal(batched[1], reference[1])
+    np.testing.assert_allclose(batched[2], reference[2], rtol=1e-5, equal_nan=True)
+    np.testing.assert_allclose(batched[3], reference[3], rtol=1e-4, equal_nan=True)
+
+
 def _build_prepare_for_vocalocator_layout(tmp_path, settings):
     """
     Description
@@ -16,6 +16,8 @@ from click.testing import CliRunner
 from scipy.io import wavfile
 from numpy.testing import assert_array_equal, assert_allclose
 from usv_playpen.processing.preprocess_data import Stylist
+from usv_playpen.processing.hpss_streaming import hpss_context_samples, hpss_wav_file, hpss_wav_files
+from usv_playpen.processing.pipeline_scheduler import MANIFEST_NAME, MessageRelay, PipelineStep, run_session_pipeline
 from usv_playpen.processing.preprocess_data import (
     concatenate_video_files_cli,
     rectify_video_fps_cli,
@@ -32,6 +34,7 @@ from usv_playpen.processing.preprocess_data import (
     translate_rotate_metric_cli,
     das_command_line_inference_cli,
     summarize_das_findings_cli,
+    session_pipeline_steps,
     concatenate_binary_files_cli,
     split_clusters_to_sessions_cli,
     prepare_vcl_assign_cli,
@@ -39,6 +42,7 @@ from usv_playpen.processing.preprocess_data import (
 )
 import platform
 import sys
+import threading
 import time
 from usv_playpen.os_utils import (
     configure_path,
@@ -99,6 +103,7 @@ from usv_playpen.processing.assign_vocalizations_utils import (
 import pathlib
 from usv_playpen.processing.assign_vocalizations import Vocalocator
 from usv_playpen.processing.modify_files import Operator
+from usv_playpen.neuropixels.spike_store import SpikeStore, spike_store_path
 
 
 VIDEO_WIDTH = 1280
@@ -1362,6 +1367,38 @@ def test_data_loader_returns_empty_dict_for_empty_dir(tmp_path):
     assert dl.load_wavefile_data() == {}
 
 
+def test_data_loader_memmap_branch_matches_scipy(tmp_path):
+    rng = np.random.default_rng(11)
+    wavfile.write(tmp_path / "a_mono.wav", 250000, rng.integers(-3000, 3000, 501, dtype=np.int16))
+    wavfile.write(tmp_path / "b_stereo.wav", 10_000, rng.integers(-3000, 3000, (300, 2), dtype=np.int16))
+    wavfile.write(tmp_path / "c_float.wav", 10_000, rng.standard_normal(120).astype(np.float32))
+    # an extra (odd-sized, padded) chunk ahead of the data chunk, as recorders write
+    _, mono = wavfile.read(tmp_path / "a_mono.wav")
+    raw = (tmp_path / "a_mono.wav").read_bytes()
+    data_at = raw.index(b"data")
+    extra_chunk = b"LIST" + (3).to_bytes(4, "little") + b"abc" + b"\x00"
+    patched = raw[:data_at] + extra_chunk + raw[data_at:]
+    patched = patched[:4] + (len(patched) - 8).to_bytes(4, "little") + patched[8:]
+    (tmp_path / "d_extra_chunk.wav").write_bytes(patched)
+
+    loaded = {
+        library: DataLoader(
+            input_parameter_dict={
+                "wave_data_loc": [str(tmp_path)],
+                "load_wavefile_data": {"library": library, "conditional_arg": []},
+            }
+        ).load_wavefile_data()
+        for library in ("scipy", "memmap")
+    }
+    assert list(loaded["memmap"]) == list(loaded["scipy"])
+    for name, entry in loaded["memmap"].items():
+        assert isinstance(entry["wav_data"], np.memmap) and not entry["wav_data"].flags.writeable
+        assert entry["sampling_rate"] == loaded["scipy"][name]["sampling_rate"]
+        assert entry["dtype"] == loaded["scipy"][name]["dtype"]
+        assert_array_equal(entry["wav_data"], loaded["scipy"][name]["wav_data"])
+    assert_array_equal(loaded["memmap"]["d_extra_chunk.wav"]["wav_data"], mono)
+
+
 def test_data_loader_preserves_alphabetical_order(tmp_path):
     for name in ("c.wav", "a.wav", "b.wav"):
         _write_wav(tmp_path / name)
@@ -2081,6 +2118,50 @@ def test_operator_concatenate_audio_files_handles_empty_dir(tmp_path, processing
     assert "concatenation impossible" in joined or "Audio concatenation started" in joined
 
 
+def test_operator_concatenate_audio_files_streams_channels_into_memmap(tmp_path, processing_settings, monkeypatch):
+    """
+    Description
+    -----------
+    `concatenate_audio_files` must copy the channel WAVs, block by block,
+    into an (n_samples, n_channels) int16 memmap named after its shape,
+    column i holding the i-th file in name order. The block size is shrunk
+    so the copy spans several blocks with a ragged last one.
+
+    Parameters
+    ----------
+    tmp_path (pathlib.Path)
+        Per-test temp directory (used as the session root).
+    processing_settings (dict)
+        Processing settings fixture.
+    monkeypatch (pytest.MonkeyPatch)
+        Used to shrink the copy block.
+
+    Returns
+    -------
+    None
+    """
+
+    monkeypatch.setattr("usv_playpen.processing.modify_files.AUDIO_CONCAT_BLOCK_SAMPLES", 64)
+    monkeypatch.setattr("usv_playpen.processing.modify_files.smart_wait", lambda **_k: None)
+    audio_dir = tmp_path / 'audio' / 'hpss_filtered'
+    audio_dir.mkdir(parents=True)
+    rng = np.random.default_rng(7)
+    channels = rng.integers(-32768, 32767, size=(3, 1000), dtype=np.int16)
+    for ch_idx, one_channel in enumerate(channels):
+        wavfile.write(audio_dir / f"m_250430145009_ch{ch_idx + 1:02d}_hpss_filtered.wav", 250000, one_channel)
+
+    processing_settings['modify_files']['Operator']['concatenate_audio_files']['concat_dirs'] = ['hpss_filtered']
+    Operator(
+        root_directory=str(tmp_path),
+        input_parameter_dict=processing_settings,
+        message_output=lambda *_a, **_k: None,
+    ).concatenate_audio_files()
+
+    mm_file = audio_dir / "250430145009_concatenated_audio_hpss_filtered_250000_1000_3_int16.mmap"
+    assert mm_file.is_file() and not list(audio_dir.glob(".*tmp*"))
+    assert_array_equal(np.memmap(mm_file, dtype='int16', mode='r', shape=(1000, 3)), channels.T)
+
+
 def test_operator_multichannel_to_channel_audio_missing_master_raises(tmp_path, processing_settings):
     (tmp_path / 'audio' / 'original_mc').mkdir(parents=True)
 
@@ -2475,6 +2556,57 @@ def test_split_clusters_to_sessions_writes_per_cluster_npy(tmp_path, mocker):
     )
 
 
+def test_split_clusters_to_sessions_writes_spike_store(tmp_path, mocker):
+    """
+    Description
+    -----------
+    The split must write one spike store per probe per session holding the
+    same units and spikes as the legacy per-cluster files; with
+    `export_legacy_cluster_npy` off, no `cluster_data` files are written.
+
+    Parameters
+    ----------
+    tmp_path (pathlib.Path)
+        Per-test temp directory.
+    mocker (pytest_mock.MockerFixture)
+        Used to no-op `smart_wait`.
+
+    Returns
+    -------
+    None
+    """
+
+    mocker.patch("usv_playpen.processing.modify_files.smart_wait")
+    session_root, cluster_data_dir = _build_split_clusters_layout(tmp_path)
+
+    settings = _processing_settings_dict()
+    settings["modify_files"]["Operator"]["get_spike_times"]["min_spike_num"] = 1
+    op = Operator(
+        root_directory=[str(session_root)],
+        input_parameter_dict=settings,
+        message_output=lambda *_a, **_k: None,
+    )
+    op.split_clusters_to_sessions()
+
+    store_file = spike_store_path(session_root, "imec0")
+    with SpikeStore(store_file) as store:
+        assert store.unit_names == ["imec0_cl0000_ch010_good", "imec0_cl0001_ch020_mua"]
+        assert store.unit_metadata["channel"].tolist() == [10, 20]
+        for unit_name in store.unit_names:
+            assert_array_equal(store.unit_array(unit_name), np.load(cluster_data_dir / f"{unit_name}.npy"))
+
+    shutil.rmtree(cluster_data_dir)
+    settings["modify_files"]["Operator"]["get_spike_times"]["export_legacy_cluster_npy"] = False
+    Operator(
+        root_directory=[str(session_root)],
+        input_parameter_dict=settings,
+        message_output=lambda *_a, **_k: None,
+    ).split_clusters_to_sessions()
+
+    assert store_file.is_file()
+    assert not cluster_data_dir.exists()
+
+
 def test_split_clusters_to_sessions_skips_without_cluster_info(tmp_path, mocker):
     """
     Description
@@ -2741,6 +2873,64 @@ def test_hpss_audio_writes_harmonic_wav(tmp_path, mocker):
     assert sr == 250000 and data.dtype == np.int16 and data.size > 0
 
 
+def test_hpss_streaming_matches_whole_recording(tmp_path):
+    """
+    Description
+    -----------
+    Block-streamed HPSS must reproduce the whole-recording harmonic output:
+    each block is padded with `hpss_context_samples` of context, so the
+    seams (and the recording edges) may only differ by float round-off,
+    i.e. at most one int16 level. Checked for block lengths that do and do
+    not divide the recording, and with channels run in a thread pool.
+
+    Parameters
+    ----------
+    tmp_path (pathlib.Path)
+        Per-test temp directory.
+
+    Returns
+    -------
+    None
+    """
+
+    sr, n = 250000, 50000 + 77
+    _write_small_wav(tmp_path / "mic0.wav", sr=sr, n=n)
+    hpss_kwargs = {
+        "stft_window_length_hop_size": [512, 128],
+        "kernel_size": [5, 60],
+        "hpss_power": 4.0,
+        "margin": [4, 1],
+    }
+    assert hpss_context_samples(512, 128, [5, 60]) == 768
+
+    hpss_wav_file(tmp_path / "mic0.wav", tmp_path / "whole.wav", block_seconds=0, **hpss_kwargs)
+    _, whole = wavfile.read(tmp_path / "whole.wav")
+
+    for block_seconds in (0.02, 0.0512):
+        hpss_wav_file(tmp_path / "mic0.wav", tmp_path / "streamed.wav", block_seconds=block_seconds, **hpss_kwargs)
+        streamed_sr, streamed = wavfile.read(tmp_path / "streamed.wav")
+        assert streamed_sr == sr and streamed.dtype == np.int16 and streamed.shape == whole.shape
+        block_samples = int(round(block_seconds * sr / 128)) * 128
+        seams = np.arange(block_samples, n, block_samples)
+        seam_window = (np.abs(np.arange(n)[:, None] - seams[None, :]) < 1024).any(axis=1)
+        seam_error = np.abs(streamed.astype(np.int32) - whole.astype(np.int32))
+        assert seam_error[seam_window].max() <= 1
+        assert seam_error.max() <= 1
+
+    shutil.copy(tmp_path / "mic0.wav", tmp_path / "mic1.wav")
+    outputs = hpss_wav_files(
+        wav_files=[tmp_path / "mic0.wav", tmp_path / "mic1.wav"],
+        output_files=[tmp_path / "par0.wav", tmp_path / "par1.wav"],
+        n_jobs=2,
+        parallel_backend="threading",
+        block_seconds=0.02,
+        **hpss_kwargs,
+    )
+    assert outputs == [tmp_path / "par0.wav", tmp_path / "par1.wav"]
+    for out_wav in outputs:
+        assert np.abs(wavfile.read(out_wav)[1].astype(np.int32) - whole).max() <= 1
+
+
 def test_filter_audio_files_runs_static_sox(tmp_path, mocker):
     """
     Description
@@ -2985,6 +3175,301 @@ def test_prepare_data_records_step_failure(processing_settings, mock_dependencie
     assert any("failure" in (c.kwargs.get("subject", "")).lower() for c in send_calls)
 
 
+def test_prepare_data_skips_up_to_date_spectrograms(processing_settings, mock_dependencies, tmp_path):
+    """
+    Description
+    -----------
+    With ``skip_up_to_date_steps`` on, a second run over an unchanged session
+    must not regenerate the spectrogram store, while touching its input (the
+    USV summary) or changing the spectrogram settings must trigger a rerun.
+
+    Parameters
+    ----------
+    processing_settings (dict)
+        Package processing-settings fixture.
+    mock_dependencies (dict)
+        Fixture of patched worker classes keyed by name.
+    tmp_path (pathlib.Path)
+        Per-test temp directory used as the single root directory.
+
+    Returns
+    -------
+    None
+    """
+
+    processing_settings['processing_booleans']['generate_usv_spectrograms'] = True
+    (tmp_path / 'audio' / 'spectrograms').mkdir(parents=True)
+    usv_summary = tmp_path / 'audio' / 'sess_usv_summary.csv'
+    usv_summary.write_text("start,stop\n0.1,0.2\n")
+
+    def _write_store():
+        (tmp_path / 'audio' / 'spectrograms' / 'sess_spectrograms.h5').write_bytes(b'spectrograms')
+
+    generate = mock_dependencies['SpectrogramGenerator'].return_value.generate_session_spectrograms
+    generate.side_effect = _write_store
+
+    def _run():
+        Stylist(input_parameter_dict=processing_settings, root_directories=[str(tmp_path)]).prepare_data_for_analyses()
+
+    _run()
+    assert (tmp_path / MANIFEST_NAME).is_file()
+    _run()
+    assert generate.call_count == 1
+
+    usv_summary.write_text("start,stop\n0.1,0.25\n")
+    _run()
+    assert generate.call_count == 2
+
+    processing_settings['generate_spectrograms']['num_freq_bins'] += 1
+    _run()
+    assert generate.call_count == 3
+
+    processing_settings['preprocess_data']['pipeline_scheduler']['skip_up_to_date_steps'] = False
+    _run()
+    assert generate.call_count == 4
+
+
+def _scheduler_params(**overrides) -> dict:
+    params = {
+        'skip_up_to_date_steps': True,
+        'fingerprint_file_contents': False,
+        'max_concurrent_sessions': 1,
+        'max_concurrent_steps': 1,
+        'cpu_budget': 0,
+        'ram_gb_budget': 0,
+        'io_budget': 2,
+    }
+    params.update(overrides)
+    return params
+
+
+def test_pipeline_scheduler_runs_independent_steps_concurrently(tmp_path):
+    """
+    Description
+    -----------
+    Two independent steps must overlap (each waits on a barrier the other has
+    to reach) while a step depending on both starts only after both are done;
+    a disabled step in between hands its own dependency on. Sessions run
+    concurrently, and a failing session does not stop the others.
+
+    Parameters
+    ----------
+    tmp_path (pathlib.Path)
+        Per-test temp directory holding the session root directories.
+
+    Returns
+    -------
+    None
+    """
+
+    sessions = [tmp_path / f'session_{idx}' for idx in range(3)]
+    for one_session in sessions:
+        one_session.mkdir()
+    barriers = {str(one_session): threading.Barrier(2, timeout=10) for one_session in sessions}
+    log = []
+    log_lock = threading.Lock()
+
+    def _record(name):
+        def _run(root_directory, session_idx):
+            if name in ('video', 'audio'):
+                barriers[root_directory].wait()
+            if name == 'audio' and session_idx == 2:
+                raise RuntimeError("broken audio")
+            with log_lock:
+                log.append((session_idx, name))
+        return _run
+
+    steps = [
+        PipelineStep(name='video', run=_record('video'), cpu=1),
+        PipelineStep(name='audio', run=_record('audio'), cpu=1),
+        PipelineStep(name='disabled', run=_record('disabled'), after=('audio',)),
+        PipelineStep(name='summary', run=_record('summary'), after=('video', 'disabled')),
+    ]
+    failed = run_session_pipeline(steps=steps,
+                                  root_directories=[str(one_session) for one_session in sessions],
+                                  input_parameter_dict={'processing_booleans': {'video': True, 'audio': True, 'disabled': False, 'summary': True}},
+                                  scheduler_params=_scheduler_params(max_concurrent_sessions=3, max_concurrent_steps=6, cpu_budget=6),
+                                  message_output=lambda *_a: None)
+
+    assert [label for label, _ in failed] == [str(sessions[2])]
+    assert "RuntimeError: broken audio" in failed[0][1]
+    for session_idx in (0, 1):
+        session_log = [name for idx, name in log if idx == session_idx]
+        assert sorted(session_log[:2]) == ['audio', 'video']
+        assert session_log[2:] == ['summary']
+    assert (2, 'summary') not in log
+    assert not any(name == 'disabled' for _, name in log)
+
+
+def test_pipeline_scheduler_serial_defaults_keep_declared_order(tmp_path):
+    """
+    Description
+    -----------
+    With one session and one step at a time, the steps run in the calling
+    thread, in declaration order, session after session; a step declining to
+    run is reported without stopping the steps after it.
+
+    Parameters
+    ----------
+    tmp_path (pathlib.Path)
+        Per-test temp directory holding the session root directories.
+
+    Returns
+    -------
+    None
+    """
+
+    log = []
+
+    def _record(name, note=None):
+        def _run(root_directory, session_idx):
+            log.append((session_idx, name, threading.current_thread() is threading.main_thread()))
+            return note
+        return _run
+
+    steps = [
+        PipelineStep(name='first', run=_record('first')),
+        PipelineStep(name='second', run=_record('second', note="second declined")),
+        PipelineStep(name='third', run=_record('third'), after=('second',)),
+    ]
+    failed = run_session_pipeline(steps=steps,
+                                  root_directories=[str(tmp_path), str(tmp_path)],
+                                  input_parameter_dict={'processing_booleans': {'first': True, 'second': True, 'third': True}},
+                                  scheduler_params=_scheduler_params(),
+                                  message_output=lambda *_a: None)
+
+    assert log == [(idx, name, True) for idx in (0, 1) for name in ('first', 'second', 'third')]
+    assert failed == [(str(tmp_path), "second declined")] * 2
+
+
+def test_pipeline_scheduler_relays_worker_messages_to_calling_thread(tmp_path):
+    """
+    Description
+    -----------
+    With steps running concurrently, ``message_output`` (e.g., the GUI log)
+    must only be called from the calling thread: messages a worker step logs
+    through the shared ``MessageRelay`` and the traceback of a failing worker
+    step are delivered by the scheduler, and a ``main_thread`` step (a
+    plotting step) runs in the calling thread.
+
+    Parameters
+    ----------
+    tmp_path (pathlib.Path)
+        Per-test temp directory holding the session root directories.
+
+    Returns
+    -------
+    None
+    """
+
+    delivered = []
+    relay = MessageRelay(lambda message: delivered.append((message, threading.current_thread() is threading.main_thread())))
+    step_threads = {}
+
+    def _record(name, fail=False):
+        def _run(root_directory, session_idx):
+            step_threads[(session_idx, name)] = threading.current_thread() is threading.main_thread()
+            relay(f"{name} in session {session_idx}")
+            if fail:
+                raise RuntimeError("broken step")
+        return _run
+
+    steps = [
+        PipelineStep(name='audio', run=_record('audio')),
+        PipelineStep(name='video', run=_record('video')),
+        PipelineStep(name='plot', run=_record('plot'), after=('audio',), main_thread=True),
+        PipelineStep(name='broken', run=_record('broken', fail=True), after=('plot',)),
+    ]
+    failed = run_session_pipeline(steps=steps,
+                                  root_directories=[str(tmp_path / 'session_0'), str(tmp_path / 'session_1')],
+                                  input_parameter_dict={'processing_booleans': {'audio': True, 'video': True, 'plot': True, 'broken': True}},
+                                  scheduler_params=_scheduler_params(max_concurrent_sessions=2, max_concurrent_steps=4, cpu_budget=4),
+                                  message_output=relay)
+
+    assert len(failed) == 2
+    assert all(on_main for _, on_main in delivered)
+    messages = [message for message, _ in delivered]
+    for session_idx in (0, 1):
+        assert {f"{name} in session {session_idx}" for name in ('audio', 'video', 'plot', 'broken')} <= set(messages)
+        assert step_threads[(session_idx, 'plot')]
+        assert not step_threads[(session_idx, 'audio')]
+    assert sum('RuntimeError: broken step' in message for message in messages) == 2
+
+
+def test_session_steps_touching_process_state_stay_on_calling_thread(processing_settings, tmp_path):
+    """
+    Description
+    -----------
+    The declared session steps that use process-wide state run in the calling
+    thread, so they never overlap: the pyplot summaries (audio-video sync,
+    DAS) and the USV mask step, which changes the working directory while it
+    builds the SAM2 predictor.
+
+    Parameters
+    ----------
+    processing_settings (dict)
+        The shipped processing settings.
+    tmp_path (pathlib.Path)
+        Per-test temp directory used as the session root.
+
+    Returns
+    -------
+    None
+    """
+
+    steps = session_pipeline_steps(input_parameter_dict=processing_settings, root_directories=[str(tmp_path)])
+
+    assert {step.name for step in steps if step.main_thread} == {
+        'conduct_audio_video_sync', 'das_summarize', 'generate_usv_masks'}
+
+
+def test_single_step_cli_reports_skip_and_force_reruns(mock_dependencies, tmp_path):
+    """
+    Description
+    -----------
+    A single-step command re-run over unchanged files must say that its
+    step was skipped as up to date (instead of returning silently), and
+    ``--force`` must run the step anyway.
+
+    Parameters
+    ----------
+    mock_dependencies (dict)
+        Fixture of patched worker classes keyed by name.
+    tmp_path (pathlib.Path)
+        Per-test temp directory passed as the CLI ``--root-directory``.
+
+    Returns
+    -------
+    None
+    """
+
+    slp_dir = tmp_path / 'video' / 'cam' / 'tracking'
+    slp_dir.mkdir(parents=True)
+    (slp_dir / 'cam.slp').write_bytes(b'slp')
+
+    def _convert():
+        (slp_dir / 'cam.analysis.h5').write_bytes(b'h5')
+
+    convert = mock_dependencies['ConvertTo3D'].return_value.sleap_file_conversion
+    convert.side_effect = _convert
+
+    runner = CliRunner()
+    rd = ["--root-directory", str(tmp_path)]
+
+    result = runner.invoke(sleap_file_conversion_cli, rd)
+    assert result.exit_code == 0, result.output
+    assert convert.call_count == 1
+
+    result = runner.invoke(sleap_file_conversion_cli, rd)
+    assert result.exit_code == 0, result.output
+    assert convert.call_count == 1
+    assert "skipped" in result.output and "up to date" in result.output and "--force" in result.output
+
+    result = runner.invoke(sleap_file_conversion_cli, rd + ["--force"])
+    assert result.exit_code == 0, result.output
+    assert convert.call_count == 2
+
+
 def test_preprocess_cli_commands_dispatch(mock_dependencies, tmp_path):
     """
     Description
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import glob
 import json
+import shutil
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -21,7 +22,9 @@ import pytest
 from scipy.io import wavfile
 from scipy.io.wavfile import read as _real_wavfile_read
 
-from usv_playpen.processing.synchronize_files import Synchronizer
+from usv_playpen.processing.synchronize_files import Synchronizer, find_digital_edges
+
+FFMPEG_INSTALLED = shutil.which("ffmpeg") is not None
 
 # ---------------------------------------------------------------------------
 # Shared fixtures
@@ -166,6 +169,46 @@ def test_find_lsb_changes_lsb_false_uses_raw_signal():
     assert largest_break > 0
 
 
+# ---------------------------------------------------------------------------
+# find_digital_edges (block-streamed bit edge detector)
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("block_samples", [1, 7, 64, 10_000])
+def test_find_digital_edges_matches_full_bit_matrix(block_samples):
+    """Streaming the last channel of an interleaved int16 recording in blocks
+    must give the same rising/falling edges as the full (n_samples, 16) bit
+    matrix, whatever the block size -- including edges on block boundaries
+    and the sign bit of negative words."""
+    rng = np.random.default_rng(11)
+    num_channels, n_samples = 3, 500
+    recording = rng.integers(-32768, 32767, size=n_samples * num_channels, dtype=np.int16)
+    digital_ch = recording.reshape((num_channels, n_samples), order='F')[-1, :].reshape([-1, 1])
+    digital_bits = (digital_ch & (2 ** np.arange(16).reshape([1, 16]))).astype(bool).astype(int)
+
+    edges = find_digital_edges(recording=recording, bit_positions=[0, 5, 15],
+                               num_channels=num_channels, channel=-1, block_samples=block_samples)
+    for bit_position in (0, 5, 15):
+        bit_diffs = digital_bits[1:, bit_position] - digital_bits[:-1, bit_position]
+        np.testing.assert_array_equal(edges[bit_position][0], np.where(bit_diffs > 0)[0])
+        np.testing.assert_array_equal(edges[bit_position][1], np.where(bit_diffs < 0)[0])
+
+
+def test_find_digital_edges_whole_value_and_degenerate_inputs():
+    """bit_positions=None compares whole sample values; empty and one-sample
+    inputs yield empty edge arrays."""
+    raw = np.zeros(64, dtype=np.int16)
+    raw[5:25] = 100
+    raw[27:29] = 100
+    rising, falling = find_digital_edges(recording=raw, bit_positions=None, block_samples=4)[None]
+    np.testing.assert_array_equal(rising, [4, 26])
+    np.testing.assert_array_equal(falling, [24, 28])
+
+    for degenerate in (np.zeros(0, dtype=np.int16), np.ones(1, dtype=np.int16)):
+        rising, falling = find_digital_edges(recording=degenerate, bit_positions=[0])[0]
+        assert rising.size == 0 and falling.size == 0
+
+
 # ---------------------------------------------------------------------------
 # validate_ephys_video_sync — file-missing branches
 # ---------------------------------------------------------------------------
@@ -633,6 +676,61 @@ def test_gather_px_information_writes_led_memmap(tmp_path, processing_settings):
     assert int(mm.max()) > 0      # LED pixels sampled as bright
 
 
+@pytest.mark.skipif(not FFMPEG_INSTALLED, reason="ffmpeg executable not found in PATH")
+def test_gather_px_information_ffmpeg_sampler_matches_opencv(tmp_path, processing_settings):
+    """
+    Description
+    -----------
+    The ffmpeg ROI sampler must fill the same `(n_frames, 3, 3)` `sync_px_*`
+    memmap as the full-frame OpenCV path: on a clip whose LEDs blink between
+    two flat colours, the two backends agree to within a couple of intensity
+    levels on every frame and LED.
+
+    Parameters
+    ----------
+    tmp_path (pathlib.Path)
+        Per-test session root.
+    processing_settings (dict)
+        Package processing-settings fixture.
+
+    Returns
+    -------
+    None
+    """
+
+    import cv2
+
+    serial = "21372315"
+    coords = list(Synchronizer._build_led_px_dict()["current"][serial].values())  # [y, x] each
+    h, w = 720, 1280
+    video_name = f"{serial}-ts.mp4"
+    video_path = tmp_path / video_name
+
+    writer = cv2.VideoWriter(str(video_path), cv2.VideoWriter_fourcc(*"mp4v"), 10.0, (w, h))
+    if not writer.isOpened():
+        pytest.skip("cv2 mp4v VideoWriter unavailable in this environment")
+    for frame_idx in range(20):
+        frame = np.full((h, w, 3), 30, dtype=np.uint8)
+        for (y, x) in coords:
+            frame[y - 8:y + 9, x - 8:x + 9] = (200, 220, 240) if (frame_idx // 3) % 2 == 0 else (60, 60, 60)
+        writer.write(frame)
+    writer.release()
+
+    sampled = {}
+    for sampler in ("opencv", "ffmpeg"):
+        sync_dir = tmp_path / f"session_{sampler}" / "sync"
+        sync_dir.mkdir(parents=True)
+        processing_settings["synchronize_files"]["Synchronizer"]["find_video_sync_trains"]["led_px_sampler"] = sampler
+        sync = _make_sync(sync_dir.parent, processing_settings)
+        sync.gather_px_information(video_of_interest=str(video_path), sync_camera_fps=10,
+                                  camera_id=serial, video_name=video_name, total_frame_number=18)
+        sampled[sampler] = np.array(np.memmap(sync_dir / f"sync_px_{serial}-ts", dtype=np.uint8,
+                                              mode="r", shape=(18, 3, 3)))
+
+    assert int(sampled["ffmpeg"].max()) > 150
+    assert np.abs(sampled["opencv"].astype(int) - sampled["ffmpeg"].astype(int)).max() <= 3
+
+
 def _processing_settings_full():
     """
     Description
@@ -189,6 +189,7 @@ def _make_tuning_parameters() -> dict:
         "temporal_offsets":                         [0],
         "n_shuffles":                               5,
         "shuffle_seed":                             0,
+        "shuffle_null_engine":                      "direct",
         "total_bin_num":                            10,
         "n_spatial_bins":                           36,
         "spatial_scale_cm":                         32,
@@ -206,6 +207,8 @@ def _make_tuning_parameters() -> dict:
         "include_partner_vocalization_tuning_bool": False,
         "smoothing_sd":                             0.0,
         "circular_features":                        ["allo_yaw", "body_dir"],
+        "n_jobs":                                   1,
+        "cluster_chunk_size":                       8,
     }
 
 
@@ -30,6 +30,7 @@ import matplotlib.pyplot as plt
 # would otherwise promote to a collection error.
 with warnings.catch_warnings():
     warnings.simplefilter("ignore", DeprecationWarning)
+    from usv_playpen.modeling.modeling_input_store import save_modeling_input
     from usv_playpen.visualizations.modeling_plots import (
         _FIGURE_DPI,
         _FIGURE_FORMAT,
@@ -821,6 +822,37 @@ class TestPlotRawFeatureDifference:
         assert len(list(out_dir.glob(f"*avg_bootstrap_*.{_FIGURE_FORMAT}"))) == 1
         assert len(list(out_dir.glob(f"*heatmap_*.{_FIGURE_FORMAT}"))) == 1
 
+    @pytest.mark.filterwarnings("ignore:Tight layout:UserWarning")
+    def test_reads_hdf5_modeling_input_store(self, tmp_path):
+        """An input written by ``save_modeling_input`` in the default HDF5
+        format is read through the store (only the plotted feature) and
+        writes the same two figures as a pickle."""
+
+        rng = np.random.default_rng(32)
+        n_time = 60
+        data = {
+            feature: {
+                'session_a': {
+                    'usv_feature_arr': rng.standard_normal((30, n_time)),
+                    'no_usv_feature_arr': rng.standard_normal((40, n_time)),
+                },
+            }
+            for feature in ('self.speed', 'other/nose-nose')
+        }
+        store = save_modeling_input(data, tmp_path / "bout_onset_input.h5")
+        out_dir = tmp_path / "raw_h5_out"
+        out_dir.mkdir()
+        plot_raw_feature_difference(
+            pickle_file_path=str(store),
+            feature_key='self.speed',
+            subset_fraction=0.5,
+            n_bootstraps=20,
+            save_plots=True,
+            output_dir=str(out_dir),
+        )
+        assert len(list(out_dir.glob(f"*avg_bootstrap_*.{_FIGURE_FORMAT}"))) == 1
+        assert len(list(out_dir.glob(f"*heatmap_*.{_FIGURE_FORMAT}"))) == 1
+
     def test_missing_feature_key_returns_without_drawing(self, tmp_path):
         """A ``feature_key`` absent from the pickle short-circuits with a
         message and writes nothing."""